@@ -170,6 +170,9 @@ _cpy_non_euclid_methods = {'single': 0, 'complete': 1, 'average': 2,
 _cpy_euclid_methods = {'centroid': 3, 'median': 4, 'ward': 5}
 _cpy_linkage_methods = set(_cpy_non_euclid_methods.keys()).union(
     set(_cpy_euclid_methods.keys()))
+# Methods whose Euclidean linkage is computed from the observation vectors
+# in linear memory.
+_cpy_obs_methods = {'single': 0, 'centroid': 3, 'median': 4, 'ward': 5}
 
 try:
     import warnings
@@ -559,6 +562,18 @@ def linkage(y, method='single', metric='euclidean'):
      implementation may chose a different minimum than the MATLAB(TM)
      version.
 
+     Single linkage is computed from a minimum spanning tree of the
+     distances, and complete, average, weighted and Ward linkage with
+     the nearest-neighbor chain algorithm; both take :math:`O(n^2)`
+     time. Ties between equal distances may be resolved differently
+     than by the generic algorithm used for centroid and median linkage.
+
+     When observation vectors are given with the Euclidean metric,
+     single, centroid, median and Ward linkage compute the distances
+     from the observations as they are needed, and store cluster
+     centroids rather than the :math:`{n \\choose 2}` distances, so
+     that they take memory linear in the number of observations.
+
      Parameters
      ----------
      y : ndarray
@@ -596,28 +611,44 @@ def linkage(y, method='single', metric='euclidean'):
         [y] = _copy_arrays_if_base_present([y])
 
         Z = np.zeros((d - 1, 4))
-        _hierarchy_wrap.linkage_wrap(y, Z, int(d), \
-                                   int(_cpy_non_euclid_methods[method]))
+        _linkage_condensed(y, Z, int(d), method)
     elif len(s) == 2:
         X = y
         n = s[0]
         m = s[1]
         if method not in _cpy_linkage_methods:
             raise ValueError('Invalid method: %s' % method)
-        if method in _cpy_non_euclid_methods.keys():
+        if method in _cpy_obs_methods and metric == 'euclidean':
+            # The distances are computed from the observations as needed,
+            # without forming the condensed distance matrix.
+            [X] = _copy_arrays_if_base_present([X])
+            Z = np.zeros((n - 1, 4))
+            _hierarchy_wrap.linkage_obs_wrap(X, Z, m, n,
+                                             int(_cpy_obs_methods[method]))
+        elif method in _cpy_non_euclid_methods.keys():
             dm = distance.pdist(X, metric)
             Z = np.zeros((n - 1, 4))
-            _hierarchy_wrap.linkage_wrap(dm, Z, n, \
-                                       int(_cpy_non_euclid_methods[method]))
+            _linkage_condensed(dm, Z, n, method)
         elif method in _cpy_euclid_methods.keys():
             if metric != 'euclidean':
                 raise ValueError('Method %s requires the distance metric to be euclidean' % s)
-            dm = distance.pdist(X, metric)
-            Z = np.zeros((n - 1, 4))
-            _hierarchy_wrap.linkage_euclid_wrap(dm, Z, X, m, n,
-                                              int(_cpy_euclid_methods[method]))
     return Z
 
+def _linkage_condensed(dm, Z, n, method):
+    """
+    Computes the linkage ``Z`` of the condensed distance matrix ``dm`` of
+    ``n`` observations for the single, complete, average, weighted and
+    ward methods.
+    """
+    if method == 'single':
+        _hierarchy_wrap.linkage_mst_single_wrap(dm, Z, n)
+    elif method == 'ward':
+        _hierarchy_wrap.linkage_nn_chain_wrap(dm, Z, n,
+                                              int(_cpy_euclid_methods[method]))
+    else:
+        _hierarchy_wrap.linkage_nn_chain_wrap(dm, Z, n,
+                                          int(_cpy_non_euclid_methods[method]))
+
 class ClusterNode:
     """
     A tree node class for representing a cluster. Leaf nodes correspond
@@ -1273,20 +1304,14 @@ def is_valid_linkage(Z, warning=False, throw=False, name=None):
 
 def _check_hierarchy_uses_cluster_before_formed(Z):
     n = Z.shape[0] + 1
-    for i in xrange(0, n - 1):
-        if Z[i, 0] >= n + i or Z[i, 1] >= n + i:
-            return True
-    return False
+    formed = np.arange(n, 2 * n - 1)
+    return bool((Z[:, 0] >= formed).any() or (Z[:, 1] >= formed).any())
 
 def _check_hierarchy_uses_cluster_more_than_once(Z):
-    n = Z.shape[0] + 1
-    chosen = set([])
-    for i in xrange(0, n - 1):
-        if (Z[i, 0] in chosen) or (Z[i, 1] in chosen) or Z[i, 0] == Z[i, 1]:
-            return True
-        chosen.add(Z[i, 0])
-        chosen.add(Z[i, 1])
-    return False
+    if (Z[:, 0] == Z[:, 1]).any():
+        return True
+    chosen = np.sort(Z[:, :2].ravel())
+    return bool((chosen[1:] == chosen[:-1]).any())
 
 def _check_hierarchy_not_all_clusters_used(Z):
     n = Z.shape[0] + 1
@@ -2038,7 +2063,7 @@ def dendrogram(Z, p=30, truncate_mode=None, color_threshold=None,
         ivl=[]
     if color_threshold is None or \
        (type(color_threshold) == types.StringType and color_threshold=='default'):
-        color_threshold = max(Z[:,2])*0.7
+        color_threshold = Z[:,2].max()*0.7
     R={'icoord':icoord_list, 'dcoord':dcoord_list, 'ivl':ivl, 'leaves':lvs,
        'color_list':color_list}
     props = {'cbt': False, 'cc':0}
@@ -2065,7 +2090,7 @@ def dendrogram(Z, p=30, truncate_mode=None, color_threshold=None,
                                contraction_marks=contraction_marks, \
                                link_color_func=link_color_func)
     if not no_plot:
-        mh = max(Z[:,2])
+        mh = Z[:,2].max()
         _plot_dendrogram(icoord_list, dcoord_list, ivl, p, n, mh, orientation, no_labels, color_list, leaf_font_size=leaf_font_size, leaf_rotation=leaf_rotation, contraction_marks=contraction_marks)
 
     return R
@@ -2115,10 +2140,14 @@ def _append_contraction_marks(Z, iv, i, n, contraction_marks):
     _append_contraction_marks_sub(Z, iv, Z[i-n, 1], n, contraction_marks)
 
 def _append_contraction_marks_sub(Z, iv, i, n, contraction_marks):
-    if (i >= n):
-        contraction_marks.append((iv, Z[i-n, 2]))
-        _append_contraction_marks_sub(Z, iv, Z[i-n, 0], n, contraction_marks)
-        _append_contraction_marks_sub(Z, iv, Z[i-n, 1], n, contraction_marks)
+    # Pre-order traversal of the non-singleton clusters below i.
+    stack = [i]
+    while stack:
+        i = stack.pop()
+        if (i >= n):
+            contraction_marks.append((iv, Z[i-n, 2]))
+            stack.append(Z[i-n, 1])
+            stack.append(Z[i-n, 0])
 
 
 def _dendrogram_calculate_info(Z, p, truncate_mode, \
@@ -2176,6 +2205,80 @@ def _dendrogram_calculate_info(Z, p, truncate_mode, \
     if i == -1:
         raise ValueError("Invalid root cluster index i.")
 
+    # The tree is traversed with an explicit stack rather than by
+    # recursion, so that the depth of the tree is not limited by the
+    # recursion limit. Each frame holds the arguments of a (formerly
+    # recursive) call for the node i and the state needed to resume it:
+    #
+    #   [i, iv, level, ua, ub, h, c, (uiva, uwa, uah, uamd)]
+    #
+    # ``result`` is the return value of the last frame that finished.
+    stack = [[i, iv, level, None, None, None, None, None]]
+    result = None
+    while stack:
+        frame = stack[-1]
+        i, iv, level, ua = frame[:4]
+        if ua is None:
+            # First visit of node i.
+            leaf = _dendrogram_leaf(Z, p, truncate_mode, show_leaf_counts,
+                                    i, iv, ivl, n, lvs, leaf_label_func,
+                                    level, labels, contraction_marks)
+            if leaf is not None:
+                result = leaf
+                stack.pop()
+                continue
+            ua, ub = _dendrogram_children(Z, n, i, count_sort,
+                                          distance_sort)
+            frame[3] = ua
+            frame[4] = ub
+            stack.append([ua, iv, level + 1, None, None, None, None, None])
+        elif frame[5] is None:
+            # The subtree to the left of node i is done.
+            frame[7] = result
+            h = Z[i-n, 2]
+            if h >= color_threshold or color_threshold <= 0:
+                c = 'b'
+
+                if currently_below_threshold[0]:
+                    current_color[0] = (current_color[0] + 1) % len(_link_line_colors)
+                currently_below_threshold[0] = False
+            else:
+                currently_below_threshold[0] = True
+                c = _link_line_colors[current_color[0]]
+            frame[5] = h
+            frame[6] = c
+            uwa = result[1]
+            stack.append([frame[4], iv + uwa, level + 1, None, None, None,
+                          None, None])
+        else:
+            # Both subtrees of node i are done.
+            (uiva, uwa, uah, uamd) = frame[7]
+            (uivb, uwb, ubh, ubmd) = result
+            h = frame[5]
+            c = frame[6]
+
+            max_dist = max(uamd, ubmd, h)
+
+            icoord_list.append([uiva, uiva, uivb, uivb])
+            dcoord_list.append([uah, h, h, ubh])
+            if link_color_func is not None:
+                v = link_color_func(int(i))
+                if type(v) != types.StringType:
+                    raise TypeError("link_color_func must return a matplotlib color string!")
+                color_list.append(v)
+            else:
+                color_list.append(c)
+            result = (((uiva + uivb) / 2), uwa+uwb, h, max_dist)
+            stack.pop()
+    return result
+
+def _dendrogram_leaf(Z, p, truncate_mode, show_leaf_counts, i, iv, ivl, n,
+                     lvs, leaf_label_func, level, labels, contraction_marks):
+    """
+    Returns the ``(left, w, h, md)`` tuple of ``_dendrogram_calculate_info``
+    if the node i is drawn as a leaf of the dendrogram, and None if it is
+    drawn with its children.
+    """
     if truncate_mode == 'lastp':
         # If the node is a leaf node but corresponds to a non-single cluster,
         # it's label is either the empty string or the number of original
@@ -2187,9 +2290,6 @@ def _dendrogram_calculate_info(Z, p, truncate_mode, \
             if contraction_marks is not None:
                 _append_contraction_marks(Z, iv + 5.0, i, n, contraction_marks)
             return (iv + 5.0, 10.0, 0.0, d)
-        elif i < n:
-            _append_singleton_leaf_node(Z, p, n, level, lvs, ivl, leaf_label_func, i, labels)
-            return (iv + 5.0, 10.0, 0.0, 0.0)
     elif truncate_mode in ('mtica', 'level'):
         if i > n and level > p:
             d = Z[i-n, 2]
@@ -2198,12 +2298,6 @@ def _dendrogram_calculate_info(Z, p, truncate_mode, \
             if contraction_marks is not None:
                 _append_contraction_marks(Z, iv + 5.0, i, n, contraction_marks)
             return (iv + 5.0, 10.0, 0.0, d)
-        elif i < n:
-            _append_singleton_leaf_node(Z, p, n, level, lvs, ivl, leaf_label_func, i, labels)
-            return (iv + 5.0, 10.0, 0.0, 0.0)
-    elif truncate_mode in ('mlab',):
-        pass
-
 
     # Otherwise, only truncate if we have a leaf node.
     #
@@ -2214,9 +2308,13 @@ def _dendrogram_calculate_info(Z, p, truncate_mode, \
     if i < n:
         _append_singleton_leaf_node(Z, p, n, level, lvs, ivl, leaf_label_func, i, labels)
         return (iv + 5.0, 10.0, 0.0, 0.0)
+    return None
 
-    # !!! Otherwise, we don't have a leaf node, so work on plotting a
-    # non-leaf node.
+def _dendrogram_children(Z, n, i, count_sort, distance_sort):
+    """
+    Returns the children ``(ua, ub)`` of the non-singleton cluster i in
+    the order in which the dendrogram draws them, from left to right.
+    """
     # Actual indices of a and b
     aa = Z[i-n, 0]
     ab = Z[i-n, 1]
@@ -2278,91 +2376,7 @@ def _dendrogram_calculate_info(Z, p, truncate_mode, \
     else:
         ua = aa
         ub = ab
-
-    # The distance of the cluster to draw to the left (ua) is uad
-    # and its count is uan. Likewise, the cluster to draw to the
-    # right has distance ubd and count ubn.
-    if ua < n:
-        uad = 0.0
-        uan = 1
-    else:
-        uad = Z[ua-n, 2]
-        uan = Z[ua-n, 3]
-    if ub < n:
-        ubd = 0.0
-        ubn = 1
-    else:
-        ubd = Z[ub-n, 2]
-        ubn = Z[ub-n, 3]
-
-    # Updated iv variable and the amount of space used.
-    (uiva, uwa, uah, uamd) = \
-          _dendrogram_calculate_info(Z=Z, p=p, \
-                                     truncate_mode=truncate_mode, \
-                                     color_threshold=color_threshold, \
-                                     get_leaves=get_leaves, \
-                                     orientation=orientation, \
-                                     labels=labels, \
-                                     count_sort=count_sort, \
-                                     distance_sort=distance_sort, \
-                                     show_leaf_counts=show_leaf_counts, \
-                                     i=ua, iv=iv, ivl=ivl, n=n, \
-                                     icoord_list=icoord_list, \
-                                     dcoord_list=dcoord_list, lvs=lvs, \
-                                     current_color=current_color, \
-                                     color_list=color_list, \
-                                     currently_below_threshold=currently_below_threshold, \
-                                     leaf_label_func=leaf_label_func, \
-                                     level=level+1, contraction_marks=contraction_marks, \
-                                     link_color_func=link_color_func)
-
-    h = Z[i-n, 2]
-    if h >= color_threshold or color_threshold <= 0:
-        c = 'b'
-
-        if currently_below_threshold[0]:
-            current_color[0] = (current_color[0] + 1) % len(_link_line_colors)
-        currently_below_threshold[0] = False
-    else:
-        currently_below_threshold[0] = True
-        c = _link_line_colors[current_color[0]]
-
-    (uivb, uwb, ubh, ubmd) = \
-          _dendrogram_calculate_info(Z=Z, p=p, \
-                                     truncate_mode=truncate_mode, \
-                                     color_threshold=color_threshold, \
-                                     get_leaves=get_leaves, \
-                                     orientation=orientation, \
-                                     labels=labels, \
-                                     count_sort=count_sort, \
-                                     distance_sort=distance_sort, \
-                                     show_leaf_counts=show_leaf_counts, \
-                                     i=ub, iv=iv+uwa, ivl=ivl, n=n, \
-                                     icoord_list=icoord_list, \
-                                     dcoord_list=dcoord_list, lvs=lvs, \
-                                     current_color=current_color, \
-                                     color_list=color_list, \
-                                     currently_below_threshold=currently_below_threshold,
-                                     leaf_label_func=leaf_label_func, \
-                                     level=level+1, contraction_marks=contraction_marks, \
-                                     link_color_func=link_color_func)
-
-    # The height of clusters a and b
-    ah = uad
-    bh = ubd
-
-    max_dist = max(uamd, ubmd, h)
-
-    icoord_list.append([uiva, uiva, uivb, uivb])
-    dcoord_list.append([uah, h, h, ubh])
-    if link_color_func is not None:
-        v = link_color_func(int(i))
-        if type(v) != types.StringType:
-            raise TypeError("link_color_func must return a matplotlib color string!")
-        color_list.append(v)
-    else:
-        color_list.append(c)
-    return ( ((uiva + uivb) / 2), uwa+uwb, h, max_dist)
+    return ua, ub
 
 def is_isomorphic(T1, T2):
     """
@@ -2401,15 +2415,12 @@ def is_isomorphic(T1, T2):
         raise ValueError('T2 must be one-dimensional.')
     if T1S[0] != T2S[0]:
         raise ValueError('T1 and T2 must have the same number of elements.')
-    n = T1S[0]
-    d = {}
-    for i in xrange(0,n):
-        if T1[i] in d.keys():
-            if d[T1[i]] != T2[i]:
-                return False
-        else:
-            d[T1[i]] = T2[i]
-    return True
+    # Within each group of equal T1 values, the T2 values must be equal.
+    order = np.argsort(T1, kind='mergesort')
+    T1s = T1[order]
+    T2s = T2[order]
+    same = T1s[1:] == T1s[:-1]
+    return not (T2s[1:][same] != T2s[:-1][same]).any()
 
 def maxdists(Z):
     """
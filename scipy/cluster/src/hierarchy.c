@@ -1270,115 +1270,51 @@ void form_flat_clusters_from_monotonic_criterion(const double *Z,
   free(rvisited);  
 }
 
+static int double_compare(const void *a, const void *b) {
+  double da = *(const double*)a, db = *(const double*)b;
+  if (da < db) {
+    return -1;
+  }
+  if (da > db) {
+    return 1;
+  }
+  return 0;
+}
+
+/** form at most mc flat clusters with the smallest threshold of a
+    monotonic criterion. */
 void form_flat_clusters_maxclust_monocrit(const double *Z,
 					  const double *mono_crit,
 					  int *T, int n, int mc) {
-  int *curNode;
-  int ndid, lid, rid, k, nc, g, ms;
-  unsigned char *lvisited, *rvisited;
-  const double *Zrow;
-  double thresh, maxmono_crit;
-  /** The maximum unsuccessful distance is initially -1.0 (hack). */
-  double max_illegal = -1.0;
-  double min_legal = 0.0;
-  int min_legal_nc = 1;
-  const int bff = CPY_FLAG_ARRAY_SIZE_BYTES(n);
-  k = 0;
-
-  min_legal = mono_crit[n-2];
-  curNode = (int*)malloc(n * sizeof(int));
-  lvisited = (unsigned char*)malloc(bff);
-  rvisited = (unsigned char*)malloc(bff);
-  curNode[k] = (n * 2) - 2;
-  memset(lvisited, 0, bff);
-  memset(rvisited, 0, bff);
-
-  /** number of clusters formed so far. */
-  nc = 0;
-
-  CPY_DEBUG_MSG("[BEGIN] min legal: %5.5f nc: %d mc: %d\n", min_legal, min_legal_nc, mc);
-
-  for (g = n - 2; g >= 0; g--) {
-    thresh = mono_crit[g];
-    /** 1. If the threshold is <= the minimum threshold we've tried
-        unsuccessfully, skip the threshold. (or)
-
-        2. If the threshold is > the minimum legal threshold, it is
-	less optimal so skip it. */
-    if (thresh > min_legal) { /** commented out : && thresh <= max_illegal **/
-      continue;
-    }
-    k = 0;
-    curNode[k] = (n * 2) - 2;
-    memset(lvisited, 0, bff);
-    memset(rvisited, 0, bff);
-    nc = 0;
-    ms = -1;
-    /** See if the threshold MD[g] works. **/
-    while (k >= 0) {
-      ndid = curNode[k];
-      Zrow = Z + ((ndid-n) * CPY_LIS);
-      lid = (int)Zrow[CPY_LIN_LEFT];
-      rid = (int)Zrow[CPY_LIN_RIGHT];
-      maxmono_crit = mono_crit[ndid-n];
-      /**      CPY_DEBUG_MSG("cutoff: %5.5f maxi: %5.5f nc: %d\n", cutoff, max_mono_crit, nc);**/
-
-      /** If the current nodes maxmono_crit is <= the threshold, stop exploring
-	  deeper in the tree. The node and its descendent leaves will be their
-	  own cluster. */
-      if (maxmono_crit <= thresh) {
-	nc++;
-	k--;
-	CPY_SET_BIT(lvisited, ndid-n);
-	CPY_SET_BIT(rvisited, ndid-n);
-	continue;
+  int g, last;
+  double *sorted, thresh;
+
+  /** Since the criterion is monotonic, the nodes above a threshold form
+      a subtree containing the root, and cutting its k nodes leaves k + 1
+      flat clusters. The number of flat clusters for each threshold is
+      therefore found from the sorted criterion, without traversing the
+      tree for each candidate threshold. */
+  sorted = (double*)malloc(sizeof(double) * (n - 1));
+  memcpy(sorted, mono_crit, sizeof(double) * (n - 1));
+  qsort(sorted, n - 1, sizeof(double), double_compare);
+
+  thresh = mono_crit[n-2];
+  for (g = 0; g < n - 1; g = last + 1) {
+    last = g;
+    while (last + 1 < n - 1 && sorted[last + 1] == sorted[g]) {
+      last++;
+    }
+    /** The nodes sorted[last+1:] are above the threshold sorted[g]. */
+    if (1 + (n - 2 - last) <= mc) {
+      if (sorted[g] < thresh) {
+	thresh = sorted[g];
       }
-      /** Otherwise, the node is above the threshold, so we need to explore
-	  it's children. */
-      if (!CPY_GET_BIT(lvisited, ndid-n)) {
-	CPY_SET_BIT(lvisited, ndid-n);
-	if (lid >= n) {
-	  curNode[k+1] = lid;
-	  k++;
-	  continue;
-	}
-	else if (lid < n) {
-	  nc++;
-	}
-      }
-      if (!CPY_GET_BIT(rvisited, ndid-n)) {
-	if (rid >= n) {
-	  CPY_SET_BIT(rvisited, ndid-n);
-	  curNode[k+1] = rid;
-	  k++;
-	  continue;
-	}
-	else if (rid < n) {
-	  nc++;
-	}
-      }
-      k--;
-    }
-
-    if (thresh > max_illegal && nc > mc) {
-      CPY_DEBUG_MSG("max illegal: %5.5f mc: %d", max_illegal, mc);
-      max_illegal = thresh;
-      continue;
-    }
-    /** If the threshold is less than the current minimum legal threshold
-	but has a legal number of clusters, set the new legal minimum. */
-    if (thresh < min_legal && nc <= mc) {
-      min_legal = thresh;
-      min_legal_nc = nc;
-      CPY_DEBUG_MSG("min legal: %5.5f nc: %d mc: %d\n", min_legal, min_legal_nc, mc);
+      break;
     }
   }
+  free(sorted);
 
-  form_flat_clusters_from_monotonic_criterion(Z, mono_crit, T, min_legal, n);
-
-  free(curNode);
-  free(lvisited);
-  free(rvisited);
+  form_flat_clusters_from_monotonic_criterion(Z, mono_crit, T, thresh, n);
 }
 
 void get_max_dist_for_each_cluster(const double *Z, double *max_dists, int n) {
@@ -1595,3 +1531,632 @@ int leaders(const double *Z, const int *T, int *L, int *M, int kk, int n) {
   free(fid);
   return errid;
 }
+
+/** The index of d(i, j), i < j, in a condensed distance matrix of n
+    observations. */
+static NPY_INLINE npy_intp condensed_index(npy_intp n, npy_intp i,
+					   npy_intp j) {
+  return n * i - (i * (i + 1)) / 2 + (j - i - 1);
+}
+
+typedef struct merge {
+  double d;
+  int i;
+} merge;
+
+static int merge_compare(const void *a, const void *b) {
+  const merge *ma = (const merge*)a;
+  const merge *mb = (const merge*)b;
+  if (ma->d < mb->d) {
+    return -1;
+  }
+  if (ma->d > mb->d) {
+    return 1;
+  }
+  /** Equal distances keep the order in which the merges were found. */
+  return ma->i - mb->i;
+}
+
+static int uf_find(int *parent, int x) {
+  int r = x, t;
+  while (parent[r] != r) {
+    r = parent[r];
+  }
+  while (parent[x] != r) {
+    t = parent[x];
+    parent[x] = r;
+    x = t;
+  }
+  return r;
+}
+
+/**
+ * Turns a list of n-1 merges into a linkage matrix. On entry, row k of Z
+ * holds two observations (one from each of the clusters merged) and the
+ * merge distance. The rows are sorted by distance and relabeled, so that
+ * the k'th merge forms cluster n + k and the smaller cluster index comes
+ * first, as in the matrices computed by linkage().
+ *
+ * Returns -1 if memory could not be allocated, 0 otherwise.
+ */
+static int label_merges(double *Z, int n) {
+  int k, a, b, ra, rb, ia, ib;
+  int *parent, *cid, *cnt;
+  merge *order;
+  double *Zs, *Zrow;
+
+  order = (merge*)malloc(sizeof(merge) * (n - 1));
+  parent = (int*)malloc(sizeof(int) * n);
+  cid = (int*)malloc(sizeof(int) * n);
+  cnt = (int*)malloc(sizeof(int) * n);
+  Zs = (double*)malloc(sizeof(double) * CPY_LIS * (n - 1));
+  if (!order || !parent || !cid || !cnt || !Zs) {
+    free(order);
+    free(parent);
+    free(cid);
+    free(cnt);
+    free(Zs);
+    return -1;
+  }
+
+  for (k = 0; k < n - 1; k++) {
+    order[k].d = Z[k * CPY_LIS + CPY_LIN_DIST];
+    order[k].i = k;
+  }
+  qsort(order, n - 1, sizeof(merge), merge_compare);
+  memcpy(Zs, Z, sizeof(double) * CPY_LIS * (n - 1));
+
+  for (k = 0; k < n; k++) {
+    parent[k] = k;
+    cid[k] = k;
+    cnt[k] = 1;
+  }
+  for (k = 0; k < n - 1; k++) {
+    Zrow = Zs + order[k].i * CPY_LIS;
+    a = (int)Zrow[CPY_LIN_LEFT];
+    b = (int)Zrow[CPY_LIN_RIGHT];
+    ra = uf_find(parent, a);
+    rb = uf_find(parent, b);
+    ia = cid[ra];
+    ib = cid[rb];
+    Zrow = Z + k * CPY_LIS;
+    Zrow[CPY_LIN_LEFT] = CPY_MIN(ia, ib);
+    Zrow[CPY_LIN_RIGHT] = CPY_MAX(ia, ib);
+    Zrow[CPY_LIN_DIST] = order[k].d;
+    Zrow[CPY_LIN_CNT] = cnt[ra] + cnt[rb];
+    parent[ra] = rb;
+    cid[rb] = n + k;
+    cnt[rb] += cnt[ra];
+  }
+
+  free(order);
+  free(parent);
+  free(cid);
+  free(cnt);
+  free(Zs);
+  return 0;
+}
+
+/**
+ * Single linkage from the minimum spanning tree of the condensed
+ * distance matrix dm of n observations, found with Prim's algorithm in
+ * O(n^2) time and O(n) additional memory. dm is not modified.
+ *
+ * Returns -1 if memory could not be allocated, 0 otherwise.
+ */
+int linkage_mst_single(const double *dm, double *Z, int n) {
+  int i, k, x, y;
+  int *from;
+  unsigned char *merged;
+  double *dmin, d, best;
+  double *Zrow;
+
+  dmin = (double*)malloc(sizeof(double) * n);
+  from = (int*)malloc(sizeof(int) * n);
+  merged = (unsigned char*)malloc(n);
+  if (!dmin || !from || !merged) {
+    free(dmin);
+    free(from);
+    free(merged);
+    return -1;
+  }
+  for (i = 0; i < n; i++) {
+    dmin[i] = HUGE_VAL;
+    from[i] = 0;
+    merged[i] = 0;
+  }
+
+  x = 0;
+  for (k = 0; k < n - 1; k++) {
+    merged[x] = 1;
+    y = -1;
+    best = HUGE_VAL;
+    for (i = 0; i < n; i++) {
+      if (merged[i]) {
+	continue;
+      }
+      if (i < x) {
+	d = dm[condensed_index(n, i, x)];
+      }
+      else {
+	d = dm[condensed_index(n, x, i)];
+      }
+      if (d < dmin[i]) {
+	dmin[i] = d;
+	from[i] = x;
+      }
+      if (y < 0 || dmin[i] < best) {
+	best = dmin[i];
+	y = i;
+      }
+    }
+    Zrow = Z + k * CPY_LIS;
+    Zrow[CPY_LIN_LEFT] = from[y];
+    Zrow[CPY_LIN_RIGHT] = y;
+    Zrow[CPY_LIN_DIST] = best;
+    x = y;
+  }
+
+  free(dmin);
+  free(from);
+  free(merged);
+  return label_merges(Z, n);
+}
+
+/**
+ * Complete, average, weighted and Ward linkage with the nearest-neighbor
+ * chain algorithm in O(n^2) time. The Lance-Williams updates are those of
+ * dist_complete, dist_average, dist_weighted and dist_ward. A working copy
+ * of the condensed distance matrix dm of n observations is made; dm is
+ * not modified.
+ *
+ * Returns -1 if memory could not be allocated, 0 otherwise.
+ */
+int linkage_nn_chain(const double *dm, double *Z, int n, int method) {
+  int i, k, x, y, c, nc, first;
+  int *chain, *size, *next, *prev;
+  double *D, *Zrow;
+  double d, best, dx, dy, dxy, xn, yn, in, t;
+  npy_intp ix, iy;
+
+  D = (double*)malloc(sizeof(double) * NCHOOSE2((npy_intp)n));
+  chain = (int*)malloc(sizeof(int) * n);
+  size = (int*)malloc(sizeof(int) * n);
+  next = (int*)malloc(sizeof(int) * (n + 1));
+  prev = (int*)malloc(sizeof(int) * (n + 1));
+  if (!D || !chain || !size || !next || !prev) {
+    free(D);
+    free(chain);
+    free(size);
+    free(next);
+    free(prev);
+    return -1;
+  }
+  memcpy(D, dm, sizeof(double) * NCHOOSE2((npy_intp)n));
+
+  /** The active clusters form a doubly linked list; the cluster merged
+      last is kept in the slot of the observation with the larger index,
+      n marks the end of the list. */
+  for (i = 0; i < n; i++) {
+    size[i] = 1;
+    next[i] = i + 1;
+    prev[i + 1] = i;
+  }
+  prev[0] = -1;
+  first = 0;
+  nc = 0;
+
+  for (k = 0; k < n - 1; k++) {
+    if (nc == 0) {
+      chain[nc++] = first;
+    }
+    for (;;) {
+      x = chain[nc - 1];
+      if (nc > 1) {
+	y = chain[nc - 2];
+	best = D[x < y ? condensed_index(n, x, y) : condensed_index(n, y, x)];
+      }
+      else {
+	y = -1;
+	best = HUGE_VAL;
+      }
+      /** Ties are resolved in favor of the previous element of the chain,
+	  which guarantees that the chain ends in a reciprocal pair. */
+      for (i = first; i < n; i = next[i]) {
+	if (i == x) {
+	  continue;
+	}
+	d = D[x < i ? condensed_index(n, x, i) : condensed_index(n, i, x)];
+	if (d < best || y < 0) {
+	  best = d;
+	  y = i;
+	}
+      }
+      if (nc > 1 && y == chain[nc - 2]) {
+	break;
+      }
+      chain[nc++] = y;
+    }
+    nc -= 2;
+
+    /** Merge x and y into the slot max(x, y). */
+    if (x > y) {
+      c = x;
+      x = y;
+      y = c;
+    }
+    dxy = best;
+    xn = (double)size[x];
+    yn = (double)size[y];
+    for (i = first; i < n; i = next[i]) {
+      if (i == x || i == y) {
+	continue;
+      }
+      ix = i < x ? condensed_index(n, i, x) : condensed_index(n, x, i);
+      iy = i < y ? condensed_index(n, i, y) : condensed_index(n, y, i);
+      dx = D[ix];
+      dy = D[iy];
+      in = (double)size[i];
+      switch (method) {
+      case CPY_LINKAGE_COMPLETE:
+	D[iy] = CPY_MAX(dx, dy);
+	break;
+      case CPY_LINKAGE_AVERAGE:
+	t = (double)1.0 / (in * (xn + yn));
+	D[iy] = t * ((dx * (xn * in)) + (dy * (yn * in)));
+	break;
+      case CPY_LINKAGE_WEIGHTED:
+	D[iy] = (dx + dy) / 2;
+	break;
+      case CPY_LINKAGE_WARD:
+	D[iy] = sqrt(((xn + in) / (xn + yn + in)) * (dx * dx) +
+		     ((yn + in) / (xn + yn + in)) * (dy * dy) +
+		     (-in / (xn + yn + in)) * (dxy * dxy));
+	break;
+      default:
+	D[iy] = CPY_MIN(dx, dy);
+	break;
+      }
+    }
+    size[y] += size[x];
+
+    /** Remove x from the active clusters. */
+    if (x == first) {
+      first = next[x];
+    }
+    else {
+      next[prev[x]] = next[x];
+    }
+    prev[next[x]] = prev[x];
+
+    Zrow = Z + k * CPY_LIS;
+    Zrow[CPY_LIN_LEFT] = x;
+    Zrow[CPY_LIN_RIGHT] = y;
+    Zrow[CPY_LIN_DIST] = dxy;
+  }
+
+  free(D);
+  free(chain);
+  free(size);
+  free(next);
+  free(prev);
+  return label_merges(Z, n);
+}
+
+/**
+ * Single linkage of the n observations of dimension m in X, with the
+ * Euclidean distances computed as needed instead of being stored. Uses
+ * Prim's algorithm, which computes every distance once, in O(n) memory.
+ *
+ * Returns -1 if memory could not be allocated, 0 otherwise.
+ */
+int linkage_obs_single(const double *X, double *Z, int n, int m) {
+  int i, k, x, y;
+  int *from;
+  unsigned char *merged;
+  double *dmin, d, best;
+  double *Zrow;
+
+  dmin = (double*)malloc(sizeof(double) * n);
+  from = (int*)malloc(sizeof(int) * n);
+  merged = (unsigned char*)malloc(n);
+  if (!dmin || !from || !merged) {
+    free(dmin);
+    free(from);
+    free(merged);
+    return -1;
+  }
+  for (i = 0; i < n; i++) {
+    dmin[i] = HUGE_VAL;
+    from[i] = 0;
+    merged[i] = 0;
+  }
+
+  x = 0;
+  for (k = 0; k < n - 1; k++) {
+    merged[x] = 1;
+    y = -1;
+    best = HUGE_VAL;
+    for (i = 0; i < n; i++) {
+      if (merged[i]) {
+	continue;
+      }
+      d = euclidean_distance(X + (npy_intp)x * m, X + (npy_intp)i * m, m);
+      if (d < dmin[i]) {
+	dmin[i] = d;
+	from[i] = x;
+      }
+      if (y < 0 || dmin[i] < best) {
+	best = dmin[i];
+	y = i;
+      }
+    }
+    Zrow = Z + k * CPY_LIS;
+    Zrow[CPY_LIN_LEFT] = from[y];
+    Zrow[CPY_LIN_RIGHT] = y;
+    Zrow[CPY_LIN_DIST] = best;
+    x = y;
+  }
+
+  free(dmin);
+  free(from);
+  free(merged);
+  return label_merges(Z, n);
+}
+
+/** The Ward distance between clusters of sizes na and nb with centroids
+    ca and cb. It equals the distance found by the Lance-Williams updates
+    of dist_ward. */
+static NPY_INLINE double ward_distance(const double *ca, const double *cb,
+				       double na, double nb, int m) {
+  return sqrt(2.0 * na * nb / (na + nb)) * euclidean_distance(ca, cb, m);
+}
+
+/**
+ * Ward linkage of the n observations of dimension m in X with the
+ * nearest-neighbor chain algorithm, representing the clusters by their
+ * centroids instead of storing the distance matrix. Uses O(nm) memory.
+ *
+ * Returns -1 if memory could not be allocated, 0 otherwise.
+ */
+int linkage_obs_ward(const double *X, double *Z, int n, int m) {
+  int i, k, t, x, y, c, nc, first;
+  int *chain, *size, *next, *prev;
+  double *C, *Zrow, *cx, *cy;
+  double d, best, xn, yn;
+
+  C = (double*)malloc(sizeof(double) * (npy_intp)n * m);
+  chain = (int*)malloc(sizeof(int) * n);
+  size = (int*)malloc(sizeof(int) * n);
+  next = (int*)malloc(sizeof(int) * (n + 1));
+  prev = (int*)malloc(sizeof(int) * (n + 1));
+  if (!C || !chain || !size || !next || !prev) {
+    free(C);
+    free(chain);
+    free(size);
+    free(next);
+    free(prev);
+    return -1;
+  }
+  memcpy(C, X, sizeof(double) * (npy_intp)n * m);
+
+  for (i = 0; i < n; i++) {
+    size[i] = 1;
+    next[i] = i + 1;
+    prev[i + 1] = i;
+  }
+  prev[0] = -1;
+  first = 0;
+  nc = 0;
+
+  for (k = 0; k < n - 1; k++) {
+    if (nc == 0) {
+      chain[nc++] = first;
+    }
+    for (;;) {
+      x = chain[nc - 1];
+      cx = C + (npy_intp)x * m;
+      xn = (double)size[x];
+      if (nc > 1) {
+	y = chain[nc - 2];
+	best = ward_distance(cx, C + (npy_intp)y * m, xn, (double)size[y], m);
+      }
+      else {
+	y = -1;
+	best = HUGE_VAL;
+      }
+      for (i = first; i < n; i = next[i]) {
+	if (i == x) {
+	  continue;
+	}
+	d = ward_distance(cx, C + (npy_intp)i * m, xn, (double)size[i], m);
+	if (d < best || y < 0) {
+	  best = d;
+	  y = i;
+	}
+      }
+      if (nc > 1 && y == chain[nc - 2]) {
+	break;
+      }
+      chain[nc++] = y;
+    }
+    nc -= 2;
+
+    /** Merge x and y into the slot max(x, y). */
+    if (x > y) {
+      c = x;
+      x = y;
+      y = c;
+    }
+    xn = (double)size[x];
+    yn = (double)size[y];
+    cx = C + (npy_intp)x * m;
+    cy = C + (npy_intp)y * m;
+    for (t = 0; t < m; t++) {
+      cy[t] = (cx[t] * xn + cy[t] * yn) / (xn + yn);
+    }
+    size[y] += size[x];
+
+    if (x == first) {
+      first = next[x];
+    }
+    else {
+      next[prev[x]] = next[x];
+    }
+    prev[next[x]] = prev[x];
+
+    Zrow = Z + k * CPY_LIS;
+    Zrow[CPY_LIN_LEFT] = x;
+    Zrow[CPY_LIN_RIGHT] = y;
+    Zrow[CPY_LIN_DIST] = best;
+  }
+
+  free(C);
+  free(chain);
+  free(size);
+  free(next);
+  free(prev);
+  return label_merges(Z, n);
+}
+
+/** Finds the nearest neighbor among the active clusters following slot i
+    in the list of active clusters. */
+static void centroid_nn(const double *C, const int *next, int *nn,
+			double *nnd, int i, int n, int m) {
+  int j;
+  double d;
+  const double *ci = C + (npy_intp)i * m;
+  nn[i] = -1;
+  nnd[i] = HUGE_VAL;
+  for (j = next[i]; j < n; j = next[j]) {
+    d = euclidean_distance(ci, C + (npy_intp)j * m, m);
+    if (nn[i] < 0 || d < nnd[i]) {
+      nn[i] = j;
+      nnd[i] = d;
+    }
+  }
+}
+
+/**
+ * Centroid or median linkage of the n observations of dimension m in X,
+ * representing the clusters by their centroids instead of storing the
+ * distance matrix. Every active cluster caches its nearest neighbor among
+ * the clusters following it, which only has to be searched for again when
+ * that neighbor is merged. The centroids and distances are computed as in
+ * linkage() and dist_centroid(). Uses O(nm) memory.
+ *
+ * Returns -1 if memory could not be allocated, 0 otherwise.
+ */
+int linkage_obs_centroid(const double *X, double *Z, int n, int m,
+			 int method) {
+  int i, j, k, t, s, r, first, l, nid;
+  int *id, *size, *next, *prev, *nn;
+  double *C, *nnd, *Zrow, *cs, *cl, *cg;
+  double d, best, ln, gn;
+
+  C = (double*)malloc(sizeof(double) * (npy_intp)n * m);
+  cl = (double*)malloc(sizeof(double) * m);
+  nnd = (double*)malloc(sizeof(double) * n);
+  id = (int*)malloc(sizeof(int) * n);
+  size = (int*)malloc(sizeof(int) * n);
+  nn = (int*)malloc(sizeof(int) * n);
+  next = (int*)malloc(sizeof(int) * (n + 1));
+  prev = (int*)malloc(sizeof(int) * (n + 1));
+  if (!C || !cl || !nnd || !id || !size || !nn || !next || !prev) {
+    free(C);
+    free(cl);
+    free(nnd);
+    free(id);
+    free(size);
+    free(nn);
+    free(next);
+    free(prev);
+    return -1;
+  }
+  memcpy(C, X, sizeof(double) * (npy_intp)n * m);
+
+  for (i = 0; i < n; i++) {
+    id[i] = i;
+    size[i] = 1;
+    next[i] = i + 1;
+    prev[i + 1] = i;
+  }
+  prev[0] = -1;
+  first = 0;
+  for (i = 0; i < n; i++) {
+    centroid_nn(C, next, nn, nnd, i, n, m);
+  }
+
+  for (k = 0, nid = n; k < n - 1; k++, nid++) {
+    s = -1;
+    best = HUGE_VAL;
+    for (i = first; i < n; i = next[i]) {
+      if (nn[i] >= 0 && (s < 0 || nnd[i] < best)) {
+	best = nnd[i];
+	s = i;
+      }
+    }
+    /** The new cluster takes the slot s of the pair (s, r), s < r. */
+    r = nn[s];
+
+    /** Combine the centroids in the order of linkage(): the cluster with
+	the smaller id first. */
+    if (id[s] < id[r]) {
+      l = s;
+      j = r;
+    }
+    else {
+      l = r;
+      j = s;
+    }
+    ln = (double)size[l];
+    gn = (double)size[j];
+    memcpy(cl, C + (npy_intp)l * m, sizeof(double) * m);
+    cg = C + (npy_intp)j * m;
+    cs = C + (npy_intp)s * m;
+    for (t = 0; t < m; t++) {
+      if (method == CPY_LINKAGE_MEDIAN) {
+	cs[t] = (cl[t] * 0.5 + cg[t] * 0.5);
+      }
+      else {
+	cs[t] = (cl[t] * ln + cg[t] * gn) / (ln + gn);
+      }
+    }
+
+    Zrow = Z + k * CPY_LIS;
+    Zrow[CPY_LIN_LEFT] = CPY_MIN(id[s], id[r]);
+    Zrow[CPY_LIN_RIGHT] = CPY_MAX(id[s], id[r]);
+    Zrow[CPY_LIN_DIST] = best;
+    Zrow[CPY_LIN_CNT] = size[s] + size[r];
+    id[s] = nid;
+    size[s] += size[r];
+
+    /** Remove r from the active clusters. */
+    next[prev[r]] = next[r];
+    prev[next[r]] = prev[r];
+
+    /** Update the nearest neighbors affected by the merge. */
+    for (i = first; i < n; i = next[i]) {
+      if (i == s || nn[i] == s || nn[i] == r) {
+	centroid_nn(C, next, nn, nnd, i, n, m);
+      }
+      else if (i < s) {
+	d = euclidean_distance(C + (npy_intp)i * m, cs, m);
+	if (d < nnd[i]) {
+	  nn[i] = s;
+	  nnd[i] = d;
+	}
+      }
+    }
+  }
+
+  free(C);
+  free(cl);
+  free(nnd);
+  free(id);
+  free(size);
+  free(nn);
+  free(next);
+  free(prev);
+  return 0;
+}
@@ -104,6 +104,12 @@ int leaders(const double *Z, const int *T, int *L, int *M, int kk, int n);
 
 void linkage(double *dm, double *Z, double *X, int m, int n, int ml, int kc, distfunc dfunc, int method);
 void linkage_alt(double *dm, double *Z, double *X, int m, int n, int ml, int kc, distfunc dfunc, int method);
+int linkage_mst_single(const double *dm, double *Z, int n);
+int linkage_nn_chain(const double *dm, double *Z, int n, int method);
+int linkage_obs_single(const double *X, double *Z, int n, int m);
+int linkage_obs_ward(const double *X, double *Z, int n, int m);
+int linkage_obs_centroid(const double *X, double *Z, int n, int m,
+			 int method);
 
 void cophenetic_distances(const double *Z, double *d, int n);
 void cpy_to_tree(const double *Z, cnode **tnodes, int n);
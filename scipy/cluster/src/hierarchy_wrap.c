@@ -112,6 +112,75 @@ extern PyObject *linkage_euclid_wrap(PyObject *self, PyObject *args) {
   return Py_BuildValue("d", 0.0);
 }
 
+extern PyObject *linkage_mst_single_wrap(PyObject *self, PyObject *args) {
+  int n, res;
+  PyArrayObject *dm, *Z;
+  if (!PyArg_ParseTuple(args, "O!O!i",
+			&PyArray_Type, &dm,
+			&PyArray_Type, &Z,
+			&n)) {
+    return 0;
+  }
+  Py_BEGIN_ALLOW_THREADS
+  res = linkage_mst_single((const double*)dm->data, (double*)Z->data, n);
+  Py_END_ALLOW_THREADS
+  if (res < 0) {
+    return PyErr_NoMemory();
+  }
+  return Py_BuildValue("d", 0.0);
+}
+
+extern PyObject *linkage_nn_chain_wrap(PyObject *self, PyObject *args) {
+  int method, n, res;
+  PyArrayObject *dm, *Z;
+  if (!PyArg_ParseTuple(args, "O!O!ii",
+			&PyArray_Type, &dm,
+			&PyArray_Type, &Z,
+			&n,
+			&method)) {
+    return 0;
+  }
+  Py_BEGIN_ALLOW_THREADS
+  res = linkage_nn_chain((const double*)dm->data, (double*)Z->data,
+			 n, method);
+  Py_END_ALLOW_THREADS
+  if (res < 0) {
+    return PyErr_NoMemory();
+  }
+  return Py_BuildValue("d", 0.0);
+}
+
+extern PyObject *linkage_obs_wrap(PyObject *self, PyObject *args) {
+  int method, m, n, res;
+  PyArrayObject *X, *Z;
+  if (!PyArg_ParseTuple(args, "O!O!iii",
+			&PyArray_Type, &X,
+			&PyArray_Type, &Z,
+			&m,
+			&n,
+			&method)) {
+    return 0;
+  }
+  Py_BEGIN_ALLOW_THREADS
+  switch (method) {
+  case CPY_LINKAGE_SINGLE:
+    res = linkage_obs_single((const double*)X->data, (double*)Z->data, n, m);
+    break;
+  case CPY_LINKAGE_WARD:
+    res = linkage_obs_ward((const double*)X->data, (double*)Z->data, n, m);
+    break;
+  default:
+    res = linkage_obs_centroid((const double*)X->data, (double*)Z->data,
+			       n, m, method);
+    break;
+  }
+  Py_END_ALLOW_THREADS
+  if (res < 0) {
+    return PyErr_NoMemory();
+  }
+  return Py_BuildValue("d", 0.0);
+}
+
 extern PyObject *calculate_cluster_sizes_wrap(PyObject *self, PyObject *args) {
   int n;
   PyArrayObject *Z, *cs_;
@@ -369,6 +438,9 @@ static PyMethodDef _hierarchyWrapMethods[] = {
   {"leaders_wrap", leaders_wrap, METH_VARARGS},
   {"linkage_euclid_wrap", linkage_euclid_wrap, METH_VARARGS},
   {"linkage_wrap", linkage_wrap, METH_VARARGS},
+  {"linkage_mst_single_wrap", linkage_mst_single_wrap, METH_VARARGS},
+  {"linkage_nn_chain_wrap", linkage_nn_chain_wrap, METH_VARARGS},
+  {"linkage_obs_wrap", linkage_obs_wrap, METH_VARARGS},
   {"prelist_wrap", prelist_wrap, METH_VARARGS},
   {NULL, NULL}     /* Sentinel - marks the end of this structure */
 };
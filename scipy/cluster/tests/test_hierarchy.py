@@ -36,13 +36,15 @@
 import os.path
 
 import numpy as np
-from numpy.testing import TestCase, run_module_suite
+from numpy.testing import TestCase, run_module_suite, assert_array_equal
 
 from scipy.cluster.hierarchy import linkage, from_mlab_linkage, to_mlab_linkage,\
         num_obs_linkage, inconsistent, cophenet, fclusterdata, fcluster, \
         is_isomorphic, single, complete, weighted, centroid, leaders, \
         correspond, is_monotonic, maxdists, maxinconsts, maxRstat, \
-        is_valid_linkage, is_valid_im, to_tree, leaves_list
+        is_valid_linkage, is_valid_im, to_tree, leaves_list, dendrogram
+from scipy.cluster import _hierarchy_wrap
+from scipy.cluster.hierarchy import _cpy_non_euclid_methods
 from scipy.spatial.distance import squareform, pdist
 
 _tdist = np.array([[0,    662,  877,  255,  412,  996],
@@ -189,6 +191,38 @@ class TestLinkage(TestCase):
         #print abs(Z-expectedZ).max()
         self.assertTrue(within_tol(Z, expectedZ, eps))
 
+    def test_linkage_generic_random(self):
+        "Tests the O(n^2) linkage methods against the generic algorithm."
+        np.random.seed(1234)
+        for n in [2, 3, 10, 57]:
+            X = np.random.rand(n, 3)
+            y = pdist(X)
+            for method in ['single', 'complete', 'average', 'weighted',
+                           'ward']:
+                Z = linkage(X, method)
+                expectedZ = np.zeros((n - 1, 4))
+                if method == 'ward':
+                    _hierarchy_wrap.linkage_euclid_wrap(y, expectedZ, X, 3,
+                                                        n, 5)
+                else:
+                    _hierarchy_wrap.linkage_wrap(y, expectedZ, n,
+                                    int(_cpy_non_euclid_methods[method]))
+                assert_array_equal(Z[:, [0, 1, 3]], expectedZ[:, [0, 1, 3]])
+                self.assertTrue(within_tol(Z[:, 2], expectedZ[:, 2], 1e-12))
+
+    def test_linkage_obs_random(self):
+        "Tests centroid and median linkage on observations against the generic algorithm."
+        np.random.seed(1234)
+        for n in [2, 3, 10, 57]:
+            X = np.random.rand(n, 3)
+            y = pdist(X)
+            for method, code in [('centroid', 3), ('median', 4)]:
+                Z = linkage(X, method)
+                expectedZ = np.zeros((n - 1, 4))
+                _hierarchy_wrap.linkage_euclid_wrap(y, expectedZ, X, 3, n,
+                                                    code)
+                assert_array_equal(Z, expectedZ)
+
 class TestInconsistent(TestCase):
 
     def test_single_inconsistent_tdist_1(self):
@@ -444,6 +478,19 @@ class TestFcluster(TestCase):
         T = fcluster(Z, criterion='maxclust', t=4)
         self.assertTrue(is_isomorphic(T, expectedT))
 
+    def test_fcluster_maxclust_random(self):
+        "Tests fcluster(Z, criterion='maxclust') against the smallest distance cutoff giving at most t clusters."
+        np.random.seed(1234)
+        Z = linkage(np.random.rand(30, 2), 'average')
+        MD = np.sort(maxdists(Z))
+        for t in xrange(1, 32):
+            for cutoff in MD:
+                expectedT = fcluster(Z, cutoff, criterion='distance')
+                if len(np.unique(expectedT)) <= t:
+                    break
+            T = fcluster(Z, t, criterion='maxclust')
+            self.assertTrue((T == expectedT).all())
+
 class TestLeaders(TestCase):
 
     def test_leaders_single(self):
@@ -457,6 +504,20 @@ class TestLeaders(TestCase):
         #print L, Lright, T
         self.assertTrue((L[0] == Lright[0]).all() and (L[1] == Lright[1]).all())
 
+class TestDendrogram(TestCase):
+
+    def test_dendrogram_deep_tree(self):
+        "Tests dendrogram on a linkage deeper than the recursion limit."
+        n = 3000
+        X = np.cumsum(np.arange(1, n + 1, dtype=np.double) ** 2)
+        Z = linkage(X.reshape(n, 1), 'single')
+        R = dendrogram(Z, no_plot=True)
+        self.assertTrue((np.array(R['leaves']) == leaves_list(Z)).all())
+        self.assertEqual(len(R['icoord']), n - 1)
+        R = dendrogram(Z, 10, truncate_mode='lastp', show_contracted=True,
+                       no_plot=True)
+        self.assertEqual(len(R['leaves']), 10)
+
 class TestIsIsomorphic(TestCase):
 
     def test_is_isomorphic_1(self):
@@ -3,14 +3,17 @@
 # David Cournapeau
 # Last Change: Wed Nov 05 07:00 PM 2008 J
 
+import os
 import os.path
+import tempfile
 import warnings
 
 import numpy as np
 from numpy.testing import assert_array_equal, assert_array_almost_equal, \
-        TestCase, run_module_suite
+        assert_equal, TestCase, run_module_suite
 
-from scipy.cluster.vq import kmeans, kmeans2, py_vq, py_vq2, vq, ClusterError
+from scipy.cluster.vq import kmeans, kmeans2, py_vq, py_vq2, vq, ClusterError, \
+        minibatch_kmeans
 try:
     from scipy.cluster import _vq
     TESTC=True
@@ -165,11 +168,43 @@ class TestKMean(TestCase):
 
         kmeans2(data, 3, minit = 'random')
         kmeans2(data, 3, minit = 'points')
+        kmeans2(data, 3, minit = '++')
 
         # Check special case 1d
         data = data[:, :1]
         kmeans2(data, 3, minit = 'random')
         kmeans2(data, 3, minit = 'points')
+        kmeans2(data, 3, minit = '++')
+
+    def test_kmeans2_kpp(self):
+        """k-means++ seeding picks distinct observations."""
+        np.random.seed(1234)
+        centers = np.array([[0., 0.], [0., 100.], [100., 0.], [100., 100.]])
+        data = np.repeat(centers, 50, axis = 0)
+        for i in range(5):
+            code, label = kmeans2(data, 4, iter = 1, minit = '++')
+            assert_array_equal(np.sort(code.view('f8,f8'), axis = 0),
+                               centers.view('f8,f8'))
+        # Points with zero distance to the chosen ones are never picked
+        # while there are others.
+        code, label = kmeans2(data[:, 0], 2, iter = 1, minit = '++')
+        assert_array_equal(np.sort(code), [0., 100.])
+
+    def test_kmeans2_bounded(self):
+        """The bounded assignment gives the labels of plain Lloyd
+        iterations with vq."""
+        np.random.seed(1234)
+        data = np.random.randn(500, 3)
+        initc = data[:40].copy()
+        code = initc.copy()
+        for i in range(10):
+            label = vq(data, code)[0]
+            for j in range(40):
+                if np.any(label == j):
+                    code[j] = data[label == j].mean(axis = 0)
+        code1, label1 = kmeans2(data, initc, iter = 10, minit = 'matrix')
+        assert_array_almost_equal(code1, code)
+        assert_array_equal(label1, label)
 
     def test_kmeans2_empty(self):
         """Ticket #505."""
@@ -200,5 +235,65 @@ class TestKMean(TestCase):
         except ValueError:
             pass
 
+    def test_kmeans_n_jobs(self):
+        """kmeans gives the same result whatever the number of threads."""
+        data = np.fromfile(open(DATAFILE1), sep = ", ")
+        data = data.reshape((200, 2))
+        np.random.seed(1234)
+        book1, dist1 = kmeans(data, 3, iter = 6)
+        np.random.seed(1234)
+        book2, dist2 = kmeans(data, 3, iter = 6, n_jobs = 3)
+        assert_array_equal(book1, book2)
+        assert_equal(dist1, dist2)
+        self.assertRaises(ValueError, kmeans, data, 3, n_jobs = 0)
+
+class TestMiniBatchKMean(TestCase):
+    def _blobs(self):
+        np.random.seed(1234)
+        centers = np.array([[0., 0.], [10., 0.], [0., 10.]])
+        data = np.concatenate([c + np.random.randn(400, 2) for c in centers])
+        np.random.shuffle(data)
+        return data, centers
+
+    def test_blobs(self):
+        data, centers = self._blobs()
+        book, dist = minibatch_kmeans(data, centers + 1., batch_size = 100)
+        assert_array_almost_equal(book, centers, decimal = 0)
+        # The distortion is the mean distance to the returned code book
+        assert_array_almost_equal(dist, vq(data, book)[1].mean())
+        full_dist = kmeans(data, centers + 1.)[1]
+        self.assertTrue(dist < 1.05 * full_dist)
+
+    def test_memmap(self):
+        data, centers = self._blobs()
+        fd, fname = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            data.tofile(fname)
+            mm = np.memmap(fname, dtype = data.dtype, mode = 'r',
+                           shape = data.shape)
+            np.random.seed(0)
+            book1, dist1 = minibatch_kmeans(mm, 3, batch_size = 70)
+            np.random.seed(0)
+            book2, dist2 = minibatch_kmeans(data, 3, batch_size = 70)
+            assert_array_equal(book1, book2)
+            assert_equal(dist1, dist2)
+            del mm
+        finally:
+            os.remove(fname)
+
+    def test_rank1(self):
+        np.random.seed(1234)
+        data = np.concatenate((np.random.randn(300), 20 + np.random.randn(300)))
+        book, dist = minibatch_kmeans(data, np.array([1., 15.]),
+                                      batch_size = 50)
+        self.assertEqual(book.shape, (2,))
+        assert_array_almost_equal(book, [0., 20.], decimal = 0)
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, minibatch_kmeans, X, 0)
+        self.assertRaises(ValueError, minibatch_kmeans, X, 2, batch_size = 0)
+        self.assertRaises(ValueError, minibatch_kmeans, X, 2, iter = 0)
+
 if __name__ == "__main__":
     run_module_suite()
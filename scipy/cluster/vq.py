@@ -72,10 +72,14 @@ Functions
     initializing centroids.  Uses maximum number of iterations as
     opposed to a distortion threshold as its stopping criterion.
 
+`minibatch_kmeans` :
+    Mini-batch k-means, which only needs one batch of observations
+    in memory at a time.  Suited to large or memory-mapped data.
+
 """
 __docformat__ = 'restructuredtext'
 
-__all__ = ['whiten', 'vq', 'kmeans', 'kmeans2']
+__all__ = ['whiten', 'vq', 'kmeans', 'kmeans2', 'minibatch_kmeans']
 
 # TODO:
 #   - implements high level method for running several times k-means with
@@ -91,6 +95,9 @@ from numpy import shape, zeros, sqrt, argmin, minimum, array, \
      std, mean
 import numpy as np
 
+from scipy.spatial.distance import cdist_blocks
+from scipy.lib._threads import run_parallel as _run_parallel
+
 class ClusterError(Exception):
     pass
 
@@ -352,6 +359,119 @@ def py_vq2(obs, code_book):
                                   # much difference.
     return code, min_dist
 
+def _as_rank2(x):
+    """View a rank 1 array of one-dimensional observations as a column."""
+    if x.ndim == 1:
+        return x[:, newaxis]
+    return x
+
+def _group_sums(obs, label):
+    """Sum the observations sharing each label.
+
+    Returns the labels present, the number of observations with each of
+    them and the sums of these observations.
+    """
+    order = label.argsort(kind='mergesort')
+    label = label[order]
+    first = np.flatnonzero(np.concatenate(([True], label[1:] != label[:-1])))
+    sizes = np.diff(np.concatenate((first, [len(label)])))
+    return label[first], sizes, np.add.reduceat(obs[order], first, axis=0)
+
+def _update_centroids(obs, label, code_book):
+    """Move each code of code_book to the mean of its observations.
+
+    Codes without observations are left unchanged.  Returns a boolean
+    array which is True for the codes that have observations.
+    """
+    labels, sizes, sums = _group_sums(obs, label)
+    code_book[labels] = sums / sizes[:, newaxis]
+    has_members = zeros(code_book.shape[0], dtype=bool)
+    has_members[labels] = True
+    return has_members
+
+def _nearest_two(obs, code_book):
+    """Return the nearest code of each observation, the distance to it,
+    and the distance to the second nearest code."""
+    n = obs.shape[0]
+    label = np.empty(n, dtype=np.intp)
+    dist = np.empty(n)
+    second = np.empty(n)
+    for start, D in cdist_blocks(obs, code_book):
+        stop = start + D.shape[0]
+        rows = arange(D.shape[0])
+        j = D.argmin(axis=1)
+        label[start:stop] = j
+        dist[start:stop] = D[rows, j]
+        D[rows, j] = np.inf
+        second[start:stop] = D.min(axis=1)
+    return label, dist, second
+
+def _half_separation(code_book):
+    """Half the distance from each code to its nearest other code."""
+    sep = np.empty(code_book.shape[0])
+    for start, D in cdist_blocks(code_book, code_book):
+        rows = arange(D.shape[0])
+        D[rows, start + rows] = np.inf
+        sep[start:start + D.shape[0]] = D.min(axis=1)
+    return 0.5 * sep
+
+def _vq_bounded(obs, code_book, bounds=None):
+    """Assign codes for an iteration of k-means, using Hamerly's bounds.
+
+    Parameters
+    ----------
+    obs : ndarray
+        M by N array of observations.
+    code_book : ndarray
+        k by N array of codes.
+    bounds : tuple, optional
+        The ``(label, lower, old_code_book)`` of the previous iteration,
+        where `old_code_book` is `code_book` before the codes were moved.
+        If not given, every observation is compared with every code.
+
+    Returns
+    -------
+    label : ndarray
+        Index of the nearest code of each observation.
+    dist : ndarray
+        Distance from each observation to its nearest code.
+    lower : ndarray
+        Lower bounds on the distance from each observation to its second
+        nearest code, to pass to the next iteration.
+
+    Notes
+    -----
+    The code of an observation cannot change if the distance to it is
+    at most half the distance from the code to any other code, or at most
+    a lower bound on the distance to the second nearest code, which only
+    decreases by the largest distance a code moved [1]_.  Only the other
+    observations are compared with all the codes, so that the assignment
+    costs much less than `vq` once the codes hardly move.
+
+    .. [1] G. Hamerly, "Making k-means even faster", Proceedings of the
+       2010 SIAM International Conference on Data Mining, 2010.
+
+    """
+    if bounds is None:
+        return _nearest_two(obs, code_book)
+    label, lower, old_code_book = bounds
+    label = label.copy()
+    shift = sqrt(np.sum((code_book - old_code_book)**2, axis=1))
+    if shift.size > 1:
+        # Observations of the code moving most only need the second
+        # largest move.
+        jmax = shift.argmax()
+        largest = shift[jmax]
+        shift[jmax] = -np.inf
+        lower = lower - np.where(label == jmax, shift.max(), largest)
+    dist = sqrt(np.sum((obs - code_book[label])**2, axis=1))
+    bound = np.maximum(_half_separation(code_book)[label], lower)
+    todo = np.flatnonzero(dist > bound)
+    if todo.size > 0:
+        label[todo], dist[todo], lower[todo] = _nearest_two(obs[todo],
+                                                            code_book)
+    return label, dist, lower
+
 def _kmeans(obs, guess, thresh=1e-5):
     """ "raw" version of k-means.
 
@@ -388,29 +508,33 @@ def _kmeans(obs, guess, thresh=1e-5):
     """
 
     code_book = array(guess, copy = True)
+    rank1 = code_book.ndim == 1
+    obs = _as_rank2(obs)
+    code_book = _as_rank2(code_book)
     avg_dist = []
     diff = thresh+1.
+    bounds = None
     while diff > thresh:
-        nc = code_book.shape[0]
         #compute membership and distances between obs and code_book
-        obs_code, distort = vq(obs, code_book)
+        obs_code, distort, lower = _vq_bounded(obs, code_book, bounds)
         avg_dist.append(mean(distort, axis=-1))
         #recalc code_book as centroids of associated obs
-        if(diff > thresh):
-            has_members = []
-            for i in arange(nc):
-                cell_members = compress(equal(obs_code, i), obs, 0)
-                if cell_members.shape[0] > 0:
-                    code_book[i] = mean(cell_members, 0)
-                    has_members.append(i)
-            #remove code_books that didn't have any members
-            code_book = take(code_book, has_members, 0)
+        old_code_book = code_book.copy()
+        has_members = _update_centroids(obs, obs_code, code_book)
+        #remove code_books that didn't have any members
+        if not has_members.all():
+            code_book = code_book[has_members]
+            old_code_book = old_code_book[has_members]
+            obs_code = (np.cumsum(has_members) - 1)[obs_code]
+        bounds = obs_code, lower, old_code_book
         if len(avg_dist) > 1:
             diff = avg_dist[-2] - avg_dist[-1]
     #print avg_dist
+    if rank1:
+        code_book = code_book[:, 0]
     return code_book, avg_dist[-1]
 
-def kmeans(obs, k_or_guess, iter=20, thresh=1e-5):
+def kmeans(obs, k_or_guess, iter=20, thresh=1e-5, n_jobs=1):
     """
     Performs k-means on a set of observation vectors forming k clusters.
 
@@ -450,6 +574,12 @@ def kmeans(obs, k_or_guess, iter=20, thresh=1e-5):
        distortion since the last k-means iteration is less than
        or equal to thresh.
 
+    n_jobs : int, optional
+       The number of threads running the ``iter`` k-means runs
+       concurrently.  If -1, the number of CPUs is used.  The
+       initial centroids are drawn before the runs start, so the
+       result does not depend on n_jobs.
+
     Returns
     -------
     codebook : ndarray
@@ -514,16 +644,149 @@ def kmeans(obs, k_or_guess, iter=20, thresh=1e-5):
         k = k_or_guess
         if k < 1:
             raise ValueError("Asked for 0 cluster ? ")
-        for i in range(iter):
-            #the intial code book is randomly selected from observations
-            guess = take(obs, randint(0, No, k), 0)
-            book, dist = _kmeans(obs, guess, thresh = thresh)
+        #the intial code books are randomly selected from observations;
+        #they are all drawn up front so that the result does not depend
+        #on n_jobs
+        guesses = [take(obs, randint(0, No, k), 0) for i in range(iter)]
+        # the runs spend most of their time in cdist_blocks, whose
+        # compiled loops release the GIL, so they proceed concurrently
+        results = _run_parallel(lambda guess: _kmeans(obs, guess,
+                                                      thresh = thresh),
+                                guesses, n_jobs)
+        for book, dist in results:
             if dist < best_dist:
                 best_book = book
                 best_dist = dist
         result = best_book, best_dist
     return result
 
+
+def _batches(n, batch_size):
+    return [(start, min(start + batch_size, n))
+            for start in range(0, n, batch_size)]
+
+def minibatch_kmeans(obs, k_or_guess, batch_size=1000, iter=10,
+                     thresh=1e-5):
+    """
+    Performs mini-batch k-means on a set of observation vectors.
+
+    Instead of assigning every observation before each centroid update,
+    the centroids are moved after each batch of `batch_size` consecutive
+    observations, using a per-centroid learning rate that decays with the
+    number of observations assigned to it so far.  Only one batch is
+    loaded in memory at a time, so `obs` can be a `numpy.memmap` that
+    is too large to fit in memory.
+
+    Parameters
+    ----------
+    obs : ndarray
+       Each row of the M by N array is an observation vector.  May be
+       a `numpy.memmap`.  The features should be whitened first.
+    k_or_guess : int or ndarray
+       The number of centroids to generate, or a k by N array of
+       initial centroids.  If an int, the initial centroids are chosen
+       by randomly selecting observations.
+    batch_size : int, optional
+       The number of consecutive observations in a batch.
+    iter : int, optional
+       The maximum number of passes over the observations.  The
+       batches are visited in a random order during each pass.
+    thresh : float, optional
+       Stops early if the mean distortion of the batches of a pass
+       decreased by no more than thresh since the previous pass.
+
+    Returns
+    -------
+    codebook : ndarray
+       A k by N array of k centroids.  Unlike `kmeans`, centroids that
+       never had any observation assigned are kept.
+    distortion : float
+       The mean distance between the observations and their closest
+       centroid.
+
+    See Also
+    --------
+    kmeans : k-means clustering on the whole data set at each step
+
+    Notes
+    -----
+    This is the algorithm of D. Sculley, "Web-Scale K-Means
+    Clustering", Proceedings of the 19th International Conference on
+    World Wide Web, 2010, except that the batches are contiguous slices
+    of `obs`, which keeps reads from a memory map sequential.  The
+    result is an approximation of the one of `kmeans`, usually of
+    slightly higher distortion.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from scipy.cluster.vq import minibatch_kmeans
+    >>> np.random.seed(1234)
+    >>> obs = np.concatenate((np.random.randn(5000, 2),
+    ...                       np.random.randn(5000, 2) + 10))
+    >>> np.random.shuffle(obs)
+    >>> book, dist = minibatch_kmeans(obs, 2, batch_size=500)
+    >>> np.sort(np.round(book[:, 0]))
+    array([  0.,  10.])
+
+    """
+    if int(iter) < 1:
+        raise ValueError('iter must be at least 1.')
+    if int(batch_size) < 1:
+        raise ValueError('batch_size must be at least 1.')
+    batch_size = int(batch_size)
+    rank1 = np.ndim(obs) == 1
+    if rank1:
+        obs = obs[:, newaxis]
+    elif np.ndim(obs) != 2:
+        raise ValueError("obs must be a rank 1 or rank 2 array")
+    No = obs.shape[0]
+    if type(k_or_guess) == type(array([])):
+        guess = k_or_guess
+        if guess.size < 1:
+            raise ValueError("Asked for 0 cluster ? initial book was %s" % \
+                             guess)
+        if rank1:
+            guess = guess.reshape(-1, 1)
+        code_book = array(guess, dtype=double)
+    else:
+        k = int(k_or_guess)
+        if k < 1:
+            raise ValueError("Asked for 0 cluster ? ")
+        code_book = array(take(obs, randint(0, No, k), 0), dtype=double)
+    nc = code_book.shape[0]
+
+    batches = _batches(No, batch_size)
+    counts = zeros(nc)
+    prev_dist = np.inf
+    for it in range(int(iter)):
+        total_dist = 0.
+        for b in np.random.permutation(len(batches)):
+            start, stop = batches[b]
+            batch = np.asarray(obs[start:stop], dtype=double)
+            code, dist = vq(batch, code_book)
+            total_dist += dist.sum()
+            # Sum the observations of each centroid, then move it to
+            # c + (sum - n*c) / count, count including this batch.
+            labels, sizes, sums = _group_sums(batch, code)
+            counts[labels] += sizes
+            code_book[labels] += (sums - sizes[:, newaxis] *
+                                  code_book[labels]) / \
+                                 counts[labels][:, newaxis]
+        avg_dist = total_dist / No
+        if prev_dist - avg_dist <= thresh:
+            break
+        prev_dist = avg_dist
+
+    # Final distortion with the converged code book
+    total_dist = 0.
+    for start, stop in batches:
+        total_dist += vq(np.asarray(obs[start:stop]), code_book)[1].sum()
+
+    if rank1:
+        code_book = code_book[:, 0]
+    return code_book, total_dist / No
+
 def _kpoints(data, k):
     """Pick k points at random in data (one row = one observation).
 
@@ -589,7 +852,50 @@ def _krandinit(data, k):
     else:
         return init_rankn(data)
 
-_valid_init_meth = {'random': _krandinit, 'points': _kpoints}
+def _kpp(data, k):
+    """Picks k points in data with the k-means++ seeding.
+
+    The first point is chosen uniformly at random, then each following
+    point is chosen with a probability proportional to its squared
+    distance to the nearest point already chosen.
+
+    Parameters
+    ----------
+    data : ndarray
+        Expect a rank 1 or 2 array. Rank 1 are assumed to describe one
+        dimensional data, rank 2 multidimensional data, in which case one
+        row is one observation.
+    k : int
+        Number of samples to generate.
+
+    References
+    ----------
+    .. [1] D. Arthur and S. Vassilvitskii, "k-means++: the advantages of
+       careful seeding", Proceedings of the Eighteenth Annual ACM-SIAM
+       Symposium on Discrete Algorithms, 2007.
+
+    """
+    data2 = _as_rank2(data)
+    n = data2.shape[0]
+    init = np.empty((k, data2.shape[1]), dtype=np.double)
+    init[0] = data2[np.random.randint(n)]
+    d2 = np.sum((data2 - init[0])**2, axis=1)
+    for i in range(1, k):
+        cumd2 = np.cumsum(d2)
+        if cumd2[-1] > 0:
+            j = np.searchsorted(cumd2, np.random.rand() * cumd2[-1],
+                                side='right')
+            j = min(j, n - 1)
+        else:
+            # All the points coincide with a chosen one
+            j = np.random.randint(n)
+        init[i] = data2[j]
+        d2 = np.minimum(d2, np.sum((data2 - init[i])**2, axis=1))
+    if data.ndim == 1:
+        return init[:, 0]
+    return init
+
+_valid_init_meth = {'random': _krandinit, 'points': _kpoints, '++': _kpp}
 
 def _missing_warn():
     """Print a warning when called."""
@@ -630,7 +936,7 @@ def kmeans2(data, k, iter = 10, thresh = 1e-5, minit = 'random',
         (not used yet).
     minit : string
         Method for initialization. Available methods are 'random',
-        'points', 'uniform', and 'matrix':
+        'points', '++', 'uniform', and 'matrix':
 
         'random': generate k centroids from a Gaussian with mean and
         variance estimated from the data.
@@ -638,6 +944,10 @@ def kmeans2(data, k, iter = 10, thresh = 1e-5, minit = 'random',
         'points': choose k observations (rows) at random from data for
         the initial centroids.
 
+        '++': choose k observations with the k-means++ seeding: each
+        observation is chosen with a probability proportional to its
+        squared distance to the nearest observation already chosen.
+
         'uniform': generate k observations from the data from a uniform
         distribution defined by the data set (unsupported).
 
@@ -710,19 +1020,21 @@ def _kmeans2(data, code, niter, nc, missing):
     Run k-means with a given initial codebook.
 
     """
+    data2 = _as_rank2(data)
+    code2 = _as_rank2(code)
+    bounds = None
     for i in range(niter):
         # Compute the nearest neighbour for each obs
         # using the current code book
-        label = vq(data, code)[0]
+        label, dist, lower = _vq_bounded(data2, code2, bounds)
         # Update the code by computing centroids using the new code book
-        for j in range(nc):
-            mbs = np.where(label==j)
-            if mbs[0].size > 0:
-                code[j] = np.mean(data[mbs], axis=0)
-            else:
-                missing()
-
-    return code, label
+        old_code = code2.copy()
+        has_members = _update_centroids(data2, label, code2)
+        for j in np.flatnonzero(~has_members):
+            missing()
+        bounds = label, lower, old_code
+
+    return code2.reshape(code.shape), label
 
 if __name__  == '__main__':
     pass
@@ -8,7 +8,7 @@ from numpy import deprecate
 
 
 # matfile read and write
-from matlab import loadmat, savemat
+from matlab import loadmat, savemat, MatFile
 
 # netCDF file support
 from netcdf import netcdf_file, netcdf_variable
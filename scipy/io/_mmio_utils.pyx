@@ -0,0 +1,91 @@
+# -*- python -*- like file
+''' Tokenizer for the bodies of Matrix Market files
+
+The Python code in mmio.py reads a file in chunks of complete lines and
+hands each chunk to `tokenize`, which converts it to a 2-D array of
+numbers in a single pass over the bytes.
+'''
+
+import numpy as np
+cimport numpy as cnp
+
+cnp.import_array()
+
+cdef extern from "stdlib.h":
+    double strtod(char *s, char **endptr)
+
+
+cdef inline bint is_blank(char c):
+    return c == c' ' or c == c'\t' or c == c'\r'
+
+
+def _bad_line(bytes chunk, Py_ssize_t offset, int ncols):
+    end = chunk.find(b'\n', offset)
+    if end < 0:
+        end = len(chunk)
+    return ValueError('expected %d numbers per line in Matrix Market '
+                      'data, found line %r' % (ncols, chunk[offset:end]))
+
+
+def tokenize(bytes chunk, int ncols):
+    ''' Parse lines of `ncols` whitespace separated numbers
+
+    Blank lines and comment lines (starting with ``%``) are skipped.
+
+    Parameters
+    ----------
+    chunk : bytes
+       Complete lines of the body of a Matrix Market file.
+    ncols : int
+       Number of numbers on every line.
+
+    Returns
+    -------
+    values : ndarray
+       float64 array of shape ``(n_lines, ncols)``.
+
+    Raises
+    ------
+    ValueError
+       If a line does not consist of `ncols` numbers.
+    '''
+    cdef char *start = chunk
+    cdef char *end = start + len(chunk)
+    cdef char *p = start
+    cdef char *line
+    cdef char *q
+    cdef Py_ssize_t n_lines = chunk.count(b'\n') + 1
+    cdef cnp.ndarray[cnp.float64_t, ndim=2] out = np.empty((n_lines, ncols))
+    cdef double *o = <double *>out.data
+    cdef Py_ssize_t row = 0
+    cdef int col
+    while p < end:
+        line = p
+        while p < end and is_blank(p[0]):
+            p += 1
+        if p == end:
+            break
+        if p[0] == c'\n':
+            p += 1
+            continue
+        if p[0] == c'%':
+            while p < end and p[0] != c'\n':
+                p += 1
+            continue
+        for col in range(ncols):
+            while p < end and is_blank(p[0]):
+                p += 1
+            if p == end or p[0] == c'\n':
+                raise _bad_line(chunk, line - start, ncols)
+            # chunk is NUL terminated, so strtod stops at its end
+            o[col] = strtod(p, &q)
+            if q == p or (q < end and not is_blank(q[0]) and q[0] != c'\n'):
+                raise _bad_line(chunk, line - start, ncols)
+            p = q
+        while p < end and is_blank(p[0]):
+            p += 1
+        if p < end and p[0] != c'\n':
+            raise _bad_line(chunk, line - start, ncols)
+        o += ncols
+        row += 1
+    return out[:row]
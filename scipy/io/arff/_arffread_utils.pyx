@@ -0,0 +1,211 @@
+# -*- python -*- like file
+''' Parser for the data section of ARFF files
+
+`RecordParser` converts the lines of the data section to the records of a
+structured array, writing the numeric and nominal values straight into
+the array.  The Python code in arffread.py takes care of the header and
+of reading the file in chunks.
+'''
+
+import numpy as np
+cimport numpy as cnp
+
+cnp.import_array()
+
+cdef extern from "stdlib.h":
+    double strtod(char *s, char **endptr)
+
+cdef extern from "string.h":
+    void *memchr(void *s, int c, size_t n)
+    void *memcpy(void *dest, void *src, size_t n)
+    void *memset(void *s, int c, size_t n)
+    int memcmp(void *s1, void *s2, size_t n)
+
+cdef double nan = np.nan
+
+# kinds of fields
+DEF NUMERIC = 0
+DEF NOMINAL = 1
+
+
+cdef inline bint is_blank(char c):
+    return c == c' ' or c == c'\t' or c == c'\r'
+
+
+cdef class RecordParser:
+    ''' Convert lines of ARFF data to records of a structured array
+
+    Parameters
+    ----------
+    dtype : dtype
+       dtype of the records.  Numeric fields are float64, nominal fields
+       are strings long enough for the longest value.
+    columns : sequence of int
+       For each field of `dtype`, the index of the attribute it holds.
+    nominals : sequence
+       For each field of `dtype`, the allowed values (as bytes) of a
+       nominal attribute, or None for a numeric attribute.
+    n_attributes : int
+       Number of attributes on each line.
+    delim : bytes
+       The delimiter of the values on a line.
+    '''
+    cdef readonly object dtype
+    cdef readonly int n_attributes
+    cdef char delim
+    cdef Py_ssize_t itemsize
+    # indexed by attribute: the field of the attribute, or -1
+    cdef cnp.ndarray fields
+    # indexed by field
+    cdef cnp.ndarray kinds, offsets, sizes
+    cdef object nominals
+
+    def __init__(self, dtype, columns, nominals, int n_attributes,
+                 bytes delim):
+        cdef int i
+        self.dtype = np.dtype(dtype)
+        self.n_attributes = n_attributes
+        self.delim = delim[0]
+        self.itemsize = self.dtype.itemsize
+        self.fields = np.empty(n_attributes, dtype=np.intp)
+        self.fields.fill(-1)
+        n = len(self.dtype.names)
+        self.kinds = np.empty(n, dtype=np.intp)
+        self.offsets = np.empty(n, dtype=np.intp)
+        self.sizes = np.empty(n, dtype=np.intp)
+        self.nominals = list(nominals)
+        for i in range(n):
+            if columns[i] < 0 or columns[i] >= n_attributes:
+                raise ValueError('column index out of range')
+            self.fields[columns[i]] = i
+            field_dtype, offset = self.dtype.fields[self.dtype.names[i]][:2]
+            self.offsets[i] = offset
+            self.sizes[i] = field_dtype.itemsize
+            if self.nominals[i] is None:
+                self.kinds[i] = NUMERIC
+            else:
+                self.kinds[i] = NOMINAL
+
+    def parse(self, bytes buf, Py_ssize_t pos, cnp.ndarray out,
+              Py_ssize_t n, bint final=False):
+        ''' Convert the lines of `buf` from `pos` on into records of `out`
+
+        Blank lines and comment lines (starting with ``%``) are skipped.
+        Parsing stops when `out` is full, or at the end of the last
+        complete line of `buf` -- or at the end of `buf` if `final` is
+        true.
+
+        Parameters
+        ----------
+        buf : bytes
+           Lines of the data section.
+        pos : int
+           Offset in `buf` of the first line to convert.
+        out : ndarray
+           Contiguous 1-D array with the dtype of the parser.
+        n : int
+           Index in `out` of the first record to write.
+        final : bool, optional
+           Whether `buf` extends to the end of the file.
+
+        Returns
+        -------
+        n : int
+           Index in `out` after the last record written.
+        pos : int
+           Offset in `buf` after the last line converted.
+        '''
+        if out.dtype != self.dtype or not out.flags.c_contiguous:
+            raise ValueError('out must be a contiguous array of the '
+                             'dtype of the parser')
+        cdef char *start = buf
+        cdef char *end = start + len(buf)
+        cdef char *p = start + pos
+        cdef char *line_end
+        cdef char *eol
+        cdef char *field_end
+        cdef char *q
+        cdef char *record
+        cdef char *tok
+        cdef Py_ssize_t n_out = out.shape[0]
+        cdef Py_ssize_t tok_len, field
+        cdef Py_ssize_t *fields = <Py_ssize_t *>self.fields.data
+        cdef Py_ssize_t *kinds = <Py_ssize_t *>self.kinds.data
+        cdef Py_ssize_t *offsets = <Py_ssize_t *>self.offsets.data
+        cdef Py_ssize_t *sizes = <Py_ssize_t *>self.sizes.data
+        cdef int attr
+        cdef double value
+        cdef bytes candidate
+        cdef bint found
+        while n < n_out and p < end:
+            eol = <char *>memchr(p, c'\n', end - p)
+            if eol == NULL:
+                if not final:
+                    break
+                eol = end
+                line_end = end
+            else:
+                line_end = eol + 1
+            # strip the line
+            while p < eol and is_blank(p[0]):
+                p += 1
+            if p == eol or p[0] == c'%':
+                p = line_end
+                continue
+            if p[0] == c'{':
+                raise ValueError('sparse ARFF data is not supported')
+            record = out.data + n * self.itemsize
+            for attr in range(self.n_attributes):
+                if p > eol:
+                    raise _bad_line(buf, eol - start, self.n_attributes)
+                field_end = <char *>memchr(p, self.delim, eol - p)
+                if field_end == NULL:
+                    field_end = eol
+                field = fields[attr]
+                if field >= 0:
+                    tok = p
+                    q = field_end
+                    while tok < q and is_blank(tok[0]):
+                        tok += 1
+                    while q > tok and is_blank(q[-1]):
+                        q -= 1
+                    tok_len = q - tok
+                    if kinds[field] == NUMERIC:
+                        if tok_len == 0:
+                            raise _bad_line(buf, eol - start,
+                                            self.n_attributes)
+                        if memchr(tok, c'?', tok_len) != NULL:
+                            value = nan
+                        else:
+                            value = strtod(tok, &q)
+                            if q != tok + tok_len:
+                                raise ValueError('could not convert %r to '
+                                                 'a number' % tok[:tok_len])
+                        memcpy(record + offsets[field], &value, sizeof(double))
+                    else:
+                        found = tok_len == 1 and tok[0] == c'?'
+                        if not found:
+                            for candidate in self.nominals[field]:
+                                if (len(candidate) == tok_len and
+                                    memcmp(<char *>candidate, tok,
+                                           tok_len) == 0):
+                                    found = True
+                                    break
+                        if not found:
+                            raise ValueError('%s value not in %s'
+                                             % (tok[:tok_len],
+                                                self.nominals[field]))
+                        memcpy(record + offsets[field], tok, tok_len)
+                        memset(record + offsets[field] + tok_len, 0,
+                               sizes[field] - tok_len)
+                p = field_end + 1
+            n += 1
+            p = line_end
+        return n, p - start
+
+
+def _bad_line(bytes buf, Py_ssize_t eol, int n_attributes):
+    ''' Error for the line of `buf` ending at `eol` '''
+    begin = buf.rfind(b'\n', 0, eol) + 1
+    return ValueError('expected %d values on line %r'
+                      % (n_attributes, buf[begin:eol]))
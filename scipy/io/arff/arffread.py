@@ -4,12 +4,14 @@ import re
 import itertools
 
 import numpy as np
+from numpy.compat import asbytes
 
-from scipy.io.arff.utils import partial
+from scipy.io.arff._arffread_utils import RecordParser
 
 """A module to read arff files."""
 
-__all__ = ['MetaData', 'loadarff', 'ArffError', 'ParseArffError']
+__all__ = ['MetaData', 'loadarff', 'loadarff_batches', 'ArffError',
+           'ParseArffError']
 
 # An Arff file is basically two parts:
 #   - header
@@ -44,6 +46,9 @@ r_mcomattrval = re.compile(r"'([..\n]+)'\s+(..+$)")
 # To get normal attributes
 r_wcomattrval = re.compile(r"(\S+)\s+(..+$)")
 
+# Number of bytes of the data section read at a time
+_READ_CHUNK = 1 << 24
+
 #-------------------------
 # Module defined exception
 #-------------------------
@@ -454,7 +459,102 @@ class MetaData(object):
         return attr_types
 
 
-def loadarff(filename):
+class _DataReader(object):
+    """Convert the data section of an ARFF file to record arrays.
+
+    The section is read in chunks, whose lines the compiled parser writes
+    straight into the records of the output arrays."""
+    def __init__(self, ofile, parser, buf):
+        self.ofile = ofile
+        self.parser = parser
+        self.buf = buf
+        self.pos = 0
+        self.final = False
+
+    def read_into(self, out, n):
+        """Fill out from its n-th record on. Return the number of records
+        in out, which is less than len(out) only at the end of the file."""
+        while True:
+            n, self.pos = self.parser.parse(self.buf, self.pos, out, n,
+                                            self.final)
+            if n == len(out) or self.final:
+                return n
+            chunk = self.ofile.read(_READ_CHUNK)
+            self.final = not chunk
+            self.buf = self.buf[self.pos:] + asbytes(chunk)
+            self.pos = 0
+
+
+def _open_data(filename, usecols):
+    """Parse the header of an arff file, and prepare to read its data.
+
+    Returns the open file, the MetaData of the file and a _DataReader
+    positioned at the start of the data."""
+    ofile = open(filename)
+
+    # Parse the header file
+    try:
+        rel, attr = read_header(ofile)
+    except ValueError, e:
+        msg = "Error while parsing header, error was: " + str(e)
+        raise ParseArffError(msg)
+
+    meta = MetaData(rel, attr)
+
+    if usecols is None:
+        columns = range(len(attr))
+    else:
+        columns = []
+        for col in usecols:
+            if isinstance(col, str):
+                if col not in meta.names():
+                    raise ValueError("no attribute named %s" % col)
+                col = meta.names().index(col)
+            elif col < 0:
+                col += len(attr)
+            if not 0 <= col < len(attr):
+                raise ValueError("column index %d out of range" % col)
+            columns.append(col)
+
+    # Build the type descriptor descr and, for nominal attributes, the
+    # tuple of their possible values.
+    descr = []
+    nominals = []
+    for i in columns:
+        name, value = attr[i]
+        type = parse_type(value)
+        if type == 'string':
+            # How to support string efficiently ? Ideally, we should know
+            # the max size of the string before allocating the numpy array.
+            raise NotImplementedError("String attributes not supported yet, sorry")
+        elif type == 'nominal':
+            n = maxnomlen(value)
+            descr.append((name, 'S%d' % n))
+            nominals.append(tuple([asbytes(v) for v in get_nom_val(value)]))
+        else:
+            descr.append((name, np.float))
+            nominals.append(None)
+
+    # Skip the header, and get the delimiter from the first line of data
+    ofile.seek(0, 0)
+    line = ofile.readline()
+    while line and not r_datameta.match(line):
+        line = ofile.readline()
+    line = ofile.readline()
+    while line and (r_empty.match(line) or r_comment.match(line)):
+        line = ofile.readline()
+    try:
+        delim = get_delim(line)
+    except ValueError, e:
+        if len(attr) > 1 and line.strip():
+            raise ParseArffError("Error while parsing delimiter: " + str(e))
+        delim = ','
+
+    parser = RecordParser(descr, columns, nominals, len(attr), asbytes(delim))
+    return ofile, meta, _DataReader(ofile, parser, asbytes(line))
+
+
+def loadarff(filename, usecols=None):
     """
     Read an arff file.
 
@@ -468,6 +568,9 @@ def loadarff(filename):
     ----------
     filename : str
        the name of the file
+    usecols : sequence, optional
+       Indices or names of the attributes to read, in the order of the
+       fields of the returned array.  By default all attributes are read.
 
     Returns
     -------
@@ -476,6 +579,8 @@ def loadarff(filename):
     meta : `MetaData`
        Contains information about the arff file such as name and
        type of attributes, the relation (name of the dataset), etc...
+       It describes all attributes of the file, also those not in
+       `usecols`.
 
     Raises
     ------
@@ -484,6 +589,10 @@ def loadarff(filename):
     NotImplementedError
         The ARFF file has an attribute which is not supported yet.
 
+    See Also
+    --------
+    loadarff_batches : read the data of an arff file in batches of records
+
     Notes
     -----
 
@@ -493,124 +602,78 @@ def loadarff(filename):
     * date type attributes
     * string type attributes
 
-    It can read files with numeric and nominal attributes.  It cannot read
+    It can read files with numeric and nominal attributes, and files with
+    string attributes if those are left out of `usecols`.  It cannot read
     files with sparse data ({} in the file).  However, this function can
     read files with missing data (? in the file), representing the data
     points as NaNs.
 
-    """
-    ofile = open(filename)
+    The data section is read in chunks and converted by compiled code,
+    directly into the returned array.
 
-    # Parse the header file
+    """
+    ofile, meta, reader = _open_data(filename, usecols)
     try:
-        rel, attr = read_header(ofile)
-    except ValueError, e:
-        msg = "Error while parsing header, error was: " + str(e)
-        raise ParseArffError(msg)
+        data = np.empty(1024, reader.parser.dtype)
+        n = reader.read_into(data, 0)
+        while n == len(data):
+            data.resize(2 * len(data), refcheck=False)
+            n = reader.read_into(data, n)
+        data.resize(n, refcheck=False)
+    finally:
+        ofile.close()
+    return data, meta
 
-    # Check whether we have a string attribute (not supported yet)
-    hasstr = False
-    for name, value in attr:
-        type = parse_type(value)
-        if type == 'string':
-            hasstr = True
 
-    meta = MetaData(rel, attr)
+def loadarff_batches(filename, batch_size=65536, usecols=None):
+    """
+    Read the data of an arff file in batches of records.
 
-    # XXX The following code is not great
-    # Build the type descriptor descr and the list of convertors to convert
-    # each attribute to the suitable type (which should match the one in
-    # descr).
+    Parameters
+    ----------
+    filename : str
+       the name of the file
+    batch_size : int, optional
+       Number of records of each batch; the last batch may be shorter.
+    usecols : sequence, optional
+       Indices or names of the attributes to read, as for `loadarff`.
 
-    # This can be used once we want to support integer as integer values and
-    # not as numeric anymore (using masked arrays ?).
-    acls2dtype = {'real' : np.float, 'integer' : np.float, 'numeric' : np.float}
-    acls2conv = {'real' : safe_float, 'integer' : safe_float, 'numeric' : safe_float}
-    descr = []
-    convertors = []
-    if not hasstr:
-        for name, value in attr:
-            type = parse_type(value)
-            if type == 'date':
-                raise ValueError("date type not supported yet, sorry")
-            elif type == 'nominal':
-                n = maxnomlen(value)
-                descr.append((name, 'S%d' % n))
-                pvalue = get_nom_val(value)
-                convertors.append(partial(safe_nominal, pvalue = pvalue))
-            else:
-                descr.append((name, acls2dtype[type]))
-                convertors.append(safe_float)
-                #dc.append(acls2conv[type])
-                #sdescr.append((name, acls2sdtype[type]))
-    else:
-        # How to support string efficiently ? Ideally, we should know the max
-        # size of the string before allocating the numpy array.
-        raise NotImplementedError("String attributes not supported yet, sorry")
-
-    ni = len(convertors)
-
-    # Get the delimiter from the first line of data:
-    def next_data_line(row_iter):
-        """Assumes we are already in the data part (eg after @data)."""
-        raw = row_iter.next()
-        while r_empty.match(raw):
-            raw = row_iter.next()
-        while r_comment.match(raw):
-            raw = row_iter.next()
-        return raw
+    Returns
+    -------
+    batches : iterator
+       Generates record arrays holding consecutive records of the file.
+       Only one batch is kept in memory at a time, so that files larger
+       than the memory can be processed.
+    meta : `MetaData`
+       Contains information about the arff file, as for `loadarff`.
 
-    try:
-        try:
-            dtline = next_data_line(ofile)
-            delim = get_delim(dtline)
-        except ValueError, e:
-            raise ParseArffError("Error while parsing delimiter: " + str(e))
-    finally:
-        ofile.seek(0, 0)
-        ofile = go_data(ofile)
-        # skip the @data line
-        ofile.next()
-
-    def generator(row_iter, delim = ','):
-        # TODO: this is where we are spending times (~80%). I think things
-        # could be made more efficiently:
-        #   - We could for example "compile" the function, because some values
-        #   do not change here.
-        #   - The function to convert a line to dtyped values could also be
-        #   generated on the fly from a string and be executed instead of
-        #   looping.
-        #   - The regex are overkill: for comments, checking that a line starts
-        #   by % should be enough and faster, and for empty lines, same thing
-        #   --> this does not seem to change anything.
-
-        # We do not abstract skipping comments and empty lines for performances
-        # reason.
-        raw = row_iter.next()
-        while r_empty.match(raw):
-            raw = row_iter.next()
-        while r_comment.match(raw):
-            raw = row_iter.next()
-
-        # 'compiling' the range since it does not change
-        # Note, I have already tried zipping the converters and
-        # row elements and got slightly worse performance.
-        elems = range(ni)
-
-        row = raw.split(delim)
-        yield tuple([convertors[i](row[i]) for i in elems])
-        for raw in row_iter:
-            while r_comment.match(raw):
-                raw = row_iter.next()
-            while r_empty.match(raw):
-                raw = row_iter.next()
-            row = raw.split(delim)
-            yield tuple([convertors[i](row[i]) for i in elems])
-
-    a = generator(ofile, delim = delim)
-    # No error should happen here: it is a bug otherwise
-    data = np.fromiter(a, descr)
-    return data, meta
+    See Also
+    --------
+    loadarff
+
+    Examples
+    --------
+    >>> batches, meta = loadarff_batches('iris.arff', batch_size=100)
+    >>> for batch in batches:
+    ...     print len(batch)
+    100
+    50
+
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive")
+    ofile, meta, reader = _open_data(filename, usecols)
+    return _batches(ofile, reader, batch_size), meta
+
+
+def _batches(ofile, reader, batch_size):
+    n = batch_size
+    while n == batch_size:
+        data = np.empty(batch_size, reader.parser.dtype)
+        n = reader.read_into(data, 0)
+        if n > 0:
+            yield data[:n]
+    ofile.close()
 
 
 #-----
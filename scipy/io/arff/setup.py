@@ -3,6 +3,7 @@
 def configuration(parent_package='io',top_path=None):
     from numpy.distutils.misc_util import Configuration
     config = Configuration('arff', parent_package, top_path)
+    config.add_extension('_arffread_utils', sources=['_arffread_utils.c'])
     config.add_data_dir('tests')
     return config
 
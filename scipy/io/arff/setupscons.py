@@ -0,0 +1,12 @@
+#!/usr/bin/env python
+
+def configuration(parent_package='io',top_path=None):
+    from numpy.distutils.misc_util import Configuration
+    config = Configuration('arff', parent_package, top_path)
+    config.add_sconscript('SConstruct')
+    config.add_data_dir('tests')
+    return config
+
+if __name__ == '__main__':
+    from numpy.distutils.core import setup
+    setup(**configuration(top_path='').todict())
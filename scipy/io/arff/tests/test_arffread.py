@@ -1,13 +1,16 @@
 #!/usr/bin/env python
 import os
 from os.path import join as pjoin
+from tempfile import mktemp
 
 import numpy as np
 
 from numpy.testing import TestCase, assert_array_almost_equal, assert_equal, \
         assert_, assert_raises
+from numpy.compat import asbytes
 
-from scipy.io.arff.arffread import loadarff
+from scipy.io.arff import arffread
+from scipy.io.arff.arffread import loadarff, loadarff_batches
 from scipy.io.arff.arffread import read_header, parse_type, ParseArffError
 
 data_path = pjoin(os.path.dirname(__file__), 'data')
@@ -23,6 +26,8 @@ expect4_data = [(0.1, 0.2, 0.3, 0.4, 'class1'),
         (1, 2, 3, 4, 'class3')]
 expected_types = ['numeric', 'numeric', 'numeric', 'numeric', 'nominal']
 
+iris = pjoin(data_path, 'iris.arff')
+
 missing = pjoin(data_path, 'missing.arff')
 expect_missing_raw = np.array([[1, 5], [2, 4], [np.nan, np.nan]])
 expect_missing = np.empty(3, [('yop', np.float), ('yap', np.float)])
@@ -52,6 +57,91 @@ class MissingDataTest(TestCase):
         for i in ['yop', 'yap']:
             assert_array_almost_equal(data[i], expect_missing[i])
 
+def _write_arff(data):
+    fn = mktemp()
+    f = open(fn, 'w')
+    f.write('@relation test\n'
+            '@attribute a real\n'
+            '@attribute b {x, yy}\n'
+            '@attribute c numeric\n'
+            '@data\n' + data)
+    f.close()
+    return fn
+
+def _assert_records_equal(a, b):
+    assert_equal(a.dtype, b.dtype)
+    for name in a.dtype.names:
+        assert_equal(a[name], b[name])
+
+class UseColsTest(TestCase):
+    def test_usecols(self):
+        data, meta = loadarff(test4, usecols=[4, 'attr1', -2])
+        assert_equal(data.dtype.names, ('class', 'attr1', 'attr3'))
+        assert_equal(list(data['class']),
+                     [asbytes(c) for c in ['class1', 'class2', 'class3']])
+        assert_array_almost_equal(data['attr1'], [0.2, -0.2, 2])
+        assert_array_almost_equal(data['attr3'], [0.4, -0.4, 4])
+        # meta describes all the attributes
+        assert_equal(meta.types(), expected_types)
+
+    def test_bad_usecols(self):
+        assert_raises(ValueError, loadarff, test4, usecols=[5])
+        assert_raises(ValueError, loadarff, test4, usecols=['attr'])
+
+    def test_string_attribute(self):
+        # string attributes are not supported, but can be left out
+        fn = mktemp()
+        f = open(fn, 'w')
+        f.write('@relation strings\n'
+                '@attribute a real\n'
+                '@attribute b string\n'
+                '@data\n'
+                '1,foo\n'
+                '2,bar\n')
+        f.close()
+        assert_raises(NotImplementedError, loadarff, fn)
+        data, meta = loadarff(fn, usecols=['a'])
+        assert_array_almost_equal(data['a'], [1, 2])
+
+class DataParsingTest(TestCase):
+    def test_chunks(self):
+        """Reading the data in small chunks."""
+        expected, meta = loadarff(iris)
+        assert_equal(len(expected), 150)
+        chunk = arffread._READ_CHUNK
+        arffread._READ_CHUNK = 10
+        try:
+            data, meta = loadarff(iris)
+        finally:
+            arffread._READ_CHUNK = chunk
+        _assert_records_equal(data, expected)
+
+    def test_batches(self):
+        expected, meta = loadarff(iris)
+        for batch_size in [1, 7, 150, 1000]:
+            batches, meta = loadarff_batches(iris, batch_size)
+            batches = list(batches)
+            for batch in batches[:-1]:
+                assert_equal(len(batch), batch_size)
+            _assert_records_equal(np.concatenate(batches), expected)
+        assert_raises(ValueError, loadarff_batches, iris, 0)
+
+    def test_whitespace_and_end_of_file(self):
+        fn = _write_arff('\n1 , x,2\n% comment\n  \n-3e2,yy ,?\r\n4,?,5')
+        data, meta = loadarff(fn)
+        assert_array_almost_equal(data['a'], [1, -300, 4])
+        assert_equal(list(data['b']), [asbytes(b) for b in ['x', 'yy', '?']])
+        assert_array_almost_equal(data['c'], [2, np.nan, 5])
+
+    def test_empty(self):
+        data, meta = loadarff(_write_arff(''))
+        assert_equal(len(data), 0)
+        assert_equal(data.dtype.names, ('a', 'b', 'c'))
+
+    def test_bad_data(self):
+        for line in ['1,x\n', '1,z,2\n', '1,x,2a\n', '1,x,\n', '{0 1}\n']:
+            assert_raises(ValueError, loadarff, _write_arff('1,x,2\n' + line))
+
 class HeaderTest(TestCase):
     def test_type_parsing(self):
         """Test parsing type of attribute from their value."""
@@ -26,6 +26,7 @@ Classes
 .. autosummary::
    :toctree: generated/
 
+   MatFile - Random access to the variables of a MATLAB style mat file
    netcdf_file - A file object for NetCDF data
    netcdf_variable - A data object for the netcdf module
 
@@ -8,7 +8,7 @@ Drive, Natick, MA 01760-2098, USA.
 
 """
 # Matlab file read and write utilities
-from mio import loadmat, savemat
+from mio import loadmat, savemat, MatFile
 
 from numpy.testing import Tester
 test = Tester().test
@@ -11,11 +11,13 @@ import warnings
 
 from numpy.compat import asbytes
 
-from miobase import get_matfile_version, docfiller
+import byteordercodes as boc
+from miobase import get_matfile_version, docfiller, MatReadWarning
 from mio4 import MatFile4Reader, MatFile4Writer
 from mio5 import MatFile5Reader, MatFile5Writer
 
-__all__ = ['find_mat_file', 'mat_reader_factory', 'loadmat', 'savemat']
+__all__ = ['find_mat_file', 'mat_reader_factory', 'loadmat', 'savemat',
+           'MatFile']
 
 @docfiller
 def find_mat_file(file_name, appendmat=True):
@@ -131,6 +133,11 @@ def loadmat(file_name,  mdict=None, appendmat=True, **kwargs):
         matlab variables to read from the file.  The reader will skip any
         variable with a name not in this sequence, possibly saving some read
         processing.
+    n_jobs : int, optional
+        Number of threads decompressing and reading the compressed
+        variables of the file concurrently.  If -1, the number of CPUs is
+        used.  Default is 1.  Only matlab 7 files have compressed
+        variables.
 
     Returns
     -------
@@ -148,8 +155,12 @@ def loadmat(file_name,  mdict=None, appendmat=True, **kwargs):
 
     """
     variable_names = kwargs.pop('variable_names', None)
+    n_jobs = kwargs.pop('n_jobs', 1)
     MR = mat_reader_factory(file_name, appendmat, **kwargs)
-    matfile_dict = MR.get_variables(variable_names)
+    if isinstance(MR, MatFile5Reader):
+        matfile_dict = MR.get_variables(variable_names, n_jobs)
+    else: # no compressed variables in mat 4 files
+        matfile_dict = MR.get_variables(variable_names)
     if mdict is not None:
         mdict.update(matfile_dict)
     else:
@@ -158,13 +169,133 @@ def loadmat(file_name,  mdict=None, appendmat=True, **kwargs):
         MR.mat_stream.close()
     return mdict
 
+class MatFile(object):
+    """
+    Random access to the variables of a MATLAB file
+
+    Opening the file reads the headers of its variables, but none of
+    their data; compressed variables are only decompressed as far as
+    their headers.  Each variable is read when it is accessed by name,
+    and uncompressed real numeric arrays are memory-mapped instead of
+    being read, so that only the parts of them that are used are read
+    from disk.
+
+    See ``MatFile.__init__`` for the parameters.
+
+    Attributes
+    ----------
+    mmap_mode : {'r', 'c', None}
+        Mode in which arrays are memory-mapped.
+
+    See also
+    --------
+    loadmat
+
+    Notes
+    -----
+    Variables are read again each time they are accessed.  Arrays are
+    memory-mapped if the file is a file on disk, and if they are returned
+    with the dtype they are stored with (this may not be the case with
+    `mat_dtype`).  Memory-mapped arrays stay valid after the file is
+    closed.
+
+    Examples
+    --------
+    >>> from scipy.io import savemat, MatFile
+    >>> savemat('example.mat', {'x': np.arange(6.).reshape(2, 3), 'y': 1.5},
+    ...         oned_as='row')
+    >>> mf = MatFile('example.mat')
+    >>> mf.keys()
+    ['x', 'y']
+    >>> mf.info('x')
+    MatVarInfo('x', shape=(2, 3), dtype=dtype('float64'))
+    >>> x = mf['x']
+    >>> type(x)
+    <class 'numpy.core.memmap.memmap'>
+    >>> x[1]
+    memmap([ 3.,  4.,  5.])
+    >>> mf.close()
+
+    """
+    @docfiller
+    def __init__(self, file_name, appendmat=True, mmap_mode='r', **kwargs):
+        """ Open mat file and index its variables
+
+    Parameters
+    ----------
+    %(file_arg)s
+    %(append_arg)s
+    mmap_mode : {'r', 'c', None}, optional
+        Mode in which to memory-map the uncompressed real numeric arrays
+        of the file, see ``numpy.memmap``: 'r' (the default) for read
+        only arrays, 'c' for copy-on-write arrays.  If None, these arrays
+        are read like the other variables.
+    %(load_args)s
+    %(struct_arg)s
+        """
+        if not mmap_mode in (None, 'r', 'c'):
+            raise ValueError("mmap_mode should be one of 'r', 'c' or None")
+        self.mmap_mode = mmap_mode
+        self._reader = mat_reader_factory(file_name, appendmat, **kwargs)
+        self._close_stream = isinstance(file_name, basestring)
+        self._names = []
+        self._index = {}
+        for info in self._reader.scan_variables():
+            if info.name in self._index:
+                warnings.warn('Duplicate variable name "%s" in stream'
+                              ' - using the last one' % info.name,
+                              MatReadWarning, stacklevel=2)
+            else:
+                self._names.append(info.name)
+            self._index[info.name] = info
+
+    def keys(self):
+        """ Names of the variables, in the order of the file """
+        return list(self._names)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def info(self, name):
+        """ Index entry of variable `name`
+
+        Returns
+        -------
+        info : MatVarInfo
+           object with the name, shape and (for numeric variables) dtype
+           of the variable, and its position in the file.
+        """
+        try:
+            return self._index[name]
+        except KeyError:
+            raise KeyError('No variable "%s" in file' % name)
+
+    def __getitem__(self, name):
+        info = self.info(name)
+        # function workspaces are kept raw, as in loadmat
+        process = name != '__function_workspace__'
+        return self._reader.read_variable(info, process, self.mmap_mode)
+
+    def close(self):
+        """ Close the file, if it was opened by name """
+        if self._close_stream:
+            self._reader.mat_stream.close()
+
+
 @docfiller
 def savemat(file_name, mdict,
             appendmat=True,
             format='5',
             long_field_names=False,
             do_compression=False,
-            oned_as=None):
+            oned_as=None,
+            append=False):
     """
     Save a dictionary of names and arrays into a MATLAB-style .mat file.
 
@@ -186,6 +317,12 @@ def savemat(file_name, mdict,
     %(long_fields)s
     %(do_compression)s
     %(oned_as)s
+    append : bool, optional
+        If True, add the variables to the end of the existing file
+        `file_name`, which must be a mat file of the same format and the
+        native byte order, instead of replacing the file.  A file-like
+        object must then be open for reading and writing.  Default is
+        False.
 
     See also
     --------
@@ -206,12 +343,20 @@ def savemat(file_name, mdict,
     without being more specific as to precisely when the change will take
     place.
 
+    Variables can be added to a file one at a time with ``append=True``.
+    Arrays are written, and compressed, piece by piece, so that no copy
+    of a large array is made.
+
     """
     file_is_string = isinstance(file_name, basestring)
     if file_is_string:
         if appendmat and file_name[-4:] != ".mat":
             file_name = file_name + ".mat"
-        file_stream = open(file_name, 'wb')
+        if append and os.path.exists(file_name):
+            # we seek back to update tags, which we cannot in 'a' mode
+            file_stream = open(file_name, 'r+b')
+        else:
+            file_stream = open(file_name, 'wb')
     else:
         try:
             file_name.write(asbytes(''))
@@ -232,6 +377,31 @@ def savemat(file_name, mdict,
                             oned_as=oned_as)
     else:
         raise ValueError("Format should be '4' or '5'")
+    if append:
+        _seek_to_append(file_stream, format)
     MW.put_variables(mdict)
     if file_is_string:
         file_stream.close()
+
+
+def _seek_to_append(file_stream, format):
+    ''' Check that variables of `format` can be appended to `file_stream`
+
+    Sets the stream position to the end of the stream.
+    '''
+    file_stream.seek(0, 2)
+    if file_stream.tell() == 0: # new file
+        return
+    file_stream.seek(0)
+    mjv, mnv = get_matfile_version(file_stream)
+    if mjv != int(format) - 4:
+        raise ValueError('Cannot append format %s variables to mat file '
+                         'of another format' % format)
+    if format == '4':
+        reader = MatFile4Reader(file_stream)
+    else:
+        reader = MatFile5Reader(file_stream)
+    if reader.byte_order != boc.native_code:
+        raise ValueError('Cannot append to mat file with non-native '
+                         'byte order')
+    file_stream.seek(0, 2)
@@ -8,7 +8,7 @@ from numpy.compat import asbytes, asstr
 
 import scipy.sparse
 
-from miobase import MatFileReader, docfiller, matdims, \
+from miobase import MatFileReader, MatVarInfo, docfiller, matdims, \
      read_dtype, convert_dtypes, arr_to_chars, arr_dtype_number, \
      MatWriteError
 
@@ -308,6 +308,36 @@ class MatFile4Reader(MatFileReader):
                     break
         return mdict
 
+    def scan_variables(self):
+        ''' Index variables in stream, reading only their headers
+
+        Returns
+        -------
+        index : list
+           ``MatVarInfo`` object for each variable, in stream order
+        '''
+        self.mat_stream.seek(0)
+        self.initialize_read()
+        index = []
+        while not self.end_of_stream():
+            position = self.mat_stream.tell()
+            hdr, next_position = self.read_var_header()
+            shape = tuple([int(d) for d in hdr.dims])
+            dtype = None
+            data_position = None
+            if hdr.mclass == mxFULL_CLASS:
+                dtype = hdr.dtype
+                # real values follow the header, in Fortran order
+                values_position = self.mat_stream.tell()
+                if not hdr.is_complex and next_position > values_position:
+                    data_position = values_position
+            index.append(MatVarInfo(asstr(hdr.name), shape, dtype,
+                                    hdr.mclass, position,
+                                    is_complex=hdr.is_complex,
+                                    data_position=data_position))
+            self.mat_stream.seek(next_position)
+        return index
+
 
 def arr_to_2d(arr, oned_as='row'):
     ''' Make ``arr`` exactly two dimensional
@@ -75,6 +75,7 @@ import os
 import time
 import sys
 import zlib
+import threading
 if sys.version_info[0] >= 3:
     from io import BytesIO
 else:
@@ -85,10 +86,11 @@ import numpy as np
 from numpy.compat import asbytes, asstr
 
 import scipy.sparse
+from scipy.lib._threads import run_parallel as _run_parallel
 
 import byteordercodes as boc
 
-from miobase import MatFileReader, docfiller, matdims, \
+from miobase import MatFileReader, MatVarInfo, docfiller, matdims, \
      read_dtype, arr_to_chars, arr_dtype_number, \
      MatWriteError, MatReadError, MatReadWarning
 
@@ -102,6 +104,10 @@ from mio5_params import MatlabObject, MatlabFunction, \
         mxCELL_CLASS, mxSTRUCT_CLASS, mxOBJECT_CLASS, mxCHAR_CLASS, \
         mxSPARSE_CLASS, mxDOUBLE_CLASS
 
+# number of bytes to decompress from the start of compressed variables to
+# read their headers, see ``MatFile5Reader.scan_variables``
+_HEADER_BYTES = 512
+
 
 class MatFile5Reader(MatFileReader):
     ''' Reader for Mat 5 mat files
@@ -252,15 +258,20 @@ class MatFile5Reader(MatFileReader):
         '''
         return self._matrix_reader.array_from_header(header, process)
 
-    def get_variables(self, variable_names=None):
+    def get_variables(self, variable_names=None, n_jobs=1):
         ''' get variables from stream as dictionary
 
         variable_names   - optional list of variable names to get
+        n_jobs           - number of threads decompressing and reading
+                           compressed variables concurrently; -1 for the
+                           number of CPUs
 
         If variable_names is None, then get all variables in file
         '''
         if isinstance(variable_names, basestring):
             variable_names = [variable_names]
+        if n_jobs != 1:
+            return self._get_variables_parallel(variable_names, n_jobs)
         self.mat_stream.seek(0)
         # Here we pass all the parameters in self to the reading objects
         self.initialize_read()
@@ -304,6 +315,180 @@ class MatFile5Reader(MatFileReader):
                     break
         return mdict
 
+    def _get_variables_parallel(self, variable_names, n_jobs):
+        ''' get variables, reading compressed variables in `n_jobs` threads
+
+        The variables are found with ``scan_variables``.  The threads
+        take turns to read the compressed data of a variable from the
+        stream, and then decompress (zlib releases the GIL) and read it
+        from memory concurrently.  Uncompressed variables are read from
+        the stream in turn.
+        '''
+        index = self.scan_variables()
+        self.mat_stream.seek(0)
+        mdict = self.read_file_header()
+        mdict['__globals__'] = []
+        infos = {}
+        for info in index:
+            name = info.name
+            if variable_names and name not in variable_names:
+                continue
+            if name in infos:
+                warnings.warn('Duplicate variable name "%s" in stream'
+                              ' - replacing previous with new\n'
+                              'Consider mio5.varmats_from_mat to split '
+                              'file into single variable files' % name,
+                              MatReadWarning, stacklevel=3)
+            infos[name] = info
+        names = infos.keys()
+        lock = threading.Lock()
+        def read(name):
+            # We want to keep function workspaces raw, see get_variables
+            process = name != '__function_workspace__'
+            try:
+                return self._read_variable_locked(infos[name], process,
+                                                  lock)
+            except MatReadError, err:
+                return err
+        results = _run_parallel(read, names, n_jobs)
+        for name, res in zip(names, results):
+            if isinstance(res, MatReadError):
+                warnings.warn(
+                    'Unreadable variable "%s", because "%s"' % \
+                    (name, res),
+                    Warning, stacklevel=3)
+                res = "Read error: %s" % res
+            mdict[name] = res
+        for info in index:
+            if info.is_global and infos.get(info.name) is info:
+                mdict['__globals__'].append(info.name)
+        return mdict
+
+    def _read_variable_locked(self, info, process, lock):
+        ''' Read variable indexed by `info`, taking `lock` to read stream '''
+        reader = VarReader5(self)
+        tag_dtype = MDTYPES[self.byte_order]['dtypes']['tag_full']
+        lock.acquire()
+        try:
+            self.mat_stream.seek(info.position)
+            tag = read_dtype(self.mat_stream, tag_dtype)
+            if not info.compressed:
+                reader.set_stream(self.mat_stream)
+                header = reader.read_header()
+                return reader.array_from_header(header, process)
+            data = self.mat_stream.read(int(tag['byte_count']))
+        finally:
+            lock.release()
+        # See read_var_header for the use of decompressobj
+        dcor = zlib.decompressobj()
+        stream = BytesIO(dcor.decompress(data))
+        del data
+        reader.set_stream(stream)
+        mdtype, byte_count = reader.read_full_tag()
+        if not mdtype == miMATRIX:
+            raise TypeError('Expecting miMATRIX type here, got %d' %  mdtype)
+        header = reader.read_header()
+        return reader.array_from_header(header, process)
+
+    def scan_variables(self):
+        ''' Index variables in stream, reading only their headers
+
+        Compressed variables are only decompressed as far as needed to
+        read their headers.
+
+        Returns
+        -------
+        index : list
+           ``MatVarInfo`` object for each variable, in stream order
+        '''
+        self.mat_stream.seek(0)
+        self.initialize_read()
+        self.read_file_header()
+        index = []
+        while not self.end_of_stream():
+            position = self.mat_stream.tell()
+            mdtype, byte_count = self._file_reader.read_full_tag()
+            next_position = self.mat_stream.tell() + byte_count
+            compressed = mdtype == miCOMPRESSED
+            if compressed:
+                stream = self._read_compressed_start(byte_count)
+                self._matrix_reader.set_stream(stream)
+                try:
+                    mdtype, byte_count = self._matrix_reader.read_full_tag()
+                    header = self._matrix_reader.read_header()
+                except IOError:
+                    # header runs past the decompressed start
+                    self.mat_stream.seek(position)
+                    header, next_position = self.read_var_header()
+                    mdtype = miMATRIX
+            else:
+                self._matrix_reader.set_stream(self.mat_stream)
+                header = self._matrix_reader.read_header()
+            if not mdtype == miMATRIX:
+                raise TypeError('Expecting miMATRIX type here, got %d'
+                                % mdtype)
+            index.append(self._var_info(header, position, compressed))
+            self.mat_stream.seek(next_position)
+        return index
+
+    def _read_compressed_start(self, byte_count):
+        ''' Decompress start of compressed element at stream position
+
+        Decompresses `byte_count` bytes of compressed data from the
+        current stream position until there are at least
+        ``_HEADER_BYTES`` bytes, enough for the headers of nearly all
+        matrices.
+
+        Returns
+        -------
+        stream : BytesIO
+           stream with start of decompressed data
+        '''
+        dcor = zlib.decompressobj()
+        chunks = []
+        n_bytes = 0
+        while byte_count > 0 and n_bytes < _HEADER_BYTES:
+            data = self.mat_stream.read(min(byte_count, _HEADER_BYTES))
+            if not data:
+                break
+            byte_count -= len(data)
+            chunk = dcor.decompress(data)
+            chunks.append(chunk)
+            n_bytes += len(chunk)
+        return BytesIO(asbytes('').join(chunks))
+
+    def _var_info(self, header, position, compressed):
+        ''' Index entry for `header`, just read by the matrix reader '''
+        name = asstr(header.name)
+        if name == '':
+            name = '__function_workspace__'
+        shape = tuple(header.dims)
+        dtype = None
+        data_position = None
+        class_dtypes = MDTYPES[self.byte_order]['classes']
+        if header.mclass in class_dtypes: # numeric matrix
+            try:
+                mdtype, byte_count, tag_data = self._matrix_reader.read_tag()
+            except IOError: # tag past the decompressed start
+                mdtype, tag_data = None, None
+            dtype = MDTYPES[self.byte_order]['dtypes'].get(mdtype)
+            if dtype is not None and not (compressed or header.is_complex
+                                          or tag_data is not None):
+                # values in file; can we map them to the returned array?
+                n_bytes = dtype.itemsize
+                for dim in shape:
+                    n_bytes *= dim
+                recast = self.mat_dtype and (
+                    header.is_logical or
+                    dtype != class_dtypes[header.mclass])
+                if n_bytes > 0 and n_bytes == byte_count and not recast:
+                    data_position = self.mat_stream.tell()
+        return MatVarInfo(name, shape, dtype, header.mclass, position,
+                          is_complex=bool(header.is_complex),
+                          is_global=bool(header.is_global),
+                          compressed=compressed,
+                          data_position=data_position)
+
 
 def varmats_from_mat(file_obj):
     """ Pull variables out of mat 5 file as a sequence of mat file objects
@@ -468,6 +653,114 @@ NDT_TAG_FULL = MDTYPES[boc.native_code]['dtypes']['tag_full']
 NDT_TAG_SMALL = MDTYPES[boc.native_code]['dtypes']['tag_smalldata']
 NDT_ARRAY_FLAGS = MDTYPES[boc.native_code]['dtypes']['array_flags']
 
+# approximate size in bytes of the pieces in which array data is written
+_WRITE_CHUNK = 1 << 20
+
+
+def _fortran_chunks(arr, chunk_size=None):
+    ''' Generate bytes of `arr` in Fortran order, in pieces
+
+    Pieces hold about `chunk_size` bytes, so that writing large arrays
+    does not make a copy of the whole array.
+
+    Parameters
+    ----------
+    arr : ndarray
+    chunk_size : None or int, optional
+       approximate size of pieces.  Defaults to ``_WRITE_CHUNK``
+
+    Examples
+    --------
+    >>> arr = np.arange(6, dtype='u1').reshape((2, 3))
+    >>> list(_fortran_chunks(arr, 4))
+    ['\\x00\\x03\\x01\\x04', '\\x02\\x05']
+    '''
+    if chunk_size is None:
+        chunk_size = _WRITE_CHUNK
+    if arr.ndim == 0 or arr.nbytes <= chunk_size:
+        yield arr.tostring(order='F')
+        return
+    # the last index varies slowest in Fortran order; slices along the
+    # last axis are consecutive pieces
+    n = arr.shape[-1]
+    slice_bytes = arr.nbytes // n
+    if slice_bytes > chunk_size:
+        for i in range(n):
+            for chunk in _fortran_chunks(arr[..., i], chunk_size):
+                yield chunk
+        return
+    step = chunk_size // slice_bytes
+    for start in range(0, n, step):
+        yield arr[..., start:start+step].tostring(order='F')
+
+
+class _TagRecorder(object):
+    ''' Null stream keeping the matrix tags written by a ``VarWriter5``
+
+    ``VarWriter5`` writes a placeholder matrix tag before each matrix,
+    and seeks back to write the final tag once it knows the length of
+    the matrix.  This stream discards the data, but keeps the final
+    tags, keyed by position, for a ``_ZlibWriter`` to write in place of
+    the placeholders.
+    '''
+    def __init__(self):
+        self.tags = {}
+        self._pos = 0
+        self._end = 0
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, pos, whence=0):
+        self._pos = pos
+
+    def write(self, s):
+        if self._pos < self._end:
+            self.tags[self._pos] = s
+        self._pos += len(s)
+        self._end = max(self._end, self._pos)
+
+
+class _ZlibWriter(object):
+    ''' Stream compressing data into `file_stream` as it is written
+
+    Matrix tags are taken from `tags`, made by writing the same
+    variable to a ``_TagRecorder``; later updates of written tags are
+    ignored.  ``byte_count`` is the number of compressed bytes written
+    so far.
+    '''
+    def __init__(self, file_stream, tags):
+        self.file_stream = file_stream
+        self.tags = tags
+        self.byte_count = 0
+        self._compressor = zlib.compressobj()
+        self._pos = 0
+        self._end = 0
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, pos, whence=0):
+        self._pos = pos
+
+    def write(self, s):
+        if self._pos < self._end:
+            # final tag, already written from self.tags
+            self._pos += len(s)
+            return
+        s = self.tags.get(self._pos, s)
+        self._pos += len(s)
+        self._end = self._pos
+        self._write_compressed(self._compressor.compress(s))
+
+    def close(self):
+        ''' Write the rest of the compressed data '''
+        self._write_compressed(self._compressor.flush())
+
+    def _write_compressed(self, data):
+        self.file_stream.write(data)
+        self.byte_count += len(data)
+
 
 class VarWriter5(object):
     ''' Generic matlab matrix writing class '''
@@ -484,7 +777,8 @@ class VarWriter5(object):
         self._var_is_global = False
 
     def write_bytes(self, arr):
-        self.file_stream.write(arr.tostring(order='F'))
+        for chunk in _fortran_chunks(arr):
+            self.file_stream.write(chunk)
 
     def write_string(self, s):
         self.file_stream.write(s)
@@ -827,13 +1121,49 @@ class MatFile5Writer(object):
                 continue
             is_global = name in self.global_vars
             if self.do_compression:
-                stream = BytesIO()
-                self._matrix_writer.file_stream = stream
-                self._matrix_writer.write_top(var, asbytes(name), is_global)
-                out_str = zlib.compress(stream.getvalue())
-                tag = np.empty((), NDT_TAG_FULL)
-                tag['mdtype'] = miCOMPRESSED
-                tag['byte_count'] = len(out_str)
-                self.file_stream.write(tag.tostring() + out_str)
+                self._put_compressed(var, asbytes(name), is_global)
             else: # not compressing
                 self._matrix_writer.write_top(var, asbytes(name), is_global)
+
+    def put_variable(self, name, var):
+        ''' Write variable `var` with `name` to stream
+
+        As for ``put_variables``, the file header is written first if
+        the stream is at position 0.  Write variables one at a time to
+        a new file, or to a file opened for update with the stream
+        position at its end, to append them to the file.
+
+        Parameters
+        ----------
+        name : str
+           name of the variable in the matlab workspace
+        var : object
+           something writeable to a matlab file, such as a numpy array
+        '''
+        self.put_variables({name: var})
+
+    def _put_compressed(self, var, name, is_global):
+        ''' Write `var` as compressed element
+
+        The variable is compressed piece by piece as it is written, so
+        that neither the variable nor its compressed data is held in
+        memory.  To know the lengths of the matrices in advance, the
+        variable is first written to a ``_TagRecorder``.
+        '''
+        recorder = _TagRecorder()
+        self._matrix_writer.file_stream = recorder
+        self._matrix_writer.write_top(var, name, is_global)
+        tag = np.zeros((), NDT_TAG_FULL)
+        tag['mdtype'] = miCOMPRESSED
+        tag_pos = self.file_stream.tell()
+        self.file_stream.write(tag.tostring())
+        stream = _ZlibWriter(self.file_stream, recorder.tags)
+        self._matrix_writer.file_stream = stream
+        self._matrix_writer.write_top(var, name, is_global)
+        stream.close()
+        # update compressed element tag with compressed length
+        end_pos = self.file_stream.tell()
+        tag['byte_count'] = stream.byte_count
+        self.file_stream.seek(tag_pos)
+        self.file_stream.write(tag.tostring())
+        self.file_stream.seek(end_pos)
@@ -122,8 +122,8 @@ cdef class VarHeader5:
     cdef readonly object dims
     cdef cnp.int32_t dims_ptr[_MAT_MAXDIMS]
     cdef int n_dims
-    cdef int is_complex
-    cdef int is_logical
+    cdef readonly int is_complex
+    cdef readonly int is_logical
     cdef public int is_global
     cdef size_t nzmax
 
@@ -169,7 +169,7 @@ cdef class VarReader5:
     * mat_dtype (bool)
     * squeeze_me (bool)
     """
-    def __new__(self, preader):
+    def __cinit__(self, preader):
         byte_order = preader.byte_order
         self.is_swapped = byte_order == swapped_code
         if self.is_swapped:
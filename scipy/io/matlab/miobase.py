@@ -16,6 +16,8 @@ from scipy.misc import doccer
 
 import byteordercodes as boc
 
+from mio_utils import squeeze_element
+
 class MatReadError(Exception): pass
 
 class MatWriteError(Exception): pass
@@ -370,6 +372,97 @@ class MatFileReader(object):
         self.mat_stream.seek(curpos-1)
         return len(b) == 0
 
+    def read_variable(self, info, process=True, mmap_mode=None):
+        ''' Read variable indexed by `info`
+
+        Parameters
+        ----------
+        info : MatVarInfo
+           index entry of variable, from ``self.scan_variables``
+        process : {True, False} bool, optional
+           If True, apply recursive post-processing during loading of
+           array.
+        mmap_mode : {None, 'r', 'c'}, optional
+           If not None, and the values of the variable can be
+           memory-mapped (see ``MatVarInfo.data_position``), return a
+           ``numpy.memmap`` of the values opened with this mode instead
+           of reading them.
+
+        Returns
+        -------
+        arr : array
+           array with post-processing applied or not according to
+           `process`.
+        '''
+        if mmap_mode is not None and info.data_position is not None:
+            try:
+                arr = np.memmap(self.mat_stream,
+                                dtype=info.dtype,
+                                mode=mmap_mode,
+                                offset=info.data_position,
+                                shape=info.shape,
+                                order='F')
+            except (AttributeError, IOError, ValueError):
+                # stream is not a file on disk; read it below
+                pass
+            else:
+                if process and self.squeeze_me:
+                    return squeeze_element(arr)
+                return arr
+        self.mat_stream.seek(info.position)
+        header, next_position = self.read_var_header()
+        return self.read_var_array(header, process)
+
+
+class MatVarInfo(object):
+    ''' Index entry for a variable in a mat file
+
+    Made for each variable by the ``scan_variables`` method of the mat
+    file readers, which only reads the variable headers.
+
+    Attributes
+    ----------
+    name : str
+       name of variable
+    shape : tuple
+       matlab dimensions of variable
+    dtype : dtype or None
+       dtype of the stored values of a numeric variable, or None if the
+       variable is not numeric or its dtype is not known without reading
+       the variable
+    mclass : int
+       matlab class code of variable (specific to file format)
+    is_complex : bool
+       whether variable is complex
+    is_global : bool
+       whether variable is global
+    position : int
+       stream position of variable, where ``read_var_header`` reads its
+       header
+    compressed : bool
+       whether variable is stored compressed
+    data_position : int or None
+       stream position of the values of a real numeric variable, if they
+       are stored (in Fortran order) so that they can be memory-mapped to
+       give the array the reader returns; None otherwise
+    '''
+    def __init__(self, name, shape, dtype, mclass, position,
+                 is_complex=False, is_global=False, compressed=False,
+                 data_position=None):
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+        self.mclass = mclass
+        self.position = position
+        self.is_complex = is_complex
+        self.is_global = is_global
+        self.compressed = compressed
+        self.data_position = data_position
+
+    def __repr__(self):
+        return '%s(%r, shape=%r, dtype=%r)' % (
+            self.__class__.__name__, self.name, self.shape, self.dtype)
+
 
 def arr_dtype_number(arr, num):
     ''' Return dtype for given number of items per element'''
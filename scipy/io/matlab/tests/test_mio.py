@@ -22,6 +22,7 @@ except ImportError:
 import warnings
 import shutil
 import gzip
+import zlib
 
 from numpy.testing import \
      assert_array_equal, \
@@ -33,13 +34,15 @@ from nose.tools import assert_true
 
 import numpy as np
 from numpy import array
+from numpy.compat import asbytes
 import scipy.sparse as SP
 
 import scipy.io.matlab.byteordercodes as boc
+import scipy.io.matlab.mio5 as mio5
 from scipy.io.matlab.miobase import matdims, MatFileReader, \
     MatWriteError
 from scipy.io.matlab.mio import find_mat_file, mat_reader_factory, \
-    loadmat, savemat
+    loadmat, savemat, MatFile
 from scipy.io.matlab.mio5 import MatlabObject, MatFile5Writer, \
       MatFile5Reader, MatlabFunction, varmats_from_mat
 
@@ -883,5 +886,323 @@ def test_one_by_zero():
     assert_equal(d['var'].shape, (0,))
 
 
+def _matfile_vars():
+    # Variables in defined order, as for test_varmats_from_mat
+    names_vars = (('arr', np.arange(600.).reshape((20, 30))),
+                  ('ints', np.arange(12, dtype=np.int16).reshape((3, 4))),
+                  ('cplx', mlarr([[1, 2j]])),
+                  ('sp', SP.csc_matrix(np.eye(4))),
+                  ('mystr', mlarr('a string')),
+                  ('row', mlarr(np.arange(5.)).T))
+    class C(object):
+        def items(self): return names_vars
+    return names_vars, C()
+
+
+def test_matfile():
+    names_vars, mdict = _matfile_vars()
+    tmpdir = mkdtemp()
+    try:
+        for do_compression in (False, True):
+            fname = pjoin(tmpdir, 'vars.mat')
+            savemat_future(fname, mdict, do_compression=do_compression)
+            mf = MatFile(fname)
+            names = [name for name, var in names_vars]
+            assert_equal(mf.keys(), names)
+            assert_equal(len(mf), 6)
+            assert_true('ints' in mf)
+            assert_true(not 'missing' in mf)
+            assert_raises(KeyError, mf.__getitem__, 'missing')
+            info = mf.info('arr')
+            assert_equal(info.shape, (20, 30))
+            assert_equal(info.dtype, np.dtype(np.float64))
+            assert_equal(info.compressed, do_compression)
+            assert_equal(mf.info('ints').dtype, np.dtype(np.int16))
+            assert_true(mf.info('cplx').is_complex)
+            assert_equal(mf.info('sp').dtype, None)
+            expected = loadmat(fname)
+            for name in names:
+                res = mf[name]
+                if SP.issparse(res):
+                    res = res.todense()
+                    exp = expected[name].todense()
+                else:
+                    exp = expected[name]
+                    assert_equal(res.dtype, exp.dtype)
+                assert_array_equal(res, exp)
+            # real numeric arrays are mapped from uncompressed files
+            for name in ('arr', 'ints', 'row'):
+                assert_equal(isinstance(mf[name], np.memmap),
+                             not do_compression)
+            assert_true(not isinstance(mf['cplx'], np.memmap))
+            mf.close()
+            # arrays are read if not memory-mapped
+            mf = MatFile(fname, mmap_mode=None)
+            assert_true(not isinstance(mf['arr'], np.memmap))
+            assert_array_equal(mf['arr'], expected['arr'])
+            mf.close()
+            mf = MatFile(fname, squeeze_me=True)
+            assert_equal(mf['row'].shape, (5,))
+            assert_equal(mf['ints'].shape, (3, 4))
+            mf.close()
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+def test_matfile_mmap_modes():
+    names_vars, mdict = _matfile_vars()
+    tmpdir = mkdtemp()
+    try:
+        fname = pjoin(tmpdir, 'vars.mat')
+        savemat_future(fname, mdict)
+        mf = MatFile(fname)
+        arr = mf['arr']
+        # read only
+        assert_raises((RuntimeError, ValueError), arr.__setitem__, 0, 1)
+        mf.close()
+        # arrays stay valid after closing
+        assert_array_equal(arr, names_vars[0][1])
+        mf = MatFile(fname, mmap_mode='c')
+        arr = mf['arr']
+        arr[0] = -1
+        assert_array_equal(arr[0], -1)
+        mf.close()
+        # copy on write leaves the file alone
+        assert_array_equal(loadmat(fname)['arr'], names_vars[0][1])
+        assert_raises(ValueError, MatFile, fname, mmap_mode='w+')
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+def test_matfile_streams():
+    # arrays in streams that are not files are read
+    names_vars, mdict = _matfile_vars()
+    for do_compression in (False, True):
+        stream = BytesIO()
+        savemat_future(stream, mdict, do_compression=do_compression)
+        mf = MatFile(stream)
+        res = mf['arr']
+        assert_true(not isinstance(res, np.memmap))
+        assert_array_equal(res, names_vars[0][1])
+        assert_array_equal(mf['cplx'], names_vars[2][1])
+
+
+def test_matfile_long_header():
+    # the headers of compressed variables are read even if they are
+    # longer than the start that is decompressed to read them
+    arr = np.arange(24.).reshape((2, 3, 4))
+    stream = BytesIO()
+    savemat_future(stream, {'a_rather_long_name': arr, 'b': arr + 1},
+                   do_compression=True)
+    old_header_bytes = mio5._HEADER_BYTES
+    try:
+        for header_bytes in (1, 30, 60):
+            mio5._HEADER_BYTES = header_bytes
+            mf = MatFile(stream)
+            assert_equal(sorted(mf.keys()), ['a_rather_long_name', 'b'])
+            assert_equal(mf.info('a_rather_long_name').shape, (2, 3, 4))
+            assert_array_equal(mf['a_rather_long_name'], arr)
+            assert_array_equal(mf['b'], arr + 1)
+    finally:
+        mio5._HEADER_BYTES = old_header_bytes
+
+
+def test_matfile_data_files():
+    # MatFile reads the variables of loadmat
+    # mat_dtype casts complex arrays to real
+    warnings.simplefilter('ignore', np.ComplexWarning)
+    try:
+        _check_matfile_data_files()
+    finally:
+        warnings.resetwarnings()
+
+
+def _check_matfile_data_files():
+    for fname in glob(pjoin(test_data_path, '*.mat')):
+        for kwargs in ({}, {'mat_dtype': True, 'squeeze_me': True}):
+            try:
+                expected = loadmat(fname, **kwargs)
+            except (NotImplementedError, ValueError):
+                # v7.3, broken files
+                continue
+            mf = MatFile(fname, **kwargs)
+            for name in mf:
+                assert_true(name in expected)
+                res = mf[name]
+                exp = expected[name]
+                if not isinstance(res, np.memmap):
+                    assert_equal(type(res), type(exp))
+                if (isinstance(exp, np.ndarray) and
+                    exp.dtype.kind in 'biufcU'):
+                    assert_equal(res.dtype, exp.dtype)
+                    assert_array_equal(res, exp)
+            mf.close()
+
+
+def test_fortran_chunks():
+    arr = np.arange(2 * 3 * 50, dtype=np.float64).reshape((2, 3, 50))
+    carr = arr * (1 + 1j)
+    for a in (arr, arr.T, np.asfortranarray(arr), arr[:, ::2, 1::3],
+              carr.real, carr.imag, arr[0, 0], np.zeros((3, 0))):
+        for chunk_size in (1, 8, 50, 100, 10**6):
+            chunks = list(mio5._fortran_chunks(a, chunk_size))
+            assert_equal(asbytes('').join(chunks), a.tostring(order='F'))
+            for chunk in chunks:
+                assert_true(len(chunk) <= max(chunk_size, a.itemsize))
+
+
+def _assert_loaded_equal(vals, mdict):
+    for name, var in mdict.items():
+        res = vals[name]
+        if SP.issparse(var):
+            assert_array_equal(res.todense(), var.todense())
+        elif isinstance(var, dict):
+            for key in var:
+                assert_array_equal(res[key][0, 0], var[key])
+        elif isinstance(var, np.ndarray) and var.dtype.hasobject:
+            for i in range(var.size):
+                assert_array_equal(res.flat[i], var.flat[i])
+        else:
+            assert_array_equal(res, var)
+
+
+def test_write_in_pieces():
+    cells = np.empty((1, 3), dtype=object)
+    cells[0, 0] = np.arange(40.).reshape((1, 40))
+    cells[0, 1] = 'a string'
+    cells[0, 2] = np.ones((3, 4)) * 1j
+    mdict = {'arr': np.arange(300.).reshape((10, 30)),
+             'tarr': np.arange(60, dtype=np.int32).reshape((3, 20)).T,
+             'cplx': np.arange(50.).reshape((5, 10)) * (1 + 2j),
+             'sp': SP.csc_matrix(np.eye(20)),
+             'cells': cells,
+             'st': {'a': np.arange(70.).reshape((1, 70)), 'b': 'text'}}
+    old_chunk = mio5._WRITE_CHUNK
+    try:
+        for do_compression in (False, True):
+            streams = []
+            for chunk in (16, 10**6):
+                mio5._WRITE_CHUNK = chunk
+                stream = BytesIO()
+                savemat_future(stream, mdict, do_compression=do_compression)
+                streams.append(stream.getvalue()[128:])
+                _assert_loaded_equal(loadmat(stream), mdict)
+            # the file does not depend on the size of the pieces
+            assert_equal(streams[0], streams[1])
+    finally:
+        mio5._WRITE_CHUNK = old_chunk
+
+
+def test_compressed_elements():
+    # compressed elements hold the variables as written uncompressed
+    mdict = {'arr': np.arange(300.).reshape((10, 30))}
+    plain = BytesIO()
+    savemat_future(plain, mdict)
+    compressed = BytesIO()
+    savemat_future(compressed, mdict, do_compression=True)
+    data = compressed.getvalue()
+    tag = np.ndarray(shape=(2,), dtype=np.uint32, buffer=data[128:136])
+    assert_equal(tag[0], 15) # miCOMPRESSED
+    assert_equal(tag[1], len(data) - 136)
+    assert_equal(zlib.decompress(data[136:]), plain.getvalue()[128:])
+
+
+def test_savemat_append():
+    tmpdir = mkdtemp()
+    try:
+        fname = pjoin(tmpdir, 'app.mat')
+        arr = np.arange(12.).reshape((3, 4))
+        for format in ('5', '4'):
+            # appending to a missing file makes a new one
+            savemat_future(fname, {'a': arr}, format=format, append=True)
+            savemat_future(fname, {'b': arr + 1}, format=format,
+                           append=True)
+            if format == '5':
+                savemat_future(fname, {'c': 'text'}, append=True,
+                               do_compression=True)
+            vals = loadmat(fname)
+            assert_array_equal(vals['a'], arr)
+            assert_array_equal(vals['b'], arr + 1)
+            if format == '5':
+                assert_array_equal(vals['c'], array([u'text']))
+                assert_raises(ValueError, savemat_future, fname,
+                              {'d': arr}, format='4', append=True)
+            else:
+                assert_raises(ValueError, savemat_future, fname,
+                              {'d': arr}, format='5', append=True)
+            # without append, the file is replaced
+            savemat_future(fname, {'d': arr}, format=format)
+            assert_equal(sorted([key for key in loadmat(fname)
+                                 if not key.startswith('__')]), ['d'])
+            os.remove(fname)
+        # streams
+        stream = BytesIO()
+        savemat_future(stream, {'a': arr})
+        savemat_future(stream, {'b': arr + 1}, append=True)
+        vals = loadmat(stream)
+        assert_array_equal(vals['a'], arr)
+        assert_array_equal(vals['b'], arr + 1)
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+def test_put_variable():
+    arr = np.arange(12.).reshape((3, 4))
+    for do_compression in (False, True):
+        stream = BytesIO()
+        writer = MatFile5Writer(stream, do_compression=do_compression,
+                                oned_as='row')
+        writer.put_variable('a', arr)
+        writer.put_variable('b', arr + 1)
+        mf = MatFile(stream)
+        assert_equal(mf.keys(), ['a', 'b'])
+        assert_array_equal(mf['b'], arr + 1)
+
+
+def test_loadmat_n_jobs():
+    mdict = dict(('var%d' % i, np.arange(i * 100.).reshape((i, 100)))
+                 for i in range(1, 20))
+    mdict['text'] = 'some text'
+    mdict['sp'] = SP.csc_matrix(np.eye(10))
+    for do_compression in (False, True):
+        stream = BytesIO()
+        MatFile5Writer(stream, do_compression=do_compression,
+                       global_vars=['var3'],
+                       oned_as='row').put_variables(mdict)
+        expected = loadmat(stream)
+        for n_jobs in (2, 5, -1):
+            vals = loadmat(stream, n_jobs=n_jobs)
+            assert_equal(sorted(vals.keys()), sorted(expected.keys()))
+            assert_equal(vals['__globals__'], ['var3'])
+            assert_array_equal(vals['text'], expected['text'])
+            assert_array_equal(vals['sp'].todense(),
+                               expected['sp'].todense())
+            for i in range(1, 20):
+                name = 'var%d' % i
+                assert_array_equal(vals[name], mdict[name])
+            vals = loadmat(stream, n_jobs=n_jobs,
+                           variable_names=['var2', 'var7'])
+            assert_equal(sorted([key for key in vals
+                                 if not key.startswith('__')]),
+                         ['var2', 'var7'])
+            assert_array_equal(vals['var7'], mdict['var7'])
+        assert_raises(ValueError, loadmat, stream, n_jobs=0)
+    # data files
+    for fname in glob(pjoin(test_data_path, 'test*_7.*.mat')):
+        if 'hdf5' in fname:
+            continue
+        expected = loadmat(fname)
+        vals = loadmat(fname, n_jobs=2)
+        assert_equal(sorted(vals.keys()), sorted(expected.keys()))
+        for name in vals:
+            if isinstance(expected[name], np.ndarray):
+                assert_equal(vals[name].dtype, expected[name].dtype)
+                assert_equal(vals[name].shape, expected[name].shape)
+    # mat 4 files have nothing to decompress
+    vals = loadmat(pjoin(test_data_path, 'testmulti_4.2c_SOL2.mat'),
+                   n_jobs=2)
+    assert_array_equal(vals['theta'], theta)
+
+
 if __name__ == "__main__":
     run_module_suite()
@@ -10,12 +10,21 @@
 #
 
 import os
-from numpy import asarray, real, imag, conj, zeros, ndarray, concatenate, \
-                  ones, ascontiguousarray, vstack, savetxt, fromfile, fromstring
+from numpy import asarray, conj, zeros, ndarray, ones, empty, concatenate, \
+                  column_stack
 from numpy.compat import asbytes, asstr
 
+from _mmio_utils import tokenize
+
 __all__ = ['mminfo','mmread','mmwrite', 'MMFile']
 
+# Number of bytes read, and of entries written, at a time.  The body of
+# a file is read in chunks of complete lines and converted to arrays by
+# the compiled tokenizer; entries are written by formatting a chunk at a
+# time with one string operation.
+_READ_CHUNK = 1 << 24
+_WRITE_CHUNK = 1 << 16
+
 
 #-------------------------------------------------------------------------------
 def mminfo(source):
@@ -48,7 +57,7 @@ def mminfo(source):
     return MMFile.info(source)
 
 #-------------------------------------------------------------------------------
-def mmread(source):
+def mmread(source, sparse_format='coo'):
     """
     Reads the contents of a Matrix Market file 'filename' into a matrix.
 
@@ -58,14 +67,24 @@ def mmread(source):
     source : file
         Matrix Market filename (extensions .mtx, .mtz.gz)
         or open file object.
+    sparse_format : {'coo', 'csr', 'csc'}, optional
+        Format of the returned matrix if the file holds a sparse
+        (coordinate) matrix.
 
     Returns
     -------
     a:
         Sparse or full matrix
 
+    Notes
+    -----
+    The file is read in chunks, so that apart from the returned matrix
+    only a constant amount of memory is used.  With ``sparse_format``
+    ``'csr'`` or ``'csc'`` the entries are converted as soon as they have
+    been read, and the COO arrays are freed before returning.
+
     """
-    return MMFile().read(source)
+    return MMFile().read(source, sparse_format)
 
 #-------------------------------------------------------------------------------
 def mmwrite(target, a, comment='', field=None, precision=None):
@@ -198,11 +217,11 @@ class MMFile (object):
             line = line.split()
             if format == self.FORMAT_ARRAY:
                 assert len(line)==2,`line`
-                rows,cols = map(float, line)
+                rows,cols = map(int, line)
                 entries = rows*cols
             else:
                 assert len(line)==3,`line`
-                rows, cols, entries = map(float, line)
+                rows, cols, entries = map(int, line)
 
             return (rows, cols, entries, format, field, symmetry)
 
@@ -262,16 +281,16 @@ class MMFile (object):
         isskew = 1
         isherm = a.dtype.char in 'FD'
         for j in range(n):
-            for i in range(j+1,n):
-                aij,aji = a[i][j],a[j][i]
-                if issymm and aij != aji:
-                    issymm = 0
-                if isskew and aij != -aji:
-                    isskew = 0
-                if isherm and aij != conj(aji):
-                    isherm = 0
-                if not (issymm or isskew or isherm):
-                    break
+            # compare column j below the diagonal with row j right of it
+            aij,aji = a[j+1:,j],a[j,j+1:]
+            if issymm and (aij != aji).any():
+                issymm = 0
+            if isskew and (aij != -aji).any():
+                isskew = 0
+            if isherm and (aij != conj(aji)).any():
+                isherm = 0
+            if not (issymm or isskew or isherm):
+                break
         if issymm: return MMFile.SYMMETRY_SYMMETRIC
         if isskew: return MMFile.SYMMETRY_SKEW_SYMMETRIC
         if isherm: return MMFile.SYMMETRY_HERMITIAN
@@ -290,12 +309,15 @@ class MMFile (object):
     def __init__(self, **kwargs): self._init_attrs(**kwargs)
 
     #---------------------------------------------------------------------------
-    def read(self, source):
+    def read(self, source, sparse_format='coo'):
+        if sparse_format not in ('coo', 'csr', 'csc'):
+            raise ValueError("sparse_format must be 'coo', 'csr' or 'csc'")
+
         stream, close_it = self._open(source)
 
         try:
             self._parse_header(stream)
-            return self._parse_body(stream)
+            return self._parse_body(stream, sparse_format)
 
         finally:
             if close_it: stream.close()
@@ -335,12 +357,29 @@ class MMFile (object):
           field=field, symmetry=symmetry)
 
     #---------------------------------------------------------------------------
-    def _parse_body(self, stream):
+    @staticmethod
+    def _read_chunks(stream, ncols):
+        """
+        Generate the numbers on the remaining lines of stream as 2-D arrays
+        with ncols columns, holding a chunk of complete lines each.
+        """
+        newline = asbytes('\n')
+        while 1:
+            chunk = stream.read(_READ_CHUNK)
+            if not chunk:
+                break
+            if not chunk.endswith(newline):
+                chunk += stream.readline()
+            yield tokenize(chunk, ncols)
+
+    #---------------------------------------------------------------------------
+    def _parse_body(self, stream, sparse_format='coo'):
         rows, cols, entries, format, field, symm = \
           (self.rows, self.cols, self.entries, self.format, self.field, self.symmetry)
 
         try:
             from scipy.sparse import coo_matrix
+            from scipy.sparse.sputils import get_index_dtype
         except ImportError:
             coo_matrix = None
 
@@ -353,116 +392,104 @@ class MMFile (object):
         is_pattern = field == self.FIELD_PATTERN
 
         if format == self.FORMAT_ARRAY:
-            a = zeros((rows,cols),dtype=dtype)
-            line = 1
+            # Fill the columns of a Fortran ordered array, from the diagonal
+            # down if only the lower triangle is stored.
+            a = zeros((rows,cols), dtype=dtype, order='F')
             i,j = 0,0
-            while line:
-                line = stream.readline()
-                if not line or line.startswith(asbytes('%')):
-                    continue
+            if rows == 0:
+                j = cols
+            for block in self._read_chunks(stream, 1 + is_complex):
                 if is_complex:
-                    aij = complex(*map(float,line.split()))
+                    values = block.view('D')[:,0]
                 else:
-                    aij = float(line)
-                a[i,j] = aij
-                if has_symmetry and i!=j:
-                    if is_skew:
-                        a[j,i] = -aij
-                    elif is_herm:
-                        a[j,i] = conj(aij)
-                    else:
-                        a[j,i] = aij
-                if i<rows-1:
-                    i = i + 1
-                else:
-                    j = j + 1
-                    if not has_symmetry:
-                        i = 0
-                    else:
-                        i = j
-            assert i in [0,j] and j==cols,`i,j,rows,cols`
+                    values = block[:,0]
+                k = 0
+                while k < len(values):
+                    if j == cols:
+                        raise ValueError('more entries than specified in header')
+                    m = min(rows - i, len(values) - k)
+                    a[i:i+m,j] = values[k:k+m]
+                    k += m
+                    i += m
+                    if i == rows:
+                        j += 1
+                        if has_symmetry:
+                            i = j
+                        else:
+                            i = 0
+            if j != cols:
+                raise ValueError('fewer entries than specified in header')
 
-        elif format == self.FORMAT_COORDINATE and coo_matrix is None:
-            # Read sparse matrix to dense when coo_matrix is not available.
-            a = zeros((rows,cols), dtype=dtype)
-            line = 1
-            k = 0
-            while line:
-                line = stream.readline()
-                if not line or line.startswith(asbytes('%')):
-                    continue
-                l = line.split()
-                i,j = map(int,l[:2])
-                i,j = i-1,j-1
-                if is_complex:
-                    aij = complex(*map(float,l[2:]))
-                else:
-                    aij = float(l[2])
-                a[i,j] = aij
-                if has_symmetry and i!=j:
+            if has_symmetry:
+                for j in range(cols):
                     if is_skew:
-                        a[j,i] = -aij
+                        a[j,j+1:] = -a[j+1:,j]
                     elif is_herm:
-                        a[j,i] = conj(aij)
+                        a[j,j+1:] = conj(a[j+1:,j])
                     else:
-                        a[j,i] = aij
-                k = k + 1
-            assert k==entries,`k,entries`
+                        a[j,j+1:] = a[j+1:,j]
 
         elif format == self.FORMAT_COORDINATE:
-            # Read sparse COOrdinate format
-            
-            if entries == 0:
-                # empty matrix
-                return coo_matrix((rows, cols), dtype=dtype)
-
-            try:
-                # fromfile works for normal files
-                flat_data = fromfile(stream, sep=' ')
-            except:
-                # fallback - fromfile fails for some file-like objects
-                flat_data = fromstring(stream.read(), sep=' ')
-
-                # TODO use iterator (e.g. xreadlines) to avoid reading
-                # the whole file into memory
-
+            # Read sparse COOrdinate format into arrays allocated up front,
+            # a chunk of entries at a time
+            if coo_matrix is None:
+                idx_dtype = 'intp'
+            else:
+                idx_dtype = get_index_dtype(maxval=max(rows, cols))
+            I = empty(entries, dtype=idx_dtype)
+            J = empty(entries, dtype=idx_dtype)
             if is_pattern:
-                flat_data = flat_data.reshape(-1,2)
-                I = ascontiguousarray(flat_data[:,0], dtype='intc')
-                J = ascontiguousarray(flat_data[:,1], dtype='intc')
-                V = ones(len(I), dtype='int8')  # filler
-            elif is_complex:
-                flat_data = flat_data.reshape(-1,4)
-                I = ascontiguousarray(flat_data[:,0], dtype='intc')
-                J = ascontiguousarray(flat_data[:,1], dtype='intc')
-                V = ascontiguousarray(flat_data[:,2], dtype='complex')
-                V.imag = flat_data[:,3]
+                V = ones(entries, dtype=dtype)
+                ncols = 2
             else:
-                flat_data = flat_data.reshape(-1,3)
-                I = ascontiguousarray(flat_data[:,0], dtype='intc')
-                J = ascontiguousarray(flat_data[:,1], dtype='intc')
-                V = ascontiguousarray(flat_data[:,2], dtype='float')
+                V = empty(entries, dtype=dtype)
+                ncols = 3 + is_complex
+
+            k = 0
+            for block in self._read_chunks(stream, ncols):
+                n = len(block)
+                if k + n > entries:
+                    raise ValueError('more entries than specified in header')
+                I[k:k+n] = block[:,0]
+                J[k:k+n] = block[:,1]
+                if is_complex:
+                    V.real[k:k+n] = block[:,2]
+                    V.imag[k:k+n] = block[:,3]
+                elif not is_pattern:
+                    V[k:k+n] = block[:,2]
+                k += n
+            if k != entries:
+                raise ValueError('fewer entries than specified in header')
 
             I -= 1 #adjust indices (base 1 -> base 0)
             J -= 1
 
             if has_symmetry:
+                # append the mirrored off diagonal entries, growing the
+                # arrays in place
                 mask = (I != J)       #off diagonal mask
-                od_I = I[mask]
-                od_J = J[mask]
-                od_V = V[mask]
-
-                I = concatenate((I,od_J))
-                J = concatenate((J,od_I))
+                n = entries + mask.sum()
+                I.resize(n, refcheck=False)
+                J.resize(n, refcheck=False)
+                V.resize(n, refcheck=False)
+                I[entries:] = J[:entries][mask]
+                J[entries:] = I[:entries][mask]
+                V[entries:] = V[:entries][mask]
+                del mask
 
                 if is_skew:
-                    od_V *= -1
+                    V[entries:] *= -1
                 elif is_herm:
-                    od_V = od_V.conjugate()
+                    V[entries:] = conj(V[entries:])
 
-                V = concatenate((V,od_V))
-
-            a = coo_matrix((V, (I, J)), shape=(rows, cols), dtype=dtype)
+            if coo_matrix is None:
+                # Read sparse matrix to dense when coo_matrix is not available.
+                a = zeros((rows,cols), dtype=dtype)
+                a[I,J] = V
+            else:
+                a = coo_matrix((V, (I, J)), shape=(rows, cols), dtype=dtype)
+                del I, J, V
+                a = a.asformat(sparse_format)
         else:
             raise NotImplementedError(format)
 
@@ -543,29 +570,18 @@ class MMFile (object):
             # write shape spec
             stream.write(asbytes('%i %i\n' % (rows,cols)))
 
+            lower = symm != self.SYMMETRY_GENERAL
+
             if field in (self.FIELD_INTEGER, self.FIELD_REAL):
 
-                if symm == self.SYMMETRY_GENERAL:
-                    for j in range(cols):
-                        for i in range(rows):
-                            stream.write(asbytes(template % a[i,j]))
-                else:
-                    for j in range(cols):
-                        for i in range(j,rows):
-                            stream.write(asbytes(template % a[i,j]))
+                for values in self._column_chunks(a, lower):
+                    self._write_chunk(stream, template, values)
 
             elif field == self.FIELD_COMPLEX:
 
-                if symm == self.SYMMETRY_GENERAL:
-                    for j in range(cols):
-                        for i in range(rows):
-                            aij = a[i,j]
-                            stream.write(asbytes(template % (real(aij),imag(aij))))
-                else:
-                    for j in range(cols):
-                        for i in range(j,rows):
-                            aij = a[i,j]
-                            stream.write(asbytes(template % (real(aij),imag(aij))))
+                for values in self._column_chunks(a, lower):
+                    self._write_chunk(stream, template,
+                                      column_stack((values.real, values.imag)))
 
             elif field == self.FIELD_PATTERN:
                 raise ValueError('pattern type inconsisted with dense format')
@@ -587,17 +603,53 @@ class MMFile (object):
             fmt = '%%.%dg' % precision
 
             if field == self.FIELD_PATTERN:
-                IJV = vstack((coo.row, coo.col)).T
+                template = '%i %i\n'
             elif field in [ self.FIELD_INTEGER, self.FIELD_REAL ]:
-                IJV = vstack((coo.row, coo.col, coo.data)).T
+                template = '%%i %%i %s\n' % fmt
             elif field == self.FIELD_COMPLEX:
-                IJV = vstack((coo.row, coo.col, coo.data.real, coo.data.imag)).T
+                template = '%%i %%i %s %s\n' % (fmt, fmt)
             else:
                 raise TypeError('Unknown field type %s' % field)
 
-            IJV[:,:2] += 1 # change base 0 -> base 1
+            for k in range(0, coo.nnz, _WRITE_CHUNK):
+                # change base 0 -> base 1
+                I = coo.row[k:k+_WRITE_CHUNK] + 1
+                J = coo.col[k:k+_WRITE_CHUNK] + 1
+                V = coo.data[k:k+_WRITE_CHUNK]
+                if field == self.FIELD_PATTERN:
+                    IJV = column_stack((I, J))
+                elif field == self.FIELD_COMPLEX:
+                    IJV = column_stack((I, J, V.real, V.imag))
+                else:
+                    IJV = column_stack((I, J, V))
+                self._write_chunk(stream, template, IJV)
+
+    #---------------------------------------------------------------------------
+    @staticmethod
+    def _column_chunks(a, lower):
+        """
+        Generate the entries of a 2-D array in column major order, in chunks
+        of whole columns.  Only the entries on and below the diagonal are
+        generated if lower is true.
+        """
+        rows, cols = a.shape
+        step = max(1, _WRITE_CHUNK // max(rows, 1))
+        for j in range(0, cols, step):
+            if lower:
+                yield concatenate([a[i:,i] for i in range(j, min(j+step, cols))])
+            else:
+                yield a[:,j:j+step].T.ravel()
 
-            savetxt(stream, IJV, fmt=fmt)
+    #---------------------------------------------------------------------------
+    @staticmethod
+    def _write_chunk(stream, template, values):
+        """
+        Write the rows of values, each formatted with template, using a
+        single formatting operation for all of them.
+        """
+        values = asarray(values)
+        stream.write(asbytes((template * len(values)) %
+                             tuple(values.ravel().tolist())))
 
 #-------------------------------------------------------------------------------
 if __name__ == '__main__':
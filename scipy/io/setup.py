@@ -4,6 +4,7 @@ def configuration(parent_package='',top_path=None):
     from numpy.distutils.misc_util import Configuration
     config = Configuration('io', parent_package, top_path)
 
+    config.add_extension('_mmio_utils', sources=['_mmio_utils.c'])
     config.add_data_dir('tests')
     config.add_data_dir('docs')
     config.add_subpackage('matlab')
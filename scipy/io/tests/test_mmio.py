@@ -1,11 +1,18 @@
 #!/usr/bin/env python
 
+import sys
 from tempfile import mktemp
+if sys.version_info[0] >= 3:
+    from io import BytesIO
+else:
+    from StringIO import StringIO as BytesIO
+from numpy.compat import asbytes
 from numpy import array,transpose
 from numpy.testing import TestCase, run_module_suite, assert_array_almost_equal, \
-            assert_equal, rand
+            assert_equal, assert_raises, rand
 
 import scipy.sparse
+from scipy.io import mmio
 from scipy.io.mmio import mminfo,mmread,mmwrite
 
 
@@ -326,6 +333,75 @@ class TestMMIOCoordinate(TestCase):
                 result = mmread(fn).todense()
                 assert_array_almost_equal(result, expected)
 
+    def test_sparse_format(self):
+        fn = mktemp()
+        f = open(fn,'w')
+        f.write(_symmetric_example)
+        f.close()
+        expected = mmread(fn).todense()
+        for fmt in ['csr','csc','coo']:
+            b = mmread(fn, sparse_format=fmt)
+            assert_equal(b.format, fmt)
+            assert_array_almost_equal(b.todense(), expected)
+        assert_raises(ValueError, mmread, fn, sparse_format='lil')
+
+
+def _stream(text):
+    return BytesIO(asbytes(text))
+
+class TestMMIOChunks(TestCase):
+    """read and write files in many small chunks"""
+    def setUp(self):
+        self.chunks = (mmio._READ_CHUNK, mmio._WRITE_CHUNK)
+        mmio._READ_CHUNK = 7
+        mmio._WRITE_CHUNK = 3
+
+    def tearDown(self):
+        mmio._READ_CHUNK, mmio._WRITE_CHUNK = self.chunks
+
+    def test_coordinate(self):
+        for example in [_general_example, _hermitian_example, _skew_example,
+                        _symmetric_example, _symmetric_pattern_example]:
+            a = mmio._READ_CHUNK
+            mmio._READ_CHUNK = 1 << 20
+            expected = mmread(_stream(example)).todense()
+            mmio._READ_CHUNK = a
+            b = mmread(_stream(example)).todense()
+            assert_array_almost_equal(b, expected)
+
+    def test_write_read(self):
+        a = scipy.sparse.rand(20, 20, density=0.3)
+        for b in [a, a * 1j, a.todense(), a.todense() * (1 + 2j),
+                  a.todense() + a.todense().T]:
+            f = BytesIO()
+            mmwrite(f, b)
+            f.seek(0)
+            c = mmread(f)
+            if scipy.sparse.isspmatrix(b):
+                b, c = b.todense(), c.todense()
+            assert_array_almost_equal(c, b)
+
+    def test_comments_and_blank_lines(self):
+        example = _general_example.replace('    4     2',
+                                           '%comment\n\n    4     2')
+        b = mmread(_stream(example)).todense()
+        assert_array_almost_equal(b, mmread(_stream(_general_example)).todense())
+        a = mmread(_stream('%%MatrixMarket matrix array real general\n'
+                            '2 1\n1.5\n% comment\n\n-2\n'))
+        assert_array_almost_equal(a, [[1.5], [-2]])
+
+    def test_bad_entries(self):
+        for body in ['1 1\n2 2 2.0\n', '1 1 1.0 0\n2 2 2.0\n',
+                     '1 1 1.0\n2 2 x\n', '1 1 1.0\n',
+                     '1 1 1.0\n2 2 2.0\n1 2 3.0\n']:
+            f = _stream('%%MatrixMarket matrix coordinate real general\n'
+                         '2 2 2\n' + body)
+            assert_raises(ValueError, mmread, f)
+        for body in ['1\n2\n3\n', '1\n2\n3\n4\n5\n']:
+            f = _stream('%%MatrixMarket matrix array real general\n'
+                         '2 2\n' + body)
+            assert_raises(ValueError, mmread, f)
+
 
 if __name__ == "__main__":
     run_module_suite()
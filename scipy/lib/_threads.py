@@ -0,0 +1,62 @@
+"""Thread pool helpers shared by the subpackages that run work in threads.
+
+The threads only speed things up if the work spends most of its time in
+compiled code that releases the GIL.
+"""
+
+import threading
+
+
+def cpu_count():
+    """Return the number of CPUs, or 1 if it cannot be determined."""
+    try:
+        import multiprocessing
+        return multiprocessing.cpu_count()
+    except (ImportError, NotImplementedError):
+        return 1
+
+
+def run_parallel(func, args, n_jobs):
+    """Return ``[func(a) for a in args]``, evaluated by `n_jobs` threads.
+
+    If `n_jobs` is -1, as many threads as CPUs are used.  If a call
+    raises, no further calls are started and the first exception is
+    re-raised once the running calls have finished.
+    """
+    if n_jobs == -1:
+        n_jobs = cpu_count()
+    if n_jobs < 1:
+        raise ValueError("n_jobs must be a positive integer or -1")
+    n_jobs = min(n_jobs, len(args))
+    if n_jobs <= 1:
+        return [func(a) for a in args]
+
+    results = [None] * len(args)
+    errors = []
+    lock = threading.Lock()
+    todo = range(len(args))
+    todo.reverse()
+
+    def worker():
+        while True:
+            lock.acquire()
+            try:
+                if not todo or errors:
+                    return
+                i = todo.pop()
+            finally:
+                lock.release()
+            try:
+                results[i] = func(args[i])
+            except Exception, e:
+                errors.append(e)
+                return
+
+    threads = [threading.Thread(target=worker) for j in range(n_jobs)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    if errors:
+        raise errors[0]
+    return results
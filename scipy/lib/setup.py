@@ -6,6 +6,7 @@ def configuration(parent_package='',top_path=None):
     config = Configuration('lib',parent_package,top_path)
     config.add_subpackage('blas')
     config.add_subpackage('lapack')
+    config.add_data_dir('tests')
 
     return config
 
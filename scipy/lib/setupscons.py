@@ -7,6 +7,7 @@ def configuration(parent_package='',top_path=None):
                            setup_name = 'setupscons.py')
     config.add_subpackage('blas')
     config.add_subpackage('lapack')
+    config.add_data_dir('tests')
 
     return config
 
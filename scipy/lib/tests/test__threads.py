@@ -0,0 +1,49 @@
+""" Tests for the thread pool helpers in scipy.lib._threads """
+
+import threading
+
+from numpy.testing import assert_equal, assert_raises, assert_, \
+        run_module_suite
+
+from scipy.lib._threads import cpu_count, run_parallel
+
+
+def test_cpu_count():
+    assert_(cpu_count() >= 1)
+
+
+def test_run_parallel():
+    args = range(20)
+    for n_jobs in [1, 3, 50, -1]:
+        assert_equal(run_parallel(lambda x: x * x, args, n_jobs),
+                     [x * x for x in args])
+    assert_equal(run_parallel(lambda x: x, [], 4), [])
+    for n_jobs in [0, -2]:
+        assert_raises(ValueError, run_parallel, lambda x: x, args, n_jobs)
+
+
+def test_run_parallel_threads():
+    names = []
+    def func(x):
+        names.append(threading.currentThread().getName())
+        return x
+    run_parallel(func, range(10), 1)
+    assert_equal(set(names), set([threading.currentThread().getName()]))
+
+
+def test_run_parallel_error():
+    calls = []
+    def func(x):
+        calls.append(x)
+        if x == 3:
+            raise KeyError(x)
+        return x
+    for n_jobs in [1, 2]:
+        del calls[:]
+        assert_raises(KeyError, run_parallel, func, range(100), n_jobs)
+        # no new calls are started once one has failed
+        assert_(len(calls) < 100)
+
+
+if __name__ == "__main__":
+    run_module_suite()
@@ -8,7 +8,9 @@ from dok import *
 from coo import *
 from dia import *
 from bsr import *
-from csgraph import *
+from builder import *
+from products import *
+from csgraph import cs_graph_components
 
 from construct import *
 from extract import *
@@ -0,0 +1,11630 @@
+/* Generated by Cython 0.15.1 on Sat Oct 17 00:11:34 2026 */
+
+#define PY_SSIZE_T_CLEAN
+#include "Python.h"
+#ifndef Py_PYTHON_H
+    #error Python headers needed to compile C extensions, please install development version of Python.
+#else
+
+#include <stddef.h> /* For offsetof */
+#ifndef offsetof
+#define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
+#endif
+
+#if !defined(WIN32) && !defined(MS_WINDOWS)
+  #ifndef __stdcall
+    #define __stdcall
+  #endif
+  #ifndef __cdecl
+    #define __cdecl
+  #endif
+  #ifndef __fastcall
+    #define __fastcall
+  #endif
+#endif
+
+#ifndef DL_IMPORT
+  #define DL_IMPORT(t) t
+#endif
+#ifndef DL_EXPORT
+  #define DL_EXPORT(t) t
+#endif
+
+#ifndef PY_LONG_LONG
+  #define PY_LONG_LONG LONG_LONG
+#endif
+
+#if PY_VERSION_HEX < 0x02040000
+  #define METH_COEXIST 0
+  #define PyDict_CheckExact(op) (Py_TYPE(op) == &PyDict_Type)
+  #define PyDict_Contains(d,o)   PySequence_Contains(d,o)
+#endif
+
+#if PY_VERSION_HEX < 0x02050000
+  typedef int Py_ssize_t;
+  #define PY_SSIZE_T_MAX INT_MAX
+  #define PY_SSIZE_T_MIN INT_MIN
+  #define PY_FORMAT_SIZE_T ""
+  #define PyInt_FromSsize_t(z) PyInt_FromLong(z)
+  #define PyInt_AsSsize_t(o)   __Pyx_PyInt_AsInt(o)
+  #define PyNumber_Index(o)    PyNumber_Int(o)
+  #define PyIndex_Check(o)     PyNumber_Check(o)
+  #define PyErr_WarnEx(category, message, stacklevel) PyErr_Warn(category, message)
+#endif
+
+#if PY_VERSION_HEX < 0x02060000
+  #define Py_REFCNT(ob) (((PyObject*)(ob))->ob_refcnt)
+  #define Py_TYPE(ob)   (((PyObject*)(ob))->ob_type)
+  #define Py_SIZE(ob)   (((PyVarObject*)(ob))->ob_size)
+  #define PyVarObject_HEAD_INIT(type, size) \
+          PyObject_HEAD_INIT(type) size,
+  #define PyType_Modified(t)
+
+  typedef struct {
+     void *buf;
+     PyObject *obj;
+     Py_ssize_t len;
+     Py_ssize_t itemsize;
+     int readonly;
+     int ndim;
+     char *format;
+     Py_ssize_t *shape;
+     Py_ssize_t *strides;
+     Py_ssize_t *suboffsets;
+     void *internal;
+  } Py_buffer;
+
+  #define PyBUF_SIMPLE 0
+  #define PyBUF_WRITABLE 0x0001
+  #define PyBUF_FORMAT 0x0004
+  #define PyBUF_ND 0x0008
+  #define PyBUF_STRIDES (0x0010 | PyBUF_ND)
+  #define PyBUF_C_CONTIGUOUS (0x0020 | PyBUF_STRIDES)
+  #define PyBUF_F_CONTIGUOUS (0x0040 | PyBUF_STRIDES)
+  #define PyBUF_ANY_CONTIGUOUS (0x0080 | PyBUF_STRIDES)
+  #define PyBUF_INDIRECT (0x0100 | PyBUF_STRIDES)
+
+#endif
+
+#if PY_MAJOR_VERSION < 3
+  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
+#else
+  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
+#endif
+
+#if PY_MAJOR_VERSION >= 3
+  #define Py_TPFLAGS_CHECKTYPES 0
+  #define Py_TPFLAGS_HAVE_INDEX 0
+#endif
+
+#if (PY_VERSION_HEX < 0x02060000) || (PY_MAJOR_VERSION >= 3)
+  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
+#endif
+
+#if PY_MAJOR_VERSION >= 3
+  #define PyBaseString_Type            PyUnicode_Type
+  #define PyStringObject               PyUnicodeObject
+  #define PyString_Type                PyUnicode_Type
+  #define PyString_Check               PyUnicode_Check
+  #define PyString_CheckExact          PyUnicode_CheckExact
+#endif
+
+#if PY_VERSION_HEX < 0x02060000
+  #define PyBytesObject                PyStringObject
+  #define PyBytes_Type                 PyString_Type
+  #define PyBytes_Check                PyString_Check
+  #define PyBytes_CheckExact           PyString_CheckExact
+  #define PyBytes_FromString           PyString_FromString
+  #define PyBytes_FromStringAndSize    PyString_FromStringAndSize
+  #define PyBytes_FromFormat           PyString_FromFormat
+  #define PyBytes_DecodeEscape         PyString_DecodeEscape
+  #define PyBytes_AsString             PyString_AsString
+  #define PyBytes_AsStringAndSize      PyString_AsStringAndSize
+  #define PyBytes_Size                 PyString_Size
+  #define PyBytes_AS_STRING            PyString_AS_STRING
+  #define PyBytes_GET_SIZE             PyString_GET_SIZE
+  #define PyBytes_Repr                 PyString_Repr
+  #define PyBytes_Concat               PyString_Concat
+  #define PyBytes_ConcatAndDel         PyString_ConcatAndDel
+#endif
+
+#if PY_VERSION_HEX < 0x02060000
+  #define PySet_Check(obj)             PyObject_TypeCheck(obj, &PySet_Type)
+  #define PyFrozenSet_Check(obj)       PyObject_TypeCheck(obj, &PyFrozenSet_Type)
+#endif
+#ifndef PySet_CheckExact
+  #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
+#endif
+
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+
+#if PY_MAJOR_VERSION >= 3
+  #define PyIntObject                  PyLongObject
+  #define PyInt_Type                   PyLong_Type
+  #define PyInt_Check(op)              PyLong_Check(op)
+  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
+  #define PyInt_FromString             PyLong_FromString
+  #define PyInt_FromUnicode            PyLong_FromUnicode
+  #define PyInt_FromLong               PyLong_FromLong
+  #define PyInt_FromSize_t             PyLong_FromSize_t
+  #define PyInt_FromSsize_t            PyLong_FromSsize_t
+  #define PyInt_AsLong                 PyLong_AsLong
+  #define PyInt_AS_LONG                PyLong_AS_LONG
+  #define PyInt_AsSsize_t              PyLong_AsSsize_t
+  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
+  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
+#endif
+
+#if PY_MAJOR_VERSION >= 3
+  #define PyBoolObject                 PyLongObject
+#endif
+
+#if PY_VERSION_HEX < 0x03020000
+  typedef long Py_hash_t;
+  #define __Pyx_PyInt_FromHash_t PyInt_FromLong
+  #define __Pyx_PyInt_AsHash_t   PyInt_AsLong
+#else
+  #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
+  #define __Pyx_PyInt_AsHash_t   PyInt_AsSsize_t
+#endif
+
+
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#else
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+#endif
+
+#if (PY_MAJOR_VERSION < 3) || (PY_VERSION_HEX >= 0x03010300)
+  #define __Pyx_PySequence_GetSlice(obj, a, b) PySequence_GetSlice(obj, a, b)
+  #define __Pyx_PySequence_SetSlice(obj, a, b, value) PySequence_SetSlice(obj, a, b, value)
+  #define __Pyx_PySequence_DelSlice(obj, a, b) PySequence_DelSlice(obj, a, b)
+#else
+  #define __Pyx_PySequence_GetSlice(obj, a, b) (unlikely(!(obj)) ? \
+        (PyErr_SetString(PyExc_SystemError, "null argument to internal routine"), (PyObject*)0) : \
+        (likely((obj)->ob_type->tp_as_mapping) ? (PySequence_GetSlice(obj, a, b)) : \
+            (PyErr_Format(PyExc_TypeError, "'%.200s' object is unsliceable", (obj)->ob_type->tp_name), (PyObject*)0)))
+  #define __Pyx_PySequence_SetSlice(obj, a, b, value) (unlikely(!(obj)) ? \
+        (PyErr_SetString(PyExc_SystemError, "null argument to internal routine"), -1) : \
+        (likely((obj)->ob_type->tp_as_mapping) ? (PySequence_SetSlice(obj, a, b, value)) : \
+            (PyErr_Format(PyExc_TypeError, "'%.200s' object doesn't support slice assignment", (obj)->ob_type->tp_name), -1)))
+  #define __Pyx_PySequence_DelSlice(obj, a, b) (unlikely(!(obj)) ? \
+        (PyErr_SetString(PyExc_SystemError, "null argument to internal routine"), -1) : \
+        (likely((obj)->ob_type->tp_as_mapping) ? (PySequence_DelSlice(obj, a, b)) : \
+            (PyErr_Format(PyExc_TypeError, "'%.200s' object doesn't support slice deletion", (obj)->ob_type->tp_name), -1)))
+#endif
+
+#if PY_MAJOR_VERSION >= 3
+  #define PyMethod_New(func, self, klass) ((self) ? PyMethod_New(func, self) : PyInstanceMethod_New(func))
+#endif
+
+#if PY_VERSION_HEX < 0x02050000
+  #define __Pyx_GetAttrString(o,n)   PyObject_GetAttrString((o),((char *)(n)))
+  #define __Pyx_SetAttrString(o,n,a) PyObject_SetAttrString((o),((char *)(n)),(a))
+  #define __Pyx_DelAttrString(o,n)   PyObject_DelAttrString((o),((char *)(n)))
+#else
+  #define __Pyx_GetAttrString(o,n)   PyObject_GetAttrString((o),(n))
+  #define __Pyx_SetAttrString(o,n,a) PyObject_SetAttrString((o),(n),(a))
+  #define __Pyx_DelAttrString(o,n)   PyObject_DelAttrString((o),(n))
+#endif
+
+#if PY_VERSION_HEX < 0x02050000
+  #define __Pyx_NAMESTR(n) ((char *)(n))
+  #define __Pyx_DOCSTR(n)  ((char *)(n))
+#else
+  #define __Pyx_NAMESTR(n) (n)
+  #define __Pyx_DOCSTR(n)  (n)
+#endif
+
+#ifndef __PYX_EXTERN_C
+  #ifdef __cplusplus
+    #define __PYX_EXTERN_C extern "C"
+  #else
+    #define __PYX_EXTERN_C extern
+  #endif
+#endif
+
+#if defined(WIN32) || defined(MS_WINDOWS)
+#define _USE_MATH_DEFINES
+#endif
+#include <math.h>
+#define __PYX_HAVE__scipy__sparse___graph_tools
+#define __PYX_HAVE_API__scipy__sparse___graph_tools
+#include "stdio.h"
+#include "stdlib.h"
+#include "numpy/arrayobject.h"
+#include "numpy/ufuncobject.h"
+#ifdef _OPENMP
+#include <omp.h>
+#endif /* _OPENMP */
+
+#ifdef PYREX_WITHOUT_ASSERTIONS
+#define CYTHON_WITHOUT_ASSERTIONS
+#endif
+
+
+/* inline attribute */
+#ifndef CYTHON_INLINE
+  #if defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_INLINE inline
+  #else
+    #define CYTHON_INLINE
+  #endif
+#endif
+
+/* unused attribute */
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || defined(__INTEL_COMPILER)
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+
+typedef struct {PyObject **p; char *s; const long n; const char* encoding; const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry; /*proto*/
+
+
+/* Type Conversion Predeclarations */
+
+#define __Pyx_PyBytes_FromUString(s) PyBytes_FromString((char*)s)
+#define __Pyx_PyBytes_AsUString(s)   ((unsigned char*) PyBytes_AsString(s))
+
+#define __Pyx_Owned_Py_None(b) (Py_INCREF(Py_None), Py_None)
+#define __Pyx_PyBool_FromLong(b) ((b) ? (Py_INCREF(Py_True), Py_True) : (Py_INCREF(Py_False), Py_False))
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x);
+
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE size_t __Pyx_PyInt_AsSize_t(PyObject*);
+
+#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+
+
+#ifdef __GNUC__
+  /* Test for GCC > 2.95 */
+  #if __GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95))
+    #define likely(x)   __builtin_expect(!!(x), 1)
+    #define unlikely(x) __builtin_expect(!!(x), 0)
+  #else /* __GNUC__ > 2 ... */
+    #define likely(x)   (x)
+    #define unlikely(x) (x)
+  #endif /* __GNUC__ > 2 ... */
+#else /* __GNUC__ */
+  #define likely(x)   (x)
+  #define unlikely(x) (x)
+#endif /* __GNUC__ */
+    
+static PyObject *__pyx_m;
+static PyObject *__pyx_b;
+static PyObject *__pyx_empty_tuple;
+static PyObject *__pyx_empty_bytes;
+static int __pyx_lineno;
+static int __pyx_clineno = 0;
+static const char * __pyx_cfilenm= __FILE__;
+static const char *__pyx_filename;
+
+
+#if !defined(CYTHON_CCOMPLEX)
+  #if defined(__cplusplus)
+    #define CYTHON_CCOMPLEX 1
+  #elif defined(_Complex_I)
+    #define CYTHON_CCOMPLEX 1
+  #else
+    #define CYTHON_CCOMPLEX 0
+  #endif
+#endif
+
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    #include <complex>
+  #else
+    #include <complex.h>
+  #endif
+#endif
+
+#if CYTHON_CCOMPLEX && !defined(__cplusplus) && defined(__sun__) && defined(__GNUC__)
+  #undef _Complex_I
+  #define _Complex_I 1.0fj
+#endif
+
+static const char *__pyx_f[] = {
+  "_graph_tools.pyx",
+  "numpy.pxd",
+};
+
+/* "numpy.pxd":719
+ * # in Cython to enable them only on the right systems.
+ * 
+ * ctypedef npy_int8       int8_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_int16      int16_t
+ * ctypedef npy_int32      int32_t
+ */
+typedef npy_int8 __pyx_t_5numpy_int8_t;
+
+/* "numpy.pxd":720
+ * 
+ * ctypedef npy_int8       int8_t
+ * ctypedef npy_int16      int16_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_int32      int32_t
+ * ctypedef npy_int64      int64_t
+ */
+typedef npy_int16 __pyx_t_5numpy_int16_t;
+
+/* "numpy.pxd":721
+ * ctypedef npy_int8       int8_t
+ * ctypedef npy_int16      int16_t
+ * ctypedef npy_int32      int32_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_int64      int64_t
+ * #ctypedef npy_int96      int96_t
+ */
+typedef npy_int32 __pyx_t_5numpy_int32_t;
+
+/* "numpy.pxd":722
+ * ctypedef npy_int16      int16_t
+ * ctypedef npy_int32      int32_t
+ * ctypedef npy_int64      int64_t             # <<<<<<<<<<<<<<
+ * #ctypedef npy_int96      int96_t
+ * #ctypedef npy_int128     int128_t
+ */
+typedef npy_int64 __pyx_t_5numpy_int64_t;
+
+/* "numpy.pxd":726
+ * #ctypedef npy_int128     int128_t
+ * 
+ * ctypedef npy_uint8      uint8_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_uint16     uint16_t
+ * ctypedef npy_uint32     uint32_t
+ */
+typedef npy_uint8 __pyx_t_5numpy_uint8_t;
+
+/* "numpy.pxd":727
+ * 
+ * ctypedef npy_uint8      uint8_t
+ * ctypedef npy_uint16     uint16_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_uint32     uint32_t
+ * ctypedef npy_uint64     uint64_t
+ */
+typedef npy_uint16 __pyx_t_5numpy_uint16_t;
+
+/* "numpy.pxd":728
+ * ctypedef npy_uint8      uint8_t
+ * ctypedef npy_uint16     uint16_t
+ * ctypedef npy_uint32     uint32_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_uint64     uint64_t
+ * #ctypedef npy_uint96     uint96_t
+ */
+typedef npy_uint32 __pyx_t_5numpy_uint32_t;
+
+/* "numpy.pxd":729
+ * ctypedef npy_uint16     uint16_t
+ * ctypedef npy_uint32     uint32_t
+ * ctypedef npy_uint64     uint64_t             # <<<<<<<<<<<<<<
+ * #ctypedef npy_uint96     uint96_t
+ * #ctypedef npy_uint128    uint128_t
+ */
+typedef npy_uint64 __pyx_t_5numpy_uint64_t;
+
+/* "numpy.pxd":733
+ * #ctypedef npy_uint128    uint128_t
+ * 
+ * ctypedef npy_float32    float32_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_float64    float64_t
+ * #ctypedef npy_float80    float80_t
+ */
+typedef npy_float32 __pyx_t_5numpy_float32_t;
+
+/* "numpy.pxd":734
+ * 
+ * ctypedef npy_float32    float32_t
+ * ctypedef npy_float64    float64_t             # <<<<<<<<<<<<<<
+ * #ctypedef npy_float80    float80_t
+ * #ctypedef npy_float128   float128_t
+ */
+typedef npy_float64 __pyx_t_5numpy_float64_t;
+
+/* "numpy.pxd":743
+ * # The int types are mapped a bit surprising --
+ * # numpy.int corresponds to 'l' and numpy.long to 'q'
+ * ctypedef npy_long       int_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_longlong   long_t
+ * ctypedef npy_longlong   longlong_t
+ */
+typedef npy_long __pyx_t_5numpy_int_t;
+
+/* "numpy.pxd":744
+ * # numpy.int corresponds to 'l' and numpy.long to 'q'
+ * ctypedef npy_long       int_t
+ * ctypedef npy_longlong   long_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_longlong   longlong_t
+ * 
+ */
+typedef npy_longlong __pyx_t_5numpy_long_t;
+
+/* "numpy.pxd":745
+ * ctypedef npy_long       int_t
+ * ctypedef npy_longlong   long_t
+ * ctypedef npy_longlong   longlong_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_ulong      uint_t
+ */
+typedef npy_longlong __pyx_t_5numpy_longlong_t;
+
+/* "numpy.pxd":747
+ * ctypedef npy_longlong   longlong_t
+ * 
+ * ctypedef npy_ulong      uint_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_ulonglong  ulong_t
+ * ctypedef npy_ulonglong  ulonglong_t
+ */
+typedef npy_ulong __pyx_t_5numpy_uint_t;
+
+/* "numpy.pxd":748
+ * 
+ * ctypedef npy_ulong      uint_t
+ * ctypedef npy_ulonglong  ulong_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_ulonglong  ulonglong_t
+ * 
+ */
+typedef npy_ulonglong __pyx_t_5numpy_ulong_t;
+
+/* "numpy.pxd":749
+ * ctypedef npy_ulong      uint_t
+ * ctypedef npy_ulonglong  ulong_t
+ * ctypedef npy_ulonglong  ulonglong_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_intp       intp_t
+ */
+typedef npy_ulonglong __pyx_t_5numpy_ulonglong_t;
+
+/* "numpy.pxd":751
+ * ctypedef npy_ulonglong  ulonglong_t
+ * 
+ * ctypedef npy_intp       intp_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_uintp      uintp_t
+ * 
+ */
+typedef npy_intp __pyx_t_5numpy_intp_t;
+
+/* "numpy.pxd":752
+ * 
+ * ctypedef npy_intp       intp_t
+ * ctypedef npy_uintp      uintp_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_double     float_t
+ */
+typedef npy_uintp __pyx_t_5numpy_uintp_t;
+
+/* "numpy.pxd":754
+ * ctypedef npy_uintp      uintp_t
+ * 
+ * ctypedef npy_double     float_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_double     double_t
+ * ctypedef npy_longdouble longdouble_t
+ */
+typedef npy_double __pyx_t_5numpy_float_t;
+
+/* "numpy.pxd":755
+ * 
+ * ctypedef npy_double     float_t
+ * ctypedef npy_double     double_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_longdouble longdouble_t
+ * 
+ */
+typedef npy_double __pyx_t_5numpy_double_t;
+
+/* "numpy.pxd":756
+ * ctypedef npy_double     float_t
+ * ctypedef npy_double     double_t
+ * ctypedef npy_longdouble longdouble_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_cfloat      cfloat_t
+ */
+typedef npy_longdouble __pyx_t_5numpy_longdouble_t;
+
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    typedef ::std::complex< float > __pyx_t_float_complex;
+  #else
+    typedef float _Complex __pyx_t_float_complex;
+  #endif
+#else
+    typedef struct { float real, imag; } __pyx_t_float_complex;
+#endif
+
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    typedef ::std::complex< double > __pyx_t_double_complex;
+  #else
+    typedef double _Complex __pyx_t_double_complex;
+  #endif
+#else
+    typedef struct { double real, imag; } __pyx_t_double_complex;
+#endif
+
+/*--- Type declarations ---*/
+
+/* "numpy.pxd":758
+ * ctypedef npy_longdouble longdouble_t
+ * 
+ * ctypedef npy_cfloat      cfloat_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_cdouble     cdouble_t
+ * ctypedef npy_clongdouble clongdouble_t
+ */
+typedef npy_cfloat __pyx_t_5numpy_cfloat_t;
+
+/* "numpy.pxd":759
+ * 
+ * ctypedef npy_cfloat      cfloat_t
+ * ctypedef npy_cdouble     cdouble_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_clongdouble clongdouble_t
+ * 
+ */
+typedef npy_cdouble __pyx_t_5numpy_cdouble_t;
+
+/* "numpy.pxd":760
+ * ctypedef npy_cfloat      cfloat_t
+ * ctypedef npy_cdouble     cdouble_t
+ * ctypedef npy_clongdouble clongdouble_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_cdouble     complex_t
+ */
+typedef npy_clongdouble __pyx_t_5numpy_clongdouble_t;
+
+/* "numpy.pxd":762
+ * ctypedef npy_clongdouble clongdouble_t
+ * 
+ * ctypedef npy_cdouble     complex_t             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew1(a):
+ */
+typedef npy_cdouble __pyx_t_5numpy_complex_t;
+struct __pyx_t_5scipy_6sparse_12_graph_tools_heap;
+
+/* "scipy/sparse/_graph_tools.pyx":28
+ * # are skipped when popped, which bounds the heap size by the number of
+ * # edges.
+ * cdef struct heap:             # <<<<<<<<<<<<<<
+ *     int n
+ *     double* key
+ */
+struct __pyx_t_5scipy_6sparse_12_graph_tools_heap {
+  int n;
+  double *key;
+  int *node;
+};
+
+
+#ifndef CYTHON_REFNANNY
+  #define CYTHON_REFNANNY 0
+#endif
+
+#if CYTHON_REFNANNY
+  typedef struct {
+    void (*INCREF)(void*, PyObject*, int);
+    void (*DECREF)(void*, PyObject*, int);
+    void (*GOTREF)(void*, PyObject*, int);
+    void (*GIVEREF)(void*, PyObject*, int);
+    void* (*SetupContext)(const char*, int, const char*);
+    void (*FinishContext)(void**);
+  } __Pyx_RefNannyAPIStruct;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname); /*proto*/
+  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
+  #define __Pyx_RefNannySetupContext(name)           __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
+  #define __Pyx_RefNannyFinishContext()           __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
+  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_XINCREF(r)  do { if((r) != NULL) {__Pyx_INCREF(r); }} while(0)
+  #define __Pyx_XDECREF(r)  do { if((r) != NULL) {__Pyx_DECREF(r); }} while(0)
+  #define __Pyx_XGOTREF(r)  do { if((r) != NULL) {__Pyx_GOTREF(r); }} while(0)
+  #define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);}} while(0)
+#else
+  #define __Pyx_RefNannyDeclarations
+  #define __Pyx_RefNannySetupContext(name)
+  #define __Pyx_RefNannyFinishContext()
+  #define __Pyx_INCREF(r) Py_INCREF(r)
+  #define __Pyx_DECREF(r) Py_DECREF(r)
+  #define __Pyx_GOTREF(r)
+  #define __Pyx_GIVEREF(r)
+  #define __Pyx_XINCREF(r) Py_XINCREF(r)
+  #define __Pyx_XDECREF(r) Py_XDECREF(r)
+  #define __Pyx_XGOTREF(r)
+  #define __Pyx_XGIVEREF(r)
+#endif /* CYTHON_REFNANNY */
+
+static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name); /*proto*/
+
+static CYTHON_INLINE long __Pyx_div_long(long, long); /* proto */
+
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found); /*proto*/
+
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name, PyObject* kw_name); /*proto*/
+
+static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],     PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,     const char* function_name); /*proto*/
+
+static int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed,
+    const char *name, int exact); /*proto*/
+
+static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
+static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
+
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause); /*proto*/
+
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
+
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected);
+
+static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void);
+
+static void __Pyx_UnpackTupleError(PyObject *, Py_ssize_t index); /*proto*/
+
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type); /*proto*/
+
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, long level); /*proto*/
+
+#ifndef __PYX_FORCE_INIT_THREADS
+  #if PY_VERSION_HEX < 0x02040200
+    #define __PYX_FORCE_INIT_THREADS 1
+  #else
+    #define __PYX_FORCE_INIT_THREADS 0
+  #endif
+#endif
+
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    #define __Pyx_CREAL(z) ((z).real())
+    #define __Pyx_CIMAG(z) ((z).imag())
+  #else
+    #define __Pyx_CREAL(z) (__real__(z))
+    #define __Pyx_CIMAG(z) (__imag__(z))
+  #endif
+#else
+    #define __Pyx_CREAL(z) ((z).real)
+    #define __Pyx_CIMAG(z) ((z).imag)
+#endif
+
+#if defined(_WIN32) && defined(__cplusplus) && CYTHON_CCOMPLEX
+    #define __Pyx_SET_CREAL(z,x) ((z).real(x))
+    #define __Pyx_SET_CIMAG(z,y) ((z).imag(y))
+#else
+    #define __Pyx_SET_CREAL(z,x) __Pyx_CREAL(z) = (x)
+    #define __Pyx_SET_CIMAG(z,y) __Pyx_CIMAG(z) = (y)
+#endif
+
+static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float, float);
+
+#if CYTHON_CCOMPLEX
+    #define __Pyx_c_eqf(a, b)   ((a)==(b))
+    #define __Pyx_c_sumf(a, b)  ((a)+(b))
+    #define __Pyx_c_difff(a, b) ((a)-(b))
+    #define __Pyx_c_prodf(a, b) ((a)*(b))
+    #define __Pyx_c_quotf(a, b) ((a)/(b))
+    #define __Pyx_c_negf(a)     (-(a))
+  #ifdef __cplusplus
+    #define __Pyx_c_is_zerof(z) ((z)==(float)0)
+    #define __Pyx_c_conjf(z)    (::std::conj(z))
+    #if 1
+        #define __Pyx_c_absf(z)     (::std::abs(z))
+        #define __Pyx_c_powf(a, b)  (::std::pow(a, b))
+    #endif
+  #else
+    #define __Pyx_c_is_zerof(z) ((z)==0)
+    #define __Pyx_c_conjf(z)    (conjf(z))
+    #if 1
+        #define __Pyx_c_absf(z)     (cabsf(z))
+        #define __Pyx_c_powf(a, b)  (cpowf(a, b))
+    #endif
+ #endif
+#else
+    static CYTHON_INLINE int __Pyx_c_eqf(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_sumf(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_difff(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_prodf(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_quotf(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_negf(__pyx_t_float_complex);
+    static CYTHON_INLINE int __Pyx_c_is_zerof(__pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_conjf(__pyx_t_float_complex);
+    #if 1
+        static CYTHON_INLINE float __Pyx_c_absf(__pyx_t_float_complex);
+        static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_powf(__pyx_t_float_complex, __pyx_t_float_complex);
+    #endif
+#endif
+
+static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double, double);
+
+#if CYTHON_CCOMPLEX
+    #define __Pyx_c_eq(a, b)   ((a)==(b))
+    #define __Pyx_c_sum(a, b)  ((a)+(b))
+    #define __Pyx_c_diff(a, b) ((a)-(b))
+    #define __Pyx_c_prod(a, b) ((a)*(b))
+    #define __Pyx_c_quot(a, b) ((a)/(b))
+    #define __Pyx_c_neg(a)     (-(a))
+  #ifdef __cplusplus
+    #define __Pyx_c_is_zero(z) ((z)==(double)0)
+    #define __Pyx_c_conj(z)    (::std::conj(z))
+    #if 1
+        #define __Pyx_c_abs(z)     (::std::abs(z))
+        #define __Pyx_c_pow(a, b)  (::std::pow(a, b))
+    #endif
+  #else
+    #define __Pyx_c_is_zero(z) ((z)==0)
+    #define __Pyx_c_conj(z)    (conj(z))
+    #if 1
+        #define __Pyx_c_abs(z)     (cabs(z))
+        #define __Pyx_c_pow(a, b)  (cpow(a, b))
+    #endif
+ #endif
+#else
+    static CYTHON_INLINE int __Pyx_c_eq(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_sum(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_diff(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_prod(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_quot(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_neg(__pyx_t_double_complex);
+    static CYTHON_INLINE int __Pyx_c_is_zero(__pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_conj(__pyx_t_double_complex);
+    #if 1
+        static CYTHON_INLINE double __Pyx_c_abs(__pyx_t_double_complex);
+        static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_pow(__pyx_t_double_complex, __pyx_t_double_complex);
+    #endif
+#endif
+
+static CYTHON_INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject *);
+
+static CYTHON_INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject *);
+
+static CYTHON_INLINE unsigned int __Pyx_PyInt_AsUnsignedInt(PyObject *);
+
+static CYTHON_INLINE char __Pyx_PyInt_AsChar(PyObject *);
+
+static CYTHON_INLINE short __Pyx_PyInt_AsShort(PyObject *);
+
+static CYTHON_INLINE int __Pyx_PyInt_AsInt(PyObject *);
+
+static CYTHON_INLINE signed char __Pyx_PyInt_AsSignedChar(PyObject *);
+
+static CYTHON_INLINE signed short __Pyx_PyInt_AsSignedShort(PyObject *);
+
+static CYTHON_INLINE signed int __Pyx_PyInt_AsSignedInt(PyObject *);
+
+static CYTHON_INLINE int __Pyx_PyInt_AsLongDouble(PyObject *);
+
+static CYTHON_INLINE unsigned long __Pyx_PyInt_AsUnsignedLong(PyObject *);
+
+static CYTHON_INLINE unsigned PY_LONG_LONG __Pyx_PyInt_AsUnsignedLongLong(PyObject *);
+
+static CYTHON_INLINE long __Pyx_PyInt_AsLong(PyObject *);
+
+static CYTHON_INLINE PY_LONG_LONG __Pyx_PyInt_AsLongLong(PyObject *);
+
+static CYTHON_INLINE signed long __Pyx_PyInt_AsSignedLong(PyObject *);
+
+static CYTHON_INLINE signed PY_LONG_LONG __Pyx_PyInt_AsSignedLongLong(PyObject *);
+
+static int __Pyx_check_binary_version(void);
+
+static PyTypeObject *__Pyx_ImportType(const char *module_name, const char *class_name, size_t size, int strict);  /*proto*/
+
+static PyObject *__Pyx_ImportModule(const char *name); /*proto*/
+
+static void __Pyx_AddTraceback(const char *funcname, int __pyx_clineno,
+                               int __pyx_lineno, const char *__pyx_filename); /*proto*/
+
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t); /*proto*/
+
+/* Module declarations from 'cpython.buffer' */
+
+/* Module declarations from 'cpython.ref' */
+
+/* Module declarations from 'libc.stdio' */
+
+/* Module declarations from 'cpython.object' */
+
+/* Module declarations from 'libc.stdlib' */
+
+/* Module declarations from 'numpy' */
+
+/* Module declarations from 'numpy' */
+static PyTypeObject *__pyx_ptype_5numpy_dtype = 0;
+static PyTypeObject *__pyx_ptype_5numpy_flatiter = 0;
+static PyTypeObject *__pyx_ptype_5numpy_broadcast = 0;
+static PyTypeObject *__pyx_ptype_5numpy_ndarray = 0;
+static PyTypeObject *__pyx_ptype_5numpy_ufunc = 0;
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *); /*proto*/
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *, PyObject *); /*proto*/
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *, PyObject *, PyObject *); /*proto*/
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *, PyObject *, PyObject *, PyObject *); /*proto*/
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *, PyObject *, PyObject *, PyObject *, PyObject *); /*proto*/
+static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *, char *, char *, int *); /*proto*/
+static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *, PyObject *); /*proto*/
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *); /*proto*/
+
+/* Module declarations from 'cython.cython.view' */
+
+/* Module declarations from 'cython' */
+
+/* Module declarations from 'scipy.sparse._graph_tools' */
+static double __pyx_v_5scipy_6sparse_12_graph_tools_infinity;
+static int __pyx_v_5scipy_6sparse_12_graph_tools_NO_PRED;
+static CYTHON_INLINE void __pyx_f_5scipy_6sparse_12_graph_tools_heappush(struct __pyx_t_5scipy_6sparse_12_graph_tools_heap *, double, int); /*proto*/
+static CYTHON_INLINE int __pyx_f_5scipy_6sparse_12_graph_tools_heappop(struct __pyx_t_5scipy_6sparse_12_graph_tools_heap *, double *); /*proto*/
+static void __pyx_f_5scipy_6sparse_12_graph_tools__dijkstra_one(int, int, int *, int *, double *, int *, int *, double *, int, double *, int *, int *, struct __pyx_t_5scipy_6sparse_12_graph_tools_heap *); /*proto*/
+static int __pyx_f_5scipy_6sparse_12_graph_tools__relax(int, int *, int *, double *, int *, int *, double *, int, double *, int *); /*proto*/
+static int __pyx_f_5scipy_6sparse_12_graph_tools__bellman_ford(int, int *, int *, double *, int *, int *, double *, int, double *, int *); /*proto*/
+static CYTHON_INLINE int __pyx_f_5scipy_6sparse_12_graph_tools__find(int *, int); /*proto*/
+static int __pyx_f_5scipy_6sparse_12_graph_tools__bfs(int *, int *, int, int, int *, int *, int *); /*proto*/
+static CYTHON_INLINE void __pyx_f_5scipy_6sparse_12_graph_tools__reset(int *, int *, int); /*proto*/
+static int __pyx_f_5scipy_6sparse_12_graph_tools__peripheral(int *, int *, int, int, int *, int *, int *, int *); /*proto*/
+static int __pyx_f_5scipy_6sparse_12_graph_tools__compare_keys(const void *, const void *); /*proto*/
+static void __pyx_f_5scipy_6sparse_12_graph_tools__degrees(int, int *, int *, int *); /*proto*/
+#define __Pyx_MODULE_NAME "scipy.sparse._graph_tools"
+int __pyx_module_is_main_scipy__sparse___graph_tools = 0;
+
+/* Implementation of 'scipy.sparse._graph_tools' */
+static PyObject *__pyx_builtin_range;
+static PyObject *__pyx_builtin_MemoryError;
+static PyObject *__pyx_builtin_ValueError;
+static PyObject *__pyx_builtin_RuntimeError;
+static char __pyx_k_1[] = "ndarray is not C contiguous";
+static char __pyx_k_3[] = "ndarray is not Fortran contiguous";
+static char __pyx_k_5[] = "Non-native byte order not supported";
+static char __pyx_k_7[] = "unknown dtype code in numpy.pxd (%d)";
+static char __pyx_k_8[] = "Format string allocated too short, see comment in numpy.pxd";
+static char __pyx_k_11[] = "Format string allocated too short.";
+static char __pyx_k_13[] = "scipy.sparse._graph_tools";
+static char __pyx_k_14[] = "reverse_cuthill_mckee";
+static char __pyx_k__B[] = "B";
+static char __pyx_k__H[] = "H";
+static char __pyx_k__I[] = "I";
+static char __pyx_k__L[] = "L";
+static char __pyx_k__N[] = "N";
+static char __pyx_k__O[] = "O";
+static char __pyx_k__Q[] = "Q";
+static char __pyx_k__b[] = "b";
+static char __pyx_k__d[] = "d";
+static char __pyx_k__f[] = "f";
+static char __pyx_k__g[] = "g";
+static char __pyx_k__h[] = "h";
+static char __pyx_k__i[] = "i";
+static char __pyx_k__l[] = "l";
+static char __pyx_k__q[] = "q";
+static char __pyx_k__Aj[] = "Aj";
+static char __pyx_k__Ap[] = "Ap";
+static char __pyx_k__Ax[] = "Ax";
+static char __pyx_k__Bj[] = "Bj";
+static char __pyx_k__Bp[] = "Bp";
+static char __pyx_k__Bx[] = "Bx";
+static char __pyx_k__Zd[] = "Zd";
+static char __pyx_k__Zf[] = "Zf";
+static char __pyx_k__Zg[] = "Zg";
+static char __pyx_k__np[] = "np";
+static char __pyx_k__inf[] = "inf";
+static char __pyx_k__cols[] = "cols";
+static char __pyx_k__dist[] = "dist";
+static char __pyx_k__keep[] = "keep";
+static char __pyx_k__pred[] = "pred";
+static char __pyx_k__rows[] = "rows";
+static char __pyx_k__numpy[] = "numpy";
+static char __pyx_k__order[] = "order";
+static char __pyx_k__range[] = "range";
+static char __pyx_k__start[] = "start";
+static char __pyx_k__kruskal[] = "kruskal";
+static char __pyx_k__sources[] = "sources";
+static char __pyx_k__NULL_IDX[] = "NULL_IDX";
+static char __pyx_k____main__[] = "__main__";
+static char __pyx_k____test__[] = "__test__";
+static char __pyx_k__dijkstra[] = "dijkstra";
+static char __pyx_k__leaf_size[] = "leaf_size";
+static char __pyx_k__ValueError[] = "ValueError";
+static char __pyx_k__undirected[] = "undirected";
+static char __pyx_k__MemoryError[] = "MemoryError";
+static char __pyx_k__depth_first[] = "depth_first";
+static char __pyx_k__RuntimeError[] = "RuntimeError";
+static char __pyx_k__bellman_ford[] = "bellman_ford";
+static char __pyx_k__breadth_first[] = "breadth_first";
+static char __pyx_k__floyd_warshall[] = "floyd_warshall";
+static char __pyx_k__nested_dissection[] = "nested_dissection";
+static char __pyx_k__johnson_potentials[] = "johnson_potentials";
+static PyObject *__pyx_kp_u_1;
+static PyObject *__pyx_kp_u_11;
+static PyObject *__pyx_n_s_13;
+static PyObject *__pyx_n_s_14;
+static PyObject *__pyx_kp_u_3;
+static PyObject *__pyx_kp_u_5;
+static PyObject *__pyx_kp_u_7;
+static PyObject *__pyx_kp_u_8;
+static PyObject *__pyx_n_s__Aj;
+static PyObject *__pyx_n_s__Ap;
+static PyObject *__pyx_n_s__Ax;
+static PyObject *__pyx_n_s__Bj;
+static PyObject *__pyx_n_s__Bp;
+static PyObject *__pyx_n_s__Bx;
+static PyObject *__pyx_n_s__MemoryError;
+static PyObject *__pyx_n_s__N;
+static PyObject *__pyx_n_s__NULL_IDX;
+static PyObject *__pyx_n_s__RuntimeError;
+static PyObject *__pyx_n_s__ValueError;
+static PyObject *__pyx_n_s____main__;
+static PyObject *__pyx_n_s____test__;
+static PyObject *__pyx_n_s__bellman_ford;
+static PyObject *__pyx_n_s__breadth_first;
+static PyObject *__pyx_n_s__cols;
+static PyObject *__pyx_n_s__depth_first;
+static PyObject *__pyx_n_s__dijkstra;
+static PyObject *__pyx_n_s__dist;
+static PyObject *__pyx_n_s__floyd_warshall;
+static PyObject *__pyx_n_s__h;
+static PyObject *__pyx_n_s__inf;
+static PyObject *__pyx_n_s__johnson_potentials;
+static PyObject *__pyx_n_s__keep;
+static PyObject *__pyx_n_s__kruskal;
+static PyObject *__pyx_n_s__leaf_size;
+static PyObject *__pyx_n_s__nested_dissection;
+static PyObject *__pyx_n_s__np;
+static PyObject *__pyx_n_s__numpy;
+static PyObject *__pyx_n_s__order;
+static PyObject *__pyx_n_s__pred;
+static PyObject *__pyx_n_s__range;
+static PyObject *__pyx_n_s__rows;
+static PyObject *__pyx_n_s__sources;
+static PyObject *__pyx_n_s__start;
+static PyObject *__pyx_n_s__undirected;
+static PyObject *__pyx_int_15;
+static PyObject *__pyx_int_neg_9999;
+static PyObject *__pyx_k_tuple_2;
+static PyObject *__pyx_k_tuple_4;
+static PyObject *__pyx_k_tuple_6;
+static PyObject *__pyx_k_tuple_9;
+static PyObject *__pyx_k_tuple_10;
+static PyObject *__pyx_k_tuple_12;
+
+/* "scipy/sparse/_graph_tools.pyx":33
+ *     int* node
+ * 
+ * cdef inline void heappush(heap* self, double key, int node) nogil:             # <<<<<<<<<<<<<<
+ *     cdef int i = self.n, parent
+ *     self.n += 1
+ */
+
+static CYTHON_INLINE void __pyx_f_5scipy_6sparse_12_graph_tools_heappush(struct __pyx_t_5scipy_6sparse_12_graph_tools_heap *__pyx_v_self, double __pyx_v_key, int __pyx_v_node) {
+  int __pyx_v_i;
+  int __pyx_v_parent;
+  int __pyx_t_1;
+
+  /* "scipy/sparse/_graph_tools.pyx":34
+ * 
+ * cdef inline void heappush(heap* self, double key, int node) nogil:
+ *     cdef int i = self.n, parent             # <<<<<<<<<<<<<<
+ *     self.n += 1
+ *     while i > 0:
+ */
+  __pyx_v_i = __pyx_v_self->n;
+
+  /* "scipy/sparse/_graph_tools.pyx":35
+ * cdef inline void heappush(heap* self, double key, int node) nogil:
+ *     cdef int i = self.n, parent
+ *     self.n += 1             # <<<<<<<<<<<<<<
+ *     while i > 0:
+ *         parent = (i - 1) // 2
+ */
+  __pyx_v_self->n = (__pyx_v_self->n + 1);
+
+  /* "scipy/sparse/_graph_tools.pyx":36
+ *     cdef int i = self.n, parent
+ *     self.n += 1
+ *     while i > 0:             # <<<<<<<<<<<<<<
+ *         parent = (i - 1) // 2
+ *         if self.key[parent] <= key:
+ */
+  while (1) {
+    __pyx_t_1 = (__pyx_v_i > 0);
+    if (!__pyx_t_1) break;
+
+    /* "scipy/sparse/_graph_tools.pyx":37
+ *     self.n += 1
+ *     while i > 0:
+ *         parent = (i - 1) // 2             # <<<<<<<<<<<<<<
+ *         if self.key[parent] <= key:
+ *             break
+ */
+    __pyx_v_parent = __Pyx_div_long((__pyx_v_i - 1), 2);
+
+    /* "scipy/sparse/_graph_tools.pyx":38
+ *     while i > 0:
+ *         parent = (i - 1) // 2
+ *         if self.key[parent] <= key:             # <<<<<<<<<<<<<<
+ *             break
+ *         self.key[i] = self.key[parent]
+ */
+    __pyx_t_1 = ((__pyx_v_self->key[__pyx_v_parent]) <= __pyx_v_key);
+    if (__pyx_t_1) {
+
+      /* "scipy/sparse/_graph_tools.pyx":39
+ *         parent = (i - 1) // 2
+ *         if self.key[parent] <= key:
+ *             break             # <<<<<<<<<<<<<<
+ *         self.key[i] = self.key[parent]
+ *         self.node[i] = self.node[parent]
+ */
+      goto __pyx_L4_break;
+      goto __pyx_L5;
+    }
+    __pyx_L5:;
+
+    /* "scipy/sparse/_graph_tools.pyx":40
+ *         if self.key[parent] <= key:
+ *             break
+ *         self.key[i] = self.key[parent]             # <<<<<<<<<<<<<<
+ *         self.node[i] = self.node[parent]
+ *         i = parent
+ */
+    (__pyx_v_self->key[__pyx_v_i]) = (__pyx_v_self->key[__pyx_v_parent]);
+
+    /* "scipy/sparse/_graph_tools.pyx":41
+ *             break
+ *         self.key[i] = self.key[parent]
+ *         self.node[i] = self.node[parent]             # <<<<<<<<<<<<<<
+ *         i = parent
+ *     self.key[i] = key
+ */
+    (__pyx_v_self->node[__pyx_v_i]) = (__pyx_v_self->node[__pyx_v_parent]);
+
+    /* "scipy/sparse/_graph_tools.pyx":42
+ *         self.key[i] = self.key[parent]
+ *         self.node[i] = self.node[parent]
+ *         i = parent             # <<<<<<<<<<<<<<
+ *     self.key[i] = key
+ *     self.node[i] = node
+ */
+    __pyx_v_i = __pyx_v_parent;
+  }
+  __pyx_L4_break:;
+
+  /* "scipy/sparse/_graph_tools.pyx":43
+ *         self.node[i] = self.node[parent]
+ *         i = parent
+ *     self.key[i] = key             # <<<<<<<<<<<<<<
+ *     self.node[i] = node
+ * 
+ */
+  (__pyx_v_self->key[__pyx_v_i]) = __pyx_v_key;
+
+  /* "scipy/sparse/_graph_tools.pyx":44
+ *         i = parent
+ *     self.key[i] = key
+ *     self.node[i] = node             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int heappop(heap* self, double* key) nogil:
+ */
+  (__pyx_v_self->node[__pyx_v_i]) = __pyx_v_node;
+
+}
+
+/* "scipy/sparse/_graph_tools.pyx":46
+ *     self.node[i] = node
+ * 
+ * cdef inline int heappop(heap* self, double* key) nogil:             # <<<<<<<<<<<<<<
+ *     cdef int i, child, node, last_node
+ *     cdef double last_key
+ */
+
+static CYTHON_INLINE int __pyx_f_5scipy_6sparse_12_graph_tools_heappop(struct __pyx_t_5scipy_6sparse_12_graph_tools_heap *__pyx_v_self, double *__pyx_v_key) {
+  int __pyx_v_i;
+  int __pyx_v_child;
+  int __pyx_v_node;
+  int __pyx_v_last_node;
+  double __pyx_v_last_key;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+
+  /* "scipy/sparse/_graph_tools.pyx":49
+ *     cdef int i, child, node, last_node
+ *     cdef double last_key
+ *     node = self.node[0]             # <<<<<<<<<<<<<<
+ *     key[0] = self.key[0]
+ *     self.n -= 1
+ */
+  __pyx_v_node = (__pyx_v_self->node[0]);
+
+  /* "scipy/sparse/_graph_tools.pyx":50
+ *     cdef double last_key
+ *     node = self.node[0]
+ *     key[0] = self.key[0]             # <<<<<<<<<<<<<<
+ *     self.n -= 1
+ *     last_key = self.key[self.n]
+ */
+  (__pyx_v_key[0]) = (__pyx_v_self->key[0]);
+
+  /* "scipy/sparse/_graph_tools.pyx":51
+ *     node = self.node[0]
+ *     key[0] = self.key[0]
+ *     self.n -= 1             # <<<<<<<<<<<<<<
+ *     last_key = self.key[self.n]
+ *     last_node = self.node[self.n]
+ */
+  __pyx_v_self->n = (__pyx_v_self->n - 1);
+
+  /* "scipy/sparse/_graph_tools.pyx":52
+ *     key[0] = self.key[0]
+ *     self.n -= 1
+ *     last_key = self.key[self.n]             # <<<<<<<<<<<<<<
+ *     last_node = self.node[self.n]
+ *     i = 0
+ */
+  __pyx_v_last_key = (__pyx_v_self->key[__pyx_v_self->n]);
+
+  /* "scipy/sparse/_graph_tools.pyx":53
+ *     self.n -= 1
+ *     last_key = self.key[self.n]
+ *     last_node = self.node[self.n]             # <<<<<<<<<<<<<<
+ *     i = 0
+ *     while 1:
+ */
+  __pyx_v_last_node = (__pyx_v_self->node[__pyx_v_self->n]);
+
+  /* "scipy/sparse/_graph_tools.pyx":54
+ *     last_key = self.key[self.n]
+ *     last_node = self.node[self.n]
+ *     i = 0             # <<<<<<<<<<<<<<
+ *     while 1:
+ *         child = 2 * i + 1
+ */
+  __pyx_v_i = 0;
+
+  /* "scipy/sparse/_graph_tools.pyx":55
+ *     last_node = self.node[self.n]
+ *     i = 0
+ *     while 1:             # <<<<<<<<<<<<<<
+ *         child = 2 * i + 1
+ *         if child >= self.n:
+ */
+  while (1) {
+    if (!1) break;
+
+    /* "scipy/sparse/_graph_tools.pyx":56
+ *     i = 0
+ *     while 1:
+ *         child = 2 * i + 1             # <<<<<<<<<<<<<<
+ *         if child >= self.n:
+ *             break
+ */
+    __pyx_v_child = ((2 * __pyx_v_i) + 1);
+
+    /* "scipy/sparse/_graph_tools.pyx":57
+ *     while 1:
+ *         child = 2 * i + 1
+ *         if child >= self.n:             # <<<<<<<<<<<<<<
+ *             break
+ *         if child + 1 < self.n and self.key[child + 1] < self.key[child]:
+ */
+    __pyx_t_1 = (__pyx_v_child >= __pyx_v_self->n);
+    if (__pyx_t_1) {
+
+      /* "scipy/sparse/_graph_tools.pyx":58
+ *         child = 2 * i + 1
+ *         if child >= self.n:
+ *             break             # <<<<<<<<<<<<<<
+ *         if child + 1 < self.n and self.key[child + 1] < self.key[child]:
+ *             child += 1
+ */
+      goto __pyx_L4_break;
+      goto __pyx_L5;
+    }
+    __pyx_L5:;
+
+    /* "scipy/sparse/_graph_tools.pyx":59
+ *         if child >= self.n:
+ *             break
+ *         if child + 1 < self.n and self.key[child + 1] < self.key[child]:             # <<<<<<<<<<<<<<
+ *             child += 1
+ *         if last_key <= self.key[child]:
+ */
+    __pyx_t_1 = ((__pyx_v_child + 1) < __pyx_v_self->n);
+    if (__pyx_t_1) {
+      __pyx_t_2 = ((__pyx_v_self->key[(__pyx_v_child + 1)]) < (__pyx_v_self->key[__pyx_v_child]));
+      __pyx_t_3 = __pyx_t_2;
+    } else {
+      __pyx_t_3 = __pyx_t_1;
+    }
+    if (__pyx_t_3) {
+
+      /* "scipy/sparse/_graph_tools.pyx":60
+ *             break
+ *         if child + 1 < self.n and self.key[child + 1] < self.key[child]:
+ *             child += 1             # <<<<<<<<<<<<<<
+ *         if last_key <= self.key[child]:
+ *             break
+ */
+      __pyx_v_child = (__pyx_v_child + 1);
+      goto __pyx_L6;
+    }
+    __pyx_L6:;
+
+    /* "scipy/sparse/_graph_tools.pyx":61
+ *         if child + 1 < self.n and self.key[child + 1] < self.key[child]:
+ *             child += 1
+ *         if last_key <= self.key[child]:             # <<<<<<<<<<<<<<
+ *             break
+ *         self.key[i] = self.key[child]
+ */
+    __pyx_t_3 = (__pyx_v_last_key <= (__pyx_v_self->key[__pyx_v_child]));
+    if (__pyx_t_3) {
+
+      /* "scipy/sparse/_graph_tools.pyx":62
+ *             child += 1
+ *         if last_key <= self.key[child]:
+ *             break             # <<<<<<<<<<<<<<
+ *         self.key[i] = self.key[child]
+ *         self.node[i] = self.node[child]
+ */
+      goto __pyx_L4_break;
+      goto __pyx_L7;
+    }
+    __pyx_L7:;
+
+    /* "scipy/sparse/_graph_tools.pyx":63
+ *         if last_key <= self.key[child]:
+ *             break
+ *         self.key[i] = self.key[child]             # <<<<<<<<<<<<<<
+ *         self.node[i] = self.node[child]
+ *         i = child
+ */
+    (__pyx_v_self->key[__pyx_v_i]) = (__pyx_v_self->key[__pyx_v_child]);
+
+    /* "scipy/sparse/_graph_tools.pyx":64
+ *             break
+ *         self.key[i] = self.key[child]
+ *         self.node[i] = self.node[child]             # <<<<<<<<<<<<<<
+ *         i = child
+ *     self.key[i] = last_key
+ */
+    (__pyx_v_self->node[__pyx_v_i]) = (__pyx_v_self->node[__pyx_v_child]);
+
+    /* "scipy/sparse/_graph_tools.pyx":65
+ *         self.key[i] = self.key[child]
+ *         self.node[i] = self.node[child]
+ *         i = child             # <<<<<<<<<<<<<<
+ *     self.key[i] = last_key
+ *     self.node[i] = last_node
+ */
+    __pyx_v_i = __pyx_v_child;
+  }
+  __pyx_L4_break:;
+
+  /* "scipy/sparse/_graph_tools.pyx":66
+ *         self.node[i] = self.node[child]
+ *         i = child
+ *     self.key[i] = last_key             # <<<<<<<<<<<<<<
+ *     self.node[i] = last_node
+ *     return node
+ */
+  (__pyx_v_self->key[__pyx_v_i]) = __pyx_v_last_key;
+
+  /* "scipy/sparse/_graph_tools.pyx":67
+ *         i = child
+ *     self.key[i] = last_key
+ *     self.node[i] = last_node             # <<<<<<<<<<<<<<
+ *     return node
+ * 
+ */
+  (__pyx_v_self->node[__pyx_v_i]) = __pyx_v_last_node;
+
+  /* "scipy/sparse/_graph_tools.pyx":68
+ *     self.key[i] = last_key
+ *     self.node[i] = last_node
+ *     return node             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = __pyx_v_node;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "scipy/sparse/_graph_tools.pyx":73
+ * @cython.boundscheck(False)
+ * @cython.cdivision(True)
+ * cdef void _dijkstra_one(int source, int N,             # <<<<<<<<<<<<<<
+ *                         int* Ap, int* Aj, double* Ax,
+ *                         int* Bp, int* Bj, double* Bx, int undirected,
+ */
+
+static void __pyx_f_5scipy_6sparse_12_graph_tools__dijkstra_one(int __pyx_v_source, int __pyx_v_N, int *__pyx_v_Ap, int *__pyx_v_Aj, double *__pyx_v_Ax, int *__pyx_v_Bp, int *__pyx_v_Bj, double *__pyx_v_Bx, int __pyx_v_undirected, double *__pyx_v_dist, int *__pyx_v_pred, int *__pyx_v_done, struct __pyx_t_5scipy_6sparse_12_graph_tools_heap *__pyx_v_h) {
+  int __pyx_v_i;
+  int __pyx_v_j;
+  int __pyx_v_k;
+  double __pyx_v_d;
+  double __pyx_v_w;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+
+  /* "scipy/sparse/_graph_tools.pyx":80
+ *     cdef double d, w
+ * 
+ *     for i in range(N):             # <<<<<<<<<<<<<<
+ *         dist[i] = infinity
+ *         pred[i] = NO_PRED
+ */
+  __pyx_t_1 = __pyx_v_N;
+  for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+    __pyx_v_i = __pyx_t_2;
+
+    /* "scipy/sparse/_graph_tools.pyx":81
+ * 
+ *     for i in range(N):
+ *         dist[i] = infinity             # <<<<<<<<<<<<<<
+ *         pred[i] = NO_PRED
+ *         done[i] = 0
+ */
+    (__pyx_v_dist[__pyx_v_i]) = __pyx_v_5scipy_6sparse_12_graph_tools_infinity;
+
+    /* "scipy/sparse/_graph_tools.pyx":82
+ *     for i in range(N):
+ *         dist[i] = infinity
+ *         pred[i] = NO_PRED             # <<<<<<<<<<<<<<
+ *         done[i] = 0
+ * 
+ */
+    (__pyx_v_pred[__pyx_v_i]) = __pyx_v_5scipy_6sparse_12_graph_tools_NO_PRED;
+
+    /* "scipy/sparse/_graph_tools.pyx":83
+ *         dist[i] = infinity
+ *         pred[i] = NO_PRED
+ *         done[i] = 0             # <<<<<<<<<<<<<<
+ * 
+ *     h.n = 0
+ */
+    (__pyx_v_done[__pyx_v_i]) = 0;
+  }
+
+  /* "scipy/sparse/_graph_tools.pyx":85
+ *         done[i] = 0
+ * 
+ *     h.n = 0             # <<<<<<<<<<<<<<
+ *     dist[source] = 0
+ *     heappush(h, 0, source)
+ */
+  __pyx_v_h->n = 0;
+
+  /* "scipy/sparse/_graph_tools.pyx":86
+ * 
+ *     h.n = 0
+ *     dist[source] = 0             # <<<<<<<<<<<<<<
+ *     heappush(h, 0, source)
+ * 
+ */
+  (__pyx_v_dist[__pyx_v_source]) = 0.0;
+
+  /* "scipy/sparse/_graph_tools.pyx":87
+ *     h.n = 0
+ *     dist[source] = 0
+ *     heappush(h, 0, source)             # <<<<<<<<<<<<<<
+ * 
+ *     while h.n > 0:
+ */
+  __pyx_f_5scipy_6sparse_12_graph_tools_heappush(__pyx_v_h, 0.0, __pyx_v_source);
+
+  /* "scipy/sparse/_graph_tools.pyx":89
+ *     heappush(h, 0, source)
+ * 
+ *     while h.n > 0:             # <<<<<<<<<<<<<<
+ *         i = heappop(h, &d)
+ *         if done[i]:
+ */
+  while (1) {
+    __pyx_t_3 = (__pyx_v_h->n > 0);
+    if (!__pyx_t_3) break;
+
+    /* "scipy/sparse/_graph_tools.pyx":90
+ * 
+ *     while h.n > 0:
+ *         i = heappop(h, &d)             # <<<<<<<<<<<<<<
+ *         if done[i]:
+ *             continue
+ */
+    __pyx_v_i = __pyx_f_5scipy_6sparse_12_graph_tools_heappop(__pyx_v_h, (&__pyx_v_d));
+
+    /* "scipy/sparse/_graph_tools.pyx":91
+ *     while h.n > 0:
+ *         i = heappop(h, &d)
+ *         if done[i]:             # <<<<<<<<<<<<<<
+ *             continue
+ *         done[i] = 1
+ */
+    if ((__pyx_v_done[__pyx_v_i])) {
+
+      /* "scipy/sparse/_graph_tools.pyx":92
+ *         i = heappop(h, &d)
+ *         if done[i]:
+ *             continue             # <<<<<<<<<<<<<<
+ *         done[i] = 1
+ *         for k in range(Ap[i], Ap[i + 1]):
+ */
+      goto __pyx_L5_continue;
+      goto __pyx_L7;
+    }
+    __pyx_L7:;
+
+    /* "scipy/sparse/_graph_tools.pyx":93
+ *         if done[i]:
+ *             continue
+ *         done[i] = 1             # <<<<<<<<<<<<<<
+ *         for k in range(Ap[i], Ap[i + 1]):
+ *             j = Aj[k]
+ */
+    (__pyx_v_done[__pyx_v_i]) = 1;
+
+    /* "scipy/sparse/_graph_tools.pyx":94
+ *             continue
+ *         done[i] = 1
+ *         for k in range(Ap[i], Ap[i + 1]):             # <<<<<<<<<<<<<<
+ *             j = Aj[k]
+ *             w = d + Ax[k]
+ */
+    __pyx_t_1 = (__pyx_v_Ap[(__pyx_v_i + 1)]);
+    for (__pyx_t_2 = (__pyx_v_Ap[__pyx_v_i]); __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+      __pyx_v_k = __pyx_t_2;
+
+      /* "scipy/sparse/_graph_tools.pyx":95
+ *         done[i] = 1
+ *         for k in range(Ap[i], Ap[i + 1]):
+ *             j = Aj[k]             # <<<<<<<<<<<<<<
+ *             w = d + Ax[k]
+ *             if w < dist[j]:
+ */
+      __pyx_v_j = (__pyx_v_Aj[__pyx_v_k]);
+
+      /* "scipy/sparse/_graph_tools.pyx":96
+ *         for k in range(Ap[i], Ap[i + 1]):
+ *             j = Aj[k]
+ *             w = d + Ax[k]             # <<<<<<<<<<<<<<
+ *             if w < dist[j]:
+ *                 dist[j] = w
+ */
+      __pyx_v_w = (__pyx_v_d + (__pyx_v_Ax[__pyx_v_k]));
+
+      /* "scipy/sparse/_graph_tools.pyx":97
+ *             j = Aj[k]
+ *             w = d + Ax[k]
+ *             if w < dist[j]:             # <<<<<<<<<<<<<<
+ *                 dist[j] = w
+ *                 pred[j] = i
+ */
+      __pyx_t_3 = (__pyx_v_w < (__pyx_v_dist[__pyx_v_j]));
+      if (__pyx_t_3) {
+
+        /* "scipy/sparse/_graph_tools.pyx":98
+ *             w = d + Ax[k]
+ *             if w < dist[j]:
+ *                 dist[j] = w             # <<<<<<<<<<<<<<
+ *                 pred[j] = i
+ *                 heappush(h, w, j)
+ */
+        (__pyx_v_dist[__pyx_v_j]) = __pyx_v_w;
+
+        /* "scipy/sparse/_graph_tools.pyx":99
+ *             if w < dist[j]:
+ *                 dist[j] = w
+ *                 pred[j] = i             # <<<<<<<<<<<<<<
+ *                 heappush(h, w, j)
+ *         if undirected:
+ */
+        (__pyx_v_pred[__pyx_v_j]) = __pyx_v_i;
+
+        /* "scipy/sparse/_graph_tools.pyx":100
+ *                 dist[j] = w
+ *                 pred[j] = i
+ *                 heappush(h, w, j)             # <<<<<<<<<<<<<<
+ *         if undirected:
+ *             for k in range(Bp[i], Bp[i + 1]):
+ */
+        __pyx_f_5scipy_6sparse_12_graph_tools_heappush(__pyx_v_h, __pyx_v_w, __pyx_v_j);
+        goto __pyx_L10;
+      }
+      __pyx_L10:;
+    }
+
+    /* "scipy/sparse/_graph_tools.pyx":101
+ *                 pred[j] = i
+ *                 heappush(h, w, j)
+ *         if undirected:             # <<<<<<<<<<<<<<
+ *             for k in range(Bp[i], Bp[i + 1]):
+ *                 j = Bj[k]
+ */
+    if (__pyx_v_undirected) {
+
+      /* "scipy/sparse/_graph_tools.pyx":102
+ *                 heappush(h, w, j)
+ *         if undirected:
+ *             for k in range(Bp[i], Bp[i + 1]):             # <<<<<<<<<<<<<<
+ *                 j = Bj[k]
+ *                 w = d + Bx[k]
+ */
+      __pyx_t_1 = (__pyx_v_Bp[(__pyx_v_i + 1)]);
+      for (__pyx_t_2 = (__pyx_v_Bp[__pyx_v_i]); __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+        __pyx_v_k = __pyx_t_2;
+
+        /* "scipy/sparse/_graph_tools.pyx":103
+ *         if undirected:
+ *             for k in range(Bp[i], Bp[i + 1]):
+ *                 j = Bj[k]             # <<<<<<<<<<<<<<
+ *                 w = d + Bx[k]
+ *                 if w < dist[j]:
+ */
+        __pyx_v_j = (__pyx_v_Bj[__pyx_v_k]);
+
+        /* "scipy/sparse/_graph_tools.pyx":104
+ *             for k in range(Bp[i], Bp[i + 1]):
+ *                 j = Bj[k]
+ *                 w = d + Bx[k]             # <<<<<<<<<<<<<<
+ *                 if w < dist[j]:
+ *                     dist[j] = w
+ */
+        __pyx_v_w = (__pyx_v_d + (__pyx_v_Bx[__pyx_v_k]));
+
+        /* "scipy/sparse/_graph_tools.pyx":105
+ *                 j = Bj[k]
+ *                 w = d + Bx[k]
+ *                 if w < dist[j]:             # <<<<<<<<<<<<<<
+ *                     dist[j] = w
+ *                     pred[j] = i
+ */
+        __pyx_t_3 = (__pyx_v_w < (__pyx_v_dist[__pyx_v_j]));
+        if (__pyx_t_3) {
+
+          /* "scipy/sparse/_graph_tools.pyx":106
+ *                 w = d + Bx[k]
+ *                 if w < dist[j]:
+ *                     dist[j] = w             # <<<<<<<<<<<<<<
+ *                     pred[j] = i
+ *                     heappush(h, w, j)
+ */
+          (__pyx_v_dist[__pyx_v_j]) = __pyx_v_w;
+
+          /* "scipy/sparse/_graph_tools.pyx":107
+ *                 if w < dist[j]:
+ *                     dist[j] = w
+ *                     pred[j] = i             # <<<<<<<<<<<<<<
+ *                     heappush(h, w, j)
+ * 
+ */
+          (__pyx_v_pred[__pyx_v_j]) = __pyx_v_i;
+
+          /* "scipy/sparse/_graph_tools.pyx":108
+ *                     dist[j] = w
+ *                     pred[j] = i
+ *                     heappush(h, w, j)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+          __pyx_f_5scipy_6sparse_12_graph_tools_heappush(__pyx_v_h, __pyx_v_w, __pyx_v_j);
+          goto __pyx_L14;
+        }
+        __pyx_L14:;
+      }
+      goto __pyx_L11;
+    }
+    __pyx_L11:;
+    __pyx_L5_continue:;
+  }
+
+}
+
+/* "scipy/sparse/_graph_tools.pyx":111
+ * 
+ * 
+ * def dijkstra(np.ndarray Ap, np.ndarray Aj, np.ndarray Ax,             # <<<<<<<<<<<<<<
+ *              np.ndarray Bp, np.ndarray Bj, np.ndarray Bx, int undirected,
+ *              np.ndarray sources, np.ndarray dist, np.ndarray pred):
+ */
+
+static PyObject *__pyx_pf_5scipy_6sparse_12_graph_tools_dijkstra(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5scipy_6sparse_12_graph_tools_dijkstra[] = "Single-source Dijkstra from each node in `sources`.\n\n    Row ``s`` of `dist` and `pred` (both C-contiguous, shape\n    ``(len(sources), N)``) receives the result for ``sources[s]``.\n    Weights must be nonnegative.\n    ";
+static PyMethodDef __pyx_mdef_5scipy_6sparse_12_graph_tools_dijkstra = {__Pyx_NAMESTR("dijkstra"), (PyCFunction)__pyx_pf_5scipy_6sparse_12_graph_tools_dijkstra, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_5scipy_6sparse_12_graph_tools_dijkstra)};
+static PyObject *__pyx_pf_5scipy_6sparse_12_graph_tools_dijkstra(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_Ap = 0;
+  PyArrayObject *__pyx_v_Aj = 0;
+  PyArrayObject *__pyx_v_Ax = 0;
+  PyArrayObject *__pyx_v_Bp = 0;
+  PyArrayObject *__pyx_v_Bj = 0;
+  PyArrayObject *__pyx_v_Bx = 0;
+  int __pyx_v_undirected;
+  PyArrayObject *__pyx_v_sources = 0;
+  PyArrayObject *__pyx_v_dist = 0;
+  PyArrayObject *__pyx_v_pred = 0;
+  int __pyx_v_N;
+  int __pyx_v_n_sources;
+  int __pyx_v_s;
+  int *__pyx_v_src;
+  int *__pyx_v_ap;
+  int *__pyx_v_aj;
+  double *__pyx_v_ax;
+  int *__pyx_v_bp;
+  int *__pyx_v_bj;
+  double *__pyx_v_bx;
+  double *__pyx_v_d_ptr;
+  int *__pyx_v_p_ptr;
+  struct __pyx_t_5scipy_6sparse_12_graph_tools_heap __pyx_v_h;
+  int *__pyx_v_done;
+  int __pyx_v_capacity;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__Ap,&__pyx_n_s__Aj,&__pyx_n_s__Ax,&__pyx_n_s__Bp,&__pyx_n_s__Bj,&__pyx_n_s__Bx,&__pyx_n_s__undirected,&__pyx_n_s__sources,&__pyx_n_s__dist,&__pyx_n_s__pred,0};
+  __Pyx_RefNannySetupContext("dijkstra");
+  __pyx_self = __pyx_self;
+  {
+    PyObject* values[10] = {0,0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  0:
+        values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Ap);
+        if (likely(values[0])) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Aj);
+        if (likely(values[1])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dijkstra", 1, 10, 10, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  2:
+        values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Ax);
+        if (likely(values[2])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dijkstra", 1, 10, 10, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  3:
+        values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Bp);
+        if (likely(values[3])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dijkstra", 1, 10, 10, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  4:
+        values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Bj);
+        if (likely(values[4])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dijkstra", 1, 10, 10, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  5:
+        values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Bx);
+        if (likely(values[5])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dijkstra", 1, 10, 10, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  6:
+        values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__undirected);
+        if (likely(values[6])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dijkstra", 1, 10, 10, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  7:
+        values[7] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__sources);
+        if (likely(values[7])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dijkstra", 1, 10, 10, 7); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  8:
+        values[8] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__dist);
+        if (likely(values[8])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dijkstra", 1, 10, 10, 8); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  9:
+        values[9] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__pred);
+        if (likely(values[9])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("dijkstra", 1, 10, 10, 9); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "dijkstra") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 10) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+      values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+    }
+    __pyx_v_Ap = ((PyArrayObject *)values[0]);
+    __pyx_v_Aj = ((PyArrayObject *)values[1]);
+    __pyx_v_Ax = ((PyArrayObject *)values[2]);
+    __pyx_v_Bp = ((PyArrayObject *)values[3]);
+    __pyx_v_Bj = ((PyArrayObject *)values[4]);
+    __pyx_v_Bx = ((PyArrayObject *)values[5]);
+    __pyx_v_undirected = __Pyx_PyInt_AsInt(values[6]); if (unlikely((__pyx_v_undirected == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_sources = ((PyArrayObject *)values[7]);
+    __pyx_v_dist = ((PyArrayObject *)values[8]);
+    __pyx_v_pred = ((PyArrayObject *)values[9]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("dijkstra", 1, 10, 10, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("scipy.sparse._graph_tools.dijkstra", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Ap), __pyx_ptype_5numpy_ndarray, 1, "Ap", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Aj), __pyx_ptype_5numpy_ndarray, 1, "Aj", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Ax), __pyx_ptype_5numpy_ndarray, 1, "Ax", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Bp), __pyx_ptype_5numpy_ndarray, 1, "Bp", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Bj), __pyx_ptype_5numpy_ndarray, 1, "Bj", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Bx), __pyx_ptype_5numpy_ndarray, 1, "Bx", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_sources), __pyx_ptype_5numpy_ndarray, 1, "sources", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 113; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_dist), __pyx_ptype_5numpy_ndarray, 1, "dist", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 113; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_pred), __pyx_ptype_5numpy_ndarray, 1, "pred", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 113; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "scipy/sparse/_graph_tools.pyx":120
+ *     Weights must be nonnegative.
+ *     """
+ *     cdef int N = Ap.shape[0] - 1             # <<<<<<<<<<<<<<
+ *     cdef int n_sources = sources.shape[0]
+ *     cdef int s
+ */
+  __pyx_v_N = ((__pyx_v_Ap->dimensions[0]) - 1);
+
+  /* "scipy/sparse/_graph_tools.pyx":121
+ *     """
+ *     cdef int N = Ap.shape[0] - 1
+ *     cdef int n_sources = sources.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef int s
+ *     cdef int* src = <int*>sources.data
+ */
+  __pyx_v_n_sources = (__pyx_v_sources->dimensions[0]);
+
+  /* "scipy/sparse/_graph_tools.pyx":123
+ *     cdef int n_sources = sources.shape[0]
+ *     cdef int s
+ *     cdef int* src = <int*>sources.data             # <<<<<<<<<<<<<<
+ *     cdef int* ap = <int*>Ap.data
+ *     cdef int* aj = <int*>Aj.data
+ */
+  __pyx_v_src = ((int *)__pyx_v_sources->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":124
+ *     cdef int s
+ *     cdef int* src = <int*>sources.data
+ *     cdef int* ap = <int*>Ap.data             # <<<<<<<<<<<<<<
+ *     cdef int* aj = <int*>Aj.data
+ *     cdef double* ax = <double*>Ax.data
+ */
+  __pyx_v_ap = ((int *)__pyx_v_Ap->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":125
+ *     cdef int* src = <int*>sources.data
+ *     cdef int* ap = <int*>Ap.data
+ *     cdef int* aj = <int*>Aj.data             # <<<<<<<<<<<<<<
+ *     cdef double* ax = <double*>Ax.data
+ *     cdef int* bp = <int*>Bp.data
+ */
+  __pyx_v_aj = ((int *)__pyx_v_Aj->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":126
+ *     cdef int* ap = <int*>Ap.data
+ *     cdef int* aj = <int*>Aj.data
+ *     cdef double* ax = <double*>Ax.data             # <<<<<<<<<<<<<<
+ *     cdef int* bp = <int*>Bp.data
+ *     cdef int* bj = <int*>Bj.data
+ */
+  __pyx_v_ax = ((double *)__pyx_v_Ax->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":127
+ *     cdef int* aj = <int*>Aj.data
+ *     cdef double* ax = <double*>Ax.data
+ *     cdef int* bp = <int*>Bp.data             # <<<<<<<<<<<<<<
+ *     cdef int* bj = <int*>Bj.data
+ *     cdef double* bx = <double*>Bx.data
+ */
+  __pyx_v_bp = ((int *)__pyx_v_Bp->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":128
+ *     cdef double* ax = <double*>Ax.data
+ *     cdef int* bp = <int*>Bp.data
+ *     cdef int* bj = <int*>Bj.data             # <<<<<<<<<<<<<<
+ *     cdef double* bx = <double*>Bx.data
+ *     cdef double* d_ptr = <double*>dist.data
+ */
+  __pyx_v_bj = ((int *)__pyx_v_Bj->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":129
+ *     cdef int* bp = <int*>Bp.data
+ *     cdef int* bj = <int*>Bj.data
+ *     cdef double* bx = <double*>Bx.data             # <<<<<<<<<<<<<<
+ *     cdef double* d_ptr = <double*>dist.data
+ *     cdef int* p_ptr = <int*>pred.data
+ */
+  __pyx_v_bx = ((double *)__pyx_v_Bx->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":130
+ *     cdef int* bj = <int*>Bj.data
+ *     cdef double* bx = <double*>Bx.data
+ *     cdef double* d_ptr = <double*>dist.data             # <<<<<<<<<<<<<<
+ *     cdef int* p_ptr = <int*>pred.data
+ *     cdef heap h
+ */
+  __pyx_v_d_ptr = ((double *)__pyx_v_dist->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":131
+ *     cdef double* bx = <double*>Bx.data
+ *     cdef double* d_ptr = <double*>dist.data
+ *     cdef int* p_ptr = <int*>pred.data             # <<<<<<<<<<<<<<
+ *     cdef heap h
+ *     cdef int* done
+ */
+  __pyx_v_p_ptr = ((int *)__pyx_v_pred->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":134
+ *     cdef heap h
+ *     cdef int* done
+ *     cdef int capacity = Aj.shape[0] + 1             # <<<<<<<<<<<<<<
+ * 
+ *     if undirected:
+ */
+  __pyx_v_capacity = ((__pyx_v_Aj->dimensions[0]) + 1);
+
+  /* "scipy/sparse/_graph_tools.pyx":136
+ *     cdef int capacity = Aj.shape[0] + 1
+ * 
+ *     if undirected:             # <<<<<<<<<<<<<<
+ *         capacity += Bj.shape[0]
+ * 
+ */
+  if (__pyx_v_undirected) {
+
+    /* "scipy/sparse/_graph_tools.pyx":137
+ * 
+ *     if undirected:
+ *         capacity += Bj.shape[0]             # <<<<<<<<<<<<<<
+ * 
+ *     h.key = <double*>malloc(capacity * sizeof(double))
+ */
+    __pyx_v_capacity = (__pyx_v_capacity + (__pyx_v_Bj->dimensions[0]));
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "scipy/sparse/_graph_tools.pyx":139
+ *         capacity += Bj.shape[0]
+ * 
+ *     h.key = <double*>malloc(capacity * sizeof(double))             # <<<<<<<<<<<<<<
+ *     h.node = <int*>malloc(capacity * sizeof(int))
+ *     done = <int*>malloc((N + 1) * sizeof(int))
+ */
+  __pyx_v_h.key = ((double *)malloc((__pyx_v_capacity * (sizeof(double)))));
+
+  /* "scipy/sparse/_graph_tools.pyx":140
+ * 
+ *     h.key = <double*>malloc(capacity * sizeof(double))
+ *     h.node = <int*>malloc(capacity * sizeof(int))             # <<<<<<<<<<<<<<
+ *     done = <int*>malloc((N + 1) * sizeof(int))
+ *     if h.key == NULL or h.node == NULL or done == NULL:
+ */
+  __pyx_v_h.node = ((int *)malloc((__pyx_v_capacity * (sizeof(int)))));
+
+  /* "scipy/sparse/_graph_tools.pyx":141
+ *     h.key = <double*>malloc(capacity * sizeof(double))
+ *     h.node = <int*>malloc(capacity * sizeof(int))
+ *     done = <int*>malloc((N + 1) * sizeof(int))             # <<<<<<<<<<<<<<
+ *     if h.key == NULL or h.node == NULL or done == NULL:
+ *         free(h.key)
+ */
+  __pyx_v_done = ((int *)malloc(((__pyx_v_N + 1) * (sizeof(int)))));
+
+  /* "scipy/sparse/_graph_tools.pyx":142
+ *     h.node = <int*>malloc(capacity * sizeof(int))
+ *     done = <int*>malloc((N + 1) * sizeof(int))
+ *     if h.key == NULL or h.node == NULL or done == NULL:             # <<<<<<<<<<<<<<
+ *         free(h.key)
+ *         free(h.node)
+ */
+  __pyx_t_1 = (__pyx_v_h.key == NULL);
+  if (!__pyx_t_1) {
+    __pyx_t_2 = (__pyx_v_h.node == NULL);
+    if (!__pyx_t_2) {
+      __pyx_t_3 = (__pyx_v_done == NULL);
+      __pyx_t_4 = __pyx_t_3;
+    } else {
+      __pyx_t_4 = __pyx_t_2;
+    }
+    __pyx_t_2 = __pyx_t_4;
+  } else {
+    __pyx_t_2 = __pyx_t_1;
+  }
+  if (__pyx_t_2) {
+
+    /* "scipy/sparse/_graph_tools.pyx":143
+ *     done = <int*>malloc((N + 1) * sizeof(int))
+ *     if h.key == NULL or h.node == NULL or done == NULL:
+ *         free(h.key)             # <<<<<<<<<<<<<<
+ *         free(h.node)
+ *         free(done)
+ */
+    free(__pyx_v_h.key);
+
+    /* "scipy/sparse/_graph_tools.pyx":144
+ *     if h.key == NULL or h.node == NULL or done == NULL:
+ *         free(h.key)
+ *         free(h.node)             # <<<<<<<<<<<<<<
+ *         free(done)
+ *         raise MemoryError()
+ */
+    free(__pyx_v_h.node);
+
+    /* "scipy/sparse/_graph_tools.pyx":145
+ *         free(h.key)
+ *         free(h.node)
+ *         free(done)             # <<<<<<<<<<<<<<
+ *         raise MemoryError()
+ * 
+ */
+    free(__pyx_v_done);
+
+    /* "scipy/sparse/_graph_tools.pyx":146
+ *         free(h.node)
+ *         free(done)
+ *         raise MemoryError()             # <<<<<<<<<<<<<<
+ * 
+ *     with nogil:
+ */
+    PyErr_NoMemory(); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 146; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L7;
+  }
+  __pyx_L7:;
+
+  /* "scipy/sparse/_graph_tools.pyx":148
+ *         raise MemoryError()
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for s in range(n_sources):
+ *             _dijkstra_one(src[s], N, ap, aj, ax, bp, bj, bx, undirected,
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save = NULL;
+      #endif
+      Py_UNBLOCK_THREADS
+      /*try:*/ {
+
+        /* "scipy/sparse/_graph_tools.pyx":149
+ * 
+ *     with nogil:
+ *         for s in range(n_sources):             # <<<<<<<<<<<<<<
+ *             _dijkstra_one(src[s], N, ap, aj, ax, bp, bj, bx, undirected,
+ *                           d_ptr + s * N, p_ptr + s * N, done, &h)
+ */
+        __pyx_t_5 = __pyx_v_n_sources;
+        for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+          __pyx_v_s = __pyx_t_6;
+
+          /* "scipy/sparse/_graph_tools.pyx":151
+ *         for s in range(n_sources):
+ *             _dijkstra_one(src[s], N, ap, aj, ax, bp, bj, bx, undirected,
+ *                           d_ptr + s * N, p_ptr + s * N, done, &h)             # <<<<<<<<<<<<<<
+ * 
+ *     free(h.key)
+ */
+          __pyx_f_5scipy_6sparse_12_graph_tools__dijkstra_one((__pyx_v_src[__pyx_v_s]), __pyx_v_N, __pyx_v_ap, __pyx_v_aj, __pyx_v_ax, __pyx_v_bp, __pyx_v_bj, __pyx_v_bx, __pyx_v_undirected, (__pyx_v_d_ptr + (__pyx_v_s * __pyx_v_N)), (__pyx_v_p_ptr + (__pyx_v_s * __pyx_v_N)), __pyx_v_done, (&__pyx_v_h));
+        }
+      }
+
+      /* "scipy/sparse/_graph_tools.pyx":148
+ *         raise MemoryError()
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for s in range(n_sources):
+ *             _dijkstra_one(src[s], N, ap, aj, ax, bp, bj, bx, undirected,
+ */
+      /*finally:*/ {
+        Py_BLOCK_THREADS
+      }
+  }
+
+  /* "scipy/sparse/_graph_tools.pyx":153
+ *                           d_ptr + s * N, p_ptr + s * N, done, &h)
+ * 
+ *     free(h.key)             # <<<<<<<<<<<<<<
+ *     free(h.node)
+ *     free(done)
+ */
+  free(__pyx_v_h.key);
+
+  /* "scipy/sparse/_graph_tools.pyx":154
+ * 
+ *     free(h.key)
+ *     free(h.node)             # <<<<<<<<<<<<<<
+ *     free(done)
+ * 
+ */
+  free(__pyx_v_h.node);
+
+  /* "scipy/sparse/_graph_tools.pyx":155
+ *     free(h.key)
+ *     free(h.node)
+ *     free(done)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  free(__pyx_v_done);
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("scipy.sparse._graph_tools.dijkstra", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "scipy/sparse/_graph_tools.pyx":159
+ * 
+ * @cython.boundscheck(False)
+ * cdef int _relax(int N, int* Ap, int* Aj, double* Ax,             # <<<<<<<<<<<<<<
+ *                 int* Bp, int* Bj, double* Bx, int undirected,
+ *                 double* dist, int* pred) nogil:
+ */
+
+static int __pyx_f_5scipy_6sparse_12_graph_tools__relax(int __pyx_v_N, int *__pyx_v_Ap, int *__pyx_v_Aj, double *__pyx_v_Ax, int *__pyx_v_Bp, int *__pyx_v_Bj, double *__pyx_v_Bx, int __pyx_v_undirected, double *__pyx_v_dist, int *__pyx_v_pred) {
+  int __pyx_v_i;
+  int __pyx_v_j;
+  int __pyx_v_k;
+  int __pyx_v_changed;
+  double __pyx_v_d;
+  double __pyx_v_w;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+
+  /* "scipy/sparse/_graph_tools.pyx":164
+ *     # one Bellman-Ford sweep over all edges; returns the number of
+ *     # distances that were lowered
+ *     cdef int i, j, k, changed = 0             # <<<<<<<<<<<<<<
+ *     cdef double d, w
+ * 
+ */
+  __pyx_v_changed = 0;
+
+  /* "scipy/sparse/_graph_tools.pyx":167
+ *     cdef double d, w
+ * 
+ *     for i in range(N):             # <<<<<<<<<<<<<<
+ *         d = dist[i]
+ *         if d == infinity:
+ */
+  __pyx_t_1 = __pyx_v_N;
+  for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+    __pyx_v_i = __pyx_t_2;
+
+    /* "scipy/sparse/_graph_tools.pyx":168
+ * 
+ *     for i in range(N):
+ *         d = dist[i]             # <<<<<<<<<<<<<<
+ *         if d == infinity:
+ *             continue
+ */
+    __pyx_v_d = (__pyx_v_dist[__pyx_v_i]);
+
+    /* "scipy/sparse/_graph_tools.pyx":169
+ *     for i in range(N):
+ *         d = dist[i]
+ *         if d == infinity:             # <<<<<<<<<<<<<<
+ *             continue
+ *         for k in range(Ap[i], Ap[i + 1]):
+ */
+    __pyx_t_3 = (__pyx_v_d == __pyx_v_5scipy_6sparse_12_graph_tools_infinity);
+    if (__pyx_t_3) {
+
+      /* "scipy/sparse/_graph_tools.pyx":170
+ *         d = dist[i]
+ *         if d == infinity:
+ *             continue             # <<<<<<<<<<<<<<
+ *         for k in range(Ap[i], Ap[i + 1]):
+ *             j = Aj[k]
+ */
+      goto __pyx_L3_continue;
+      goto __pyx_L5;
+    }
+    __pyx_L5:;
+
+    /* "scipy/sparse/_graph_tools.pyx":171
+ *         if d == infinity:
+ *             continue
+ *         for k in range(Ap[i], Ap[i + 1]):             # <<<<<<<<<<<<<<
+ *             j = Aj[k]
+ *             w = d + Ax[k]
+ */
+    __pyx_t_4 = (__pyx_v_Ap[(__pyx_v_i + 1)]);
+    for (__pyx_t_5 = (__pyx_v_Ap[__pyx_v_i]); __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+      __pyx_v_k = __pyx_t_5;
+
+      /* "scipy/sparse/_graph_tools.pyx":172
+ *             continue
+ *         for k in range(Ap[i], Ap[i + 1]):
+ *             j = Aj[k]             # <<<<<<<<<<<<<<
+ *             w = d + Ax[k]
+ *             if w < dist[j]:
+ */
+      __pyx_v_j = (__pyx_v_Aj[__pyx_v_k]);
+
+      /* "scipy/sparse/_graph_tools.pyx":173
+ *         for k in range(Ap[i], Ap[i + 1]):
+ *             j = Aj[k]
+ *             w = d + Ax[k]             # <<<<<<<<<<<<<<
+ *             if w < dist[j]:
+ *                 dist[j] = w
+ */
+      __pyx_v_w = (__pyx_v_d + (__pyx_v_Ax[__pyx_v_k]));
+
+      /* "scipy/sparse/_graph_tools.pyx":174
+ *             j = Aj[k]
+ *             w = d + Ax[k]
+ *             if w < dist[j]:             # <<<<<<<<<<<<<<
+ *                 dist[j] = w
+ *                 pred[j] = i
+ */
+      __pyx_t_3 = (__pyx_v_w < (__pyx_v_dist[__pyx_v_j]));
+      if (__pyx_t_3) {
+
+        /* "scipy/sparse/_graph_tools.pyx":175
+ *             w = d + Ax[k]
+ *             if w < dist[j]:
+ *                 dist[j] = w             # <<<<<<<<<<<<<<
+ *                 pred[j] = i
+ *                 changed += 1
+ */
+        (__pyx_v_dist[__pyx_v_j]) = __pyx_v_w;
+
+        /* "scipy/sparse/_graph_tools.pyx":176
+ *             if w < dist[j]:
+ *                 dist[j] = w
+ *                 pred[j] = i             # <<<<<<<<<<<<<<
+ *                 changed += 1
+ *         if undirected:
+ */
+        (__pyx_v_pred[__pyx_v_j]) = __pyx_v_i;
+
+        /* "scipy/sparse/_graph_tools.pyx":177
+ *                 dist[j] = w
+ *                 pred[j] = i
+ *                 changed += 1             # <<<<<<<<<<<<<<
+ *         if undirected:
+ *             for k in range(Bp[i], Bp[i + 1]):
+ */
+        __pyx_v_changed = (__pyx_v_changed + 1);
+        goto __pyx_L8;
+      }
+      __pyx_L8:;
+    }
+
+    /* "scipy/sparse/_graph_tools.pyx":178
+ *                 pred[j] = i
+ *                 changed += 1
+ *         if undirected:             # <<<<<<<<<<<<<<
+ *             for k in range(Bp[i], Bp[i + 1]):
+ *                 j = Bj[k]
+ */
+    if (__pyx_v_undirected) {
+
+      /* "scipy/sparse/_graph_tools.pyx":179
+ *                 changed += 1
+ *         if undirected:
+ *             for k in range(Bp[i], Bp[i + 1]):             # <<<<<<<<<<<<<<
+ *                 j = Bj[k]
+ *                 w = d + Bx[k]
+ */
+      __pyx_t_4 = (__pyx_v_Bp[(__pyx_v_i + 1)]);
+      for (__pyx_t_5 = (__pyx_v_Bp[__pyx_v_i]); __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+        __pyx_v_k = __pyx_t_5;
+
+        /* "scipy/sparse/_graph_tools.pyx":180
+ *         if undirected:
+ *             for k in range(Bp[i], Bp[i + 1]):
+ *                 j = Bj[k]             # <<<<<<<<<<<<<<
+ *                 w = d + Bx[k]
+ *                 if w < dist[j]:
+ */
+        __pyx_v_j = (__pyx_v_Bj[__pyx_v_k]);
+
+        /* "scipy/sparse/_graph_tools.pyx":181
+ *             for k in range(Bp[i], Bp[i + 1]):
+ *                 j = Bj[k]
+ *                 w = d + Bx[k]             # <<<<<<<<<<<<<<
+ *                 if w < dist[j]:
+ *                     dist[j] = w
+ */
+        __pyx_v_w = (__pyx_v_d + (__pyx_v_Bx[__pyx_v_k]));
+
+        /* "scipy/sparse/_graph_tools.pyx":182
+ *                 j = Bj[k]
+ *                 w = d + Bx[k]
+ *                 if w < dist[j]:             # <<<<<<<<<<<<<<
+ *                     dist[j] = w
+ *                     pred[j] = i
+ */
+        __pyx_t_3 = (__pyx_v_w < (__pyx_v_dist[__pyx_v_j]));
+        if (__pyx_t_3) {
+
+          /* "scipy/sparse/_graph_tools.pyx":183
+ *                 w = d + Bx[k]
+ *                 if w < dist[j]:
+ *                     dist[j] = w             # <<<<<<<<<<<<<<
+ *                     pred[j] = i
+ *                     changed += 1
+ */
+          (__pyx_v_dist[__pyx_v_j]) = __pyx_v_w;
+
+          /* "scipy/sparse/_graph_tools.pyx":184
+ *                 if w < dist[j]:
+ *                     dist[j] = w
+ *                     pred[j] = i             # <<<<<<<<<<<<<<
+ *                     changed += 1
+ *     return changed
+ */
+          (__pyx_v_pred[__pyx_v_j]) = __pyx_v_i;
+
+          /* "scipy/sparse/_graph_tools.pyx":185
+ *                     dist[j] = w
+ *                     pred[j] = i
+ *                     changed += 1             # <<<<<<<<<<<<<<
+ *     return changed
+ * 
+ */
+          __pyx_v_changed = (__pyx_v_changed + 1);
+          goto __pyx_L12;
+        }
+        __pyx_L12:;
+      }
+      goto __pyx_L9;
+    }
+    __pyx_L9:;
+    __pyx_L3_continue:;
+  }
+
+  /* "scipy/sparse/_graph_tools.pyx":186
+ *                     pred[j] = i
+ *                     changed += 1
+ *     return changed             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = __pyx_v_changed;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "scipy/sparse/_graph_tools.pyx":190
+ * 
+ * @cython.boundscheck(False)
+ * cdef int _bellman_ford(int N, int* Ap, int* Aj, double* Ax,             # <<<<<<<<<<<<<<
+ *                        int* Bp, int* Bj, double* Bx, int undirected,
+ *                        double* dist, int* pred) nogil:
+ */
+
+static int __pyx_f_5scipy_6sparse_12_graph_tools__bellman_ford(int __pyx_v_N, int *__pyx_v_Ap, int *__pyx_v_Aj, double *__pyx_v_Ax, int *__pyx_v_Bp, int *__pyx_v_Bj, double *__pyx_v_Bx, int __pyx_v_undirected, double *__pyx_v_dist, int *__pyx_v_pred) {
+  int __pyx_v_it;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+
+  /* "scipy/sparse/_graph_tools.pyx":196
+ *     # negative cycle is reachable from the finite entries of dist
+ *     cdef int it
+ *     for it in range(N):             # <<<<<<<<<<<<<<
+ *         if not _relax(N, Ap, Aj, Ax, Bp, Bj, Bx, undirected, dist, pred):
+ *             return 0
+ */
+  __pyx_t_1 = __pyx_v_N;
+  for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+    __pyx_v_it = __pyx_t_2;
+
+    /* "scipy/sparse/_graph_tools.pyx":197
+ *     cdef int it
+ *     for it in range(N):
+ *         if not _relax(N, Ap, Aj, Ax, Bp, Bj, Bx, undirected, dist, pred):             # <<<<<<<<<<<<<<
+ *             return 0
+ *     return 1
+ */
+    __pyx_t_3 = (!__pyx_f_5scipy_6sparse_12_graph_tools__relax(__pyx_v_N, __pyx_v_Ap, __pyx_v_Aj, __pyx_v_Ax, __pyx_v_Bp, __pyx_v_Bj, __pyx_v_Bx, __pyx_v_undirected, __pyx_v_dist, __pyx_v_pred));
+    if (__pyx_t_3) {
+
+      /* "scipy/sparse/_graph_tools.pyx":198
+ *     for it in range(N):
+ *         if not _relax(N, Ap, Aj, Ax, Bp, Bj, Bx, undirected, dist, pred):
+ *             return 0             # <<<<<<<<<<<<<<
+ *     return 1
+ * 
+ */
+      __pyx_r = 0;
+      goto __pyx_L0;
+      goto __pyx_L5;
+    }
+    __pyx_L5:;
+  }
+
+  /* "scipy/sparse/_graph_tools.pyx":199
+ *         if not _relax(N, Ap, Aj, Ax, Bp, Bj, Bx, undirected, dist, pred):
+ *             return 0
+ *     return 1             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 1;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "scipy/sparse/_graph_tools.pyx":202
+ * 
+ * 
+ * def bellman_ford(np.ndarray Ap, np.ndarray Aj, np.ndarray Ax,             # <<<<<<<<<<<<<<
+ *                  np.ndarray Bp, np.ndarray Bj, np.ndarray Bx, int undirected,
+ *                  np.ndarray sources, np.ndarray dist, np.ndarray pred):
+ */
+
+static PyObject *__pyx_pf_5scipy_6sparse_12_graph_tools_1bellman_ford(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5scipy_6sparse_12_graph_tools_1bellman_ford[] = "Single-source Bellman-Ford from each node in `sources`.\n\n    Same layout as `dijkstra`.  Returns the index into `sources` of the\n    first source from which a negative cycle is reachable, or -1.\n    ";
+static PyMethodDef __pyx_mdef_5scipy_6sparse_12_graph_tools_1bellman_ford = {__Pyx_NAMESTR("bellman_ford"), (PyCFunction)__pyx_pf_5scipy_6sparse_12_graph_tools_1bellman_ford, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_5scipy_6sparse_12_graph_tools_1bellman_ford)};
+static PyObject *__pyx_pf_5scipy_6sparse_12_graph_tools_1bellman_ford(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_Ap = 0;
+  PyArrayObject *__pyx_v_Aj = 0;
+  PyArrayObject *__pyx_v_Ax = 0;
+  PyArrayObject *__pyx_v_Bp = 0;
+  PyArrayObject *__pyx_v_Bj = 0;
+  PyArrayObject *__pyx_v_Bx = 0;
+  int __pyx_v_undirected;
+  PyArrayObject *__pyx_v_sources = 0;
+  PyArrayObject *__pyx_v_dist = 0;
+  PyArrayObject *__pyx_v_pred = 0;
+  int __pyx_v_N;
+  int __pyx_v_n_sources;
+  int __pyx_v_s;
+  int __pyx_v_i;
+  int __pyx_v_bad;
+  int *__pyx_v_src;
+  int *__pyx_v_ap;
+  int *__pyx_v_aj;
+  double *__pyx_v_ax;
+  int *__pyx_v_bp;
+  int *__pyx_v_bj;
+  double *__pyx_v_bx;
+  double *__pyx_v_d_base;
+  int *__pyx_v_p_base;
+  double *__pyx_v_d_ptr;
+  int *__pyx_v_p_ptr;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__Ap,&__pyx_n_s__Aj,&__pyx_n_s__Ax,&__pyx_n_s__Bp,&__pyx_n_s__Bj,&__pyx_n_s__Bx,&__pyx_n_s__undirected,&__pyx_n_s__sources,&__pyx_n_s__dist,&__pyx_n_s__pred,0};
+  __Pyx_RefNannySetupContext("bellman_ford");
+  __pyx_self = __pyx_self;
+  {
+    PyObject* values[10] = {0,0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  0:
+        values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Ap);
+        if (likely(values[0])) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Aj);
+        if (likely(values[1])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("bellman_ford", 1, 10, 10, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  2:
+        values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Ax);
+        if (likely(values[2])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("bellman_ford", 1, 10, 10, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  3:
+        values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Bp);
+        if (likely(values[3])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("bellman_ford", 1, 10, 10, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  4:
+        values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Bj);
+        if (likely(values[4])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("bellman_ford", 1, 10, 10, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  5:
+        values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Bx);
+        if (likely(values[5])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("bellman_ford", 1, 10, 10, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  6:
+        values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__undirected);
+        if (likely(values[6])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("bellman_ford", 1, 10, 10, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  7:
+        values[7] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__sources);
+        if (likely(values[7])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("bellman_ford", 1, 10, 10, 7); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  8:
+        values[8] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__dist);
+        if (likely(values[8])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("bellman_ford", 1, 10, 10, 8); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  9:
+        values[9] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__pred);
+        if (likely(values[9])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("bellman_ford", 1, 10, 10, 9); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "bellman_ford") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 10) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+      values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+    }
+    __pyx_v_Ap = ((PyArrayObject *)values[0]);
+    __pyx_v_Aj = ((PyArrayObject *)values[1]);
+    __pyx_v_Ax = ((PyArrayObject *)values[2]);
+    __pyx_v_Bp = ((PyArrayObject *)values[3]);
+    __pyx_v_Bj = ((PyArrayObject *)values[4]);
+    __pyx_v_Bx = ((PyArrayObject *)values[5]);
+    __pyx_v_undirected = __Pyx_PyInt_AsInt(values[6]); if (unlikely((__pyx_v_undirected == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 203; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_sources = ((PyArrayObject *)values[7]);
+    __pyx_v_dist = ((PyArrayObject *)values[8]);
+    __pyx_v_pred = ((PyArrayObject *)values[9]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("bellman_ford", 1, 10, 10, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("scipy.sparse._graph_tools.bellman_ford", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Ap), __pyx_ptype_5numpy_ndarray, 1, "Ap", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Aj), __pyx_ptype_5numpy_ndarray, 1, "Aj", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Ax), __pyx_ptype_5numpy_ndarray, 1, "Ax", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Bp), __pyx_ptype_5numpy_ndarray, 1, "Bp", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 203; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Bj), __pyx_ptype_5numpy_ndarray, 1, "Bj", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 203; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Bx), __pyx_ptype_5numpy_ndarray, 1, "Bx", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 203; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_sources), __pyx_ptype_5numpy_ndarray, 1, "sources", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 204; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_dist), __pyx_ptype_5numpy_ndarray, 1, "dist", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 204; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_pred), __pyx_ptype_5numpy_ndarray, 1, "pred", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 204; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "scipy/sparse/_graph_tools.pyx":210
+ *     first source from which a negative cycle is reachable, or -1.
+ *     """
+ *     cdef int N = Ap.shape[0] - 1             # <<<<<<<<<<<<<<
+ *     cdef int n_sources = sources.shape[0]
+ *     cdef int s, i, bad = -1
+ */
+  __pyx_v_N = ((__pyx_v_Ap->dimensions[0]) - 1);
+
+  /* "scipy/sparse/_graph_tools.pyx":211
+ *     """
+ *     cdef int N = Ap.shape[0] - 1
+ *     cdef int n_sources = sources.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef int s, i, bad = -1
+ *     cdef int* src = <int*>sources.data
+ */
+  __pyx_v_n_sources = (__pyx_v_sources->dimensions[0]);
+
+  /* "scipy/sparse/_graph_tools.pyx":212
+ *     cdef int N = Ap.shape[0] - 1
+ *     cdef int n_sources = sources.shape[0]
+ *     cdef int s, i, bad = -1             # <<<<<<<<<<<<<<
+ *     cdef int* src = <int*>sources.data
+ *     cdef int* ap = <int*>Ap.data
+ */
+  __pyx_v_bad = -1;
+
+  /* "scipy/sparse/_graph_tools.pyx":213
+ *     cdef int n_sources = sources.shape[0]
+ *     cdef int s, i, bad = -1
+ *     cdef int* src = <int*>sources.data             # <<<<<<<<<<<<<<
+ *     cdef int* ap = <int*>Ap.data
+ *     cdef int* aj = <int*>Aj.data
+ */
+  __pyx_v_src = ((int *)__pyx_v_sources->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":214
+ *     cdef int s, i, bad = -1
+ *     cdef int* src = <int*>sources.data
+ *     cdef int* ap = <int*>Ap.data             # <<<<<<<<<<<<<<
+ *     cdef int* aj = <int*>Aj.data
+ *     cdef double* ax = <double*>Ax.data
+ */
+  __pyx_v_ap = ((int *)__pyx_v_Ap->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":215
+ *     cdef int* src = <int*>sources.data
+ *     cdef int* ap = <int*>Ap.data
+ *     cdef int* aj = <int*>Aj.data             # <<<<<<<<<<<<<<
+ *     cdef double* ax = <double*>Ax.data
+ *     cdef int* bp = <int*>Bp.data
+ */
+  __pyx_v_aj = ((int *)__pyx_v_Aj->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":216
+ *     cdef int* ap = <int*>Ap.data
+ *     cdef int* aj = <int*>Aj.data
+ *     cdef double* ax = <double*>Ax.data             # <<<<<<<<<<<<<<
+ *     cdef int* bp = <int*>Bp.data
+ *     cdef int* bj = <int*>Bj.data
+ */
+  __pyx_v_ax = ((double *)__pyx_v_Ax->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":217
+ *     cdef int* aj = <int*>Aj.data
+ *     cdef double* ax = <double*>Ax.data
+ *     cdef int* bp = <int*>Bp.data             # <<<<<<<<<<<<<<
+ *     cdef int* bj = <int*>Bj.data
+ *     cdef double* bx = <double*>Bx.data
+ */
+  __pyx_v_bp = ((int *)__pyx_v_Bp->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":218
+ *     cdef double* ax = <double*>Ax.data
+ *     cdef int* bp = <int*>Bp.data
+ *     cdef int* bj = <int*>Bj.data             # <<<<<<<<<<<<<<
+ *     cdef double* bx = <double*>Bx.data
+ *     cdef double* d_base = <double*>dist.data
+ */
+  __pyx_v_bj = ((int *)__pyx_v_Bj->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":219
+ *     cdef int* bp = <int*>Bp.data
+ *     cdef int* bj = <int*>Bj.data
+ *     cdef double* bx = <double*>Bx.data             # <<<<<<<<<<<<<<
+ *     cdef double* d_base = <double*>dist.data
+ *     cdef int* p_base = <int*>pred.data
+ */
+  __pyx_v_bx = ((double *)__pyx_v_Bx->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":220
+ *     cdef int* bj = <int*>Bj.data
+ *     cdef double* bx = <double*>Bx.data
+ *     cdef double* d_base = <double*>dist.data             # <<<<<<<<<<<<<<
+ *     cdef int* p_base = <int*>pred.data
+ *     cdef double* d_ptr
+ */
+  __pyx_v_d_base = ((double *)__pyx_v_dist->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":221
+ *     cdef double* bx = <double*>Bx.data
+ *     cdef double* d_base = <double*>dist.data
+ *     cdef int* p_base = <int*>pred.data             # <<<<<<<<<<<<<<
+ *     cdef double* d_ptr
+ *     cdef int* p_ptr
+ */
+  __pyx_v_p_base = ((int *)__pyx_v_pred->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":225
+ *     cdef int* p_ptr
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for s in range(n_sources):
+ *             d_ptr = d_base + s * N
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save = NULL;
+      #endif
+      Py_UNBLOCK_THREADS
+      /*try:*/ {
+
+        /* "scipy/sparse/_graph_tools.pyx":226
+ * 
+ *     with nogil:
+ *         for s in range(n_sources):             # <<<<<<<<<<<<<<
+ *             d_ptr = d_base + s * N
+ *             p_ptr = p_base + s * N
+ */
+        __pyx_t_1 = __pyx_v_n_sources;
+        for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+          __pyx_v_s = __pyx_t_2;
+
+          /* "scipy/sparse/_graph_tools.pyx":227
+ *     with nogil:
+ *         for s in range(n_sources):
+ *             d_ptr = d_base + s * N             # <<<<<<<<<<<<<<
+ *             p_ptr = p_base + s * N
+ *             for i in range(N):
+ */
+          __pyx_v_d_ptr = (__pyx_v_d_base + (__pyx_v_s * __pyx_v_N));
+
+          /* "scipy/sparse/_graph_tools.pyx":228
+ *         for s in range(n_sources):
+ *             d_ptr = d_base + s * N
+ *             p_ptr = p_base + s * N             # <<<<<<<<<<<<<<
+ *             for i in range(N):
+ *                 d_ptr[i] = infinity
+ */
+          __pyx_v_p_ptr = (__pyx_v_p_base + (__pyx_v_s * __pyx_v_N));
+
+          /* "scipy/sparse/_graph_tools.pyx":229
+ *             d_ptr = d_base + s * N
+ *             p_ptr = p_base + s * N
+ *             for i in range(N):             # <<<<<<<<<<<<<<
+ *                 d_ptr[i] = infinity
+ *                 p_ptr[i] = NO_PRED
+ */
+          __pyx_t_3 = __pyx_v_N;
+          for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+            __pyx_v_i = __pyx_t_4;
+
+            /* "scipy/sparse/_graph_tools.pyx":230
+ *             p_ptr = p_base + s * N
+ *             for i in range(N):
+ *                 d_ptr[i] = infinity             # <<<<<<<<<<<<<<
+ *                 p_ptr[i] = NO_PRED
+ *             d_ptr[src[s]] = 0
+ */
+            (__pyx_v_d_ptr[__pyx_v_i]) = __pyx_v_5scipy_6sparse_12_graph_tools_infinity;
+
+            /* "scipy/sparse/_graph_tools.pyx":231
+ *             for i in range(N):
+ *                 d_ptr[i] = infinity
+ *                 p_ptr[i] = NO_PRED             # <<<<<<<<<<<<<<
+ *             d_ptr[src[s]] = 0
+ *             if _bellman_ford(N, ap, aj, ax, bp, bj, bx, undirected,
+ */
+            (__pyx_v_p_ptr[__pyx_v_i]) = __pyx_v_5scipy_6sparse_12_graph_tools_NO_PRED;
+          }
+
+          /* "scipy/sparse/_graph_tools.pyx":232
+ *                 d_ptr[i] = infinity
+ *                 p_ptr[i] = NO_PRED
+ *             d_ptr[src[s]] = 0             # <<<<<<<<<<<<<<
+ *             if _bellman_ford(N, ap, aj, ax, bp, bj, bx, undirected,
+ *                              d_ptr, p_ptr):
+ */
+          (__pyx_v_d_ptr[(__pyx_v_src[__pyx_v_s])]) = 0.0;
+
+          /* "scipy/sparse/_graph_tools.pyx":234
+ *             d_ptr[src[s]] = 0
+ *             if _bellman_ford(N, ap, aj, ax, bp, bj, bx, undirected,
+ *                              d_ptr, p_ptr):             # <<<<<<<<<<<<<<
+ *                 bad = s
+ *                 break
+ */
+          __pyx_t_3 = __pyx_f_5scipy_6sparse_12_graph_tools__bellman_ford(__pyx_v_N, __pyx_v_ap, __pyx_v_aj, __pyx_v_ax, __pyx_v_bp, __pyx_v_bj, __pyx_v_bx, __pyx_v_undirected, __pyx_v_d_ptr, __pyx_v_p_ptr);
+          if (__pyx_t_3) {
+
+            /* "scipy/sparse/_graph_tools.pyx":235
+ *             if _bellman_ford(N, ap, aj, ax, bp, bj, bx, undirected,
+ *                              d_ptr, p_ptr):
+ *                 bad = s             # <<<<<<<<<<<<<<
+ *                 break
+ *     return bad
+ */
+            __pyx_v_bad = __pyx_v_s;
+
+            /* "scipy/sparse/_graph_tools.pyx":236
+ *                              d_ptr, p_ptr):
+ *                 bad = s
+ *                 break             # <<<<<<<<<<<<<<
+ *     return bad
+ * 
+ */
+            goto __pyx_L10_break;
+            goto __pyx_L13;
+          }
+          __pyx_L13:;
+        }
+        __pyx_L10_break:;
+      }
+
+      /* "scipy/sparse/_graph_tools.pyx":225
+ *     cdef int* p_ptr
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for s in range(n_sources):
+ *             d_ptr = d_base + s * N
+ */
+      /*finally:*/ {
+        Py_BLOCK_THREADS
+      }
+  }
+
+  /* "scipy/sparse/_graph_tools.pyx":237
+ *                 bad = s
+ *                 break
+ *     return bad             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_5 = PyInt_FromLong(__pyx_v_bad); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_r = __pyx_t_5;
+  __pyx_t_5 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("scipy.sparse._graph_tools.bellman_ford", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "scipy/sparse/_graph_tools.pyx":240
+ * 
+ * 
+ * def johnson_potentials(np.ndarray Ap, np.ndarray Aj, np.ndarray Ax,             # <<<<<<<<<<<<<<
+ *                        np.ndarray Bp, np.ndarray Bj, np.ndarray Bx,
+ *                        int undirected, np.ndarray h):
+ */
+
+static PyObject *__pyx_pf_5scipy_6sparse_12_graph_tools_2johnson_potentials(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5scipy_6sparse_12_graph_tools_2johnson_potentials[] = "Vertex potentials for Johnson's reweighting.\n\n    Runs Bellman-Ford from a virtual node joined to every node by a zero\n    weight edge, i.e. starting with all distances zero.  `h` receives\n    the potentials; returns 1 if the graph has a negative cycle.\n    ";
+static PyMethodDef __pyx_mdef_5scipy_6sparse_12_graph_tools_2johnson_potentials = {__Pyx_NAMESTR("johnson_potentials"), (PyCFunction)__pyx_pf_5scipy_6sparse_12_graph_tools_2johnson_potentials, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_5scipy_6sparse_12_graph_tools_2johnson_potentials)};
+static PyObject *__pyx_pf_5scipy_6sparse_12_graph_tools_2johnson_potentials(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_Ap = 0;
+  PyArrayObject *__pyx_v_Aj = 0;
+  PyArrayObject *__pyx_v_Ax = 0;
+  PyArrayObject *__pyx_v_Bp = 0;
+  PyArrayObject *__pyx_v_Bj = 0;
+  PyArrayObject *__pyx_v_Bx = 0;
+  int __pyx_v_undirected;
+  PyArrayObject *__pyx_v_h = 0;
+  int __pyx_v_N;
+  int __pyx_v_i;
+  int __pyx_v_bad;
+  int *__pyx_v_ap;
+  int *__pyx_v_aj;
+  double *__pyx_v_ax;
+  int *__pyx_v_bp;
+  int *__pyx_v_bj;
+  double *__pyx_v_bx;
+  double *__pyx_v_h_ptr;
+  int *__pyx_v_pred;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__Ap,&__pyx_n_s__Aj,&__pyx_n_s__Ax,&__pyx_n_s__Bp,&__pyx_n_s__Bj,&__pyx_n_s__Bx,&__pyx_n_s__undirected,&__pyx_n_s__h,0};
+  __Pyx_RefNannySetupContext("johnson_potentials");
+  __pyx_self = __pyx_self;
+  {
+    PyObject* values[8] = {0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  0:
+        values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Ap);
+        if (likely(values[0])) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Aj);
+        if (likely(values[1])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("johnson_potentials", 1, 8, 8, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 240; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  2:
+        values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Ax);
+        if (likely(values[2])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("johnson_potentials", 1, 8, 8, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 240; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  3:
+        values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Bp);
+        if (likely(values[3])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("johnson_potentials", 1, 8, 8, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 240; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  4:
+        values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Bj);
+        if (likely(values[4])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("johnson_potentials", 1, 8, 8, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 240; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  5:
+        values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Bx);
+        if (likely(values[5])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("johnson_potentials", 1, 8, 8, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 240; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  6:
+        values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__undirected);
+        if (likely(values[6])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("johnson_potentials", 1, 8, 8, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 240; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  7:
+        values[7] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__h);
+        if (likely(values[7])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("johnson_potentials", 1, 8, 8, 7); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 240; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "johnson_potentials") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 240; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 8) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+    }
+    __pyx_v_Ap = ((PyArrayObject *)values[0]);
+    __pyx_v_Aj = ((PyArrayObject *)values[1]);
+    __pyx_v_Ax = ((PyArrayObject *)values[2]);
+    __pyx_v_Bp = ((PyArrayObject *)values[3]);
+    __pyx_v_Bj = ((PyArrayObject *)values[4]);
+    __pyx_v_Bx = ((PyArrayObject *)values[5]);
+    __pyx_v_undirected = __Pyx_PyInt_AsInt(values[6]); if (unlikely((__pyx_v_undirected == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_h = ((PyArrayObject *)values[7]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("johnson_potentials", 1, 8, 8, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 240; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("scipy.sparse._graph_tools.johnson_potentials", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Ap), __pyx_ptype_5numpy_ndarray, 1, "Ap", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 240; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Aj), __pyx_ptype_5numpy_ndarray, 1, "Aj", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 240; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Ax), __pyx_ptype_5numpy_ndarray, 1, "Ax", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 240; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Bp), __pyx_ptype_5numpy_ndarray, 1, "Bp", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 241; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Bj), __pyx_ptype_5numpy_ndarray, 1, "Bj", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 241; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Bx), __pyx_ptype_5numpy_ndarray, 1, "Bx", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 241; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_h), __pyx_ptype_5numpy_ndarray, 1, "h", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "scipy/sparse/_graph_tools.pyx":249
+ *     the potentials; returns 1 if the graph has a negative cycle.
+ *     """
+ *     cdef int N = Ap.shape[0] - 1             # <<<<<<<<<<<<<<
+ *     cdef int i, bad
+ *     cdef int* ap = <int*>Ap.data
+ */
+  __pyx_v_N = ((__pyx_v_Ap->dimensions[0]) - 1);
+
+  /* "scipy/sparse/_graph_tools.pyx":251
+ *     cdef int N = Ap.shape[0] - 1
+ *     cdef int i, bad
+ *     cdef int* ap = <int*>Ap.data             # <<<<<<<<<<<<<<
+ *     cdef int* aj = <int*>Aj.data
+ *     cdef double* ax = <double*>Ax.data
+ */
+  __pyx_v_ap = ((int *)__pyx_v_Ap->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":252
+ *     cdef int i, bad
+ *     cdef int* ap = <int*>Ap.data
+ *     cdef int* aj = <int*>Aj.data             # <<<<<<<<<<<<<<
+ *     cdef double* ax = <double*>Ax.data
+ *     cdef int* bp = <int*>Bp.data
+ */
+  __pyx_v_aj = ((int *)__pyx_v_Aj->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":253
+ *     cdef int* ap = <int*>Ap.data
+ *     cdef int* aj = <int*>Aj.data
+ *     cdef double* ax = <double*>Ax.data             # <<<<<<<<<<<<<<
+ *     cdef int* bp = <int*>Bp.data
+ *     cdef int* bj = <int*>Bj.data
+ */
+  __pyx_v_ax = ((double *)__pyx_v_Ax->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":254
+ *     cdef int* aj = <int*>Aj.data
+ *     cdef double* ax = <double*>Ax.data
+ *     cdef int* bp = <int*>Bp.data             # <<<<<<<<<<<<<<
+ *     cdef int* bj = <int*>Bj.data
+ *     cdef double* bx = <double*>Bx.data
+ */
+  __pyx_v_bp = ((int *)__pyx_v_Bp->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":255
+ *     cdef double* ax = <double*>Ax.data
+ *     cdef int* bp = <int*>Bp.data
+ *     cdef int* bj = <int*>Bj.data             # <<<<<<<<<<<<<<
+ *     cdef double* bx = <double*>Bx.data
+ *     cdef double* h_ptr = <double*>h.data
+ */
+  __pyx_v_bj = ((int *)__pyx_v_Bj->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":256
+ *     cdef int* bp = <int*>Bp.data
+ *     cdef int* bj = <int*>Bj.data
+ *     cdef double* bx = <double*>Bx.data             # <<<<<<<<<<<<<<
+ *     cdef double* h_ptr = <double*>h.data
+ *     cdef int* pred = <int*>malloc((N + 1) * sizeof(int))
+ */
+  __pyx_v_bx = ((double *)__pyx_v_Bx->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":257
+ *     cdef int* bj = <int*>Bj.data
+ *     cdef double* bx = <double*>Bx.data
+ *     cdef double* h_ptr = <double*>h.data             # <<<<<<<<<<<<<<
+ *     cdef int* pred = <int*>malloc((N + 1) * sizeof(int))
+ * 
+ */
+  __pyx_v_h_ptr = ((double *)__pyx_v_h->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":258
+ *     cdef double* bx = <double*>Bx.data
+ *     cdef double* h_ptr = <double*>h.data
+ *     cdef int* pred = <int*>malloc((N + 1) * sizeof(int))             # <<<<<<<<<<<<<<
+ * 
+ *     if pred == NULL:
+ */
+  __pyx_v_pred = ((int *)malloc(((__pyx_v_N + 1) * (sizeof(int)))));
+
+  /* "scipy/sparse/_graph_tools.pyx":260
+ *     cdef int* pred = <int*>malloc((N + 1) * sizeof(int))
+ * 
+ *     if pred == NULL:             # <<<<<<<<<<<<<<
+ *         raise MemoryError()
+ *     with nogil:
+ */
+  __pyx_t_1 = (__pyx_v_pred == NULL);
+  if (__pyx_t_1) {
+
+    /* "scipy/sparse/_graph_tools.pyx":261
+ * 
+ *     if pred == NULL:
+ *         raise MemoryError()             # <<<<<<<<<<<<<<
+ *     with nogil:
+ *         for i in range(N):
+ */
+    PyErr_NoMemory(); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 261; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "scipy/sparse/_graph_tools.pyx":262
+ *     if pred == NULL:
+ *         raise MemoryError()
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(N):
+ *             h_ptr[i] = 0
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save = NULL;
+      #endif
+      Py_UNBLOCK_THREADS
+      /*try:*/ {
+
+        /* "scipy/sparse/_graph_tools.pyx":263
+ *         raise MemoryError()
+ *     with nogil:
+ *         for i in range(N):             # <<<<<<<<<<<<<<
+ *             h_ptr[i] = 0
+ *             pred[i] = NO_PRED
+ */
+        __pyx_t_2 = __pyx_v_N;
+        for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+          __pyx_v_i = __pyx_t_3;
+
+          /* "scipy/sparse/_graph_tools.pyx":264
+ *     with nogil:
+ *         for i in range(N):
+ *             h_ptr[i] = 0             # <<<<<<<<<<<<<<
+ *             pred[i] = NO_PRED
+ *         bad = _bellman_ford(N, ap, aj, ax, bp, bj, bx, undirected,
+ */
+          (__pyx_v_h_ptr[__pyx_v_i]) = 0.0;
+
+          /* "scipy/sparse/_graph_tools.pyx":265
+ *         for i in range(N):
+ *             h_ptr[i] = 0
+ *             pred[i] = NO_PRED             # <<<<<<<<<<<<<<
+ *         bad = _bellman_ford(N, ap, aj, ax, bp, bj, bx, undirected,
+ *                             h_ptr, pred)
+ */
+          (__pyx_v_pred[__pyx_v_i]) = __pyx_v_5scipy_6sparse_12_graph_tools_NO_PRED;
+        }
+
+        /* "scipy/sparse/_graph_tools.pyx":267
+ *             pred[i] = NO_PRED
+ *         bad = _bellman_ford(N, ap, aj, ax, bp, bj, bx, undirected,
+ *                             h_ptr, pred)             # <<<<<<<<<<<<<<
+ *     free(pred)
+ *     return bad
+ */
+        __pyx_v_bad = __pyx_f_5scipy_6sparse_12_graph_tools__bellman_ford(__pyx_v_N, __pyx_v_ap, __pyx_v_aj, __pyx_v_ax, __pyx_v_bp, __pyx_v_bj, __pyx_v_bx, __pyx_v_undirected, __pyx_v_h_ptr, __pyx_v_pred);
+      }
+
+      /* "scipy/sparse/_graph_tools.pyx":262
+ *     if pred == NULL:
+ *         raise MemoryError()
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(N):
+ *             h_ptr[i] = 0
+ */
+      /*finally:*/ {
+        Py_BLOCK_THREADS
+      }
+  }
+
+  /* "scipy/sparse/_graph_tools.pyx":268
+ *         bad = _bellman_ford(N, ap, aj, ax, bp, bj, bx, undirected,
+ *                             h_ptr, pred)
+ *     free(pred)             # <<<<<<<<<<<<<<
+ *     return bad
+ * 
+ */
+  free(__pyx_v_pred);
+
+  /* "scipy/sparse/_graph_tools.pyx":269
+ *                             h_ptr, pred)
+ *     free(pred)
+ *     return bad             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_4 = PyInt_FromLong(__pyx_v_bad); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 269; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("scipy.sparse._graph_tools.johnson_potentials", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "scipy/sparse/_graph_tools.pyx":273
+ * 
+ * @cython.boundscheck(False)
+ * def floyd_warshall(np.ndarray Ap, np.ndarray Aj, np.ndarray Ax,             # <<<<<<<<<<<<<<
+ *                    np.ndarray Bp, np.ndarray Bj, np.ndarray Bx,
+ *                    int undirected, np.ndarray dist, np.ndarray pred):
+ */
+
+static PyObject *__pyx_pf_5scipy_6sparse_12_graph_tools_3floyd_warshall(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5scipy_6sparse_12_graph_tools_3floyd_warshall[] = "All-pairs Floyd-Warshall.\n\n    `dist` and `pred` are C-contiguous N x N output arrays.  Returns 1\n    if a negative cycle was found.\n    ";
+static PyMethodDef __pyx_mdef_5scipy_6sparse_12_graph_tools_3floyd_warshall = {__Pyx_NAMESTR("floyd_warshall"), (PyCFunction)__pyx_pf_5scipy_6sparse_12_graph_tools_3floyd_warshall, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_5scipy_6sparse_12_graph_tools_3floyd_warshall)};
+static PyObject *__pyx_pf_5scipy_6sparse_12_graph_tools_3floyd_warshall(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_Ap = 0;
+  PyArrayObject *__pyx_v_Aj = 0;
+  PyArrayObject *__pyx_v_Ax = 0;
+  PyArrayObject *__pyx_v_Bp = 0;
+  PyArrayObject *__pyx_v_Bj = 0;
+  PyArrayObject *__pyx_v_Bx = 0;
+  int __pyx_v_undirected;
+  PyArrayObject *__pyx_v_dist = 0;
+  PyArrayObject *__pyx_v_pred = 0;
+  int __pyx_v_N;
+  int *__pyx_v_ap;
+  int *__pyx_v_aj;
+  double *__pyx_v_ax;
+  int *__pyx_v_bp;
+  int *__pyx_v_bj;
+  double *__pyx_v_bx;
+  double *__pyx_v_D;
+  int *__pyx_v_P;
+  int __pyx_v_i;
+  int __pyx_v_j;
+  int __pyx_v_k;
+  double *__pyx_v_Di;
+  double *__pyx_v_Dk;
+  int *__pyx_v_Pi;
+  int *__pyx_v_Pk;
+  double __pyx_v_dik;
+  double __pyx_v_d;
+  int __pyx_v_negative_cycle;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__Ap,&__pyx_n_s__Aj,&__pyx_n_s__Ax,&__pyx_n_s__Bp,&__pyx_n_s__Bj,&__pyx_n_s__Bx,&__pyx_n_s__undirected,&__pyx_n_s__dist,&__pyx_n_s__pred,0};
+  __Pyx_RefNannySetupContext("floyd_warshall");
+  __pyx_self = __pyx_self;
+  {
+    PyObject* values[9] = {0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  0:
+        values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Ap);
+        if (likely(values[0])) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Aj);
+        if (likely(values[1])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("floyd_warshall", 1, 9, 9, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  2:
+        values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Ax);
+        if (likely(values[2])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("floyd_warshall", 1, 9, 9, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  3:
+        values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Bp);
+        if (likely(values[3])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("floyd_warshall", 1, 9, 9, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  4:
+        values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Bj);
+        if (likely(values[4])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("floyd_warshall", 1, 9, 9, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  5:
+        values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Bx);
+        if (likely(values[5])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("floyd_warshall", 1, 9, 9, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  6:
+        values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__undirected);
+        if (likely(values[6])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("floyd_warshall", 1, 9, 9, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  7:
+        values[7] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__dist);
+        if (likely(values[7])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("floyd_warshall", 1, 9, 9, 7); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  8:
+        values[8] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__pred);
+        if (likely(values[8])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("floyd_warshall", 1, 9, 9, 8); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "floyd_warshall") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 9) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+    }
+    __pyx_v_Ap = ((PyArrayObject *)values[0]);
+    __pyx_v_Aj = ((PyArrayObject *)values[1]);
+    __pyx_v_Ax = ((PyArrayObject *)values[2]);
+    __pyx_v_Bp = ((PyArrayObject *)values[3]);
+    __pyx_v_Bj = ((PyArrayObject *)values[4]);
+    __pyx_v_Bx = ((PyArrayObject *)values[5]);
+    __pyx_v_undirected = __Pyx_PyInt_AsInt(values[6]); if (unlikely((__pyx_v_undirected == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 275; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_dist = ((PyArrayObject *)values[7]);
+    __pyx_v_pred = ((PyArrayObject *)values[8]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("floyd_warshall", 1, 9, 9, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("scipy.sparse._graph_tools.floyd_warshall", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Ap), __pyx_ptype_5numpy_ndarray, 1, "Ap", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Aj), __pyx_ptype_5numpy_ndarray, 1, "Aj", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Ax), __pyx_ptype_5numpy_ndarray, 1, "Ax", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Bp), __pyx_ptype_5numpy_ndarray, 1, "Bp", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Bj), __pyx_ptype_5numpy_ndarray, 1, "Bj", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Bx), __pyx_ptype_5numpy_ndarray, 1, "Bx", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_dist), __pyx_ptype_5numpy_ndarray, 1, "dist", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 275; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_pred), __pyx_ptype_5numpy_ndarray, 1, "pred", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 275; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "scipy/sparse/_graph_tools.pyx":281
+ *     if a negative cycle was found.
+ *     """
+ *     cdef int N = Ap.shape[0] - 1             # <<<<<<<<<<<<<<
+ *     cdef int* ap = <int*>Ap.data
+ *     cdef int* aj = <int*>Aj.data
+ */
+  __pyx_v_N = ((__pyx_v_Ap->dimensions[0]) - 1);
+
+  /* "scipy/sparse/_graph_tools.pyx":282
+ *     """
+ *     cdef int N = Ap.shape[0] - 1
+ *     cdef int* ap = <int*>Ap.data             # <<<<<<<<<<<<<<
+ *     cdef int* aj = <int*>Aj.data
+ *     cdef double* ax = <double*>Ax.data
+ */
+  __pyx_v_ap = ((int *)__pyx_v_Ap->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":283
+ *     cdef int N = Ap.shape[0] - 1
+ *     cdef int* ap = <int*>Ap.data
+ *     cdef int* aj = <int*>Aj.data             # <<<<<<<<<<<<<<
+ *     cdef double* ax = <double*>Ax.data
+ *     cdef int* bp = <int*>Bp.data
+ */
+  __pyx_v_aj = ((int *)__pyx_v_Aj->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":284
+ *     cdef int* ap = <int*>Ap.data
+ *     cdef int* aj = <int*>Aj.data
+ *     cdef double* ax = <double*>Ax.data             # <<<<<<<<<<<<<<
+ *     cdef int* bp = <int*>Bp.data
+ *     cdef int* bj = <int*>Bj.data
+ */
+  __pyx_v_ax = ((double *)__pyx_v_Ax->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":285
+ *     cdef int* aj = <int*>Aj.data
+ *     cdef double* ax = <double*>Ax.data
+ *     cdef int* bp = <int*>Bp.data             # <<<<<<<<<<<<<<
+ *     cdef int* bj = <int*>Bj.data
+ *     cdef double* bx = <double*>Bx.data
+ */
+  __pyx_v_bp = ((int *)__pyx_v_Bp->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":286
+ *     cdef double* ax = <double*>Ax.data
+ *     cdef int* bp = <int*>Bp.data
+ *     cdef int* bj = <int*>Bj.data             # <<<<<<<<<<<<<<
+ *     cdef double* bx = <double*>Bx.data
+ *     cdef double* D = <double*>dist.data
+ */
+  __pyx_v_bj = ((int *)__pyx_v_Bj->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":287
+ *     cdef int* bp = <int*>Bp.data
+ *     cdef int* bj = <int*>Bj.data
+ *     cdef double* bx = <double*>Bx.data             # <<<<<<<<<<<<<<
+ *     cdef double* D = <double*>dist.data
+ *     cdef int* P = <int*>pred.data
+ */
+  __pyx_v_bx = ((double *)__pyx_v_Bx->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":288
+ *     cdef int* bj = <int*>Bj.data
+ *     cdef double* bx = <double*>Bx.data
+ *     cdef double* D = <double*>dist.data             # <<<<<<<<<<<<<<
+ *     cdef int* P = <int*>pred.data
+ *     cdef int i, j, k
+ */
+  __pyx_v_D = ((double *)__pyx_v_dist->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":289
+ *     cdef double* bx = <double*>Bx.data
+ *     cdef double* D = <double*>dist.data
+ *     cdef int* P = <int*>pred.data             # <<<<<<<<<<<<<<
+ *     cdef int i, j, k
+ *     cdef double* Di
+ */
+  __pyx_v_P = ((int *)__pyx_v_pred->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":296
+ *     cdef int* Pk
+ *     cdef double dik, d
+ *     cdef int negative_cycle = 0             # <<<<<<<<<<<<<<
+ * 
+ *     with nogil:
+ */
+  __pyx_v_negative_cycle = 0;
+
+  /* "scipy/sparse/_graph_tools.pyx":298
+ *     cdef int negative_cycle = 0
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(N * N):
+ *             D[i] = infinity
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save = NULL;
+      #endif
+      Py_UNBLOCK_THREADS
+      /*try:*/ {
+
+        /* "scipy/sparse/_graph_tools.pyx":299
+ * 
+ *     with nogil:
+ *         for i in range(N * N):             # <<<<<<<<<<<<<<
+ *             D[i] = infinity
+ *             P[i] = NO_PRED
+ */
+        __pyx_t_1 = (__pyx_v_N * __pyx_v_N);
+        for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+          __pyx_v_i = __pyx_t_2;
+
+          /* "scipy/sparse/_graph_tools.pyx":300
+ *     with nogil:
+ *         for i in range(N * N):
+ *             D[i] = infinity             # <<<<<<<<<<<<<<
+ *             P[i] = NO_PRED
+ *         for i in range(N):
+ */
+          (__pyx_v_D[__pyx_v_i]) = __pyx_v_5scipy_6sparse_12_graph_tools_infinity;
+
+          /* "scipy/sparse/_graph_tools.pyx":301
+ *         for i in range(N * N):
+ *             D[i] = infinity
+ *             P[i] = NO_PRED             # <<<<<<<<<<<<<<
+ *         for i in range(N):
+ *             D[i * N + i] = 0
+ */
+          (__pyx_v_P[__pyx_v_i]) = __pyx_v_5scipy_6sparse_12_graph_tools_NO_PRED;
+        }
+
+        /* "scipy/sparse/_graph_tools.pyx":302
+ *             D[i] = infinity
+ *             P[i] = NO_PRED
+ *         for i in range(N):             # <<<<<<<<<<<<<<
+ *             D[i * N + i] = 0
+ *         # duplicate and reversed edges keep the lightest weight
+ */
+        __pyx_t_1 = __pyx_v_N;
+        for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+          __pyx_v_i = __pyx_t_2;
+
+          /* "scipy/sparse/_graph_tools.pyx":303
+ *             P[i] = NO_PRED
+ *         for i in range(N):
+ *             D[i * N + i] = 0             # <<<<<<<<<<<<<<
+ *         # duplicate and reversed edges keep the lightest weight
+ *         for i in range(N):
+ */
+          (__pyx_v_D[((__pyx_v_i * __pyx_v_N) + __pyx_v_i)]) = 0.0;
+        }
+
+        /* "scipy/sparse/_graph_tools.pyx":305
+ *             D[i * N + i] = 0
+ *         # duplicate and reversed edges keep the lightest weight
+ *         for i in range(N):             # <<<<<<<<<<<<<<
+ *             for k in range(ap[i], ap[i + 1]):
+ *                 j = aj[k]
+ */
+        __pyx_t_1 = __pyx_v_N;
+        for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+          __pyx_v_i = __pyx_t_2;
+
+          /* "scipy/sparse/_graph_tools.pyx":306
+ *         # duplicate and reversed edges keep the lightest weight
+ *         for i in range(N):
+ *             for k in range(ap[i], ap[i + 1]):             # <<<<<<<<<<<<<<
+ *                 j = aj[k]
+ *                 if ax[k] < D[i * N + j]:
+ */
+          __pyx_t_3 = (__pyx_v_ap[(__pyx_v_i + 1)]);
+          for (__pyx_t_4 = (__pyx_v_ap[__pyx_v_i]); __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+            __pyx_v_k = __pyx_t_4;
+
+            /* "scipy/sparse/_graph_tools.pyx":307
+ *         for i in range(N):
+ *             for k in range(ap[i], ap[i + 1]):
+ *                 j = aj[k]             # <<<<<<<<<<<<<<
+ *                 if ax[k] < D[i * N + j]:
+ *                     D[i * N + j] = ax[k]
+ */
+            __pyx_v_j = (__pyx_v_aj[__pyx_v_k]);
+
+            /* "scipy/sparse/_graph_tools.pyx":308
+ *             for k in range(ap[i], ap[i + 1]):
+ *                 j = aj[k]
+ *                 if ax[k] < D[i * N + j]:             # <<<<<<<<<<<<<<
+ *                     D[i * N + j] = ax[k]
+ *                     if i != j:
+ */
+            __pyx_t_5 = ((__pyx_v_ax[__pyx_v_k]) < (__pyx_v_D[((__pyx_v_i * __pyx_v_N) + __pyx_v_j)]));
+            if (__pyx_t_5) {
+
+              /* "scipy/sparse/_graph_tools.pyx":309
+ *                 j = aj[k]
+ *                 if ax[k] < D[i * N + j]:
+ *                     D[i * N + j] = ax[k]             # <<<<<<<<<<<<<<
+ *                     if i != j:
+ *                         P[i * N + j] = i
+ */
+              (__pyx_v_D[((__pyx_v_i * __pyx_v_N) + __pyx_v_j)]) = (__pyx_v_ax[__pyx_v_k]);
+
+              /* "scipy/sparse/_graph_tools.pyx":310
+ *                 if ax[k] < D[i * N + j]:
+ *                     D[i * N + j] = ax[k]
+ *                     if i != j:             # <<<<<<<<<<<<<<
+ *                         P[i * N + j] = i
+ *             if undirected:
+ */
+              __pyx_t_5 = (__pyx_v_i != __pyx_v_j);
+              if (__pyx_t_5) {
+
+                /* "scipy/sparse/_graph_tools.pyx":311
+ *                     D[i * N + j] = ax[k]
+ *                     if i != j:
+ *                         P[i * N + j] = i             # <<<<<<<<<<<<<<
+ *             if undirected:
+ *                 for k in range(bp[i], bp[i + 1]):
+ */
+                (__pyx_v_P[((__pyx_v_i * __pyx_v_N) + __pyx_v_j)]) = __pyx_v_i;
+                goto __pyx_L18;
+              }
+              __pyx_L18:;
+              goto __pyx_L17;
+            }
+            __pyx_L17:;
+          }
+
+          /* "scipy/sparse/_graph_tools.pyx":312
+ *                     if i != j:
+ *                         P[i * N + j] = i
+ *             if undirected:             # <<<<<<<<<<<<<<
+ *                 for k in range(bp[i], bp[i + 1]):
+ *                     j = bj[k]
+ */
+          if (__pyx_v_undirected) {
+
+            /* "scipy/sparse/_graph_tools.pyx":313
+ *                         P[i * N + j] = i
+ *             if undirected:
+ *                 for k in range(bp[i], bp[i + 1]):             # <<<<<<<<<<<<<<
+ *                     j = bj[k]
+ *                     if bx[k] < D[i * N + j]:
+ */
+            __pyx_t_3 = (__pyx_v_bp[(__pyx_v_i + 1)]);
+            for (__pyx_t_4 = (__pyx_v_bp[__pyx_v_i]); __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+              __pyx_v_k = __pyx_t_4;
+
+              /* "scipy/sparse/_graph_tools.pyx":314
+ *             if undirected:
+ *                 for k in range(bp[i], bp[i + 1]):
+ *                     j = bj[k]             # <<<<<<<<<<<<<<
+ *                     if bx[k] < D[i * N + j]:
+ *                         D[i * N + j] = bx[k]
+ */
+              __pyx_v_j = (__pyx_v_bj[__pyx_v_k]);
+
+              /* "scipy/sparse/_graph_tools.pyx":315
+ *                 for k in range(bp[i], bp[i + 1]):
+ *                     j = bj[k]
+ *                     if bx[k] < D[i * N + j]:             # <<<<<<<<<<<<<<
+ *                         D[i * N + j] = bx[k]
+ *                         if i != j:
+ */
+              __pyx_t_5 = ((__pyx_v_bx[__pyx_v_k]) < (__pyx_v_D[((__pyx_v_i * __pyx_v_N) + __pyx_v_j)]));
+              if (__pyx_t_5) {
+
+                /* "scipy/sparse/_graph_tools.pyx":316
+ *                     j = bj[k]
+ *                     if bx[k] < D[i * N + j]:
+ *                         D[i * N + j] = bx[k]             # <<<<<<<<<<<<<<
+ *                         if i != j:
+ *                             P[i * N + j] = i
+ */
+                (__pyx_v_D[((__pyx_v_i * __pyx_v_N) + __pyx_v_j)]) = (__pyx_v_bx[__pyx_v_k]);
+
+                /* "scipy/sparse/_graph_tools.pyx":317
+ *                     if bx[k] < D[i * N + j]:
+ *                         D[i * N + j] = bx[k]
+ *                         if i != j:             # <<<<<<<<<<<<<<
+ *                             P[i * N + j] = i
+ * 
+ */
+                __pyx_t_5 = (__pyx_v_i != __pyx_v_j);
+                if (__pyx_t_5) {
+
+                  /* "scipy/sparse/_graph_tools.pyx":318
+ *                         D[i * N + j] = bx[k]
+ *                         if i != j:
+ *                             P[i * N + j] = i             # <<<<<<<<<<<<<<
+ * 
+ *         for k in range(N):
+ */
+                  (__pyx_v_P[((__pyx_v_i * __pyx_v_N) + __pyx_v_j)]) = __pyx_v_i;
+                  goto __pyx_L23;
+                }
+                __pyx_L23:;
+                goto __pyx_L22;
+              }
+              __pyx_L22:;
+            }
+            goto __pyx_L19;
+          }
+          __pyx_L19:;
+        }
+
+        /* "scipy/sparse/_graph_tools.pyx":320
+ *                             P[i * N + j] = i
+ * 
+ *         for k in range(N):             # <<<<<<<<<<<<<<
+ *             Dk = D + k * N
+ *             Pk = P + k * N
+ */
+        __pyx_t_1 = __pyx_v_N;
+        for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+          __pyx_v_k = __pyx_t_2;
+
+          /* "scipy/sparse/_graph_tools.pyx":321
+ * 
+ *         for k in range(N):
+ *             Dk = D + k * N             # <<<<<<<<<<<<<<
+ *             Pk = P + k * N
+ *             for i in range(N):
+ */
+          __pyx_v_Dk = (__pyx_v_D + (__pyx_v_k * __pyx_v_N));
+
+          /* "scipy/sparse/_graph_tools.pyx":322
+ *         for k in range(N):
+ *             Dk = D + k * N
+ *             Pk = P + k * N             # <<<<<<<<<<<<<<
+ *             for i in range(N):
+ *                 Di = D + i * N
+ */
+          __pyx_v_Pk = (__pyx_v_P + (__pyx_v_k * __pyx_v_N));
+
+          /* "scipy/sparse/_graph_tools.pyx":323
+ *             Dk = D + k * N
+ *             Pk = P + k * N
+ *             for i in range(N):             # <<<<<<<<<<<<<<
+ *                 Di = D + i * N
+ *                 dik = Di[k]
+ */
+          __pyx_t_3 = __pyx_v_N;
+          for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+            __pyx_v_i = __pyx_t_4;
+
+            /* "scipy/sparse/_graph_tools.pyx":324
+ *             Pk = P + k * N
+ *             for i in range(N):
+ *                 Di = D + i * N             # <<<<<<<<<<<<<<
+ *                 dik = Di[k]
+ *                 if dik == infinity:
+ */
+            __pyx_v_Di = (__pyx_v_D + (__pyx_v_i * __pyx_v_N));
+
+            /* "scipy/sparse/_graph_tools.pyx":325
+ *             for i in range(N):
+ *                 Di = D + i * N
+ *                 dik = Di[k]             # <<<<<<<<<<<<<<
+ *                 if dik == infinity:
+ *                     continue
+ */
+            __pyx_v_dik = (__pyx_v_Di[__pyx_v_k]);
+
+            /* "scipy/sparse/_graph_tools.pyx":326
+ *                 Di = D + i * N
+ *                 dik = Di[k]
+ *                 if dik == infinity:             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 Pi = P + i * N
+ */
+            __pyx_t_5 = (__pyx_v_dik == __pyx_v_5scipy_6sparse_12_graph_tools_infinity);
+            if (__pyx_t_5) {
+
+              /* "scipy/sparse/_graph_tools.pyx":327
+ *                 dik = Di[k]
+ *                 if dik == infinity:
+ *                     continue             # <<<<<<<<<<<<<<
+ *                 Pi = P + i * N
+ *                 for j in range(N):
+ */
+              goto __pyx_L26_continue;
+              goto __pyx_L28;
+            }
+            __pyx_L28:;
+
+            /* "scipy/sparse/_graph_tools.pyx":328
+ *                 if dik == infinity:
+ *                     continue
+ *                 Pi = P + i * N             # <<<<<<<<<<<<<<
+ *                 for j in range(N):
+ *                     d = dik + Dk[j]
+ */
+            __pyx_v_Pi = (__pyx_v_P + (__pyx_v_i * __pyx_v_N));
+
+            /* "scipy/sparse/_graph_tools.pyx":329
+ *                     continue
+ *                 Pi = P + i * N
+ *                 for j in range(N):             # <<<<<<<<<<<<<<
+ *                     d = dik + Dk[j]
+ *                     if d < Di[j]:
+ */
+            __pyx_t_6 = __pyx_v_N;
+            for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
+              __pyx_v_j = __pyx_t_7;
+
+              /* "scipy/sparse/_graph_tools.pyx":330
+ *                 Pi = P + i * N
+ *                 for j in range(N):
+ *                     d = dik + Dk[j]             # <<<<<<<<<<<<<<
+ *                     if d < Di[j]:
+ *                         Di[j] = d
+ */
+              __pyx_v_d = (__pyx_v_dik + (__pyx_v_Dk[__pyx_v_j]));
+
+              /* "scipy/sparse/_graph_tools.pyx":331
+ *                 for j in range(N):
+ *                     d = dik + Dk[j]
+ *                     if d < Di[j]:             # <<<<<<<<<<<<<<
+ *                         Di[j] = d
+ *                         Pi[j] = Pk[j]
+ */
+              __pyx_t_5 = (__pyx_v_d < (__pyx_v_Di[__pyx_v_j]));
+              if (__pyx_t_5) {
+
+                /* "scipy/sparse/_graph_tools.pyx":332
+ *                     d = dik + Dk[j]
+ *                     if d < Di[j]:
+ *                         Di[j] = d             # <<<<<<<<<<<<<<
+ *                         Pi[j] = Pk[j]
+ *         for i in range(N):
+ */
+                (__pyx_v_Di[__pyx_v_j]) = __pyx_v_d;
+
+                /* "scipy/sparse/_graph_tools.pyx":333
+ *                     if d < Di[j]:
+ *                         Di[j] = d
+ *                         Pi[j] = Pk[j]             # <<<<<<<<<<<<<<
+ *         for i in range(N):
+ *             if D[i * N + i] < 0:
+ */
+                (__pyx_v_Pi[__pyx_v_j]) = (__pyx_v_Pk[__pyx_v_j]);
+                goto __pyx_L31;
+              }
+              __pyx_L31:;
+            }
+            __pyx_L26_continue:;
+          }
+        }
+
+        /* "scipy/sparse/_graph_tools.pyx":334
+ *                         Di[j] = d
+ *                         Pi[j] = Pk[j]
+ *         for i in range(N):             # <<<<<<<<<<<<<<
+ *             if D[i * N + i] < 0:
+ *                 negative_cycle = 1
+ */
+        __pyx_t_1 = __pyx_v_N;
+        for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+          __pyx_v_i = __pyx_t_2;
+
+          /* "scipy/sparse/_graph_tools.pyx":335
+ *                         Pi[j] = Pk[j]
+ *         for i in range(N):
+ *             if D[i * N + i] < 0:             # <<<<<<<<<<<<<<
+ *                 negative_cycle = 1
+ *     return negative_cycle
+ */
+          __pyx_t_5 = ((__pyx_v_D[((__pyx_v_i * __pyx_v_N) + __pyx_v_i)]) < 0.0);
+          if (__pyx_t_5) {
+
+            /* "scipy/sparse/_graph_tools.pyx":336
+ *         for i in range(N):
+ *             if D[i * N + i] < 0:
+ *                 negative_cycle = 1             # <<<<<<<<<<<<<<
+ *     return negative_cycle
+ * 
+ */
+            __pyx_v_negative_cycle = 1;
+            goto __pyx_L34;
+          }
+          __pyx_L34:;
+        }
+      }
+
+      /* "scipy/sparse/_graph_tools.pyx":298
+ *     cdef int negative_cycle = 0
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(N * N):
+ *             D[i] = infinity
+ */
+      /*finally:*/ {
+        Py_BLOCK_THREADS
+      }
+  }
+
+  /* "scipy/sparse/_graph_tools.pyx":337
+ *             if D[i * N + i] < 0:
+ *                 negative_cycle = 1
+ *     return negative_cycle             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_8 = PyInt_FromLong(__pyx_v_negative_cycle); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_8);
+  __pyx_r = __pyx_t_8;
+  __pyx_t_8 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("scipy.sparse._graph_tools.floyd_warshall", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "scipy/sparse/_graph_tools.pyx":341
+ * 
+ * @cython.boundscheck(False)
+ * def breadth_first(np.ndarray Ap, np.ndarray Aj,             # <<<<<<<<<<<<<<
+ *                   np.ndarray Bp, np.ndarray Bj, int undirected,
+ *                   int start, np.ndarray order, np.ndarray pred):
+ */
+
+static PyObject *__pyx_pf_5scipy_6sparse_12_graph_tools_4breadth_first(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5scipy_6sparse_12_graph_tools_4breadth_first[] = "Breadth-first order from `start`.\n\n    `order` (length N) receives the visited nodes and `pred` the\n    predecessor of each node in the tree.  Returns the number of nodes\n    reached.\n    ";
+static PyMethodDef __pyx_mdef_5scipy_6sparse_12_graph_tools_4breadth_first = {__Pyx_NAMESTR("breadth_first"), (PyCFunction)__pyx_pf_5scipy_6sparse_12_graph_tools_4breadth_first, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_5scipy_6sparse_12_graph_tools_4breadth_first)};
+static PyObject *__pyx_pf_5scipy_6sparse_12_graph_tools_4breadth_first(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_Ap = 0;
+  PyArrayObject *__pyx_v_Aj = 0;
+  PyArrayObject *__pyx_v_Bp = 0;
+  PyArrayObject *__pyx_v_Bj = 0;
+  int __pyx_v_undirected;
+  int __pyx_v_start;
+  PyArrayObject *__pyx_v_order = 0;
+  PyArrayObject *__pyx_v_pred = 0;
+  int __pyx_v_N;
+  int *__pyx_v_ap;
+  int *__pyx_v_aj;
+  int *__pyx_v_bp;
+  int *__pyx_v_bj;
+  int *__pyx_v_o;
+  int *__pyx_v_p;
+  int __pyx_v_i;
+  int __pyx_v_j;
+  int __pyx_v_k;
+  int __pyx_v_head;
+  int __pyx_v_tail;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__Ap,&__pyx_n_s__Aj,&__pyx_n_s__Bp,&__pyx_n_s__Bj,&__pyx_n_s__undirected,&__pyx_n_s__start,&__pyx_n_s__order,&__pyx_n_s__pred,0};
+  __Pyx_RefNannySetupContext("breadth_first");
+  __pyx_self = __pyx_self;
+  {
+    PyObject* values[8] = {0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  0:
+        values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Ap);
+        if (likely(values[0])) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Aj);
+        if (likely(values[1])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("breadth_first", 1, 8, 8, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  2:
+        values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Bp);
+        if (likely(values[2])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("breadth_first", 1, 8, 8, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  3:
+        values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Bj);
+        if (likely(values[3])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("breadth_first", 1, 8, 8, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  4:
+        values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__undirected);
+        if (likely(values[4])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("breadth_first", 1, 8, 8, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  5:
+        values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__start);
+        if (likely(values[5])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("breadth_first", 1, 8, 8, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  6:
+        values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__order);
+        if (likely(values[6])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("breadth_first", 1, 8, 8, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  7:
+        values[7] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__pred);
+        if (likely(values[7])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("breadth_first", 1, 8, 8, 7); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "breadth_first") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 8) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+    }
+    __pyx_v_Ap = ((PyArrayObject *)values[0]);
+    __pyx_v_Aj = ((PyArrayObject *)values[1]);
+    __pyx_v_Bp = ((PyArrayObject *)values[2]);
+    __pyx_v_Bj = ((PyArrayObject *)values[3]);
+    __pyx_v_undirected = __Pyx_PyInt_AsInt(values[4]); if (unlikely((__pyx_v_undirected == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 342; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_start = __Pyx_PyInt_AsInt(values[5]); if (unlikely((__pyx_v_start == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 343; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_order = ((PyArrayObject *)values[6]);
+    __pyx_v_pred = ((PyArrayObject *)values[7]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("breadth_first", 1, 8, 8, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("scipy.sparse._graph_tools.breadth_first", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Ap), __pyx_ptype_5numpy_ndarray, 1, "Ap", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Aj), __pyx_ptype_5numpy_ndarray, 1, "Aj", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Bp), __pyx_ptype_5numpy_ndarray, 1, "Bp", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 342; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Bj), __pyx_ptype_5numpy_ndarray, 1, "Bj", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 342; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_order), __pyx_ptype_5numpy_ndarray, 1, "order", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 343; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_pred), __pyx_ptype_5numpy_ndarray, 1, "pred", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 343; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "scipy/sparse/_graph_tools.pyx":350
+ *     reached.
+ *     """
+ *     cdef int N = Ap.shape[0] - 1             # <<<<<<<<<<<<<<
+ *     cdef int* ap = <int*>Ap.data
+ *     cdef int* aj = <int*>Aj.data
+ */
+  __pyx_v_N = ((__pyx_v_Ap->dimensions[0]) - 1);
+
+  /* "scipy/sparse/_graph_tools.pyx":351
+ *     """
+ *     cdef int N = Ap.shape[0] - 1
+ *     cdef int* ap = <int*>Ap.data             # <<<<<<<<<<<<<<
+ *     cdef int* aj = <int*>Aj.data
+ *     cdef int* bp = <int*>Bp.data
+ */
+  __pyx_v_ap = ((int *)__pyx_v_Ap->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":352
+ *     cdef int N = Ap.shape[0] - 1
+ *     cdef int* ap = <int*>Ap.data
+ *     cdef int* aj = <int*>Aj.data             # <<<<<<<<<<<<<<
+ *     cdef int* bp = <int*>Bp.data
+ *     cdef int* bj = <int*>Bj.data
+ */
+  __pyx_v_aj = ((int *)__pyx_v_Aj->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":353
+ *     cdef int* ap = <int*>Ap.data
+ *     cdef int* aj = <int*>Aj.data
+ *     cdef int* bp = <int*>Bp.data             # <<<<<<<<<<<<<<
+ *     cdef int* bj = <int*>Bj.data
+ *     cdef int* o = <int*>order.data
+ */
+  __pyx_v_bp = ((int *)__pyx_v_Bp->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":354
+ *     cdef int* aj = <int*>Aj.data
+ *     cdef int* bp = <int*>Bp.data
+ *     cdef int* bj = <int*>Bj.data             # <<<<<<<<<<<<<<
+ *     cdef int* o = <int*>order.data
+ *     cdef int* p = <int*>pred.data
+ */
+  __pyx_v_bj = ((int *)__pyx_v_Bj->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":355
+ *     cdef int* bp = <int*>Bp.data
+ *     cdef int* bj = <int*>Bj.data
+ *     cdef int* o = <int*>order.data             # <<<<<<<<<<<<<<
+ *     cdef int* p = <int*>pred.data
+ *     cdef int i, j, k, head = 0, tail = 1
+ */
+  __pyx_v_o = ((int *)__pyx_v_order->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":356
+ *     cdef int* bj = <int*>Bj.data
+ *     cdef int* o = <int*>order.data
+ *     cdef int* p = <int*>pred.data             # <<<<<<<<<<<<<<
+ *     cdef int i, j, k, head = 0, tail = 1
+ * 
+ */
+  __pyx_v_p = ((int *)__pyx_v_pred->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":357
+ *     cdef int* o = <int*>order.data
+ *     cdef int* p = <int*>pred.data
+ *     cdef int i, j, k, head = 0, tail = 1             # <<<<<<<<<<<<<<
+ * 
+ *     with nogil:
+ */
+  __pyx_v_head = 0;
+  __pyx_v_tail = 1;
+
+  /* "scipy/sparse/_graph_tools.pyx":359
+ *     cdef int i, j, k, head = 0, tail = 1
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(N):
+ *             p[i] = NO_PRED
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save = NULL;
+      #endif
+      Py_UNBLOCK_THREADS
+      /*try:*/ {
+
+        /* "scipy/sparse/_graph_tools.pyx":360
+ * 
+ *     with nogil:
+ *         for i in range(N):             # <<<<<<<<<<<<<<
+ *             p[i] = NO_PRED
+ *         # pred doubles as the visited flag; the root points to itself
+ */
+        __pyx_t_1 = __pyx_v_N;
+        for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+          __pyx_v_i = __pyx_t_2;
+
+          /* "scipy/sparse/_graph_tools.pyx":361
+ *     with nogil:
+ *         for i in range(N):
+ *             p[i] = NO_PRED             # <<<<<<<<<<<<<<
+ *         # pred doubles as the visited flag; the root points to itself
+ *         # until the traversal is done
+ */
+          (__pyx_v_p[__pyx_v_i]) = __pyx_v_5scipy_6sparse_12_graph_tools_NO_PRED;
+        }
+
+        /* "scipy/sparse/_graph_tools.pyx":364
+ *         # pred doubles as the visited flag; the root points to itself
+ *         # until the traversal is done
+ *         o[0] = start             # <<<<<<<<<<<<<<
+ *         p[start] = start
+ *         while head < tail:
+ */
+        (__pyx_v_o[0]) = __pyx_v_start;
+
+        /* "scipy/sparse/_graph_tools.pyx":365
+ *         # until the traversal is done
+ *         o[0] = start
+ *         p[start] = start             # <<<<<<<<<<<<<<
+ *         while head < tail:
+ *             i = o[head]
+ */
+        (__pyx_v_p[__pyx_v_start]) = __pyx_v_start;
+
+        /* "scipy/sparse/_graph_tools.pyx":366
+ *         o[0] = start
+ *         p[start] = start
+ *         while head < tail:             # <<<<<<<<<<<<<<
+ *             i = o[head]
+ *             head += 1
+ */
+        while (1) {
+          __pyx_t_3 = (__pyx_v_head < __pyx_v_tail);
+          if (!__pyx_t_3) break;
+
+          /* "scipy/sparse/_graph_tools.pyx":367
+ *         p[start] = start
+ *         while head < tail:
+ *             i = o[head]             # <<<<<<<<<<<<<<
+ *             head += 1
+ *             for k in range(ap[i], ap[i + 1]):
+ */
+          __pyx_v_i = (__pyx_v_o[__pyx_v_head]);
+
+          /* "scipy/sparse/_graph_tools.pyx":368
+ *         while head < tail:
+ *             i = o[head]
+ *             head += 1             # <<<<<<<<<<<<<<
+ *             for k in range(ap[i], ap[i + 1]):
+ *                 j = aj[k]
+ */
+          __pyx_v_head = (__pyx_v_head + 1);
+
+          /* "scipy/sparse/_graph_tools.pyx":369
+ *             i = o[head]
+ *             head += 1
+ *             for k in range(ap[i], ap[i + 1]):             # <<<<<<<<<<<<<<
+ *                 j = aj[k]
+ *                 if p[j] == NO_PRED:
+ */
+          __pyx_t_1 = (__pyx_v_ap[(__pyx_v_i + 1)]);
+          for (__pyx_t_2 = (__pyx_v_ap[__pyx_v_i]); __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+            __pyx_v_k = __pyx_t_2;
+
+            /* "scipy/sparse/_graph_tools.pyx":370
+ *             head += 1
+ *             for k in range(ap[i], ap[i + 1]):
+ *                 j = aj[k]             # <<<<<<<<<<<<<<
+ *                 if p[j] == NO_PRED:
+ *                     p[j] = i
+ */
+            __pyx_v_j = (__pyx_v_aj[__pyx_v_k]);
+
+            /* "scipy/sparse/_graph_tools.pyx":371
+ *             for k in range(ap[i], ap[i + 1]):
+ *                 j = aj[k]
+ *                 if p[j] == NO_PRED:             # <<<<<<<<<<<<<<
+ *                     p[j] = i
+ *                     o[tail] = j
+ */
+            __pyx_t_3 = ((__pyx_v_p[__pyx_v_j]) == __pyx_v_5scipy_6sparse_12_graph_tools_NO_PRED);
+            if (__pyx_t_3) {
+
+              /* "scipy/sparse/_graph_tools.pyx":372
+ *                 j = aj[k]
+ *                 if p[j] == NO_PRED:
+ *                     p[j] = i             # <<<<<<<<<<<<<<
+ *                     o[tail] = j
+ *                     tail += 1
+ */
+              (__pyx_v_p[__pyx_v_j]) = __pyx_v_i;
+
+              /* "scipy/sparse/_graph_tools.pyx":373
+ *                 if p[j] == NO_PRED:
+ *                     p[j] = i
+ *                     o[tail] = j             # <<<<<<<<<<<<<<
+ *                     tail += 1
+ *             if undirected:
+ */
+              (__pyx_v_o[__pyx_v_tail]) = __pyx_v_j;
+
+              /* "scipy/sparse/_graph_tools.pyx":374
+ *                     p[j] = i
+ *                     o[tail] = j
+ *                     tail += 1             # <<<<<<<<<<<<<<
+ *             if undirected:
+ *                 for k in range(bp[i], bp[i + 1]):
+ */
+              __pyx_v_tail = (__pyx_v_tail + 1);
+              goto __pyx_L15;
+            }
+            __pyx_L15:;
+          }
+
+          /* "scipy/sparse/_graph_tools.pyx":375
+ *                     o[tail] = j
+ *                     tail += 1
+ *             if undirected:             # <<<<<<<<<<<<<<
+ *                 for k in range(bp[i], bp[i + 1]):
+ *                     j = bj[k]
+ */
+          if (__pyx_v_undirected) {
+
+            /* "scipy/sparse/_graph_tools.pyx":376
+ *                     tail += 1
+ *             if undirected:
+ *                 for k in range(bp[i], bp[i + 1]):             # <<<<<<<<<<<<<<
+ *                     j = bj[k]
+ *                     if p[j] == NO_PRED:
+ */
+            __pyx_t_1 = (__pyx_v_bp[(__pyx_v_i + 1)]);
+            for (__pyx_t_2 = (__pyx_v_bp[__pyx_v_i]); __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+              __pyx_v_k = __pyx_t_2;
+
+              /* "scipy/sparse/_graph_tools.pyx":377
+ *             if undirected:
+ *                 for k in range(bp[i], bp[i + 1]):
+ *                     j = bj[k]             # <<<<<<<<<<<<<<
+ *                     if p[j] == NO_PRED:
+ *                         p[j] = i
+ */
+              __pyx_v_j = (__pyx_v_bj[__pyx_v_k]);
+
+              /* "scipy/sparse/_graph_tools.pyx":378
+ *                 for k in range(bp[i], bp[i + 1]):
+ *                     j = bj[k]
+ *                     if p[j] == NO_PRED:             # <<<<<<<<<<<<<<
+ *                         p[j] = i
+ *                         o[tail] = j
+ */
+              __pyx_t_3 = ((__pyx_v_p[__pyx_v_j]) == __pyx_v_5scipy_6sparse_12_graph_tools_NO_PRED);
+              if (__pyx_t_3) {
+
+                /* "scipy/sparse/_graph_tools.pyx":379
+ *                     j = bj[k]
+ *                     if p[j] == NO_PRED:
+ *                         p[j] = i             # <<<<<<<<<<<<<<
+ *                         o[tail] = j
+ *                         tail += 1
+ */
+                (__pyx_v_p[__pyx_v_j]) = __pyx_v_i;
+
+                /* "scipy/sparse/_graph_tools.pyx":380
+ *                     if p[j] == NO_PRED:
+ *                         p[j] = i
+ *                         o[tail] = j             # <<<<<<<<<<<<<<
+ *                         tail += 1
+ *         p[start] = NO_PRED
+ */
+                (__pyx_v_o[__pyx_v_tail]) = __pyx_v_j;
+
+                /* "scipy/sparse/_graph_tools.pyx":381
+ *                         p[j] = i
+ *                         o[tail] = j
+ *                         tail += 1             # <<<<<<<<<<<<<<
+ *         p[start] = NO_PRED
+ *     return tail
+ */
+                __pyx_v_tail = (__pyx_v_tail + 1);
+                goto __pyx_L19;
+              }
+              __pyx_L19:;
+            }
+            goto __pyx_L16;
+          }
+          __pyx_L16:;
+        }
+
+        /* "scipy/sparse/_graph_tools.pyx":382
+ *                         o[tail] = j
+ *                         tail += 1
+ *         p[start] = NO_PRED             # <<<<<<<<<<<<<<
+ *     return tail
+ * 
+ */
+        (__pyx_v_p[__pyx_v_start]) = __pyx_v_5scipy_6sparse_12_graph_tools_NO_PRED;
+      }
+
+      /* "scipy/sparse/_graph_tools.pyx":359
+ *     cdef int i, j, k, head = 0, tail = 1
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(N):
+ *             p[i] = NO_PRED
+ */
+      /*finally:*/ {
+        Py_BLOCK_THREADS
+      }
+  }
+
+  /* "scipy/sparse/_graph_tools.pyx":383
+ *                         tail += 1
+ *         p[start] = NO_PRED
+ *     return tail             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_4 = PyInt_FromLong(__pyx_v_tail); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 383; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("scipy.sparse._graph_tools.breadth_first", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "scipy/sparse/_graph_tools.pyx":387
+ * 
+ * @cython.boundscheck(False)
+ * def depth_first(np.ndarray Ap, np.ndarray Aj,             # <<<<<<<<<<<<<<
+ *                 np.ndarray Bp, np.ndarray Bj, int undirected,
+ *                 int start, np.ndarray order, np.ndarray pred):
+ */
+
+static PyObject *__pyx_pf_5scipy_6sparse_12_graph_tools_5depth_first(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5scipy_6sparse_12_graph_tools_5depth_first[] = "Depth-first (preorder) from `start`; same layout as\n    `breadth_first`.";
+static PyMethodDef __pyx_mdef_5scipy_6sparse_12_graph_tools_5depth_first = {__Pyx_NAMESTR("depth_first"), (PyCFunction)__pyx_pf_5scipy_6sparse_12_graph_tools_5depth_first, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_5scipy_6sparse_12_graph_tools_5depth_first)};
+static PyObject *__pyx_pf_5scipy_6sparse_12_graph_tools_5depth_first(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_Ap = 0;
+  PyArrayObject *__pyx_v_Aj = 0;
+  PyArrayObject *__pyx_v_Bp = 0;
+  PyArrayObject *__pyx_v_Bj = 0;
+  int __pyx_v_undirected;
+  int __pyx_v_start;
+  PyArrayObject *__pyx_v_order = 0;
+  PyArrayObject *__pyx_v_pred = 0;
+  int __pyx_v_N;
+  int *__pyx_v_ap;
+  int *__pyx_v_aj;
+  int *__pyx_v_bp;
+  int *__pyx_v_bj;
+  int *__pyx_v_o;
+  int *__pyx_v_p;
+  int __pyx_v_i;
+  int __pyx_v_j;
+  int __pyx_v_k;
+  int __pyx_v_deg;
+  int __pyx_v_top;
+  int __pyx_v_n_order;
+  int *__pyx_v_stack;
+  int *__pyx_v_cursor;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__Ap,&__pyx_n_s__Aj,&__pyx_n_s__Bp,&__pyx_n_s__Bj,&__pyx_n_s__undirected,&__pyx_n_s__start,&__pyx_n_s__order,&__pyx_n_s__pred,0};
+  __Pyx_RefNannySetupContext("depth_first");
+  __pyx_self = __pyx_self;
+  {
+    PyObject* values[8] = {0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  0:
+        values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Ap);
+        if (likely(values[0])) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Aj);
+        if (likely(values[1])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("depth_first", 1, 8, 8, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 387; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  2:
+        values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Bp);
+        if (likely(values[2])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("depth_first", 1, 8, 8, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 387; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  3:
+        values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Bj);
+        if (likely(values[3])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("depth_first", 1, 8, 8, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 387; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  4:
+        values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__undirected);
+        if (likely(values[4])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("depth_first", 1, 8, 8, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 387; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  5:
+        values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__start);
+        if (likely(values[5])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("depth_first", 1, 8, 8, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 387; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  6:
+        values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__order);
+        if (likely(values[6])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("depth_first", 1, 8, 8, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 387; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  7:
+        values[7] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__pred);
+        if (likely(values[7])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("depth_first", 1, 8, 8, 7); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 387; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "depth_first") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 387; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 8) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+    }
+    __pyx_v_Ap = ((PyArrayObject *)values[0]);
+    __pyx_v_Aj = ((PyArrayObject *)values[1]);
+    __pyx_v_Bp = ((PyArrayObject *)values[2]);
+    __pyx_v_Bj = ((PyArrayObject *)values[3]);
+    __pyx_v_undirected = __Pyx_PyInt_AsInt(values[4]); if (unlikely((__pyx_v_undirected == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 388; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_start = __Pyx_PyInt_AsInt(values[5]); if (unlikely((__pyx_v_start == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 389; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_order = ((PyArrayObject *)values[6]);
+    __pyx_v_pred = ((PyArrayObject *)values[7]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("depth_first", 1, 8, 8, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 387; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("scipy.sparse._graph_tools.depth_first", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Ap), __pyx_ptype_5numpy_ndarray, 1, "Ap", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 387; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Aj), __pyx_ptype_5numpy_ndarray, 1, "Aj", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 387; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Bp), __pyx_ptype_5numpy_ndarray, 1, "Bp", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 388; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Bj), __pyx_ptype_5numpy_ndarray, 1, "Bj", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 388; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_order), __pyx_ptype_5numpy_ndarray, 1, "order", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 389; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_pred), __pyx_ptype_5numpy_ndarray, 1, "pred", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 389; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "scipy/sparse/_graph_tools.pyx":392
+ *     """Depth-first (preorder) from `start`; same layout as
+ *     `breadth_first`."""
+ *     cdef int N = Ap.shape[0] - 1             # <<<<<<<<<<<<<<
+ *     cdef int* ap = <int*>Ap.data
+ *     cdef int* aj = <int*>Aj.data
+ */
+  __pyx_v_N = ((__pyx_v_Ap->dimensions[0]) - 1);
+
+  /* "scipy/sparse/_graph_tools.pyx":393
+ *     `breadth_first`."""
+ *     cdef int N = Ap.shape[0] - 1
+ *     cdef int* ap = <int*>Ap.data             # <<<<<<<<<<<<<<
+ *     cdef int* aj = <int*>Aj.data
+ *     cdef int* bp = <int*>Bp.data
+ */
+  __pyx_v_ap = ((int *)__pyx_v_Ap->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":394
+ *     cdef int N = Ap.shape[0] - 1
+ *     cdef int* ap = <int*>Ap.data
+ *     cdef int* aj = <int*>Aj.data             # <<<<<<<<<<<<<<
+ *     cdef int* bp = <int*>Bp.data
+ *     cdef int* bj = <int*>Bj.data
+ */
+  __pyx_v_aj = ((int *)__pyx_v_Aj->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":395
+ *     cdef int* ap = <int*>Ap.data
+ *     cdef int* aj = <int*>Aj.data
+ *     cdef int* bp = <int*>Bp.data             # <<<<<<<<<<<<<<
+ *     cdef int* bj = <int*>Bj.data
+ *     cdef int* o = <int*>order.data
+ */
+  __pyx_v_bp = ((int *)__pyx_v_Bp->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":396
+ *     cdef int* aj = <int*>Aj.data
+ *     cdef int* bp = <int*>Bp.data
+ *     cdef int* bj = <int*>Bj.data             # <<<<<<<<<<<<<<
+ *     cdef int* o = <int*>order.data
+ *     cdef int* p = <int*>pred.data
+ */
+  __pyx_v_bj = ((int *)__pyx_v_Bj->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":397
+ *     cdef int* bp = <int*>Bp.data
+ *     cdef int* bj = <int*>Bj.data
+ *     cdef int* o = <int*>order.data             # <<<<<<<<<<<<<<
+ *     cdef int* p = <int*>pred.data
+ *     cdef int i, j, k, deg, top = 0, n_order = 1
+ */
+  __pyx_v_o = ((int *)__pyx_v_order->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":398
+ *     cdef int* bj = <int*>Bj.data
+ *     cdef int* o = <int*>order.data
+ *     cdef int* p = <int*>pred.data             # <<<<<<<<<<<<<<
+ *     cdef int i, j, k, deg, top = 0, n_order = 1
+ *     cdef int* stack = <int*>malloc((N + 1) * sizeof(int))
+ */
+  __pyx_v_p = ((int *)__pyx_v_pred->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":399
+ *     cdef int* o = <int*>order.data
+ *     cdef int* p = <int*>pred.data
+ *     cdef int i, j, k, deg, top = 0, n_order = 1             # <<<<<<<<<<<<<<
+ *     cdef int* stack = <int*>malloc((N + 1) * sizeof(int))
+ *     cdef int* cursor = <int*>malloc((N + 1) * sizeof(int))
+ */
+  __pyx_v_top = 0;
+  __pyx_v_n_order = 1;
+
+  /* "scipy/sparse/_graph_tools.pyx":400
+ *     cdef int* p = <int*>pred.data
+ *     cdef int i, j, k, deg, top = 0, n_order = 1
+ *     cdef int* stack = <int*>malloc((N + 1) * sizeof(int))             # <<<<<<<<<<<<<<
+ *     cdef int* cursor = <int*>malloc((N + 1) * sizeof(int))
+ * 
+ */
+  __pyx_v_stack = ((int *)malloc(((__pyx_v_N + 1) * (sizeof(int)))));
+
+  /* "scipy/sparse/_graph_tools.pyx":401
+ *     cdef int i, j, k, deg, top = 0, n_order = 1
+ *     cdef int* stack = <int*>malloc((N + 1) * sizeof(int))
+ *     cdef int* cursor = <int*>malloc((N + 1) * sizeof(int))             # <<<<<<<<<<<<<<
+ * 
+ *     if stack == NULL or cursor == NULL:
+ */
+  __pyx_v_cursor = ((int *)malloc(((__pyx_v_N + 1) * (sizeof(int)))));
+
+  /* "scipy/sparse/_graph_tools.pyx":403
+ *     cdef int* cursor = <int*>malloc((N + 1) * sizeof(int))
+ * 
+ *     if stack == NULL or cursor == NULL:             # <<<<<<<<<<<<<<
+ *         free(stack)
+ *         free(cursor)
+ */
+  __pyx_t_1 = (__pyx_v_stack == NULL);
+  if (!__pyx_t_1) {
+    __pyx_t_2 = (__pyx_v_cursor == NULL);
+    __pyx_t_3 = __pyx_t_2;
+  } else {
+    __pyx_t_3 = __pyx_t_1;
+  }
+  if (__pyx_t_3) {
+
+    /* "scipy/sparse/_graph_tools.pyx":404
+ * 
+ *     if stack == NULL or cursor == NULL:
+ *         free(stack)             # <<<<<<<<<<<<<<
+ *         free(cursor)
+ *         raise MemoryError()
+ */
+    free(__pyx_v_stack);
+
+    /* "scipy/sparse/_graph_tools.pyx":405
+ *     if stack == NULL or cursor == NULL:
+ *         free(stack)
+ *         free(cursor)             # <<<<<<<<<<<<<<
+ *         raise MemoryError()
+ * 
+ */
+    free(__pyx_v_cursor);
+
+    /* "scipy/sparse/_graph_tools.pyx":406
+ *         free(stack)
+ *         free(cursor)
+ *         raise MemoryError()             # <<<<<<<<<<<<<<
+ * 
+ *     with nogil:
+ */
+    PyErr_NoMemory(); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 406; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "scipy/sparse/_graph_tools.pyx":408
+ *         raise MemoryError()
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(N):
+ *             p[i] = NO_PRED
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save = NULL;
+      #endif
+      Py_UNBLOCK_THREADS
+      /*try:*/ {
+
+        /* "scipy/sparse/_graph_tools.pyx":409
+ * 
+ *     with nogil:
+ *         for i in range(N):             # <<<<<<<<<<<<<<
+ *             p[i] = NO_PRED
+ *         o[0] = start
+ */
+        __pyx_t_4 = __pyx_v_N;
+        for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+          __pyx_v_i = __pyx_t_5;
+
+          /* "scipy/sparse/_graph_tools.pyx":410
+ *     with nogil:
+ *         for i in range(N):
+ *             p[i] = NO_PRED             # <<<<<<<<<<<<<<
+ *         o[0] = start
+ *         p[start] = start
+ */
+          (__pyx_v_p[__pyx_v_i]) = __pyx_v_5scipy_6sparse_12_graph_tools_NO_PRED;
+        }
+
+        /* "scipy/sparse/_graph_tools.pyx":411
+ *         for i in range(N):
+ *             p[i] = NO_PRED
+ *         o[0] = start             # <<<<<<<<<<<<<<
+ *         p[start] = start
+ *         stack[0] = start
+ */
+        (__pyx_v_o[0]) = __pyx_v_start;
+
+        /* "scipy/sparse/_graph_tools.pyx":412
+ *             p[i] = NO_PRED
+ *         o[0] = start
+ *         p[start] = start             # <<<<<<<<<<<<<<
+ *         stack[0] = start
+ *         cursor[start] = 0
+ */
+        (__pyx_v_p[__pyx_v_start]) = __pyx_v_start;
+
+        /* "scipy/sparse/_graph_tools.pyx":413
+ *         o[0] = start
+ *         p[start] = start
+ *         stack[0] = start             # <<<<<<<<<<<<<<
+ *         cursor[start] = 0
+ *         while top >= 0:
+ */
+        (__pyx_v_stack[0]) = __pyx_v_start;
+
+        /* "scipy/sparse/_graph_tools.pyx":414
+ *         p[start] = start
+ *         stack[0] = start
+ *         cursor[start] = 0             # <<<<<<<<<<<<<<
+ *         while top >= 0:
+ *             i = stack[top]
+ */
+        (__pyx_v_cursor[__pyx_v_start]) = 0;
+
+        /* "scipy/sparse/_graph_tools.pyx":415
+ *         stack[0] = start
+ *         cursor[start] = 0
+ *         while top >= 0:             # <<<<<<<<<<<<<<
+ *             i = stack[top]
+ *             # cursor[i] walks the row of A and then, for undirected
+ */
+        while (1) {
+          __pyx_t_3 = (__pyx_v_top >= 0);
+          if (!__pyx_t_3) break;
+
+          /* "scipy/sparse/_graph_tools.pyx":416
+ *         cursor[start] = 0
+ *         while top >= 0:
+ *             i = stack[top]             # <<<<<<<<<<<<<<
+ *             # cursor[i] walks the row of A and then, for undirected
+ *             # graphs, the row of its transpose
+ */
+          __pyx_v_i = (__pyx_v_stack[__pyx_v_top]);
+
+          /* "scipy/sparse/_graph_tools.pyx":419
+ *             # cursor[i] walks the row of A and then, for undirected
+ *             # graphs, the row of its transpose
+ *             deg = ap[i + 1] - ap[i]             # <<<<<<<<<<<<<<
+ *             j = -1
+ *             while j < 0:
+ */
+          __pyx_v_deg = ((__pyx_v_ap[(__pyx_v_i + 1)]) - (__pyx_v_ap[__pyx_v_i]));
+
+          /* "scipy/sparse/_graph_tools.pyx":420
+ *             # graphs, the row of its transpose
+ *             deg = ap[i + 1] - ap[i]
+ *             j = -1             # <<<<<<<<<<<<<<
+ *             while j < 0:
+ *                 k = cursor[i]
+ */
+          __pyx_v_j = -1;
+
+          /* "scipy/sparse/_graph_tools.pyx":421
+ *             deg = ap[i + 1] - ap[i]
+ *             j = -1
+ *             while j < 0:             # <<<<<<<<<<<<<<
+ *                 k = cursor[i]
+ *                 if k < deg:
+ */
+          while (1) {
+            __pyx_t_3 = (__pyx_v_j < 0);
+            if (!__pyx_t_3) break;
+
+            /* "scipy/sparse/_graph_tools.pyx":422
+ *             j = -1
+ *             while j < 0:
+ *                 k = cursor[i]             # <<<<<<<<<<<<<<
+ *                 if k < deg:
+ *                     j = aj[ap[i] + k]
+ */
+            __pyx_v_k = (__pyx_v_cursor[__pyx_v_i]);
+
+            /* "scipy/sparse/_graph_tools.pyx":423
+ *             while j < 0:
+ *                 k = cursor[i]
+ *                 if k < deg:             # <<<<<<<<<<<<<<
+ *                     j = aj[ap[i] + k]
+ *                 elif undirected and k < deg + bp[i + 1] - bp[i]:
+ */
+            __pyx_t_3 = (__pyx_v_k < __pyx_v_deg);
+            if (__pyx_t_3) {
+
+              /* "scipy/sparse/_graph_tools.pyx":424
+ *                 k = cursor[i]
+ *                 if k < deg:
+ *                     j = aj[ap[i] + k]             # <<<<<<<<<<<<<<
+ *                 elif undirected and k < deg + bp[i + 1] - bp[i]:
+ *                     j = bj[bp[i] + k - deg]
+ */
+              __pyx_v_j = (__pyx_v_aj[((__pyx_v_ap[__pyx_v_i]) + __pyx_v_k)]);
+              goto __pyx_L16;
+            }
+
+            /* "scipy/sparse/_graph_tools.pyx":425
+ *                 if k < deg:
+ *                     j = aj[ap[i] + k]
+ *                 elif undirected and k < deg + bp[i + 1] - bp[i]:             # <<<<<<<<<<<<<<
+ *                     j = bj[bp[i] + k - deg]
+ *                 else:
+ */
+            if (__pyx_v_undirected) {
+              __pyx_t_3 = (__pyx_v_k < ((__pyx_v_deg + (__pyx_v_bp[(__pyx_v_i + 1)])) - (__pyx_v_bp[__pyx_v_i])));
+              __pyx_t_1 = __pyx_t_3;
+            } else {
+              __pyx_t_1 = __pyx_v_undirected;
+            }
+            if (__pyx_t_1) {
+
+              /* "scipy/sparse/_graph_tools.pyx":426
+ *                     j = aj[ap[i] + k]
+ *                 elif undirected and k < deg + bp[i + 1] - bp[i]:
+ *                     j = bj[bp[i] + k - deg]             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     break
+ */
+              __pyx_v_j = (__pyx_v_bj[(((__pyx_v_bp[__pyx_v_i]) + __pyx_v_k) - __pyx_v_deg)]);
+              goto __pyx_L16;
+            }
+            /*else*/ {
+
+              /* "scipy/sparse/_graph_tools.pyx":428
+ *                     j = bj[bp[i] + k - deg]
+ *                 else:
+ *                     break             # <<<<<<<<<<<<<<
+ *                 cursor[i] = k + 1
+ *                 if p[j] != NO_PRED:
+ */
+              goto __pyx_L15_break;
+            }
+            __pyx_L16:;
+
+            /* "scipy/sparse/_graph_tools.pyx":429
+ *                 else:
+ *                     break
+ *                 cursor[i] = k + 1             # <<<<<<<<<<<<<<
+ *                 if p[j] != NO_PRED:
+ *                     j = -1
+ */
+            (__pyx_v_cursor[__pyx_v_i]) = (__pyx_v_k + 1);
+
+            /* "scipy/sparse/_graph_tools.pyx":430
+ *                     break
+ *                 cursor[i] = k + 1
+ *                 if p[j] != NO_PRED:             # <<<<<<<<<<<<<<
+ *                     j = -1
+ *             if j < 0:
+ */
+            __pyx_t_1 = ((__pyx_v_p[__pyx_v_j]) != __pyx_v_5scipy_6sparse_12_graph_tools_NO_PRED);
+            if (__pyx_t_1) {
+
+              /* "scipy/sparse/_graph_tools.pyx":431
+ *                 cursor[i] = k + 1
+ *                 if p[j] != NO_PRED:
+ *                     j = -1             # <<<<<<<<<<<<<<
+ *             if j < 0:
+ *                 top -= 1
+ */
+              __pyx_v_j = -1;
+              goto __pyx_L17;
+            }
+            __pyx_L17:;
+          }
+          __pyx_L15_break:;
+
+          /* "scipy/sparse/_graph_tools.pyx":432
+ *                 if p[j] != NO_PRED:
+ *                     j = -1
+ *             if j < 0:             # <<<<<<<<<<<<<<
+ *                 top -= 1
+ *                 continue
+ */
+          __pyx_t_1 = (__pyx_v_j < 0);
+          if (__pyx_t_1) {
+
+            /* "scipy/sparse/_graph_tools.pyx":433
+ *                     j = -1
+ *             if j < 0:
+ *                 top -= 1             # <<<<<<<<<<<<<<
+ *                 continue
+ *             p[j] = i
+ */
+            __pyx_v_top = (__pyx_v_top - 1);
+
+            /* "scipy/sparse/_graph_tools.pyx":434
+ *             if j < 0:
+ *                 top -= 1
+ *                 continue             # <<<<<<<<<<<<<<
+ *             p[j] = i
+ *             o[n_order] = j
+ */
+            goto __pyx_L12_continue;
+            goto __pyx_L18;
+          }
+          __pyx_L18:;
+
+          /* "scipy/sparse/_graph_tools.pyx":435
+ *                 top -= 1
+ *                 continue
+ *             p[j] = i             # <<<<<<<<<<<<<<
+ *             o[n_order] = j
+ *             n_order += 1
+ */
+          (__pyx_v_p[__pyx_v_j]) = __pyx_v_i;
+
+          /* "scipy/sparse/_graph_tools.pyx":436
+ *                 continue
+ *             p[j] = i
+ *             o[n_order] = j             # <<<<<<<<<<<<<<
+ *             n_order += 1
+ *             top += 1
+ */
+          (__pyx_v_o[__pyx_v_n_order]) = __pyx_v_j;
+
+          /* "scipy/sparse/_graph_tools.pyx":437
+ *             p[j] = i
+ *             o[n_order] = j
+ *             n_order += 1             # <<<<<<<<<<<<<<
+ *             top += 1
+ *             stack[top] = j
+ */
+          __pyx_v_n_order = (__pyx_v_n_order + 1);
+
+          /* "scipy/sparse/_graph_tools.pyx":438
+ *             o[n_order] = j
+ *             n_order += 1
+ *             top += 1             # <<<<<<<<<<<<<<
+ *             stack[top] = j
+ *             cursor[j] = 0
+ */
+          __pyx_v_top = (__pyx_v_top + 1);
+
+          /* "scipy/sparse/_graph_tools.pyx":439
+ *             n_order += 1
+ *             top += 1
+ *             stack[top] = j             # <<<<<<<<<<<<<<
+ *             cursor[j] = 0
+ *         p[start] = NO_PRED
+ */
+          (__pyx_v_stack[__pyx_v_top]) = __pyx_v_j;
+
+          /* "scipy/sparse/_graph_tools.pyx":440
+ *             top += 1
+ *             stack[top] = j
+ *             cursor[j] = 0             # <<<<<<<<<<<<<<
+ *         p[start] = NO_PRED
+ * 
+ */
+          (__pyx_v_cursor[__pyx_v_j]) = 0;
+          __pyx_L12_continue:;
+        }
+
+        /* "scipy/sparse/_graph_tools.pyx":441
+ *             stack[top] = j
+ *             cursor[j] = 0
+ *         p[start] = NO_PRED             # <<<<<<<<<<<<<<
+ * 
+ *     free(stack)
+ */
+        (__pyx_v_p[__pyx_v_start]) = __pyx_v_5scipy_6sparse_12_graph_tools_NO_PRED;
+      }
+
+      /* "scipy/sparse/_graph_tools.pyx":408
+ *         raise MemoryError()
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(N):
+ *             p[i] = NO_PRED
+ */
+      /*finally:*/ {
+        Py_BLOCK_THREADS
+      }
+  }
+
+  /* "scipy/sparse/_graph_tools.pyx":443
+ *         p[start] = NO_PRED
+ * 
+ *     free(stack)             # <<<<<<<<<<<<<<
+ *     free(cursor)
+ *     return n_order
+ */
+  free(__pyx_v_stack);
+
+  /* "scipy/sparse/_graph_tools.pyx":444
+ * 
+ *     free(stack)
+ *     free(cursor)             # <<<<<<<<<<<<<<
+ *     return n_order
+ * 
+ */
+  free(__pyx_v_cursor);
+
+  /* "scipy/sparse/_graph_tools.pyx":445
+ *     free(stack)
+ *     free(cursor)
+ *     return n_order             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_6 = PyInt_FromLong(__pyx_v_n_order); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 445; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_r = __pyx_t_6;
+  __pyx_t_6 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("scipy.sparse._graph_tools.depth_first", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "scipy/sparse/_graph_tools.pyx":448
+ * 
+ * 
+ * cdef inline int _find(int* parent, int i) nogil:             # <<<<<<<<<<<<<<
+ *     cdef int root = i, nxt
+ *     while parent[root] != root:
+ */
+
+static CYTHON_INLINE int __pyx_f_5scipy_6sparse_12_graph_tools__find(int *__pyx_v_parent, int __pyx_v_i) {
+  int __pyx_v_root;
+  int __pyx_v_nxt;
+  int __pyx_r;
+  int __pyx_t_1;
+
+  /* "scipy/sparse/_graph_tools.pyx":449
+ * 
+ * cdef inline int _find(int* parent, int i) nogil:
+ *     cdef int root = i, nxt             # <<<<<<<<<<<<<<
+ *     while parent[root] != root:
+ *         root = parent[root]
+ */
+  __pyx_v_root = __pyx_v_i;
+
+  /* "scipy/sparse/_graph_tools.pyx":450
+ * cdef inline int _find(int* parent, int i) nogil:
+ *     cdef int root = i, nxt
+ *     while parent[root] != root:             # <<<<<<<<<<<<<<
+ *         root = parent[root]
+ *     # path compression
+ */
+  while (1) {
+    __pyx_t_1 = ((__pyx_v_parent[__pyx_v_root]) != __pyx_v_root);
+    if (!__pyx_t_1) break;
+
+    /* "scipy/sparse/_graph_tools.pyx":451
+ *     cdef int root = i, nxt
+ *     while parent[root] != root:
+ *         root = parent[root]             # <<<<<<<<<<<<<<
+ *     # path compression
+ *     while parent[i] != root:
+ */
+    __pyx_v_root = (__pyx_v_parent[__pyx_v_root]);
+  }
+
+  /* "scipy/sparse/_graph_tools.pyx":453
+ *         root = parent[root]
+ *     # path compression
+ *     while parent[i] != root:             # <<<<<<<<<<<<<<
+ *         nxt = parent[i]
+ *         parent[i] = root
+ */
+  while (1) {
+    __pyx_t_1 = ((__pyx_v_parent[__pyx_v_i]) != __pyx_v_root);
+    if (!__pyx_t_1) break;
+
+    /* "scipy/sparse/_graph_tools.pyx":454
+ *     # path compression
+ *     while parent[i] != root:
+ *         nxt = parent[i]             # <<<<<<<<<<<<<<
+ *         parent[i] = root
+ *         i = nxt
+ */
+    __pyx_v_nxt = (__pyx_v_parent[__pyx_v_i]);
+
+    /* "scipy/sparse/_graph_tools.pyx":455
+ *     while parent[i] != root:
+ *         nxt = parent[i]
+ *         parent[i] = root             # <<<<<<<<<<<<<<
+ *         i = nxt
+ *     return root
+ */
+    (__pyx_v_parent[__pyx_v_i]) = __pyx_v_root;
+
+    /* "scipy/sparse/_graph_tools.pyx":456
+ *         nxt = parent[i]
+ *         parent[i] = root
+ *         i = nxt             # <<<<<<<<<<<<<<
+ *     return root
+ * 
+ */
+    __pyx_v_i = __pyx_v_nxt;
+  }
+
+  /* "scipy/sparse/_graph_tools.pyx":457
+ *         parent[i] = root
+ *         i = nxt
+ *     return root             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = __pyx_v_root;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "scipy/sparse/_graph_tools.pyx":461
+ * 
+ * @cython.boundscheck(False)
+ * def kruskal(int N, np.ndarray rows, np.ndarray cols, np.ndarray order,             # <<<<<<<<<<<<<<
+ *             np.ndarray keep):
+ *     """Kruskal's algorithm on an edge list.
+ */
+
+static PyObject *__pyx_pf_5scipy_6sparse_12_graph_tools_6kruskal(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5scipy_6sparse_12_graph_tools_6kruskal[] = "Kruskal's algorithm on an edge list.\n\n    `order` lists the edges (``rows[e]``, ``cols[e]``) by increasing\n    weight; ``keep[e]`` is set to 1 for the edges of the minimum\n    spanning forest.  Returns the number of edges kept.\n    ";
+static PyMethodDef __pyx_mdef_5scipy_6sparse_12_graph_tools_6kruskal = {__Pyx_NAMESTR("kruskal"), (PyCFunction)__pyx_pf_5scipy_6sparse_12_graph_tools_6kruskal, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_5scipy_6sparse_12_graph_tools_6kruskal)};
+static PyObject *__pyx_pf_5scipy_6sparse_12_graph_tools_6kruskal(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_v_N;
+  PyArrayObject *__pyx_v_rows = 0;
+  PyArrayObject *__pyx_v_cols = 0;
+  PyArrayObject *__pyx_v_order = 0;
+  PyArrayObject *__pyx_v_keep = 0;
+  int *__pyx_v_r;
+  int *__pyx_v_c;
+  int *__pyx_v_o;
+  __pyx_t_5numpy_int8_t *__pyx_v_kp;
+  int __pyx_v_n_edges;
+  int __pyx_v_e;
+  int __pyx_v_i;
+  int __pyx_v_a;
+  int __pyx_v_b;
+  int __pyx_v_n_kept;
+  int *__pyx_v_parent;
+  int *__pyx_v_rank;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__N,&__pyx_n_s__rows,&__pyx_n_s__cols,&__pyx_n_s__order,&__pyx_n_s__keep,0};
+  __Pyx_RefNannySetupContext("kruskal");
+  __pyx_self = __pyx_self;
+  {
+    PyObject* values[5] = {0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  0:
+        values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__N);
+        if (likely(values[0])) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__rows);
+        if (likely(values[1])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("kruskal", 1, 5, 5, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 461; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  2:
+        values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__cols);
+        if (likely(values[2])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("kruskal", 1, 5, 5, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 461; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  3:
+        values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__order);
+        if (likely(values[3])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("kruskal", 1, 5, 5, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 461; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  4:
+        values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__keep);
+        if (likely(values[4])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("kruskal", 1, 5, 5, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 461; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "kruskal") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 461; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 5) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+    }
+    __pyx_v_N = __Pyx_PyInt_AsInt(values[0]); if (unlikely((__pyx_v_N == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 461; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_rows = ((PyArrayObject *)values[1]);
+    __pyx_v_cols = ((PyArrayObject *)values[2]);
+    __pyx_v_order = ((PyArrayObject *)values[3]);
+    __pyx_v_keep = ((PyArrayObject *)values[4]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("kruskal", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 461; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("scipy.sparse._graph_tools.kruskal", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_rows), __pyx_ptype_5numpy_ndarray, 1, "rows", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 461; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_cols), __pyx_ptype_5numpy_ndarray, 1, "cols", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 461; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_order), __pyx_ptype_5numpy_ndarray, 1, "order", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 461; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_keep), __pyx_ptype_5numpy_ndarray, 1, "keep", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 462; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "scipy/sparse/_graph_tools.pyx":469
+ *     spanning forest.  Returns the number of edges kept.
+ *     """
+ *     cdef int* r = <int*>rows.data             # <<<<<<<<<<<<<<
+ *     cdef int* c = <int*>cols.data
+ *     cdef int* o = <int*>order.data
+ */
+  __pyx_v_r = ((int *)__pyx_v_rows->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":470
+ *     """
+ *     cdef int* r = <int*>rows.data
+ *     cdef int* c = <int*>cols.data             # <<<<<<<<<<<<<<
+ *     cdef int* o = <int*>order.data
+ *     cdef np.int8_t* kp = <np.int8_t*>keep.data
+ */
+  __pyx_v_c = ((int *)__pyx_v_cols->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":471
+ *     cdef int* r = <int*>rows.data
+ *     cdef int* c = <int*>cols.data
+ *     cdef int* o = <int*>order.data             # <<<<<<<<<<<<<<
+ *     cdef np.int8_t* kp = <np.int8_t*>keep.data
+ *     cdef int n_edges = order.shape[0]
+ */
+  __pyx_v_o = ((int *)__pyx_v_order->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":472
+ *     cdef int* c = <int*>cols.data
+ *     cdef int* o = <int*>order.data
+ *     cdef np.int8_t* kp = <np.int8_t*>keep.data             # <<<<<<<<<<<<<<
+ *     cdef int n_edges = order.shape[0]
+ *     cdef int e, i, a, b, n_kept = 0
+ */
+  __pyx_v_kp = ((__pyx_t_5numpy_int8_t *)__pyx_v_keep->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":473
+ *     cdef int* o = <int*>order.data
+ *     cdef np.int8_t* kp = <np.int8_t*>keep.data
+ *     cdef int n_edges = order.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef int e, i, a, b, n_kept = 0
+ *     cdef int* parent = <int*>malloc((N + 1) * sizeof(int))
+ */
+  __pyx_v_n_edges = (__pyx_v_order->dimensions[0]);
+
+  /* "scipy/sparse/_graph_tools.pyx":474
+ *     cdef np.int8_t* kp = <np.int8_t*>keep.data
+ *     cdef int n_edges = order.shape[0]
+ *     cdef int e, i, a, b, n_kept = 0             # <<<<<<<<<<<<<<
+ *     cdef int* parent = <int*>malloc((N + 1) * sizeof(int))
+ *     cdef int* rank = <int*>malloc((N + 1) * sizeof(int))
+ */
+  __pyx_v_n_kept = 0;
+
+  /* "scipy/sparse/_graph_tools.pyx":475
+ *     cdef int n_edges = order.shape[0]
+ *     cdef int e, i, a, b, n_kept = 0
+ *     cdef int* parent = <int*>malloc((N + 1) * sizeof(int))             # <<<<<<<<<<<<<<
+ *     cdef int* rank = <int*>malloc((N + 1) * sizeof(int))
+ * 
+ */
+  __pyx_v_parent = ((int *)malloc(((__pyx_v_N + 1) * (sizeof(int)))));
+
+  /* "scipy/sparse/_graph_tools.pyx":476
+ *     cdef int e, i, a, b, n_kept = 0
+ *     cdef int* parent = <int*>malloc((N + 1) * sizeof(int))
+ *     cdef int* rank = <int*>malloc((N + 1) * sizeof(int))             # <<<<<<<<<<<<<<
+ * 
+ *     if parent == NULL or rank == NULL:
+ */
+  __pyx_v_rank = ((int *)malloc(((__pyx_v_N + 1) * (sizeof(int)))));
+
+  /* "scipy/sparse/_graph_tools.pyx":478
+ *     cdef int* rank = <int*>malloc((N + 1) * sizeof(int))
+ * 
+ *     if parent == NULL or rank == NULL:             # <<<<<<<<<<<<<<
+ *         free(parent)
+ *         free(rank)
+ */
+  __pyx_t_1 = (__pyx_v_parent == NULL);
+  if (!__pyx_t_1) {
+    __pyx_t_2 = (__pyx_v_rank == NULL);
+    __pyx_t_3 = __pyx_t_2;
+  } else {
+    __pyx_t_3 = __pyx_t_1;
+  }
+  if (__pyx_t_3) {
+
+    /* "scipy/sparse/_graph_tools.pyx":479
+ * 
+ *     if parent == NULL or rank == NULL:
+ *         free(parent)             # <<<<<<<<<<<<<<
+ *         free(rank)
+ *         raise MemoryError()
+ */
+    free(__pyx_v_parent);
+
+    /* "scipy/sparse/_graph_tools.pyx":480
+ *     if parent == NULL or rank == NULL:
+ *         free(parent)
+ *         free(rank)             # <<<<<<<<<<<<<<
+ *         raise MemoryError()
+ * 
+ */
+    free(__pyx_v_rank);
+
+    /* "scipy/sparse/_graph_tools.pyx":481
+ *         free(parent)
+ *         free(rank)
+ *         raise MemoryError()             # <<<<<<<<<<<<<<
+ * 
+ *     with nogil:
+ */
+    PyErr_NoMemory(); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 481; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "scipy/sparse/_graph_tools.pyx":483
+ *         raise MemoryError()
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(N):
+ *             parent[i] = i
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save = NULL;
+      #endif
+      Py_UNBLOCK_THREADS
+      /*try:*/ {
+
+        /* "scipy/sparse/_graph_tools.pyx":484
+ * 
+ *     with nogil:
+ *         for i in range(N):             # <<<<<<<<<<<<<<
+ *             parent[i] = i
+ *             rank[i] = 0
+ */
+        __pyx_t_4 = __pyx_v_N;
+        for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+          __pyx_v_i = __pyx_t_5;
+
+          /* "scipy/sparse/_graph_tools.pyx":485
+ *     with nogil:
+ *         for i in range(N):
+ *             parent[i] = i             # <<<<<<<<<<<<<<
+ *             rank[i] = 0
+ *         for i in range(n_edges):
+ */
+          (__pyx_v_parent[__pyx_v_i]) = __pyx_v_i;
+
+          /* "scipy/sparse/_graph_tools.pyx":486
+ *         for i in range(N):
+ *             parent[i] = i
+ *             rank[i] = 0             # <<<<<<<<<<<<<<
+ *         for i in range(n_edges):
+ *             if n_kept == N - 1:
+ */
+          (__pyx_v_rank[__pyx_v_i]) = 0;
+        }
+
+        /* "scipy/sparse/_graph_tools.pyx":487
+ *             parent[i] = i
+ *             rank[i] = 0
+ *         for i in range(n_edges):             # <<<<<<<<<<<<<<
+ *             if n_kept == N - 1:
+ *                 break
+ */
+        __pyx_t_4 = __pyx_v_n_edges;
+        for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+          __pyx_v_i = __pyx_t_5;
+
+          /* "scipy/sparse/_graph_tools.pyx":488
+ *             rank[i] = 0
+ *         for i in range(n_edges):
+ *             if n_kept == N - 1:             # <<<<<<<<<<<<<<
+ *                 break
+ *             e = o[i]
+ */
+          __pyx_t_3 = (__pyx_v_n_kept == (__pyx_v_N - 1));
+          if (__pyx_t_3) {
+
+            /* "scipy/sparse/_graph_tools.pyx":489
+ *         for i in range(n_edges):
+ *             if n_kept == N - 1:
+ *                 break             # <<<<<<<<<<<<<<
+ *             e = o[i]
+ *             a = _find(parent, r[e])
+ */
+            goto __pyx_L13_break;
+            goto __pyx_L14;
+          }
+          __pyx_L14:;
+
+          /* "scipy/sparse/_graph_tools.pyx":490
+ *             if n_kept == N - 1:
+ *                 break
+ *             e = o[i]             # <<<<<<<<<<<<<<
+ *             a = _find(parent, r[e])
+ *             b = _find(parent, c[e])
+ */
+          __pyx_v_e = (__pyx_v_o[__pyx_v_i]);
+
+          /* "scipy/sparse/_graph_tools.pyx":491
+ *                 break
+ *             e = o[i]
+ *             a = _find(parent, r[e])             # <<<<<<<<<<<<<<
+ *             b = _find(parent, c[e])
+ *             if a == b:
+ */
+          __pyx_v_a = __pyx_f_5scipy_6sparse_12_graph_tools__find(__pyx_v_parent, (__pyx_v_r[__pyx_v_e]));
+
+          /* "scipy/sparse/_graph_tools.pyx":492
+ *             e = o[i]
+ *             a = _find(parent, r[e])
+ *             b = _find(parent, c[e])             # <<<<<<<<<<<<<<
+ *             if a == b:
+ *                 continue
+ */
+          __pyx_v_b = __pyx_f_5scipy_6sparse_12_graph_tools__find(__pyx_v_parent, (__pyx_v_c[__pyx_v_e]));
+
+          /* "scipy/sparse/_graph_tools.pyx":493
+ *             a = _find(parent, r[e])
+ *             b = _find(parent, c[e])
+ *             if a == b:             # <<<<<<<<<<<<<<
+ *                 continue
+ *             # union by rank
+ */
+          __pyx_t_3 = (__pyx_v_a == __pyx_v_b);
+          if (__pyx_t_3) {
+
+            /* "scipy/sparse/_graph_tools.pyx":494
+ *             b = _find(parent, c[e])
+ *             if a == b:
+ *                 continue             # <<<<<<<<<<<<<<
+ *             # union by rank
+ *             if rank[a] < rank[b]:
+ */
+            goto __pyx_L12_continue;
+            goto __pyx_L15;
+          }
+          __pyx_L15:;
+
+          /* "scipy/sparse/_graph_tools.pyx":496
+ *                 continue
+ *             # union by rank
+ *             if rank[a] < rank[b]:             # <<<<<<<<<<<<<<
+ *                 parent[a] = b
+ *             elif rank[a] > rank[b]:
+ */
+          __pyx_t_3 = ((__pyx_v_rank[__pyx_v_a]) < (__pyx_v_rank[__pyx_v_b]));
+          if (__pyx_t_3) {
+
+            /* "scipy/sparse/_graph_tools.pyx":497
+ *             # union by rank
+ *             if rank[a] < rank[b]:
+ *                 parent[a] = b             # <<<<<<<<<<<<<<
+ *             elif rank[a] > rank[b]:
+ *                 parent[b] = a
+ */
+            (__pyx_v_parent[__pyx_v_a]) = __pyx_v_b;
+            goto __pyx_L16;
+          }
+
+          /* "scipy/sparse/_graph_tools.pyx":498
+ *             if rank[a] < rank[b]:
+ *                 parent[a] = b
+ *             elif rank[a] > rank[b]:             # <<<<<<<<<<<<<<
+ *                 parent[b] = a
+ *             else:
+ */
+          __pyx_t_3 = ((__pyx_v_rank[__pyx_v_a]) > (__pyx_v_rank[__pyx_v_b]));
+          if (__pyx_t_3) {
+
+            /* "scipy/sparse/_graph_tools.pyx":499
+ *                 parent[a] = b
+ *             elif rank[a] > rank[b]:
+ *                 parent[b] = a             # <<<<<<<<<<<<<<
+ *             else:
+ *                 parent[b] = a
+ */
+            (__pyx_v_parent[__pyx_v_b]) = __pyx_v_a;
+            goto __pyx_L16;
+          }
+          /*else*/ {
+
+            /* "scipy/sparse/_graph_tools.pyx":501
+ *                 parent[b] = a
+ *             else:
+ *                 parent[b] = a             # <<<<<<<<<<<<<<
+ *                 rank[a] += 1
+ *             kp[e] = 1
+ */
+            (__pyx_v_parent[__pyx_v_b]) = __pyx_v_a;
+
+            /* "scipy/sparse/_graph_tools.pyx":502
+ *             else:
+ *                 parent[b] = a
+ *                 rank[a] += 1             # <<<<<<<<<<<<<<
+ *             kp[e] = 1
+ *             n_kept += 1
+ */
+            __pyx_t_6 = __pyx_v_a;
+            (__pyx_v_rank[__pyx_t_6]) = ((__pyx_v_rank[__pyx_t_6]) + 1);
+          }
+          __pyx_L16:;
+
+          /* "scipy/sparse/_graph_tools.pyx":503
+ *                 parent[b] = a
+ *                 rank[a] += 1
+ *             kp[e] = 1             # <<<<<<<<<<<<<<
+ *             n_kept += 1
+ * 
+ */
+          (__pyx_v_kp[__pyx_v_e]) = 1;
+
+          /* "scipy/sparse/_graph_tools.pyx":504
+ *                 rank[a] += 1
+ *             kp[e] = 1
+ *             n_kept += 1             # <<<<<<<<<<<<<<
+ * 
+ *     free(parent)
+ */
+          __pyx_v_n_kept = (__pyx_v_n_kept + 1);
+          __pyx_L12_continue:;
+        }
+        __pyx_L13_break:;
+      }
+
+      /* "scipy/sparse/_graph_tools.pyx":483
+ *         raise MemoryError()
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for i in range(N):
+ *             parent[i] = i
+ */
+      /*finally:*/ {
+        Py_BLOCK_THREADS
+      }
+  }
+
+  /* "scipy/sparse/_graph_tools.pyx":506
+ *             n_kept += 1
+ * 
+ *     free(parent)             # <<<<<<<<<<<<<<
+ *     free(rank)
+ *     return n_kept
+ */
+  free(__pyx_v_parent);
+
+  /* "scipy/sparse/_graph_tools.pyx":507
+ * 
+ *     free(parent)
+ *     free(rank)             # <<<<<<<<<<<<<<
+ *     return n_kept
+ * 
+ */
+  free(__pyx_v_rank);
+
+  /* "scipy/sparse/_graph_tools.pyx":508
+ *     free(parent)
+ *     free(rank)
+ *     return n_kept             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_7 = PyInt_FromLong(__pyx_v_n_kept); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 508; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_r = __pyx_t_7;
+  __pyx_t_7 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("scipy.sparse._graph_tools.kruskal", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "scipy/sparse/_graph_tools.pyx":517
+ * 
+ * @cython.boundscheck(False)
+ * cdef int _bfs(int* ap, int* aj, int root, int tag, int* part,             # <<<<<<<<<<<<<<
+ *               int* level, int* queue) nogil:
+ *     # level[] must be -1 on the nodes of the subgraph; returns the number
+ */
+
+static int __pyx_f_5scipy_6sparse_12_graph_tools__bfs(int *__pyx_v_ap, int *__pyx_v_aj, int __pyx_v_root, int __pyx_v_tag, int *__pyx_v_part, int *__pyx_v_level, int *__pyx_v_queue) {
+  int __pyx_v_i;
+  int __pyx_v_j;
+  int __pyx_v_k;
+  int __pyx_v_head;
+  int __pyx_v_tail;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+
+  /* "scipy/sparse/_graph_tools.pyx":521
+ *     # level[] must be -1 on the nodes of the subgraph; returns the number
+ *     # of nodes reached, which are left in queue[] in breadth-first order
+ *     cdef int i, j, k, head = 0, tail = 1             # <<<<<<<<<<<<<<
+ *     queue[0] = root
+ *     level[root] = 0
+ */
+  __pyx_v_head = 0;
+  __pyx_v_tail = 1;
+
+  /* "scipy/sparse/_graph_tools.pyx":522
+ *     # of nodes reached, which are left in queue[] in breadth-first order
+ *     cdef int i, j, k, head = 0, tail = 1
+ *     queue[0] = root             # <<<<<<<<<<<<<<
+ *     level[root] = 0
+ *     while head < tail:
+ */
+  (__pyx_v_queue[0]) = __pyx_v_root;
+
+  /* "scipy/sparse/_graph_tools.pyx":523
+ *     cdef int i, j, k, head = 0, tail = 1
+ *     queue[0] = root
+ *     level[root] = 0             # <<<<<<<<<<<<<<
+ *     while head < tail:
+ *         i = queue[head]
+ */
+  (__pyx_v_level[__pyx_v_root]) = 0;
+
+  /* "scipy/sparse/_graph_tools.pyx":524
+ *     queue[0] = root
+ *     level[root] = 0
+ *     while head < tail:             # <<<<<<<<<<<<<<
+ *         i = queue[head]
+ *         head += 1
+ */
+  while (1) {
+    __pyx_t_1 = (__pyx_v_head < __pyx_v_tail);
+    if (!__pyx_t_1) break;
+
+    /* "scipy/sparse/_graph_tools.pyx":525
+ *     level[root] = 0
+ *     while head < tail:
+ *         i = queue[head]             # <<<<<<<<<<<<<<
+ *         head += 1
+ *         for k in range(ap[i], ap[i + 1]):
+ */
+    __pyx_v_i = (__pyx_v_queue[__pyx_v_head]);
+
+    /* "scipy/sparse/_graph_tools.pyx":526
+ *     while head < tail:
+ *         i = queue[head]
+ *         head += 1             # <<<<<<<<<<<<<<
+ *         for k in range(ap[i], ap[i + 1]):
+ *             j = aj[k]
+ */
+    __pyx_v_head = (__pyx_v_head + 1);
+
+    /* "scipy/sparse/_graph_tools.pyx":527
+ *         i = queue[head]
+ *         head += 1
+ *         for k in range(ap[i], ap[i + 1]):             # <<<<<<<<<<<<<<
+ *             j = aj[k]
+ *             if level[j] < 0 and part[j] == tag:
+ */
+    __pyx_t_2 = (__pyx_v_ap[(__pyx_v_i + 1)]);
+    for (__pyx_t_3 = (__pyx_v_ap[__pyx_v_i]); __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+      __pyx_v_k = __pyx_t_3;
+
+      /* "scipy/sparse/_graph_tools.pyx":528
+ *         head += 1
+ *         for k in range(ap[i], ap[i + 1]):
+ *             j = aj[k]             # <<<<<<<<<<<<<<
+ *             if level[j] < 0 and part[j] == tag:
+ *                 level[j] = level[i] + 1
+ */
+      __pyx_v_j = (__pyx_v_aj[__pyx_v_k]);
+
+      /* "scipy/sparse/_graph_tools.pyx":529
+ *         for k in range(ap[i], ap[i + 1]):
+ *             j = aj[k]
+ *             if level[j] < 0 and part[j] == tag:             # <<<<<<<<<<<<<<
+ *                 level[j] = level[i] + 1
+ *                 queue[tail] = j
+ */
+      __pyx_t_1 = ((__pyx_v_level[__pyx_v_j]) < 0);
+      if (__pyx_t_1) {
+        __pyx_t_4 = ((__pyx_v_part[__pyx_v_j]) == __pyx_v_tag);
+        __pyx_t_5 = __pyx_t_4;
+      } else {
+        __pyx_t_5 = __pyx_t_1;
+      }
+      if (__pyx_t_5) {
+
+        /* "scipy/sparse/_graph_tools.pyx":530
+ *             j = aj[k]
+ *             if level[j] < 0 and part[j] == tag:
+ *                 level[j] = level[i] + 1             # <<<<<<<<<<<<<<
+ *                 queue[tail] = j
+ *                 tail += 1
+ */
+        (__pyx_v_level[__pyx_v_j]) = ((__pyx_v_level[__pyx_v_i]) + 1);
+
+        /* "scipy/sparse/_graph_tools.pyx":531
+ *             if level[j] < 0 and part[j] == tag:
+ *                 level[j] = level[i] + 1
+ *                 queue[tail] = j             # <<<<<<<<<<<<<<
+ *                 tail += 1
+ *     return tail
+ */
+        (__pyx_v_queue[__pyx_v_tail]) = __pyx_v_j;
+
+        /* "scipy/sparse/_graph_tools.pyx":532
+ *                 level[j] = level[i] + 1
+ *                 queue[tail] = j
+ *                 tail += 1             # <<<<<<<<<<<<<<
+ *     return tail
+ * 
+ */
+        __pyx_v_tail = (__pyx_v_tail + 1);
+        goto __pyx_L7;
+      }
+      __pyx_L7:;
+    }
+  }
+
+  /* "scipy/sparse/_graph_tools.pyx":533
+ *                 queue[tail] = j
+ *                 tail += 1
+ *     return tail             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void _reset(int* level, int* queue, int n) nogil:
+ */
+  __pyx_r = __pyx_v_tail;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "scipy/sparse/_graph_tools.pyx":535
+ *     return tail
+ * 
+ * cdef inline void _reset(int* level, int* queue, int n) nogil:             # <<<<<<<<<<<<<<
+ *     cdef int k
+ *     for k in range(n):
+ */
+
+static CYTHON_INLINE void __pyx_f_5scipy_6sparse_12_graph_tools__reset(int *__pyx_v_level, int *__pyx_v_queue, int __pyx_v_n) {
+  int __pyx_v_k;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "scipy/sparse/_graph_tools.pyx":537
+ * cdef inline void _reset(int* level, int* queue, int n) nogil:
+ *     cdef int k
+ *     for k in range(n):             # <<<<<<<<<<<<<<
+ *         level[queue[k]] = -1
+ * 
+ */
+  __pyx_t_1 = __pyx_v_n;
+  for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+    __pyx_v_k = __pyx_t_2;
+
+    /* "scipy/sparse/_graph_tools.pyx":538
+ *     cdef int k
+ *     for k in range(n):
+ *         level[queue[k]] = -1             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+    (__pyx_v_level[(__pyx_v_queue[__pyx_v_k])]) = -1;
+  }
+
+}
+
+/* "scipy/sparse/_graph_tools.pyx":542
+ * 
+ * @cython.boundscheck(False)
+ * cdef int _peripheral(int* ap, int* aj, int root, int tag, int* part,             # <<<<<<<<<<<<<<
+ *                      int* degree, int* level, int* queue) nogil:
+ *     # George-Liu pseudo-peripheral node: restart the search from a node of
+ */
+
+static int __pyx_f_5scipy_6sparse_12_graph_tools__peripheral(int *__pyx_v_ap, int *__pyx_v_aj, int __pyx_v_root, int __pyx_v_tag, int *__pyx_v_part, int *__pyx_v_degree, int *__pyx_v_level, int *__pyx_v_queue) {
+  int __pyx_v_n;
+  int __pyx_v_k;
+  int __pyx_v_i;
+  int __pyx_v_ecc;
+  int __pyx_v_best;
+  int __pyx_v_new_ecc;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+
+  /* "scipy/sparse/_graph_tools.pyx":547
+ *     # minimum degree in the last level while the eccentricity grows
+ *     cdef int n, k, i, ecc, best, new_ecc
+ *     n = _bfs(ap, aj, root, tag, part, level, queue)             # <<<<<<<<<<<<<<
+ *     ecc = level[queue[n - 1]]
+ *     while 1:
+ */
+  __pyx_v_n = __pyx_f_5scipy_6sparse_12_graph_tools__bfs(__pyx_v_ap, __pyx_v_aj, __pyx_v_root, __pyx_v_tag, __pyx_v_part, __pyx_v_level, __pyx_v_queue);
+
+  /* "scipy/sparse/_graph_tools.pyx":548
+ *     cdef int n, k, i, ecc, best, new_ecc
+ *     n = _bfs(ap, aj, root, tag, part, level, queue)
+ *     ecc = level[queue[n - 1]]             # <<<<<<<<<<<<<<
+ *     while 1:
+ *         best = queue[n - 1]
+ */
+  __pyx_v_ecc = (__pyx_v_level[(__pyx_v_queue[(__pyx_v_n - 1)])]);
+
+  /* "scipy/sparse/_graph_tools.pyx":549
+ *     n = _bfs(ap, aj, root, tag, part, level, queue)
+ *     ecc = level[queue[n - 1]]
+ *     while 1:             # <<<<<<<<<<<<<<
+ *         best = queue[n - 1]
+ *         k = n - 2
+ */
+  while (1) {
+    if (!1) break;
+
+    /* "scipy/sparse/_graph_tools.pyx":550
+ *     ecc = level[queue[n - 1]]
+ *     while 1:
+ *         best = queue[n - 1]             # <<<<<<<<<<<<<<
+ *         k = n - 2
+ *         while k >= 0 and level[queue[k]] == ecc:
+ */
+    __pyx_v_best = (__pyx_v_queue[(__pyx_v_n - 1)]);
+
+    /* "scipy/sparse/_graph_tools.pyx":551
+ *     while 1:
+ *         best = queue[n - 1]
+ *         k = n - 2             # <<<<<<<<<<<<<<
+ *         while k >= 0 and level[queue[k]] == ecc:
+ *             i = queue[k]
+ */
+    __pyx_v_k = (__pyx_v_n - 2);
+
+    /* "scipy/sparse/_graph_tools.pyx":552
+ *         best = queue[n - 1]
+ *         k = n - 2
+ *         while k >= 0 and level[queue[k]] == ecc:             # <<<<<<<<<<<<<<
+ *             i = queue[k]
+ *             if degree[i] < degree[best]:
+ */
+    while (1) {
+      __pyx_t_1 = (__pyx_v_k >= 0);
+      if (__pyx_t_1) {
+        __pyx_t_2 = ((__pyx_v_level[(__pyx_v_queue[__pyx_v_k])]) == __pyx_v_ecc);
+        __pyx_t_3 = __pyx_t_2;
+      } else {
+        __pyx_t_3 = __pyx_t_1;
+      }
+      if (!__pyx_t_3) break;
+
+      /* "scipy/sparse/_graph_tools.pyx":553
+ *         k = n - 2
+ *         while k >= 0 and level[queue[k]] == ecc:
+ *             i = queue[k]             # <<<<<<<<<<<<<<
+ *             if degree[i] < degree[best]:
+ *                 best = i
+ */
+      __pyx_v_i = (__pyx_v_queue[__pyx_v_k]);
+
+      /* "scipy/sparse/_graph_tools.pyx":554
+ *         while k >= 0 and level[queue[k]] == ecc:
+ *             i = queue[k]
+ *             if degree[i] < degree[best]:             # <<<<<<<<<<<<<<
+ *                 best = i
+ *             k -= 1
+ */
+      __pyx_t_3 = ((__pyx_v_degree[__pyx_v_i]) < (__pyx_v_degree[__pyx_v_best]));
+      if (__pyx_t_3) {
+
+        /* "scipy/sparse/_graph_tools.pyx":555
+ *             i = queue[k]
+ *             if degree[i] < degree[best]:
+ *                 best = i             # <<<<<<<<<<<<<<
+ *             k -= 1
+ *         _reset(level, queue, n)
+ */
+        __pyx_v_best = __pyx_v_i;
+        goto __pyx_L7;
+      }
+      __pyx_L7:;
+
+      /* "scipy/sparse/_graph_tools.pyx":556
+ *             if degree[i] < degree[best]:
+ *                 best = i
+ *             k -= 1             # <<<<<<<<<<<<<<
+ *         _reset(level, queue, n)
+ *         n = _bfs(ap, aj, best, tag, part, level, queue)
+ */
+      __pyx_v_k = (__pyx_v_k - 1);
+    }
+
+    /* "scipy/sparse/_graph_tools.pyx":557
+ *                 best = i
+ *             k -= 1
+ *         _reset(level, queue, n)             # <<<<<<<<<<<<<<
+ *         n = _bfs(ap, aj, best, tag, part, level, queue)
+ *         new_ecc = level[queue[n - 1]]
+ */
+    __pyx_f_5scipy_6sparse_12_graph_tools__reset(__pyx_v_level, __pyx_v_queue, __pyx_v_n);
+
+    /* "scipy/sparse/_graph_tools.pyx":558
+ *             k -= 1
+ *         _reset(level, queue, n)
+ *         n = _bfs(ap, aj, best, tag, part, level, queue)             # <<<<<<<<<<<<<<
+ *         new_ecc = level[queue[n - 1]]
+ *         _reset(level, queue, n)
+ */
+    __pyx_v_n = __pyx_f_5scipy_6sparse_12_graph_tools__bfs(__pyx_v_ap, __pyx_v_aj, __pyx_v_best, __pyx_v_tag, __pyx_v_part, __pyx_v_level, __pyx_v_queue);
+
+    /* "scipy/sparse/_graph_tools.pyx":559
+ *         _reset(level, queue, n)
+ *         n = _bfs(ap, aj, best, tag, part, level, queue)
+ *         new_ecc = level[queue[n - 1]]             # <<<<<<<<<<<<<<
+ *         _reset(level, queue, n)
+ *         if new_ecc <= ecc:
+ */
+    __pyx_v_new_ecc = (__pyx_v_level[(__pyx_v_queue[(__pyx_v_n - 1)])]);
+
+    /* "scipy/sparse/_graph_tools.pyx":560
+ *         n = _bfs(ap, aj, best, tag, part, level, queue)
+ *         new_ecc = level[queue[n - 1]]
+ *         _reset(level, queue, n)             # <<<<<<<<<<<<<<
+ *         if new_ecc <= ecc:
+ *             return root
+ */
+    __pyx_f_5scipy_6sparse_12_graph_tools__reset(__pyx_v_level, __pyx_v_queue, __pyx_v_n);
+
+    /* "scipy/sparse/_graph_tools.pyx":561
+ *         new_ecc = level[queue[n - 1]]
+ *         _reset(level, queue, n)
+ *         if new_ecc <= ecc:             # <<<<<<<<<<<<<<
+ *             return root
+ *         root = best
+ */
+    __pyx_t_3 = (__pyx_v_new_ecc <= __pyx_v_ecc);
+    if (__pyx_t_3) {
+
+      /* "scipy/sparse/_graph_tools.pyx":562
+ *         _reset(level, queue, n)
+ *         if new_ecc <= ecc:
+ *             return root             # <<<<<<<<<<<<<<
+ *         root = best
+ *         ecc = new_ecc
+ */
+      __pyx_r = __pyx_v_root;
+      goto __pyx_L0;
+      goto __pyx_L8;
+    }
+    __pyx_L8:;
+
+    /* "scipy/sparse/_graph_tools.pyx":563
+ *         if new_ecc <= ecc:
+ *             return root
+ *         root = best             # <<<<<<<<<<<<<<
+ *         ecc = new_ecc
+ *         n = _bfs(ap, aj, root, tag, part, level, queue)
+ */
+    __pyx_v_root = __pyx_v_best;
+
+    /* "scipy/sparse/_graph_tools.pyx":564
+ *             return root
+ *         root = best
+ *         ecc = new_ecc             # <<<<<<<<<<<<<<
+ *         n = _bfs(ap, aj, root, tag, part, level, queue)
+ * 
+ */
+    __pyx_v_ecc = __pyx_v_new_ecc;
+
+    /* "scipy/sparse/_graph_tools.pyx":565
+ *         root = best
+ *         ecc = new_ecc
+ *         n = _bfs(ap, aj, root, tag, part, level, queue)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+    __pyx_v_n = __pyx_f_5scipy_6sparse_12_graph_tools__bfs(__pyx_v_ap, __pyx_v_aj, __pyx_v_root, __pyx_v_tag, __pyx_v_part, __pyx_v_level, __pyx_v_queue);
+  }
+
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "scipy/sparse/_graph_tools.pyx":568
+ * 
+ * 
+ * cdef int _compare_keys(const_void* a, const_void* b) nogil:             # <<<<<<<<<<<<<<
+ *     cdef np.int64_t x = (<np.int64_t*>a)[0], y = (<np.int64_t*>b)[0]
+ *     return (x > y) - (x < y)
+ */
+
+static int __pyx_f_5scipy_6sparse_12_graph_tools__compare_keys(const void *__pyx_v_a, const void *__pyx_v_b) {
+  __pyx_t_5numpy_int64_t __pyx_v_x;
+  __pyx_t_5numpy_int64_t __pyx_v_y;
+  int __pyx_r;
+
+  /* "scipy/sparse/_graph_tools.pyx":569
+ * 
+ * cdef int _compare_keys(const_void* a, const_void* b) nogil:
+ *     cdef np.int64_t x = (<np.int64_t*>a)[0], y = (<np.int64_t*>b)[0]             # <<<<<<<<<<<<<<
+ *     return (x > y) - (x < y)
+ * 
+ */
+  __pyx_v_x = (((__pyx_t_5numpy_int64_t *)__pyx_v_a)[0]);
+  __pyx_v_y = (((__pyx_t_5numpy_int64_t *)__pyx_v_b)[0]);
+
+  /* "scipy/sparse/_graph_tools.pyx":570
+ * cdef int _compare_keys(const_void* a, const_void* b) nogil:
+ *     cdef np.int64_t x = (<np.int64_t*>a)[0], y = (<np.int64_t*>b)[0]
+ *     return (x > y) - (x < y)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = ((__pyx_v_x > __pyx_v_y) - (__pyx_v_x < __pyx_v_y));
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "scipy/sparse/_graph_tools.pyx":574
+ * 
+ * @cython.boundscheck(False)
+ * cdef void _degrees(int N, int* ap, int* aj, int* degree) nogil:             # <<<<<<<<<<<<<<
+ *     cdef int i, k
+ *     for i in range(N):
+ */
+
+static void __pyx_f_5scipy_6sparse_12_graph_tools__degrees(int __pyx_v_N, int *__pyx_v_ap, int *__pyx_v_aj, int *__pyx_v_degree) {
+  int __pyx_v_i;
+  int __pyx_v_k;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+
+  /* "scipy/sparse/_graph_tools.pyx":576
+ * cdef void _degrees(int N, int* ap, int* aj, int* degree) nogil:
+ *     cdef int i, k
+ *     for i in range(N):             # <<<<<<<<<<<<<<
+ *         degree[i] = 0
+ *         for k in range(ap[i], ap[i + 1]):
+ */
+  __pyx_t_1 = __pyx_v_N;
+  for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+    __pyx_v_i = __pyx_t_2;
+
+    /* "scipy/sparse/_graph_tools.pyx":577
+ *     cdef int i, k
+ *     for i in range(N):
+ *         degree[i] = 0             # <<<<<<<<<<<<<<
+ *         for k in range(ap[i], ap[i + 1]):
+ *             if aj[k] != i:
+ */
+    (__pyx_v_degree[__pyx_v_i]) = 0;
+
+    /* "scipy/sparse/_graph_tools.pyx":578
+ *     for i in range(N):
+ *         degree[i] = 0
+ *         for k in range(ap[i], ap[i + 1]):             # <<<<<<<<<<<<<<
+ *             if aj[k] != i:
+ *                 degree[i] += 1
+ */
+    __pyx_t_3 = (__pyx_v_ap[(__pyx_v_i + 1)]);
+    for (__pyx_t_4 = (__pyx_v_ap[__pyx_v_i]); __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_v_k = __pyx_t_4;
+
+      /* "scipy/sparse/_graph_tools.pyx":579
+ *         degree[i] = 0
+ *         for k in range(ap[i], ap[i + 1]):
+ *             if aj[k] != i:             # <<<<<<<<<<<<<<
+ *                 degree[i] += 1
+ * 
+ */
+      __pyx_t_5 = ((__pyx_v_aj[__pyx_v_k]) != __pyx_v_i);
+      if (__pyx_t_5) {
+
+        /* "scipy/sparse/_graph_tools.pyx":580
+ *         for k in range(ap[i], ap[i + 1]):
+ *             if aj[k] != i:
+ *                 degree[i] += 1             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+        __pyx_t_6 = __pyx_v_i;
+        (__pyx_v_degree[__pyx_t_6]) = ((__pyx_v_degree[__pyx_t_6]) + 1);
+        goto __pyx_L7;
+      }
+      __pyx_L7:;
+    }
+  }
+
+}
+
+/* "scipy/sparse/_graph_tools.pyx":584
+ * 
+ * @cython.boundscheck(False)
+ * def reverse_cuthill_mckee(np.ndarray Ap, np.ndarray Aj, np.ndarray order):             # <<<<<<<<<<<<<<
+ *     """Reverse Cuthill-McKee ordering of a symmetric pattern.
+ * 
+ */
+
+static PyObject *__pyx_pf_5scipy_6sparse_12_graph_tools_7reverse_cuthill_mckee(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5scipy_6sparse_12_graph_tools_7reverse_cuthill_mckee[] = "Reverse Cuthill-McKee ordering of a symmetric pattern.\n\n    Each connected component is numbered breadth-first from a\n    pseudo-peripheral node, visiting neighbours by increasing degree;\n    the whole order is then reversed.  `order` (length N) receives the\n    permutation.\n    ";
+static PyMethodDef __pyx_mdef_5scipy_6sparse_12_graph_tools_7reverse_cuthill_mckee = {__Pyx_NAMESTR("reverse_cuthill_mckee"), (PyCFunction)__pyx_pf_5scipy_6sparse_12_graph_tools_7reverse_cuthill_mckee, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_5scipy_6sparse_12_graph_tools_7reverse_cuthill_mckee)};
+static PyObject *__pyx_pf_5scipy_6sparse_12_graph_tools_7reverse_cuthill_mckee(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_Ap = 0;
+  PyArrayObject *__pyx_v_Aj = 0;
+  PyArrayObject *__pyx_v_order = 0;
+  int __pyx_v_N;
+  int *__pyx_v_ap;
+  int *__pyx_v_aj;
+  int *__pyx_v_o;
+  int __pyx_v_i;
+  int __pyx_v_j;
+  int __pyx_v_k;
+  int __pyx_v_s;
+  int __pyx_v_root;
+  int __pyx_v_head;
+  int __pyx_v_tail;
+  int __pyx_v_first;
+  int __pyx_v_n_new;
+  int __pyx_v_tmp;
+  int *__pyx_v_degree;
+  int *__pyx_v_level;
+  int *__pyx_v_queue;
+  int *__pyx_v_part;
+  __pyx_t_5numpy_int64_t *__pyx_v_keys;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  long __pyx_t_11;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__Ap,&__pyx_n_s__Aj,&__pyx_n_s__order,0};
+  __Pyx_RefNannySetupContext("reverse_cuthill_mckee");
+  __pyx_self = __pyx_self;
+  {
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  0:
+        values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Ap);
+        if (likely(values[0])) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Aj);
+        if (likely(values[1])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("reverse_cuthill_mckee", 1, 3, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 584; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  2:
+        values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__order);
+        if (likely(values[2])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("reverse_cuthill_mckee", 1, 3, 3, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 584; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "reverse_cuthill_mckee") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 584; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v_Ap = ((PyArrayObject *)values[0]);
+    __pyx_v_Aj = ((PyArrayObject *)values[1]);
+    __pyx_v_order = ((PyArrayObject *)values[2]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("reverse_cuthill_mckee", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 584; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("scipy.sparse._graph_tools.reverse_cuthill_mckee", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Ap), __pyx_ptype_5numpy_ndarray, 1, "Ap", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 584; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Aj), __pyx_ptype_5numpy_ndarray, 1, "Aj", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 584; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_order), __pyx_ptype_5numpy_ndarray, 1, "order", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 584; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "scipy/sparse/_graph_tools.pyx":592
+ *     permutation.
+ *     """
+ *     cdef int N = Ap.shape[0] - 1             # <<<<<<<<<<<<<<
+ *     cdef int* ap = <int*>Ap.data
+ *     cdef int* aj = <int*>Aj.data
+ */
+  __pyx_v_N = ((__pyx_v_Ap->dimensions[0]) - 1);
+
+  /* "scipy/sparse/_graph_tools.pyx":593
+ *     """
+ *     cdef int N = Ap.shape[0] - 1
+ *     cdef int* ap = <int*>Ap.data             # <<<<<<<<<<<<<<
+ *     cdef int* aj = <int*>Aj.data
+ *     cdef int* o = <int*>order.data
+ */
+  __pyx_v_ap = ((int *)__pyx_v_Ap->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":594
+ *     cdef int N = Ap.shape[0] - 1
+ *     cdef int* ap = <int*>Ap.data
+ *     cdef int* aj = <int*>Aj.data             # <<<<<<<<<<<<<<
+ *     cdef int* o = <int*>order.data
+ *     cdef int i, j, k, s, root, head, tail, first, n_new, tmp
+ */
+  __pyx_v_aj = ((int *)__pyx_v_Aj->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":595
+ *     cdef int* ap = <int*>Ap.data
+ *     cdef int* aj = <int*>Aj.data
+ *     cdef int* o = <int*>order.data             # <<<<<<<<<<<<<<
+ *     cdef int i, j, k, s, root, head, tail, first, n_new, tmp
+ *     cdef int* degree = <int*>malloc((N + 1) * sizeof(int))
+ */
+  __pyx_v_o = ((int *)__pyx_v_order->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":597
+ *     cdef int* o = <int*>order.data
+ *     cdef int i, j, k, s, root, head, tail, first, n_new, tmp
+ *     cdef int* degree = <int*>malloc((N + 1) * sizeof(int))             # <<<<<<<<<<<<<<
+ *     cdef int* level = <int*>malloc((N + 1) * sizeof(int))
+ *     cdef int* queue = <int*>malloc((N + 1) * sizeof(int))
+ */
+  __pyx_v_degree = ((int *)malloc(((__pyx_v_N + 1) * (sizeof(int)))));
+
+  /* "scipy/sparse/_graph_tools.pyx":598
+ *     cdef int i, j, k, s, root, head, tail, first, n_new, tmp
+ *     cdef int* degree = <int*>malloc((N + 1) * sizeof(int))
+ *     cdef int* level = <int*>malloc((N + 1) * sizeof(int))             # <<<<<<<<<<<<<<
+ *     cdef int* queue = <int*>malloc((N + 1) * sizeof(int))
+ *     cdef int* part = <int*>malloc((N + 1) * sizeof(int))
+ */
+  __pyx_v_level = ((int *)malloc(((__pyx_v_N + 1) * (sizeof(int)))));
+
+  /* "scipy/sparse/_graph_tools.pyx":599
+ *     cdef int* degree = <int*>malloc((N + 1) * sizeof(int))
+ *     cdef int* level = <int*>malloc((N + 1) * sizeof(int))
+ *     cdef int* queue = <int*>malloc((N + 1) * sizeof(int))             # <<<<<<<<<<<<<<
+ *     cdef int* part = <int*>malloc((N + 1) * sizeof(int))
+ *     cdef np.int64_t* keys = <np.int64_t*>malloc((N + 1) *
+ */
+  __pyx_v_queue = ((int *)malloc(((__pyx_v_N + 1) * (sizeof(int)))));
+
+  /* "scipy/sparse/_graph_tools.pyx":600
+ *     cdef int* level = <int*>malloc((N + 1) * sizeof(int))
+ *     cdef int* queue = <int*>malloc((N + 1) * sizeof(int))
+ *     cdef int* part = <int*>malloc((N + 1) * sizeof(int))             # <<<<<<<<<<<<<<
+ *     cdef np.int64_t* keys = <np.int64_t*>malloc((N + 1) *
+ *                                                 sizeof(np.int64_t))
+ */
+  __pyx_v_part = ((int *)malloc(((__pyx_v_N + 1) * (sizeof(int)))));
+
+  /* "scipy/sparse/_graph_tools.pyx":602
+ *     cdef int* part = <int*>malloc((N + 1) * sizeof(int))
+ *     cdef np.int64_t* keys = <np.int64_t*>malloc((N + 1) *
+ *                                                 sizeof(np.int64_t))             # <<<<<<<<<<<<<<
+ * 
+ *     if (degree == NULL or level == NULL or queue == NULL or part == NULL
+ */
+  __pyx_v_keys = ((__pyx_t_5numpy_int64_t *)malloc(((__pyx_v_N + 1) * (sizeof(__pyx_t_5numpy_int64_t)))));
+
+  /* "scipy/sparse/_graph_tools.pyx":604
+ *                                                 sizeof(np.int64_t))
+ * 
+ *     if (degree == NULL or level == NULL or queue == NULL or part == NULL             # <<<<<<<<<<<<<<
+ *             or keys == NULL):
+ *         free(degree)
+ */
+  __pyx_t_1 = (__pyx_v_degree == NULL);
+  if (!__pyx_t_1) {
+    __pyx_t_2 = (__pyx_v_level == NULL);
+    if (!__pyx_t_2) {
+      __pyx_t_3 = (__pyx_v_queue == NULL);
+      if (!__pyx_t_3) {
+
+        /* "scipy/sparse/_graph_tools.pyx":605
+ * 
+ *     if (degree == NULL or level == NULL or queue == NULL or part == NULL
+ *             or keys == NULL):             # <<<<<<<<<<<<<<
+ *         free(degree)
+ *         free(level)
+ */
+        __pyx_t_4 = (__pyx_v_part == NULL);
+        if (!__pyx_t_4) {
+          __pyx_t_5 = (__pyx_v_keys == NULL);
+          __pyx_t_6 = __pyx_t_5;
+        } else {
+          __pyx_t_6 = __pyx_t_4;
+        }
+        __pyx_t_4 = __pyx_t_6;
+      } else {
+        __pyx_t_4 = __pyx_t_3;
+      }
+      __pyx_t_3 = __pyx_t_4;
+    } else {
+      __pyx_t_3 = __pyx_t_2;
+    }
+    __pyx_t_2 = __pyx_t_3;
+  } else {
+    __pyx_t_2 = __pyx_t_1;
+  }
+  if (__pyx_t_2) {
+
+    /* "scipy/sparse/_graph_tools.pyx":606
+ *     if (degree == NULL or level == NULL or queue == NULL or part == NULL
+ *             or keys == NULL):
+ *         free(degree)             # <<<<<<<<<<<<<<
+ *         free(level)
+ *         free(queue)
+ */
+    free(__pyx_v_degree);
+
+    /* "scipy/sparse/_graph_tools.pyx":607
+ *             or keys == NULL):
+ *         free(degree)
+ *         free(level)             # <<<<<<<<<<<<<<
+ *         free(queue)
+ *         free(part)
+ */
+    free(__pyx_v_level);
+
+    /* "scipy/sparse/_graph_tools.pyx":608
+ *         free(degree)
+ *         free(level)
+ *         free(queue)             # <<<<<<<<<<<<<<
+ *         free(part)
+ *         free(keys)
+ */
+    free(__pyx_v_queue);
+
+    /* "scipy/sparse/_graph_tools.pyx":609
+ *         free(level)
+ *         free(queue)
+ *         free(part)             # <<<<<<<<<<<<<<
+ *         free(keys)
+ *         raise MemoryError()
+ */
+    free(__pyx_v_part);
+
+    /* "scipy/sparse/_graph_tools.pyx":610
+ *         free(queue)
+ *         free(part)
+ *         free(keys)             # <<<<<<<<<<<<<<
+ *         raise MemoryError()
+ * 
+ */
+    free(__pyx_v_keys);
+
+    /* "scipy/sparse/_graph_tools.pyx":611
+ *         free(part)
+ *         free(keys)
+ *         raise MemoryError()             # <<<<<<<<<<<<<<
+ * 
+ *     with nogil:
+ */
+    PyErr_NoMemory(); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 611; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "scipy/sparse/_graph_tools.pyx":613
+ *         raise MemoryError()
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         _degrees(N, ap, aj, degree)
+ *         for i in range(N):
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save = NULL;
+      #endif
+      Py_UNBLOCK_THREADS
+      /*try:*/ {
+
+        /* "scipy/sparse/_graph_tools.pyx":614
+ * 
+ *     with nogil:
+ *         _degrees(N, ap, aj, degree)             # <<<<<<<<<<<<<<
+ *         for i in range(N):
+ *             level[i] = -1
+ */
+        __pyx_f_5scipy_6sparse_12_graph_tools__degrees(__pyx_v_N, __pyx_v_ap, __pyx_v_aj, __pyx_v_degree);
+
+        /* "scipy/sparse/_graph_tools.pyx":615
+ *     with nogil:
+ *         _degrees(N, ap, aj, degree)
+ *         for i in range(N):             # <<<<<<<<<<<<<<
+ *             level[i] = -1
+ *             part[i] = 0
+ */
+        __pyx_t_7 = __pyx_v_N;
+        for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+          __pyx_v_i = __pyx_t_8;
+
+          /* "scipy/sparse/_graph_tools.pyx":616
+ *         _degrees(N, ap, aj, degree)
+ *         for i in range(N):
+ *             level[i] = -1             # <<<<<<<<<<<<<<
+ *             part[i] = 0
+ * 
+ */
+          (__pyx_v_level[__pyx_v_i]) = -1;
+
+          /* "scipy/sparse/_graph_tools.pyx":617
+ *         for i in range(N):
+ *             level[i] = -1
+ *             part[i] = 0             # <<<<<<<<<<<<<<
+ * 
+ *         tail = 0
+ */
+          (__pyx_v_part[__pyx_v_i]) = 0;
+        }
+
+        /* "scipy/sparse/_graph_tools.pyx":619
+ *             part[i] = 0
+ * 
+ *         tail = 0             # <<<<<<<<<<<<<<
+ *         for s in range(N):
+ *             if part[s]:
+ */
+        __pyx_v_tail = 0;
+
+        /* "scipy/sparse/_graph_tools.pyx":620
+ * 
+ *         tail = 0
+ *         for s in range(N):             # <<<<<<<<<<<<<<
+ *             if part[s]:
+ *                 continue
+ */
+        __pyx_t_7 = __pyx_v_N;
+        for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+          __pyx_v_s = __pyx_t_8;
+
+          /* "scipy/sparse/_graph_tools.pyx":621
+ *         tail = 0
+ *         for s in range(N):
+ *             if part[s]:             # <<<<<<<<<<<<<<
+ *                 continue
+ *             root = _peripheral(ap, aj, s, 0, part, degree, level, queue)
+ */
+          if ((__pyx_v_part[__pyx_v_s])) {
+
+            /* "scipy/sparse/_graph_tools.pyx":622
+ *         for s in range(N):
+ *             if part[s]:
+ *                 continue             # <<<<<<<<<<<<<<
+ *             root = _peripheral(ap, aj, s, 0, part, degree, level, queue)
+ *             # part[] marks the nodes already numbered
+ */
+            goto __pyx_L12_continue;
+            goto __pyx_L14;
+          }
+          __pyx_L14:;
+
+          /* "scipy/sparse/_graph_tools.pyx":623
+ *             if part[s]:
+ *                 continue
+ *             root = _peripheral(ap, aj, s, 0, part, degree, level, queue)             # <<<<<<<<<<<<<<
+ *             # part[] marks the nodes already numbered
+ *             head = tail
+ */
+          __pyx_v_root = __pyx_f_5scipy_6sparse_12_graph_tools__peripheral(__pyx_v_ap, __pyx_v_aj, __pyx_v_s, 0, __pyx_v_part, __pyx_v_degree, __pyx_v_level, __pyx_v_queue);
+
+          /* "scipy/sparse/_graph_tools.pyx":625
+ *             root = _peripheral(ap, aj, s, 0, part, degree, level, queue)
+ *             # part[] marks the nodes already numbered
+ *             head = tail             # <<<<<<<<<<<<<<
+ *             o[tail] = root
+ *             part[root] = 1
+ */
+          __pyx_v_head = __pyx_v_tail;
+
+          /* "scipy/sparse/_graph_tools.pyx":626
+ *             # part[] marks the nodes already numbered
+ *             head = tail
+ *             o[tail] = root             # <<<<<<<<<<<<<<
+ *             part[root] = 1
+ *             tail += 1
+ */
+          (__pyx_v_o[__pyx_v_tail]) = __pyx_v_root;
+
+          /* "scipy/sparse/_graph_tools.pyx":627
+ *             head = tail
+ *             o[tail] = root
+ *             part[root] = 1             # <<<<<<<<<<<<<<
+ *             tail += 1
+ *             while head < tail:
+ */
+          (__pyx_v_part[__pyx_v_root]) = 1;
+
+          /* "scipy/sparse/_graph_tools.pyx":628
+ *             o[tail] = root
+ *             part[root] = 1
+ *             tail += 1             # <<<<<<<<<<<<<<
+ *             while head < tail:
+ *                 i = o[head]
+ */
+          __pyx_v_tail = (__pyx_v_tail + 1);
+
+          /* "scipy/sparse/_graph_tools.pyx":629
+ *             part[root] = 1
+ *             tail += 1
+ *             while head < tail:             # <<<<<<<<<<<<<<
+ *                 i = o[head]
+ *                 head += 1
+ */
+          while (1) {
+            __pyx_t_2 = (__pyx_v_head < __pyx_v_tail);
+            if (!__pyx_t_2) break;
+
+            /* "scipy/sparse/_graph_tools.pyx":630
+ *             tail += 1
+ *             while head < tail:
+ *                 i = o[head]             # <<<<<<<<<<<<<<
+ *                 head += 1
+ *                 first = tail
+ */
+            __pyx_v_i = (__pyx_v_o[__pyx_v_head]);
+
+            /* "scipy/sparse/_graph_tools.pyx":631
+ *             while head < tail:
+ *                 i = o[head]
+ *                 head += 1             # <<<<<<<<<<<<<<
+ *                 first = tail
+ *                 for k in range(ap[i], ap[i + 1]):
+ */
+            __pyx_v_head = (__pyx_v_head + 1);
+
+            /* "scipy/sparse/_graph_tools.pyx":632
+ *                 i = o[head]
+ *                 head += 1
+ *                 first = tail             # <<<<<<<<<<<<<<
+ *                 for k in range(ap[i], ap[i + 1]):
+ *                     j = aj[k]
+ */
+            __pyx_v_first = __pyx_v_tail;
+
+            /* "scipy/sparse/_graph_tools.pyx":633
+ *                 head += 1
+ *                 first = tail
+ *                 for k in range(ap[i], ap[i + 1]):             # <<<<<<<<<<<<<<
+ *                     j = aj[k]
+ *                     if not part[j]:
+ */
+            __pyx_t_9 = (__pyx_v_ap[(__pyx_v_i + 1)]);
+            for (__pyx_t_10 = (__pyx_v_ap[__pyx_v_i]); __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+              __pyx_v_k = __pyx_t_10;
+
+              /* "scipy/sparse/_graph_tools.pyx":634
+ *                 first = tail
+ *                 for k in range(ap[i], ap[i + 1]):
+ *                     j = aj[k]             # <<<<<<<<<<<<<<
+ *                     if not part[j]:
+ *                         part[j] = 1
+ */
+              __pyx_v_j = (__pyx_v_aj[__pyx_v_k]);
+
+              /* "scipy/sparse/_graph_tools.pyx":635
+ *                 for k in range(ap[i], ap[i + 1]):
+ *                     j = aj[k]
+ *                     if not part[j]:             # <<<<<<<<<<<<<<
+ *                         part[j] = 1
+ *                         o[tail] = j
+ */
+              __pyx_t_2 = (!(__pyx_v_part[__pyx_v_j]));
+              if (__pyx_t_2) {
+
+                /* "scipy/sparse/_graph_tools.pyx":636
+ *                     j = aj[k]
+ *                     if not part[j]:
+ *                         part[j] = 1             # <<<<<<<<<<<<<<
+ *                         o[tail] = j
+ *                         tail += 1
+ */
+                (__pyx_v_part[__pyx_v_j]) = 1;
+
+                /* "scipy/sparse/_graph_tools.pyx":637
+ *                     if not part[j]:
+ *                         part[j] = 1
+ *                         o[tail] = j             # <<<<<<<<<<<<<<
+ *                         tail += 1
+ *                 n_new = tail - first
+ */
+                (__pyx_v_o[__pyx_v_tail]) = __pyx_v_j;
+
+                /* "scipy/sparse/_graph_tools.pyx":638
+ *                         part[j] = 1
+ *                         o[tail] = j
+ *                         tail += 1             # <<<<<<<<<<<<<<
+ *                 n_new = tail - first
+ *                 if n_new > 1:
+ */
+                __pyx_v_tail = (__pyx_v_tail + 1);
+                goto __pyx_L19;
+              }
+              __pyx_L19:;
+            }
+
+            /* "scipy/sparse/_graph_tools.pyx":639
+ *                         o[tail] = j
+ *                         tail += 1
+ *                 n_new = tail - first             # <<<<<<<<<<<<<<
+ *                 if n_new > 1:
+ *                     for k in range(n_new):
+ */
+            __pyx_v_n_new = (__pyx_v_tail - __pyx_v_first);
+
+            /* "scipy/sparse/_graph_tools.pyx":640
+ *                         tail += 1
+ *                 n_new = tail - first
+ *                 if n_new > 1:             # <<<<<<<<<<<<<<
+ *                     for k in range(n_new):
+ *                         j = o[first + k]
+ */
+            __pyx_t_2 = (__pyx_v_n_new > 1);
+            if (__pyx_t_2) {
+
+              /* "scipy/sparse/_graph_tools.pyx":641
+ *                 n_new = tail - first
+ *                 if n_new > 1:
+ *                     for k in range(n_new):             # <<<<<<<<<<<<<<
+ *                         j = o[first + k]
+ *                         keys[k] = ((<np.int64_t>degree[j]) << 32) | j
+ */
+              __pyx_t_9 = __pyx_v_n_new;
+              for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+                __pyx_v_k = __pyx_t_10;
+
+                /* "scipy/sparse/_graph_tools.pyx":642
+ *                 if n_new > 1:
+ *                     for k in range(n_new):
+ *                         j = o[first + k]             # <<<<<<<<<<<<<<
+ *                         keys[k] = ((<np.int64_t>degree[j]) << 32) | j
+ *                     qsort(keys, n_new, sizeof(np.int64_t), _compare_keys)
+ */
+                __pyx_v_j = (__pyx_v_o[(__pyx_v_first + __pyx_v_k)]);
+
+                /* "scipy/sparse/_graph_tools.pyx":643
+ *                     for k in range(n_new):
+ *                         j = o[first + k]
+ *                         keys[k] = ((<np.int64_t>degree[j]) << 32) | j             # <<<<<<<<<<<<<<
+ *                     qsort(keys, n_new, sizeof(np.int64_t), _compare_keys)
+ *                     for k in range(n_new):
+ */
+                (__pyx_v_keys[__pyx_v_k]) = ((((__pyx_t_5numpy_int64_t)(__pyx_v_degree[__pyx_v_j])) << 32) | __pyx_v_j);
+              }
+
+              /* "scipy/sparse/_graph_tools.pyx":644
+ *                         j = o[first + k]
+ *                         keys[k] = ((<np.int64_t>degree[j]) << 32) | j
+ *                     qsort(keys, n_new, sizeof(np.int64_t), _compare_keys)             # <<<<<<<<<<<<<<
+ *                     for k in range(n_new):
+ *                         o[first + k] = <int>(keys[k] - ((keys[k] >> 32) << 32))
+ */
+              qsort(__pyx_v_keys, __pyx_v_n_new, (sizeof(__pyx_t_5numpy_int64_t)), __pyx_f_5scipy_6sparse_12_graph_tools__compare_keys);
+
+              /* "scipy/sparse/_graph_tools.pyx":645
+ *                         keys[k] = ((<np.int64_t>degree[j]) << 32) | j
+ *                     qsort(keys, n_new, sizeof(np.int64_t), _compare_keys)
+ *                     for k in range(n_new):             # <<<<<<<<<<<<<<
+ *                         o[first + k] = <int>(keys[k] - ((keys[k] >> 32) << 32))
+ * 
+ */
+              __pyx_t_9 = __pyx_v_n_new;
+              for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+                __pyx_v_k = __pyx_t_10;
+
+                /* "scipy/sparse/_graph_tools.pyx":646
+ *                     qsort(keys, n_new, sizeof(np.int64_t), _compare_keys)
+ *                     for k in range(n_new):
+ *                         o[first + k] = <int>(keys[k] - ((keys[k] >> 32) << 32))             # <<<<<<<<<<<<<<
+ * 
+ *         for i in range(N // 2):
+ */
+                (__pyx_v_o[(__pyx_v_first + __pyx_v_k)]) = ((int)((__pyx_v_keys[__pyx_v_k]) - (((__pyx_v_keys[__pyx_v_k]) >> 32) << 32)));
+              }
+              goto __pyx_L20;
+            }
+            __pyx_L20:;
+          }
+          __pyx_L12_continue:;
+        }
+
+        /* "scipy/sparse/_graph_tools.pyx":648
+ *                         o[first + k] = <int>(keys[k] - ((keys[k] >> 32) << 32))
+ * 
+ *         for i in range(N // 2):             # <<<<<<<<<<<<<<
+ *             tmp = o[i]
+ *             o[i] = o[N - 1 - i]
+ */
+        __pyx_t_11 = __Pyx_div_long(__pyx_v_N, 2);
+        for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_11; __pyx_t_7+=1) {
+          __pyx_v_i = __pyx_t_7;
+
+          /* "scipy/sparse/_graph_tools.pyx":649
+ * 
+ *         for i in range(N // 2):
+ *             tmp = o[i]             # <<<<<<<<<<<<<<
+ *             o[i] = o[N - 1 - i]
+ *             o[N - 1 - i] = tmp
+ */
+          __pyx_v_tmp = (__pyx_v_o[__pyx_v_i]);
+
+          /* "scipy/sparse/_graph_tools.pyx":650
+ *         for i in range(N // 2):
+ *             tmp = o[i]
+ *             o[i] = o[N - 1 - i]             # <<<<<<<<<<<<<<
+ *             o[N - 1 - i] = tmp
+ * 
+ */
+          (__pyx_v_o[__pyx_v_i]) = (__pyx_v_o[((__pyx_v_N - 1) - __pyx_v_i)]);
+
+          /* "scipy/sparse/_graph_tools.pyx":651
+ *             tmp = o[i]
+ *             o[i] = o[N - 1 - i]
+ *             o[N - 1 - i] = tmp             # <<<<<<<<<<<<<<
+ * 
+ *     free(degree)
+ */
+          (__pyx_v_o[((__pyx_v_N - 1) - __pyx_v_i)]) = __pyx_v_tmp;
+        }
+      }
+
+      /* "scipy/sparse/_graph_tools.pyx":613
+ *         raise MemoryError()
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         _degrees(N, ap, aj, degree)
+ *         for i in range(N):
+ */
+      /*finally:*/ {
+        Py_BLOCK_THREADS
+      }
+  }
+
+  /* "scipy/sparse/_graph_tools.pyx":653
+ *             o[N - 1 - i] = tmp
+ * 
+ *     free(degree)             # <<<<<<<<<<<<<<
+ *     free(level)
+ *     free(queue)
+ */
+  free(__pyx_v_degree);
+
+  /* "scipy/sparse/_graph_tools.pyx":654
+ * 
+ *     free(degree)
+ *     free(level)             # <<<<<<<<<<<<<<
+ *     free(queue)
+ *     free(part)
+ */
+  free(__pyx_v_level);
+
+  /* "scipy/sparse/_graph_tools.pyx":655
+ *     free(degree)
+ *     free(level)
+ *     free(queue)             # <<<<<<<<<<<<<<
+ *     free(part)
+ *     free(keys)
+ */
+  free(__pyx_v_queue);
+
+  /* "scipy/sparse/_graph_tools.pyx":656
+ *     free(level)
+ *     free(queue)
+ *     free(part)             # <<<<<<<<<<<<<<
+ *     free(keys)
+ * 
+ */
+  free(__pyx_v_part);
+
+  /* "scipy/sparse/_graph_tools.pyx":657
+ *     free(queue)
+ *     free(part)
+ *     free(keys)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  free(__pyx_v_keys);
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("scipy.sparse._graph_tools.reverse_cuthill_mckee", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "scipy/sparse/_graph_tools.pyx":661
+ * 
+ * @cython.boundscheck(False)
+ * def nested_dissection(np.ndarray Ap, np.ndarray Aj, np.ndarray order,             # <<<<<<<<<<<<<<
+ *                       int leaf_size):
+ *     """Nested dissection ordering of a symmetric pattern.
+ */
+
+static PyObject *__pyx_pf_5scipy_6sparse_12_graph_tools_8nested_dissection(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5scipy_6sparse_12_graph_tools_8nested_dissection[] = "Nested dissection ordering of a symmetric pattern.\n\n    Each subgraph larger than `leaf_size` is split by the middle level of\n    a breadth-first level structure rooted at a pseudo-peripheral node;\n    the two halves are ordered recursively, followed by the separator.\n    Disconnected subgraphs are split into their components first.\n    `order` (length N) receives the permutation.\n    ";
+static PyMethodDef __pyx_mdef_5scipy_6sparse_12_graph_tools_8nested_dissection = {__Pyx_NAMESTR("nested_dissection"), (PyCFunction)__pyx_pf_5scipy_6sparse_12_graph_tools_8nested_dissection, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_5scipy_6sparse_12_graph_tools_8nested_dissection)};
+static PyObject *__pyx_pf_5scipy_6sparse_12_graph_tools_8nested_dissection(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_Ap = 0;
+  PyArrayObject *__pyx_v_Aj = 0;
+  PyArrayObject *__pyx_v_order = 0;
+  int __pyx_v_leaf_size;
+  int __pyx_v_N;
+  int *__pyx_v_ap;
+  int *__pyx_v_aj;
+  int *__pyx_v_nodes;
+  int __pyx_v_i;
+  int __pyx_v_k;
+  int __pyx_v_n;
+  int __pyx_v_size;
+  int __pyx_v_start;
+  int __pyx_v_end;
+  int __pyx_v_root;
+  int __pyx_v_ecc;
+  int __pyx_v_sep;
+  int __pyx_v_a;
+  int __pyx_v_b;
+  int __pyx_v_n_rest;
+  int __pyx_v_tag;
+  int __pyx_v_n_tasks;
+  int *__pyx_v_degree;
+  int *__pyx_v_level;
+  int *__pyx_v_queue;
+  int *__pyx_v_part;
+  int *__pyx_v_tasks;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__Ap,&__pyx_n_s__Aj,&__pyx_n_s__order,&__pyx_n_s__leaf_size,0};
+  __Pyx_RefNannySetupContext("nested_dissection");
+  __pyx_self = __pyx_self;
+  {
+    PyObject* values[4] = {0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  0:
+        values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Ap);
+        if (likely(values[0])) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__Aj);
+        if (likely(values[1])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("nested_dissection", 1, 4, 4, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 661; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  2:
+        values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__order);
+        if (likely(values[2])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("nested_dissection", 1, 4, 4, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 661; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  3:
+        values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__leaf_size);
+        if (likely(values[3])) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("nested_dissection", 1, 4, 4, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 661; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "nested_dissection") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 661; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+    }
+    __pyx_v_Ap = ((PyArrayObject *)values[0]);
+    __pyx_v_Aj = ((PyArrayObject *)values[1]);
+    __pyx_v_order = ((PyArrayObject *)values[2]);
+    __pyx_v_leaf_size = __Pyx_PyInt_AsInt(values[3]); if (unlikely((__pyx_v_leaf_size == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 662; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("nested_dissection", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 661; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("scipy.sparse._graph_tools.nested_dissection", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Ap), __pyx_ptype_5numpy_ndarray, 1, "Ap", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 661; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_Aj), __pyx_ptype_5numpy_ndarray, 1, "Aj", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 661; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_order), __pyx_ptype_5numpy_ndarray, 1, "order", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 661; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "scipy/sparse/_graph_tools.pyx":671
+ *     `order` (length N) receives the permutation.
+ *     """
+ *     cdef int N = Ap.shape[0] - 1             # <<<<<<<<<<<<<<
+ *     cdef int* ap = <int*>Ap.data
+ *     cdef int* aj = <int*>Aj.data
+ */
+  __pyx_v_N = ((__pyx_v_Ap->dimensions[0]) - 1);
+
+  /* "scipy/sparse/_graph_tools.pyx":672
+ *     """
+ *     cdef int N = Ap.shape[0] - 1
+ *     cdef int* ap = <int*>Ap.data             # <<<<<<<<<<<<<<
+ *     cdef int* aj = <int*>Aj.data
+ *     cdef int* nodes = <int*>order.data
+ */
+  __pyx_v_ap = ((int *)__pyx_v_Ap->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":673
+ *     cdef int N = Ap.shape[0] - 1
+ *     cdef int* ap = <int*>Ap.data
+ *     cdef int* aj = <int*>Aj.data             # <<<<<<<<<<<<<<
+ *     cdef int* nodes = <int*>order.data
+ *     cdef int i, k, n, size, start, end, root, ecc, sep, a, b, n_rest
+ */
+  __pyx_v_aj = ((int *)__pyx_v_Aj->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":674
+ *     cdef int* ap = <int*>Ap.data
+ *     cdef int* aj = <int*>Aj.data
+ *     cdef int* nodes = <int*>order.data             # <<<<<<<<<<<<<<
+ *     cdef int i, k, n, size, start, end, root, ecc, sep, a, b, n_rest
+ *     cdef int tag = 0, n_tasks = 1
+ */
+  __pyx_v_nodes = ((int *)__pyx_v_order->data);
+
+  /* "scipy/sparse/_graph_tools.pyx":676
+ *     cdef int* nodes = <int*>order.data
+ *     cdef int i, k, n, size, start, end, root, ecc, sep, a, b, n_rest
+ *     cdef int tag = 0, n_tasks = 1             # <<<<<<<<<<<<<<
+ *     cdef int* degree = <int*>malloc((N + 1) * sizeof(int))
+ *     cdef int* level = <int*>malloc((N + 1) * sizeof(int))
+ */
+  __pyx_v_tag = 0;
+  __pyx_v_n_tasks = 1;
+
+  /* "scipy/sparse/_graph_tools.pyx":677
+ *     cdef int i, k, n, size, start, end, root, ecc, sep, a, b, n_rest
+ *     cdef int tag = 0, n_tasks = 1
+ *     cdef int* degree = <int*>malloc((N + 1) * sizeof(int))             # <<<<<<<<<<<<<<
+ *     cdef int* level = <int*>malloc((N + 1) * sizeof(int))
+ *     cdef int* queue = <int*>malloc((N + 1) * sizeof(int))
+ */
+  __pyx_v_degree = ((int *)malloc(((__pyx_v_N + 1) * (sizeof(int)))));
+
+  /* "scipy/sparse/_graph_tools.pyx":678
+ *     cdef int tag = 0, n_tasks = 1
+ *     cdef int* degree = <int*>malloc((N + 1) * sizeof(int))
+ *     cdef int* level = <int*>malloc((N + 1) * sizeof(int))             # <<<<<<<<<<<<<<
+ *     cdef int* queue = <int*>malloc((N + 1) * sizeof(int))
+ *     cdef int* part = <int*>malloc((N + 1) * sizeof(int))
+ */
+  __pyx_v_level = ((int *)malloc(((__pyx_v_N + 1) * (sizeof(int)))));
+
+  /* "scipy/sparse/_graph_tools.pyx":679
+ *     cdef int* degree = <int*>malloc((N + 1) * sizeof(int))
+ *     cdef int* level = <int*>malloc((N + 1) * sizeof(int))
+ *     cdef int* queue = <int*>malloc((N + 1) * sizeof(int))             # <<<<<<<<<<<<<<
+ *     cdef int* part = <int*>malloc((N + 1) * sizeof(int))
+ *     cdef int* tasks = <int*>malloc(2 * (N + 1) * sizeof(int))
+ */
+  __pyx_v_queue = ((int *)malloc(((__pyx_v_N + 1) * (sizeof(int)))));
+
+  /* "scipy/sparse/_graph_tools.pyx":680
+ *     cdef int* level = <int*>malloc((N + 1) * sizeof(int))
+ *     cdef int* queue = <int*>malloc((N + 1) * sizeof(int))
+ *     cdef int* part = <int*>malloc((N + 1) * sizeof(int))             # <<<<<<<<<<<<<<
+ *     cdef int* tasks = <int*>malloc(2 * (N + 1) * sizeof(int))
+ * 
+ */
+  __pyx_v_part = ((int *)malloc(((__pyx_v_N + 1) * (sizeof(int)))));
+
+  /* "scipy/sparse/_graph_tools.pyx":681
+ *     cdef int* queue = <int*>malloc((N + 1) * sizeof(int))
+ *     cdef int* part = <int*>malloc((N + 1) * sizeof(int))
+ *     cdef int* tasks = <int*>malloc(2 * (N + 1) * sizeof(int))             # <<<<<<<<<<<<<<
+ * 
+ *     if (degree == NULL or level == NULL or queue == NULL or part == NULL
+ */
+  __pyx_v_tasks = ((int *)malloc(((2 * (__pyx_v_N + 1)) * (sizeof(int)))));
+
+  /* "scipy/sparse/_graph_tools.pyx":683
+ *     cdef int* tasks = <int*>malloc(2 * (N + 1) * sizeof(int))
+ * 
+ *     if (degree == NULL or level == NULL or queue == NULL or part == NULL             # <<<<<<<<<<<<<<
+ *             or tasks == NULL):
+ *         free(degree)
+ */
+  __pyx_t_1 = (__pyx_v_degree == NULL);
+  if (!__pyx_t_1) {
+    __pyx_t_2 = (__pyx_v_level == NULL);
+    if (!__pyx_t_2) {
+      __pyx_t_3 = (__pyx_v_queue == NULL);
+      if (!__pyx_t_3) {
+
+        /* "scipy/sparse/_graph_tools.pyx":684
+ * 
+ *     if (degree == NULL or level == NULL or queue == NULL or part == NULL
+ *             or tasks == NULL):             # <<<<<<<<<<<<<<
+ *         free(degree)
+ *         free(level)
+ */
+        __pyx_t_4 = (__pyx_v_part == NULL);
+        if (!__pyx_t_4) {
+          __pyx_t_5 = (__pyx_v_tasks == NULL);
+          __pyx_t_6 = __pyx_t_5;
+        } else {
+          __pyx_t_6 = __pyx_t_4;
+        }
+        __pyx_t_4 = __pyx_t_6;
+      } else {
+        __pyx_t_4 = __pyx_t_3;
+      }
+      __pyx_t_3 = __pyx_t_4;
+    } else {
+      __pyx_t_3 = __pyx_t_2;
+    }
+    __pyx_t_2 = __pyx_t_3;
+  } else {
+    __pyx_t_2 = __pyx_t_1;
+  }
+  if (__pyx_t_2) {
+
+    /* "scipy/sparse/_graph_tools.pyx":685
+ *     if (degree == NULL or level == NULL or queue == NULL or part == NULL
+ *             or tasks == NULL):
+ *         free(degree)             # <<<<<<<<<<<<<<
+ *         free(level)
+ *         free(queue)
+ */
+    free(__pyx_v_degree);
+
+    /* "scipy/sparse/_graph_tools.pyx":686
+ *             or tasks == NULL):
+ *         free(degree)
+ *         free(level)             # <<<<<<<<<<<<<<
+ *         free(queue)
+ *         free(part)
+ */
+    free(__pyx_v_level);
+
+    /* "scipy/sparse/_graph_tools.pyx":687
+ *         free(degree)
+ *         free(level)
+ *         free(queue)             # <<<<<<<<<<<<<<
+ *         free(part)
+ *         free(tasks)
+ */
+    free(__pyx_v_queue);
+
+    /* "scipy/sparse/_graph_tools.pyx":688
+ *         free(level)
+ *         free(queue)
+ *         free(part)             # <<<<<<<<<<<<<<
+ *         free(tasks)
+ *         raise MemoryError()
+ */
+    free(__pyx_v_part);
+
+    /* "scipy/sparse/_graph_tools.pyx":689
+ *         free(queue)
+ *         free(part)
+ *         free(tasks)             # <<<<<<<<<<<<<<
+ *         raise MemoryError()
+ * 
+ */
+    free(__pyx_v_tasks);
+
+    /* "scipy/sparse/_graph_tools.pyx":690
+ *         free(part)
+ *         free(tasks)
+ *         raise MemoryError()             # <<<<<<<<<<<<<<
+ * 
+ *     with nogil:
+ */
+    PyErr_NoMemory(); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 690; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "scipy/sparse/_graph_tools.pyx":692
+ *         raise MemoryError()
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         _degrees(N, ap, aj, degree)
+ *         for i in range(N):
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save = NULL;
+      #endif
+      Py_UNBLOCK_THREADS
+      /*try:*/ {
+
+        /* "scipy/sparse/_graph_tools.pyx":693
+ * 
+ *     with nogil:
+ *         _degrees(N, ap, aj, degree)             # <<<<<<<<<<<<<<
+ *         for i in range(N):
+ *             nodes[i] = i
+ */
+        __pyx_f_5scipy_6sparse_12_graph_tools__degrees(__pyx_v_N, __pyx_v_ap, __pyx_v_aj, __pyx_v_degree);
+
+        /* "scipy/sparse/_graph_tools.pyx":694
+ *     with nogil:
+ *         _degrees(N, ap, aj, degree)
+ *         for i in range(N):             # <<<<<<<<<<<<<<
+ *             nodes[i] = i
+ *             level[i] = -1
+ */
+        __pyx_t_7 = __pyx_v_N;
+        for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+          __pyx_v_i = __pyx_t_8;
+
+          /* "scipy/sparse/_graph_tools.pyx":695
+ *         _degrees(N, ap, aj, degree)
+ *         for i in range(N):
+ *             nodes[i] = i             # <<<<<<<<<<<<<<
+ *             level[i] = -1
+ *         # the pending subgraphs are the segments nodes[start:end]; they
+ */
+          (__pyx_v_nodes[__pyx_v_i]) = __pyx_v_i;
+
+          /* "scipy/sparse/_graph_tools.pyx":696
+ *         for i in range(N):
+ *             nodes[i] = i
+ *             level[i] = -1             # <<<<<<<<<<<<<<
+ *         # the pending subgraphs are the segments nodes[start:end]; they
+ *         # are rearranged in place, so the final nodes[] is the ordering
+ */
+          (__pyx_v_level[__pyx_v_i]) = -1;
+        }
+
+        /* "scipy/sparse/_graph_tools.pyx":699
+ *         # the pending subgraphs are the segments nodes[start:end]; they
+ *         # are rearranged in place, so the final nodes[] is the ordering
+ *         tasks[0] = 0             # <<<<<<<<<<<<<<
+ *         tasks[1] = N
+ *         while n_tasks > 0:
+ */
+        (__pyx_v_tasks[0]) = 0;
+
+        /* "scipy/sparse/_graph_tools.pyx":700
+ *         # are rearranged in place, so the final nodes[] is the ordering
+ *         tasks[0] = 0
+ *         tasks[1] = N             # <<<<<<<<<<<<<<
+ *         while n_tasks > 0:
+ *             n_tasks -= 1
+ */
+        (__pyx_v_tasks[1]) = __pyx_v_N;
+
+        /* "scipy/sparse/_graph_tools.pyx":701
+ *         tasks[0] = 0
+ *         tasks[1] = N
+ *         while n_tasks > 0:             # <<<<<<<<<<<<<<
+ *             n_tasks -= 1
+ *             start = tasks[2 * n_tasks]
+ */
+        while (1) {
+          __pyx_t_2 = (__pyx_v_n_tasks > 0);
+          if (!__pyx_t_2) break;
+
+          /* "scipy/sparse/_graph_tools.pyx":702
+ *         tasks[1] = N
+ *         while n_tasks > 0:
+ *             n_tasks -= 1             # <<<<<<<<<<<<<<
+ *             start = tasks[2 * n_tasks]
+ *             end = tasks[2 * n_tasks + 1]
+ */
+          __pyx_v_n_tasks = (__pyx_v_n_tasks - 1);
+
+          /* "scipy/sparse/_graph_tools.pyx":703
+ *         while n_tasks > 0:
+ *             n_tasks -= 1
+ *             start = tasks[2 * n_tasks]             # <<<<<<<<<<<<<<
+ *             end = tasks[2 * n_tasks + 1]
+ *             size = end - start
+ */
+          __pyx_v_start = (__pyx_v_tasks[(2 * __pyx_v_n_tasks)]);
+
+          /* "scipy/sparse/_graph_tools.pyx":704
+ *             n_tasks -= 1
+ *             start = tasks[2 * n_tasks]
+ *             end = tasks[2 * n_tasks + 1]             # <<<<<<<<<<<<<<
+ *             size = end - start
+ *             if size <= leaf_size:
+ */
+          __pyx_v_end = (__pyx_v_tasks[((2 * __pyx_v_n_tasks) + 1)]);
+
+          /* "scipy/sparse/_graph_tools.pyx":705
+ *             start = tasks[2 * n_tasks]
+ *             end = tasks[2 * n_tasks + 1]
+ *             size = end - start             # <<<<<<<<<<<<<<
+ *             if size <= leaf_size:
+ *                 continue
+ */
+          __pyx_v_size = (__pyx_v_end - __pyx_v_start);
+
+          /* "scipy/sparse/_graph_tools.pyx":706
+ *             end = tasks[2 * n_tasks + 1]
+ *             size = end - start
+ *             if size <= leaf_size:             # <<<<<<<<<<<<<<
+ *                 continue
+ * 
+ */
+          __pyx_t_2 = (__pyx_v_size <= __pyx_v_leaf_size);
+          if (__pyx_t_2) {
+
+            /* "scipy/sparse/_graph_tools.pyx":707
+ *             size = end - start
+ *             if size <= leaf_size:
+ *                 continue             # <<<<<<<<<<<<<<
+ * 
+ *             tag += 1
+ */
+            goto __pyx_L12_continue;
+            goto __pyx_L14;
+          }
+          __pyx_L14:;
+
+          /* "scipy/sparse/_graph_tools.pyx":709
+ *                 continue
+ * 
+ *             tag += 1             # <<<<<<<<<<<<<<
+ *             for k in range(start, end):
+ *                 part[nodes[k]] = tag
+ */
+          __pyx_v_tag = (__pyx_v_tag + 1);
+
+          /* "scipy/sparse/_graph_tools.pyx":710
+ * 
+ *             tag += 1
+ *             for k in range(start, end):             # <<<<<<<<<<<<<<
+ *                 part[nodes[k]] = tag
+ * 
+ */
+          __pyx_t_7 = __pyx_v_end;
+          for (__pyx_t_8 = __pyx_v_start; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+            __pyx_v_k = __pyx_t_8;
+
+            /* "scipy/sparse/_graph_tools.pyx":711
+ *             tag += 1
+ *             for k in range(start, end):
+ *                 part[nodes[k]] = tag             # <<<<<<<<<<<<<<
+ * 
+ *             root = _peripheral(ap, aj, nodes[start], tag, part, degree,
+ */
+            (__pyx_v_part[(__pyx_v_nodes[__pyx_v_k])]) = __pyx_v_tag;
+          }
+
+          /* "scipy/sparse/_graph_tools.pyx":714
+ * 
+ *             root = _peripheral(ap, aj, nodes[start], tag, part, degree,
+ *                                level, queue)             # <<<<<<<<<<<<<<
+ *             n = _bfs(ap, aj, root, tag, part, level, queue)
+ * 
+ */
+          __pyx_v_root = __pyx_f_5scipy_6sparse_12_graph_tools__peripheral(__pyx_v_ap, __pyx_v_aj, (__pyx_v_nodes[__pyx_v_start]), __pyx_v_tag, __pyx_v_part, __pyx_v_degree, __pyx_v_level, __pyx_v_queue);
+
+          /* "scipy/sparse/_graph_tools.pyx":715
+ *             root = _peripheral(ap, aj, nodes[start], tag, part, degree,
+ *                                level, queue)
+ *             n = _bfs(ap, aj, root, tag, part, level, queue)             # <<<<<<<<<<<<<<
+ * 
+ *             if n < size:
+ */
+          __pyx_v_n = __pyx_f_5scipy_6sparse_12_graph_tools__bfs(__pyx_v_ap, __pyx_v_aj, __pyx_v_root, __pyx_v_tag, __pyx_v_part, __pyx_v_level, __pyx_v_queue);
+
+          /* "scipy/sparse/_graph_tools.pyx":717
+ *             n = _bfs(ap, aj, root, tag, part, level, queue)
+ * 
+ *             if n < size:             # <<<<<<<<<<<<<<
+ *                 # disconnected: the reached component, then the rest
+ *                 n_rest = n
+ */
+          __pyx_t_2 = (__pyx_v_n < __pyx_v_size);
+          if (__pyx_t_2) {
+
+            /* "scipy/sparse/_graph_tools.pyx":719
+ *             if n < size:
+ *                 # disconnected: the reached component, then the rest
+ *                 n_rest = n             # <<<<<<<<<<<<<<
+ *                 for k in range(start, end):
+ *                     if level[nodes[k]] < 0:
+ */
+            __pyx_v_n_rest = __pyx_v_n;
+
+            /* "scipy/sparse/_graph_tools.pyx":720
+ *                 # disconnected: the reached component, then the rest
+ *                 n_rest = n
+ *                 for k in range(start, end):             # <<<<<<<<<<<<<<
+ *                     if level[nodes[k]] < 0:
+ *                         queue[n_rest] = nodes[k]
+ */
+            __pyx_t_7 = __pyx_v_end;
+            for (__pyx_t_8 = __pyx_v_start; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+              __pyx_v_k = __pyx_t_8;
+
+              /* "scipy/sparse/_graph_tools.pyx":721
+ *                 n_rest = n
+ *                 for k in range(start, end):
+ *                     if level[nodes[k]] < 0:             # <<<<<<<<<<<<<<
+ *                         queue[n_rest] = nodes[k]
+ *                         n_rest += 1
+ */
+              __pyx_t_2 = ((__pyx_v_level[(__pyx_v_nodes[__pyx_v_k])]) < 0);
+              if (__pyx_t_2) {
+
+                /* "scipy/sparse/_graph_tools.pyx":722
+ *                 for k in range(start, end):
+ *                     if level[nodes[k]] < 0:
+ *                         queue[n_rest] = nodes[k]             # <<<<<<<<<<<<<<
+ *                         n_rest += 1
+ *                 for k in range(size):
+ */
+                (__pyx_v_queue[__pyx_v_n_rest]) = (__pyx_v_nodes[__pyx_v_k]);
+
+                /* "scipy/sparse/_graph_tools.pyx":723
+ *                     if level[nodes[k]] < 0:
+ *                         queue[n_rest] = nodes[k]
+ *                         n_rest += 1             # <<<<<<<<<<<<<<
+ *                 for k in range(size):
+ *                     nodes[start + k] = queue[k]
+ */
+                __pyx_v_n_rest = (__pyx_v_n_rest + 1);
+                goto __pyx_L20;
+              }
+              __pyx_L20:;
+            }
+
+            /* "scipy/sparse/_graph_tools.pyx":724
+ *                         queue[n_rest] = nodes[k]
+ *                         n_rest += 1
+ *                 for k in range(size):             # <<<<<<<<<<<<<<
+ *                     nodes[start + k] = queue[k]
+ *                 _reset(level, queue, n)
+ */
+            __pyx_t_7 = __pyx_v_size;
+            for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+              __pyx_v_k = __pyx_t_8;
+
+              /* "scipy/sparse/_graph_tools.pyx":725
+ *                         n_rest += 1
+ *                 for k in range(size):
+ *                     nodes[start + k] = queue[k]             # <<<<<<<<<<<<<<
+ *                 _reset(level, queue, n)
+ *                 tasks[2 * n_tasks] = start
+ */
+              (__pyx_v_nodes[(__pyx_v_start + __pyx_v_k)]) = (__pyx_v_queue[__pyx_v_k]);
+            }
+
+            /* "scipy/sparse/_graph_tools.pyx":726
+ *                 for k in range(size):
+ *                     nodes[start + k] = queue[k]
+ *                 _reset(level, queue, n)             # <<<<<<<<<<<<<<
+ *                 tasks[2 * n_tasks] = start
+ *                 tasks[2 * n_tasks + 1] = start + n
+ */
+            __pyx_f_5scipy_6sparse_12_graph_tools__reset(__pyx_v_level, __pyx_v_queue, __pyx_v_n);
+
+            /* "scipy/sparse/_graph_tools.pyx":727
+ *                     nodes[start + k] = queue[k]
+ *                 _reset(level, queue, n)
+ *                 tasks[2 * n_tasks] = start             # <<<<<<<<<<<<<<
+ *                 tasks[2 * n_tasks + 1] = start + n
+ *                 tasks[2 * n_tasks + 2] = start + n
+ */
+            (__pyx_v_tasks[(2 * __pyx_v_n_tasks)]) = __pyx_v_start;
+
+            /* "scipy/sparse/_graph_tools.pyx":728
+ *                 _reset(level, queue, n)
+ *                 tasks[2 * n_tasks] = start
+ *                 tasks[2 * n_tasks + 1] = start + n             # <<<<<<<<<<<<<<
+ *                 tasks[2 * n_tasks + 2] = start + n
+ *                 tasks[2 * n_tasks + 3] = end
+ */
+            (__pyx_v_tasks[((2 * __pyx_v_n_tasks) + 1)]) = (__pyx_v_start + __pyx_v_n);
+
+            /* "scipy/sparse/_graph_tools.pyx":729
+ *                 tasks[2 * n_tasks] = start
+ *                 tasks[2 * n_tasks + 1] = start + n
+ *                 tasks[2 * n_tasks + 2] = start + n             # <<<<<<<<<<<<<<
+ *                 tasks[2 * n_tasks + 3] = end
+ *                 n_tasks += 2
+ */
+            (__pyx_v_tasks[((2 * __pyx_v_n_tasks) + 2)]) = (__pyx_v_start + __pyx_v_n);
+
+            /* "scipy/sparse/_graph_tools.pyx":730
+ *                 tasks[2 * n_tasks + 1] = start + n
+ *                 tasks[2 * n_tasks + 2] = start + n
+ *                 tasks[2 * n_tasks + 3] = end             # <<<<<<<<<<<<<<
+ *                 n_tasks += 2
+ *                 continue
+ */
+            (__pyx_v_tasks[((2 * __pyx_v_n_tasks) + 3)]) = __pyx_v_end;
+
+            /* "scipy/sparse/_graph_tools.pyx":731
+ *                 tasks[2 * n_tasks + 2] = start + n
+ *                 tasks[2 * n_tasks + 3] = end
+ *                 n_tasks += 2             # <<<<<<<<<<<<<<
+ *                 continue
+ * 
+ */
+            __pyx_v_n_tasks = (__pyx_v_n_tasks + 2);
+
+            /* "scipy/sparse/_graph_tools.pyx":732
+ *                 tasks[2 * n_tasks + 3] = end
+ *                 n_tasks += 2
+ *                 continue             # <<<<<<<<<<<<<<
+ * 
+ *             ecc = level[queue[n - 1]]
+ */
+            goto __pyx_L12_continue;
+            goto __pyx_L17;
+          }
+          __pyx_L17:;
+
+          /* "scipy/sparse/_graph_tools.pyx":734
+ *                 continue
+ * 
+ *             ecc = level[queue[n - 1]]             # <<<<<<<<<<<<<<
+ *             if ecc < 2:
+ *                 # no level separates two nonempty parts
+ */
+          __pyx_v_ecc = (__pyx_v_level[(__pyx_v_queue[(__pyx_v_n - 1)])]);
+
+          /* "scipy/sparse/_graph_tools.pyx":735
+ * 
+ *             ecc = level[queue[n - 1]]
+ *             if ecc < 2:             # <<<<<<<<<<<<<<
+ *                 # no level separates two nonempty parts
+ *                 _reset(level, queue, n)
+ */
+          __pyx_t_2 = (__pyx_v_ecc < 2);
+          if (__pyx_t_2) {
+
+            /* "scipy/sparse/_graph_tools.pyx":737
+ *             if ecc < 2:
+ *                 # no level separates two nonempty parts
+ *                 _reset(level, queue, n)             # <<<<<<<<<<<<<<
+ *                 continue
+ * 
+ */
+            __pyx_f_5scipy_6sparse_12_graph_tools__reset(__pyx_v_level, __pyx_v_queue, __pyx_v_n);
+
+            /* "scipy/sparse/_graph_tools.pyx":738
+ *                 # no level separates two nonempty parts
+ *                 _reset(level, queue, n)
+ *                 continue             # <<<<<<<<<<<<<<
+ * 
+ *             # separator level: the one holding the median node, kept
+ */
+            goto __pyx_L12_continue;
+            goto __pyx_L23;
+          }
+          __pyx_L23:;
+
+          /* "scipy/sparse/_graph_tools.pyx":742
+ *             # separator level: the one holding the median node, kept
+ *             # strictly inside the level structure
+ *             sep = level[queue[n // 2]]             # <<<<<<<<<<<<<<
+ *             if sep < 1:
+ *                 sep = 1
+ */
+          __pyx_v_sep = (__pyx_v_level[(__pyx_v_queue[__Pyx_div_long(__pyx_v_n, 2)])]);
+
+          /* "scipy/sparse/_graph_tools.pyx":743
+ *             # strictly inside the level structure
+ *             sep = level[queue[n // 2]]
+ *             if sep < 1:             # <<<<<<<<<<<<<<
+ *                 sep = 1
+ *             elif sep > ecc - 1:
+ */
+          __pyx_t_2 = (__pyx_v_sep < 1);
+          if (__pyx_t_2) {
+
+            /* "scipy/sparse/_graph_tools.pyx":744
+ *             sep = level[queue[n // 2]]
+ *             if sep < 1:
+ *                 sep = 1             # <<<<<<<<<<<<<<
+ *             elif sep > ecc - 1:
+ *                 sep = ecc - 1
+ */
+            __pyx_v_sep = 1;
+            goto __pyx_L24;
+          }
+
+          /* "scipy/sparse/_graph_tools.pyx":745
+ *             if sep < 1:
+ *                 sep = 1
+ *             elif sep > ecc - 1:             # <<<<<<<<<<<<<<
+ *                 sep = ecc - 1
+ *             # levels are nondecreasing along the queue
+ */
+          __pyx_t_2 = (__pyx_v_sep > (__pyx_v_ecc - 1));
+          if (__pyx_t_2) {
+
+            /* "scipy/sparse/_graph_tools.pyx":746
+ *                 sep = 1
+ *             elif sep > ecc - 1:
+ *                 sep = ecc - 1             # <<<<<<<<<<<<<<
+ *             # levels are nondecreasing along the queue
+ *             a = 0
+ */
+            __pyx_v_sep = (__pyx_v_ecc - 1);
+            goto __pyx_L24;
+          }
+          __pyx_L24:;
+
+          /* "scipy/sparse/_graph_tools.pyx":748
+ *                 sep = ecc - 1
+ *             # levels are nondecreasing along the queue
+ *             a = 0             # <<<<<<<<<<<<<<
+ *             while level[queue[a]] < sep:
+ *                 a += 1
+ */
+          __pyx_v_a = 0;
+
+          /* "scipy/sparse/_graph_tools.pyx":749
+ *             # levels are nondecreasing along the queue
+ *             a = 0
+ *             while level[queue[a]] < sep:             # <<<<<<<<<<<<<<
+ *                 a += 1
+ *             b = a
+ */
+          while (1) {
+            __pyx_t_2 = ((__pyx_v_level[(__pyx_v_queue[__pyx_v_a])]) < __pyx_v_sep);
+            if (!__pyx_t_2) break;
+
+            /* "scipy/sparse/_graph_tools.pyx":750
+ *             a = 0
+ *             while level[queue[a]] < sep:
+ *                 a += 1             # <<<<<<<<<<<<<<
+ *             b = a
+ *             while level[queue[b]] == sep:
+ */
+            __pyx_v_a = (__pyx_v_a + 1);
+          }
+
+          /* "scipy/sparse/_graph_tools.pyx":751
+ *             while level[queue[a]] < sep:
+ *                 a += 1
+ *             b = a             # <<<<<<<<<<<<<<
+ *             while level[queue[b]] == sep:
+ *                 b += 1
+ */
+          __pyx_v_b = __pyx_v_a;
+
+          /* "scipy/sparse/_graph_tools.pyx":752
+ *                 a += 1
+ *             b = a
+ *             while level[queue[b]] == sep:             # <<<<<<<<<<<<<<
+ *                 b += 1
+ * 
+ */
+          while (1) {
+            __pyx_t_2 = ((__pyx_v_level[(__pyx_v_queue[__pyx_v_b])]) == __pyx_v_sep);
+            if (!__pyx_t_2) break;
+
+            /* "scipy/sparse/_graph_tools.pyx":753
+ *             b = a
+ *             while level[queue[b]] == sep:
+ *                 b += 1             # <<<<<<<<<<<<<<
+ * 
+ *             # nodes[start:end] becomes [levels < sep, levels > sep, sep]
+ */
+            __pyx_v_b = (__pyx_v_b + 1);
+          }
+
+          /* "scipy/sparse/_graph_tools.pyx":756
+ * 
+ *             # nodes[start:end] becomes [levels < sep, levels > sep, sep]
+ *             for k in range(a):             # <<<<<<<<<<<<<<
+ *                 nodes[start + k] = queue[k]
+ *             for k in range(b, n):
+ */
+          __pyx_t_7 = __pyx_v_a;
+          for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+            __pyx_v_k = __pyx_t_8;
+
+            /* "scipy/sparse/_graph_tools.pyx":757
+ *             # nodes[start:end] becomes [levels < sep, levels > sep, sep]
+ *             for k in range(a):
+ *                 nodes[start + k] = queue[k]             # <<<<<<<<<<<<<<
+ *             for k in range(b, n):
+ *                 nodes[start + a + k - b] = queue[k]
+ */
+            (__pyx_v_nodes[(__pyx_v_start + __pyx_v_k)]) = (__pyx_v_queue[__pyx_v_k]);
+          }
+
+          /* "scipy/sparse/_graph_tools.pyx":758
+ *             for k in range(a):
+ *                 nodes[start + k] = queue[k]
+ *             for k in range(b, n):             # <<<<<<<<<<<<<<
+ *                 nodes[start + a + k - b] = queue[k]
+ *             for k in range(a, b):
+ */
+          __pyx_t_7 = __pyx_v_n;
+          for (__pyx_t_8 = __pyx_v_b; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+            __pyx_v_k = __pyx_t_8;
+
+            /* "scipy/sparse/_graph_tools.pyx":759
+ *                 nodes[start + k] = queue[k]
+ *             for k in range(b, n):
+ *                 nodes[start + a + k - b] = queue[k]             # <<<<<<<<<<<<<<
+ *             for k in range(a, b):
+ *                 nodes[end - b + k] = queue[k]
+ */
+            (__pyx_v_nodes[(((__pyx_v_start + __pyx_v_a) + __pyx_v_k) - __pyx_v_b)]) = (__pyx_v_queue[__pyx_v_k]);
+          }
+
+          /* "scipy/sparse/_graph_tools.pyx":760
+ *             for k in range(b, n):
+ *                 nodes[start + a + k - b] = queue[k]
+ *             for k in range(a, b):             # <<<<<<<<<<<<<<
+ *                 nodes[end - b + k] = queue[k]
+ *             _reset(level, queue, n)
+ */
+          __pyx_t_7 = __pyx_v_b;
+          for (__pyx_t_8 = __pyx_v_a; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+            __pyx_v_k = __pyx_t_8;
+
+            /* "scipy/sparse/_graph_tools.pyx":761
+ *                 nodes[start + a + k - b] = queue[k]
+ *             for k in range(a, b):
+ *                 nodes[end - b + k] = queue[k]             # <<<<<<<<<<<<<<
+ *             _reset(level, queue, n)
+ * 
+ */
+            (__pyx_v_nodes[((__pyx_v_end - __pyx_v_b) + __pyx_v_k)]) = (__pyx_v_queue[__pyx_v_k]);
+          }
+
+          /* "scipy/sparse/_graph_tools.pyx":762
+ *             for k in range(a, b):
+ *                 nodes[end - b + k] = queue[k]
+ *             _reset(level, queue, n)             # <<<<<<<<<<<<<<
+ * 
+ *             tasks[2 * n_tasks] = start
+ */
+          __pyx_f_5scipy_6sparse_12_graph_tools__reset(__pyx_v_level, __pyx_v_queue, __pyx_v_n);
+
+          /* "scipy/sparse/_graph_tools.pyx":764
+ *             _reset(level, queue, n)
+ * 
+ *             tasks[2 * n_tasks] = start             # <<<<<<<<<<<<<<
+ *             tasks[2 * n_tasks + 1] = start + a
+ *             tasks[2 * n_tasks + 2] = start + a
+ */
+          (__pyx_v_tasks[(2 * __pyx_v_n_tasks)]) = __pyx_v_start;
+
+          /* "scipy/sparse/_graph_tools.pyx":765
+ * 
+ *             tasks[2 * n_tasks] = start
+ *             tasks[2 * n_tasks + 1] = start + a             # <<<<<<<<<<<<<<
+ *             tasks[2 * n_tasks + 2] = start + a
+ *             tasks[2 * n_tasks + 3] = start + a + n - b
+ */
+          (__pyx_v_tasks[((2 * __pyx_v_n_tasks) + 1)]) = (__pyx_v_start + __pyx_v_a);
+
+          /* "scipy/sparse/_graph_tools.pyx":766
+ *             tasks[2 * n_tasks] = start
+ *             tasks[2 * n_tasks + 1] = start + a
+ *             tasks[2 * n_tasks + 2] = start + a             # <<<<<<<<<<<<<<
+ *             tasks[2 * n_tasks + 3] = start + a + n - b
+ *             n_tasks += 2
+ */
+          (__pyx_v_tasks[((2 * __pyx_v_n_tasks) + 2)]) = (__pyx_v_start + __pyx_v_a);
+
+          /* "scipy/sparse/_graph_tools.pyx":767
+ *             tasks[2 * n_tasks + 1] = start + a
+ *             tasks[2 * n_tasks + 2] = start + a
+ *             tasks[2 * n_tasks + 3] = start + a + n - b             # <<<<<<<<<<<<<<
+ *             n_tasks += 2
+ * 
+ */
+          (__pyx_v_tasks[((2 * __pyx_v_n_tasks) + 3)]) = (((__pyx_v_start + __pyx_v_a) + __pyx_v_n) - __pyx_v_b);
+
+          /* "scipy/sparse/_graph_tools.pyx":768
+ *             tasks[2 * n_tasks + 2] = start + a
+ *             tasks[2 * n_tasks + 3] = start + a + n - b
+ *             n_tasks += 2             # <<<<<<<<<<<<<<
+ * 
+ *     free(degree)
+ */
+          __pyx_v_n_tasks = (__pyx_v_n_tasks + 2);
+          __pyx_L12_continue:;
+        }
+      }
+
+      /* "scipy/sparse/_graph_tools.pyx":692
+ *         raise MemoryError()
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         _degrees(N, ap, aj, degree)
+ *         for i in range(N):
+ */
+      /*finally:*/ {
+        Py_BLOCK_THREADS
+      }
+  }
+
+  /* "scipy/sparse/_graph_tools.pyx":770
+ *             n_tasks += 2
+ * 
+ *     free(degree)             # <<<<<<<<<<<<<<
+ *     free(level)
+ *     free(queue)
+ */
+  free(__pyx_v_degree);
+
+  /* "scipy/sparse/_graph_tools.pyx":771
+ * 
+ *     free(degree)
+ *     free(level)             # <<<<<<<<<<<<<<
+ *     free(queue)
+ *     free(part)
+ */
+  free(__pyx_v_level);
+
+  /* "scipy/sparse/_graph_tools.pyx":772
+ *     free(degree)
+ *     free(level)
+ *     free(queue)             # <<<<<<<<<<<<<<
+ *     free(part)
+ *     free(tasks)
+ */
+  free(__pyx_v_queue);
+
+  /* "scipy/sparse/_graph_tools.pyx":773
+ *     free(level)
+ *     free(queue)
+ *     free(part)             # <<<<<<<<<<<<<<
+ *     free(tasks)
+ */
+  free(__pyx_v_part);
+
+  /* "scipy/sparse/_graph_tools.pyx":774
+ *     free(queue)
+ *     free(part)
+ *     free(tasks)             # <<<<<<<<<<<<<<
+ */
+  free(__pyx_v_tasks);
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("scipy.sparse._graph_tools.nested_dissection", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "numpy.pxd":190
+ *         # experimental exception made for __getbuffer__ and __releasebuffer__
+ *         # -- the details of this may change.
+ *         def __getbuffer__(ndarray self, Py_buffer* info, int flags):             # <<<<<<<<<<<<<<
+ *             # This implementation of getbuffer is geared towards Cython
+ *             # requirements, and does not yet fullfill the PEP.
+ */
+
+static CYTHON_UNUSED int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags); /*proto*/
+static CYTHON_UNUSED int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags) {
+  int __pyx_v_copy_shape;
+  int __pyx_v_i;
+  int __pyx_v_ndim;
+  int __pyx_v_endian_detector;
+  int __pyx_v_little_endian;
+  int __pyx_v_t;
+  char *__pyx_v_f;
+  PyArray_Descr *__pyx_v_descr = 0;
+  int __pyx_v_offset;
+  int __pyx_v_hasfields;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  char *__pyx_t_9;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__getbuffer__");
+  if (__pyx_v_info != NULL) {
+    __pyx_v_info->obj = Py_None; __Pyx_INCREF(Py_None);
+    __Pyx_GIVEREF(__pyx_v_info->obj);
+  }
+
+  /* "numpy.pxd":196
+ *             # of flags
+ * 
+ *             if info == NULL: return             # <<<<<<<<<<<<<<
+ * 
+ *             cdef int copy_shape, i, ndim
+ */
+  __pyx_t_1 = (__pyx_v_info == NULL);
+  if (__pyx_t_1) {
+    __pyx_r = 0;
+    goto __pyx_L0;
+    goto __pyx_L5;
+  }
+  __pyx_L5:;
+
+  /* "numpy.pxd":199
+ * 
+ *             cdef int copy_shape, i, ndim
+ *             cdef int endian_detector = 1             # <<<<<<<<<<<<<<
+ *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)
+ * 
+ */
+  __pyx_v_endian_detector = 1;
+
+  /* "numpy.pxd":200
+ *             cdef int copy_shape, i, ndim
+ *             cdef int endian_detector = 1
+ *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)             # <<<<<<<<<<<<<<
+ * 
+ *             ndim = PyArray_NDIM(self)
+ */
+  __pyx_v_little_endian = ((((char *)(&__pyx_v_endian_detector))[0]) != 0);
+
+  /* "numpy.pxd":202
+ *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)
+ * 
+ *             ndim = PyArray_NDIM(self)             # <<<<<<<<<<<<<<
+ * 
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
+ */
+  __pyx_v_ndim = PyArray_NDIM(((PyArrayObject *)__pyx_v_self));
+
+  /* "numpy.pxd":204
+ *             ndim = PyArray_NDIM(self)
+ * 
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
+ *                 copy_shape = 1
+ *             else:
+ */
+  __pyx_t_1 = ((sizeof(npy_intp)) != (sizeof(Py_ssize_t)));
+  if (__pyx_t_1) {
+
+    /* "numpy.pxd":205
+ * 
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
+ *                 copy_shape = 1             # <<<<<<<<<<<<<<
+ *             else:
+ *                 copy_shape = 0
+ */
+    __pyx_v_copy_shape = 1;
+    goto __pyx_L6;
+  }
+  /*else*/ {
+
+    /* "numpy.pxd":207
+ *                 copy_shape = 1
+ *             else:
+ *                 copy_shape = 0             # <<<<<<<<<<<<<<
+ * 
+ *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
+ */
+    __pyx_v_copy_shape = 0;
+  }
+  __pyx_L6:;
+
+  /* "numpy.pxd":209
+ *                 copy_shape = 0
+ * 
+ *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
+ *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not C contiguous")
+ */
+  __pyx_t_1 = ((__pyx_v_flags & PyBUF_C_CONTIGUOUS) == PyBUF_C_CONTIGUOUS);
+  if (__pyx_t_1) {
+
+    /* "numpy.pxd":210
+ * 
+ *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
+ *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):             # <<<<<<<<<<<<<<
+ *                 raise ValueError(u"ndarray is not C contiguous")
+ * 
+ */
+    __pyx_t_2 = (!PyArray_CHKFLAGS(((PyArrayObject *)__pyx_v_self), NPY_C_CONTIGUOUS));
+    __pyx_t_3 = __pyx_t_2;
+  } else {
+    __pyx_t_3 = __pyx_t_1;
+  }
+  if (__pyx_t_3) {
+
+    /* "numpy.pxd":211
+ *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
+ *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not C contiguous")             # <<<<<<<<<<<<<<
+ * 
+ *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
+ */
+    __pyx_t_4 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_2), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    {__pyx_filename = __pyx_f[1]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L7;
+  }
+  __pyx_L7:;
+
+  /* "numpy.pxd":213
+ *                 raise ValueError(u"ndarray is not C contiguous")
+ * 
+ *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
+ *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not Fortran contiguous")
+ */
+  __pyx_t_3 = ((__pyx_v_flags & PyBUF_F_CONTIGUOUS) == PyBUF_F_CONTIGUOUS);
+  if (__pyx_t_3) {
+
+    /* "numpy.pxd":214
+ * 
+ *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
+ *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):             # <<<<<<<<<<<<<<
+ *                 raise ValueError(u"ndarray is not Fortran contiguous")
+ * 
+ */
+    __pyx_t_1 = (!PyArray_CHKFLAGS(((PyArrayObject *)__pyx_v_self), NPY_F_CONTIGUOUS));
+    __pyx_t_2 = __pyx_t_1;
+  } else {
+    __pyx_t_2 = __pyx_t_3;
+  }
+  if (__pyx_t_2) {
+
+    /* "numpy.pxd":215
+ *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
+ *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not Fortran contiguous")             # <<<<<<<<<<<<<<
+ * 
+ *             info.buf = PyArray_DATA(self)
+ */
+    __pyx_t_4 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_4), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    {__pyx_filename = __pyx_f[1]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    goto __pyx_L8;
+  }
+  __pyx_L8:;
+
+  /* "numpy.pxd":217
+ *                 raise ValueError(u"ndarray is not Fortran contiguous")
+ * 
+ *             info.buf = PyArray_DATA(self)             # <<<<<<<<<<<<<<
+ *             info.ndim = ndim
+ *             if copy_shape:
+ */
+  __pyx_v_info->buf = PyArray_DATA(((PyArrayObject *)__pyx_v_self));
+
+  /* "numpy.pxd":218
+ * 
+ *             info.buf = PyArray_DATA(self)
+ *             info.ndim = ndim             # <<<<<<<<<<<<<<
+ *             if copy_shape:
+ *                 # Allocate new buffer for strides and shape info.
+ */
+  __pyx_v_info->ndim = __pyx_v_ndim;
+
+  /* "numpy.pxd":219
+ *             info.buf = PyArray_DATA(self)
+ *             info.ndim = ndim
+ *             if copy_shape:             # <<<<<<<<<<<<<<
+ *                 # Allocate new buffer for strides and shape info.
+ *                 # This is allocated as one block, strides first.
+ */
+  if (__pyx_v_copy_shape) {
+
+    /* "numpy.pxd":222
+ *                 # Allocate new buffer for strides and shape info.
+ *                 # This is allocated as one block, strides first.
+ *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * <size_t>ndim * 2)             # <<<<<<<<<<<<<<
+ *                 info.shape = info.strides + ndim
+ *                 for i in range(ndim):
+ */
+    __pyx_v_info->strides = ((Py_ssize_t *)malloc((((sizeof(Py_ssize_t)) * ((size_t)__pyx_v_ndim)) * 2)));
+
+    /* "numpy.pxd":223
+ *                 # This is allocated as one block, strides first.
+ *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * <size_t>ndim * 2)
+ *                 info.shape = info.strides + ndim             # <<<<<<<<<<<<<<
+ *                 for i in range(ndim):
+ *                     info.strides[i] = PyArray_STRIDES(self)[i]
+ */
+    __pyx_v_info->shape = (__pyx_v_info->strides + __pyx_v_ndim);
+
+    /* "numpy.pxd":224
+ *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * <size_t>ndim * 2)
+ *                 info.shape = info.strides + ndim
+ *                 for i in range(ndim):             # <<<<<<<<<<<<<<
+ *                     info.strides[i] = PyArray_STRIDES(self)[i]
+ *                     info.shape[i] = PyArray_DIMS(self)[i]
+ */
+    __pyx_t_5 = __pyx_v_ndim;
+    for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+      __pyx_v_i = __pyx_t_6;
+
+      /* "numpy.pxd":225
+ *                 info.shape = info.strides + ndim
+ *                 for i in range(ndim):
+ *                     info.strides[i] = PyArray_STRIDES(self)[i]             # <<<<<<<<<<<<<<
+ *                     info.shape[i] = PyArray_DIMS(self)[i]
+ *             else:
+ */
+      (__pyx_v_info->strides[__pyx_v_i]) = (PyArray_STRIDES(((PyArrayObject *)__pyx_v_self))[__pyx_v_i]);
+
+      /* "numpy.pxd":226
+ *                 for i in range(ndim):
+ *                     info.strides[i] = PyArray_STRIDES(self)[i]
+ *                     info.shape[i] = PyArray_DIMS(self)[i]             # <<<<<<<<<<<<<<
+ *             else:
+ *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
+ */
+      (__pyx_v_info->shape[__pyx_v_i]) = (PyArray_DIMS(((PyArrayObject *)__pyx_v_self))[__pyx_v_i]);
+    }
+    goto __pyx_L9;
+  }
+  /*else*/ {
+
+    /* "numpy.pxd":228
+ *                     info.shape[i] = PyArray_DIMS(self)[i]
+ *             else:
+ *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)             # <<<<<<<<<<<<<<
+ *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
+ *             info.suboffsets = NULL
+ */
+    __pyx_v_info->strides = ((Py_ssize_t *)PyArray_STRIDES(((PyArrayObject *)__pyx_v_self)));
+
+    /* "numpy.pxd":229
+ *             else:
+ *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
+ *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)             # <<<<<<<<<<<<<<
+ *             info.suboffsets = NULL
+ *             info.itemsize = PyArray_ITEMSIZE(self)
+ */
+    __pyx_v_info->shape = ((Py_ssize_t *)PyArray_DIMS(((PyArrayObject *)__pyx_v_self)));
+  }
+  __pyx_L9:;
+
+  /* "numpy.pxd":230
+ *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
+ *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
+ *             info.suboffsets = NULL             # <<<<<<<<<<<<<<
+ *             info.itemsize = PyArray_ITEMSIZE(self)
+ *             info.readonly = not PyArray_ISWRITEABLE(self)
+ */
+  __pyx_v_info->suboffsets = NULL;
+
+  /* "numpy.pxd":231
+ *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
+ *             info.suboffsets = NULL
+ *             info.itemsize = PyArray_ITEMSIZE(self)             # <<<<<<<<<<<<<<
+ *             info.readonly = not PyArray_ISWRITEABLE(self)
+ * 
+ */
+  __pyx_v_info->itemsize = PyArray_ITEMSIZE(((PyArrayObject *)__pyx_v_self));
+
+  /* "numpy.pxd":232
+ *             info.suboffsets = NULL
+ *             info.itemsize = PyArray_ITEMSIZE(self)
+ *             info.readonly = not PyArray_ISWRITEABLE(self)             # <<<<<<<<<<<<<<
+ * 
+ *             cdef int t
+ */
+  __pyx_v_info->readonly = (!PyArray_ISWRITEABLE(((PyArrayObject *)__pyx_v_self)));
+
+  /* "numpy.pxd":235
+ * 
+ *             cdef int t
+ *             cdef char* f = NULL             # <<<<<<<<<<<<<<
+ *             cdef dtype descr = self.descr
+ *             cdef list stack
+ */
+  __pyx_v_f = NULL;
+
+  /* "numpy.pxd":236
+ *             cdef int t
+ *             cdef char* f = NULL
+ *             cdef dtype descr = self.descr             # <<<<<<<<<<<<<<
+ *             cdef list stack
+ *             cdef int offset
+ */
+  __Pyx_INCREF(((PyObject *)((PyArrayObject *)__pyx_v_self)->descr));
+  __pyx_v_descr = ((PyArrayObject *)__pyx_v_self)->descr;
+
+  /* "numpy.pxd":240
+ *             cdef int offset
+ * 
+ *             cdef bint hasfields = PyDataType_HASFIELDS(descr)             # <<<<<<<<<<<<<<
+ * 
+ *             if not hasfields and not copy_shape:
+ */
+  __pyx_v_hasfields = PyDataType_HASFIELDS(__pyx_v_descr);
+
+  /* "numpy.pxd":242
+ *             cdef bint hasfields = PyDataType_HASFIELDS(descr)
+ * 
+ *             if not hasfields and not copy_shape:             # <<<<<<<<<<<<<<
+ *                 # do not call releasebuffer
+ *                 info.obj = None
+ */
+  __pyx_t_2 = (!__pyx_v_hasfields);
+  if (__pyx_t_2) {
+    __pyx_t_3 = (!__pyx_v_copy_shape);
+    __pyx_t_1 = __pyx_t_3;
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+  }
+  if (__pyx_t_1) {
+
+    /* "numpy.pxd":244
+ *             if not hasfields and not copy_shape:
+ *                 # do not call releasebuffer
+ *                 info.obj = None             # <<<<<<<<<<<<<<
+ *             else:
+ *                 # need to call releasebuffer
+ */
+    __Pyx_INCREF(Py_None);
+    __Pyx_GIVEREF(Py_None);
+    __Pyx_GOTREF(__pyx_v_info->obj);
+    __Pyx_DECREF(__pyx_v_info->obj);
+    __pyx_v_info->obj = Py_None;
+    goto __pyx_L12;
+  }
+  /*else*/ {
+
+    /* "numpy.pxd":247
+ *             else:
+ *                 # need to call releasebuffer
+ *                 info.obj = self             # <<<<<<<<<<<<<<
+ * 
+ *             if not hasfields:
+ */
+    __Pyx_INCREF(__pyx_v_self);
+    __Pyx_GIVEREF(__pyx_v_self);
+    __Pyx_GOTREF(__pyx_v_info->obj);
+    __Pyx_DECREF(__pyx_v_info->obj);
+    __pyx_v_info->obj = __pyx_v_self;
+  }
+  __pyx_L12:;
+
+  /* "numpy.pxd":249
+ *                 info.obj = self
+ * 
+ *             if not hasfields:             # <<<<<<<<<<<<<<
+ *                 t = descr.type_num
+ *                 if ((descr.byteorder == '>' and little_endian) or
+ */
+  __pyx_t_1 = (!__pyx_v_hasfields);
+  if (__pyx_t_1) {
+
+    /* "numpy.pxd":250
+ * 
+ *             if not hasfields:
+ *                 t = descr.type_num             # <<<<<<<<<<<<<<
+ *                 if ((descr.byteorder == '>' and little_endian) or
+ *                     (descr.byteorder == '<' and not little_endian)):
+ */
+    __pyx_v_t = __pyx_v_descr->type_num;
+
+    /* "numpy.pxd":251
+ *             if not hasfields:
+ *                 t = descr.type_num
+ *                 if ((descr.byteorder == '>' and little_endian) or             # <<<<<<<<<<<<<<
+ *                     (descr.byteorder == '<' and not little_endian)):
+ *                     raise ValueError(u"Non-native byte order not supported")
+ */
+    __pyx_t_1 = (__pyx_v_descr->byteorder == '>');
+    if (__pyx_t_1) {
+      __pyx_t_2 = __pyx_v_little_endian;
+    } else {
+      __pyx_t_2 = __pyx_t_1;
+    }
+    if (!__pyx_t_2) {
+
+      /* "numpy.pxd":252
+ *                 t = descr.type_num
+ *                 if ((descr.byteorder == '>' and little_endian) or
+ *                     (descr.byteorder == '<' and not little_endian)):             # <<<<<<<<<<<<<<
+ *                     raise ValueError(u"Non-native byte order not supported")
+ *                 if   t == NPY_BYTE:        f = "b"
+ */
+      __pyx_t_1 = (__pyx_v_descr->byteorder == '<');
+      if (__pyx_t_1) {
+        __pyx_t_3 = (!__pyx_v_little_endian);
+        __pyx_t_7 = __pyx_t_3;
+      } else {
+        __pyx_t_7 = __pyx_t_1;
+      }
+      __pyx_t_1 = __pyx_t_7;
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+    }
+    if (__pyx_t_1) {
+
+      /* "numpy.pxd":253
+ *                 if ((descr.byteorder == '>' and little_endian) or
+ *                     (descr.byteorder == '<' and not little_endian)):
+ *                     raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
+ *                 if   t == NPY_BYTE:        f = "b"
+ *                 elif t == NPY_UBYTE:       f = "B"
+ */
+      __pyx_t_4 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_6), NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 253; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      {__pyx_filename = __pyx_f[1]; __pyx_lineno = 253; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      goto __pyx_L14;
+    }
+    __pyx_L14:;
+
+    /* "numpy.pxd":254
+ *                     (descr.byteorder == '<' and not little_endian)):
+ *                     raise ValueError(u"Non-native byte order not supported")
+ *                 if   t == NPY_BYTE:        f = "b"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_UBYTE:       f = "B"
+ *                 elif t == NPY_SHORT:       f = "h"
+ */
+    __pyx_t_1 = (__pyx_v_t == NPY_BYTE);
+    if (__pyx_t_1) {
+      __pyx_v_f = __pyx_k__b;
+      goto __pyx_L15;
+    }
+
+    /* "numpy.pxd":255
+ *                     raise ValueError(u"Non-native byte order not supported")
+ *                 if   t == NPY_BYTE:        f = "b"
+ *                 elif t == NPY_UBYTE:       f = "B"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_SHORT:       f = "h"
+ *                 elif t == NPY_USHORT:      f = "H"
+ */
+    __pyx_t_1 = (__pyx_v_t == NPY_UBYTE);
+    if (__pyx_t_1) {
+      __pyx_v_f = __pyx_k__B;
+      goto __pyx_L15;
+    }
+
+    /* "numpy.pxd":256
+ *                 if   t == NPY_BYTE:        f = "b"
+ *                 elif t == NPY_UBYTE:       f = "B"
+ *                 elif t == NPY_SHORT:       f = "h"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_USHORT:      f = "H"
+ *                 elif t == NPY_INT:         f = "i"
+ */
+    __pyx_t_1 = (__pyx_v_t == NPY_SHORT);
+    if (__pyx_t_1) {
+      __pyx_v_f = __pyx_k__h;
+      goto __pyx_L15;
+    }
+
+    /* "numpy.pxd":257
+ *                 elif t == NPY_UBYTE:       f = "B"
+ *                 elif t == NPY_SHORT:       f = "h"
+ *                 elif t == NPY_USHORT:      f = "H"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_INT:         f = "i"
+ *                 elif t == NPY_UINT:        f = "I"
+ */
+    __pyx_t_1 = (__pyx_v_t == NPY_USHORT);
+    if (__pyx_t_1) {
+      __pyx_v_f = __pyx_k__H;
+      goto __pyx_L15;
+    }
+
+    /* "numpy.pxd":258
+ *                 elif t == NPY_SHORT:       f = "h"
+ *                 elif t == NPY_USHORT:      f = "H"
+ *                 elif t == NPY_INT:         f = "i"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_UINT:        f = "I"
+ *                 elif t == NPY_LONG:        f = "l"
+ */
+    __pyx_t_1 = (__pyx_v_t == NPY_INT);
+    if (__pyx_t_1) {
+      __pyx_v_f = __pyx_k__i;
+      goto __pyx_L15;
+    }
+
+    /* "numpy.pxd":259
+ *                 elif t == NPY_USHORT:      f = "H"
+ *                 elif t == NPY_INT:         f = "i"
+ *                 elif t == NPY_UINT:        f = "I"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_LONG:        f = "l"
+ *                 elif t == NPY_ULONG:       f = "L"
+ */
+    __pyx_t_1 = (__pyx_v_t == NPY_UINT);
+    if (__pyx_t_1) {
+      __pyx_v_f = __pyx_k__I;
+      goto __pyx_L15;
+    }
+
+    /* "numpy.pxd":260
+ *                 elif t == NPY_INT:         f = "i"
+ *                 elif t == NPY_UINT:        f = "I"
+ *                 elif t == NPY_LONG:        f = "l"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_ULONG:       f = "L"
+ *                 elif t == NPY_LONGLONG:    f = "q"
+ */
+    __pyx_t_1 = (__pyx_v_t == NPY_LONG);
+    if (__pyx_t_1) {
+      __pyx_v_f = __pyx_k__l;
+      goto __pyx_L15;
+    }
+
+    /* "numpy.pxd":261
+ *                 elif t == NPY_UINT:        f = "I"
+ *                 elif t == NPY_LONG:        f = "l"
+ *                 elif t == NPY_ULONG:       f = "L"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_LONGLONG:    f = "q"
+ *                 elif t == NPY_ULONGLONG:   f = "Q"
+ */
+    __pyx_t_1 = (__pyx_v_t == NPY_ULONG);
+    if (__pyx_t_1) {
+      __pyx_v_f = __pyx_k__L;
+      goto __pyx_L15;
+    }
+
+    /* "numpy.pxd":262
+ *                 elif t == NPY_LONG:        f = "l"
+ *                 elif t == NPY_ULONG:       f = "L"
+ *                 elif t == NPY_LONGLONG:    f = "q"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_ULONGLONG:   f = "Q"
+ *                 elif t == NPY_FLOAT:       f = "f"
+ */
+    __pyx_t_1 = (__pyx_v_t == NPY_LONGLONG);
+    if (__pyx_t_1) {
+      __pyx_v_f = __pyx_k__q;
+      goto __pyx_L15;
+    }
+
+    /* "numpy.pxd":263
+ *                 elif t == NPY_ULONG:       f = "L"
+ *                 elif t == NPY_LONGLONG:    f = "q"
+ *                 elif t == NPY_ULONGLONG:   f = "Q"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_FLOAT:       f = "f"
+ *                 elif t == NPY_DOUBLE:      f = "d"
+ */
+    __pyx_t_1 = (__pyx_v_t == NPY_ULONGLONG);
+    if (__pyx_t_1) {
+      __pyx_v_f = __pyx_k__Q;
+      goto __pyx_L15;
+    }
+
+    /* "numpy.pxd":264
+ *                 elif t == NPY_LONGLONG:    f = "q"
+ *                 elif t == NPY_ULONGLONG:   f = "Q"
+ *                 elif t == NPY_FLOAT:       f = "f"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_DOUBLE:      f = "d"
+ *                 elif t == NPY_LONGDOUBLE:  f = "g"
+ */
+    __pyx_t_1 = (__pyx_v_t == NPY_FLOAT);
+    if (__pyx_t_1) {
+      __pyx_v_f = __pyx_k__f;
+      goto __pyx_L15;
+    }
+
+    /* "numpy.pxd":265
+ *                 elif t == NPY_ULONGLONG:   f = "Q"
+ *                 elif t == NPY_FLOAT:       f = "f"
+ *                 elif t == NPY_DOUBLE:      f = "d"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_LONGDOUBLE:  f = "g"
+ *                 elif t == NPY_CFLOAT:      f = "Zf"
+ */
+    __pyx_t_1 = (__pyx_v_t == NPY_DOUBLE);
+    if (__pyx_t_1) {
+      __pyx_v_f = __pyx_k__d;
+      goto __pyx_L15;
+    }
+
+    /* "numpy.pxd":266
+ *                 elif t == NPY_FLOAT:       f = "f"
+ *                 elif t == NPY_DOUBLE:      f = "d"
+ *                 elif t == NPY_LONGDOUBLE:  f = "g"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_CFLOAT:      f = "Zf"
+ *                 elif t == NPY_CDOUBLE:     f = "Zd"
+ */
+    __pyx_t_1 = (__pyx_v_t == NPY_LONGDOUBLE);
+    if (__pyx_t_1) {
+      __pyx_v_f = __pyx_k__g;
+      goto __pyx_L15;
+    }
+
+    /* "numpy.pxd":267
+ *                 elif t == NPY_DOUBLE:      f = "d"
+ *                 elif t == NPY_LONGDOUBLE:  f = "g"
+ *                 elif t == NPY_CFLOAT:      f = "Zf"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_CDOUBLE:     f = "Zd"
+ *                 elif t == NPY_CLONGDOUBLE: f = "Zg"
+ */
+    __pyx_t_1 = (__pyx_v_t == NPY_CFLOAT);
+    if (__pyx_t_1) {
+      __pyx_v_f = __pyx_k__Zf;
+      goto __pyx_L15;
+    }
+
+    /* "numpy.pxd":268
+ *                 elif t == NPY_LONGDOUBLE:  f = "g"
+ *                 elif t == NPY_CFLOAT:      f = "Zf"
+ *                 elif t == NPY_CDOUBLE:     f = "Zd"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_CLONGDOUBLE: f = "Zg"
+ *                 elif t == NPY_OBJECT:      f = "O"
+ */
+    __pyx_t_1 = (__pyx_v_t == NPY_CDOUBLE);
+    if (__pyx_t_1) {
+      __pyx_v_f = __pyx_k__Zd;
+      goto __pyx_L15;
+    }
+
+    /* "numpy.pxd":269
+ *                 elif t == NPY_CFLOAT:      f = "Zf"
+ *                 elif t == NPY_CDOUBLE:     f = "Zd"
+ *                 elif t == NPY_CLONGDOUBLE: f = "Zg"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_OBJECT:      f = "O"
+ *                 else:
+ */
+    __pyx_t_1 = (__pyx_v_t == NPY_CLONGDOUBLE);
+    if (__pyx_t_1) {
+      __pyx_v_f = __pyx_k__Zg;
+      goto __pyx_L15;
+    }
+
+    /* "numpy.pxd":270
+ *                 elif t == NPY_CDOUBLE:     f = "Zd"
+ *                 elif t == NPY_CLONGDOUBLE: f = "Zg"
+ *                 elif t == NPY_OBJECT:      f = "O"             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
+ */
+    __pyx_t_1 = (__pyx_v_t == NPY_OBJECT);
+    if (__pyx_t_1) {
+      __pyx_v_f = __pyx_k__O;
+      goto __pyx_L15;
+    }
+    /*else*/ {
+
+      /* "numpy.pxd":272
+ *                 elif t == NPY_OBJECT:      f = "O"
+ *                 else:
+ *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)             # <<<<<<<<<<<<<<
+ *                 info.format = f
+ *                 return
+ */
+      __pyx_t_4 = PyInt_FromLong(__pyx_v_t); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 272; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_8 = PyNumber_Remainder(((PyObject *)__pyx_kp_u_7), __pyx_t_4); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 272; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(((PyObject *)__pyx_t_8));
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 272; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(((PyObject *)__pyx_t_4));
+      PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_t_8));
+      __Pyx_GIVEREF(((PyObject *)__pyx_t_8));
+      __pyx_t_8 = 0;
+      __pyx_t_8 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_t_4), NULL); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 272; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(((PyObject *)__pyx_t_4)); __pyx_t_4 = 0;
+      __Pyx_Raise(__pyx_t_8, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      {__pyx_filename = __pyx_f[1]; __pyx_lineno = 272; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    __pyx_L15:;
+
+    /* "numpy.pxd":273
+ *                 else:
+ *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
+ *                 info.format = f             # <<<<<<<<<<<<<<
+ *                 return
+ *             else:
+ */
+    __pyx_v_info->format = __pyx_v_f;
+
+    /* "numpy.pxd":274
+ *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
+ *                 info.format = f
+ *                 return             # <<<<<<<<<<<<<<
+ *             else:
+ *                 info.format = <char*>stdlib.malloc(_buffer_format_string_len)
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+    goto __pyx_L13;
+  }
+  /*else*/ {
+
+    /* "numpy.pxd":276
+ *                 return
+ *             else:
+ *                 info.format = <char*>stdlib.malloc(_buffer_format_string_len)             # <<<<<<<<<<<<<<
+ *                 info.format[0] = '^' # Native data types, manual alignment
+ *                 offset = 0
+ */
+    __pyx_v_info->format = ((char *)malloc(255));
+
+    /* "numpy.pxd":277
+ *             else:
+ *                 info.format = <char*>stdlib.malloc(_buffer_format_string_len)
+ *                 info.format[0] = '^' # Native data types, manual alignment             # <<<<<<<<<<<<<<
+ *                 offset = 0
+ *                 f = _util_dtypestring(descr, info.format + 1,
+ */
+    (__pyx_v_info->format[0]) = '^';
+
+    /* "numpy.pxd":278
+ *                 info.format = <char*>stdlib.malloc(_buffer_format_string_len)
+ *                 info.format[0] = '^' # Native data types, manual alignment
+ *                 offset = 0             # <<<<<<<<<<<<<<
+ *                 f = _util_dtypestring(descr, info.format + 1,
+ *                                       info.format + _buffer_format_string_len,
+ */
+    __pyx_v_offset = 0;
+
+    /* "numpy.pxd":281
+ *                 f = _util_dtypestring(descr, info.format + 1,
+ *                                       info.format + _buffer_format_string_len,
+ *                                       &offset)             # <<<<<<<<<<<<<<
+ *                 f[0] = 0 # Terminate format string
+ * 
+ */
+    __pyx_t_9 = __pyx_f_5numpy__util_dtypestring(__pyx_v_descr, (__pyx_v_info->format + 1), (__pyx_v_info->format + 255), (&__pyx_v_offset)); if (unlikely(__pyx_t_9 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 279; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_v_f = __pyx_t_9;
+
+    /* "numpy.pxd":282
+ *                                       info.format + _buffer_format_string_len,
+ *                                       &offset)
+ *                 f[0] = 0 # Terminate format string             # <<<<<<<<<<<<<<
+ * 
+ *         def __releasebuffer__(ndarray self, Py_buffer* info):
+ */
+    (__pyx_v_f[0]) = 0;
+  }
+  __pyx_L13:;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("numpy.ndarray.__getbuffer__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  if (__pyx_v_info != NULL && __pyx_v_info->obj != NULL) {
+    __Pyx_GOTREF(__pyx_v_info->obj);
+    __Pyx_DECREF(__pyx_v_info->obj); __pyx_v_info->obj = NULL;
+  }
+  goto __pyx_L2;
+  __pyx_L0:;
+  if (__pyx_v_info != NULL && __pyx_v_info->obj == Py_None) {
+    __Pyx_GOTREF(Py_None);
+    __Pyx_DECREF(Py_None); __pyx_v_info->obj = NULL;
+  }
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_descr);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "numpy.pxd":284
+ *                 f[0] = 0 # Terminate format string
+ * 
+ *         def __releasebuffer__(ndarray self, Py_buffer* info):             # <<<<<<<<<<<<<<
+ *             if PyArray_HASFIELDS(self):
+ *                 stdlib.free(info.format)
+ */
+
+static CYTHON_UNUSED void __pyx_pf_5numpy_7ndarray_1__releasebuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info); /*proto*/
+static CYTHON_UNUSED void __pyx_pf_5numpy_7ndarray_1__releasebuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("__releasebuffer__");
+
+  /* "numpy.pxd":285
+ * 
+ *         def __releasebuffer__(ndarray self, Py_buffer* info):
+ *             if PyArray_HASFIELDS(self):             # <<<<<<<<<<<<<<
+ *                 stdlib.free(info.format)
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
+ */
+  __pyx_t_1 = PyArray_HASFIELDS(((PyArrayObject *)__pyx_v_self));
+  if (__pyx_t_1) {
+
+    /* "numpy.pxd":286
+ *         def __releasebuffer__(ndarray self, Py_buffer* info):
+ *             if PyArray_HASFIELDS(self):
+ *                 stdlib.free(info.format)             # <<<<<<<<<<<<<<
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
+ *                 stdlib.free(info.strides)
+ */
+    free(__pyx_v_info->format);
+    goto __pyx_L5;
+  }
+  __pyx_L5:;
+
+  /* "numpy.pxd":287
+ *             if PyArray_HASFIELDS(self):
+ *                 stdlib.free(info.format)
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
+ *                 stdlib.free(info.strides)
+ *                 # info.shape was stored after info.strides in the same block
+ */
+  __pyx_t_1 = ((sizeof(npy_intp)) != (sizeof(Py_ssize_t)));
+  if (__pyx_t_1) {
+
+    /* "numpy.pxd":288
+ *                 stdlib.free(info.format)
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
+ *                 stdlib.free(info.strides)             # <<<<<<<<<<<<<<
+ *                 # info.shape was stored after info.strides in the same block
+ * 
+ */
+    free(__pyx_v_info->strides);
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "numpy.pxd":764
+ * ctypedef npy_cdouble     complex_t
+ * 
+ * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(1, <void*>a)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__pyx_v_a) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew1");
+
+  /* "numpy.pxd":765
+ * 
+ * cdef inline object PyArray_MultiIterNew1(a):
+ *     return PyArray_MultiIterNew(1, <void*>a)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew2(a, b):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(1, ((void *)__pyx_v_a)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 765; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew1", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "numpy.pxd":767
+ *     return PyArray_MultiIterNew(1, <void*>a)
+ * 
+ * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__pyx_v_a, PyObject *__pyx_v_b) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew2");
+
+  /* "numpy.pxd":768
+ * 
+ * cdef inline object PyArray_MultiIterNew2(a, b):
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew3(a, b, c):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(2, ((void *)__pyx_v_a), ((void *)__pyx_v_b)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 768; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew2", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "numpy.pxd":770
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
+ * 
+ * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew3");
+
+  /* "numpy.pxd":771
+ * 
+ * cdef inline object PyArray_MultiIterNew3(a, b, c):
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(3, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 771; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew3", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "numpy.pxd":773
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
+ * 
+ * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c, PyObject *__pyx_v_d) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew4");
+
+  /* "numpy.pxd":774
+ * 
+ * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(4, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 774; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew4", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "numpy.pxd":776
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
+ * 
+ * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c, PyObject *__pyx_v_d, PyObject *__pyx_v_e) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew5");
+
+  /* "numpy.pxd":777
+ * 
+ * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline char* _util_dtypestring(dtype descr, char* f, char* end, int* offset) except NULL:
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(5, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d), ((void *)__pyx_v_e)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 777; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew5", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "numpy.pxd":779
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
+ * 
+ * cdef inline char* _util_dtypestring(dtype descr, char* f, char* end, int* offset) except NULL:             # <<<<<<<<<<<<<<
+ *     # Recursive utility function used in __getbuffer__ to get format
+ *     # string. The new location in the format string is returned.
+ */
+
+static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx_v_descr, char *__pyx_v_f, char *__pyx_v_end, int *__pyx_v_offset) {
+  PyArray_Descr *__pyx_v_child = 0;
+  int __pyx_v_endian_detector;
+  int __pyx_v_little_endian;
+  PyObject *__pyx_v_fields = 0;
+  PyObject *__pyx_v_childname = NULL;
+  PyObject *__pyx_v_new_offset = NULL;
+  PyObject *__pyx_v_t = NULL;
+  char *__pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  long __pyx_t_10;
+  char *__pyx_t_11;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_util_dtypestring");
+
+  /* "numpy.pxd":786
+ *     cdef int delta_offset
+ *     cdef tuple i
+ *     cdef int endian_detector = 1             # <<<<<<<<<<<<<<
+ *     cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)
+ *     cdef tuple fields
+ */
+  __pyx_v_endian_detector = 1;
+
+  /* "numpy.pxd":787
+ *     cdef tuple i
+ *     cdef int endian_detector = 1
+ *     cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)             # <<<<<<<<<<<<<<
+ *     cdef tuple fields
+ * 
+ */
+  __pyx_v_little_endian = ((((char *)(&__pyx_v_endian_detector))[0]) != 0);
+
+  /* "numpy.pxd":790
+ *     cdef tuple fields
+ * 
+ *     for childname in descr.names:             # <<<<<<<<<<<<<<
+ *         fields = descr.fields[childname]
+ *         child, new_offset = fields
+ */
+  if (unlikely(((PyObject *)__pyx_v_descr->names) == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable"); {__pyx_filename = __pyx_f[1]; __pyx_lineno = 790; __pyx_clineno = __LINE__; goto __pyx_L1_error;} 
+  }
+  __pyx_t_1 = ((PyObject *)__pyx_v_descr->names); __Pyx_INCREF(__pyx_t_1); __pyx_t_2 = 0;
+  for (;;) {
+    if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+    __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++;
+    __Pyx_XDECREF(__pyx_v_childname);
+    __pyx_v_childname = __pyx_t_3;
+    __pyx_t_3 = 0;
+
+    /* "numpy.pxd":791
+ * 
+ *     for childname in descr.names:
+ *         fields = descr.fields[childname]             # <<<<<<<<<<<<<<
+ *         child, new_offset = fields
+ * 
+ */
+    __pyx_t_3 = PyObject_GetItem(__pyx_v_descr->fields, __pyx_v_childname); if (!__pyx_t_3) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 791; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    if (!(likely(PyTuple_CheckExact(__pyx_t_3))||((__pyx_t_3) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected tuple, got %.200s", Py_TYPE(__pyx_t_3)->tp_name), 0))) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 791; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_XDECREF(((PyObject *)__pyx_v_fields));
+    __pyx_v_fields = ((PyObject*)__pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "numpy.pxd":792
+ *     for childname in descr.names:
+ *         fields = descr.fields[childname]
+ *         child, new_offset = fields             # <<<<<<<<<<<<<<
+ * 
+ *         if (end - f) - (new_offset - offset[0]) < 15:
+ */
+    if (likely(PyTuple_CheckExact(((PyObject *)__pyx_v_fields)))) {
+      PyObject* sequence = ((PyObject *)__pyx_v_fields);
+      if (unlikely(PyTuple_GET_SIZE(sequence) != 2)) {
+        if (PyTuple_GET_SIZE(sequence) > 2) __Pyx_RaiseTooManyValuesError(2);
+        else __Pyx_RaiseNeedMoreValuesError(PyTuple_GET_SIZE(sequence));
+        {__pyx_filename = __pyx_f[1]; __pyx_lineno = 792; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      }
+      __pyx_t_3 = PyTuple_GET_ITEM(sequence, 0); 
+      __pyx_t_4 = PyTuple_GET_ITEM(sequence, 1); 
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+    } else {
+      __Pyx_UnpackTupleError(((PyObject *)__pyx_v_fields), 2);
+      {__pyx_filename = __pyx_f[1]; __pyx_lineno = 792; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_dtype))))) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 792; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_XDECREF(((PyObject *)__pyx_v_child));
+    __pyx_v_child = ((PyArray_Descr *)__pyx_t_3);
+    __pyx_t_3 = 0;
+    __Pyx_XDECREF(__pyx_v_new_offset);
+    __pyx_v_new_offset = __pyx_t_4;
+    __pyx_t_4 = 0;
+
+    /* "numpy.pxd":794
+ *         child, new_offset = fields
+ * 
+ *         if (end - f) - (new_offset - offset[0]) < 15:             # <<<<<<<<<<<<<<
+ *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
+ * 
+ */
+    __pyx_t_4 = PyInt_FromLong((__pyx_v_end - __pyx_v_f)); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 794; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = PyInt_FromLong((__pyx_v_offset[0])); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 794; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_5 = PyNumber_Subtract(__pyx_v_new_offset, __pyx_t_3); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 794; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = PyNumber_Subtract(__pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 794; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = PyObject_RichCompare(__pyx_t_3, __pyx_int_15, Py_LT); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 794; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 794; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (__pyx_t_6) {
+
+      /* "numpy.pxd":795
+ * 
+ *         if (end - f) - (new_offset - offset[0]) < 15:
+ *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")             # <<<<<<<<<<<<<<
+ * 
+ *         if ((child.byteorder == '>' and little_endian) or
+ */
+      __pyx_t_5 = PyObject_Call(__pyx_builtin_RuntimeError, ((PyObject *)__pyx_k_tuple_9), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 795; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_Raise(__pyx_t_5, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      {__pyx_filename = __pyx_f[1]; __pyx_lineno = 795; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      goto __pyx_L5;
+    }
+    __pyx_L5:;
+
+    /* "numpy.pxd":797
+ *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
+ * 
+ *         if ((child.byteorder == '>' and little_endian) or             # <<<<<<<<<<<<<<
+ *             (child.byteorder == '<' and not little_endian)):
+ *             raise ValueError(u"Non-native byte order not supported")
+ */
+    __pyx_t_6 = (__pyx_v_child->byteorder == '>');
+    if (__pyx_t_6) {
+      __pyx_t_7 = __pyx_v_little_endian;
+    } else {
+      __pyx_t_7 = __pyx_t_6;
+    }
+    if (!__pyx_t_7) {
+
+      /* "numpy.pxd":798
+ * 
+ *         if ((child.byteorder == '>' and little_endian) or
+ *             (child.byteorder == '<' and not little_endian)):             # <<<<<<<<<<<<<<
+ *             raise ValueError(u"Non-native byte order not supported")
+ *             # One could encode it in the format string and have Cython
+ */
+      __pyx_t_6 = (__pyx_v_child->byteorder == '<');
+      if (__pyx_t_6) {
+        __pyx_t_8 = (!__pyx_v_little_endian);
+        __pyx_t_9 = __pyx_t_8;
+      } else {
+        __pyx_t_9 = __pyx_t_6;
+      }
+      __pyx_t_6 = __pyx_t_9;
+    } else {
+      __pyx_t_6 = __pyx_t_7;
+    }
+    if (__pyx_t_6) {
+
+      /* "numpy.pxd":799
+ *         if ((child.byteorder == '>' and little_endian) or
+ *             (child.byteorder == '<' and not little_endian)):
+ *             raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
+ *             # One could encode it in the format string and have Cython
+ *             # complain instead, BUT: < and > in format strings also imply
+ */
+      __pyx_t_5 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_k_tuple_10), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 799; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_Raise(__pyx_t_5, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      {__pyx_filename = __pyx_f[1]; __pyx_lineno = 799; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      goto __pyx_L6;
+    }
+    __pyx_L6:;
+
+    /* "numpy.pxd":809
+ * 
+ *         # Output padding bytes
+ *         while offset[0] < new_offset:             # <<<<<<<<<<<<<<
+ *             f[0] = 120 # "x"; pad byte
+ *             f += 1
+ */
+    while (1) {
+      __pyx_t_5 = PyInt_FromLong((__pyx_v_offset[0])); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 809; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_3 = PyObject_RichCompare(__pyx_t_5, __pyx_v_new_offset, Py_LT); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 809; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 809; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      if (!__pyx_t_6) break;
+
+      /* "numpy.pxd":810
+ *         # Output padding bytes
+ *         while offset[0] < new_offset:
+ *             f[0] = 120 # "x"; pad byte             # <<<<<<<<<<<<<<
+ *             f += 1
+ *             offset[0] += 1
+ */
+      (__pyx_v_f[0]) = 120;
+
+      /* "numpy.pxd":811
+ *         while offset[0] < new_offset:
+ *             f[0] = 120 # "x"; pad byte
+ *             f += 1             # <<<<<<<<<<<<<<
+ *             offset[0] += 1
+ * 
+ */
+      __pyx_v_f = (__pyx_v_f + 1);
+
+      /* "numpy.pxd":812
+ *             f[0] = 120 # "x"; pad byte
+ *             f += 1
+ *             offset[0] += 1             # <<<<<<<<<<<<<<
+ * 
+ *         offset[0] += child.itemsize
+ */
+      __pyx_t_10 = 0;
+      (__pyx_v_offset[__pyx_t_10]) = ((__pyx_v_offset[__pyx_t_10]) + 1);
+    }
+
+    /* "numpy.pxd":814
+ *             offset[0] += 1
+ * 
+ *         offset[0] += child.itemsize             # <<<<<<<<<<<<<<
+ * 
+ *         if not PyDataType_HASFIELDS(child):
+ */
+    __pyx_t_10 = 0;
+    (__pyx_v_offset[__pyx_t_10]) = ((__pyx_v_offset[__pyx_t_10]) + __pyx_v_child->elsize);
+
+    /* "numpy.pxd":816
+ *         offset[0] += child.itemsize
+ * 
+ *         if not PyDataType_HASFIELDS(child):             # <<<<<<<<<<<<<<
+ *             t = child.type_num
+ *             if end - f < 5:
+ */
+    __pyx_t_6 = (!PyDataType_HASFIELDS(__pyx_v_child));
+    if (__pyx_t_6) {
+
+      /* "numpy.pxd":817
+ * 
+ *         if not PyDataType_HASFIELDS(child):
+ *             t = child.type_num             # <<<<<<<<<<<<<<
+ *             if end - f < 5:
+ *                 raise RuntimeError(u"Format string allocated too short.")
+ */
+      __pyx_t_3 = PyInt_FromLong(__pyx_v_child->type_num); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 817; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_XDECREF(__pyx_v_t);
+      __pyx_v_t = __pyx_t_3;
+      __pyx_t_3 = 0;
+
+      /* "numpy.pxd":818
+ *         if not PyDataType_HASFIELDS(child):
+ *             t = child.type_num
+ *             if end - f < 5:             # <<<<<<<<<<<<<<
+ *                 raise RuntimeError(u"Format string allocated too short.")
+ * 
+ */
+      __pyx_t_6 = ((__pyx_v_end - __pyx_v_f) < 5);
+      if (__pyx_t_6) {
+
+        /* "numpy.pxd":819
+ *             t = child.type_num
+ *             if end - f < 5:
+ *                 raise RuntimeError(u"Format string allocated too short.")             # <<<<<<<<<<<<<<
+ * 
+ *             # Until ticket #99 is fixed, use integers to avoid warnings
+ */
+        __pyx_t_3 = PyObject_Call(__pyx_builtin_RuntimeError, ((PyObject *)__pyx_k_tuple_12), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 819; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        {__pyx_filename = __pyx_f[1]; __pyx_lineno = 819; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        goto __pyx_L10;
+      }
+      __pyx_L10:;
+
+      /* "numpy.pxd":822
+ * 
+ *             # Until ticket #99 is fixed, use integers to avoid warnings
+ *             if   t == NPY_BYTE:        f[0] =  98 #"b"             # <<<<<<<<<<<<<<
+ *             elif t == NPY_UBYTE:       f[0] =  66 #"B"
+ *             elif t == NPY_SHORT:       f[0] = 104 #"h"
+ */
+      __pyx_t_3 = PyInt_FromLong(NPY_BYTE); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 822; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_5 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 822; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 822; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (__pyx_t_6) {
+        (__pyx_v_f[0]) = 98;
+        goto __pyx_L11;
+      }
+
+      /* "numpy.pxd":823
+ *             # Until ticket #99 is fixed, use integers to avoid warnings
+ *             if   t == NPY_BYTE:        f[0] =  98 #"b"
+ *             elif t == NPY_UBYTE:       f[0] =  66 #"B"             # <<<<<<<<<<<<<<
+ *             elif t == NPY_SHORT:       f[0] = 104 #"h"
+ *             elif t == NPY_USHORT:      f[0] =  72 #"H"
+ */
+      __pyx_t_5 = PyInt_FromLong(NPY_UBYTE); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 823; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_5, Py_EQ); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 823; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 823; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      if (__pyx_t_6) {
+        (__pyx_v_f[0]) = 66;
+        goto __pyx_L11;
+      }
+
+      /* "numpy.pxd":824
+ *             if   t == NPY_BYTE:        f[0] =  98 #"b"
+ *             elif t == NPY_UBYTE:       f[0] =  66 #"B"
+ *             elif t == NPY_SHORT:       f[0] = 104 #"h"             # <<<<<<<<<<<<<<
+ *             elif t == NPY_USHORT:      f[0] =  72 #"H"
+ *             elif t == NPY_INT:         f[0] = 105 #"i"
+ */
+      __pyx_t_3 = PyInt_FromLong(NPY_SHORT); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 824; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_5 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 824; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 824; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (__pyx_t_6) {
+        (__pyx_v_f[0]) = 104;
+        goto __pyx_L11;
+      }
+
+      /* "numpy.pxd":825
+ *             elif t == NPY_UBYTE:       f[0] =  66 #"B"
+ *             elif t == NPY_SHORT:       f[0] = 104 #"h"
+ *             elif t == NPY_USHORT:      f[0] =  72 #"H"             # <<<<<<<<<<<<<<
+ *             elif t == NPY_INT:         f[0] = 105 #"i"
+ *             elif t == NPY_UINT:        f[0] =  73 #"I"
+ */
+      __pyx_t_5 = PyInt_FromLong(NPY_USHORT); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 825; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_5, Py_EQ); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 825; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 825; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      if (__pyx_t_6) {
+        (__pyx_v_f[0]) = 72;
+        goto __pyx_L11;
+      }
+
+      /* "numpy.pxd":826
+ *             elif t == NPY_SHORT:       f[0] = 104 #"h"
+ *             elif t == NPY_USHORT:      f[0] =  72 #"H"
+ *             elif t == NPY_INT:         f[0] = 105 #"i"             # <<<<<<<<<<<<<<
+ *             elif t == NPY_UINT:        f[0] =  73 #"I"
+ *             elif t == NPY_LONG:        f[0] = 108 #"l"
+ */
+      __pyx_t_3 = PyInt_FromLong(NPY_INT); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 826; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_5 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 826; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 826; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (__pyx_t_6) {
+        (__pyx_v_f[0]) = 105;
+        goto __pyx_L11;
+      }
+
+      /* "numpy.pxd":827
+ *             elif t == NPY_USHORT:      f[0] =  72 #"H"
+ *             elif t == NPY_INT:         f[0] = 105 #"i"
+ *             elif t == NPY_UINT:        f[0] =  73 #"I"             # <<<<<<<<<<<<<<
+ *             elif t == NPY_LONG:        f[0] = 108 #"l"
+ *             elif t == NPY_ULONG:       f[0] = 76  #"L"
+ */
+      __pyx_t_5 = PyInt_FromLong(NPY_UINT); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 827; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_5, Py_EQ); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 827; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 827; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      if (__pyx_t_6) {
+        (__pyx_v_f[0]) = 73;
+        goto __pyx_L11;
+      }
+
+      /* "numpy.pxd":828
+ *             elif t == NPY_INT:         f[0] = 105 #"i"
+ *             elif t == NPY_UINT:        f[0] =  73 #"I"
+ *             elif t == NPY_LONG:        f[0] = 108 #"l"             # <<<<<<<<<<<<<<
+ *             elif t == NPY_ULONG:       f[0] = 76  #"L"
+ *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
+ */
+      __pyx_t_3 = PyInt_FromLong(NPY_LONG); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 828; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_5 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 828; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 828; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (__pyx_t_6) {
+        (__pyx_v_f[0]) = 108;
+        goto __pyx_L11;
+      }
+
+      /* "numpy.pxd":829
+ *             elif t == NPY_UINT:        f[0] =  73 #"I"
+ *             elif t == NPY_LONG:        f[0] = 108 #"l"
+ *             elif t == NPY_ULONG:       f[0] = 76  #"L"             # <<<<<<<<<<<<<<
+ *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
+ *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
+ */
+      __pyx_t_5 = PyInt_FromLong(NPY_ULONG); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 829; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_5, Py_EQ); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 829; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 829; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      if (__pyx_t_6) {
+        (__pyx_v_f[0]) = 76;
+        goto __pyx_L11;
+      }
+
+      /* "numpy.pxd":830
+ *             elif t == NPY_LONG:        f[0] = 108 #"l"
+ *             elif t == NPY_ULONG:       f[0] = 76  #"L"
+ *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"             # <<<<<<<<<<<<<<
+ *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
+ *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
+ */
+      __pyx_t_3 = PyInt_FromLong(NPY_LONGLONG); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 830; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_5 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 830; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 830; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (__pyx_t_6) {
+        (__pyx_v_f[0]) = 113;
+        goto __pyx_L11;
+      }
+
+      /* "numpy.pxd":831
+ *             elif t == NPY_ULONG:       f[0] = 76  #"L"
+ *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
+ *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"             # <<<<<<<<<<<<<<
+ *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
+ *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
+ */
+      __pyx_t_5 = PyInt_FromLong(NPY_ULONGLONG); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 831; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_5, Py_EQ); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 831; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 831; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      if (__pyx_t_6) {
+        (__pyx_v_f[0]) = 81;
+        goto __pyx_L11;
+      }
+
+      /* "numpy.pxd":832
+ *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
+ *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
+ *             elif t == NPY_FLOAT:       f[0] = 102 #"f"             # <<<<<<<<<<<<<<
+ *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
+ *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
+ */
+      __pyx_t_3 = PyInt_FromLong(NPY_FLOAT); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 832; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_5 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 832; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 832; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (__pyx_t_6) {
+        (__pyx_v_f[0]) = 102;
+        goto __pyx_L11;
+      }
+
+      /* "numpy.pxd":833
+ *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
+ *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
+ *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"             # <<<<<<<<<<<<<<
+ *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
+ *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
+ */
+      __pyx_t_5 = PyInt_FromLong(NPY_DOUBLE); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 833; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_5, Py_EQ); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 833; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 833; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      if (__pyx_t_6) {
+        (__pyx_v_f[0]) = 100;
+        goto __pyx_L11;
+      }
+
+      /* "numpy.pxd":834
+ *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
+ *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
+ *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"             # <<<<<<<<<<<<<<
+ *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
+ *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
+ */
+      __pyx_t_3 = PyInt_FromLong(NPY_LONGDOUBLE); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 834; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_5 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 834; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 834; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (__pyx_t_6) {
+        (__pyx_v_f[0]) = 103;
+        goto __pyx_L11;
+      }
+
+      /* "numpy.pxd":835
+ *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
+ *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
+ *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf             # <<<<<<<<<<<<<<
+ *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
+ *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg
+ */
+      __pyx_t_5 = PyInt_FromLong(NPY_CFLOAT); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 835; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_5, Py_EQ); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 835; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 835; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      if (__pyx_t_6) {
+        (__pyx_v_f[0]) = 90;
+        (__pyx_v_f[1]) = 102;
+        __pyx_v_f = (__pyx_v_f + 1);
+        goto __pyx_L11;
+      }
+
+      /* "numpy.pxd":836
+ *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
+ *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
+ *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd             # <<<<<<<<<<<<<<
+ *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg
+ *             elif t == NPY_OBJECT:      f[0] = 79 #"O"
+ */
+      __pyx_t_3 = PyInt_FromLong(NPY_CDOUBLE); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 836; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_5 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 836; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 836; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (__pyx_t_6) {
+        (__pyx_v_f[0]) = 90;
+        (__pyx_v_f[1]) = 100;
+        __pyx_v_f = (__pyx_v_f + 1);
+        goto __pyx_L11;
+      }
+
+      /* "numpy.pxd":837
+ *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
+ *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
+ *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg             # <<<<<<<<<<<<<<
+ *             elif t == NPY_OBJECT:      f[0] = 79 #"O"
+ *             else:
+ */
+      __pyx_t_5 = PyInt_FromLong(NPY_CLONGDOUBLE); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 837; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_5, Py_EQ); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 837; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 837; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      if (__pyx_t_6) {
+        (__pyx_v_f[0]) = 90;
+        (__pyx_v_f[1]) = 103;
+        __pyx_v_f = (__pyx_v_f + 1);
+        goto __pyx_L11;
+      }
+
+      /* "numpy.pxd":838
+ *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
+ *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg
+ *             elif t == NPY_OBJECT:      f[0] = 79 #"O"             # <<<<<<<<<<<<<<
+ *             else:
+ *                 raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
+ */
+      __pyx_t_3 = PyInt_FromLong(NPY_OBJECT); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 838; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_5 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 838; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 838; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (__pyx_t_6) {
+        (__pyx_v_f[0]) = 79;
+        goto __pyx_L11;
+      }
+      /*else*/ {
+
+        /* "numpy.pxd":840
+ *             elif t == NPY_OBJECT:      f[0] = 79 #"O"
+ *             else:
+ *                 raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)             # <<<<<<<<<<<<<<
+ *             f += 1
+ *         else:
+ */
+        __pyx_t_5 = PyNumber_Remainder(((PyObject *)__pyx_kp_u_7), __pyx_v_t); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 840; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __Pyx_GOTREF(((PyObject *)__pyx_t_5));
+        __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 840; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __Pyx_GOTREF(((PyObject *)__pyx_t_3));
+        PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_t_5));
+        __Pyx_GIVEREF(((PyObject *)__pyx_t_5));
+        __pyx_t_5 = 0;
+        __pyx_t_5 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_t_3), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 840; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF(((PyObject *)__pyx_t_3)); __pyx_t_3 = 0;
+        __Pyx_Raise(__pyx_t_5, 0, 0, 0);
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        {__pyx_filename = __pyx_f[1]; __pyx_lineno = 840; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      }
+      __pyx_L11:;
+
+      /* "numpy.pxd":841
+ *             else:
+ *                 raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
+ *             f += 1             # <<<<<<<<<<<<<<
+ *         else:
+ *             # Cython ignores struct boundary information ("T{...}"),
+ */
+      __pyx_v_f = (__pyx_v_f + 1);
+      goto __pyx_L9;
+    }
+    /*else*/ {
+
+      /* "numpy.pxd":845
+ *             # Cython ignores struct boundary information ("T{...}"),
+ *             # so don't output it
+ *             f = _util_dtypestring(child, f, end, offset)             # <<<<<<<<<<<<<<
+ *     return f
+ * 
+ */
+      __pyx_t_11 = __pyx_f_5numpy__util_dtypestring(__pyx_v_child, __pyx_v_f, __pyx_v_end, __pyx_v_offset); if (unlikely(__pyx_t_11 == NULL)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 845; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_v_f = __pyx_t_11;
+    }
+    __pyx_L9:;
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "numpy.pxd":846
+ *             # so don't output it
+ *             f = _util_dtypestring(child, f, end, offset)
+ *     return f             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = __pyx_v_f;
+  goto __pyx_L0;
+
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("numpy._util_dtypestring", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_child);
+  __Pyx_XDECREF(__pyx_v_fields);
+  __Pyx_XDECREF(__pyx_v_childname);
+  __Pyx_XDECREF(__pyx_v_new_offset);
+  __Pyx_XDECREF(__pyx_v_t);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "numpy.pxd":961
+ * 
+ * 
+ * cdef inline void set_array_base(ndarray arr, object base):             # <<<<<<<<<<<<<<
+ *      cdef PyObject* baseptr
+ *      if base is None:
+ */
+
+static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_arr, PyObject *__pyx_v_base) {
+  PyObject *__pyx_v_baseptr;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("set_array_base");
+
+  /* "numpy.pxd":963
+ * cdef inline void set_array_base(ndarray arr, object base):
+ *      cdef PyObject* baseptr
+ *      if base is None:             # <<<<<<<<<<<<<<
+ *          baseptr = NULL
+ *      else:
+ */
+  __pyx_t_1 = (__pyx_v_base == Py_None);
+  if (__pyx_t_1) {
+
+    /* "numpy.pxd":964
+ *      cdef PyObject* baseptr
+ *      if base is None:
+ *          baseptr = NULL             # <<<<<<<<<<<<<<
+ *      else:
+ *          Py_INCREF(base) # important to do this before decref below!
+ */
+    __pyx_v_baseptr = NULL;
+    goto __pyx_L3;
+  }
+  /*else*/ {
+
+    /* "numpy.pxd":966
+ *          baseptr = NULL
+ *      else:
+ *          Py_INCREF(base) # important to do this before decref below!             # <<<<<<<<<<<<<<
+ *          baseptr = <PyObject*>base
+ *      Py_XDECREF(arr.base)
+ */
+    Py_INCREF(__pyx_v_base);
+
+    /* "numpy.pxd":967
+ *      else:
+ *          Py_INCREF(base) # important to do this before decref below!
+ *          baseptr = <PyObject*>base             # <<<<<<<<<<<<<<
+ *      Py_XDECREF(arr.base)
+ *      arr.base = baseptr
+ */
+    __pyx_v_baseptr = ((PyObject *)__pyx_v_base);
+  }
+  __pyx_L3:;
+
+  /* "numpy.pxd":968
+ *          Py_INCREF(base) # important to do this before decref below!
+ *          baseptr = <PyObject*>base
+ *      Py_XDECREF(arr.base)             # <<<<<<<<<<<<<<
+ *      arr.base = baseptr
+ * 
+ */
+  Py_XDECREF(__pyx_v_arr->base);
+
+  /* "numpy.pxd":969
+ *          baseptr = <PyObject*>base
+ *      Py_XDECREF(arr.base)
+ *      arr.base = baseptr             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object get_array_base(ndarray arr):
+ */
+  __pyx_v_arr->base = __pyx_v_baseptr;
+
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "numpy.pxd":971
+ *      arr.base = baseptr
+ * 
+ * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
+ *     if arr.base is NULL:
+ *         return None
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__pyx_v_arr) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("get_array_base");
+
+  /* "numpy.pxd":972
+ * 
+ * cdef inline object get_array_base(ndarray arr):
+ *     if arr.base is NULL:             # <<<<<<<<<<<<<<
+ *         return None
+ *     else:
+ */
+  __pyx_t_1 = (__pyx_v_arr->base == NULL);
+  if (__pyx_t_1) {
+
+    /* "numpy.pxd":973
+ * cdef inline object get_array_base(ndarray arr):
+ *     if arr.base is NULL:
+ *         return None             # <<<<<<<<<<<<<<
+ *     else:
+ *         return <object>arr.base
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(Py_None);
+    __pyx_r = Py_None;
+    goto __pyx_L0;
+    goto __pyx_L3;
+  }
+  /*else*/ {
+
+    /* "numpy.pxd":975
+ *         return None
+ *     else:
+ *         return <object>arr.base             # <<<<<<<<<<<<<<
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(((PyObject *)__pyx_v_arr->base));
+    __pyx_r = ((PyObject *)__pyx_v_arr->base);
+    goto __pyx_L0;
+  }
+  __pyx_L3:;
+
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+
+#if PY_MAJOR_VERSION >= 3
+static struct PyModuleDef __pyx_moduledef = {
+    PyModuleDef_HEAD_INIT,
+    __Pyx_NAMESTR("_graph_tools"),
+    0, /* m_doc */
+    -1, /* m_size */
+    __pyx_methods /* m_methods */,
+    NULL, /* m_reload */
+    NULL, /* m_traverse */
+    NULL, /* m_clear */
+    NULL /* m_free */
+};
+#endif
+
+static __Pyx_StringTabEntry __pyx_string_tab[] = {
+  {&__pyx_kp_u_1, __pyx_k_1, sizeof(__pyx_k_1), 0, 1, 0, 0},
+  {&__pyx_kp_u_11, __pyx_k_11, sizeof(__pyx_k_11), 0, 1, 0, 0},
+  {&__pyx_n_s_13, __pyx_k_13, sizeof(__pyx_k_13), 0, 0, 1, 1},
+  {&__pyx_n_s_14, __pyx_k_14, sizeof(__pyx_k_14), 0, 0, 1, 1},
+  {&__pyx_kp_u_3, __pyx_k_3, sizeof(__pyx_k_3), 0, 1, 0, 0},
+  {&__pyx_kp_u_5, __pyx_k_5, sizeof(__pyx_k_5), 0, 1, 0, 0},
+  {&__pyx_kp_u_7, __pyx_k_7, sizeof(__pyx_k_7), 0, 1, 0, 0},
+  {&__pyx_kp_u_8, __pyx_k_8, sizeof(__pyx_k_8), 0, 1, 0, 0},
+  {&__pyx_n_s__Aj, __pyx_k__Aj, sizeof(__pyx_k__Aj), 0, 0, 1, 1},
+  {&__pyx_n_s__Ap, __pyx_k__Ap, sizeof(__pyx_k__Ap), 0, 0, 1, 1},
+  {&__pyx_n_s__Ax, __pyx_k__Ax, sizeof(__pyx_k__Ax), 0, 0, 1, 1},
+  {&__pyx_n_s__Bj, __pyx_k__Bj, sizeof(__pyx_k__Bj), 0, 0, 1, 1},
+  {&__pyx_n_s__Bp, __pyx_k__Bp, sizeof(__pyx_k__Bp), 0, 0, 1, 1},
+  {&__pyx_n_s__Bx, __pyx_k__Bx, sizeof(__pyx_k__Bx), 0, 0, 1, 1},
+  {&__pyx_n_s__MemoryError, __pyx_k__MemoryError, sizeof(__pyx_k__MemoryError), 0, 0, 1, 1},
+  {&__pyx_n_s__N, __pyx_k__N, sizeof(__pyx_k__N), 0, 0, 1, 1},
+  {&__pyx_n_s__NULL_IDX, __pyx_k__NULL_IDX, sizeof(__pyx_k__NULL_IDX), 0, 0, 1, 1},
+  {&__pyx_n_s__RuntimeError, __pyx_k__RuntimeError, sizeof(__pyx_k__RuntimeError), 0, 0, 1, 1},
+  {&__pyx_n_s__ValueError, __pyx_k__ValueError, sizeof(__pyx_k__ValueError), 0, 0, 1, 1},
+  {&__pyx_n_s____main__, __pyx_k____main__, sizeof(__pyx_k____main__), 0, 0, 1, 1},
+  {&__pyx_n_s____test__, __pyx_k____test__, sizeof(__pyx_k____test__), 0, 0, 1, 1},
+  {&__pyx_n_s__bellman_ford, __pyx_k__bellman_ford, sizeof(__pyx_k__bellman_ford), 0, 0, 1, 1},
+  {&__pyx_n_s__breadth_first, __pyx_k__breadth_first, sizeof(__pyx_k__breadth_first), 0, 0, 1, 1},
+  {&__pyx_n_s__cols, __pyx_k__cols, sizeof(__pyx_k__cols), 0, 0, 1, 1},
+  {&__pyx_n_s__depth_first, __pyx_k__depth_first, sizeof(__pyx_k__depth_first), 0, 0, 1, 1},
+  {&__pyx_n_s__dijkstra, __pyx_k__dijkstra, sizeof(__pyx_k__dijkstra), 0, 0, 1, 1},
+  {&__pyx_n_s__dist, __pyx_k__dist, sizeof(__pyx_k__dist), 0, 0, 1, 1},
+  {&__pyx_n_s__floyd_warshall, __pyx_k__floyd_warshall, sizeof(__pyx_k__floyd_warshall), 0, 0, 1, 1},
+  {&__pyx_n_s__h, __pyx_k__h, sizeof(__pyx_k__h), 0, 0, 1, 1},
+  {&__pyx_n_s__inf, __pyx_k__inf, sizeof(__pyx_k__inf), 0, 0, 1, 1},
+  {&__pyx_n_s__johnson_potentials, __pyx_k__johnson_potentials, sizeof(__pyx_k__johnson_potentials), 0, 0, 1, 1},
+  {&__pyx_n_s__keep, __pyx_k__keep, sizeof(__pyx_k__keep), 0, 0, 1, 1},
+  {&__pyx_n_s__kruskal, __pyx_k__kruskal, sizeof(__pyx_k__kruskal), 0, 0, 1, 1},
+  {&__pyx_n_s__leaf_size, __pyx_k__leaf_size, sizeof(__pyx_k__leaf_size), 0, 0, 1, 1},
+  {&__pyx_n_s__nested_dissection, __pyx_k__nested_dissection, sizeof(__pyx_k__nested_dissection), 0, 0, 1, 1},
+  {&__pyx_n_s__np, __pyx_k__np, sizeof(__pyx_k__np), 0, 0, 1, 1},
+  {&__pyx_n_s__numpy, __pyx_k__numpy, sizeof(__pyx_k__numpy), 0, 0, 1, 1},
+  {&__pyx_n_s__order, __pyx_k__order, sizeof(__pyx_k__order), 0, 0, 1, 1},
+  {&__pyx_n_s__pred, __pyx_k__pred, sizeof(__pyx_k__pred), 0, 0, 1, 1},
+  {&__pyx_n_s__range, __pyx_k__range, sizeof(__pyx_k__range), 0, 0, 1, 1},
+  {&__pyx_n_s__rows, __pyx_k__rows, sizeof(__pyx_k__rows), 0, 0, 1, 1},
+  {&__pyx_n_s__sources, __pyx_k__sources, sizeof(__pyx_k__sources), 0, 0, 1, 1},
+  {&__pyx_n_s__start, __pyx_k__start, sizeof(__pyx_k__start), 0, 0, 1, 1},
+  {&__pyx_n_s__undirected, __pyx_k__undirected, sizeof(__pyx_k__undirected), 0, 0, 1, 1},
+  {0, 0, 0, 0, 0, 0, 0}
+};
+static int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_range = __Pyx_GetName(__pyx_b, __pyx_n_s__range); if (!__pyx_builtin_range) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 80; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_MemoryError = __Pyx_GetName(__pyx_b, __pyx_n_s__MemoryError); if (!__pyx_builtin_MemoryError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 146; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_ValueError = __Pyx_GetName(__pyx_b, __pyx_n_s__ValueError); if (!__pyx_builtin_ValueError) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_RuntimeError = __Pyx_GetName(__pyx_b, __pyx_n_s__RuntimeError); if (!__pyx_builtin_RuntimeError) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 795; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static int __Pyx_InitCachedConstants(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants");
+
+  /* "numpy.pxd":211
+ *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
+ *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not C contiguous")             # <<<<<<<<<<<<<<
+ * 
+ *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
+ */
+  __pyx_k_tuple_2 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_2));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_u_1));
+  PyTuple_SET_ITEM(__pyx_k_tuple_2, 0, ((PyObject *)__pyx_kp_u_1));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_1));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_2));
+
+  /* "numpy.pxd":215
+ *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
+ *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not Fortran contiguous")             # <<<<<<<<<<<<<<
+ * 
+ *             info.buf = PyArray_DATA(self)
+ */
+  __pyx_k_tuple_4 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_4)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_4));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_u_3));
+  PyTuple_SET_ITEM(__pyx_k_tuple_4, 0, ((PyObject *)__pyx_kp_u_3));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_3));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_4));
+
+  /* "numpy.pxd":253
+ *                 if ((descr.byteorder == '>' and little_endian) or
+ *                     (descr.byteorder == '<' and not little_endian)):
+ *                     raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
+ *                 if   t == NPY_BYTE:        f = "b"
+ *                 elif t == NPY_UBYTE:       f = "B"
+ */
+  __pyx_k_tuple_6 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_6)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 253; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_6));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_u_5));
+  PyTuple_SET_ITEM(__pyx_k_tuple_6, 0, ((PyObject *)__pyx_kp_u_5));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_5));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_6));
+
+  /* "numpy.pxd":795
+ * 
+ *         if (end - f) - (new_offset - offset[0]) < 15:
+ *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")             # <<<<<<<<<<<<<<
+ * 
+ *         if ((child.byteorder == '>' and little_endian) or
+ */
+  __pyx_k_tuple_9 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_9)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 795; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_9));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_u_8));
+  PyTuple_SET_ITEM(__pyx_k_tuple_9, 0, ((PyObject *)__pyx_kp_u_8));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_8));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_9));
+
+  /* "numpy.pxd":799
+ *         if ((child.byteorder == '>' and little_endian) or
+ *             (child.byteorder == '<' and not little_endian)):
+ *             raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
+ *             # One could encode it in the format string and have Cython
+ *             # complain instead, BUT: < and > in format strings also imply
+ */
+  __pyx_k_tuple_10 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_10)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 799; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_10));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_u_5));
+  PyTuple_SET_ITEM(__pyx_k_tuple_10, 0, ((PyObject *)__pyx_kp_u_5));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_5));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_10));
+
+  /* "numpy.pxd":819
+ *             t = child.type_num
+ *             if end - f < 5:
+ *                 raise RuntimeError(u"Format string allocated too short.")             # <<<<<<<<<<<<<<
+ * 
+ *             # Until ticket #99 is fixed, use integers to avoid warnings
+ */
+  __pyx_k_tuple_12 = PyTuple_New(1); if (unlikely(!__pyx_k_tuple_12)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 819; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_k_tuple_12));
+  __Pyx_INCREF(((PyObject *)__pyx_kp_u_11));
+  PyTuple_SET_ITEM(__pyx_k_tuple_12, 0, ((PyObject *)__pyx_kp_u_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_kp_u_11));
+  __Pyx_GIVEREF(((PyObject *)__pyx_k_tuple_12));
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_InitGlobals(void) {
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_15 = PyInt_FromLong(15); if (unlikely(!__pyx_int_15)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_neg_9999 = PyInt_FromLong(-9999); if (unlikely(!__pyx_int_neg_9999)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+#if PY_MAJOR_VERSION < 3
+PyMODINIT_FUNC init_graph_tools(void); /*proto*/
+PyMODINIT_FUNC init_graph_tools(void)
+#else
+PyMODINIT_FUNC PyInit__graph_tools(void); /*proto*/
+PyMODINIT_FUNC PyInit__graph_tools(void)
+#endif
+{
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  double __pyx_t_3;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_REFNANNY
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+  if (!__Pyx_RefNanny) {
+      PyErr_Clear();
+      __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+      if (!__Pyx_RefNanny)
+          Py_FatalError("failed to import 'refnanny' module");
+  }
+  #endif
+  __Pyx_RefNannySetupContext("PyMODINIT_FUNC PyInit__graph_tools(void)");
+  if ( __Pyx_check_binary_version() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  #ifdef __pyx_binding_PyCFunctionType_USED
+  if (__pyx_binding_PyCFunctionType_init() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  #endif
+  /*--- Library function declarations ---*/
+  /*--- Threads initialization code ---*/
+  #if defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
+  #ifdef WITH_THREAD /* Python build with threading support? */
+  PyEval_InitThreads();
+  #endif
+  #endif
+  /*--- Module creation code ---*/
+  #if PY_MAJOR_VERSION < 3
+  __pyx_m = Py_InitModule4(__Pyx_NAMESTR("_graph_tools"), __pyx_methods, 0, 0, PYTHON_API_VERSION);
+  #else
+  __pyx_m = PyModule_Create(&__pyx_moduledef);
+  #endif
+  if (!__pyx_m) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  #if PY_MAJOR_VERSION < 3
+  Py_INCREF(__pyx_m);
+  #endif
+  __pyx_b = PyImport_AddModule(__Pyx_NAMESTR(__Pyx_BUILTIN_MODULE_NAME));
+  if (!__pyx_b) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  if (__Pyx_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  /*--- Initialize various global constants etc. ---*/
+  if (unlikely(__Pyx_InitGlobals() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_module_is_main_scipy__sparse___graph_tools) {
+    if (__Pyx_SetAttrString(__pyx_m, "__name__", __pyx_n_s____main__) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  }
+  /*--- Builtin init code ---*/
+  if (unlikely(__Pyx_InitCachedBuiltins() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  /*--- Constants init code ---*/
+  if (unlikely(__Pyx_InitCachedConstants() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  /*--- Global init code ---*/
+  /*--- Variable export code ---*/
+  /*--- Function export code ---*/
+  /*--- Type init code ---*/
+  /*--- Type import code ---*/
+  __pyx_ptype_5numpy_dtype = __Pyx_ImportType("numpy", "dtype", sizeof(PyArray_Descr), 0); if (unlikely(!__pyx_ptype_5numpy_dtype)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 151; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_ptype_5numpy_flatiter = __Pyx_ImportType("numpy", "flatiter", sizeof(PyArrayIterObject), 0); if (unlikely(!__pyx_ptype_5numpy_flatiter)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_ptype_5numpy_broadcast = __Pyx_ImportType("numpy", "broadcast", sizeof(PyArrayMultiIterObject), 0); if (unlikely(!__pyx_ptype_5numpy_broadcast)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_ptype_5numpy_ndarray = __Pyx_ImportType("numpy", "ndarray", sizeof(PyArrayObject), 0); if (unlikely(!__pyx_ptype_5numpy_ndarray)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_ptype_5numpy_ufunc = __Pyx_ImportType("numpy", "ufunc", sizeof(PyUFuncObject), 0); if (unlikely(!__pyx_ptype_5numpy_ufunc)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 857; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  /*--- Variable import code ---*/
+  /*--- Function import code ---*/
+  /*--- Execution code ---*/
+
+  /* "scipy/sparse/_graph_tools.pyx":9
+ * # matrix, so that an edge stored as (i, j) can be traversed from j too.
+ * 
+ * import numpy as np             # <<<<<<<<<<<<<<
+ * cimport numpy as np
+ * cimport cython
+ */
+  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__numpy), 0, -1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 9; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__np, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 9; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "scipy/sparse/_graph_tools.pyx":15
+ * from libc.stdlib cimport malloc, free, qsort, const_void
+ * 
+ * np.import_array()             # <<<<<<<<<<<<<<
+ * 
+ * cdef double infinity = np.inf
+ */
+  import_array();
+
+  /* "scipy/sparse/_graph_tools.pyx":17
+ * np.import_array()
+ * 
+ * cdef double infinity = np.inf             # <<<<<<<<<<<<<<
+ * 
+ * # value stored in the predecessor arrays for nodes without predecessor
+ */
+  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__np); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 17; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__inf); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 17; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_3 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 17; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_5scipy_6sparse_12_graph_tools_infinity = __pyx_t_3;
+
+  /* "scipy/sparse/_graph_tools.pyx":20
+ * 
+ * # value stored in the predecessor arrays for nodes without predecessor
+ * NULL_IDX = -9999             # <<<<<<<<<<<<<<
+ * cdef int NO_PRED = -9999
+ * 
+ */
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__NULL_IDX, __pyx_int_neg_9999) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 20; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "scipy/sparse/_graph_tools.pyx":21
+ * # value stored in the predecessor arrays for nodes without predecessor
+ * NULL_IDX = -9999
+ * cdef int NO_PRED = -9999             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_v_5scipy_6sparse_12_graph_tools_NO_PRED = -9999;
+
+  /* "scipy/sparse/_graph_tools.pyx":111
+ * 
+ * 
+ * def dijkstra(np.ndarray Ap, np.ndarray Aj, np.ndarray Ax,             # <<<<<<<<<<<<<<
+ *              np.ndarray Bp, np.ndarray Bj, np.ndarray Bx, int undirected,
+ *              np.ndarray sources, np.ndarray dist, np.ndarray pred):
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5scipy_6sparse_12_graph_tools_dijkstra, NULL, __pyx_n_s_13); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__dijkstra, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "scipy/sparse/_graph_tools.pyx":202
+ * 
+ * 
+ * def bellman_ford(np.ndarray Ap, np.ndarray Aj, np.ndarray Ax,             # <<<<<<<<<<<<<<
+ *                  np.ndarray Bp, np.ndarray Bj, np.ndarray Bx, int undirected,
+ *                  np.ndarray sources, np.ndarray dist, np.ndarray pred):
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5scipy_6sparse_12_graph_tools_1bellman_ford, NULL, __pyx_n_s_13); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__bellman_ford, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "scipy/sparse/_graph_tools.pyx":240
+ * 
+ * 
+ * def johnson_potentials(np.ndarray Ap, np.ndarray Aj, np.ndarray Ax,             # <<<<<<<<<<<<<<
+ *                        np.ndarray Bp, np.ndarray Bj, np.ndarray Bx,
+ *                        int undirected, np.ndarray h):
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5scipy_6sparse_12_graph_tools_2johnson_potentials, NULL, __pyx_n_s_13); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 240; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__johnson_potentials, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 240; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "scipy/sparse/_graph_tools.pyx":273
+ * 
+ * @cython.boundscheck(False)
+ * def floyd_warshall(np.ndarray Ap, np.ndarray Aj, np.ndarray Ax,             # <<<<<<<<<<<<<<
+ *                    np.ndarray Bp, np.ndarray Bj, np.ndarray Bx,
+ *                    int undirected, np.ndarray dist, np.ndarray pred):
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5scipy_6sparse_12_graph_tools_3floyd_warshall, NULL, __pyx_n_s_13); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__floyd_warshall, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "scipy/sparse/_graph_tools.pyx":341
+ * 
+ * @cython.boundscheck(False)
+ * def breadth_first(np.ndarray Ap, np.ndarray Aj,             # <<<<<<<<<<<<<<
+ *                   np.ndarray Bp, np.ndarray Bj, int undirected,
+ *                   int start, np.ndarray order, np.ndarray pred):
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5scipy_6sparse_12_graph_tools_4breadth_first, NULL, __pyx_n_s_13); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__breadth_first, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "scipy/sparse/_graph_tools.pyx":387
+ * 
+ * @cython.boundscheck(False)
+ * def depth_first(np.ndarray Ap, np.ndarray Aj,             # <<<<<<<<<<<<<<
+ *                 np.ndarray Bp, np.ndarray Bj, int undirected,
+ *                 int start, np.ndarray order, np.ndarray pred):
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5scipy_6sparse_12_graph_tools_5depth_first, NULL, __pyx_n_s_13); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 387; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__depth_first, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 387; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "scipy/sparse/_graph_tools.pyx":461
+ * 
+ * @cython.boundscheck(False)
+ * def kruskal(int N, np.ndarray rows, np.ndarray cols, np.ndarray order,             # <<<<<<<<<<<<<<
+ *             np.ndarray keep):
+ *     """Kruskal's algorithm on an edge list.
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5scipy_6sparse_12_graph_tools_6kruskal, NULL, __pyx_n_s_13); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 461; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__kruskal, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 461; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "scipy/sparse/_graph_tools.pyx":584
+ * 
+ * @cython.boundscheck(False)
+ * def reverse_cuthill_mckee(np.ndarray Ap, np.ndarray Aj, np.ndarray order):             # <<<<<<<<<<<<<<
+ *     """Reverse Cuthill-McKee ordering of a symmetric pattern.
+ * 
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5scipy_6sparse_12_graph_tools_7reverse_cuthill_mckee, NULL, __pyx_n_s_13); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 584; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_14, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 584; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "scipy/sparse/_graph_tools.pyx":661
+ * 
+ * @cython.boundscheck(False)
+ * def nested_dissection(np.ndarray Ap, np.ndarray Aj, np.ndarray order,             # <<<<<<<<<<<<<<
+ *                       int leaf_size):
+ *     """Nested dissection ordering of a symmetric pattern.
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5scipy_6sparse_12_graph_tools_8nested_dissection, NULL, __pyx_n_s_13); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 661; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__nested_dissection, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 661; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "scipy/sparse/_graph_tools.pyx":1
+ * # Compiled kernels for scipy.sparse.csgraph.             # <<<<<<<<<<<<<<
+ * #
+ * # All routines work directly on the indptr/indices/data arrays of a CSR
+ */
+  __pyx_t_2 = PyDict_New(); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(((PyObject *)__pyx_t_2));
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s____test__, ((PyObject *)__pyx_t_2)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
+
+  /* "numpy.pxd":971
+ *      arr.base = baseptr
+ * 
+ * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
+ *     if arr.base is NULL:
+ *         return None
+ */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  if (__pyx_m) {
+    __Pyx_AddTraceback("init scipy.sparse._graph_tools", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    Py_DECREF(__pyx_m); __pyx_m = 0;
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init scipy.sparse._graph_tools");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if PY_MAJOR_VERSION < 3
+  return;
+  #else
+  return __pyx_m;
+  #endif
+}
+
+/* Runtime support code */
+
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule((char *)modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, (char *)"RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif /* CYTHON_REFNANNY */
+
+static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name) {
+    PyObject *result;
+    result = PyObject_GetAttr(dict, name);
+    if (!result) {
+        if (dict != __pyx_b) {
+            PyErr_Clear();
+            result = PyObject_GetAttr(__pyx_b, name);
+        }
+        if (!result) {
+            PyErr_SetObject(PyExc_NameError, name);
+        }
+    }
+    return result;
+}
+
+static CYTHON_INLINE long __Pyx_div_long(long a, long b) {
+    long q = a / b;
+    long r = a - q*b;
+    q -= ((r != 0) & ((r ^ b) < 0));
+    return q;
+}
+
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%s() takes %s %"PY_FORMAT_SIZE_T"d positional argument%s (%"PY_FORMAT_SIZE_T"d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        #if PY_MAJOR_VERSION >= 3
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+        #else
+        "%s() got multiple values for keyword argument '%s'", func_name,
+        PyString_AS_STRING(kw_name));
+        #endif
+}
+
+static int __Pyx_ParseOptionalKeywords(
+    PyObject *kwds,
+    PyObject **argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject *key = 0, *value = 0;
+    Py_ssize_t pos = 0;
+    PyObject*** name;
+    PyObject*** first_kw_arg = argnames + num_pos_args;
+
+    while (PyDict_Next(kwds, &pos, &key, &value)) {
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            values[name-argnames] = value;
+        } else {
+            #if PY_MAJOR_VERSION < 3
+            if (unlikely(!PyString_CheckExact(key)) && unlikely(!PyString_Check(key))) {
+            #else
+            if (unlikely(!PyUnicode_CheckExact(key)) && unlikely(!PyUnicode_Check(key))) {
+            #endif
+                goto invalid_keyword_type;
+            } else {
+                for (name = first_kw_arg; *name; name++) {
+                    #if PY_MAJOR_VERSION >= 3
+                    if (PyUnicode_GET_SIZE(**name) == PyUnicode_GET_SIZE(key) &&
+                        PyUnicode_Compare(**name, key) == 0) break;
+                    #else
+                    if (PyString_GET_SIZE(**name) == PyString_GET_SIZE(key) &&
+                        _PyString_Eq(**name, key)) break;
+                    #endif
+                }
+                if (*name) {
+                    values[name-argnames] = value;
+                } else {
+                    /* unexpected keyword found */
+                    for (name=argnames; name != first_kw_arg; name++) {
+                        if (**name == key) goto arg_passed_twice;
+                        #if PY_MAJOR_VERSION >= 3
+                        if (PyUnicode_GET_SIZE(**name) == PyUnicode_GET_SIZE(key) &&
+                            PyUnicode_Compare(**name, key) == 0) goto arg_passed_twice;
+                        #else
+                        if (PyString_GET_SIZE(**name) == PyString_GET_SIZE(key) &&
+                            _PyString_Eq(**name, key)) goto arg_passed_twice;
+                        #endif
+                    }
+                    if (kwds2) {
+                        if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+                    } else {
+                        goto invalid_keyword;
+                    }
+                }
+            }
+        }
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, **name);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%s() got an unexpected keyword argument '%s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+bad:
+    return -1;
+}
+
+static int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed,
+    const char *name, int exact)
+{
+    if (!type) {
+        PyErr_Format(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    if (none_allowed && obj == Py_None) return 1;
+    else if (exact) {
+        if (Py_TYPE(obj) == type) return 1;
+    }
+    else {
+        if (PyObject_TypeCheck(obj, type)) return 1;
+    }
+    PyErr_Format(PyExc_TypeError,
+        "Argument '%s' has incorrect type (expected %s, got %s)",
+        name, type->tp_name, Py_TYPE(obj)->tp_name);
+    return 0;
+}
+
+static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    PyThreadState *tstate = PyThreadState_GET();
+
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+
+static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb) {
+    PyThreadState *tstate = PyThreadState_GET();
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+
+
+#if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    /* cause is unused */
+    Py_XINCREF(type);
+    Py_XINCREF(value);
+    Py_XINCREF(tb);
+    /* First, check the traceback argument, replacing None with NULL. */
+    if (tb == Py_None) {
+        Py_DECREF(tb);
+        tb = 0;
+    }
+    else if (tb != NULL && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto raise_error;
+    }
+    /* Next, replace a missing value with None */
+    if (value == NULL) {
+        value = Py_None;
+        Py_INCREF(value);
+    }
+    #if PY_VERSION_HEX < 0x02050000
+    if (!PyClass_Check(type))
+    #else
+    if (!PyType_Check(type))
+    #endif
+    {
+        /* Raising an instance.  The value should be a dummy. */
+        if (value != Py_None) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        /* Normalize to raise <class>, <instance> */
+        Py_DECREF(value);
+        value = type;
+        #if PY_VERSION_HEX < 0x02050000
+            if (PyInstance_Check(type)) {
+                type = (PyObject*) ((PyInstanceObject*)type)->in_class;
+                Py_INCREF(type);
+            }
+            else {
+                type = 0;
+                PyErr_SetString(PyExc_TypeError,
+                    "raise: exception must be an old-style class or instance");
+                goto raise_error;
+            }
+        #else
+            type = (PyObject*) Py_TYPE(type);
+            Py_INCREF(type);
+            if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+                PyErr_SetString(PyExc_TypeError,
+                    "raise: exception class must be a subclass of BaseException");
+                goto raise_error;
+            }
+        #endif
+    }
+
+    __Pyx_ErrRestore(type, value, tb);
+    return;
+raise_error:
+    Py_XDECREF(value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+    return;
+}
+
+#else /* Python 3+ */
+
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (!PyExceptionClass_Check(type)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+
+    if (cause) {
+        PyObject *fixed_cause;
+        if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        }
+        else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        }
+        else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        if (!value) {
+            value = PyObject_CallObject(type, NULL);
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+
+    PyErr_SetObject(type, value);
+
+    if (tb) {
+        PyThreadState *tstate = PyThreadState_GET();
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+    }
+
+bad:
+    return;
+}
+#endif
+
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
+    PyErr_Format(PyExc_ValueError,
+                 "need more than %"PY_FORMAT_SIZE_T"d value%s to unpack",
+                 index, (index == 1) ? "" : "s");
+}
+
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
+    PyErr_Format(PyExc_ValueError,
+                 "too many values to unpack (expected %"PY_FORMAT_SIZE_T"d)", expected);
+}
+
+static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+}
+
+static void __Pyx_UnpackTupleError(PyObject *t, Py_ssize_t index) {
+    if (t == Py_None) {
+      __Pyx_RaiseNoneNotIterableError();
+    } else if (PyTuple_GET_SIZE(t) < index) {
+      __Pyx_RaiseNeedMoreValuesError(PyTuple_GET_SIZE(t));
+    } else {
+      __Pyx_RaiseTooManyValuesError(index);
+    }
+}
+
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
+    if (unlikely(!type)) {
+        PyErr_Format(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    if (likely(PyObject_TypeCheck(obj, type)))
+        return 1;
+    PyErr_Format(PyExc_TypeError, "Cannot convert %.200s to %.200s",
+                 Py_TYPE(obj)->tp_name, type->tp_name);
+    return 0;
+}
+
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, long level) {
+    PyObject *py_import = 0;
+    PyObject *empty_list = 0;
+    PyObject *module = 0;
+    PyObject *global_dict = 0;
+    PyObject *empty_dict = 0;
+    PyObject *list;
+    py_import = __Pyx_GetAttrString(__pyx_b, "__import__");
+    if (!py_import)
+        goto bad;
+    if (from_list)
+        list = from_list;
+    else {
+        empty_list = PyList_New(0);
+        if (!empty_list)
+            goto bad;
+        list = empty_list;
+    }
+    global_dict = PyModule_GetDict(__pyx_m);
+    if (!global_dict)
+        goto bad;
+    empty_dict = PyDict_New();
+    if (!empty_dict)
+        goto bad;
+    #if PY_VERSION_HEX >= 0x02050000
+    {
+        PyObject *py_level = PyInt_FromLong(level);
+        if (!py_level)
+            goto bad;
+        module = PyObject_CallFunctionObjArgs(py_import,
+            name, global_dict, empty_dict, list, py_level, NULL);
+        Py_DECREF(py_level);
+    }
+    #else
+    if (level>0) {
+        PyErr_SetString(PyExc_RuntimeError, "Relative import is not supported for Python <=2.4.");
+        goto bad;
+    }
+    module = PyObject_CallFunctionObjArgs(py_import,
+        name, global_dict, empty_dict, list, NULL);
+    #endif
+bad:
+    Py_XDECREF(empty_list);
+    Py_XDECREF(py_import);
+    Py_XDECREF(empty_dict);
+    return module;
+}
+
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
+      return ::std::complex< float >(x, y);
+    }
+  #else
+    static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
+      return x + y*(__pyx_t_float_complex)_Complex_I;
+    }
+  #endif
+#else
+    static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
+      __pyx_t_float_complex z;
+      z.real = x;
+      z.imag = y;
+      return z;
+    }
+#endif
+
+#if CYTHON_CCOMPLEX
+#else
+    static CYTHON_INLINE int __Pyx_c_eqf(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+       return (a.real == b.real) && (a.imag == b.imag);
+    }
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_sumf(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+        __pyx_t_float_complex z;
+        z.real = a.real + b.real;
+        z.imag = a.imag + b.imag;
+        return z;
+    }
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_difff(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+        __pyx_t_float_complex z;
+        z.real = a.real - b.real;
+        z.imag = a.imag - b.imag;
+        return z;
+    }
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_prodf(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+        __pyx_t_float_complex z;
+        z.real = a.real * b.real - a.imag * b.imag;
+        z.imag = a.real * b.imag + a.imag * b.real;
+        return z;
+    }
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_quotf(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+        __pyx_t_float_complex z;
+        float denom = b.real * b.real + b.imag * b.imag;
+        z.real = (a.real * b.real + a.imag * b.imag) / denom;
+        z.imag = (a.imag * b.real - a.real * b.imag) / denom;
+        return z;
+    }
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_negf(__pyx_t_float_complex a) {
+        __pyx_t_float_complex z;
+        z.real = -a.real;
+        z.imag = -a.imag;
+        return z;
+    }
+    static CYTHON_INLINE int __Pyx_c_is_zerof(__pyx_t_float_complex a) {
+       return (a.real == 0) && (a.imag == 0);
+    }
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_conjf(__pyx_t_float_complex a) {
+        __pyx_t_float_complex z;
+        z.real =  a.real;
+        z.imag = -a.imag;
+        return z;
+    }
+    #if 1
+        static CYTHON_INLINE float __Pyx_c_absf(__pyx_t_float_complex z) {
+          #if !defined(HAVE_HYPOT) || defined(_MSC_VER)
+            return sqrtf(z.real*z.real + z.imag*z.imag);
+          #else
+            return hypotf(z.real, z.imag);
+          #endif
+        }
+        static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_powf(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+            __pyx_t_float_complex z;
+            float r, lnr, theta, z_r, z_theta;
+            if (b.imag == 0 && b.real == (int)b.real) {
+                if (b.real < 0) {
+                    float denom = a.real * a.real + a.imag * a.imag;
+                    a.real = a.real / denom;
+                    a.imag = -a.imag / denom;
+                    b.real = -b.real;
+                }
+                switch ((int)b.real) {
+                    case 0:
+                        z.real = 1;
+                        z.imag = 0;
+                        return z;
+                    case 1:
+                        return a;
+                    case 2:
+                        z = __Pyx_c_prodf(a, a);
+                        return __Pyx_c_prodf(a, a);
+                    case 3:
+                        z = __Pyx_c_prodf(a, a);
+                        return __Pyx_c_prodf(z, a);
+                    case 4:
+                        z = __Pyx_c_prodf(a, a);
+                        return __Pyx_c_prodf(z, z);
+                }
+            }
+            if (a.imag == 0) {
+                if (a.real == 0) {
+                    return a;
+                }
+                r = a.real;
+                theta = 0;
+            } else {
+                r = __Pyx_c_absf(a);
+                theta = atan2f(a.imag, a.real);
+            }
+            lnr = logf(r);
+            z_r = expf(lnr * b.real - theta * b.imag);
+            z_theta = theta * b.real + lnr * b.imag;
+            z.real = z_r * cosf(z_theta);
+            z.imag = z_r * sinf(z_theta);
+            return z;
+        }
+    #endif
+#endif
+
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double x, double y) {
+      return ::std::complex< double >(x, y);
+    }
+  #else
+    static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double x, double y) {
+      return x + y*(__pyx_t_double_complex)_Complex_I;
+    }
+  #endif
+#else
+    static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double x, double y) {
+      __pyx_t_double_complex z;
+      z.real = x;
+      z.imag = y;
+      return z;
+    }
+#endif
+
+#if CYTHON_CCOMPLEX
+#else
+    static CYTHON_INLINE int __Pyx_c_eq(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+       return (a.real == b.real) && (a.imag == b.imag);
+    }
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_sum(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+        __pyx_t_double_complex z;
+        z.real = a.real + b.real;
+        z.imag = a.imag + b.imag;
+        return z;
+    }
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_diff(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+        __pyx_t_double_complex z;
+        z.real = a.real - b.real;
+        z.imag = a.imag - b.imag;
+        return z;
+    }
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_prod(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+        __pyx_t_double_complex z;
+        z.real = a.real * b.real - a.imag * b.imag;
+        z.imag = a.real * b.imag + a.imag * b.real;
+        return z;
+    }
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_quot(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+        __pyx_t_double_complex z;
+        double denom = b.real * b.real + b.imag * b.imag;
+        z.real = (a.real * b.real + a.imag * b.imag) / denom;
+        z.imag = (a.imag * b.real - a.real * b.imag) / denom;
+        return z;
+    }
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_neg(__pyx_t_double_complex a) {
+        __pyx_t_double_complex z;
+        z.real = -a.real;
+        z.imag = -a.imag;
+        return z;
+    }
+    static CYTHON_INLINE int __Pyx_c_is_zero(__pyx_t_double_complex a) {
+       return (a.real == 0) && (a.imag == 0);
+    }
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_conj(__pyx_t_double_complex a) {
+        __pyx_t_double_complex z;
+        z.real =  a.real;
+        z.imag = -a.imag;
+        return z;
+    }
+    #if 1
+        static CYTHON_INLINE double __Pyx_c_abs(__pyx_t_double_complex z) {
+          #if !defined(HAVE_HYPOT) || defined(_MSC_VER)
+            return sqrt(z.real*z.real + z.imag*z.imag);
+          #else
+            return hypot(z.real, z.imag);
+          #endif
+        }
+        static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_pow(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+            __pyx_t_double_complex z;
+            double r, lnr, theta, z_r, z_theta;
+            if (b.imag == 0 && b.real == (int)b.real) {
+                if (b.real < 0) {
+                    double denom = a.real * a.real + a.imag * a.imag;
+                    a.real = a.real / denom;
+                    a.imag = -a.imag / denom;
+                    b.real = -b.real;
+                }
+                switch ((int)b.real) {
+                    case 0:
+                        z.real = 1;
+                        z.imag = 0;
+                        return z;
+                    case 1:
+                        return a;
+                    case 2:
+                        z = __Pyx_c_prod(a, a);
+                        return __Pyx_c_prod(a, a);
+                    case 3:
+                        z = __Pyx_c_prod(a, a);
+                        return __Pyx_c_prod(z, a);
+                    case 4:
+                        z = __Pyx_c_prod(a, a);
+                        return __Pyx_c_prod(z, z);
+                }
+            }
+            if (a.imag == 0) {
+                if (a.real == 0) {
+                    return a;
+                }
+                r = a.real;
+                theta = 0;
+            } else {
+                r = __Pyx_c_abs(a);
+                theta = atan2(a.imag, a.real);
+            }
+            lnr = log(r);
+            z_r = exp(lnr * b.real - theta * b.imag);
+            z_theta = theta * b.real + lnr * b.imag;
+            z.real = z_r * cos(z_theta);
+            z.imag = z_r * sin(z_theta);
+            return z;
+        }
+    #endif
+#endif
+
+static CYTHON_INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject* x) {
+    const unsigned char neg_one = (unsigned char)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (sizeof(unsigned char) < sizeof(long)) {
+        long val = __Pyx_PyInt_AsLong(x);
+        if (unlikely(val != (long)(unsigned char)val)) {
+            if (!unlikely(val == -1 && PyErr_Occurred())) {
+                PyErr_SetString(PyExc_OverflowError,
+                    (is_unsigned && unlikely(val < 0)) ?
+                    "can't convert negative value to unsigned char" :
+                    "value too large to convert to unsigned char");
+            }
+            return (unsigned char)-1;
+        }
+        return (unsigned char)val;
+    }
+    return (unsigned char)__Pyx_PyInt_AsUnsignedLong(x);
+}
+
+static CYTHON_INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject* x) {
+    const unsigned short neg_one = (unsigned short)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (sizeof(unsigned short) < sizeof(long)) {
+        long val = __Pyx_PyInt_AsLong(x);
+        if (unlikely(val != (long)(unsigned short)val)) {
+            if (!unlikely(val == -1 && PyErr_Occurred())) {
+                PyErr_SetString(PyExc_OverflowError,
+                    (is_unsigned && unlikely(val < 0)) ?
+                    "can't convert negative value to unsigned short" :
+                    "value too large to convert to unsigned short");
+            }
+            return (unsigned short)-1;
+        }
+        return (unsigned short)val;
+    }
+    return (unsigned short)__Pyx_PyInt_AsUnsignedLong(x);
+}
+
+static CYTHON_INLINE unsigned int __Pyx_PyInt_AsUnsignedInt(PyObject* x) {
+    const unsigned int neg_one = (unsigned int)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (sizeof(unsigned int) < sizeof(long)) {
+        long val = __Pyx_PyInt_AsLong(x);
+        if (unlikely(val != (long)(unsigned int)val)) {
+            if (!unlikely(val == -1 && PyErr_Occurred())) {
+                PyErr_SetString(PyExc_OverflowError,
+                    (is_unsigned && unlikely(val < 0)) ?
+                    "can't convert negative value to unsigned int" :
+                    "value too large to convert to unsigned int");
+            }
+            return (unsigned int)-1;
+        }
+        return (unsigned int)val;
+    }
+    return (unsigned int)__Pyx_PyInt_AsUnsignedLong(x);
+}
+
+static CYTHON_INLINE char __Pyx_PyInt_AsChar(PyObject* x) {
+    const char neg_one = (char)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (sizeof(char) < sizeof(long)) {
+        long val = __Pyx_PyInt_AsLong(x);
+        if (unlikely(val != (long)(char)val)) {
+            if (!unlikely(val == -1 && PyErr_Occurred())) {
+                PyErr_SetString(PyExc_OverflowError,
+                    (is_unsigned && unlikely(val < 0)) ?
+                    "can't convert negative value to char" :
+                    "value too large to convert to char");
+            }
+            return (char)-1;
+        }
+        return (char)val;
+    }
+    return (char)__Pyx_PyInt_AsLong(x);
+}
+
+static CYTHON_INLINE short __Pyx_PyInt_AsShort(PyObject* x) {
+    const short neg_one = (short)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (sizeof(short) < sizeof(long)) {
+        long val = __Pyx_PyInt_AsLong(x);
+        if (unlikely(val != (long)(short)val)) {
+            if (!unlikely(val == -1 && PyErr_Occurred())) {
+                PyErr_SetString(PyExc_OverflowError,
+                    (is_unsigned && unlikely(val < 0)) ?
+                    "can't convert negative value to short" :
+                    "value too large to convert to short");
+            }
+            return (short)-1;
+        }
+        return (short)val;
+    }
+    return (short)__Pyx_PyInt_AsLong(x);
+}
+
+static CYTHON_INLINE int __Pyx_PyInt_AsInt(PyObject* x) {
+    const int neg_one = (int)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (sizeof(int) < sizeof(long)) {
+        long val = __Pyx_PyInt_AsLong(x);
+        if (unlikely(val != (long)(int)val)) {
+            if (!unlikely(val == -1 && PyErr_Occurred())) {
+                PyErr_SetString(PyExc_OverflowError,
+                    (is_unsigned && unlikely(val < 0)) ?
+                    "can't convert negative value to int" :
+                    "value too large to convert to int");
+            }
+            return (int)-1;
+        }
+        return (int)val;
+    }
+    return (int)__Pyx_PyInt_AsLong(x);
+}
+
+static CYTHON_INLINE signed char __Pyx_PyInt_AsSignedChar(PyObject* x) {
+    const signed char neg_one = (signed char)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (sizeof(signed char) < sizeof(long)) {
+        long val = __Pyx_PyInt_AsLong(x);
+        if (unlikely(val != (long)(signed char)val)) {
+            if (!unlikely(val == -1 && PyErr_Occurred())) {
+                PyErr_SetString(PyExc_OverflowError,
+                    (is_unsigned && unlikely(val < 0)) ?
+                    "can't convert negative value to signed char" :
+                    "value too large to convert to signed char");
+            }
+            return (signed char)-1;
+        }
+        return (signed char)val;
+    }
+    return (signed char)__Pyx_PyInt_AsSignedLong(x);
+}
+
+static CYTHON_INLINE signed short __Pyx_PyInt_AsSignedShort(PyObject* x) {
+    const signed short neg_one = (signed short)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (sizeof(signed short) < sizeof(long)) {
+        long val = __Pyx_PyInt_AsLong(x);
+        if (unlikely(val != (long)(signed short)val)) {
+            if (!unlikely(val == -1 && PyErr_Occurred())) {
+                PyErr_SetString(PyExc_OverflowError,
+                    (is_unsigned && unlikely(val < 0)) ?
+                    "can't convert negative value to signed short" :
+                    "value too large to convert to signed short");
+            }
+            return (signed short)-1;
+        }
+        return (signed short)val;
+    }
+    return (signed short)__Pyx_PyInt_AsSignedLong(x);
+}
+
+static CYTHON_INLINE signed int __Pyx_PyInt_AsSignedInt(PyObject* x) {
+    const signed int neg_one = (signed int)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (sizeof(signed int) < sizeof(long)) {
+        long val = __Pyx_PyInt_AsLong(x);
+        if (unlikely(val != (long)(signed int)val)) {
+            if (!unlikely(val == -1 && PyErr_Occurred())) {
+                PyErr_SetString(PyExc_OverflowError,
+                    (is_unsigned && unlikely(val < 0)) ?
+                    "can't convert negative value to signed int" :
+                    "value too large to convert to signed int");
+            }
+            return (signed int)-1;
+        }
+        return (signed int)val;
+    }
+    return (signed int)__Pyx_PyInt_AsSignedLong(x);
+}
+
+static CYTHON_INLINE int __Pyx_PyInt_AsLongDouble(PyObject* x) {
+    const int neg_one = (int)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (sizeof(int) < sizeof(long)) {
+        long val = __Pyx_PyInt_AsLong(x);
+        if (unlikely(val != (long)(int)val)) {
+            if (!unlikely(val == -1 && PyErr_Occurred())) {
+                PyErr_SetString(PyExc_OverflowError,
+                    (is_unsigned && unlikely(val < 0)) ?
+                    "can't convert negative value to int" :
+                    "value too large to convert to int");
+            }
+            return (int)-1;
+        }
+        return (int)val;
+    }
+    return (int)__Pyx_PyInt_AsLong(x);
+}
+
+static CYTHON_INLINE unsigned long __Pyx_PyInt_AsUnsignedLong(PyObject* x) {
+    const unsigned long neg_one = (unsigned long)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+#if PY_VERSION_HEX < 0x03000000
+    if (likely(PyInt_Check(x))) {
+        long val = PyInt_AS_LONG(x);
+        if (is_unsigned && unlikely(val < 0)) {
+            PyErr_SetString(PyExc_OverflowError,
+                            "can't convert negative value to unsigned long");
+            return (unsigned long)-1;
+        }
+        return (unsigned long)val;
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+            if (unlikely(Py_SIZE(x) < 0)) {
+                PyErr_SetString(PyExc_OverflowError,
+                                "can't convert negative value to unsigned long");
+                return (unsigned long)-1;
+            }
+            return (unsigned long)PyLong_AsUnsignedLong(x);
+        } else {
+            return (unsigned long)PyLong_AsLong(x);
+        }
+    } else {
+        unsigned long val;
+        PyObject *tmp = __Pyx_PyNumber_Int(x);
+        if (!tmp) return (unsigned long)-1;
+        val = __Pyx_PyInt_AsUnsignedLong(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+}
+
+static CYTHON_INLINE unsigned PY_LONG_LONG __Pyx_PyInt_AsUnsignedLongLong(PyObject* x) {
+    const unsigned PY_LONG_LONG neg_one = (unsigned PY_LONG_LONG)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+#if PY_VERSION_HEX < 0x03000000
+    if (likely(PyInt_Check(x))) {
+        long val = PyInt_AS_LONG(x);
+        if (is_unsigned && unlikely(val < 0)) {
+            PyErr_SetString(PyExc_OverflowError,
+                            "can't convert negative value to unsigned PY_LONG_LONG");
+            return (unsigned PY_LONG_LONG)-1;
+        }
+        return (unsigned PY_LONG_LONG)val;
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+            if (unlikely(Py_SIZE(x) < 0)) {
+                PyErr_SetString(PyExc_OverflowError,
+                                "can't convert negative value to unsigned PY_LONG_LONG");
+                return (unsigned PY_LONG_LONG)-1;
+            }
+            return (unsigned PY_LONG_LONG)PyLong_AsUnsignedLongLong(x);
+        } else {
+            return (unsigned PY_LONG_LONG)PyLong_AsLongLong(x);
+        }
+    } else {
+        unsigned PY_LONG_LONG val;
+        PyObject *tmp = __Pyx_PyNumber_Int(x);
+        if (!tmp) return (unsigned PY_LONG_LONG)-1;
+        val = __Pyx_PyInt_AsUnsignedLongLong(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+}
+
+static CYTHON_INLINE long __Pyx_PyInt_AsLong(PyObject* x) {
+    const long neg_one = (long)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+#if PY_VERSION_HEX < 0x03000000
+    if (likely(PyInt_Check(x))) {
+        long val = PyInt_AS_LONG(x);
+        if (is_unsigned && unlikely(val < 0)) {
+            PyErr_SetString(PyExc_OverflowError,
+                            "can't convert negative value to long");
+            return (long)-1;
+        }
+        return (long)val;
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+            if (unlikely(Py_SIZE(x) < 0)) {
+                PyErr_SetString(PyExc_OverflowError,
+                                "can't convert negative value to long");
+                return (long)-1;
+            }
+            return (long)PyLong_AsUnsignedLong(x);
+        } else {
+            return (long)PyLong_AsLong(x);
+        }
+    } else {
+        long val;
+        PyObject *tmp = __Pyx_PyNumber_Int(x);
+        if (!tmp) return (long)-1;
+        val = __Pyx_PyInt_AsLong(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+}
+
+static CYTHON_INLINE PY_LONG_LONG __Pyx_PyInt_AsLongLong(PyObject* x) {
+    const PY_LONG_LONG neg_one = (PY_LONG_LONG)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+#if PY_VERSION_HEX < 0x03000000
+    if (likely(PyInt_Check(x))) {
+        long val = PyInt_AS_LONG(x);
+        if (is_unsigned && unlikely(val < 0)) {
+            PyErr_SetString(PyExc_OverflowError,
+                            "can't convert negative value to PY_LONG_LONG");
+            return (PY_LONG_LONG)-1;
+        }
+        return (PY_LONG_LONG)val;
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+            if (unlikely(Py_SIZE(x) < 0)) {
+                PyErr_SetString(PyExc_OverflowError,
+                                "can't convert negative value to PY_LONG_LONG");
+                return (PY_LONG_LONG)-1;
+            }
+            return (PY_LONG_LONG)PyLong_AsUnsignedLongLong(x);
+        } else {
+            return (PY_LONG_LONG)PyLong_AsLongLong(x);
+        }
+    } else {
+        PY_LONG_LONG val;
+        PyObject *tmp = __Pyx_PyNumber_Int(x);
+        if (!tmp) return (PY_LONG_LONG)-1;
+        val = __Pyx_PyInt_AsLongLong(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+}
+
+static CYTHON_INLINE signed long __Pyx_PyInt_AsSignedLong(PyObject* x) {
+    const signed long neg_one = (signed long)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+#if PY_VERSION_HEX < 0x03000000
+    if (likely(PyInt_Check(x))) {
+        long val = PyInt_AS_LONG(x);
+        if (is_unsigned && unlikely(val < 0)) {
+            PyErr_SetString(PyExc_OverflowError,
+                            "can't convert negative value to signed long");
+            return (signed long)-1;
+        }
+        return (signed long)val;
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+            if (unlikely(Py_SIZE(x) < 0)) {
+                PyErr_SetString(PyExc_OverflowError,
+                                "can't convert negative value to signed long");
+                return (signed long)-1;
+            }
+            return (signed long)PyLong_AsUnsignedLong(x);
+        } else {
+            return (signed long)PyLong_AsLong(x);
+        }
+    } else {
+        signed long val;
+        PyObject *tmp = __Pyx_PyNumber_Int(x);
+        if (!tmp) return (signed long)-1;
+        val = __Pyx_PyInt_AsSignedLong(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+}
+
+static CYTHON_INLINE signed PY_LONG_LONG __Pyx_PyInt_AsSignedLongLong(PyObject* x) {
+    const signed PY_LONG_LONG neg_one = (signed PY_LONG_LONG)-1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+#if PY_VERSION_HEX < 0x03000000
+    if (likely(PyInt_Check(x))) {
+        long val = PyInt_AS_LONG(x);
+        if (is_unsigned && unlikely(val < 0)) {
+            PyErr_SetString(PyExc_OverflowError,
+                            "can't convert negative value to signed PY_LONG_LONG");
+            return (signed PY_LONG_LONG)-1;
+        }
+        return (signed PY_LONG_LONG)val;
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+            if (unlikely(Py_SIZE(x) < 0)) {
+                PyErr_SetString(PyExc_OverflowError,
+                                "can't convert negative value to signed PY_LONG_LONG");
+                return (signed PY_LONG_LONG)-1;
+            }
+            return (signed PY_LONG_LONG)PyLong_AsUnsignedLongLong(x);
+        } else {
+            return (signed PY_LONG_LONG)PyLong_AsLongLong(x);
+        }
+    } else {
+        signed PY_LONG_LONG val;
+        PyObject *tmp = __Pyx_PyNumber_Int(x);
+        if (!tmp) return (signed PY_LONG_LONG)-1;
+        val = __Pyx_PyInt_AsSignedLongLong(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+}
+
+static int __Pyx_check_binary_version(void) {
+    char ctversion[4], rtversion[4];
+    PyOS_snprintf(ctversion, 4, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    PyOS_snprintf(rtversion, 4, "%s", Py_GetVersion());
+    if (ctversion[0] != rtversion[0] || ctversion[2] != rtversion[2]) {
+        char message[200];
+        PyOS_snprintf(message, sizeof(message),
+                      "compiletime version %s of module '%.100s' "
+                      "does not match runtime version %s",
+                      ctversion, __Pyx_MODULE_NAME, rtversion);
+        #if PY_VERSION_HEX < 0x02050000
+        return PyErr_Warn(NULL, message);
+        #else
+        return PyErr_WarnEx(NULL, message, 1);
+        #endif
+    }
+    return 0;
+}
+
+#ifndef __PYX_HAVE_RT_ImportType
+#define __PYX_HAVE_RT_ImportType
+static PyTypeObject *__Pyx_ImportType(const char *module_name, const char *class_name,
+    size_t size, int strict)
+{
+    PyObject *py_module = 0;
+    PyObject *result = 0;
+    PyObject *py_name = 0;
+    char warning[200];
+
+    py_module = __Pyx_ImportModule(module_name);
+    if (!py_module)
+        goto bad;
+    #if PY_MAJOR_VERSION < 3
+    py_name = PyString_FromString(class_name);
+    #else
+    py_name = PyUnicode_FromString(class_name);
+    #endif
+    if (!py_name)
+        goto bad;
+    result = PyObject_GetAttr(py_module, py_name);
+    Py_DECREF(py_name);
+    py_name = 0;
+    Py_DECREF(py_module);
+    py_module = 0;
+    if (!result)
+        goto bad;
+    if (!PyType_Check(result)) {
+        PyErr_Format(PyExc_TypeError,
+            "%s.%s is not a type object",
+            module_name, class_name);
+        goto bad;
+    }
+    if (!strict && ((PyTypeObject *)result)->tp_basicsize > (Py_ssize_t)size) {
+        PyOS_snprintf(warning, sizeof(warning),
+            "%s.%s size changed, may indicate binary incompatibility",
+            module_name, class_name);
+        #if PY_VERSION_HEX < 0x02050000
+        if (PyErr_Warn(NULL, warning) < 0) goto bad;
+        #else
+        if (PyErr_WarnEx(NULL, warning, 0) < 0) goto bad;
+        #endif
+    }
+    else if (((PyTypeObject *)result)->tp_basicsize != (Py_ssize_t)size) {
+        PyErr_Format(PyExc_ValueError,
+            "%s.%s has the wrong size, try recompiling",
+            module_name, class_name);
+        goto bad;
+    }
+    return (PyTypeObject *)result;
+bad:
+    Py_XDECREF(py_module);
+    Py_XDECREF(result);
+    return NULL;
+}
+#endif
+
+#ifndef __PYX_HAVE_RT_ImportModule
+#define __PYX_HAVE_RT_ImportModule
+static PyObject *__Pyx_ImportModule(const char *name) {
+    PyObject *py_name = 0;
+    PyObject *py_module = 0;
+
+    #if PY_MAJOR_VERSION < 3
+    py_name = PyString_FromString(name);
+    #else
+    py_name = PyUnicode_FromString(name);
+    #endif
+    if (!py_name)
+        goto bad;
+    py_module = PyImport_Import(py_name);
+    Py_DECREF(py_name);
+    return py_module;
+bad:
+    Py_XDECREF(py_name);
+    return 0;
+}
+#endif
+
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+
+static void __Pyx_AddTraceback(const char *funcname, int __pyx_clineno,
+                               int __pyx_lineno, const char *__pyx_filename) {
+    PyObject *py_srcfile = 0;
+    PyObject *py_funcname = 0;
+    PyObject *py_globals = 0;
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+
+    #if PY_MAJOR_VERSION < 3
+    py_srcfile = PyString_FromString(__pyx_filename);
+    #else
+    py_srcfile = PyUnicode_FromString(__pyx_filename);
+    #endif
+    if (!py_srcfile) goto bad;
+    if (__pyx_clineno) {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, __pyx_clineno);
+        #else
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, __pyx_clineno);
+        #endif
+    }
+    else {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromString(funcname);
+        #else
+        py_funcname = PyUnicode_FromString(funcname);
+        #endif
+    }
+    if (!py_funcname) goto bad;
+    py_globals = PyModule_GetDict(__pyx_m);
+    if (!py_globals) goto bad;
+    py_code = PyCode_New(
+        0,            /*int argcount,*/
+        #if PY_MAJOR_VERSION >= 3
+        0,            /*int kwonlyargcount,*/
+        #endif
+        0,            /*int nlocals,*/
+        0,            /*int stacksize,*/
+        0,            /*int flags,*/
+        __pyx_empty_bytes, /*PyObject *code,*/
+        __pyx_empty_tuple,  /*PyObject *consts,*/
+        __pyx_empty_tuple,  /*PyObject *names,*/
+        __pyx_empty_tuple,  /*PyObject *varnames,*/
+        __pyx_empty_tuple,  /*PyObject *freevars,*/
+        __pyx_empty_tuple,  /*PyObject *cellvars,*/
+        py_srcfile,   /*PyObject *filename,*/
+        py_funcname,  /*PyObject *name,*/
+        __pyx_lineno,   /*int firstlineno,*/
+        __pyx_empty_bytes  /*PyObject *lnotab*/
+    );
+    if (!py_code) goto bad;
+    py_frame = PyFrame_New(
+        PyThreadState_GET(), /*PyThreadState *tstate,*/
+        py_code,             /*PyCodeObject *code,*/
+        py_globals,          /*PyObject *globals,*/
+        0                    /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    py_frame->f_lineno = __pyx_lineno;
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_srcfile);
+    Py_XDECREF(py_funcname);
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
+}
+
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+    while (t->p) {
+        #if PY_MAJOR_VERSION < 3
+        if (t->is_unicode) {
+            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
+        } else if (t->intern) {
+            *t->p = PyString_InternFromString(t->s);
+        } else {
+            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
+        }
+        #else  /* Python 3+ has unicode identifiers */
+        if (t->is_unicode | t->is_str) {
+            if (t->intern) {
+                *t->p = PyUnicode_InternFromString(t->s);
+            } else if (t->encoding) {
+                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
+            } else {
+                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
+            }
+        } else {
+            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
+        }
+        #endif
+        if (!*t->p)
+            return -1;
+        ++t;
+    }
+    return 0;
+}
+
+/* Type Conversion Functions */
+
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+   int is_true = x == Py_True;
+   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
+   else return PyObject_IsTrue(x);
+}
+
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x) {
+  PyNumberMethods *m;
+  const char *name = NULL;
+  PyObject *res = NULL;
+#if PY_VERSION_HEX < 0x03000000
+  if (PyInt_Check(x) || PyLong_Check(x))
+#else
+  if (PyLong_Check(x))
+#endif
+    return Py_INCREF(x), x;
+  m = Py_TYPE(x)->tp_as_number;
+#if PY_VERSION_HEX < 0x03000000
+  if (m && m->nb_int) {
+    name = "int";
+    res = PyNumber_Int(x);
+  }
+  else if (m && m->nb_long) {
+    name = "long";
+    res = PyNumber_Long(x);
+  }
+#else
+  if (m && m->nb_int) {
+    name = "int";
+    res = PyNumber_Long(x);
+  }
+#endif
+  if (res) {
+#if PY_VERSION_HEX < 0x03000000
+    if (!PyInt_Check(res) && !PyLong_Check(res)) {
+#else
+    if (!PyLong_Check(res)) {
+#endif
+      PyErr_Format(PyExc_TypeError,
+                   "__%s__ returned non-%s (type %.200s)",
+                   name, name, Py_TYPE(res)->tp_name);
+      Py_DECREF(res);
+      return NULL;
+    }
+  }
+  else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_TypeError,
+                    "an integer is required");
+  }
+  return res;
+}
+
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+  Py_ssize_t ival;
+  PyObject* x = PyNumber_Index(b);
+  if (!x) return -1;
+  ival = PyInt_AsSsize_t(x);
+  Py_DECREF(x);
+  return ival;
+}
+
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
+#if PY_VERSION_HEX < 0x02050000
+   if (ival <= LONG_MAX)
+       return PyInt_FromLong((long)ival);
+   else {
+       unsigned char *bytes = (unsigned char *) &ival;
+       int one = 1; int little = (int)*(unsigned char*)&one;
+       return _PyLong_FromByteArray(bytes, sizeof(size_t), little, 0);
+   }
+#else
+   return PyInt_FromSize_t(ival);
+#endif
+}
+
+static CYTHON_INLINE size_t __Pyx_PyInt_AsSize_t(PyObject* x) {
+   unsigned PY_LONG_LONG val = __Pyx_PyInt_AsUnsignedLongLong(x);
+   if (unlikely(val == (unsigned PY_LONG_LONG)-1 && PyErr_Occurred())) {
+       return (size_t)-1;
+   } else if (unlikely(val != (unsigned PY_LONG_LONG)(size_t)val)) {
+       PyErr_SetString(PyExc_OverflowError,
+                       "value too large to convert to size_t");
+       return (size_t)-1;
+   }
+   return (size_t)val;
+}
+
+
+#endif /* Py_PYTHON_H */
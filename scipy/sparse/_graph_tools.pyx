@@ -0,0 +1,774 @@
+# Compiled kernels for scipy.sparse.csgraph.
+#
+# All routines work directly on the indptr/indices/data arrays of a CSR
+# adjacency matrix.  Indices are C ints and weights are doubles; the
+# Python wrappers in csgraph.py take care of the conversions.  For
+# undirected graphs the wrappers also pass the arrays of the transposed
+# matrix, so that an edge stored as (i, j) can be traversed from j too.
+
+import numpy as np
+cimport numpy as np
+cimport cython
+
+from libc.stdlib cimport malloc, free, qsort, const_void
+
+np.import_array()
+
+cdef double infinity = np.inf
+
+# value stored in the predecessor arrays for nodes without predecessor
+NULL_IDX = -9999
+cdef int NO_PRED = -9999
+
+
+# binary min-heap keyed on distance.  Entries are never decreased in
+# place: a shorter path simply pushes the node again and stale entries
+# are skipped when popped, which bounds the heap size by the number of
+# edges.
+cdef struct heap:
+    int n
+    double* key
+    int* node
+
+cdef inline void heappush(heap* self, double key, int node) nogil:
+    cdef int i = self.n, parent
+    self.n += 1
+    while i > 0:
+        parent = (i - 1) // 2
+        if self.key[parent] <= key:
+            break
+        self.key[i] = self.key[parent]
+        self.node[i] = self.node[parent]
+        i = parent
+    self.key[i] = key
+    self.node[i] = node
+
+cdef inline int heappop(heap* self, double* key) nogil:
+    cdef int i, child, node, last_node
+    cdef double last_key
+    node = self.node[0]
+    key[0] = self.key[0]
+    self.n -= 1
+    last_key = self.key[self.n]
+    last_node = self.node[self.n]
+    i = 0
+    while 1:
+        child = 2 * i + 1
+        if child >= self.n:
+            break
+        if child + 1 < self.n and self.key[child + 1] < self.key[child]:
+            child += 1
+        if last_key <= self.key[child]:
+            break
+        self.key[i] = self.key[child]
+        self.node[i] = self.node[child]
+        i = child
+    self.key[i] = last_key
+    self.node[i] = last_node
+    return node
+
+
+@cython.boundscheck(False)
+@cython.cdivision(True)
+cdef void _dijkstra_one(int source, int N,
+                        int* Ap, int* Aj, double* Ax,
+                        int* Bp, int* Bj, double* Bx, int undirected,
+                        double* dist, int* pred, int* done, heap* h) nogil:
+    cdef int i, j, k
+    cdef double d, w
+
+    for i in range(N):
+        dist[i] = infinity
+        pred[i] = NO_PRED
+        done[i] = 0
+
+    h.n = 0
+    dist[source] = 0
+    heappush(h, 0, source)
+
+    while h.n > 0:
+        i = heappop(h, &d)
+        if done[i]:
+            continue
+        done[i] = 1
+        for k in range(Ap[i], Ap[i + 1]):
+            j = Aj[k]
+            w = d + Ax[k]
+            if w < dist[j]:
+                dist[j] = w
+                pred[j] = i
+                heappush(h, w, j)
+        if undirected:
+            for k in range(Bp[i], Bp[i + 1]):
+                j = Bj[k]
+                w = d + Bx[k]
+                if w < dist[j]:
+                    dist[j] = w
+                    pred[j] = i
+                    heappush(h, w, j)
+
+
+def dijkstra(np.ndarray Ap, np.ndarray Aj, np.ndarray Ax,
+             np.ndarray Bp, np.ndarray Bj, np.ndarray Bx, int undirected,
+             np.ndarray sources, np.ndarray dist, np.ndarray pred):
+    """Single-source Dijkstra from each node in `sources`.
+
+    Row ``s`` of `dist` and `pred` (both C-contiguous, shape
+    ``(len(sources), N)``) receives the result for ``sources[s]``.
+    Weights must be nonnegative.
+    """
+    cdef int N = Ap.shape[0] - 1
+    cdef int n_sources = sources.shape[0]
+    cdef int s
+    cdef int* src = <int*>sources.data
+    cdef int* ap = <int*>Ap.data
+    cdef int* aj = <int*>Aj.data
+    cdef double* ax = <double*>Ax.data
+    cdef int* bp = <int*>Bp.data
+    cdef int* bj = <int*>Bj.data
+    cdef double* bx = <double*>Bx.data
+    cdef double* d_ptr = <double*>dist.data
+    cdef int* p_ptr = <int*>pred.data
+    cdef heap h
+    cdef int* done
+    cdef int capacity = Aj.shape[0] + 1
+
+    if undirected:
+        capacity += Bj.shape[0]
+
+    h.key = <double*>malloc(capacity * sizeof(double))
+    h.node = <int*>malloc(capacity * sizeof(int))
+    done = <int*>malloc((N + 1) * sizeof(int))
+    if h.key == NULL or h.node == NULL or done == NULL:
+        free(h.key)
+        free(h.node)
+        free(done)
+        raise MemoryError()
+
+    with nogil:
+        for s in range(n_sources):
+            _dijkstra_one(src[s], N, ap, aj, ax, bp, bj, bx, undirected,
+                          d_ptr + s * N, p_ptr + s * N, done, &h)
+
+    free(h.key)
+    free(h.node)
+    free(done)
+
+
+@cython.boundscheck(False)
+cdef int _relax(int N, int* Ap, int* Aj, double* Ax,
+                int* Bp, int* Bj, double* Bx, int undirected,
+                double* dist, int* pred) nogil:
+    # one Bellman-Ford sweep over all edges; returns the number of
+    # distances that were lowered
+    cdef int i, j, k, changed = 0
+    cdef double d, w
+
+    for i in range(N):
+        d = dist[i]
+        if d == infinity:
+            continue
+        for k in range(Ap[i], Ap[i + 1]):
+            j = Aj[k]
+            w = d + Ax[k]
+            if w < dist[j]:
+                dist[j] = w
+                pred[j] = i
+                changed += 1
+        if undirected:
+            for k in range(Bp[i], Bp[i + 1]):
+                j = Bj[k]
+                w = d + Bx[k]
+                if w < dist[j]:
+                    dist[j] = w
+                    pred[j] = i
+                    changed += 1
+    return changed
+
+
+@cython.boundscheck(False)
+cdef int _bellman_ford(int N, int* Ap, int* Aj, double* Ax,
+                       int* Bp, int* Bj, double* Bx, int undirected,
+                       double* dist, int* pred) nogil:
+    # dist and pred hold the starting estimates; returns 1 if a
+    # negative cycle is reachable from the finite entries of dist
+    cdef int it
+    for it in range(N):
+        if not _relax(N, Ap, Aj, Ax, Bp, Bj, Bx, undirected, dist, pred):
+            return 0
+    return 1
+
+
+def bellman_ford(np.ndarray Ap, np.ndarray Aj, np.ndarray Ax,
+                 np.ndarray Bp, np.ndarray Bj, np.ndarray Bx, int undirected,
+                 np.ndarray sources, np.ndarray dist, np.ndarray pred):
+    """Single-source Bellman-Ford from each node in `sources`.
+
+    Same layout as `dijkstra`.  Returns the index into `sources` of the
+    first source from which a negative cycle is reachable, or -1.
+    """
+    cdef int N = Ap.shape[0] - 1
+    cdef int n_sources = sources.shape[0]
+    cdef int s, i, bad = -1
+    cdef int* src = <int*>sources.data
+    cdef int* ap = <int*>Ap.data
+    cdef int* aj = <int*>Aj.data
+    cdef double* ax = <double*>Ax.data
+    cdef int* bp = <int*>Bp.data
+    cdef int* bj = <int*>Bj.data
+    cdef double* bx = <double*>Bx.data
+    cdef double* d_base = <double*>dist.data
+    cdef int* p_base = <int*>pred.data
+    cdef double* d_ptr
+    cdef int* p_ptr
+
+    with nogil:
+        for s in range(n_sources):
+            d_ptr = d_base + s * N
+            p_ptr = p_base + s * N
+            for i in range(N):
+                d_ptr[i] = infinity
+                p_ptr[i] = NO_PRED
+            d_ptr[src[s]] = 0
+            if _bellman_ford(N, ap, aj, ax, bp, bj, bx, undirected,
+                             d_ptr, p_ptr):
+                bad = s
+                break
+    return bad
+
+
+def johnson_potentials(np.ndarray Ap, np.ndarray Aj, np.ndarray Ax,
+                       np.ndarray Bp, np.ndarray Bj, np.ndarray Bx,
+                       int undirected, np.ndarray h):
+    """Vertex potentials for Johnson's reweighting.
+
+    Runs Bellman-Ford from a virtual node joined to every node by a zero
+    weight edge, i.e. starting with all distances zero.  `h` receives
+    the potentials; returns 1 if the graph has a negative cycle.
+    """
+    cdef int N = Ap.shape[0] - 1
+    cdef int i, bad
+    cdef int* ap = <int*>Ap.data
+    cdef int* aj = <int*>Aj.data
+    cdef double* ax = <double*>Ax.data
+    cdef int* bp = <int*>Bp.data
+    cdef int* bj = <int*>Bj.data
+    cdef double* bx = <double*>Bx.data
+    cdef double* h_ptr = <double*>h.data
+    cdef int* pred = <int*>malloc((N + 1) * sizeof(int))
+
+    if pred == NULL:
+        raise MemoryError()
+    with nogil:
+        for i in range(N):
+            h_ptr[i] = 0
+            pred[i] = NO_PRED
+        bad = _bellman_ford(N, ap, aj, ax, bp, bj, bx, undirected,
+                            h_ptr, pred)
+    free(pred)
+    return bad
+
+
+@cython.boundscheck(False)
+def floyd_warshall(np.ndarray Ap, np.ndarray Aj, np.ndarray Ax,
+                   np.ndarray Bp, np.ndarray Bj, np.ndarray Bx,
+                   int undirected, np.ndarray dist, np.ndarray pred):
+    """All-pairs Floyd-Warshall.
+
+    `dist` and `pred` are C-contiguous N x N output arrays.  Returns 1
+    if a negative cycle was found.
+    """
+    cdef int N = Ap.shape[0] - 1
+    cdef int* ap = <int*>Ap.data
+    cdef int* aj = <int*>Aj.data
+    cdef double* ax = <double*>Ax.data
+    cdef int* bp = <int*>Bp.data
+    cdef int* bj = <int*>Bj.data
+    cdef double* bx = <double*>Bx.data
+    cdef double* D = <double*>dist.data
+    cdef int* P = <int*>pred.data
+    cdef int i, j, k
+    cdef double* Di
+    cdef double* Dk
+    cdef int* Pi
+    cdef int* Pk
+    cdef double dik, d
+    cdef int negative_cycle = 0
+
+    with nogil:
+        for i in range(N * N):
+            D[i] = infinity
+            P[i] = NO_PRED
+        for i in range(N):
+            D[i * N + i] = 0
+        # duplicate and reversed edges keep the lightest weight
+        for i in range(N):
+            for k in range(ap[i], ap[i + 1]):
+                j = aj[k]
+                if ax[k] < D[i * N + j]:
+                    D[i * N + j] = ax[k]
+                    if i != j:
+                        P[i * N + j] = i
+            if undirected:
+                for k in range(bp[i], bp[i + 1]):
+                    j = bj[k]
+                    if bx[k] < D[i * N + j]:
+                        D[i * N + j] = bx[k]
+                        if i != j:
+                            P[i * N + j] = i
+
+        for k in range(N):
+            Dk = D + k * N
+            Pk = P + k * N
+            for i in range(N):
+                Di = D + i * N
+                dik = Di[k]
+                if dik == infinity:
+                    continue
+                Pi = P + i * N
+                for j in range(N):
+                    d = dik + Dk[j]
+                    if d < Di[j]:
+                        Di[j] = d
+                        Pi[j] = Pk[j]
+        for i in range(N):
+            if D[i * N + i] < 0:
+                negative_cycle = 1
+    return negative_cycle
+
+
+@cython.boundscheck(False)
+def breadth_first(np.ndarray Ap, np.ndarray Aj,
+                  np.ndarray Bp, np.ndarray Bj, int undirected,
+                  int start, np.ndarray order, np.ndarray pred):
+    """Breadth-first order from `start`.
+
+    `order` (length N) receives the visited nodes and `pred` the
+    predecessor of each node in the tree.  Returns the number of nodes
+    reached.
+    """
+    cdef int N = Ap.shape[0] - 1
+    cdef int* ap = <int*>Ap.data
+    cdef int* aj = <int*>Aj.data
+    cdef int* bp = <int*>Bp.data
+    cdef int* bj = <int*>Bj.data
+    cdef int* o = <int*>order.data
+    cdef int* p = <int*>pred.data
+    cdef int i, j, k, head = 0, tail = 1
+
+    with nogil:
+        for i in range(N):
+            p[i] = NO_PRED
+        # pred doubles as the visited flag; the root points to itself
+        # until the traversal is done
+        o[0] = start
+        p[start] = start
+        while head < tail:
+            i = o[head]
+            head += 1
+            for k in range(ap[i], ap[i + 1]):
+                j = aj[k]
+                if p[j] == NO_PRED:
+                    p[j] = i
+                    o[tail] = j
+                    tail += 1
+            if undirected:
+                for k in range(bp[i], bp[i + 1]):
+                    j = bj[k]
+                    if p[j] == NO_PRED:
+                        p[j] = i
+                        o[tail] = j
+                        tail += 1
+        p[start] = NO_PRED
+    return tail
+
+
+@cython.boundscheck(False)
+def depth_first(np.ndarray Ap, np.ndarray Aj,
+                np.ndarray Bp, np.ndarray Bj, int undirected,
+                int start, np.ndarray order, np.ndarray pred):
+    """Depth-first (preorder) from `start`; same layout as
+    `breadth_first`."""
+    cdef int N = Ap.shape[0] - 1
+    cdef int* ap = <int*>Ap.data
+    cdef int* aj = <int*>Aj.data
+    cdef int* bp = <int*>Bp.data
+    cdef int* bj = <int*>Bj.data
+    cdef int* o = <int*>order.data
+    cdef int* p = <int*>pred.data
+    cdef int i, j, k, deg, top = 0, n_order = 1
+    cdef int* stack = <int*>malloc((N + 1) * sizeof(int))
+    cdef int* cursor = <int*>malloc((N + 1) * sizeof(int))
+
+    if stack == NULL or cursor == NULL:
+        free(stack)
+        free(cursor)
+        raise MemoryError()
+
+    with nogil:
+        for i in range(N):
+            p[i] = NO_PRED
+        o[0] = start
+        p[start] = start
+        stack[0] = start
+        cursor[start] = 0
+        while top >= 0:
+            i = stack[top]
+            # cursor[i] walks the row of A and then, for undirected
+            # graphs, the row of its transpose
+            deg = ap[i + 1] - ap[i]
+            j = -1
+            while j < 0:
+                k = cursor[i]
+                if k < deg:
+                    j = aj[ap[i] + k]
+                elif undirected and k < deg + bp[i + 1] - bp[i]:
+                    j = bj[bp[i] + k - deg]
+                else:
+                    break
+                cursor[i] = k + 1
+                if p[j] != NO_PRED:
+                    j = -1
+            if j < 0:
+                top -= 1
+                continue
+            p[j] = i
+            o[n_order] = j
+            n_order += 1
+            top += 1
+            stack[top] = j
+            cursor[j] = 0
+        p[start] = NO_PRED
+
+    free(stack)
+    free(cursor)
+    return n_order
+
+
+cdef inline int _find(int* parent, int i) nogil:
+    cdef int root = i, nxt
+    while parent[root] != root:
+        root = parent[root]
+    # path compression
+    while parent[i] != root:
+        nxt = parent[i]
+        parent[i] = root
+        i = nxt
+    return root
+
+
+@cython.boundscheck(False)
+def kruskal(int N, np.ndarray rows, np.ndarray cols, np.ndarray order,
+            np.ndarray keep):
+    """Kruskal's algorithm on an edge list.
+
+    `order` lists the edges (``rows[e]``, ``cols[e]``) by increasing
+    weight; ``keep[e]`` is set to 1 for the edges of the minimum
+    spanning forest.  Returns the number of edges kept.
+    """
+    cdef int* r = <int*>rows.data
+    cdef int* c = <int*>cols.data
+    cdef int* o = <int*>order.data
+    cdef np.int8_t* kp = <np.int8_t*>keep.data
+    cdef int n_edges = order.shape[0]
+    cdef int e, i, a, b, n_kept = 0
+    cdef int* parent = <int*>malloc((N + 1) * sizeof(int))
+    cdef int* rank = <int*>malloc((N + 1) * sizeof(int))
+
+    if parent == NULL or rank == NULL:
+        free(parent)
+        free(rank)
+        raise MemoryError()
+
+    with nogil:
+        for i in range(N):
+            parent[i] = i
+            rank[i] = 0
+        for i in range(n_edges):
+            if n_kept == N - 1:
+                break
+            e = o[i]
+            a = _find(parent, r[e])
+            b = _find(parent, c[e])
+            if a == b:
+                continue
+            # union by rank
+            if rank[a] < rank[b]:
+                parent[a] = b
+            elif rank[a] > rank[b]:
+                parent[b] = a
+            else:
+                parent[b] = a
+                rank[a] += 1
+            kp[e] = 1
+            n_kept += 1
+
+    free(parent)
+    free(rank)
+    return n_kept
+
+
+# Orderings.  These routines expect the nonzero pattern of a symmetric
+# matrix (self loops are ignored) and restrict the breadth-first searches
+# to the nodes i with part[i] == tag, so that nested dissection can work
+# on subgraphs without copying them.
+
+@cython.boundscheck(False)
+cdef int _bfs(int* ap, int* aj, int root, int tag, int* part,
+              int* level, int* queue) nogil:
+    # level[] must be -1 on the nodes of the subgraph; returns the number
+    # of nodes reached, which are left in queue[] in breadth-first order
+    cdef int i, j, k, head = 0, tail = 1
+    queue[0] = root
+    level[root] = 0
+    while head < tail:
+        i = queue[head]
+        head += 1
+        for k in range(ap[i], ap[i + 1]):
+            j = aj[k]
+            if level[j] < 0 and part[j] == tag:
+                level[j] = level[i] + 1
+                queue[tail] = j
+                tail += 1
+    return tail
+
+cdef inline void _reset(int* level, int* queue, int n) nogil:
+    cdef int k
+    for k in range(n):
+        level[queue[k]] = -1
+
+
+@cython.boundscheck(False)
+cdef int _peripheral(int* ap, int* aj, int root, int tag, int* part,
+                     int* degree, int* level, int* queue) nogil:
+    # George-Liu pseudo-peripheral node: restart the search from a node of
+    # minimum degree in the last level while the eccentricity grows
+    cdef int n, k, i, ecc, best, new_ecc
+    n = _bfs(ap, aj, root, tag, part, level, queue)
+    ecc = level[queue[n - 1]]
+    while 1:
+        best = queue[n - 1]
+        k = n - 2
+        while k >= 0 and level[queue[k]] == ecc:
+            i = queue[k]
+            if degree[i] < degree[best]:
+                best = i
+            k -= 1
+        _reset(level, queue, n)
+        n = _bfs(ap, aj, best, tag, part, level, queue)
+        new_ecc = level[queue[n - 1]]
+        _reset(level, queue, n)
+        if new_ecc <= ecc:
+            return root
+        root = best
+        ecc = new_ecc
+        n = _bfs(ap, aj, root, tag, part, level, queue)
+
+
+cdef int _compare_keys(const_void* a, const_void* b) nogil:
+    cdef np.int64_t x = (<np.int64_t*>a)[0], y = (<np.int64_t*>b)[0]
+    return (x > y) - (x < y)
+
+
+@cython.boundscheck(False)
+cdef void _degrees(int N, int* ap, int* aj, int* degree) nogil:
+    cdef int i, k
+    for i in range(N):
+        degree[i] = 0
+        for k in range(ap[i], ap[i + 1]):
+            if aj[k] != i:
+                degree[i] += 1
+
+
+@cython.boundscheck(False)
+def reverse_cuthill_mckee(np.ndarray Ap, np.ndarray Aj, np.ndarray order):
+    """Reverse Cuthill-McKee ordering of a symmetric pattern.
+
+    Each connected component is numbered breadth-first from a
+    pseudo-peripheral node, visiting neighbours by increasing degree;
+    the whole order is then reversed.  `order` (length N) receives the
+    permutation.
+    """
+    cdef int N = Ap.shape[0] - 1
+    cdef int* ap = <int*>Ap.data
+    cdef int* aj = <int*>Aj.data
+    cdef int* o = <int*>order.data
+    cdef int i, j, k, s, root, head, tail, first, n_new, tmp
+    cdef int* degree = <int*>malloc((N + 1) * sizeof(int))
+    cdef int* level = <int*>malloc((N + 1) * sizeof(int))
+    cdef int* queue = <int*>malloc((N + 1) * sizeof(int))
+    cdef int* part = <int*>malloc((N + 1) * sizeof(int))
+    cdef np.int64_t* keys = <np.int64_t*>malloc((N + 1) *
+                                                sizeof(np.int64_t))
+
+    if (degree == NULL or level == NULL or queue == NULL or part == NULL
+            or keys == NULL):
+        free(degree)
+        free(level)
+        free(queue)
+        free(part)
+        free(keys)
+        raise MemoryError()
+
+    with nogil:
+        _degrees(N, ap, aj, degree)
+        for i in range(N):
+            level[i] = -1
+            part[i] = 0
+
+        tail = 0
+        for s in range(N):
+            if part[s]:
+                continue
+            root = _peripheral(ap, aj, s, 0, part, degree, level, queue)
+            # part[] marks the nodes already numbered
+            head = tail
+            o[tail] = root
+            part[root] = 1
+            tail += 1
+            while head < tail:
+                i = o[head]
+                head += 1
+                first = tail
+                for k in range(ap[i], ap[i + 1]):
+                    j = aj[k]
+                    if not part[j]:
+                        part[j] = 1
+                        o[tail] = j
+                        tail += 1
+                n_new = tail - first
+                if n_new > 1:
+                    for k in range(n_new):
+                        j = o[first + k]
+                        keys[k] = ((<np.int64_t>degree[j]) << 32) | j
+                    qsort(keys, n_new, sizeof(np.int64_t), _compare_keys)
+                    for k in range(n_new):
+                        o[first + k] = <int>(keys[k] - ((keys[k] >> 32) << 32))
+
+        for i in range(N // 2):
+            tmp = o[i]
+            o[i] = o[N - 1 - i]
+            o[N - 1 - i] = tmp
+
+    free(degree)
+    free(level)
+    free(queue)
+    free(part)
+    free(keys)
+
+
+@cython.boundscheck(False)
+def nested_dissection(np.ndarray Ap, np.ndarray Aj, np.ndarray order,
+                      int leaf_size):
+    """Nested dissection ordering of a symmetric pattern.
+
+    Each subgraph larger than `leaf_size` is split by the middle level of
+    a breadth-first level structure rooted at a pseudo-peripheral node;
+    the two halves are ordered recursively, followed by the separator.
+    Disconnected subgraphs are split into their components first.
+    `order` (length N) receives the permutation.
+    """
+    cdef int N = Ap.shape[0] - 1
+    cdef int* ap = <int*>Ap.data
+    cdef int* aj = <int*>Aj.data
+    cdef int* nodes = <int*>order.data
+    cdef int i, k, n, size, start, end, root, ecc, sep, a, b, n_rest
+    cdef int tag = 0, n_tasks = 1
+    cdef int* degree = <int*>malloc((N + 1) * sizeof(int))
+    cdef int* level = <int*>malloc((N + 1) * sizeof(int))
+    cdef int* queue = <int*>malloc((N + 1) * sizeof(int))
+    cdef int* part = <int*>malloc((N + 1) * sizeof(int))
+    cdef int* tasks = <int*>malloc(2 * (N + 1) * sizeof(int))
+
+    if (degree == NULL or level == NULL or queue == NULL or part == NULL
+            or tasks == NULL):
+        free(degree)
+        free(level)
+        free(queue)
+        free(part)
+        free(tasks)
+        raise MemoryError()
+
+    with nogil:
+        _degrees(N, ap, aj, degree)
+        for i in range(N):
+            nodes[i] = i
+            level[i] = -1
+        # the pending subgraphs are the segments nodes[start:end]; they
+        # are rearranged in place, so the final nodes[] is the ordering
+        tasks[0] = 0
+        tasks[1] = N
+        while n_tasks > 0:
+            n_tasks -= 1
+            start = tasks[2 * n_tasks]
+            end = tasks[2 * n_tasks + 1]
+            size = end - start
+            if size <= leaf_size:
+                continue
+
+            tag += 1
+            for k in range(start, end):
+                part[nodes[k]] = tag
+
+            root = _peripheral(ap, aj, nodes[start], tag, part, degree,
+                               level, queue)
+            n = _bfs(ap, aj, root, tag, part, level, queue)
+
+            if n < size:
+                # disconnected: the reached component, then the rest
+                n_rest = n
+                for k in range(start, end):
+                    if level[nodes[k]] < 0:
+                        queue[n_rest] = nodes[k]
+                        n_rest += 1
+                for k in range(size):
+                    nodes[start + k] = queue[k]
+                _reset(level, queue, n)
+                tasks[2 * n_tasks] = start
+                tasks[2 * n_tasks + 1] = start + n
+                tasks[2 * n_tasks + 2] = start + n
+                tasks[2 * n_tasks + 3] = end
+                n_tasks += 2
+                continue
+
+            ecc = level[queue[n - 1]]
+            if ecc < 2:
+                # no level separates two nonempty parts
+                _reset(level, queue, n)
+                continue
+
+            # separator level: the one holding the median node, kept
+            # strictly inside the level structure
+            sep = level[queue[n // 2]]
+            if sep < 1:
+                sep = 1
+            elif sep > ecc - 1:
+                sep = ecc - 1
+            # levels are nondecreasing along the queue
+            a = 0
+            while level[queue[a]] < sep:
+                a += 1
+            b = a
+            while level[queue[b]] == sep:
+                b += 1
+
+            # nodes[start:end] becomes [levels < sep, levels > sep, sep]
+            for k in range(a):
+                nodes[start + k] = queue[k]
+            for k in range(b, n):
+                nodes[start + a + k - b] = queue[k]
+            for k in range(a, b):
+                nodes[end - b + k] = queue[k]
+            _reset(level, queue, n)
+
+            tasks[2 * n_tasks] = start
+            tasks[2 * n_tasks + 1] = start + a
+            tasks[2 * n_tasks + 2] = start + a
+            tasks[2 * n_tasks + 3] = start + a + n - b
+            n_tasks += 2
+
+    free(degree)
+    free(level)
+    free(queue)
+    free(part)
+    free(tasks)
@@ -11,7 +11,7 @@ import numpy as np
 from data import _data_matrix
 from compressed import _cs_matrix
 from base import isspmatrix, _formats
-from sputils import isshape, getdtype, to_native, upcast
+from sputils import isshape, getdtype, to_native, upcast, get_index_dtype
 import sparsetools
 from sparsetools import bsr_matvec, bsr_matvecs, csr_matmat_pass1, \
                         bsr_matmat_pass2, bsr_transpose, bsr_sort_indices
@@ -114,14 +114,14 @@ class bsr_matrix(_cs_matrix):
                     if not isshape(blocksize):
                         raise ValueError('invalid blocksize=%s' % blocksize)
                     blocksize = tuple(blocksize)
-                self.data    = np.zeros( (0,) + blocksize, getdtype(dtype, default=float) )
-                self.indices = np.zeros( 0, dtype=np.intc )
-
                 R,C = blocksize
                 if (M % R) != 0 or (N % C) != 0:
                     raise ValueError('shape must be multiple of blocksize')
 
-                self.indptr  = np.zeros(M//R + 1, dtype=np.intc )
+                idx_dtype = get_index_dtype(maxval=max(M//R, N//C))
+                self.data    = np.zeros( (0,) + blocksize, getdtype(dtype, default=float) )
+                self.indices = np.zeros( 0, dtype=idx_dtype )
+                self.indptr  = np.zeros(M//R + 1, dtype=idx_dtype )
 
             elif len(arg1) == 2:
                 # (data,(row,col)) format
@@ -193,9 +193,10 @@ class bsr_matrix(_cs_matrix):
             warn("indices array has non-integer dtype (%s)" \
                     % self.indices.dtype.name )
 
-        # only support 32-bit ints for now
-        self.indptr  = np.asarray(self.indptr, np.intc)
-        self.indices = np.asarray(self.indices, np.intc)
+        # use 32-bit indices unless the matrix is too large for them
+        idx_dtype = get_index_dtype(maxval=max(M//R, N//C, len(self.indices)))
+        self.indptr  = np.asarray(self.indptr, idx_dtype)
+        self.indices = np.asarray(self.indices, idx_dtype)
         self.data    = to_native(self.data)
 
         # check array shapes
@@ -316,8 +317,6 @@ class bsr_matrix(_cs_matrix):
         M, K1 = self.shape
         K2, N = other.shape
 
-        indptr = np.empty_like( self.indptr )
-
         R,n = self.blocksize
 
         #convert to this format
@@ -333,19 +332,33 @@ class bsr_matrix(_cs_matrix):
         else:
             other = other.tobsr(blocksize=(n,C))
 
+        # bound the number of blocks of the product as in _cs_matrix
+        a_counts = np.bincount(np.r_[self.indices, K1//n])[:K1//n]
+        b_counts = np.diff(other.indptr)
+        max_bnnz = min(np.dot(a_counts.astype(np.float64), b_counts),
+                       (M//R)*(N//C))
+        idx_dtype = get_index_dtype((self.indptr, other.indptr),
+                                    maxval=max(M//R, N//C, K1//n, max_bnnz))
+        A_indptr  = np.asarray(self.indptr, dtype=idx_dtype)
+        A_indices = np.asarray(self.indices, dtype=idx_dtype)
+        B_indptr  = np.asarray(other.indptr, dtype=idx_dtype)
+        B_indices = np.asarray(other.indices, dtype=idx_dtype)
+
+        indptr = np.empty(len(self.indptr), dtype=idx_dtype)
+
         csr_matmat_pass1( M//R, N//C, \
-                self.indptr,  self.indices, \
-                other.indptr, other.indices, \
+                A_indptr, A_indices, \
+                B_indptr, B_indices, \
                 indptr)
 
         bnnz = indptr[-1]
-        indices = np.empty(bnnz, dtype=np.intc)
+        indices = np.empty(bnnz, dtype=idx_dtype)
         data    = np.empty(R*C*bnnz, dtype=upcast(self.dtype,other.dtype))
 
         bsr_matmat_pass2( M//R, N//C, R, C, n, \
-                self.indptr,  self.indices,  np.ravel(self.data), \
-                other.indptr, other.indices, np.ravel(other.data), \
-                indptr,       indices,       data)
+                A_indptr, A_indices, np.ravel(self.data), \
+                B_indptr, B_indices, np.ravel(other.data), \
+                indptr,   indices,   data)
 
         data = data.reshape(-1,R,C)
 
@@ -499,14 +512,21 @@ class bsr_matrix(_cs_matrix):
         R,C = self.blocksize
 
         max_bnnz = len(self.data) + len(other.data)
-        indptr  = np.empty_like(self.indptr)
-        indices = np.empty(max_bnnz, dtype=np.intc)
+        idx_dtype = get_index_dtype((self.indices, other.indices),
+                                    maxval=max(self.shape[0]//R,
+                                               self.shape[1]//C, max_bnnz))
+        indptr  = np.empty(len(self.indptr), dtype=idx_dtype)
+        indices = np.empty(max_bnnz, dtype=idx_dtype)
         data    = np.empty(R*C*max_bnnz, dtype=upcast(self.dtype,other.dtype))
 
         fn(self.shape[0]//R, self.shape[1]//C, R, C,
-                self.indptr,  self.indices,  np.ravel(self.data),
-                other.indptr, other.indices, np.ravel(other.data),
-                indptr,       indices,       data)
+                np.asarray(self.indptr, dtype=idx_dtype),
+                np.asarray(self.indices, dtype=idx_dtype),
+                np.ravel(self.data),
+                np.asarray(other.indptr, dtype=idx_dtype),
+                np.asarray(other.indices, dtype=idx_dtype),
+                np.ravel(other.data),
+                indptr, indices, data)
 
         actual_bnnz = indptr[-1]
         indices = indices[:actual_bnnz]
@@ -0,0 +1,208 @@
+"""Incremental assembly of sparse matrices from coordinate triplets"""
+
+__docformat__ = "restructuredtext en"
+
+__all__ = ['coo_builder']
+
+import numpy as np
+
+from sparsetools import coo_tocsr, csr_tocsc, csr_sum_duplicates
+from sputils import getdtype, isshape, upcast, get_index_dtype
+
+
+class coo_builder(object):
+    """
+    Builder for assembling a sparse matrix from (row, col, value) triplets
+
+    Entries are appended to preallocated arrays that grow geometrically,
+    so that adding a block of entries costs a few vectorized copies,
+    independently of the number of entries already stored.  Entries for
+    the same position may be added any number of times; they are summed
+    when the matrix is converted.
+
+    This can be instantiated as:
+        coo_builder((M, N), [dtype, nnz_hint])
+            to assemble a matrix with shape (M, N).  dtype is optional,
+            defaulting to dtype='d'.  nnz_hint is the number of entries
+            (counting duplicates) to preallocate for.
+
+    Notes
+    -----
+
+    Advantages over lil_matrix and dok_matrix
+        - entries are added by vectorized calls instead of per element
+          Python operations, which dominate the assembly of large
+          matrices with the other formats
+        - the conversion to CSR or CSC format, including the summation
+          of duplicate entries, is done in compiled code in linear time
+
+    Intended Usage
+        - finite element and similar assemblies where a small dense block
+          is scattered into the global matrix for every element
+        - call ``tocsr()`` or ``tocsc()`` once, when all entries have been
+          added; the builder cannot be indexed or used in arithmetic
+
+    Examples
+    --------
+    >>> from scipy.sparse import coo_builder
+    >>> B = coo_builder((4, 4))
+    >>> B.add_block([0, 1], [0, 1], [[1, -1], [-1, 1]])
+    >>> B.add_block([1, 2], [1, 2], [[1, -1], [-1, 1]])
+    >>> B.add([3, 3], [0, 3], 2.0)
+    >>> B.tocsr().todense()
+    matrix([[ 1., -1.,  0.,  0.],
+            [-1.,  2., -1.,  0.],
+            [ 0., -1.,  1.,  0.],
+            [ 2.,  0.,  0.,  2.]])
+
+    Several elements can be added in one call by stacking their indices
+    and values:
+
+    >>> B = coo_builder((4, 4))
+    >>> elements = [[0, 1], [1, 2], [2, 3]]
+    >>> B.add_block(elements, elements, [[[1, -1], [-1, 1]]] * 3)
+    >>> B.nnz
+    12
+    >>> B.tocsr().diagonal()
+    array([ 1.,  2.,  2.,  1.])
+
+    """
+
+    def __init__(self, shape, dtype=None, nnz_hint=0):
+        if not isshape(shape):
+            raise TypeError('expected a shape (M, N)')
+        self.shape = (int(shape[0]), int(shape[1]))
+        self.dtype = np.dtype(upcast(getdtype(dtype, default=float)))
+        self.nnz = 0
+        idx_dtype = get_index_dtype(maxval=max(self.shape))
+        self.row = np.empty(nnz_hint, dtype=idx_dtype)
+        self.col = np.empty(nnz_hint, dtype=idx_dtype)
+        self.data = np.empty(nnz_hint, dtype=self.dtype)
+
+    def __repr__(self):
+        return "<%dx%d sparse matrix builder of type '%s'\n" \
+               "\twith %d stored elements (duplicates included)>" % \
+               (self.shape + (self.dtype.type, self.nnz))
+
+    def _reserve(self, n):
+        """Make room for n more entries"""
+        size = self.nnz + n
+        if size <= len(self.data):
+            return
+        size = max(size, 2 * len(self.data))
+        for name in ['row', 'col', 'data']:
+            old = getattr(self, name)
+            new = np.empty(size, dtype=old.dtype)
+            new[:self.nnz] = old[:self.nnz]
+            setattr(self, name, new)
+
+    def _append(self, rows, cols, values):
+        shape = np.broadcast(rows, cols, values).shape
+        n = int(np.prod(shape))
+        if n == 0:
+            return
+        M, N = self.shape
+        # check the indices before they are broadcast
+        for idx, dim in [(rows, M), (cols, N)]:
+            if idx.dtype.kind not in 'iu':
+                raise TypeError('indices must be integers')
+            if idx.min() < 0 or idx.max() >= dim:
+                raise IndexError('index out of bounds')
+
+        self._reserve(n)
+        end = self.nnz + n
+        self.row[self.nnz:end].reshape(shape)[...] = rows
+        self.col[self.nnz:end].reshape(shape)[...] = cols
+        self.data[self.nnz:end].reshape(shape)[...] = values
+        self.nnz = end
+
+    def add(self, rows, cols, values):
+        """Add entries values[k] at positions (rows[k], cols[k])
+
+        The arguments are broadcast against each other, so a scalar value
+        is added at every position.
+        """
+        self._append(np.asarray(rows), np.asarray(cols), np.asarray(values))
+
+    def add_block(self, rows, cols, values):
+        """Add the dense block values[i, j] at position (rows[i], cols[j])
+
+        If `rows` and `cols` are 2-D, with one row of indices per block,
+        then `values` has shape (n_blocks, len(rows[0]), len(cols[0])) and
+        all blocks are added in a single call.
+        """
+        rows = np.asarray(rows)
+        cols = np.asarray(cols)
+        values = np.asarray(values)
+        if rows.ndim == 1 and cols.ndim == 1:
+            if values.ndim > 2:
+                raise ValueError('values must have at most 2 dimensions')
+            self._append(rows[:, None], cols[None, :], values)
+        elif rows.ndim == 2 and cols.ndim == 2:
+            if len(rows) != len(cols):
+                raise ValueError('rows and cols hold different numbers '
+                                 'of blocks')
+            self._append(rows[:, :, None], cols[:, None, :], values)
+        else:
+            raise ValueError('rows and cols must both be 1-D or 2-D')
+
+    def clear(self):
+        """Remove all entries, keeping the allocated storage"""
+        self.nnz = 0
+
+    def tocoo(self):
+        """Return the assembled matrix in COOrdinate format
+
+        Duplicate entries are not summed.
+        """
+        from coo import coo_matrix
+        return coo_matrix((self.data[:self.nnz].copy(),
+                           (self.row[:self.nnz].copy(),
+                            self.col[:self.nnz].copy())),
+                          shape=self.shape)
+
+    def tocsr(self):
+        """Return the assembled matrix in Compressed Sparse Row format
+
+        Duplicate entries are summed and the column indices are sorted.
+        """
+        from csr import csr_matrix
+        indptr, indices, data = self._compress(self.shape, self.row,
+                                               self.col)
+        return csr_matrix((data, indices, indptr), shape=self.shape)
+
+    def tocsc(self):
+        """Return the assembled matrix in Compressed Sparse Column format
+
+        Duplicate entries are summed and the row indices are sorted.
+        """
+        from csc import csc_matrix
+        indptr, indices, data = self._compress(self.shape[::-1], self.col,
+                                               self.row)
+        return csc_matrix((data, indices, indptr), shape=self.shape)
+
+    def _compress(self, shape, major, minor):
+        # Compress along the minor axis first and transpose the result:
+        # both steps are counting sorts, which leave the indices of every
+        # compressed row sorted, so the duplicates are adjacent and can be
+        # summed without sorting.
+        M, N = shape
+        nnz = self.nnz
+        idx_dtype = get_index_dtype((major,), maxval=max(M, N, nnz))
+        minor_ptr = np.empty(N + 1, dtype=idx_dtype)
+        minor_ind = np.empty(nnz, dtype=idx_dtype)
+        minor_data = np.empty(nnz, dtype=self.dtype)
+        coo_tocsr(N, M, nnz, np.asarray(minor[:nnz], dtype=idx_dtype),
+                  np.asarray(major[:nnz], dtype=idx_dtype), self.data[:nnz],
+                  minor_ptr, minor_ind, minor_data)
+
+        indptr = np.empty(M + 1, dtype=idx_dtype)
+        indices = np.empty(nnz, dtype=idx_dtype)
+        data = np.empty(nnz, dtype=self.dtype)
+        csr_tocsc(N, M, minor_ptr, minor_ind, minor_data,
+                  indptr, indices, data)
+        del minor_ptr, minor_ind, minor_data
+
+        csr_sum_duplicates(M, N, indptr, indices, data)
+        nnz = indptr[-1]
+        return indptr, indices[:nnz].copy(), data[:nnz].copy()
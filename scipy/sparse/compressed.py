@@ -6,12 +6,124 @@ __all__ = []
 from warnings import warn
 
 import numpy as np
+from numpy.compat import asbytes, asstr
 
 from base import spmatrix, isspmatrix, SparseEfficiencyWarning
 from data import _data_matrix
 import sparsetools
 from sputils import upcast, to_native, isdense, isshape, getdtype, \
-        isscalarlike, isintlike
+        isscalarlike, isintlike, get_index_dtype, _threads_for, \
+        _nnz_partition, _run_threads
+
+
+# On-disk format written by _cs_matrix.save: an 8-byte magic string, a
+# header of little-endian int64 values (format version, index of the
+# format in _FILE_FORMATS, the shape, the number of stored entries and the
+# byte offsets of the indptr, indices and data arrays), the dtypes of the
+# data and of the index arrays as 8-byte strings, then the arrays in
+# little-endian byte order, each starting at a multiple of _FILE_ALIGN so
+# that they can be memory-mapped.
+_FILE_MAGIC = asbytes('\x93CSMATRX')
+_FILE_VERSION = 2
+_FILE_HEADER_LEN = 8
+_FILE_FORMATS = ['csr', 'csc']
+_FILE_ALIGN = 64
+
+# Number of entries of A processed at a time by _product_work.
+_WORK_CHUNK = 1 << 20
+
+
+def _product_work(Ap, Aj, Bp):
+    """Index pointer of the work of the CSR matrix product A * B.
+
+    ``work[i+1] - work[i]`` is the number of multiply-adds for row i of
+    the product, an upper bound of its number of entries.  `Ap` may be
+    a slice of a larger index pointer.
+    """
+    b_counts = np.diff(Bp)
+    Ap = np.asarray(Ap)
+    work = np.zeros(len(Ap), dtype=np.int64)
+    total = 0
+    # process the entries of A in chunks to bound the temporary memory
+    n_chunks = max(1, int(Ap[-1] - Ap[0]) // _WORK_CHUNK)
+    for start, stop in _nnz_partition(Ap - Ap[0], n_chunks):
+        lo, hi = Ap[start], Ap[stop]
+        c = np.empty(hi - lo + 1, dtype=np.int64)
+        c[0] = 0
+        np.cumsum(b_counts[Aj[lo:hi]], dtype=np.int64, out=c[1:])
+        work[start + 1:stop + 1] = total + c[Ap[start + 1:stop + 1] - lo]
+        total += c[-1]
+    return work
+
+
+def _csr_matmat(n_col, Ap, Aj, Ax, Bp, Bj, Bx, work=None):
+    """CSR arrays (indptr, indices, data) of the product A * B.
+
+    The rows of A are those of the index pointer `Ap`, which may be a
+    slice of the index pointer of a larger matrix; `work` is the result
+    of `_product_work` for these rows.  Blocks of rows holding about the
+    same amount of work are multiplied in parallel threads.
+    """
+    if work is None:
+        work = _product_work(Ap, Aj, Bp)
+    n_row = len(Ap) - 1
+    maxnnz = min(work[-1] - work[0], n_row * n_col)
+    idx_dtype = get_index_dtype((Ap, Aj, Bp, Bj),
+                                maxval=max(n_row, n_col, len(Bp), maxnnz))
+    dtype = upcast(Ax.dtype, Bx.dtype)
+    Ap = np.asarray(Ap, dtype=idx_dtype)
+    Aj = np.asarray(Aj, dtype=idx_dtype)
+    Bp = np.asarray(Bp, dtype=idx_dtype)
+    Bj = np.asarray(Bj, dtype=idx_dtype)
+    Ax = np.asarray(Ax, dtype=dtype)
+    Bx = np.asarray(Bx, dtype=dtype)
+
+    indptr = np.zeros(n_row + 1, dtype=idx_dtype)
+    if n_row == 0:
+        return indptr, np.empty(0, idx_dtype), np.empty(0, dtype)
+    ranges = _nnz_partition(work - work[0], _threads_for(work[-1] - work[0]))
+
+    # pass 1 counts the entries of every row of each block, so that the
+    # blocks can be written to their part of the output in pass 2
+    ptrs = {}
+    def pass1(start, stop):
+        Cp = np.empty(stop - start + 1, dtype=idx_dtype)
+        sparsetools.csr_matmat_pass1(stop - start, n_col, Ap[start:stop + 1],
+                                     Aj, Bp, Bj, Cp)
+        ptrs[start] = Cp
+    _run_threads(pass1, ranges)
+
+    offsets = {}
+    nnz = 0
+    for start, stop in ranges:
+        offsets[start] = nnz
+        nnz += int(ptrs[start][-1])
+    indices = np.empty(nnz, dtype=idx_dtype)
+    data = np.empty(nnz, dtype=dtype)
+
+    def pass2(start, stop):
+        Cp = ptrs[start]
+        lo = offsets[start]
+        hi = lo + int(Cp[-1])
+        sparsetools.csr_matmat_pass2(stop - start, n_col, Ap[start:stop + 1],
+                                     Aj, Ax, Bp, Bj, Bx, Cp,
+                                     indices[lo:hi], data[lo:hi])
+    _run_threads(pass2, ranges)
+
+    # pass 2 drops the entries that cancel, which may leave gaps between
+    # the blocks
+    nnz = 0
+    parts = []
+    for start, stop in ranges:
+        Cp = ptrs[start]
+        lo = offsets[start]
+        parts.append((lo, lo + int(Cp[-1])))
+        indptr[start + 1:stop + 1] = Cp[1:] + nnz
+        nnz += int(Cp[-1])
+    if len(parts) > 1 and nnz < len(indices):
+        indices = np.concatenate([indices[lo:hi] for lo, hi in parts])
+        data = np.concatenate([data[lo:hi] for lo, hi in parts])
+    return indptr, indices, data
 
 
 class _cs_matrix(_data_matrix):
@@ -34,9 +146,11 @@ class _cs_matrix(_data_matrix):
                 # create empty matrix
                 self.shape = arg1   #spmatrix checks for errors here
                 M, N = self.shape
+                idx_dtype = get_index_dtype(maxval=max(M, N))
                 self.data    = np.zeros(0, getdtype(dtype, default=float))
-                self.indices = np.zeros(0, np.intc)
-                self.indptr  = np.zeros(self._swap((M,N))[0] + 1, dtype=np.intc)
+                self.indices = np.zeros(0, idx_dtype)
+                self.indptr  = np.zeros(self._swap((M,N))[0] + 1,
+                                        dtype=idx_dtype)
             else:
                 if len(arg1) == 2:
                     # (data, ij) format
@@ -82,6 +196,15 @@ class _cs_matrix(_data_matrix):
 
         self.check_format(full_check=False)
 
+        if isinstance(arg1, tuple) and len(arg1) == 3:
+            for old, new in zip(arg1, (self.data, self.indices, self.indptr)):
+                if isinstance(old, np.memmap) and \
+                        not np.may_share_memory(old, new):
+                    warn("memory-mapped array was copied into memory; "
+                         "use %s indices and native byte order to avoid "
+                         "this" % np.dtype(self.indices.dtype).name,
+                         SparseEfficiencyWarning)
+
     def getnnz(self):
         return self.indptr[-1]
     nnz = property(fget=getnnz)
@@ -121,9 +244,11 @@ class _cs_matrix(_data_matrix):
             warn("indices array has non-integer dtype (%s)" \
                     % self.indices.dtype.name )
 
-        # only support 32-bit ints for now
-        self.indptr  = np.asarray(self.indptr,  dtype=np.intc)
-        self.indices = np.asarray(self.indices, dtype=np.intc)
+        # use 32-bit indices unless the matrix is too large for them
+        idx_dtype = get_index_dtype(maxval=max(self.shape +
+                                               (len(self.indices),)))
+        self.indptr  = np.asarray(self.indptr,  dtype=idx_dtype)
+        self.indices = np.asarray(self.indices, dtype=idx_dtype)
         self.data    = to_native(self.data)
 
         # check array shapes
@@ -277,23 +402,17 @@ class _cs_matrix(_data_matrix):
         M, K1 = self.shape
         K2, N = other.shape
 
-        major_axis = self._swap((M,N))[0]
-        indptr = np.empty(major_axis + 1, dtype=np.intc)
-
         other = self.__class__(other) #convert to this format
-        fn = getattr(sparsetools, self.format + '_matmat_pass1')
-        fn( M, N, self.indptr, self.indices, \
-                  other.indptr, other.indices, \
-                  indptr)
 
-        nnz = indptr[-1]
-        indices = np.empty(nnz, dtype=np.intc)
-        data    = np.empty(nnz, dtype=upcast(self.dtype,other.dtype))
-
-        fn = getattr(sparsetools, self.format + '_matmat_pass2')
-        fn( M, N, self.indptr, self.indices, self.data, \
-                  other.indptr, other.indices, other.data, \
-                  indptr, indices, data)
+        # the CSC arrays of a matrix are the CSR arrays of its transpose,
+        # and A * B = (B.T * A.T).T
+        if self.format == 'csr':
+            A, B, n_col = self, other, N
+        else:
+            A, B, n_col = other, self, M
+        indptr, indices, data = _csr_matmat(n_col, A.indptr, A.indices,
+                                            A.data, B.indptr, B.indices,
+                                            B.data)
 
         return self.__class__((data,indices,indptr),shape=(M,N))
 
@@ -537,7 +656,8 @@ class _cs_matrix(_data_matrix):
             data = data.copy()
             minor_indices = minor_indices.copy()
 
-        major_indices = np.empty(len(minor_indices), dtype=np.intc)
+        major_indices = np.empty(len(minor_indices),
+                                 dtype=minor_indices.dtype)
 
         sparsetools.expandptr(major_dim,self.indptr,major_indices)
 
@@ -553,11 +673,24 @@ class _cs_matrix(_data_matrix):
     # methods that examine or modify the internal data structure #
     ##############################################################
 
+    def _check_writeable(self):
+        """Raise ValueError if an array of the matrix is read-only.
+
+        The in-place sparsetools routines write through the array buffers
+        regardless of their flags, e.g. into a read-only memory map.
+        """
+        for arr in [self.indptr, self.indices, self.data]:
+            if not arr.flags.writeable:
+                raise ValueError("cannot modify a matrix with read-only "
+                                 "arrays in place; copy it first or load "
+                                 "it with mmap_mode='c'")
+
     def eliminate_zeros(self):
         """Remove zero entries from the matrix
 
         The is an *in place* operation
         """
+        self._check_writeable()
         fn = sparsetools.csr_eliminate_zeros
         M,N = self._swap(self.shape)
         fn( M, N, self.indptr, self.indices, self.data)
@@ -569,6 +702,7 @@ class _cs_matrix(_data_matrix):
 
         The is an *in place* operation
         """
+        self._check_writeable()
         self.sort_indices()
 
         fn = sparsetools.csr_sum_duplicates
@@ -615,6 +749,7 @@ class _cs_matrix(_data_matrix):
         """
 
         if not self.has_sorted_indices:
+            self._check_writeable()
             fn = sparsetools.csr_sort_indices
             fn( len(self.indptr) - 1, self.indptr, self.indices, self.data)
             self.has_sorted_indices = True
@@ -635,6 +770,131 @@ class _cs_matrix(_data_matrix):
         self.indices = self.indices[:self.nnz]
 
 
+    def save(self, filename):
+        """Write the matrix to a file.
+
+        The index pointer, indices and data arrays are written to a flat
+        binary file, which can be opened with `load` without reading it
+        into memory.
+
+        Parameters
+        ----------
+        filename : str
+            Name of the file to write.
+
+        See Also
+        --------
+        load
+
+        """
+        nnz = self.nnz
+        data_dtype = self.dtype.newbyteorder('<')
+        idx_dtype = np.dtype(get_index_dtype(maxval=max(self.shape + (nnz,))))
+        idx_dtype = idx_dtype.newbyteorder('<')
+        arrays = [np.asarray(self.indptr, dtype=idx_dtype),
+                  np.asarray(self.indices[:nnz], dtype=idx_dtype),
+                  np.asarray(self.data[:nnz], dtype=data_dtype)]
+        offsets = []
+        offset = len(_FILE_MAGIC) + 8*_FILE_HEADER_LEN + 16
+        for arr in arrays:
+            offset = -(-offset//_FILE_ALIGN)*_FILE_ALIGN
+            offsets.append(offset)
+            offset += arr.nbytes
+        header = np.array([_FILE_VERSION, _FILE_FORMATS.index(self.format)]
+                          + list(self.shape) + [nnz] + offsets, dtype='<i8')
+
+        f = open(filename, 'wb')
+        try:
+            f.write(_FILE_MAGIC)
+            f.write(header.tostring())
+            f.write(asbytes(data_dtype.str.ljust(8, '\0')))
+            f.write(asbytes(idx_dtype.str.ljust(8, '\0')))
+            for arr, offset in zip(arrays, offsets):
+                f.write(asbytes('\0')*(offset - f.tell()))
+                arr.tofile(f)
+        finally:
+            f.close()
+
+    def load(cls, filename, mmap_mode='r'):
+        """Open a matrix written by `save`.
+
+        Parameters
+        ----------
+        filename : str
+            Name of the file to read.
+        mmap_mode : {None, 'r', 'r+', 'c'}, optional
+            If not None, the arrays of the matrix are memory-mapped from
+            the file using the given mode (see `numpy.memmap`) instead of
+            being read into memory.  Opening the matrix then takes constant
+            time, and operations such as row slicing of a CSR matrix only
+            read the parts of the file they need.  With mode 'r' the
+            matrix is read-only, and in-place methods such as
+            `sum_duplicates` raise ValueError; mode 'c' allows them without
+            touching the file.  Default: 'r'.
+
+        Returns
+        -------
+        A : sparse matrix
+            The matrix, of the same format as the class `load` is called
+            on.
+
+        See Also
+        --------
+        save
+
+        Notes
+        -----
+        The arrays are stored in little-endian byte order; on big-endian
+        machines they are converted, and thus read into memory, when the
+        file is opened.
+
+        """
+        f = open(filename, 'rb')
+        try:
+            magic = f.read(len(_FILE_MAGIC))
+            if magic != _FILE_MAGIC:
+                raise ValueError("%s is not a sparse matrix file" % filename)
+            header = np.fromstring(f.read(8*_FILE_HEADER_LEN), dtype='<i8')
+            if len(header) != _FILE_HEADER_LEN:
+                raise ValueError("%s is truncated" % filename)
+            version, fmt, M, N, nnz = [int(v) for v in header[:5]]
+            # version 1 files had no index dtype and only 32-bit indices
+            if version != _FILE_VERSION:
+                raise ValueError("unsupported sparse matrix file version %d"
+                                 % version)
+            data_dtype = asstr(f.read(8)).rstrip('\0')
+            idx_dtype = asstr(f.read(8)).rstrip('\0')
+            if len(idx_dtype) == 0:
+                raise ValueError("%s is truncated" % filename)
+            format = cls.__name__[:3]
+            if _FILE_FORMATS[fmt] != format:
+                raise ValueError("%s holds a %s_matrix, not a %s_matrix" %
+                                 (filename, _FILE_FORMATS[fmt], format))
+            # CSR matrices are compressed along the rows, CSC along columns
+            specs = [(idx_dtype, (M, N)[fmt] + 1),
+                     (idx_dtype, nnz),
+                     (data_dtype, nnz)]
+            arrays = []
+            for (dtype, size), offset in zip(specs, header[5:]):
+                if mmap_mode is None or size == 0:
+                    f.seek(int(offset))
+                    arr = np.fromfile(f, dtype=dtype, count=size)
+                    if len(arr) != size:
+                        raise ValueError("%s is truncated" % filename)
+                else:
+                    arr = np.memmap(filename, dtype=dtype, mode=mmap_mode,
+                                    offset=int(offset), shape=(size,))
+                if not arr.dtype.isnative:
+                    arr = arr.astype(arr.dtype.newbyteorder('='))
+                arrays.append(arr)
+        finally:
+            f.close()
+
+        indptr, indices, data = arrays
+        return cls((data, indices, indptr), shape=(M, N))
+    load = classmethod(load)
+
+
     ###################
     # utility methods #
     ###################
@@ -660,13 +920,17 @@ class _cs_matrix(_data_matrix):
         fn = getattr(sparsetools, self.format + op + self.format)
 
         maxnnz  = self.nnz + other.nnz
-        indptr  = np.empty_like(self.indptr)
-        indices = np.empty(maxnnz, dtype=np.intc)
+        idx_dtype = get_index_dtype((self.indices, other.indices),
+                                    maxval=max(self.shape + (maxnnz,)))
+        indptr  = np.empty(len(self.indptr), dtype=idx_dtype)
+        indices = np.empty(maxnnz, dtype=idx_dtype)
         data    = np.empty(maxnnz, dtype=upcast(self.dtype,other.dtype))
 
         fn(self.shape[0], self.shape[1], \
-                self.indptr,  self.indices,  self.data,
-                other.indptr, other.indices, other.data,
+                np.asarray(self.indptr, dtype=idx_dtype),
+                np.asarray(self.indices, dtype=idx_dtype), self.data,
+                np.asarray(other.indptr, dtype=idx_dtype),
+                np.asarray(other.indices, dtype=idx_dtype), other.data,
                 indptr, indices, data)
 
         actual_nnz = indptr[-1]
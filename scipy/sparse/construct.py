@@ -11,7 +11,7 @@ from warnings import warn
 
 import numpy as np
 
-from sputils import upcast
+from sputils import upcast, get_index_dtype
 
 from csr import csr_matrix
 from csc import csc_matrix
@@ -82,15 +82,16 @@ def identity(n, dtype='d', format=None):
 
     """
 
+    idx_dtype = get_index_dtype(maxval=n)
     if format in ['csr','csc']:
-        indptr  = np.arange(n+1, dtype=np.intc)
-        indices = np.arange(n,   dtype=np.intc)
+        indptr  = np.arange(n+1, dtype=idx_dtype)
+        indices = np.arange(n,   dtype=idx_dtype)
         data    = np.ones(n,     dtype=dtype)
         cls = eval('%s_matrix' % format)
         return cls((data,indices,indptr),(n,n))
     elif format == 'coo':
-        row  = np.arange(n, dtype=np.intc)
-        col  = np.arange(n, dtype=np.intc)
+        row  = np.arange(n, dtype=idx_dtype)
+        col  = np.arange(n, dtype=idx_dtype)
         data = np.ones(n, dtype=dtype)
         return coo_matrix((data,(row,col)),(n,n))
     elif format == 'dia':
@@ -171,8 +172,9 @@ def kron(A, B, format=None):
             return coo_matrix( output_shape )
 
         # expand entries of a into blocks
-        row  = A.row.repeat(B.nnz)
-        col  = A.col.repeat(B.nnz)
+        idx_dtype = get_index_dtype(maxval=max(output_shape))
+        row  = np.asarray(A.row, dtype=idx_dtype).repeat(B.nnz)
+        col  = np.asarray(A.col, dtype=idx_dtype).repeat(B.nnz)
         data = A.data.repeat(B.nnz)
 
         row *= B.shape[0]
@@ -331,8 +333,8 @@ def bmat(blocks, format=None, dtype=None):
     M,N = blocks.shape
 
     block_mask   = np.zeros(blocks.shape,    dtype=np.bool)
-    brow_lengths = np.zeros(blocks.shape[0], dtype=np.intc)
-    bcol_lengths = np.zeros(blocks.shape[1], dtype=np.intc)
+    brow_lengths = np.zeros(blocks.shape[0], dtype=np.int64)
+    bcol_lengths = np.zeros(blocks.shape[1], dtype=np.int64)
 
     # convert everything to COO format
     for i in range(M):
@@ -368,9 +370,10 @@ def bmat(blocks, format=None, dtype=None):
     row_offsets = np.concatenate(([0], np.cumsum(brow_lengths)))
     col_offsets = np.concatenate(([0], np.cumsum(bcol_lengths)))
 
+    idx_dtype = get_index_dtype(maxval=max(row_offsets[-1], col_offsets[-1]))
     data = np.empty(nnz, dtype=dtype)
-    row  = np.empty(nnz, dtype=np.intc)
-    col  = np.empty(nnz, dtype=np.intc)
+    row  = np.empty(nnz, dtype=idx_dtype)
+    col  = np.empty(nnz, dtype=idx_dtype)
 
     nnz = 0
     for i in range(M):
@@ -9,7 +9,7 @@ from warnings import warn
 import numpy as np
 
 from sparsetools import csc_tocsr
-from sputils import upcast, isintlike
+from sputils import upcast, isintlike, get_index_dtype
 
 from compressed import _cs_matrix
 
@@ -99,12 +99,15 @@ class csc_matrix(_cs_matrix):
 
     def tocsr(self):
         M,N = self.shape
-        indptr  = np.empty(M + 1,    dtype=np.intc)
-        indices = np.empty(self.nnz, dtype=np.intc)
+        idx_dtype = get_index_dtype((self.indptr, self.indices),
+                                    maxval=max(M, N, self.nnz))
+        indptr  = np.empty(M + 1,    dtype=idx_dtype)
+        indices = np.empty(self.nnz, dtype=idx_dtype)
         data    = np.empty(self.nnz, dtype=upcast(self.dtype))
 
         csc_tocsr(M, N, \
-                 self.indptr, self.indices, self.data, \
+                 np.asarray(self.indptr, dtype=idx_dtype),
+                 np.asarray(self.indices, dtype=idx_dtype), self.data, \
                  indptr, indices, data)
 
         from csr import csr_matrix
@@ -126,8 +129,11 @@ class csc_matrix(_cs_matrix):
                 if isintlike(col) or isinstance(col,slice):
                     return self.T[col,row].T
                 else:
-                    row = np.asarray(row, dtype=np.intc)
-                    col = np.asarray(col, dtype=np.intc)
+                    row = np.asarray(row)
+                    col = np.asarray(col)
+                    idx_dtype = get_index_dtype((row, col))
+                    row = np.asarray(row, dtype=idx_dtype)
+                    col = np.asarray(col, dtype=idx_dtype)
                     if len(row.shape) == 1:
                         return self.T[col,row]
                     elif len(row.shape) == 2:
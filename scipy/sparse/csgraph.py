@@ -2,14 +2,22 @@
 
 __docformat__ = "restructuredtext en"
 
-__all__ = ['cs_graph_components']
+__all__ = ['cs_graph_components', 'shortest_path', 'dijkstra',
+           'bellman_ford', 'floyd_warshall', 'johnson',
+           'breadth_first_order', 'depth_first_order',
+           'minimum_spanning_tree', 'NegativeCycleError',
+           'reverse_cuthill_mckee', 'nested_dissection',
+           'symmetric_permutation']
 
 import numpy as np
 
 from sparsetools import cs_graph_components as _cs_graph_components
+import _graph_tools
 
 from csr import csr_matrix
+from csc import csc_matrix
 from base import isspmatrix
+from sputils import _max_intc_index
 
 _msg0 = 'x must be a symmetric square matrix!'
 _msg1 = _msg0 + '(has shape %s)'
@@ -78,3 +86,622 @@ def cs_graph_components(x):
     return n_comp, label
 
 
+class NegativeCycleError(Exception):
+    """The graph contains a cycle of negative total weight, so shortest
+    paths are not defined."""
+    pass
+
+# marker for "no predecessor" in the predecessor arrays
+NULL_IDX = _graph_tools.NULL_IDX
+
+_graph_msg = 'csgraph must be a square matrix (has shape %s)'
+
+
+def _check_index_size(A, name='csgraph'):
+    """Raise ValueError if the indices of the sparse matrix `A` do not
+    fit into the C ints used by the compiled routines."""
+    if max(A.shape + (A.nnz,)) > _max_intc_index:
+        raise ValueError("%s is too large, only 32-bit indices are "
+                         "supported" % name)
+
+
+def _validate_graph(csgraph, directed, unweighted=False):
+    """Return ``(N, arrays)`` where ``arrays`` holds the contiguous
+    indptr, indices and float64 data of `csgraph` in CSR form, followed
+    by those of its transpose (the same arrays again if `directed`).
+
+    Every stored entry of a sparse matrix is an edge, explicit zeros
+    included; for dense input the nonzero entries are the edges.
+    """
+    if isspmatrix(csgraph):
+        _check_index_size(csgraph)
+        G = csgraph.tocsr()
+    else:
+        G = csr_matrix(np.asarray(csgraph))
+
+    if len(G.shape) != 2 or G.shape[0] != G.shape[1]:
+        raise ValueError(_graph_msg % (G.shape,))
+
+    def arrays(G):
+        indptr = np.ascontiguousarray(G.indptr, dtype=np.intc)
+        indices = np.ascontiguousarray(G.indices, dtype=np.intc)
+        if unweighted:
+            data = np.ones(len(indices), dtype=np.float64)
+        else:
+            data = np.ascontiguousarray(G.data, dtype=np.float64)
+        return indptr, indices, data
+
+    A = arrays(G)
+    if directed:
+        B = A
+    else:
+        B = arrays(G.T.tocsr())
+    return G.shape[0], A + B
+
+
+def _validate_indices(indices, N):
+    """Return (sources, scalar) for the `indices` argument."""
+    if indices is None:
+        return np.arange(N, dtype=np.intc), False
+    scalar = np.isscalar(indices)
+    sources = np.array(indices, dtype=np.intc, ndmin=1, copy=True)
+    if sources.ndim != 1:
+        raise ValueError('indices must be a scalar or a 1-d sequence')
+    sources[sources < 0] += N
+    if np.any(sources < 0) or np.any(sources >= N):
+        raise ValueError('indices out of range 0...%d' % (N - 1))
+    return sources, scalar
+
+
+def _result(dist, pred, scalar, return_predecessors):
+    if scalar:
+        dist = dist[0]
+        pred = pred[0]
+    if return_predecessors:
+        return dist, pred
+    return dist
+
+
+def dijkstra(csgraph, directed=True, indices=None,
+             return_predecessors=False, unweighted=False):
+    """
+    Shortest path lengths with Dijkstra's algorithm.
+
+    Uses a binary heap, so each source costs O((N + E) log E) for a
+    graph with N nodes and E edges.
+
+    Parameters
+    ----------
+    csgraph : array_like or sparse matrix, shape (N, N)
+        Adjacency matrix: entry ``(i, j)`` is the weight of the edge from
+        node `i` to node `j`.  All stored entries of a sparse matrix are
+        edges; for a dense array the nonzero entries are.  Weights must
+        be nonnegative.
+    directed : bool, optional
+        If False, an edge can be traversed in both directions.
+    indices : int or sequence of ints, optional
+        Compute paths only from these nodes.  Default is all nodes.
+    return_predecessors : bool, optional
+        If True, also return the predecessor matrix.
+    unweighted : bool, optional
+        If True, every edge has weight one (hop count).
+
+    Returns
+    -------
+    dist_matrix : ndarray, shape (n_indices, N)
+        ``dist_matrix[i, j]`` is the length of the shortest path from
+        ``indices[i]`` to node `j`; ``inf`` if there is none.  One
+        dimensional if `indices` is a scalar.
+    predecessors : ndarray, shape (n_indices, N)
+        Only returned if `return_predecessors` is True.  The node before
+        `j` on the shortest path from ``indices[i]`` to `j`, or -9999 if
+        there is no such node.
+
+    See Also
+    --------
+    shortest_path, bellman_ford, johnson
+
+    """
+    N, arrays = _validate_graph(csgraph, directed, unweighted)
+    if np.any(arrays[2] < 0):
+        raise ValueError('dijkstra requires nonnegative edge weights; '
+                         'use bellman_ford or johnson instead')
+    sources, scalar = _validate_indices(indices, N)
+
+    dist = np.empty((len(sources), N), dtype=np.float64)
+    pred = np.empty((len(sources), N), dtype=np.intc)
+    _graph_tools.dijkstra(*(arrays + (not directed, sources, dist, pred)))
+    return _result(dist, pred, scalar, return_predecessors)
+
+
+def bellman_ford(csgraph, directed=True, indices=None,
+                 return_predecessors=False, unweighted=False):
+    """
+    Shortest path lengths with the Bellman-Ford algorithm.
+
+    Negative weights are allowed.  Each source costs O(N E).  For an
+    undirected graph a negative edge is itself a negative cycle.
+
+    Parameters and return values are as for `dijkstra`.
+
+    Raises
+    ------
+    NegativeCycleError
+        If a negative cycle is reachable from one of the sources.
+
+    See Also
+    --------
+    shortest_path, dijkstra, johnson
+
+    """
+    N, arrays = _validate_graph(csgraph, directed, unweighted)
+    sources, scalar = _validate_indices(indices, N)
+
+    dist = np.empty((len(sources), N), dtype=np.float64)
+    pred = np.empty((len(sources), N), dtype=np.intc)
+    bad = _graph_tools.bellman_ford(*(arrays + (not directed, sources,
+                                                dist, pred)))
+    if bad >= 0:
+        raise NegativeCycleError('negative cycle reachable from node %d'
+                                 % sources[bad])
+    return _result(dist, pred, scalar, return_predecessors)
+
+
+def johnson(csgraph, directed=True, indices=None,
+            return_predecessors=False, unweighted=False):
+    """
+    Shortest path lengths with Johnson's algorithm.
+
+    A single Bellman-Ford pass computes vertex potentials that make all
+    edge weights nonnegative, after which Dijkstra's algorithm is run
+    from every source.  This handles negative weights at roughly the
+    cost of `dijkstra` for sparse graphs.
+
+    Parameters and return values are as for `dijkstra`.
+
+    Raises
+    ------
+    NegativeCycleError
+        If the graph contains a negative cycle.
+
+    See Also
+    --------
+    shortest_path, dijkstra, bellman_ford
+
+    """
+    N, arrays = _validate_graph(csgraph, directed, unweighted)
+    sources, scalar = _validate_indices(indices, N)
+    Ap, Aj, Ax, Bp, Bj, Bx = arrays
+
+    h = np.empty(N, dtype=np.float64)
+    if _graph_tools.johnson_potentials(Ap, Aj, Ax, Bp, Bj, Bx,
+                                       not directed, h):
+        raise NegativeCycleError('the graph contains a negative cycle')
+
+    def reweight(indptr, indices, data):
+        rows = np.repeat(np.arange(N), np.diff(indptr))
+        # clip the rounding noise so that Dijkstra sees no negative edge
+        return np.maximum(data + h[rows] - h[indices], 0)
+
+    Ax = reweight(Ap, Aj, Ax)
+    if directed:
+        Bx = Ax
+    else:
+        Bx = reweight(Bp, Bj, Bx)
+
+    dist = np.empty((len(sources), N), dtype=np.float64)
+    pred = np.empty((len(sources), N), dtype=np.intc)
+    _graph_tools.dijkstra(Ap, Aj, Ax, Bp, Bj, Bx, not directed,
+                          sources, dist, pred)
+    dist += h[np.newaxis, :] - h[sources][:, np.newaxis]
+    return _result(dist, pred, scalar, return_predecessors)
+
+
+def floyd_warshall(csgraph, directed=True, return_predecessors=False,
+                   unweighted=False):
+    """
+    All-pairs shortest path lengths with the Floyd-Warshall algorithm.
+
+    Runs in O(N**3) time and O(N**2) memory regardless of the number of
+    edges, which makes it the method of choice for small or dense
+    graphs.  Negative weights are allowed.
+
+    Parameters and return values are as for `dijkstra`, with the result
+    always of shape (N, N).
+
+    Raises
+    ------
+    NegativeCycleError
+        If the graph contains a negative cycle.
+
+    See Also
+    --------
+    shortest_path, dijkstra
+
+    """
+    N, arrays = _validate_graph(csgraph, directed, unweighted)
+
+    dist = np.empty((N, N), dtype=np.float64)
+    pred = np.empty((N, N), dtype=np.intc)
+    if _graph_tools.floyd_warshall(*(arrays + (not directed, dist, pred))):
+        raise NegativeCycleError('the graph contains a negative cycle')
+    return _result(dist, pred, False, return_predecessors)
+
+
+def shortest_path(csgraph, method='auto', directed=True,
+                  return_predecessors=False, unweighted=False,
+                  indices=None):
+    """
+    Shortest path lengths on a graph stored as a sparse or dense matrix.
+
+    Parameters
+    ----------
+    csgraph : array_like or sparse matrix, shape (N, N)
+        Adjacency matrix; see `dijkstra`.
+    method : {'auto', 'D', 'BF', 'J', 'FW'}, optional
+        Algorithm to use:
+
+        * 'D' -- Dijkstra's algorithm, nonnegative weights only
+        * 'BF' -- Bellman-Ford
+        * 'J' -- Johnson's algorithm
+        * 'FW' -- Floyd-Warshall
+        * 'auto' -- Floyd-Warshall for dense graphs (more than a quarter
+          of the entries are edges), otherwise Dijkstra's algorithm if
+          all weights are nonnegative and Johnson's algorithm if not.
+
+    directed, return_predecessors, unweighted, indices
+        See `dijkstra`.
+
+    Returns
+    -------
+    dist_matrix, predecessors
+        See `dijkstra`.
+
+    Raises
+    ------
+    NegativeCycleError
+        If a negative cycle is found.
+
+    Examples
+    --------
+    >>> from scipy.sparse.csgraph import shortest_path
+    >>> G = [[0, 1, 3],
+    ...      [0, 0, 1],
+    ...      [0, 0, 0]]
+    >>> shortest_path(G)
+    array([[  0.,   1.,   2.],
+           [ inf,   0.,   1.],
+           [ inf,  inf,   0.]])
+
+    """
+    if method == 'auto':
+        if not isspmatrix(csgraph):
+            csgraph = csr_matrix(np.asarray(csgraph))
+        N = csgraph.shape[0]
+        if N > 0 and csgraph.nnz > 0.25 * N * N:
+            method = 'FW'
+        elif unweighted or not np.any(csgraph.tocsr().data < 0):
+            method = 'D'
+        else:
+            method = 'J'
+
+    if method == 'FW':
+        result = floyd_warshall(csgraph, directed, True, unweighted)
+        if indices is not None:
+            sources, scalar = _validate_indices(indices, result[0].shape[0])
+            result = (result[0][sources], result[1][sources])
+            if scalar:
+                result = (result[0][0], result[1][0])
+        if return_predecessors:
+            return result
+        return result[0]
+
+    try:
+        func = {'D': dijkstra, 'BF': bellman_ford, 'J': johnson}[method]
+    except KeyError:
+        raise ValueError('unrecognized method %r' % (method,))
+    return func(csgraph, directed, indices, return_predecessors, unweighted)
+
+
+def _traversal(func, csgraph, i_start, directed, return_predecessors):
+    N, (Ap, Aj, Ax, Bp, Bj, Bx) = _validate_graph(csgraph, directed, True)
+    if i_start < 0:
+        i_start += N
+    if not 0 <= i_start < N:
+        raise ValueError('i_start out of range 0...%d' % (N - 1))
+
+    order = np.empty(N, dtype=np.intc)
+    pred = np.empty(N, dtype=np.intc)
+    n_reached = func(Ap, Aj, Bp, Bj, not directed, int(i_start), order, pred)
+    order = order[:n_reached].copy()
+    if return_predecessors:
+        return order, pred
+    return order
+
+
+def breadth_first_order(csgraph, i_start, directed=True,
+                        return_predecessors=True):
+    """
+    Breadth-first ordering of the nodes reachable from `i_start`.
+
+    Parameters
+    ----------
+    csgraph : array_like or sparse matrix, shape (N, N)
+        Adjacency matrix; see `dijkstra`.  Weights are ignored.
+    i_start : int
+        Starting node.
+    directed : bool, optional
+        If False, edges can be traversed in both directions.
+    return_predecessors : bool, optional
+        If True (default), also return the predecessor array.
+
+    Returns
+    -------
+    node_array : ndarray of ints
+        The reachable nodes, in the order they are visited.  Neighbours
+        are visited in the order they are stored in the rows of the
+        matrix.
+    predecessors : ndarray of ints, shape (N,)
+        The parent of each node in the breadth-first tree, -9999 for
+        `i_start` and for unreachable nodes.
+
+    See Also
+    --------
+    depth_first_order
+
+    """
+    return _traversal(_graph_tools.breadth_first, csgraph, i_start,
+                      directed, return_predecessors)
+
+
+def depth_first_order(csgraph, i_start, directed=True,
+                      return_predecessors=True):
+    """
+    Depth-first (preorder) ordering of the nodes reachable from
+    `i_start`.
+
+    The traversal uses an explicit stack, so deep graphs do not hit the
+    recursion limit.  Parameters and return values are as for
+    `breadth_first_order`.
+
+    See Also
+    --------
+    breadth_first_order
+
+    """
+    return _traversal(_graph_tools.depth_first, csgraph, i_start,
+                      directed, return_predecessors)
+
+
+def minimum_spanning_tree(csgraph):
+    """
+    Minimum spanning tree (or forest) of an undirected graph.
+
+    Uses Kruskal's algorithm on the stored edges.  The direction of the
+    edges is ignored: ``(i, j)`` and ``(j, i)`` are the same edge.
+
+    Parameters
+    ----------
+    csgraph : array_like or sparse matrix, shape (N, N)
+        Adjacency matrix; see `dijkstra`.
+
+    Returns
+    -------
+    tree : csr_matrix, shape (N, N)
+        The edges of the spanning tree, each stored at the position it
+        had in `csgraph`.  If the graph is not connected this is a
+        spanning forest with one tree per connected component.
+
+    Examples
+    --------
+    >>> from scipy.sparse.csgraph import minimum_spanning_tree
+    >>> G = [[0, 8, 0, 3],
+    ...      [0, 0, 2, 5],
+    ...      [0, 0, 0, 6],
+    ...      [0, 0, 0, 0]]
+    >>> minimum_spanning_tree(G).todense()
+    matrix([[ 0.,  0.,  0.,  3.],
+            [ 0.,  0.,  2.,  5.],
+            [ 0.,  0.,  0.,  0.],
+            [ 0.,  0.,  0.,  0.]])
+
+    """
+    N, (Ap, Aj, Ax, Bp, Bj, Bx) = _validate_graph(csgraph, True)
+
+    rows = np.repeat(np.arange(N, dtype=np.intc), np.diff(Ap))
+    order = np.ascontiguousarray(np.argsort(Ax, kind='mergesort'),
+                                 dtype=np.intc)
+    keep = np.zeros(len(Ax), dtype=np.int8)
+    _graph_tools.kruskal(N, rows, Aj, order, keep)
+
+    keep = keep.astype(bool)
+    return csr_matrix((Ax[keep], (rows[keep], Aj[keep])), shape=(N, N))
+
+
+def _symmetric_pattern(graph, symmetric_mode):
+    """Return contiguous indptr and indices of the nonzero pattern of
+    ``graph + graph.T`` (of `graph` alone if `symmetric_mode`)."""
+    if isspmatrix(graph):
+        _check_index_size(graph, 'graph')
+        G = graph.tocsr()
+    else:
+        G = csr_matrix(np.asarray(graph))
+    if len(G.shape) != 2 or G.shape[0] != G.shape[1]:
+        raise ValueError(_graph_msg % (G.shape,))
+
+    if not symmetric_mode:
+        P = csr_matrix((np.ones(len(G.indices), dtype=np.intc),
+                        G.indices, G.indptr), shape=G.shape)
+        G = P + P.T.tocsr()
+    return (np.ascontiguousarray(G.indptr, dtype=np.intc),
+            np.ascontiguousarray(G.indices, dtype=np.intc))
+
+
+def reverse_cuthill_mckee(graph, symmetric_mode=False):
+    """
+    Reverse Cuthill-McKee ordering of a sparse matrix.
+
+    The ordering reduces the bandwidth (and usually the profile) of the
+    matrix, which also improves the memory locality of products with
+    vectors.
+
+    Parameters
+    ----------
+    graph : array_like or sparse matrix, shape (N, N)
+        The matrix to reorder.  Only its nonzero pattern is used.
+    symmetric_mode : bool, optional
+        If True, the pattern of `graph` is assumed to be symmetric and is
+        used as is; otherwise the pattern of ``graph + graph.T`` is used.
+
+    Returns
+    -------
+    perm : ndarray of ints, shape (N,)
+        The permutation: row and column ``i`` of the reordered matrix are
+        row and column ``perm[i]`` of `graph`.
+
+    See Also
+    --------
+    nested_dissection, symmetric_permutation
+
+    Notes
+    -----
+    Each connected component is numbered breadth-first from a
+    pseudo-peripheral node found with the algorithm of George and Liu,
+    visiting the neighbours of each node by increasing degree, and the
+    resulting order is reversed.
+
+    References
+    ----------
+    .. [1] E. Cuthill and J. McKee, "Reducing the bandwidth of sparse
+       symmetric matrices", Proc. 24th ACM National Conference, 1969.
+    .. [2] A. George and J. W. H. Liu, "Computer Solution of Large Sparse
+       Positive Definite Systems", Prentice-Hall, 1981.
+
+    Examples
+    --------
+    >>> from scipy.sparse import csr_matrix
+    >>> from scipy.sparse.csgraph import reverse_cuthill_mckee
+    >>> from scipy.sparse.csgraph import symmetric_permutation
+    >>> A = csr_matrix([[1, 0, 0, 1],
+    ...                 [0, 1, 1, 0],
+    ...                 [0, 1, 1, 0],
+    ...                 [1, 0, 0, 1]])
+    >>> perm = reverse_cuthill_mckee(A)
+    >>> symmetric_permutation(A, perm).todense()
+    matrix([[1, 1, 0, 0],
+            [1, 1, 0, 0],
+            [0, 0, 1, 1],
+            [0, 0, 1, 1]])
+
+    """
+    indptr, indices = _symmetric_pattern(graph, symmetric_mode)
+    perm = np.empty(len(indptr) - 1, dtype=np.intc)
+    _graph_tools.reverse_cuthill_mckee(indptr, indices, perm)
+    return perm
+
+
+def nested_dissection(graph, leaf_size=64, symmetric_mode=False):
+    """
+    Nested dissection ordering of a sparse matrix.
+
+    A fill-reducing ordering for the LU or Cholesky factorization of
+    matrices arising from meshes and other graphs with small separators.
+
+    Parameters
+    ----------
+    graph : array_like or sparse matrix, shape (N, N)
+        The matrix to reorder.  Only its nonzero pattern is used.
+    leaf_size : int, optional
+        Subgraphs with at most this many nodes are not split further.
+    symmetric_mode : bool, optional
+        See `reverse_cuthill_mckee`.
+
+    Returns
+    -------
+    perm : ndarray of ints, shape (N,)
+        The permutation, as for `reverse_cuthill_mckee`.
+
+    See Also
+    --------
+    reverse_cuthill_mckee, symmetric_permutation
+
+    Notes
+    -----
+    The graph is split by the middle level of a breadth-first level
+    structure rooted at a pseudo-peripheral node.  The two halves are
+    ordered first, recursively, and the separator last, so that
+    eliminating the halves does not create fill between them.
+
+    To factor a matrix in this ordering, permute it with
+    `symmetric_permutation` and pass ``permc_spec='NATURAL'`` to
+    `scipy.sparse.linalg.splu`.
+
+    """
+    if leaf_size < 1:
+        raise ValueError('leaf_size must be positive')
+    indptr, indices = _symmetric_pattern(graph, symmetric_mode)
+    perm = np.empty(len(indptr) - 1, dtype=np.intc)
+    _graph_tools.nested_dissection(indptr, indices, perm, int(leaf_size))
+    return perm
+
+
+def symmetric_permutation(A, perm):
+    """
+    Permute the rows and columns of a square matrix.
+
+    Parameters
+    ----------
+    A : sparse matrix, shape (N, N)
+        The matrix to permute.
+    perm : sequence of ints, shape (N,)
+        A permutation of ``range(N)``, such as returned by
+        `reverse_cuthill_mckee` or `nested_dissection`.
+
+    Returns
+    -------
+    B : sparse matrix
+        ``B[i, j] == A[perm[i], perm[j]]``, i.e. ``P * A * P.T`` for the
+        permutation matrix ``P`` with ``P[i, perm[i]] == 1``.  A CSC
+        matrix stays CSC; other formats are returned as CSR.
+
+    Notes
+    -----
+    A system ``A x = b`` becomes ``B y = b[perm]``, with ``x[perm] = y``.
+
+    """
+    if not isspmatrix(A):
+        A = csr_matrix(A)
+    if len(A.shape) != 2 or A.shape[0] != A.shape[1]:
+        raise ValueError('A must be a square matrix (has shape %s)'
+                         % (A.shape,))
+    _check_index_size(A, 'A')
+    N = A.shape[0]
+
+    perm = np.asarray(perm)
+    iperm = np.empty(N, dtype=np.intc)
+    iperm.fill(-1)
+    if perm.shape == (N,) and perm.dtype.kind in 'iu' and \
+           N > 0 and perm.min() >= 0 and perm.max() < N:
+        perm = perm.astype(np.intc)
+        iperm[perm] = np.arange(N, dtype=np.intc)
+    if perm.shape != (N,) or np.any(iperm < 0):
+        raise ValueError('perm is not a permutation of range(%d)' % N)
+
+    if A.format == 'csc':
+        cls = csc_matrix
+    else:
+        cls = csr_matrix
+        A = A.tocsr()
+
+    # gather the compressed rows (columns) in the new order and renumber
+    # the indices within them
+    lengths = np.diff(A.indptr)[perm]
+    indptr = np.empty(N + 1, dtype=np.intc)
+    indptr[0] = 0
+    np.cumsum(lengths, out=indptr[1:])
+    src = np.arange(indptr[-1], dtype=np.intc) + \
+          np.repeat(A.indptr[perm] - indptr[:-1], lengths)
+
+    B = cls((A.data[src], iperm[A.indices[src]], indptr), shape=A.shape)
+    B.has_sorted_indices = False
+    return B
@@ -10,8 +10,9 @@ from warnings import warn
 import numpy as np
 
 from sparsetools import csr_tocsc, csr_tobsr, csr_count_blocks, \
-        get_csr_submatrix, csr_sample_values
-from sputils import upcast, isintlike
+        get_csr_submatrix, csr_sample_values, csr_matvec, csr_matvecs
+from sputils import upcast, isintlike, _threads_for, _nnz_partition, \
+        _run_threads, get_index_dtype
 
 
 from compressed import _cs_matrix
@@ -81,6 +82,37 @@ class csr_matrix(_cs_matrix):
 
     """
 
+    def _mul_vector(self, other):
+        n_threads = _threads_for(self.nnz)
+        if n_threads == 1:
+            return _cs_matrix._mul_vector(self, other)
+
+        # Each thread computes the rows of a block holding about the same
+        # number of entries, exactly as the serial kernel would.
+        M,N = self.shape
+        result = np.zeros( M, dtype=upcast(self.dtype,other.dtype) )
+        def matvec(start, stop):
+            csr_matvec(stop - start, N, self.indptr[start:stop + 1],
+                       self.indices, self.data, other, result[start:stop])
+        _run_threads(matvec, _nnz_partition(self.indptr, n_threads))
+        return result
+
+    def _mul_multivector(self, other):
+        n_threads = _threads_for(self.nnz)
+        if n_threads == 1:
+            return _cs_matrix._mul_multivector(self, other)
+
+        M,N = self.shape
+        n_vecs = other.shape[1] #number of column vectors
+        result = np.zeros( (M,n_vecs), dtype=upcast(self.dtype,other.dtype) )
+        other = other.ravel()
+        def matvecs(start, stop):
+            csr_matvecs(stop - start, N, n_vecs, self.indptr[start:stop + 1],
+                        self.indices, self.data, other,
+                        result[start:stop].ravel())
+        _run_threads(matvecs, _nnz_partition(self.indptr, n_threads))
+        return result
+
     def transpose(self, copy=False):
         from csc import csc_matrix
         M,N = self.shape
@@ -110,12 +142,15 @@ class csr_matrix(_cs_matrix):
             return self
 
     def tocsc(self):
-        indptr  = np.empty(self.shape[1] + 1, dtype=np.intc)
-        indices = np.empty(self.nnz, dtype=np.intc)
+        idx_dtype = get_index_dtype((self.indptr, self.indices),
+                                    maxval=max(self.shape + (self.nnz,)))
+        indptr  = np.empty(self.shape[1] + 1, dtype=idx_dtype)
+        indices = np.empty(self.nnz, dtype=idx_dtype)
         data    = np.empty(self.nnz, dtype=upcast(self.dtype))
 
         csr_tocsc(self.shape[0], self.shape[1], \
-                  self.indptr, self.indices, self.data, \
+                  np.asarray(self.indptr, dtype=idx_dtype),
+                  np.asarray(self.indices, dtype=idx_dtype), self.data, \
                   indptr, indices, data)
 
         from csc import csc_matrix
@@ -141,13 +176,18 @@ class csr_matrix(_cs_matrix):
             if R < 1 or C < 1 or M % R != 0 or N % C != 0:
                 raise ValueError('invalid blocksize %s' % blocksize)
 
-            blks = csr_count_blocks(M,N,R,C,self.indptr,self.indices)
+            idx_dtype = get_index_dtype((self.indptr, self.indices),
+                                        maxval=max(M//R, N//C, self.nnz))
+            A_indptr  = np.asarray(self.indptr, dtype=idx_dtype)
+            A_indices = np.asarray(self.indices, dtype=idx_dtype)
+
+            blks = csr_count_blocks(M,N,R,C,A_indptr,A_indices)
 
-            indptr  = np.empty(M//R + 1,    dtype=np.intc)
-            indices = np.empty(blks,       dtype=np.intc)
+            indptr  = np.empty(M//R + 1,    dtype=idx_dtype)
+            indices = np.empty(blks,       dtype=idx_dtype)
             data    = np.zeros((blks,R,C), dtype=self.dtype)
 
-            csr_tobsr(M, N, R, C, self.indptr, self.indices, self.data, \
+            csr_tobsr(M, N, R, C, A_indptr, A_indices, self.data, \
                     indptr, indices, data.ravel() )
 
             return bsr_matrix((data,indices,indptr), shape=self.shape)
@@ -163,7 +203,8 @@ class csr_matrix(_cs_matrix):
     def __getitem__(self, key):
         def asindices(x):
             try:
-                x = np.asarray(x, dtype=np.intc)
+                x = np.asarray(x)
+                x = np.asarray(x, dtype=get_index_dtype((x,)))
             except:
                 raise IndexError('invalid index')
             else:
@@ -191,7 +232,7 @@ class csr_matrix(_cs_matrix):
                 indices = indices.copy()
                 indices[indices < 0] += N
 
-            indptr  = np.arange(len(indices) + 1, dtype=np.intc)
+            indptr  = np.arange(len(indices) + 1, dtype=indices.dtype)
             data    = np.ones(len(indices), dtype=self.dtype)
             shape   = (len(indices),N)
 
@@ -238,9 +279,13 @@ class csr_matrix(_cs_matrix):
 
                         num_samples = len(row)
                         val = np.empty(num_samples, dtype=self.dtype)
+                        idx_dtype = get_index_dtype((self.indptr, row, col))
                         csr_sample_values(self.shape[0], self.shape[1],
-                                          self.indptr, self.indices, self.data,
-                                          num_samples, row, col, val)
+                                np.asarray(self.indptr, dtype=idx_dtype),
+                                np.asarray(self.indices, dtype=idx_dtype),
+                                self.data, num_samples,
+                                np.asarray(row, dtype=idx_dtype),
+                                np.asarray(col, dtype=idx_dtype), val)
                         #val = []
                         #for i,j in zip(row,col):
                         #    val.append(self._get_single_element(i,j))
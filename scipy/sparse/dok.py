@@ -9,7 +9,8 @@ from itertools import izip
 import numpy as np
 
 from base import spmatrix, isspmatrix
-from sputils import isdense, getdtype, isshape, isintlike, isscalarlike, upcast
+from sputils import isdense, getdtype, isshape, isintlike, isscalarlike, upcast, \
+        get_index_dtype
 
 try:
     from operator import isSequenceType as _is_sequence
@@ -510,7 +511,8 @@ class dok_matrix(spmatrix, dict):
             return coo_matrix(self.shape, dtype=self.dtype)
         else:
             data    = np.asarray(self.values(), dtype=self.dtype)
-            indices = np.asarray(self.keys(), dtype=np.intc).T
+            idx_dtype = get_index_dtype(maxval=max(self.shape))
+            indices = np.asarray(self.keys(), dtype=idx_dtype).T
             return coo_matrix((data,indices), shape=self.shape, dtype=self.dtype)
 
     def todok(self,copy=False):
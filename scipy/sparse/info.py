@@ -21,6 +21,16 @@ dok_matrix. The lil_matrix class supports basic slicing and fancy
 indexing with a similar syntax to NumPy arrays.  As illustrated below,
 the COO format may also be used to efficiently construct matrices.
 
+Large matrices assembled from many small pieces, such as finite element
+matrices, are built fastest with coo_builder, which collects vectorized
+additions of entries and dense blocks and sums duplicate entries when it
+is converted to CSR or CSC format.
+
+Products of large CSR and CSC matrices are computed in parallel threads.
+masked_product computes only the entries of a product that lie in the
+pattern of a mask, and product_row_blocks generates a product one block
+of rows at a time, for products that do not fit in memory.
+
 To perform manipulations such as multiplication or inversion, first
 convert the matrix to either CSC or CSR format. The lil_matrix format is
 row-based, so conversion to CSR is efficient, whereas conversion to CSC
@@ -116,6 +126,7 @@ Modules
    extract - Functions to extract parts of sparse matrices
    lil - LInked List sparse matrix class
    linalg -
+   products - Masked and blockwise products of sparse matrices
    sparsetools - A collection of routines for sparse matrix operations
    spfuncs - Functions that operate on sparse matrices
    sputils - Utility functions for sparse matrix module
@@ -161,6 +172,8 @@ Functions
    kronsum - kronecker sum of sparse matrices
    lil_diags - Generate a lil_matrix with the given diagonals
    lil_eye - RxC lil_matrix whose k-th diagonal set to one
+   masked_product - Product of sparse matrices in the pattern of a mask
+   product_row_blocks - Product of sparse matrices in blocks of rows
    rand - Random values in a given shape
    spdiags - Return a sparse matrix from diagonals
    tril - Lower triangular portion of a matrix in sparse format
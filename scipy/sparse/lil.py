@@ -10,7 +10,8 @@ from bisect import bisect_left
 import numpy as np
 
 from base import spmatrix, isspmatrix
-from sputils import getdtype, isshape, issequence, isscalarlike
+from sputils import getdtype, isshape, issequence, isscalarlike, \
+        get_index_dtype
 
 class lil_matrix(spmatrix):
     """Row-based linked list sparse matrix
@@ -424,15 +425,18 @@ class lil_matrix(spmatrix):
         """ Return Compressed Sparse Row format arrays for this matrix.
         """
 
-        indptr = np.asarray([len(x) for x in self.rows], dtype=np.intc)
-        indptr = np.concatenate( (np.array([0], dtype=np.intc), np.cumsum(indptr)) )
+        lengths = np.asarray([len(x) for x in self.rows], dtype=np.int64)
+        nnz = lengths.sum()
+        idx_dtype = get_index_dtype(maxval=max(self.shape + (nnz,)))
 
-        nnz = indptr[-1]
+        indptr = np.empty(len(lengths) + 1, dtype=idx_dtype)
+        indptr[0] = 0
+        np.cumsum(lengths, out=indptr[1:])
 
         indices = []
         for x in self.rows:
             indices.extend(x)
-        indices = np.asarray(indices, dtype=np.intc)
+        indices = np.asarray(indices, dtype=idx_dtype)
 
         data = []
         for x in self.data:
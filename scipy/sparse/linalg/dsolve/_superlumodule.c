@@ -74,8 +74,10 @@ Py_gssv(PyObject *self, PyObject *args, PyObject *kwdict)
         return NULL;
     }
 
-    /* Create Space for output */
-    Py_X = PyArray_CopyFromObject(Py_B, type, 1, 2);
+    /* Create Space for output; right hand sides are columns */
+    Py_X = PyArray_FromAny(Py_B, PyArray_DescrFromType(type), 1, 2,
+                           NPY_F_CONTIGUOUS | NPY_ALIGNED | NPY_ENSURECOPY,
+                           NULL);
     if (Py_X == NULL) return NULL;
 
     if (csc) {
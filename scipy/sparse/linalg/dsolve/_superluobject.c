@@ -29,8 +29,9 @@ solves linear system of equations with one or sereral right hand sides.\n\
 parameters\n\
 ----------\n\
 \n\
-b        array, right hand side(s) of equation\n\
-x        array, solution vector(s)\n\
+b        array, right hand side(s) of equation: a vector of length N,\n\
+         or an N x K array holding K right hand sides as columns\n\
+x        array, solution vector(s), same shape as b\n\
 trans    'N': solve A   * x == b\n\
          'T': solve A^T * x == b\n\
          'H': solve A^H * x == b\n\
@@ -41,6 +42,7 @@ static PyObject *
 SciPyLU_solve(SciPyLUObject *self, PyObject *args, PyObject *kwds) {
   PyArrayObject *b, *x=NULL;
   SuperMatrix B;
+  PyArray_Descr *descr;
 #ifndef NPY_PY3K
   char itrans = 'N';
 #else
@@ -79,11 +81,25 @@ SciPyLU_solve(SciPyLUObject *self, PyObject *args, PyObject *kwds) {
     return NULL;
   }
 
-  if ((x = (PyArrayObject *) \
-       PyArray_CopyFromObject((PyObject *)b,self->type,1,2))==NULL) return NULL;
+  if (self->L.Store == NULL) {
+      PyErr_SetString(PyExc_RuntimeError,
+                      "no factorization available (refactor failed)");
+      return NULL;
+  }
 
-  if (b->dimensions[0] != self->n) goto fail;
+  /* SuperLU expects the right hand sides as the columns of a
+   * column-major array */
+  descr = PyArray_DescrFromType(self->type);
+  if ((x = (PyArrayObject *) \
+       PyArray_FromAny((PyObject *)b, descr, 1, 2,
+                       NPY_F_CONTIGUOUS | NPY_ALIGNED | NPY_ENSURECOPY,
+                       NULL))==NULL) return NULL;
 
+  B.Store = NULL;
+  if (x->dimensions[0] != self->n) {
+      PyErr_SetString(PyExc_ValueError, "b is of incompatible size");
+      goto fail;
+  }
 
   if (setjmp(_superlu_py_jmpbuf)) goto fail; 
 
@@ -114,10 +130,128 @@ fail:
   return NULL;
 }
 
+static int SciPyLU_factor(SciPyLUObject *self, SuperMatrix *A, int refactor);
+
+static char refactor_doc[] = "self.refactor(A)\n\
+\n\
+recomputes the factorization for a sparse matrix with the same sparsity\n\
+pattern as the factored one, but new values.  The column ordering and\n\
+elimination tree of the first factorization are reused.\n\
+\n\
+parameters\n\
+----------\n\
+\n\
+A        sparse matrix (in any format with a tocsc method) with the shape\n\
+         and the stored entries of the factored matrix.  ValueError is\n\
+         raised if its sparsity pattern differs.\n\
+";
+
+/* array of attribute `name` of `obj`, of type `typenum` */
+static PyArrayObject *
+attr_as_array(PyObject *obj, char *name, int typenum)
+{
+  PyObject *attr;
+  PyArrayObject *arr;
+
+  attr = PyObject_GetAttrString(obj, name);
+  if (attr == NULL)
+    return NULL;
+  arr = (PyArrayObject *)PyArray_FROMANY(attr, typenum, 1, 1, NPY_IN_ARRAY);
+  Py_DECREF(attr);
+  return arr;
+}
+
+static PyObject *
+SciPyLU_refactor(SciPyLUObject *self, PyObject *args)
+{
+  PyObject *py_A, *csc = NULL, *sorted, *shape = NULL;
+  PyArrayObject *data = NULL, *indices = NULL, *indptr = NULL;
+  SuperMatrix A;
+  int m, n, ret;
+
+  if (!PyArg_ParseTuple(args, "O", &py_A))
+    return NULL;
+
+  if (!PyObject_HasAttrString(py_A, "tocsc")) {
+    PyErr_SetString(PyExc_TypeError, "A must be a sparse matrix");
+    return NULL;
+  }
+  /* the factored matrix is in CSC format with sorted indices */
+  csc = PyObject_CallMethod(py_A, "tocsc", NULL);
+  if (csc == NULL)
+    goto fail;
+  sorted = PyObject_CallMethod(csc, "sorted_indices", NULL);
+  Py_DECREF(csc);
+  csc = sorted;
+  if (csc == NULL)
+    goto fail;
+  shape = PyObject_GetAttrString(csc, "shape");
+  if (shape == NULL || !PyArg_ParseTuple(shape, "ii", &m, &n))
+    goto fail;
+  data = attr_as_array(csc, "data", self->type);
+  indices = attr_as_array(csc, "indices", NPY_INT);
+  indptr = attr_as_array(csc, "indptr", NPY_INT);
+  if (data == NULL || indices == NULL || indptr == NULL)
+    goto fail;
+
+  if (m != self->n || n != self->n
+      || indptr->dimensions[0] != self->n + 1
+      || memcmp(indptr->data, self->colptr, (self->n + 1) * sizeof(int))
+      || indices->dimensions[0] < self->nnz
+      || data->dimensions[0] < self->nnz
+      || memcmp(indices->data, self->rowind, self->nnz * sizeof(int))) {
+    PyErr_SetString(PyExc_ValueError,
+                    "A must have the sparsity pattern of the factored matrix");
+    goto fail;
+  }
+
+  /* the old factors are replaced */
+  if (self->L.Store != NULL) {
+    Destroy_SuperNode_Matrix(&self->L);
+    self->L.Store = NULL;
+  }
+  if (self->U.Store != NULL) {
+    Destroy_CompCol_Matrix(&self->U);
+    self->U.Store = NULL;
+  }
+
+  A.Store = NULL;
+  if (setjmp(_superlu_py_jmpbuf)) {
+    Destroy_SuperMatrix_Store(&A);
+    goto fail;
+  }
+  Create_CompCol_Matrix(self->type, &A, self->n, self->n, self->nnz,
+                        data->data, self->rowind, self->colptr, SLU_NC,
+                        NPY_TYPECODE_TO_SLU(self->type), SLU_GE);
+
+  ret = SciPyLU_factor(self, &A, 1);
+
+  /* arrays of the matrix are not freed */
+  Destroy_SuperMatrix_Store(&A);
+  if (ret)
+    goto fail;
+  Py_DECREF(csc);
+  Py_DECREF(shape);
+  Py_DECREF(data);
+  Py_DECREF(indices);
+  Py_DECREF(indptr);
+  Py_INCREF(Py_None);
+  return Py_None;
+
+fail:
+  Py_XDECREF(csc);
+  Py_XDECREF(shape);
+  Py_XDECREF(data);
+  Py_XDECREF(indices);
+  Py_XDECREF(indptr);
+  return NULL;
+}
+
 /** table of object methods
  */
 PyMethodDef SciPyLU_methods[] = {
   {"solve", (PyCFunction)SciPyLU_solve, METH_VARARGS|METH_KEYWORDS, solve_doc},
+  {"refactor", (PyCFunction)SciPyLU_refactor, METH_VARARGS, refactor_doc},
   {NULL, NULL}			/* sentinel */
 };
 
@@ -131,6 +265,9 @@ SciPyLU_dealloc(SciPyLUObject *self)
 {
   SUPERLU_FREE(self->perm_r);
   SUPERLU_FREE(self->perm_c);
+  SUPERLU_FREE(self->etree);
+  SUPERLU_FREE(self->rowind);
+  SUPERLU_FREE(self->colptr);
   if (self->L.Store != NULL) {
       Destroy_SuperNode_Matrix(&self->L);
   }
@@ -145,8 +282,11 @@ SciPyLU_getattr(SciPyLUObject *self, char *name)
 {
   if (strcmp(name, "shape") == 0)
     return Py_BuildValue("(i,i)", self->m, self->n);
-  if (strcmp(name, "nnz") == 0)
+  if (strcmp(name, "nnz") == 0) {
+    if (self->L.Store == NULL)
+      return Py_BuildValue("i", 0);
     return Py_BuildValue("i", ((SCformat *)self->L.Store)->nnz + ((SCformat *)self->U.Store)->nnz);
+  }
   if (strcmp(name, "perm_r") == 0) {
     PyArrayObject* perm_r = PyArray_SimpleNewFromData(1, (npy_intp*) (&self->n), NPY_INT, (void*)self->perm_r);
     /* For ref counting of the memory */
@@ -211,7 +351,10 @@ perm_r\n\
 Methods\n\
 -------\n\
 solve\n\
-    solves the system for a given right hand side vector\n \
+    solves the system for a given right hand side vector or block\n\
+refactor\n\
+    factors new values with the same sparsity pattern, reusing the\n\
+    column ordering\n\
 \n\
 ";
 
@@ -291,9 +434,14 @@ int DenseSuper_from_Numeric(SuperMatrix *X, PyObject *PyX)
     n = 1;
     ldx = m;
   }
-  else {  /* nd == 2 */
-    m = aX->dimensions[1];
-    n = aX->dimensions[0];
+  else {  /* nd == 2, Fortran-contiguous: one column per right hand side */
+    if (!PyArray_ISFARRAY(aX)) {
+      PyErr_SetString(PyExc_ValueError,
+                      "2-D right hand sides must be Fortran-contiguous");
+      return -1;
+    }
+    m = aX->dimensions[0];
+    n = aX->dimensions[1];
     ldx = m;
   }
   
@@ -376,66 +524,51 @@ int NCFormat_from_spMatrix(SuperMatrix *A, int m, int n, int nnz,
   return 0;
 }
 
-PyObject *
-newSciPyLUObject(SuperMatrix *A, PyObject *option_dict, int intype, int ilu)
+/*
+ * Factor A into self->L, self->U.  On the first factorization the column
+ * permutation and elimination tree are computed; when refactoring they
+ * are reused (SuperLU's SamePattern mode).
+ */
+static int
+SciPyLU_factor(SciPyLUObject *self, SuperMatrix *A, int refactor)
 {
-
-   /* A must be in SLU_NC format used by the factorization routine. */
-  SciPyLUObject *self;
   SuperMatrix AC;     /* Matrix postmultiplied by Pc */
   int lwork = 0;
-  int *etree=NULL;
   int info;
-  int n;
-  superlu_options_t options;
   SuperLUStat_t stat;
-  int panel_size, relax;
   int trf_finished = 0;
 
-  n = A->ncol;
-
-  if (!set_superlu_options_from_dict(&options, ilu, option_dict,
-                                     &panel_size, &relax)) {
-      return NULL;
-  }
-
-  /* Create SciPyLUObject */
-  self = PyObject_New(SciPyLUObject, &SciPySuperLUType);
-  if (self == NULL)
-    return PyErr_NoMemory();
-  self->m = A->nrow;
-  self->n = n;
-  self->perm_r = NULL;
-  self->perm_c = NULL;
-  self->type = intype;
+  AC.Store = NULL;
+  StatInit(&stat);
 
   if (setjmp(_superlu_py_jmpbuf)) goto fail;
-  
-  /* Calculate and apply minimum degree ordering*/
-  etree = intMalloc(n);
-  self->perm_r = intMalloc(n);
-  self->perm_c = intMalloc(n);
-  StatInit(&stat);
 
-  get_perm_c(options.ColPerm, A, self->perm_c); /* calc column permutation */
-  sp_preorder(&options, A, self->perm_c, etree, &AC); /* apply column
-                                                       * permutation */
+  if (refactor) {
+      self->options.Fact = SamePattern;
+  }
+  else {
+      self->options.Fact = DOFACT;
+      /* calc column permutation */
+      get_perm_c(self->options.ColPerm, A, self->perm_c);
+  }
+  sp_preorder(&self->options, A, self->perm_c, self->etree, &AC);
+                                          /* apply column permutation */
 
   /* Perform factorization */
   if (!CHECK_SLU_TYPE(SLU_TYPECODE_TO_NPY(A->Dtype))) {
       PyErr_SetString(PyExc_ValueError, "Invalid type in SuperMatrix.");
       goto fail;
   }
-  if (ilu) {
+  if (self->ilu) {
       gsitrf(SLU_TYPECODE_TO_NPY(A->Dtype),
-             &options, &AC, relax, panel_size,
-             etree, NULL, lwork, self->perm_c, self->perm_r,
+             &self->options, &AC, self->relax, self->panel_size,
+             self->etree, NULL, lwork, self->perm_c, self->perm_r,
              &self->L, &self->U, &stat, &info);
   }
   else {
       gstrf(SLU_TYPECODE_TO_NPY(A->Dtype),
-            &options, &AC, relax, panel_size,
-            etree, NULL, lwork, self->perm_c, self->perm_r,
+            &self->options, &AC, self->relax, self->panel_size,
+            self->etree, NULL, lwork, self->perm_c, self->perm_r,
             &self->L, &self->U, &stat, &info);
   }
   trf_finished = 1;
@@ -445,7 +578,7 @@ newSciPyLUObject(SuperMatrix *A, PyObject *option_dict, int intype, int ilu)
         PyErr_SetString(PyExc_SystemError,
                         "gstrf was called with invalid arguments");
     else {
-        if (info <= n) 
+        if (info <= self->n) 
             PyErr_SetString(PyExc_RuntimeError, "Factor is exactly singular");
         else
             PyErr_NoMemory();
@@ -454,22 +587,77 @@ newSciPyLUObject(SuperMatrix *A, PyObject *option_dict, int intype, int ilu)
   }
 
   /* free memory */
-  SUPERLU_FREE(etree);
   Destroy_CompCol_Permuted(&AC);
   StatFree(&stat);
-  
-  return (PyObject *)self;
+  return 0;
 
 fail:
-  if (!trf_finished) {
-      /* Avoid trying to free partially initialized matrices;
-         might leak some memory, but avoids a crash */
-      self->L.Store = NULL;
-      self->U.Store = NULL;
+  if (trf_finished) {
+      Destroy_SuperNode_Matrix(&self->L);
+      Destroy_CompCol_Matrix(&self->U);
+  }
+  /* Avoid trying to free partially initialized matrices;
+     might leak some memory, but avoids a crash */
+  self->L.Store = NULL;
+  self->U.Store = NULL;
+  if (AC.Store != NULL) {
+      Destroy_CompCol_Permuted(&AC);
   }
-  SUPERLU_FREE(etree);
-  Destroy_CompCol_Permuted(&AC);
   StatFree(&stat);
+  return -1;
+}
+
+PyObject *
+newSciPyLUObject(SuperMatrix *A, PyObject *option_dict, int intype, int ilu)
+{
+
+   /* A must be in SLU_NC format used by the factorization routine. */
+  SciPyLUObject *self;
+  NCformat *Astore = (NCformat *)A->Store;
+  int n;
+
+  n = A->ncol;
+
+  /* Create SciPyLUObject */
+  self = PyObject_New(SciPyLUObject, &SciPySuperLUType);
+  if (self == NULL)
+    return PyErr_NoMemory();
+  self->m = A->nrow;
+  self->n = n;
+  self->perm_r = NULL;
+  self->perm_c = NULL;
+  self->etree = NULL;
+  self->rowind = NULL;
+  self->colptr = NULL;
+  self->L.Store = NULL;
+  self->U.Store = NULL;
+  self->type = intype;
+  self->ilu = ilu;
+  self->nnz = Astore->nnz;
+
+  if (!set_superlu_options_from_dict(&self->options, ilu, option_dict,
+                                     &self->panel_size, &self->relax)) {
+      SciPyLU_dealloc(self);
+      return NULL;
+  }
+
+  if (setjmp(_superlu_py_jmpbuf)) goto fail;
+
+  self->etree = intMalloc(n);
+  self->perm_r = intMalloc(n);
+  self->perm_c = intMalloc(n);
+
+  /* keep the sparsity pattern for refactor() */
+  self->rowind = intMalloc(Astore->nnz > 0 ? Astore->nnz : 1);
+  self->colptr = intMalloc(n + 1);
+  memcpy(self->rowind, Astore->rowind, Astore->nnz * sizeof(int));
+  memcpy(self->colptr, Astore->colptr, (n + 1) * sizeof(int));
+
+  if (SciPyLU_factor(self, A, 0)) goto fail;
+
+  return (PyObject *)self;
+
+fail:
   SciPyLU_dealloc(self);
   return NULL;
 }
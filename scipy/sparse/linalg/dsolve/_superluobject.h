@@ -29,6 +29,15 @@ typedef struct {
     int *perm_r;
     int *perm_c;
     int type;
+    /* kept for numeric refactorization with the same sparsity pattern */
+    int ilu;
+    int nnz;
+    int *rowind;
+    int *colptr;
+    int *etree;
+    superlu_options_t options;
+    int panel_size;
+    int relax;
 } SciPyLUObject;
 
 extern PyTypeObject SciPySuperLUType;
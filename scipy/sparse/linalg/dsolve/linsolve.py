@@ -1,6 +1,6 @@
 from warnings import warn
 
-from numpy import asarray
+from numpy import asarray, intc, iinfo
 from scipy.sparse import isspmatrix_csc, isspmatrix_csr, isspmatrix, \
         SparseEfficiencyWarning, csc_matrix
 
@@ -20,6 +20,13 @@ useUmfpack = True
 
 __all__ = [ 'use_solver', 'spsolve', 'splu', 'spilu', 'factorized' ]
 
+def _superlu_indices(A):
+    """Return the indices and indptr arrays of A as C ints for SuperLU"""
+    if max(A.shape + (A.nnz,)) > iinfo(intc).max:
+        raise ValueError("matrix is too large for SuperLU, which only "
+                         "supports 32-bit indices")
+    return asarray(A.indices, dtype=intc), asarray(A.indptr, dtype=intc)
+
 def use_solver( **kwargs ):
     """
     Valid keyword arguments with defaults (other ignored):
@@ -95,7 +102,8 @@ def spsolve(A, b, permc_spec=None, use_umfpack=True):
 
         b = asarray(b, dtype=A.dtype)
         options = dict(ColPerm=permc_spec)
-        return _superlu.gssv(N, A.nnz, A.data, A.indices, A.indptr, b, flag,
+        indices, indptr = _superlu_indices(A)
+        return _superlu.gssv(N, A.nnz, A.data, indices, indptr, b, flag,
                              options=options)[0]
 
 def splu(A, permc_spec=None, diag_pivot_thresh=None,
@@ -138,7 +146,7 @@ def splu(A, permc_spec=None, diag_pivot_thresh=None,
     Returns
     -------
     invA : scipy.sparse.linalg.dsolve._superlu.SciPyLUType
-        Object, which has a ``solve`` method.
+        Object, which has a ``solve`` method and a ``refactor`` method.
 
     See also
     --------
@@ -148,6 +156,31 @@ def splu(A, permc_spec=None, diag_pivot_thresh=None,
     -----
     This function uses the SuperLU library.
 
+    ``invA.solve(b)`` accepts a vector or a 2-D array whose columns are
+    right hand sides, and solves for all of them in one call.
+
+    ``invA.refactor(A2)`` factors a sparse matrix `A2` with the same
+    sparsity pattern as `A` (the same stored entries, in any order and
+    format) but new values; a ValueError is raised if the pattern differs.
+    The column ordering and elimination tree are reused from the first
+    factorization, so repeated factorizations of matrices with a fixed
+    pattern only pay for the numeric work.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from scipy.sparse import csc_matrix
+    >>> from scipy.sparse.linalg import splu
+    >>> A = csc_matrix([[1., 0., 2.], [0., 3., 0.], [4., 0., 5.]])
+    >>> lu = splu(A)
+    >>> lu.solve(np.array([[5., 1.], [3., 6.], [14., 4.]]))
+    array([[ 1.,  1.],
+           [ 1.,  2.],
+           [ 2.,  0.]])
+    >>> lu.refactor(2 * A)
+    >>> lu.solve(np.array([10., 6., 28.]))
+    array([ 1.,  1.,  2.])
+
     References
     ----------
     .. [SLU] SuperLU http://crd.lbl.gov/~xiaoye/SuperLU/
@@ -169,7 +202,8 @@ def splu(A, permc_spec=None, diag_pivot_thresh=None,
                     PanelSize=panel_size, Relax=relax)
     if options is not None:
         _options.update(options)
-    return _superlu.gstrf(N, A.nnz, A.data, A.indices, A.indptr,
+    indices, indptr = _superlu_indices(A)
+    return _superlu.gstrf(N, A.nnz, A.data, indices, indptr,
                           ilu=False, options=_options)
 
 def spilu(A, drop_tol=None, fill_factor=None, drop_rule=None, permc_spec=None,
@@ -241,7 +275,8 @@ def spilu(A, drop_tol=None, fill_factor=None, drop_rule=None, permc_spec=None,
                     PanelSize=panel_size, Relax=relax)
     if options is not None:
         _options.update(options)
-    return _superlu.gstrf(N, A.nnz, A.data, A.indices, A.indptr,
+    indices, indptr = _superlu_indices(A)
+    return _superlu.gstrf(N, A.nnz, A.data, indices, indptr,
                           ilu=True, options=_options)
 
 def factorized( A ):
@@ -152,6 +152,83 @@ class TestSplu(object):
             del perm
             assert_equal(sys.getrefcount(lu), rc)
 
+    def _random_matrix(self, n=30, dtype='d'):
+        a = random.random((n, n))
+        a[a < 0.9] = 0
+        # Make a diagonal dominant, to make sure it is not singular
+        a += 4*eye(n)
+        return csc_matrix(a.astype(dtype))
+
+    def test_solve_2d(self):
+        # A block of right hand sides is solved column by column.
+        for dtype in ['f', 'd', 'F', 'D']:
+            a_ = self._random_matrix(dtype=dtype)
+            lu = splu(a_)
+            b = random.random((30, 4)).astype(dtype)
+            x = lu.solve(b)
+            assert_equal(x.shape, (30, 4))
+            for k in range(4):
+                assert_array_almost_equal(x[:, k], lu.solve(b[:, k]))
+            assert_array_almost_equal(a_ * x, b, decimal=4)
+            assert_array_almost_equal(a_.T * lu.solve(b, 'T'), b, decimal=4)
+        assert_raises(ValueError, lu.solve, ones((31, 2)))
+
+    def test_refactor(self):
+        for dtype in ['f', 'd', 'F', 'D']:
+            a_ = self._random_matrix(dtype=dtype)
+            lu = splu(a_)
+            perm_c = lu.perm_c.copy()
+            b = ones(30, dtype=dtype)
+            data = a_.data * (1 + random.random(a_.nnz)).astype(dtype)
+            a2 = csc_matrix((data, a_.indices, a_.indptr), shape=a_.shape)
+            lu.refactor(a2)
+            assert_array_almost_equal(a2 * lu.solve(b), b, decimal=4)
+            # the column ordering is kept
+            assert_array_equal(lu.perm_c, perm_c)
+            # the values are taken in the order of the factored matrix
+            a3 = 2 * a2.tocsr()
+            lu.refactor(a3)
+            assert_array_almost_equal(a3 * lu.solve(b), b, decimal=4)
+        # the pattern has to match
+        assert_raises(ValueError, lu.refactor, a2[1:, 1:])
+        assert_raises(ValueError, lu.refactor, a2.T)
+        assert_raises(TypeError, lu.refactor, a2.data)
+
+    def test_refactor_csr(self):
+        # a CSR matrix is factored in CSC order
+        a_ = csc_matrix([[1., 0., 2.], [0., 3., 0.], [4., 0., 5.]]).tocsr()
+        lu = splu(a_)
+        a2 = a_.copy()
+        a2.data = array([2., 1., 3., 1., 7.])
+        lu.refactor(a2)
+        b = array([1., 2., 3.])
+        assert_array_almost_equal(a2 * lu.solve(b), b)
+        # an entry more or less
+        a3 = csc_matrix([[1., 1., 2.], [0., 3., 0.], [4., 0., 5.]])
+        assert_raises(ValueError, lu.refactor, a3)
+        a3 = csc_matrix([[1., 0., 2.], [0., 3., 0.], [4., 0., 0.]])
+        assert_raises(ValueError, lu.refactor, a3)
+
+    def test_refactor_singular(self):
+        a_ = self._random_matrix()
+        lu = splu(a_)
+        # zero the first column, keeping its entries
+        data = a_.data.copy()
+        data[:a_.indptr[1]] = 0
+        a2 = csc_matrix((data, a_.indices, a_.indptr), shape=a_.shape)
+        assert_raises(RuntimeError, lu.refactor, a2)
+        # the object is unusable until refactored successfully
+        assert_raises(RuntimeError, lu.solve, ones(30))
+        lu.refactor(a_)
+        assert_array_almost_equal(a_ * lu.solve(ones(30)), ones(30))
+
+    def test_spilu_refactor(self):
+        a_ = self._random_matrix()
+        lu = spilu(a_)
+        lu.refactor(2 * a_)
+        assert_array_almost_equal(2 * a_ * lu.solve(ones(30)), ones(30),
+                                  decimal=2)
+
 
 if __name__ == "__main__":
     run_module_suite()
@@ -33,9 +33,12 @@ Uses ARPACK: http://www.caam.rice.edu/software/ARPACK/
 
 # Solver modes
 # ------------
-# ARPACK and handle shifted and shift-inverse computations
-# for eigenvalues by providing a shift (sigma) and a solver.
-# This is currently not implemented
+# ARPACK can handle generalized, shifted and shift-inverse computations
+# for eigenvalues by providing a shift (sigma) and a solver.  The
+# wrapper implements modes 1 (regular), 2 (regular generalized,
+# OP = inv(M)*A) and 3 (shift-invert, OP = inv(A - sigma*M)*M).  The
+# solves needed by modes 2 and 3 use a single LU factorization of M or
+# of A - sigma*M, computed before the iterations start.
 
 __docformat__ = "restructuredtext en"
 
@@ -43,8 +46,10 @@ __all___=['eigs', 'eigsh', 'svds', 'ArpackNoConvergence']
 
 import _arpack
 import numpy as np
+from scipy.linalg import lu_factor, lu_solve
 from scipy.sparse.linalg.interface import aslinearoperator, LinearOperator
-from scipy.sparse import csc_matrix, csr_matrix, isspmatrix
+from scipy.sparse.linalg.dsolve import splu
+from scipy.sparse import csc_matrix, csr_matrix, isspmatrix, identity
 
 _type_conv = {'f':'s', 'd':'d', 'F':'c', 'D':'z'}
 _ndigits = {'f':5, 'd':12, 'F':5, 'D':12}
@@ -169,8 +174,12 @@ class ArpackNoConvergence(ArpackError):
         self.eigenvectors = eigenvectors
 
 class _ArpackParams(object):
+    # Whether mode 2 needs x overwritten with A*x when computing OP*x
+    _mode2_stores_Ax = False
+
     def __init__(self, n, k, tp, matvec, sigma=None,
-                 ncv=None, v0=None, maxiter=None, which="LM", tol=0):
+                 ncv=None, v0=None, maxiter=None, which="LM", tol=0,
+                 mode=1, M_matvec=None, Minv_matvec=None, OPinv_matvec=None):
         if k <= 0:
             raise ValueError("k must be positive, k=%d" % k)
 
@@ -190,9 +199,6 @@ class _ArpackParams(object):
             self.resid = np.zeros(n, tp)
             info = 0
 
-        if sigma is not None:
-            raise NotImplementedError("shifted eigenproblem not supported yet")
-
         if ncv is None:
             ncv = 2 * k + 1
         ncv = min(ncv, n)
@@ -201,15 +207,32 @@ class _ArpackParams(object):
         self.iparam = np.zeros(11, "int")
 
         # set solver mode and parameters
-        # only supported mode is 1: Ax=lx
         ishfts = 1
-        mode1 = 1
         self.iparam[0] = ishfts
         self.iparam[2] = maxiter
-        self.iparam[6] = mode1
+        self.iparam[6] = mode
+
+        # OP is the operator whose eigenvalues ARPACK finds, and B the
+        # matrix of the inner product (bmat='G') if it is not the identity
+        if mode == 1:
+            self.OP = matvec
+        elif mode == 2:
+            self.OP = lambda x: Minv_matvec(matvec(x))
+        elif mode == 3:
+            if M_matvec is None:
+                self.OP = OPinv_matvec
+            else:
+                self.OP = lambda x: OPinv_matvec(M_matvec(x))
+        else:
+            raise ValueError("mode must be 1, 2 or 3, mode=%s" % mode)
 
         self.n = n
         self.matvec = matvec
+        self.M_matvec = M_matvec
+        self.Minv_matvec = Minv_matvec
+        self.OPinv_matvec = OPinv_matvec
+        self.mode = mode
+        self.sigma = sigma
         self.tol = tol
         self.k = k
         self.maxiter = maxiter
@@ -217,11 +240,45 @@ class _ArpackParams(object):
         self.which = which
         self.tp = tp
         self.info = info
-        self.bmat = 'I'
+        if M_matvec is None:
+            self.bmat = 'I'
+        else:
+            self.bmat = 'G'
 
         self.converged = False
         self.ido = 0
 
+    def _reverse_communication(self):
+        # Perform the operation requested by the last call to the solver
+        xslice = slice(self.ipntr[0]-1, self.ipntr[0]-1+self.n)
+        yslice = slice(self.ipntr[1]-1, self.ipntr[1]-1+self.n)
+        if self.ido == -1:
+            # initialization
+            self.workd[yslice] = self.OP(self.workd[xslice])
+        elif self.ido == 1:
+            # compute y=OP*x
+            if self.mode == 2 and self._mode2_stores_Ax:
+                self.workd[xslice] = self.matvec(self.workd[xslice])
+                self.workd[yslice] = self.Minv_matvec(self.workd[xslice])
+            elif self.mode == 3 and self.bmat == 'G':
+                # M*x is already available in workd
+                Bxslice = slice(self.ipntr[2]-1, self.ipntr[2]-1+self.n)
+                self.workd[yslice] = self.OPinv_matvec(self.workd[Bxslice])
+            else:
+                self.workd[yslice] = self.OP(self.workd[xslice])
+        elif self.ido == 2:
+            # compute y=M*x
+            self.workd[yslice] = self.M_matvec(self.workd[xslice])
+        else:
+            self.converged = True
+
+            if self.info == 0:
+                pass
+            elif self.info == 1:
+                self._raise_no_convergence()
+            else:
+                raise ArpackError(self.info)
+
     def _raise_no_convergence(self):
         msg = "No convergence (%d iterations, %d/%d eigenvectors converged)"
         k_ok = self.iparam[4]
@@ -236,15 +293,19 @@ class _ArpackParams(object):
         raise ArpackNoConvergence(msg % (num_iter, k_ok, self.k), ev, vec)
 
 class _SymmetricArpackParams(_ArpackParams):
+    _mode2_stores_Ax = True
+
     def __init__(self, n, k, tp, matvec, sigma=None,
-                 ncv=None, v0=None, maxiter=None, which="LM", tol=0):
+                 ncv=None, v0=None, maxiter=None, which="LM", tol=0,
+                 mode=1, M_matvec=None, Minv_matvec=None, OPinv_matvec=None):
         if which not in _SEUPD_WHICH:
             raise ValueError("which must be one of %s" % ' '.join(_SEUPD_WHICH))
         if k >= n:
             raise ValueError("k must be less than rank(A), k=%d" % k)
 
         _ArpackParams.__init__(self, n, k, tp, matvec, sigma,
-                 ncv, v0, maxiter, which, tol)
+                 ncv, v0, maxiter, which, tol,
+                 mode, M_matvec, Minv_matvec, OPinv_matvec)
 
         if self.ncv > n or self.ncv <= k:
             raise ValueError("ncv must be k<ncv<=n, ncv=%s" % self.ncv)
@@ -266,30 +327,17 @@ class _SymmetricArpackParams(_ArpackParams):
                     self.resid, self.v, self.iparam, self.ipntr,
                     self.workd, self.workl, self.info)
 
-        xslice = slice(self.ipntr[0]-1, self.ipntr[0]-1+self.n)
-        yslice = slice(self.ipntr[1]-1, self.ipntr[1]-1+self.n)
-        if self.ido == -1:
-            # initialization
-            self.workd[yslice] = self.matvec(self.workd[xslice])
-        elif self.ido == 1:
-            # compute y=Ax
-            self.workd[yslice] = self.matvec(self.workd[xslice])
-        else:
-            self.converged = True
-
-            if self.info == 0:
-                pass
-            elif self.info == 1:
-                self._raise_no_convergence()
-            else:
-                raise ArpackError(self.info)
+        self._reverse_communication()
 
     def extract(self, return_eigenvectors):
         rvec = return_eigenvectors
         ierr = 0
         howmny = 'A' # return all eigenvectors
         sselect = np.zeros(self.ncv, 'int') # unused
-        sigma = 0.0 # no shifts, not implemented
+        if self.sigma is None:
+            sigma = 0.0
+        else:
+            sigma = self.sigma
 
         d, z, ierr = self._arpack_extract(rvec, howmny, sselect, sigma, self.bmat,
                 self.which, self.k, self.tol, self.resid, self.v,
@@ -310,14 +358,16 @@ class _SymmetricArpackParams(_ArpackParams):
 
 class _UnsymmetricArpackParams(_ArpackParams):
     def __init__(self, n, k, tp, matvec, sigma=None,
-                 ncv=None, v0=None, maxiter=None, which="LM", tol=0):
+                 ncv=None, v0=None, maxiter=None, which="LM", tol=0,
+                 mode=1, M_matvec=None, Minv_matvec=None, OPinv_matvec=None):
         if which not in _NEUPD_WHICH:
             raise ValueError("Parameter which must be one of %s" % ' '.join(_NEUPD_WHICH))
         if k >= n-1:
             raise ValueError("k must be less than rank(A)-1, k=%d" % k)
 
         _ArpackParams.__init__(self, n, k, tp, matvec, sigma,
-                 ncv, v0, maxiter, which, tol)
+                 ncv, v0, maxiter, which, tol,
+                 mode, M_matvec, Minv_matvec, OPinv_matvec)
 
         if self.ncv > n or self.ncv <= k+1:
             raise ValueError("ncv must be k+1<ncv<=n, ncv=%s" % self.ncv)
@@ -348,23 +398,7 @@ class _UnsymmetricArpackParams(_ArpackParams):
                         self.resid, self.v, self.iparam, self.ipntr,
                         self.workd, self.workl, self.rwork, self.info)
 
-        xslice = slice(self.ipntr[0]-1, self.ipntr[0]-1+self.n)
-        yslice = slice(self.ipntr[1]-1, self.ipntr[1]-1+self.n)
-        if self.ido == -1:
-            # initialization
-            self.workd[yslice] = self.matvec(self.workd[xslice])
-        elif self.ido == 1:
-            # compute y=Ax
-            self.workd[yslice] = self.matvec(self.workd[xslice])
-        else:
-            self.converged = True
-
-            if self.info == 0:
-                pass
-            elif self.info == 1:
-                self._raise_no_convergence()
-            else:
-                raise ArpackError(self.info)
+        self._reverse_communication()
 
     def extract(self, return_eigenvectors):
         k, n = self.k, self.n
@@ -372,8 +406,13 @@ class _UnsymmetricArpackParams(_ArpackParams):
         ierr = 0
         howmny = 'A' # return all eigenvectors
         sselect = np.zeros(self.ncv, 'int') # unused
-        sigmai = 0.0 # no shifts, not implemented
-        sigmar = 0.0 # no shifts, not implemented
+        if self.sigma is None:
+            sigma = 0.0
+        else:
+            sigma = self.sigma
+        # complex shifts of real matrices are done in complex arithmetic
+        sigmar = np.real(sigma)
+        sigmai = 0.0
         workev = np.zeros(3 * self.ncv, self.tp)
 
         if self.tp in 'fd':
@@ -420,7 +459,11 @@ class _UnsymmetricArpackParams(_ArpackParams):
             else:
                 # we got one extra eigenvalue (likely a cc pair, but which?)
                 # cut at approx precision for sorting
-                rd = np.round(d, decimals = _ndigits[self.tp])
+                if self.mode == 3:
+                    # which refers to the eigenvalues of OP
+                    rd = np.round(1. / (d - sigmar), decimals = _ndigits[self.tp])
+                else:
+                    rd = np.round(d, decimals = _ndigits[self.tp])
                 if self.which in ['LR','SR']:
                     ind = np.argsort(rd.real)
                 elif self.which in ['LI','SI']:
@@ -440,7 +483,7 @@ class _UnsymmetricArpackParams(_ArpackParams):
             # complex is so much simpler...
             d, z, ierr =\
                     self._arpack_extract(return_eigenvectors,
-                           howmny, sselect, sigmar, workev,
+                           howmny, sselect, sigma, workev,
                            self.bmat, self.which, k, self.tol, self.resid,
                            self.v, self.iparam, self.ipntr,
                            self.workd, self.workl, self.rwork, ierr)
@@ -465,14 +508,73 @@ def _aslinearoperator_with_dtype(m):
         m.dtype = (m*x).dtype
     return m
 
+def _factorized_solver(A, dtype, sigma=None, M=None):
+    """Return a function computing ``inv(A - sigma*M) * x``.
+
+    A - sigma*M is LU factored once, with `splu` if A or M is sparse and
+    with `scipy.linalg.lu_factor` if both are dense, so that the returned
+    function only does the triangular solves.
+    """
+    if not (isinstance(A, np.ndarray) or isspmatrix(A)):
+        raise TypeError("only dense or sparse matrices can be factored; "
+                        "give an operator computing the inverse instead")
+    if M is not None and not (isinstance(M, np.ndarray) or isspmatrix(M)):
+        raise TypeError("only dense or sparse matrices can be factored; "
+                        "give an operator computing the inverse instead")
+    if isspmatrix(A) or isspmatrix(M):
+        A = csc_matrix(A, dtype=dtype)
+        if sigma is not None and sigma != 0:
+            if M is None:
+                M = identity(A.shape[0], dtype=dtype, format='csc')
+            A = (A - sigma * csc_matrix(M, dtype=dtype)).tocsc()
+        return splu(A).solve
+    else:
+        A = np.array(A, dtype=dtype)
+        if sigma is not None and sigma != 0:
+            if M is None:
+                A.flat[::A.shape[0] + 1] -= sigma
+            else:
+                A -= sigma * np.asarray(M)
+        lu = lu_factor(A)
+        return lambda x: lu_solve(lu, x)
+
+def _arpack_operators(A, tp, M, sigma, Minv, OPinv):
+    """Set up the operators for the ARPACK mode implied by M and sigma.
+
+    Returns ``(mode, M_matvec, Minv_matvec, OPinv_matvec)``.
+    """
+    n = A.shape[0]
+    M_matvec = Minv_matvec = OPinv_matvec = None
+    if M is not None:
+        if M.shape != (n, n):
+            raise ValueError('wrong M dimensions %s, should be %s'
+                             % (M.shape, A.shape))
+        M_matvec = _aslinearoperator_with_dtype(M).matvec
+    if sigma is None:
+        if M is None:
+            return 1, None, None, None
+        # regular generalized mode: OP = inv(M)*A
+        if Minv is None:
+            Minv_matvec = _factorized_solver(M, tp)
+        else:
+            Minv_matvec = _aslinearoperator_with_dtype(Minv).matvec
+        return 2, M_matvec, Minv_matvec, None
+    # shift-invert mode: OP = inv(A - sigma*M)*M
+    if OPinv is None:
+        OPinv_matvec = _factorized_solver(A, tp, sigma, M)
+    else:
+        OPinv_matvec = _aslinearoperator_with_dtype(OPinv).matvec
+    return 3, M_matvec, None, OPinv_matvec
+
 def eigs(A, k=6, M=None, sigma=None, which='LM', v0=None,
          ncv=None, maxiter=None, tol=0,
-         return_eigenvectors=True):
+         return_eigenvectors=True, Minv=None, OPinv=None):
     """
     Find k eigenvalues and eigenvectors of the square matrix A.
 
     Solves ``A * x[i] = w[i] * x[i]``, the standard eigenvalue problem
-    for w[i] eigenvalues with corresponding eigenvectors x[i].
+    for w[i] eigenvalues with corresponding eigenvectors x[i], or
+    ``A * x[i] = w[i] * M * x[i]``, the generalized eigenvalue problem.
 
     Parameters
     ----------
@@ -495,13 +597,20 @@ def eigs(A, k=6, M=None, sigma=None, which='LM', v0=None,
 
     Other Parameters
     ----------------
-    M : matrix or array
-        (Not implemented)
+    M : matrix, array, or object with matvec(x) method
         A symmetric positive-definite matrix for the generalized
-        eigenvalue problem ``A * x = w * M * x``.
+        eigenvalue problem ``A * x = w * M * x``.  Unless `sigma` is
+        given, M is LU factored (or `Minv` is used) to solve with it.
     sigma : real or complex
-        (Not implemented)
-        Find eigenvalues near sigma.  Shift spectrum by sigma.
+        Find eigenvalues near sigma using shift-invert mode: ARPACK
+        computes the eigenvalues ``1 / (w - sigma)`` of
+        ``inv(A - sigma * M) * M``, whose largest are those of `A` closest
+        to `sigma`.  ``A - sigma * M`` is LU factored once, before the
+        iterations (with `splu` if A or M is sparse), unless `OPinv` is
+        given.  The eigenvalues w are returned, and `which` refers to the
+        transformed eigenvalues, so that ``which='LM'`` gives those
+        closest to sigma.  For a real matrix A, a complex sigma makes the
+        computation use complex arithmetic.
     v0 : array
         Starting vector for iteration.
     ncv : integer
@@ -524,6 +633,13 @@ def eigs(A, k=6, M=None, sigma=None, which='LM', v0=None,
         The default value of 0 implies machine precision.
     return_eigenvectors : boolean
         Return eigenvectors (True) in addition to eigenvalues
+    Minv : matrix, array, or object with matvec(x) method
+        Computes ``inv(M) * x``, for the generalized problem without
+        `sigma`, instead of factoring M.
+    OPinv : matrix, array, or object with matvec(x) method
+        Computes ``inv(A - sigma * M) * x``, for the shift-invert mode,
+        instead of factoring ``A - sigma * M``.  Needed if A or M is
+        only given as an operator.
 
     Raises
     ------
@@ -562,17 +678,25 @@ def eigs(A, k=6, M=None, sigma=None, which='LM', v0=None,
        Solution of Large Scale Eigenvalue Problems by Implicitly Restarted
        Arnoldi Methods. SIAM, Philadelphia, PA, 1998.
     """
-    A = _aslinearoperator_with_dtype(A)
-    if A.shape[0] != A.shape[1]:
-        raise ValueError('expected square matrix (shape=%s)' % (A.shape,))
-    n = A.shape[0]
-
-    matvec = lambda x : A.matvec(x)
-    params = _UnsymmetricArpackParams(n, k, A.dtype.char, matvec, sigma,
-                           ncv, v0, maxiter, which, tol)
+    Aop = _aslinearoperator_with_dtype(A)
+    if Aop.shape[0] != Aop.shape[1]:
+        raise ValueError('expected square matrix (shape=%s)' % (Aop.shape,))
+    n = Aop.shape[0]
+
+    tp = Aop.dtype.char
+    if sigma is not None and np.iscomplexobj(sigma) and tp in 'fd':
+        if np.imag(sigma) == 0:
+            sigma = np.real(sigma)
+        else:
+            # work in complex arithmetic for complex shifts
+            tp = tp.upper()
+    mode, M_matvec, Minv_matvec, OPinv_matvec = \
+            _arpack_operators(A, tp, M, sigma, Minv, OPinv)
 
-    if M is not None:
-        raise NotImplementedError("generalized eigenproblem not supported yet")
+    matvec = lambda x : Aop.matvec(x)
+    params = _UnsymmetricArpackParams(n, k, tp, matvec, sigma,
+                           ncv, v0, maxiter, which, tol,
+                           mode, M_matvec, Minv_matvec, OPinv_matvec)
 
     while not params.converged:
         params.iterate()
@@ -581,12 +705,13 @@ def eigs(A, k=6, M=None, sigma=None, which='LM', v0=None,
 
 def eigsh(A, k=6, M=None, sigma=None, which='LM', v0=None,
           ncv=None, maxiter=None, tol=0,
-          return_eigenvectors=True):
+          return_eigenvectors=True, Minv=None, OPinv=None):
     """
     Find k eigenvalues and eigenvectors of the real symmetric square matrix A.
 
     Solves A * x[i] = w[i] * x[i], the standard eigenvalue problem for
-    w[i] eigenvalues with corresponding eigenvectors x[i].
+    w[i] eigenvalues with corresponding eigenvectors x[i], or
+    A * x[i] = w[i] * M * x[i], the generalized eigenvalue problem.
 
     Parameters
     ----------
@@ -607,13 +732,18 @@ def eigsh(A, k=6, M=None, sigma=None, which='LM', v0=None,
 
     Other Parameters
     ----------------
-    M : matrix or array
-        (Not implemented)
+    M : matrix, array, or object with matvec(x) method
         A symmetric positive-definite matrix for the generalized
-        eigenvalue problem A * x = w * M * x
+        eigenvalue problem A * x = w * M * x.  Unless `sigma` is given,
+        M is LU factored (or `Minv` is used) to solve with it.
     sigma : real
-        (Not implemented)
-        Find eigenvalues near sigma.  Shift spectrum by sigma.
+        Find eigenvalues near sigma using shift-invert mode: ARPACK
+        computes the eigenvalues 1 / (w - sigma) of
+        inv(A - sigma * M) * M, whose largest are those of A closest to
+        sigma.  A - sigma * M is LU factored once, before the iterations
+        (with `splu` if A or M is sparse), unless `OPinv` is given.  The
+        eigenvalues w are returned, and `which` refers to the transformed
+        eigenvalues, so that which='LM' gives those closest to sigma.
     v0 : array
         Starting vector for iteration.
     ncv : integer
@@ -635,6 +765,13 @@ def eigsh(A, k=6, M=None, sigma=None, which='LM', v0=None,
         The default value of 0 implies machine precision.
     return_eigenvectors : boolean
         Return eigenvectors (True) in addition to eigenvalues
+    Minv : matrix, array, or object with matvec(x) method
+        Computes inv(M) * x, for the generalized problem without sigma,
+        instead of factoring M.
+    OPinv : matrix, array, or object with matvec(x) method
+        Computes inv(A - sigma * M) * x, for the shift-invert mode,
+        instead of factoring A - sigma * M.  Needed if A or M is only
+        given as an operator.
 
     Raises
     ------
@@ -671,17 +808,23 @@ def eigsh(A, k=6, M=None, sigma=None, which='LM', v0=None,
        Solution of Large Scale Eigenvalue Problems by Implicitly Restarted
        Arnoldi Methods. SIAM, Philadelphia, PA, 1998.
     """
-    A = _aslinearoperator_with_dtype(A)
-    if A.shape[0] != A.shape[1]:
-        raise ValueError('expected square matrix (shape=%s)' % (A.shape,))
-    n = A.shape[0]
-
-    if M is not None:
-        raise NotImplementedError("generalized eigenproblem not supported yet")
-
-    matvec = lambda x : A.matvec(x)
-    params = _SymmetricArpackParams(n, k, A.dtype.char, matvec, sigma,
-                           ncv, v0, maxiter, which, tol)
+    Aop = _aslinearoperator_with_dtype(A)
+    if Aop.shape[0] != Aop.shape[1]:
+        raise ValueError('expected square matrix (shape=%s)' % (Aop.shape,))
+    n = Aop.shape[0]
+
+    if sigma is not None:
+        if np.iscomplexobj(sigma) and np.imag(sigma) != 0:
+            raise ValueError("sigma must be real, sigma=%s" % (sigma,))
+        sigma = float(np.real(sigma))
+    tp = Aop.dtype.char
+    mode, M_matvec, Minv_matvec, OPinv_matvec = \
+            _arpack_operators(A, tp, M, sigma, Minv, OPinv)
+
+    matvec = lambda x : Aop.matvec(x)
+    params = _SymmetricArpackParams(n, k, tp, matvec, sigma,
+                           ncv, v0, maxiter, which, tol,
+                           mode, M_matvec, Minv_matvec, OPinv_matvec)
 
     while not params.converged:
         params.iterate()
@@ -16,7 +16,7 @@ from scipy.sparse.linalg import LinearOperator
 from scipy.sparse.linalg.eigen.arpack import eigs, eigsh, svds, \
      ArpackNoConvergence
 
-from scipy.linalg import svd
+from scipy.linalg import svd, eigh, eigvals, lu_factor, lu_solve
 
 def assert_almost_equal_cc(actual,desired,decimal=7,err_msg='',verbose=True):
     # almost equal or complex conjugates almost equal
@@ -366,6 +366,72 @@ def test_eigs_operator():
     w, v = eigs(fft_op, k=3)
     assert_equal(w.dtype, np.complex_)
 
+def _generalized_problem(n=40):
+    random.seed(1234)
+    B = random.randn(n, n)
+    A = B + B.T
+    M = np.diag(1. + random.rand(n))
+    M[0, 1] = M[1, 0] = 0.1
+    return A, M
+
+def test_eigsh_generalized():
+    A, M = _generalized_problem()
+    w_exact = eigh(A, M, eigvals_only=True)
+    for A1, M1 in [(A, M), (csc_matrix(A), csc_matrix(M))]:
+        w, v = eigsh(A1, k=4, M=M1, which='LA')
+        assert_array_almost_equal(np.sort(w), w_exact[-4:])
+        assert_array_almost_equal(dot(A, v), dot(M, v) * w)
+
+def test_eigsh_shift_invert():
+    A, M = _generalized_problem()
+    sigma = 0.5
+    for M1, w_exact in [(None, eigh(A, eigvals_only=True)),
+                        (M, eigh(A, M, eigvals_only=True))]:
+        near = np.sort(w_exact[argsort(abs(w_exact - sigma))[:4]])
+        for sparse in [False, True]:
+            A2, M2 = A, M1
+            if sparse:
+                A2 = csc_matrix(A)
+                if M1 is not None:
+                    M2 = csc_matrix(M1)
+            w, v = eigsh(A2, k=4, M=M2, sigma=sigma)
+            assert_array_almost_equal(np.sort(w), near)
+            if M1 is None:
+                assert_array_almost_equal(dot(A, v), v * w)
+            else:
+                assert_array_almost_equal(dot(A, v), dot(M1, v) * w)
+    assert_raises(ValueError, eigsh, A, 4, sigma=1j)
+
+def test_eigs_shift_invert():
+    random.seed(1234)
+    A = random.randn(30, 30)
+    w_exact = eigvals(A)
+    for sigma in [0.5, 0.5 + 1j]:
+        near = w_exact[argsort(abs(w_exact - sigma))[:4]]
+        for A1 in [A, csc_matrix(A)]:
+            w, v = eigs(A1, k=4, sigma=sigma)
+            assert_array_almost_equal(np.sort(abs(w - sigma)),
+                                      np.sort(abs(near - sigma)))
+            assert_array_almost_equal(dot(A, v), v * w)
+
+def test_eigs_generalized():
+    A, M = _generalized_problem(30)
+    A = A + np.triu(A)
+    w, v = eigs(A, k=4, M=M)
+    assert_array_almost_equal(dot(A, v), dot(M, v) * w)
+
+def test_shift_invert_operator():
+    A, M = _generalized_problem()
+    sigma = 0.5
+    assert_raises(TypeError, eigsh, LinearOperator(A.shape, lambda x: dot(A, x),
+                                                   dtype=A.dtype), 4,
+                  sigma=sigma)
+    lu = lu_factor(A - sigma * np.eye(len(A)))
+    OPinv = LinearOperator(A.shape, lambda x: lu_solve(lu, x), dtype=A.dtype)
+    w = eigsh(A, k=4, sigma=sigma, OPinv=OPinv, return_eigenvectors=False)
+    assert_array_almost_equal(np.sort(w),
+                              np.sort(eigsh(A, k=4, sigma=sigma)[0]))
+
 def sorted_svd(m, k):
     """Compute svd of a dense matrix m, and return singular vectors/values
     sorted."""
@@ -0,0 +1,296 @@
+"""Block Krylov methods for linear systems with several right hand sides"""
+
+import numpy as np
+from scipy.linalg import qr, solve_triangular
+
+from scipy.sparse.linalg.interface import aslinearoperator, IdentityOperator
+from utils import coerce
+
+__all__ = ['block_cg', 'block_gmres']
+
+
+def _make_block_system(A, M, X0, B):
+    """Like make_system, for a block of right hand sides.
+
+    Returns ``(A, M, X, B, postprocess)`` with `X` and `B` 2-D arrays of
+    the same floating point type, one column per right hand side.
+    """
+    A = aslinearoperator(A)
+    if A.shape[0] != A.shape[1]:
+        raise ValueError('expected square matrix, but got shape=%s'
+                         % (A.shape,))
+    N = A.shape[0]
+
+    B = np.asarray(B)
+    if B.ndim not in (1, 2) or B.shape[0] != N:
+        raise ValueError('A and B have incompatible dimensions')
+    shape = B.shape
+    B = B.reshape(N, -1)
+
+    if hasattr(A, 'dtype'):
+        xtype = A.dtype.char
+    else:
+        xtype = A.matvec(B[:, 0]).dtype.char
+    xtype = coerce(xtype, B.dtype.char)
+    B = np.asarray(B, dtype=xtype)
+
+    if X0 is None:
+        X = np.zeros(B.shape, dtype=xtype)
+    else:
+        X = np.array(X0, dtype=xtype)
+        if X.shape != shape:
+            raise ValueError('X0 and B have different shapes')
+        X = X.reshape(B.shape)
+
+    if M is None:
+        M = IdentityOperator(shape=A.shape, dtype=A.dtype)
+    else:
+        M = aslinearoperator(M)
+        if A.shape != M.shape:
+            raise ValueError('matrix and preconditioner have different shapes')
+
+    def postprocess(X):
+        return X.reshape(shape)
+
+    return A, M, X, B, postprocess
+
+
+def _matmat(A, X):
+    return np.asarray(A.matmat(X)).reshape(X.shape[0], -1)
+
+
+def _orth(W):
+    """Orthonormal basis of the range of W, dropping directions that are
+    numerically dependent (this keeps block CG free of breakdowns when
+    some columns converge before the others)."""
+    Q, R = np.linalg.qr(W)
+    d = abs(R.diagonal())
+    if len(d) == 0 or d.max() == 0:
+        return W[:, :0]
+    return Q[:, d > d.max() * max(W.shape) * np.finfo(W.dtype).eps]
+
+
+def _colnorms(R):
+    return np.sqrt(np.sum(abs(R)**2, axis=0))
+
+
+def block_cg(A, B, X0=None, tol=1e-5, maxiter=None, M=None, callback=None):
+    """
+    Use block Conjugate Gradient iteration to solve A X = B.
+
+    All right hand sides are advanced together, so each iteration costs
+    one matrix product with a block of vectors (``A.matmat``) instead of
+    one matrix-vector product per right hand side, and the search space
+    of every column benefits from the Krylov vectors of the others.
+
+    Parameters
+    ----------
+    A : {sparse matrix, dense matrix, LinearOperator}
+        The real symmetric or complex Hermitian positive definite N-by-N
+        matrix of the linear system.
+    B : {array, matrix}
+        Right hand sides, with shape (N, K) for K systems, or (N,).
+
+    Returns
+    -------
+    X : array
+        The converged solutions, with the shape of `B`.
+    info : integer
+        Provides convergence information:
+            0  : successful exit
+            >0 : convergence to tolerance not achieved, number of iterations
+
+    Other Parameters
+    ----------------
+    X0 : {array, matrix}
+        Starting guess for the solutions.
+    tol : float
+        Tolerance to achieve.  The algorithm terminates when the residual
+        of every column, relative to the norm of the column of `B`, is
+        below `tol`.
+    maxiter : integer
+        Maximum number of iterations (default ``10*N``).
+    M : {sparse matrix, dense matrix, LinearOperator}
+        Hermitian positive definite preconditioner for A, approximating
+        the inverse of A.
+    callback : function
+        User-supplied function to call after each iteration.  It is called
+        as callback(Xk), where Xk is the current block of solutions.
+
+    See Also
+    --------
+    cg, block_gmres
+
+    Notes
+    -----
+    The search directions are orthonormalized at every step and
+    directions that have become linearly dependent (for instance because
+    a column has converged) are dropped, which avoids the breakdown of
+    the original method of O'Leary [1]_ as in [2]_.
+
+    References
+    ----------
+    .. [1] D. P. O'Leary, "The block conjugate gradient algorithm and
+       related methods", Linear Algebra Appl. 29, 293-322 (1980).
+    .. [2] H. Ji and Y. Li, "A breakdown-free block conjugate gradient
+       method", BIT Numer. Math. 57, 379-403 (2017).
+
+    """
+    A, M, X, B, postprocess = _make_block_system(A, M, X0, B)
+
+    N, K = B.shape
+    if maxiter is None:
+        maxiter = N * 10
+
+    bnrm = _colnorms(B)
+    bnrm[bnrm == 0] = 1
+
+    R = B - _matmat(A, X)
+    if np.all(_colnorms(R) <= tol * bnrm):
+        return postprocess(X), 0
+
+    P = _orth(_matmat(M, R))
+    for it in xrange(1, maxiter + 1):
+        Q = _matmat(A, P)
+        PtQ = np.dot(P.T.conj(), Q)
+        alpha = np.linalg.solve(PtQ, np.dot(P.T.conj(), R))
+        X += np.dot(P, alpha)
+        R -= np.dot(Q, alpha)
+
+        if callback is not None:
+            callback(postprocess(X))
+        if np.all(_colnorms(R) <= tol * bnrm):
+            return postprocess(X), 0
+
+        Z = _matmat(M, R)
+        beta = -np.linalg.solve(PtQ, np.dot(Q.T.conj(), Z))
+        P = _orth(Z + np.dot(P, beta))
+        if P.shape[1] == 0:
+            break
+
+    return postprocess(X), it
+
+
+def block_gmres(A, B, X0=None, tol=1e-5, restart=None, maxiter=None, M=None,
+                callback=None):
+    """
+    Use block Generalized Minimal RESidual iteration to solve A X = B.
+
+    All right hand sides share one block Krylov space, which is extended
+    with one matrix product with a block of vectors (``A.matmat``) per
+    step.
+
+    Parameters
+    ----------
+    A : {sparse matrix, dense matrix, LinearOperator}
+        The N-by-N matrix of the linear system.
+    B : {array, matrix}
+        Right hand sides, with shape (N, K) for K systems, or (N,).
+
+    Returns
+    -------
+    X : array
+        The converged solutions, with the shape of `B`.
+    info : integer
+        Provides convergence information:
+            0  : successful exit
+            >0 : convergence to tolerance not achieved, number of restart
+                 cycles
+
+    Other Parameters
+    ----------------
+    X0 : {array, matrix}
+        Starting guess for the solutions.
+    tol : float
+        Tolerance to achieve.  The algorithm terminates when the residual
+        of every column, relative to the norm of the column of `B`, is
+        below `tol`.
+    restart : integer, optional
+        Number of block steps between restarts (default 20).  The Krylov
+        basis holds at most ``restart * K`` vectors of length N.
+    maxiter : integer
+        Maximum number of restart cycles (default ``10*N``).
+    M : {sparse matrix, dense matrix, LinearOperator}
+        Preconditioner for A, approximating the inverse of A.  It is
+        applied on the right, so the residuals that are tested are those
+        of the original system.
+    callback : function
+        User-supplied function to call after each restart cycle.  It is
+        called as callback(Xk), where Xk is the current block of
+        solutions.
+
+    See Also
+    --------
+    gmres, block_cg
+
+    Notes
+    -----
+    Each restart cycle starts from an orthonormal basis of the range of
+    the residuals, obtained as in `block_cg`.  The block size is the rank
+    of the residual block, so dependent right hand sides, or more right
+    hand sides than unknowns, do not enlarge the Krylov basis.
+
+    """
+    A, M, X, B, postprocess = _make_block_system(A, M, X0, B)
+
+    N, K = B.shape
+    if restart is None:
+        restart = 20
+    if maxiter is None:
+        maxiter = N * 10
+
+    bnrm = _colnorms(B)
+    bnrm[bnrm == 0] = 1
+
+    # orthogonal 2p x 2p factors of the QR decomposition of H
+    F = []
+
+    for cycle in xrange(1, maxiter + 1):
+        R = B - _matmat(A, X)
+        if np.all(_colnorms(R) <= tol * bnrm):
+            return postprocess(X), 0
+
+        # deflate the residuals to a basis of p <= min(N, K) vectors
+        Q = _orth(R)
+        p = Q.shape[1]
+        steps = max(1, min(restart, N // p))
+        V = np.empty((N, (steps + 1) * p), dtype=X.dtype)
+        H = np.zeros(((steps + 1) * p, steps * p), dtype=X.dtype)
+        E = np.zeros(((steps + 1) * p, K), dtype=X.dtype)
+        V[:, :p] = Q
+        E[:p] = np.dot(Q.T.conj(), R)
+        del F[:]
+
+        # block Arnoldi, A M V[:, :m] = V[:, :m+p] H[:m+p, :m] with
+        # m = (j+1) p; H is reduced to upper triangular form as it grows
+        # so that the residual norms come for free at every step
+        for j in xrange(steps):
+            m = (j + 1) * p
+            W = _matmat(A, _matmat(M, V[:, m-p:m]))
+            # classical block Gram-Schmidt, done twice for orthogonality
+            for sweep in range(2):
+                Hj = np.dot(V[:, :m].T.conj(), W)
+                W -= np.dot(V[:, :m], Hj)
+                H[:m, m-p:m] += Hj
+            V[:, m:m+p], H[m:m+p, m-p:m] = np.linalg.qr(W)
+
+            for i in xrange(j):
+                rows = slice(i*p, (i+2)*p)
+                H[rows, m-p:m] = np.dot(F[i].T.conj(), H[rows, m-p:m])
+            rows = slice(m-p, m+p)
+            Fj, Rj = qr(H[rows, m-p:m])
+            F.append(Fj)
+            H[rows, m-p:m] = np.dot(Fj.T.conj(), H[rows, m-p:m])
+            E[rows] = np.dot(Fj.T.conj(), E[rows])
+
+            if np.all(_colnorms(E[m:m+p]) <= tol * bnrm):
+                break
+
+        Y = solve_triangular(H[:m, :m], E[:m])
+        X += _matmat(M, np.dot(V[:, :m], Y))
+        if callback is not None:
+            callback(postprocess(X))
+
+    if np.all(_colnorms(B - _matmat(A, X)) <= tol * bnrm):
+        return postprocess(X), 0
+    return postprocess(X), maxiter
@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+"""Tests for the linalg.isolve.block module
+"""
+
+import numpy as np
+from numpy.testing import TestCase, run_module_suite, assert_, \
+        assert_equal, assert_raises
+
+from scipy.sparse import spdiags, kron, identity
+
+from scipy.sparse.linalg.interface import LinearOperator
+from scipy.sparse.linalg import splu
+from scipy.sparse.linalg.isolve import block_cg, block_gmres
+
+
+def _poisson2d(n):
+    e = np.ones(n)
+    T = spdiags([-e, 2 * e, -e], [-1, 0, 1], n, n)
+    return (kron(identity(n), T) + kron(T, identity(n))).tocsr()
+
+
+def _relres(A, X, B):
+    R = B - A * X
+    return np.sqrt(np.sum(abs(R)**2, axis=0) / np.sum(abs(B)**2, axis=0))
+
+
+class CountingOperator(LinearOperator):
+    def __init__(self, A):
+        self.A = A
+        self.n_matmat = 0
+        LinearOperator.__init__(self, A.shape, self._matvec,
+                                matmat=self._matmat, dtype=A.dtype)
+
+    def _matvec(self, x):
+        return self._matmat(x.reshape(-1, 1))
+
+    def _matmat(self, X):
+        self.n_matmat += 1
+        return self.A * X
+
+
+class TestBlockSolvers(TestCase):
+    def setUp(self):
+        np.random.seed(1234)
+        self.A = _poisson2d(15)
+        N = self.A.shape[0]
+        self.C = (self.A + spdiags([0.5 * np.ones(N)], [1], N, N)).tocsr()
+        self.B = np.random.rand(N, 5)
+
+    def test_block_cg(self):
+        X, info = block_cg(self.A, self.B, tol=1e-10)
+        assert_equal(info, 0)
+        assert_equal(X.shape, self.B.shape)
+        assert_(np.all(_relres(self.A, X, self.B) <= 1e-10))
+
+    def test_block_gmres(self):
+        for restart in [2, 10, None]:
+            X, info = block_gmres(self.C, self.B, tol=1e-10, restart=restart)
+            assert_equal(info, 0)
+            assert_(np.all(_relres(self.C, X, self.B) <= 1e-10))
+
+    def test_fewer_products(self):
+        # the block iteration shares its Krylov space between columns, so
+        # it needs fewer block products than the slowest single solve
+        for solver, A in [(block_cg, self.A), (block_gmres, self.C)]:
+            op = CountingOperator(A)
+            solver(op, self.B[:, 0], tol=1e-10)
+            single = op.n_matmat
+            op.n_matmat = 0
+            solver(op, self.B, tol=1e-10)
+            assert_(op.n_matmat < single, (solver, op.n_matmat, single))
+
+    def test_single_rhs(self):
+        b = self.B[:, 0]
+        for solver, A in [(block_cg, self.A), (block_gmres, self.C)]:
+            x, info = solver(A, b, tol=1e-10)
+            assert_equal(info, 0)
+            assert_equal(x.shape, b.shape)
+            assert_(_relres(A, x, b) <= 1e-10)
+
+    def test_rank_deficient(self):
+        # dependent and zero right hand sides must not break the iteration
+        b0, b1 = self.B[:, 0], self.B[:, 1]
+        B = np.column_stack([b0, b0, 2 * b1, b0 - b1, 0 * b0])
+        for solver, A in [(block_cg, self.A), (block_gmres, self.C)]:
+            X, info = solver(A, B, tol=1e-10)
+            assert_equal(info, 0)
+            assert_(np.all(abs(B - A * X) <= 1e-10 * abs(B).max() * 10))
+
+    def test_more_rhs_than_unknowns(self):
+        B = np.random.rand(4, 6)
+        for solver, A in [(block_cg, self.A[:4, :4]),
+                          (block_gmres, self.C[:4, :4])]:
+            X, info = solver(A, B, tol=1e-10)
+            assert_equal(info, 0)
+            assert_equal(X.shape, B.shape)
+            assert_(np.all(_relres(A, X, B) <= 1e-10))
+
+    def test_complex(self):
+        N = self.A.shape[0]
+        S = spdiags([np.ones(N)], [1], N, N)
+        A = (self.A + 0.01j * (S - S.T)).tocsr()
+        B = self.B[:, :2] + 1j * self.B[:, 2:4]
+        for solver in [block_cg, block_gmres]:
+            X, info = solver(A, B, tol=1e-10)
+            assert_equal(info, 0)
+            assert_equal(X.dtype, np.complex128)
+            assert_(np.all(_relres(A, X, B) <= 1e-10))
+
+    def test_preconditioner(self):
+        lu = splu(self.C.tocsc())
+        M = LinearOperator(self.C.shape, matvec=lu.solve, matmat=lu.solve,
+                           dtype=self.C.dtype)
+        op = CountingOperator(self.C)
+        X, info = block_gmres(op, self.B, tol=1e-10, M=M)
+        assert_equal(info, 0)
+        # an exact preconditioner solves the system in one step
+        assert_(op.n_matmat <= 3, op.n_matmat)
+        assert_(np.all(_relres(self.C, X, self.B) <= 1e-10))
+
+        lu = splu(self.A.tocsc())
+        M = LinearOperator(self.A.shape, matvec=lu.solve, matmat=lu.solve,
+                           dtype=self.A.dtype)
+        X, info = block_cg(self.A, self.B, tol=1e-10, M=M)
+        assert_equal(info, 0)
+        assert_(np.all(_relres(self.A, X, self.B) <= 1e-10))
+
+    def test_x0_and_callback(self):
+        X0 = np.linalg.solve(self.C.toarray(), self.B)
+        for solver in [block_cg, block_gmres]:
+            calls = []
+            X, info = solver(self.C, self.B, X0=X0, callback=calls.append)
+            assert_equal(info, 0)
+            assert_equal(len(calls), 0)
+            assert_(np.all(X == X0))
+
+        calls = []
+        X, info = block_cg(self.A, self.B, callback=calls.append, maxiter=3)
+        assert_equal(info, 3)
+        assert_equal(len(calls), 3)
+        assert_equal(calls[-1].shape, self.B.shape)
+
+    def test_bad_shapes(self):
+        for solver in [block_cg, block_gmres]:
+            assert_raises(ValueError, solver, self.A, self.B[1:])
+            assert_raises(ValueError, solver, self.A, self.B,
+                          X0=self.B[:, 1:])
+            assert_raises(ValueError, solver, self.A[1:], self.B[1:])
+
+
+if __name__ == "__main__":
+    run_module_suite()
@@ -0,0 +1,168 @@
+"""Masked and blockwise products of sparse matrices"""
+
+__docformat__ = "restructuredtext en"
+
+__all__ = ['masked_product', 'product_row_blocks']
+
+import numpy as np
+
+from sparsetools import csr_matmat_masked
+from sputils import upcast, get_index_dtype, _threads_for, _nnz_partition, \
+        _run_threads
+from compressed import _product_work, _csr_matmat
+from csr import csr_matrix
+
+
+def _check_product(A, B):
+    A = csr_matrix(A)
+    B = csr_matrix(B)
+    if A.shape[1] != B.shape[0]:
+        raise ValueError('dimension mismatch')
+    return A, B
+
+
+def masked_product(A, B, mask):
+    """
+    Compute the product of two sparse matrices in the pattern of a mask
+
+    Returns ``(A * B).multiply(mask)`` without forming ``A * B``: the
+    entries of the product are only accumulated at the positions where
+    `mask` has stored entries, so the memory used is that of `mask`
+    rather than that of the product.
+
+    Parameters
+    ----------
+    A, B : sparse matrix or array_like
+        The factors of the product.
+    mask : sparse matrix or array_like
+        Matrix with the shape of ``A * B``.  The entries of the product
+        in its sparsity pattern are multiplied by its values; use a mask
+        of ones to select entries without scaling them.
+
+    Returns
+    -------
+    C : csr_matrix
+        The masked product.
+
+    See Also
+    --------
+    product_row_blocks
+
+    Notes
+    -----
+    As for ``A * B``, blocks of rows are computed in parallel threads
+    for large products.
+
+    Examples
+    --------
+    Compute the inner products of selected pairs of rows of a matrix:
+
+    >>> from scipy.sparse import csr_matrix, masked_product
+    >>> X = csr_matrix([[1, 0, 2], [0, 3, 0], [4, 0, 5]])
+    >>> pairs = csr_matrix(([1, 1], ([0, 1], [2, 2])), shape=(3, 3))
+    >>> masked_product(X, X.T, pairs).todense()
+    matrix([[ 0,  0, 14],
+            [ 0,  0,  0],
+            [ 0,  0,  0]])
+
+    """
+    A, B = _check_product(A, B)
+    mask = csr_matrix(mask)
+    M, N = A.shape[0], B.shape[1]
+    if mask.shape != (M, N):
+        raise ValueError('mask and product have different shapes')
+
+    idx_dtype = get_index_dtype((A.indptr, A.indices, B.indptr, B.indices,
+                                 mask.indptr, mask.indices))
+    dtype = upcast(A.dtype, B.dtype, mask.dtype)
+    Ap = np.asarray(A.indptr, dtype=idx_dtype)
+    Aj = np.asarray(A.indices, dtype=idx_dtype)
+    Ax = np.asarray(A.data, dtype=dtype)
+    Bp = np.asarray(B.indptr, dtype=idx_dtype)
+    Bj = np.asarray(B.indices, dtype=idx_dtype)
+    Bx = np.asarray(B.data, dtype=dtype)
+    Cp = np.array(mask.indptr, dtype=idx_dtype)
+    Cj = np.array(mask.indices, dtype=idx_dtype)
+    Xx = np.asarray(mask.data, dtype=dtype)
+    data = np.empty(len(Cj), dtype=dtype)
+
+    def product(start, stop):
+        csr_matmat_masked(stop - start, N, Ap[start:stop + 1], Aj, Ax,
+                          Bp, Bj, Bx, Cp[start:stop + 1], Cj, Xx, data)
+
+    if M > 0:
+        work = _product_work(Ap, Aj, Bp)
+        _run_threads(product, _nnz_partition(work, _threads_for(work[-1])))
+
+    C = csr_matrix((data, Cj, Cp), shape=(M, N))
+    C.eliminate_zeros()
+    return C
+
+
+def product_row_blocks(A, B, max_nnz=1 << 24):
+    """
+    Compute the product of two sparse matrices in blocks of rows
+
+    Generates the product ``A * B`` as a sequence of CSR matrices
+    holding consecutive blocks of its rows, so that products too large
+    for memory can be reduced or written out a block at a time.
+
+    Parameters
+    ----------
+    A, B : sparse matrix or array_like
+        The factors of the product.
+    max_nnz : int, optional
+        Bound on the number of stored entries of a block.  It is
+        enforced on the number of multiply-adds of each block, which is
+        at least its number of entries; a single row that exceeds it
+        makes up a block of its own.  Default: 2**24.
+
+    Yields
+    ------
+    start, stop : int
+        The range of rows of the block.
+    C : csr_matrix
+        The rows ``start:stop`` of ``A * B``.
+
+    See Also
+    --------
+    masked_product
+
+    Examples
+    --------
+    >>> from scipy.sparse import csr_matrix, product_row_blocks
+    >>> X = csr_matrix([[1, 0, 2], [0, 3, 0], [4, 0, 5]])
+    >>> for start, stop, C in product_row_blocks(X, X.T, max_nnz=4):
+    ...     print start, stop, C.nnz
+    0 1 2
+    1 2 1
+    2 3 2
+
+    """
+    A, B = _check_product(A, B)
+    if max_nnz < 1:
+        raise ValueError('max_nnz must be positive')
+    N = B.shape[1]
+
+    # convert the arrays once, rather than for every block
+    idx_dtype = get_index_dtype((A.indptr, A.indices, B.indptr, B.indices))
+    dtype = upcast(A.dtype, B.dtype)
+    Ap = np.asarray(A.indptr, dtype=idx_dtype)
+    Aj = np.asarray(A.indices, dtype=idx_dtype)
+    Ax = np.asarray(A.data, dtype=dtype)
+    Bp = np.asarray(B.indptr, dtype=idx_dtype)
+    Bj = np.asarray(B.indices, dtype=idx_dtype)
+    Bx = np.asarray(B.data, dtype=dtype)
+
+    work = _product_work(Ap, Aj, Bp)
+    M = A.shape[0]
+    start = 0
+    while start < M:
+        stop = int(np.searchsorted(work, work[start] + max_nnz, 'right')) - 1
+        stop = min(max(stop, start + 1), M)
+        indptr, indices, data = _csr_matmat(N, Ap[start:stop + 1], Aj, Ax,
+                                            Bp, Bj, Bx,
+                                            work[start:stop + 1])
+        yield start, stop, csr_matrix((data, indices, indptr),
+                                      shape=(stop - start, N))
+        start = stop
@@ -12,6 +12,10 @@ def configuration(parent_package='',top_path=None):
     config.add_subpackage('linalg')
     config.add_subpackage('sparsetools')
 
+    config.add_extension('_graph_tools',
+                         sources=['_graph_tools.c'],
+                         include_dirs=[numpy.get_include()])
+
     return config
 
 if __name__ == '__main__':
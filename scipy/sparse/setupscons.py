@@ -13,6 +13,7 @@ def configuration(parent_package='',top_path=None):
     config.add_data_dir('tests')
     config.add_subpackage('linalg')
     config.add_subpackage('sparsetools')
+    config.add_sconscript('SConstruct')
 
     return config
 
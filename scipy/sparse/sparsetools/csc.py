@@ -1,12 +1,22 @@
 # This file was automatically generated by SWIG (http://www.swig.org).
-# Version 2.0.1+capsulehack
+# Version 3.0.12
 #
 # Do not make changes to this file unless you know what you are doing--modify
 # the SWIG interface file instead.
-# This file is compatible with both classic and new-style classes.
 
-from sys import version_info
-if version_info >= (2,6,0):
+from sys import version_info as _swig_python_version_info
+if _swig_python_version_info >= (2, 7, 0):
+    def swig_import_helper():
+        import importlib
+        pkg = __name__.rpartition('.')[0]
+        mname = '.'.join((pkg, '_csc')).lstrip('.')
+        try:
+            return importlib.import_module(mname)
+        except ImportError:
+            return importlib.import_module('_csc')
+    _csc = swig_import_helper()
+    del swig_import_helper
+elif _swig_python_version_info >= (2, 6, 0):
     def swig_import_helper():
         from os.path import dirname
         import imp
@@ -16,409 +26,379 @@ if version_info >= (2,6,0):
         except ImportError:
             import _csc
             return _csc
-        if fp is not None:
-            try:
-                _mod = imp.load_module('_csc', fp, pathname, description)
-            finally:
+        try:
+            _mod = imp.load_module('_csc', fp, pathname, description)
+        finally:
+            if fp is not None:
                 fp.close()
-            return _mod
+        return _mod
     _csc = swig_import_helper()
     del swig_import_helper
 else:
     import _csc
-del version_info
+del _swig_python_version_info
+
 try:
     _swig_property = property
 except NameError:
-    pass # Python < 2.2 doesn't have 'property'.
-def _swig_setattr_nondynamic(self,class_type,name,value,static=1):
-    if (name == "thisown"): return self.this.own(value)
+    pass  # Python < 2.2 doesn't have 'property'.
+
+try:
+    import builtins as __builtin__
+except ImportError:
+    import __builtin__
+
+def _swig_setattr_nondynamic(self, class_type, name, value, static=1):
+    if (name == "thisown"):
+        return self.this.own(value)
     if (name == "this"):
         if type(value).__name__ == 'SwigPyObject':
             self.__dict__[name] = value
             return
-    method = class_type.__swig_setmethods__.get(name,None)
-    if method: return method(self,value)
-    if (not static) or hasattr(self,name):
-        self.__dict__[name] = value
+    method = class_type.__swig_setmethods__.get(name, None)
+    if method:
+        return method(self, value)
+    if (not static):
+        if _newclass:
+            object.__setattr__(self, name, value)
+        else:
+            self.__dict__[name] = value
     else:
         raise AttributeError("You cannot add attributes to %s" % self)
 
-def _swig_setattr(self,class_type,name,value):
-    return _swig_setattr_nondynamic(self,class_type,name,value,0)
 
-def _swig_getattr(self,class_type,name):
-    if (name == "thisown"): return self.this.own()
-    method = class_type.__swig_getmethods__.get(name,None)
-    if method: return method(self)
-    raise AttributeError(name)
+def _swig_setattr(self, class_type, name, value):
+    return _swig_setattr_nondynamic(self, class_type, name, value, 0)
+
+
+def _swig_getattr(self, class_type, name):
+    if (name == "thisown"):
+        return self.this.own()
+    method = class_type.__swig_getmethods__.get(name, None)
+    if method:
+        return method(self)
+    raise AttributeError("'%s' object has no attribute '%s'" % (class_type.__name__, name))
+
 
 def _swig_repr(self):
-    try: strthis = "proxy of " + self.this.__repr__()
-    except: strthis = ""
+    try:
+        strthis = "proxy of " + self.this.__repr__()
+    except __builtin__.Exception:
+        strthis = ""
     return "<%s.%s; %s >" % (self.__class__.__module__, self.__class__.__name__, strthis,)
 
 try:
     _object = object
     _newclass = 1
-except AttributeError:
-    class _object : pass
+except __builtin__.Exception:
+    class _object:
+        pass
     _newclass = 0
 
 
-
 def csc_matmat_pass1(*args):
-  """
-    csc_matmat_pass1(int n_row, int n_col, int Ap, int Ai, int Bp, int Bi, 
-        int Cp)
     """
-  return _csc.csc_matmat_pass1(*args)
-
+    csc_matmat_pass1(int const n_row, int const n_col, int const [] Ap, int const [] Ai, int const [] Bp, int const [] Bi, int [] Cp)
+    csc_matmat_pass1(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, long long const [] Bp, long long const [] Bi, long long [] Cp)
+    """
+    return _csc.csc_matmat_pass1(*args)
 
 def csc_diagonal(*args):
-  """
-    csc_diagonal(int n_row, int n_col, int Ap, int Aj, signed char Ax, 
-        signed char Yx)
-    csc_diagonal(int n_row, int n_col, int Ap, int Aj, unsigned char Ax, 
-        unsigned char Yx)
-    csc_diagonal(int n_row, int n_col, int Ap, int Aj, short Ax, short Yx)
-    csc_diagonal(int n_row, int n_col, int Ap, int Aj, unsigned short Ax, 
-        unsigned short Yx)
-    csc_diagonal(int n_row, int n_col, int Ap, int Aj, int Ax, int Yx)
-    csc_diagonal(int n_row, int n_col, int Ap, int Aj, unsigned int Ax, 
-        unsigned int Yx)
-    csc_diagonal(int n_row, int n_col, int Ap, int Aj, long long Ax, 
-        long long Yx)
-    csc_diagonal(int n_row, int n_col, int Ap, int Aj, unsigned long long Ax, 
-        unsigned long long Yx)
-    csc_diagonal(int n_row, int n_col, int Ap, int Aj, float Ax, float Yx)
-    csc_diagonal(int n_row, int n_col, int Ap, int Aj, double Ax, double Yx)
-    csc_diagonal(int n_row, int n_col, int Ap, int Aj, long double Ax, 
-        long double Yx)
-    csc_diagonal(int n_row, int n_col, int Ap, int Aj, npy_cfloat_wrapper Ax, 
-        npy_cfloat_wrapper Yx)
-    csc_diagonal(int n_row, int n_col, int Ap, int Aj, npy_cdouble_wrapper Ax, 
-        npy_cdouble_wrapper Yx)
-    csc_diagonal(int n_row, int n_col, int Ap, int Aj, npy_clongdouble_wrapper Ax, 
-        npy_clongdouble_wrapper Yx)
     """
-  return _csc.csc_diagonal(*args)
+    csc_diagonal(int const n_row, int const n_col, int const [] Ap, int const [] Aj, signed char const [] Ax, signed char [] Yx)
+    csc_diagonal(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned char const [] Ax, unsigned char [] Yx)
+    csc_diagonal(int const n_row, int const n_col, int const [] Ap, int const [] Aj, short const [] Ax, short [] Yx)
+    csc_diagonal(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned short const [] Ax, unsigned short [] Yx)
+    csc_diagonal(int const n_row, int const n_col, int const [] Ap, int const [] Aj, int const [] Ax, int [] Yx)
+    csc_diagonal(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned int const [] Ax, unsigned int [] Yx)
+    csc_diagonal(int const n_row, int const n_col, int const [] Ap, int const [] Aj, long long const [] Ax, long long [] Yx)
+    csc_diagonal(int const n_row, int const n_col, int const [] Ap, int const [] Aj, unsigned long long const [] Ax, unsigned long long [] Yx)
+    csc_diagonal(int const n_row, int const n_col, int const [] Ap, int const [] Aj, float const [] Ax, float [] Yx)
+    csc_diagonal(int const n_row, int const n_col, int const [] Ap, int const [] Aj, double const [] Ax, double [] Yx)
+    csc_diagonal(int const n_row, int const n_col, int const [] Ap, int const [] Aj, long double const [] Ax, long double [] Yx)
+    csc_diagonal(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_cfloat_wrapper const [] Ax, npy_cfloat_wrapper [] Yx)
+    csc_diagonal(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_cdouble_wrapper const [] Ax, npy_cdouble_wrapper [] Yx)
+    csc_diagonal(int const n_row, int const n_col, int const [] Ap, int const [] Aj, npy_clongdouble_wrapper const [] Ax, npy_clongdouble_wrapper [] Yx)
+    csc_diagonal(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, signed char const [] Ax, signed char [] Yx)
+    csc_diagonal(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned char const [] Ax, unsigned char [] Yx)
+    csc_diagonal(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, short const [] Ax, short [] Yx)
+    csc_diagonal(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned short const [] Ax, unsigned short [] Yx)
+    csc_diagonal(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, int const [] Ax, int [] Yx)
+    csc_diagonal(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned int const [] Ax, unsigned int [] Yx)
+    csc_diagonal(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, long long const [] Ax, long long [] Yx)
+    csc_diagonal(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, unsigned long long const [] Ax, unsigned long long [] Yx)
+    csc_diagonal(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, float const [] Ax, float [] Yx)
+    csc_diagonal(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, double const [] Ax, double [] Yx)
+    csc_diagonal(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, long double const [] Ax, long double [] Yx)
+    csc_diagonal(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_cfloat_wrapper const [] Ax, npy_cfloat_wrapper [] Yx)
+    csc_diagonal(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_cdouble_wrapper const [] Ax, npy_cdouble_wrapper [] Yx)
+    csc_diagonal(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Aj, npy_clongdouble_wrapper const [] Ax, npy_clongdouble_wrapper [] Yx)
+    """
+    return _csc.csc_diagonal(*args)
 
 def csc_tocsr(*args):
-  """
-    csc_tocsr(int n_row, int n_col, int Ap, int Ai, signed char Ax, 
-        int Bp, int Bj, signed char Bx)
-    csc_tocsr(int n_row, int n_col, int Ap, int Ai, unsigned char Ax, 
-        int Bp, int Bj, unsigned char Bx)
-    csc_tocsr(int n_row, int n_col, int Ap, int Ai, short Ax, int Bp, 
-        int Bj, short Bx)
-    csc_tocsr(int n_row, int n_col, int Ap, int Ai, unsigned short Ax, 
-        int Bp, int Bj, unsigned short Bx)
-    csc_tocsr(int n_row, int n_col, int Ap, int Ai, int Ax, int Bp, 
-        int Bj, int Bx)
-    csc_tocsr(int n_row, int n_col, int Ap, int Ai, unsigned int Ax, 
-        int Bp, int Bj, unsigned int Bx)
-    csc_tocsr(int n_row, int n_col, int Ap, int Ai, long long Ax, 
-        int Bp, int Bj, long long Bx)
-    csc_tocsr(int n_row, int n_col, int Ap, int Ai, unsigned long long Ax, 
-        int Bp, int Bj, unsigned long long Bx)
-    csc_tocsr(int n_row, int n_col, int Ap, int Ai, float Ax, int Bp, 
-        int Bj, float Bx)
-    csc_tocsr(int n_row, int n_col, int Ap, int Ai, double Ax, int Bp, 
-        int Bj, double Bx)
-    csc_tocsr(int n_row, int n_col, int Ap, int Ai, long double Ax, 
-        int Bp, int Bj, long double Bx)
-    csc_tocsr(int n_row, int n_col, int Ap, int Ai, npy_cfloat_wrapper Ax, 
-        int Bp, int Bj, npy_cfloat_wrapper Bx)
-    csc_tocsr(int n_row, int n_col, int Ap, int Ai, npy_cdouble_wrapper Ax, 
-        int Bp, int Bj, npy_cdouble_wrapper Bx)
-    csc_tocsr(int n_row, int n_col, int Ap, int Ai, npy_clongdouble_wrapper Ax, 
-        int Bp, int Bj, npy_clongdouble_wrapper Bx)
     """
-  return _csc.csc_tocsr(*args)
+    csc_tocsr(int const n_row, int const n_col, int const [] Ap, int const [] Ai, signed char const [] Ax, int [] Bp, int [] Bj, signed char [] Bx)
+    csc_tocsr(int const n_row, int const n_col, int const [] Ap, int const [] Ai, unsigned char const [] Ax, int [] Bp, int [] Bj, unsigned char [] Bx)
+    csc_tocsr(int const n_row, int const n_col, int const [] Ap, int const [] Ai, short const [] Ax, int [] Bp, int [] Bj, short [] Bx)
+    csc_tocsr(int const n_row, int const n_col, int const [] Ap, int const [] Ai, unsigned short const [] Ax, int [] Bp, int [] Bj, unsigned short [] Bx)
+    csc_tocsr(int const n_row, int const n_col, int const [] Ap, int const [] Ai, int const [] Ax, int [] Bp, int [] Bj, int [] Bx)
+    csc_tocsr(int const n_row, int const n_col, int const [] Ap, int const [] Ai, unsigned int const [] Ax, int [] Bp, int [] Bj, unsigned int [] Bx)
+    csc_tocsr(int const n_row, int const n_col, int const [] Ap, int const [] Ai, long long const [] Ax, int [] Bp, int [] Bj, long long [] Bx)
+    csc_tocsr(int const n_row, int const n_col, int const [] Ap, int const [] Ai, unsigned long long const [] Ax, int [] Bp, int [] Bj, unsigned long long [] Bx)
+    csc_tocsr(int const n_row, int const n_col, int const [] Ap, int const [] Ai, float const [] Ax, int [] Bp, int [] Bj, float [] Bx)
+    csc_tocsr(int const n_row, int const n_col, int const [] Ap, int const [] Ai, double const [] Ax, int [] Bp, int [] Bj, double [] Bx)
+    csc_tocsr(int const n_row, int const n_col, int const [] Ap, int const [] Ai, long double const [] Ax, int [] Bp, int [] Bj, long double [] Bx)
+    csc_tocsr(int const n_row, int const n_col, int const [] Ap, int const [] Ai, npy_cfloat_wrapper const [] Ax, int [] Bp, int [] Bj, npy_cfloat_wrapper [] Bx)
+    csc_tocsr(int const n_row, int const n_col, int const [] Ap, int const [] Ai, npy_cdouble_wrapper const [] Ax, int [] Bp, int [] Bj, npy_cdouble_wrapper [] Bx)
+    csc_tocsr(int const n_row, int const n_col, int const [] Ap, int const [] Ai, npy_clongdouble_wrapper const [] Ax, int [] Bp, int [] Bj, npy_clongdouble_wrapper [] Bx)
+    csc_tocsr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, signed char const [] Ax, long long [] Bp, long long [] Bj, signed char [] Bx)
+    csc_tocsr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, unsigned char const [] Ax, long long [] Bp, long long [] Bj, unsigned char [] Bx)
+    csc_tocsr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, short const [] Ax, long long [] Bp, long long [] Bj, short [] Bx)
+    csc_tocsr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, unsigned short const [] Ax, long long [] Bp, long long [] Bj, unsigned short [] Bx)
+    csc_tocsr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, int const [] Ax, long long [] Bp, long long [] Bj, int [] Bx)
+    csc_tocsr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, unsigned int const [] Ax, long long [] Bp, long long [] Bj, unsigned int [] Bx)
+    csc_tocsr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, long long const [] Ax, long long [] Bp, long long [] Bj, long long [] Bx)
+    csc_tocsr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, unsigned long long const [] Ax, long long [] Bp, long long [] Bj, unsigned long long [] Bx)
+    csc_tocsr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, float const [] Ax, long long [] Bp, long long [] Bj, float [] Bx)
+    csc_tocsr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, double const [] Ax, long long [] Bp, long long [] Bj, double [] Bx)
+    csc_tocsr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, long double const [] Ax, long long [] Bp, long long [] Bj, long double [] Bx)
+    csc_tocsr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, npy_cfloat_wrapper const [] Ax, long long [] Bp, long long [] Bj, npy_cfloat_wrapper [] Bx)
+    csc_tocsr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, npy_cdouble_wrapper const [] Ax, long long [] Bp, long long [] Bj, npy_cdouble_wrapper [] Bx)
+    csc_tocsr(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, npy_clongdouble_wrapper const [] Ax, long long [] Bp, long long [] Bj, npy_clongdouble_wrapper [] Bx)
+    """
+    return _csc.csc_tocsr(*args)
 
 def csc_matmat_pass2(*args):
-  """
-    csc_matmat_pass2(int n_row, int n_col, int Ap, int Ai, signed char Ax, 
-        int Bp, int Bi, signed char Bx, int Cp, int Ci, 
-        signed char Cx)
-    csc_matmat_pass2(int n_row, int n_col, int Ap, int Ai, unsigned char Ax, 
-        int Bp, int Bi, unsigned char Bx, int Cp, 
-        int Ci, unsigned char Cx)
-    csc_matmat_pass2(int n_row, int n_col, int Ap, int Ai, short Ax, int Bp, 
-        int Bi, short Bx, int Cp, int Ci, short Cx)
-    csc_matmat_pass2(int n_row, int n_col, int Ap, int Ai, unsigned short Ax, 
-        int Bp, int Bi, unsigned short Bx, int Cp, 
-        int Ci, unsigned short Cx)
-    csc_matmat_pass2(int n_row, int n_col, int Ap, int Ai, int Ax, int Bp, 
-        int Bi, int Bx, int Cp, int Ci, int Cx)
-    csc_matmat_pass2(int n_row, int n_col, int Ap, int Ai, unsigned int Ax, 
-        int Bp, int Bi, unsigned int Bx, int Cp, 
-        int Ci, unsigned int Cx)
-    csc_matmat_pass2(int n_row, int n_col, int Ap, int Ai, long long Ax, 
-        int Bp, int Bi, long long Bx, int Cp, int Ci, 
-        long long Cx)
-    csc_matmat_pass2(int n_row, int n_col, int Ap, int Ai, unsigned long long Ax, 
-        int Bp, int Bi, unsigned long long Bx, 
-        int Cp, int Ci, unsigned long long Cx)
-    csc_matmat_pass2(int n_row, int n_col, int Ap, int Ai, float Ax, int Bp, 
-        int Bi, float Bx, int Cp, int Ci, float Cx)
-    csc_matmat_pass2(int n_row, int n_col, int Ap, int Ai, double Ax, int Bp, 
-        int Bi, double Bx, int Cp, int Ci, double Cx)
-    csc_matmat_pass2(int n_row, int n_col, int Ap, int Ai, long double Ax, 
-        int Bp, int Bi, long double Bx, int Cp, int Ci, 
-        long double Cx)
-    csc_matmat_pass2(int n_row, int n_col, int Ap, int Ai, npy_cfloat_wrapper Ax, 
-        int Bp, int Bi, npy_cfloat_wrapper Bx, 
-        int Cp, int Ci, npy_cfloat_wrapper Cx)
-    csc_matmat_pass2(int n_row, int n_col, int Ap, int Ai, npy_cdouble_wrapper Ax, 
-        int Bp, int Bi, npy_cdouble_wrapper Bx, 
-        int Cp, int Ci, npy_cdouble_wrapper Cx)
-    csc_matmat_pass2(int n_row, int n_col, int Ap, int Ai, npy_clongdouble_wrapper Ax, 
-        int Bp, int Bi, npy_clongdouble_wrapper Bx, 
-        int Cp, int Ci, npy_clongdouble_wrapper Cx)
     """
-  return _csc.csc_matmat_pass2(*args)
+    csc_matmat_pass2(int const n_row, int const n_col, int const [] Ap, int const [] Ai, signed char const [] Ax, int const [] Bp, int const [] Bi, signed char const [] Bx, int [] Cp, int [] Ci, signed char [] Cx)
+    csc_matmat_pass2(int const n_row, int const n_col, int const [] Ap, int const [] Ai, unsigned char const [] Ax, int const [] Bp, int const [] Bi, unsigned char const [] Bx, int [] Cp, int [] Ci, unsigned char [] Cx)
+    csc_matmat_pass2(int const n_row, int const n_col, int const [] Ap, int const [] Ai, short const [] Ax, int const [] Bp, int const [] Bi, short const [] Bx, int [] Cp, int [] Ci, short [] Cx)
+    csc_matmat_pass2(int const n_row, int const n_col, int const [] Ap, int const [] Ai, unsigned short const [] Ax, int const [] Bp, int const [] Bi, unsigned short const [] Bx, int [] Cp, int [] Ci, unsigned short [] Cx)
+    csc_matmat_pass2(int const n_row, int const n_col, int const [] Ap, int const [] Ai, int const [] Ax, int const [] Bp, int const [] Bi, int const [] Bx, int [] Cp, int [] Ci, int [] Cx)
+    csc_matmat_pass2(int const n_row, int const n_col, int const [] Ap, int const [] Ai, unsigned int const [] Ax, int const [] Bp, int const [] Bi, unsigned int const [] Bx, int [] Cp, int [] Ci, unsigned int [] Cx)
+    csc_matmat_pass2(int const n_row, int const n_col, int const [] Ap, int const [] Ai, long long const [] Ax, int const [] Bp, int const [] Bi, long long const [] Bx, int [] Cp, int [] Ci, long long [] Cx)
+    csc_matmat_pass2(int const n_row, int const n_col, int const [] Ap, int const [] Ai, unsigned long long const [] Ax, int const [] Bp, int const [] Bi, unsigned long long const [] Bx, int [] Cp, int [] Ci, unsigned long long [] Cx)
+    csc_matmat_pass2(int const n_row, int const n_col, int const [] Ap, int const [] Ai, float const [] Ax, int const [] Bp, int const [] Bi, float const [] Bx, int [] Cp, int [] Ci, float [] Cx)
+    csc_matmat_pass2(int const n_row, int const n_col, int const [] Ap, int const [] Ai, double const [] Ax, int const [] Bp, int const [] Bi, double const [] Bx, int [] Cp, int [] Ci, double [] Cx)
+    csc_matmat_pass2(int const n_row, int const n_col, int const [] Ap, int const [] Ai, long double const [] Ax, int const [] Bp, int const [] Bi, long double const [] Bx, int [] Cp, int [] Ci, long double [] Cx)
+    csc_matmat_pass2(int const n_row, int const n_col, int const [] Ap, int const [] Ai, npy_cfloat_wrapper const [] Ax, int const [] Bp, int const [] Bi, npy_cfloat_wrapper const [] Bx, int [] Cp, int [] Ci, npy_cfloat_wrapper [] Cx)
+    csc_matmat_pass2(int const n_row, int const n_col, int const [] Ap, int const [] Ai, npy_cdouble_wrapper const [] Ax, int const [] Bp, int const [] Bi, npy_cdouble_wrapper const [] Bx, int [] Cp, int [] Ci, npy_cdouble_wrapper [] Cx)
+    csc_matmat_pass2(int const n_row, int const n_col, int const [] Ap, int const [] Ai, npy_clongdouble_wrapper const [] Ax, int const [] Bp, int const [] Bi, npy_clongdouble_wrapper const [] Bx, int [] Cp, int [] Ci, npy_clongdouble_wrapper [] Cx)
+    csc_matmat_pass2(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, signed char const [] Ax, long long const [] Bp, long long const [] Bi, signed char const [] Bx, long long [] Cp, long long [] Ci, signed char [] Cx)
+    csc_matmat_pass2(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, unsigned char const [] Ax, long long const [] Bp, long long const [] Bi, unsigned char const [] Bx, long long [] Cp, long long [] Ci, unsigned char [] Cx)
+    csc_matmat_pass2(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, short const [] Ax, long long const [] Bp, long long const [] Bi, short const [] Bx, long long [] Cp, long long [] Ci, short [] Cx)
+    csc_matmat_pass2(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, unsigned short const [] Ax, long long const [] Bp, long long const [] Bi, unsigned short const [] Bx, long long [] Cp, long long [] Ci, unsigned short [] Cx)
+    csc_matmat_pass2(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, int const [] Ax, long long const [] Bp, long long const [] Bi, int const [] Bx, long long [] Cp, long long [] Ci, int [] Cx)
+    csc_matmat_pass2(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, unsigned int const [] Ax, long long const [] Bp, long long const [] Bi, unsigned int const [] Bx, long long [] Cp, long long [] Ci, unsigned int [] Cx)
+    csc_matmat_pass2(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, long long const [] Ax, long long const [] Bp, long long const [] Bi, long long const [] Bx, long long [] Cp, long long [] Ci, long long [] Cx)
+    csc_matmat_pass2(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, unsigned long long const [] Ax, long long const [] Bp, long long const [] Bi, unsigned long long const [] Bx, long long [] Cp, long long [] Ci, unsigned long long [] Cx)
+    csc_matmat_pass2(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, float const [] Ax, long long const [] Bp, long long const [] Bi, float const [] Bx, long long [] Cp, long long [] Ci, float [] Cx)
+    csc_matmat_pass2(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, double const [] Ax, long long const [] Bp, long long const [] Bi, double const [] Bx, long long [] Cp, long long [] Ci, double [] Cx)
+    csc_matmat_pass2(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, long double const [] Ax, long long const [] Bp, long long const [] Bi, long double const [] Bx, long long [] Cp, long long [] Ci, long double [] Cx)
+    csc_matmat_pass2(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, npy_cfloat_wrapper const [] Ax, long long const [] Bp, long long const [] Bi, npy_cfloat_wrapper const [] Bx, long long [] Cp, long long [] Ci, npy_cfloat_wrapper [] Cx)
+    csc_matmat_pass2(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, npy_cdouble_wrapper const [] Ax, long long const [] Bp, long long const [] Bi, npy_cdouble_wrapper const [] Bx, long long [] Cp, long long [] Ci, npy_cdouble_wrapper [] Cx)
+    csc_matmat_pass2(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, npy_clongdouble_wrapper const [] Ax, long long const [] Bp, long long const [] Bi, npy_clongdouble_wrapper const [] Bx, long long [] Cp, long long [] Ci, npy_clongdouble_wrapper [] Cx)
+    """
+    return _csc.csc_matmat_pass2(*args)
 
 def csc_matvec(*args):
-  """
-    csc_matvec(int n_row, int n_col, int Ap, int Ai, signed char Ax, 
-        signed char Xx, signed char Yx)
-    csc_matvec(int n_row, int n_col, int Ap, int Ai, unsigned char Ax, 
-        unsigned char Xx, unsigned char Yx)
-    csc_matvec(int n_row, int n_col, int Ap, int Ai, short Ax, short Xx, 
-        short Yx)
-    csc_matvec(int n_row, int n_col, int Ap, int Ai, unsigned short Ax, 
-        unsigned short Xx, unsigned short Yx)
-    csc_matvec(int n_row, int n_col, int Ap, int Ai, int Ax, int Xx, 
-        int Yx)
-    csc_matvec(int n_row, int n_col, int Ap, int Ai, unsigned int Ax, 
-        unsigned int Xx, unsigned int Yx)
-    csc_matvec(int n_row, int n_col, int Ap, int Ai, long long Ax, 
-        long long Xx, long long Yx)
-    csc_matvec(int n_row, int n_col, int Ap, int Ai, unsigned long long Ax, 
-        unsigned long long Xx, unsigned long long Yx)
-    csc_matvec(int n_row, int n_col, int Ap, int Ai, float Ax, float Xx, 
-        float Yx)
-    csc_matvec(int n_row, int n_col, int Ap, int Ai, double Ax, double Xx, 
-        double Yx)
-    csc_matvec(int n_row, int n_col, int Ap, int Ai, long double Ax, 
-        long double Xx, long double Yx)
-    csc_matvec(int n_row, int n_col, int Ap, int Ai, npy_cfloat_wrapper Ax, 
-        npy_cfloat_wrapper Xx, npy_cfloat_wrapper Yx)
-    csc_matvec(int n_row, int n_col, int Ap, int Ai, npy_cdouble_wrapper Ax, 
-        npy_cdouble_wrapper Xx, npy_cdouble_wrapper Yx)
-    csc_matvec(int n_row, int n_col, int Ap, int Ai, npy_clongdouble_wrapper Ax, 
-        npy_clongdouble_wrapper Xx, npy_clongdouble_wrapper Yx)
     """
-  return _csc.csc_matvec(*args)
+    csc_matvec(int const n_row, int const n_col, int const [] Ap, int const [] Ai, signed char const [] Ax, signed char const [] Xx, signed char [] Yx)
+    csc_matvec(int const n_row, int const n_col, int const [] Ap, int const [] Ai, unsigned char const [] Ax, unsigned char const [] Xx, unsigned char [] Yx)
+    csc_matvec(int const n_row, int const n_col, int const [] Ap, int const [] Ai, short const [] Ax, short const [] Xx, short [] Yx)
+    csc_matvec(int const n_row, int const n_col, int const [] Ap, int const [] Ai, unsigned short const [] Ax, unsigned short const [] Xx, unsigned short [] Yx)
+    csc_matvec(int const n_row, int const n_col, int const [] Ap, int const [] Ai, int const [] Ax, int const [] Xx, int [] Yx)
+    csc_matvec(int const n_row, int const n_col, int const [] Ap, int const [] Ai, unsigned int const [] Ax, unsigned int const [] Xx, unsigned int [] Yx)
+    csc_matvec(int const n_row, int const n_col, int const [] Ap, int const [] Ai, long long const [] Ax, long long const [] Xx, long long [] Yx)
+    csc_matvec(int const n_row, int const n_col, int const [] Ap, int const [] Ai, unsigned long long const [] Ax, unsigned long long const [] Xx, unsigned long long [] Yx)
+    csc_matvec(int const n_row, int const n_col, int const [] Ap, int const [] Ai, float const [] Ax, float const [] Xx, float [] Yx)
+    csc_matvec(int const n_row, int const n_col, int const [] Ap, int const [] Ai, double const [] Ax, double const [] Xx, double [] Yx)
+    csc_matvec(int const n_row, int const n_col, int const [] Ap, int const [] Ai, long double const [] Ax, long double const [] Xx, long double [] Yx)
+    csc_matvec(int const n_row, int const n_col, int const [] Ap, int const [] Ai, npy_cfloat_wrapper const [] Ax, npy_cfloat_wrapper const [] Xx, npy_cfloat_wrapper [] Yx)
+    csc_matvec(int const n_row, int const n_col, int const [] Ap, int const [] Ai, npy_cdouble_wrapper const [] Ax, npy_cdouble_wrapper const [] Xx, npy_cdouble_wrapper [] Yx)
+    csc_matvec(int const n_row, int const n_col, int const [] Ap, int const [] Ai, npy_clongdouble_wrapper const [] Ax, npy_clongdouble_wrapper const [] Xx, npy_clongdouble_wrapper [] Yx)
+    csc_matvec(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, signed char const [] Ax, signed char const [] Xx, signed char [] Yx)
+    csc_matvec(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, unsigned char const [] Ax, unsigned char const [] Xx, unsigned char [] Yx)
+    csc_matvec(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, short const [] Ax, short const [] Xx, short [] Yx)
+    csc_matvec(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, unsigned short const [] Ax, unsigned short const [] Xx, unsigned short [] Yx)
+    csc_matvec(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, int const [] Ax, int const [] Xx, int [] Yx)
+    csc_matvec(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, unsigned int const [] Ax, unsigned int const [] Xx, unsigned int [] Yx)
+    csc_matvec(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, long long const [] Ax, long long const [] Xx, long long [] Yx)
+    csc_matvec(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, unsigned long long const [] Ax, unsigned long long const [] Xx, unsigned long long [] Yx)
+    csc_matvec(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, float const [] Ax, float const [] Xx, float [] Yx)
+    csc_matvec(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, double const [] Ax, double const [] Xx, double [] Yx)
+    csc_matvec(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, long double const [] Ax, long double const [] Xx, long double [] Yx)
+    csc_matvec(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, npy_cfloat_wrapper const [] Ax, npy_cfloat_wrapper const [] Xx, npy_cfloat_wrapper [] Yx)
+    csc_matvec(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, npy_cdouble_wrapper const [] Ax, npy_cdouble_wrapper const [] Xx, npy_cdouble_wrapper [] Yx)
+    csc_matvec(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, npy_clongdouble_wrapper const [] Ax, npy_clongdouble_wrapper const [] Xx, npy_clongdouble_wrapper [] Yx)
+    """
+    return _csc.csc_matvec(*args)
 
 def csc_matvecs(*args):
-  """
-    csc_matvecs(int n_row, int n_col, int n_vecs, int Ap, int Ai, signed char Ax, 
-        signed char Xx, signed char Yx)
-    csc_matvecs(int n_row, int n_col, int n_vecs, int Ap, int Ai, unsigned char Ax, 
-        unsigned char Xx, unsigned char Yx)
-    csc_matvecs(int n_row, int n_col, int n_vecs, int Ap, int Ai, short Ax, 
-        short Xx, short Yx)
-    csc_matvecs(int n_row, int n_col, int n_vecs, int Ap, int Ai, unsigned short Ax, 
-        unsigned short Xx, unsigned short Yx)
-    csc_matvecs(int n_row, int n_col, int n_vecs, int Ap, int Ai, int Ax, 
-        int Xx, int Yx)
-    csc_matvecs(int n_row, int n_col, int n_vecs, int Ap, int Ai, unsigned int Ax, 
-        unsigned int Xx, unsigned int Yx)
-    csc_matvecs(int n_row, int n_col, int n_vecs, int Ap, int Ai, long long Ax, 
-        long long Xx, long long Yx)
-    csc_matvecs(int n_row, int n_col, int n_vecs, int Ap, int Ai, unsigned long long Ax, 
-        unsigned long long Xx, 
-        unsigned long long Yx)
-    csc_matvecs(int n_row, int n_col, int n_vecs, int Ap, int Ai, float Ax, 
-        float Xx, float Yx)
-    csc_matvecs(int n_row, int n_col, int n_vecs, int Ap, int Ai, double Ax, 
-        double Xx, double Yx)
-    csc_matvecs(int n_row, int n_col, int n_vecs, int Ap, int Ai, long double Ax, 
-        long double Xx, long double Yx)
-    csc_matvecs(int n_row, int n_col, int n_vecs, int Ap, int Ai, npy_cfloat_wrapper Ax, 
-        npy_cfloat_wrapper Xx, 
-        npy_cfloat_wrapper Yx)
-    csc_matvecs(int n_row, int n_col, int n_vecs, int Ap, int Ai, npy_cdouble_wrapper Ax, 
-        npy_cdouble_wrapper Xx, 
-        npy_cdouble_wrapper Yx)
-    csc_matvecs(int n_row, int n_col, int n_vecs, int Ap, int Ai, npy_clongdouble_wrapper Ax, 
-        npy_clongdouble_wrapper Xx, 
-        npy_clongdouble_wrapper Yx)
     """
-  return _csc.csc_matvecs(*args)
+    csc_matvecs(int const n_row, int const n_col, int const n_vecs, int const [] Ap, int const [] Ai, signed char const [] Ax, signed char const [] Xx, signed char [] Yx)
+    csc_matvecs(int const n_row, int const n_col, int const n_vecs, int const [] Ap, int const [] Ai, unsigned char const [] Ax, unsigned char const [] Xx, unsigned char [] Yx)
+    csc_matvecs(int const n_row, int const n_col, int const n_vecs, int const [] Ap, int const [] Ai, short const [] Ax, short const [] Xx, short [] Yx)
+    csc_matvecs(int const n_row, int const n_col, int const n_vecs, int const [] Ap, int const [] Ai, unsigned short const [] Ax, unsigned short const [] Xx, unsigned short [] Yx)
+    csc_matvecs(int const n_row, int const n_col, int const n_vecs, int const [] Ap, int const [] Ai, int const [] Ax, int const [] Xx, int [] Yx)
+    csc_matvecs(int const n_row, int const n_col, int const n_vecs, int const [] Ap, int const [] Ai, unsigned int const [] Ax, unsigned int const [] Xx, unsigned int [] Yx)
+    csc_matvecs(int const n_row, int const n_col, int const n_vecs, int const [] Ap, int const [] Ai, long long const [] Ax, long long const [] Xx, long long [] Yx)
+    csc_matvecs(int const n_row, int const n_col, int const n_vecs, int const [] Ap, int const [] Ai, unsigned long long const [] Ax, unsigned long long const [] Xx, unsigned long long [] Yx)
+    csc_matvecs(int const n_row, int const n_col, int const n_vecs, int const [] Ap, int const [] Ai, float const [] Ax, float const [] Xx, float [] Yx)
+    csc_matvecs(int const n_row, int const n_col, int const n_vecs, int const [] Ap, int const [] Ai, double const [] Ax, double const [] Xx, double [] Yx)
+    csc_matvecs(int const n_row, int const n_col, int const n_vecs, int const [] Ap, int const [] Ai, long double const [] Ax, long double const [] Xx, long double [] Yx)
+    csc_matvecs(int const n_row, int const n_col, int const n_vecs, int const [] Ap, int const [] Ai, npy_cfloat_wrapper const [] Ax, npy_cfloat_wrapper const [] Xx, npy_cfloat_wrapper [] Yx)
+    csc_matvecs(int const n_row, int const n_col, int const n_vecs, int const [] Ap, int const [] Ai, npy_cdouble_wrapper const [] Ax, npy_cdouble_wrapper const [] Xx, npy_cdouble_wrapper [] Yx)
+    csc_matvecs(int const n_row, int const n_col, int const n_vecs, int const [] Ap, int const [] Ai, npy_clongdouble_wrapper const [] Ax, npy_clongdouble_wrapper const [] Xx, npy_clongdouble_wrapper [] Yx)
+    csc_matvecs(long long const n_row, long long const n_col, long long const n_vecs, long long const [] Ap, long long const [] Ai, signed char const [] Ax, signed char const [] Xx, signed char [] Yx)
+    csc_matvecs(long long const n_row, long long const n_col, long long const n_vecs, long long const [] Ap, long long const [] Ai, unsigned char const [] Ax, unsigned char const [] Xx, unsigned char [] Yx)
+    csc_matvecs(long long const n_row, long long const n_col, long long const n_vecs, long long const [] Ap, long long const [] Ai, short const [] Ax, short const [] Xx, short [] Yx)
+    csc_matvecs(long long const n_row, long long const n_col, long long const n_vecs, long long const [] Ap, long long const [] Ai, unsigned short const [] Ax, unsigned short const [] Xx, unsigned short [] Yx)
+    csc_matvecs(long long const n_row, long long const n_col, long long const n_vecs, long long const [] Ap, long long const [] Ai, int const [] Ax, int const [] Xx, int [] Yx)
+    csc_matvecs(long long const n_row, long long const n_col, long long const n_vecs, long long const [] Ap, long long const [] Ai, unsigned int const [] Ax, unsigned int const [] Xx, unsigned int [] Yx)
+    csc_matvecs(long long const n_row, long long const n_col, long long const n_vecs, long long const [] Ap, long long const [] Ai, long long const [] Ax, long long const [] Xx, long long [] Yx)
+    csc_matvecs(long long const n_row, long long const n_col, long long const n_vecs, long long const [] Ap, long long const [] Ai, unsigned long long const [] Ax, unsigned long long const [] Xx, unsigned long long [] Yx)
+    csc_matvecs(long long const n_row, long long const n_col, long long const n_vecs, long long const [] Ap, long long const [] Ai, float const [] Ax, float const [] Xx, float [] Yx)
+    csc_matvecs(long long const n_row, long long const n_col, long long const n_vecs, long long const [] Ap, long long const [] Ai, double const [] Ax, double const [] Xx, double [] Yx)
+    csc_matvecs(long long const n_row, long long const n_col, long long const n_vecs, long long const [] Ap, long long const [] Ai, long double const [] Ax, long double const [] Xx, long double [] Yx)
+    csc_matvecs(long long const n_row, long long const n_col, long long const n_vecs, long long const [] Ap, long long const [] Ai, npy_cfloat_wrapper const [] Ax, npy_cfloat_wrapper const [] Xx, npy_cfloat_wrapper [] Yx)
+    csc_matvecs(long long const n_row, long long const n_col, long long const n_vecs, long long const [] Ap, long long const [] Ai, npy_cdouble_wrapper const [] Ax, npy_cdouble_wrapper const [] Xx, npy_cdouble_wrapper [] Yx)
+    csc_matvecs(long long const n_row, long long const n_col, long long const n_vecs, long long const [] Ap, long long const [] Ai, npy_clongdouble_wrapper const [] Ax, npy_clongdouble_wrapper const [] Xx, npy_clongdouble_wrapper [] Yx)
+    """
+    return _csc.csc_matvecs(*args)
 
 def csc_elmul_csc(*args):
-  """
-    csc_elmul_csc(int n_row, int n_col, int Ap, int Ai, signed char Ax, 
-        int Bp, int Bi, signed char Bx, int Cp, int Ci, 
-        signed char Cx)
-    csc_elmul_csc(int n_row, int n_col, int Ap, int Ai, unsigned char Ax, 
-        int Bp, int Bi, unsigned char Bx, int Cp, 
-        int Ci, unsigned char Cx)
-    csc_elmul_csc(int n_row, int n_col, int Ap, int Ai, short Ax, int Bp, 
-        int Bi, short Bx, int Cp, int Ci, short Cx)
-    csc_elmul_csc(int n_row, int n_col, int Ap, int Ai, unsigned short Ax, 
-        int Bp, int Bi, unsigned short Bx, int Cp, 
-        int Ci, unsigned short Cx)
-    csc_elmul_csc(int n_row, int n_col, int Ap, int Ai, int Ax, int Bp, 
-        int Bi, int Bx, int Cp, int Ci, int Cx)
-    csc_elmul_csc(int n_row, int n_col, int Ap, int Ai, unsigned int Ax, 
-        int Bp, int Bi, unsigned int Bx, int Cp, 
-        int Ci, unsigned int Cx)
-    csc_elmul_csc(int n_row, int n_col, int Ap, int Ai, long long Ax, 
-        int Bp, int Bi, long long Bx, int Cp, int Ci, 
-        long long Cx)
-    csc_elmul_csc(int n_row, int n_col, int Ap, int Ai, unsigned long long Ax, 
-        int Bp, int Bi, unsigned long long Bx, 
-        int Cp, int Ci, unsigned long long Cx)
-    csc_elmul_csc(int n_row, int n_col, int Ap, int Ai, float Ax, int Bp, 
-        int Bi, float Bx, int Cp, int Ci, float Cx)
-    csc_elmul_csc(int n_row, int n_col, int Ap, int Ai, double Ax, int Bp, 
-        int Bi, double Bx, int Cp, int Ci, double Cx)
-    csc_elmul_csc(int n_row, int n_col, int Ap, int Ai, long double Ax, 
-        int Bp, int Bi, long double Bx, int Cp, int Ci, 
-        long double Cx)
-    csc_elmul_csc(int n_row, int n_col, int Ap, int Ai, npy_cfloat_wrapper Ax, 
-        int Bp, int Bi, npy_cfloat_wrapper Bx, 
-        int Cp, int Ci, npy_cfloat_wrapper Cx)
-    csc_elmul_csc(int n_row, int n_col, int Ap, int Ai, npy_cdouble_wrapper Ax, 
-        int Bp, int Bi, npy_cdouble_wrapper Bx, 
-        int Cp, int Ci, npy_cdouble_wrapper Cx)
-    csc_elmul_csc(int n_row, int n_col, int Ap, int Ai, npy_clongdouble_wrapper Ax, 
-        int Bp, int Bi, npy_clongdouble_wrapper Bx, 
-        int Cp, int Ci, npy_clongdouble_wrapper Cx)
     """
-  return _csc.csc_elmul_csc(*args)
+    csc_elmul_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, signed char const [] Ax, int const [] Bp, int const [] Bi, signed char const [] Bx, int [] Cp, int [] Ci, signed char [] Cx)
+    csc_elmul_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, unsigned char const [] Ax, int const [] Bp, int const [] Bi, unsigned char const [] Bx, int [] Cp, int [] Ci, unsigned char [] Cx)
+    csc_elmul_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, short const [] Ax, int const [] Bp, int const [] Bi, short const [] Bx, int [] Cp, int [] Ci, short [] Cx)
+    csc_elmul_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, unsigned short const [] Ax, int const [] Bp, int const [] Bi, unsigned short const [] Bx, int [] Cp, int [] Ci, unsigned short [] Cx)
+    csc_elmul_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, int const [] Ax, int const [] Bp, int const [] Bi, int const [] Bx, int [] Cp, int [] Ci, int [] Cx)
+    csc_elmul_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, unsigned int const [] Ax, int const [] Bp, int const [] Bi, unsigned int const [] Bx, int [] Cp, int [] Ci, unsigned int [] Cx)
+    csc_elmul_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, long long const [] Ax, int const [] Bp, int const [] Bi, long long const [] Bx, int [] Cp, int [] Ci, long long [] Cx)
+    csc_elmul_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, unsigned long long const [] Ax, int const [] Bp, int const [] Bi, unsigned long long const [] Bx, int [] Cp, int [] Ci, unsigned long long [] Cx)
+    csc_elmul_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, float const [] Ax, int const [] Bp, int const [] Bi, float const [] Bx, int [] Cp, int [] Ci, float [] Cx)
+    csc_elmul_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, double const [] Ax, int const [] Bp, int const [] Bi, double const [] Bx, int [] Cp, int [] Ci, double [] Cx)
+    csc_elmul_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, long double const [] Ax, int const [] Bp, int const [] Bi, long double const [] Bx, int [] Cp, int [] Ci, long double [] Cx)
+    csc_elmul_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, npy_cfloat_wrapper const [] Ax, int const [] Bp, int const [] Bi, npy_cfloat_wrapper const [] Bx, int [] Cp, int [] Ci, npy_cfloat_wrapper [] Cx)
+    csc_elmul_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, npy_cdouble_wrapper const [] Ax, int const [] Bp, int const [] Bi, npy_cdouble_wrapper const [] Bx, int [] Cp, int [] Ci, npy_cdouble_wrapper [] Cx)
+    csc_elmul_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, npy_clongdouble_wrapper const [] Ax, int const [] Bp, int const [] Bi, npy_clongdouble_wrapper const [] Bx, int [] Cp, int [] Ci, npy_clongdouble_wrapper [] Cx)
+    csc_elmul_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, signed char const [] Ax, long long const [] Bp, long long const [] Bi, signed char const [] Bx, long long [] Cp, long long [] Ci, signed char [] Cx)
+    csc_elmul_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, unsigned char const [] Ax, long long const [] Bp, long long const [] Bi, unsigned char const [] Bx, long long [] Cp, long long [] Ci, unsigned char [] Cx)
+    csc_elmul_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, short const [] Ax, long long const [] Bp, long long const [] Bi, short const [] Bx, long long [] Cp, long long [] Ci, short [] Cx)
+    csc_elmul_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, unsigned short const [] Ax, long long const [] Bp, long long const [] Bi, unsigned short const [] Bx, long long [] Cp, long long [] Ci, unsigned short [] Cx)
+    csc_elmul_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, int const [] Ax, long long const [] Bp, long long const [] Bi, int const [] Bx, long long [] Cp, long long [] Ci, int [] Cx)
+    csc_elmul_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, unsigned int const [] Ax, long long const [] Bp, long long const [] Bi, unsigned int const [] Bx, long long [] Cp, long long [] Ci, unsigned int [] Cx)
+    csc_elmul_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, long long const [] Ax, long long const [] Bp, long long const [] Bi, long long const [] Bx, long long [] Cp, long long [] Ci, long long [] Cx)
+    csc_elmul_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, unsigned long long const [] Ax, long long const [] Bp, long long const [] Bi, unsigned long long const [] Bx, long long [] Cp, long long [] Ci, unsigned long long [] Cx)
+    csc_elmul_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, float const [] Ax, long long const [] Bp, long long const [] Bi, float const [] Bx, long long [] Cp, long long [] Ci, float [] Cx)
+    csc_elmul_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, double const [] Ax, long long const [] Bp, long long const [] Bi, double const [] Bx, long long [] Cp, long long [] Ci, double [] Cx)
+    csc_elmul_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, long double const [] Ax, long long const [] Bp, long long const [] Bi, long double const [] Bx, long long [] Cp, long long [] Ci, long double [] Cx)
+    csc_elmul_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, npy_cfloat_wrapper const [] Ax, long long const [] Bp, long long const [] Bi, npy_cfloat_wrapper const [] Bx, long long [] Cp, long long [] Ci, npy_cfloat_wrapper [] Cx)
+    csc_elmul_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, npy_cdouble_wrapper const [] Ax, long long const [] Bp, long long const [] Bi, npy_cdouble_wrapper const [] Bx, long long [] Cp, long long [] Ci, npy_cdouble_wrapper [] Cx)
+    csc_elmul_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, npy_clongdouble_wrapper const [] Ax, long long const [] Bp, long long const [] Bi, npy_clongdouble_wrapper const [] Bx, long long [] Cp, long long [] Ci, npy_clongdouble_wrapper [] Cx)
+    """
+    return _csc.csc_elmul_csc(*args)
 
 def csc_eldiv_csc(*args):
-  """
-    csc_eldiv_csc(int n_row, int n_col, int Ap, int Ai, signed char Ax, 
-        int Bp, int Bi, signed char Bx, int Cp, int Ci, 
-        signed char Cx)
-    csc_eldiv_csc(int n_row, int n_col, int Ap, int Ai, unsigned char Ax, 
-        int Bp, int Bi, unsigned char Bx, int Cp, 
-        int Ci, unsigned char Cx)
-    csc_eldiv_csc(int n_row, int n_col, int Ap, int Ai, short Ax, int Bp, 
-        int Bi, short Bx, int Cp, int Ci, short Cx)
-    csc_eldiv_csc(int n_row, int n_col, int Ap, int Ai, unsigned short Ax, 
-        int Bp, int Bi, unsigned short Bx, int Cp, 
-        int Ci, unsigned short Cx)
-    csc_eldiv_csc(int n_row, int n_col, int Ap, int Ai, int Ax, int Bp, 
-        int Bi, int Bx, int Cp, int Ci, int Cx)
-    csc_eldiv_csc(int n_row, int n_col, int Ap, int Ai, unsigned int Ax, 
-        int Bp, int Bi, unsigned int Bx, int Cp, 
-        int Ci, unsigned int Cx)
-    csc_eldiv_csc(int n_row, int n_col, int Ap, int Ai, long long Ax, 
-        int Bp, int Bi, long long Bx, int Cp, int Ci, 
-        long long Cx)
-    csc_eldiv_csc(int n_row, int n_col, int Ap, int Ai, unsigned long long Ax, 
-        int Bp, int Bi, unsigned long long Bx, 
-        int Cp, int Ci, unsigned long long Cx)
-    csc_eldiv_csc(int n_row, int n_col, int Ap, int Ai, float Ax, int Bp, 
-        int Bi, float Bx, int Cp, int Ci, float Cx)
-    csc_eldiv_csc(int n_row, int n_col, int Ap, int Ai, double Ax, int Bp, 
-        int Bi, double Bx, int Cp, int Ci, double Cx)
-    csc_eldiv_csc(int n_row, int n_col, int Ap, int Ai, long double Ax, 
-        int Bp, int Bi, long double Bx, int Cp, int Ci, 
-        long double Cx)
-    csc_eldiv_csc(int n_row, int n_col, int Ap, int Ai, npy_cfloat_wrapper Ax, 
-        int Bp, int Bi, npy_cfloat_wrapper Bx, 
-        int Cp, int Ci, npy_cfloat_wrapper Cx)
-    csc_eldiv_csc(int n_row, int n_col, int Ap, int Ai, npy_cdouble_wrapper Ax, 
-        int Bp, int Bi, npy_cdouble_wrapper Bx, 
-        int Cp, int Ci, npy_cdouble_wrapper Cx)
-    csc_eldiv_csc(int n_row, int n_col, int Ap, int Ai, npy_clongdouble_wrapper Ax, 
-        int Bp, int Bi, npy_clongdouble_wrapper Bx, 
-        int Cp, int Ci, npy_clongdouble_wrapper Cx)
     """
-  return _csc.csc_eldiv_csc(*args)
+    csc_eldiv_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, signed char const [] Ax, int const [] Bp, int const [] Bi, signed char const [] Bx, int [] Cp, int [] Ci, signed char [] Cx)
+    csc_eldiv_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, unsigned char const [] Ax, int const [] Bp, int const [] Bi, unsigned char const [] Bx, int [] Cp, int [] Ci, unsigned char [] Cx)
+    csc_eldiv_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, short const [] Ax, int const [] Bp, int const [] Bi, short const [] Bx, int [] Cp, int [] Ci, short [] Cx)
+    csc_eldiv_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, unsigned short const [] Ax, int const [] Bp, int const [] Bi, unsigned short const [] Bx, int [] Cp, int [] Ci, unsigned short [] Cx)
+    csc_eldiv_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, int const [] Ax, int const [] Bp, int const [] Bi, int const [] Bx, int [] Cp, int [] Ci, int [] Cx)
+    csc_eldiv_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, unsigned int const [] Ax, int const [] Bp, int const [] Bi, unsigned int const [] Bx, int [] Cp, int [] Ci, unsigned int [] Cx)
+    csc_eldiv_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, long long const [] Ax, int const [] Bp, int const [] Bi, long long const [] Bx, int [] Cp, int [] Ci, long long [] Cx)
+    csc_eldiv_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, unsigned long long const [] Ax, int const [] Bp, int const [] Bi, unsigned long long const [] Bx, int [] Cp, int [] Ci, unsigned long long [] Cx)
+    csc_eldiv_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, float const [] Ax, int const [] Bp, int const [] Bi, float const [] Bx, int [] Cp, int [] Ci, float [] Cx)
+    csc_eldiv_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, double const [] Ax, int const [] Bp, int const [] Bi, double const [] Bx, int [] Cp, int [] Ci, double [] Cx)
+    csc_eldiv_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, long double const [] Ax, int const [] Bp, int const [] Bi, long double const [] Bx, int [] Cp, int [] Ci, long double [] Cx)
+    csc_eldiv_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, npy_cfloat_wrapper const [] Ax, int const [] Bp, int const [] Bi, npy_cfloat_wrapper const [] Bx, int [] Cp, int [] Ci, npy_cfloat_wrapper [] Cx)
+    csc_eldiv_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, npy_cdouble_wrapper const [] Ax, int const [] Bp, int const [] Bi, npy_cdouble_wrapper const [] Bx, int [] Cp, int [] Ci, npy_cdouble_wrapper [] Cx)
+    csc_eldiv_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, npy_clongdouble_wrapper const [] Ax, int const [] Bp, int const [] Bi, npy_clongdouble_wrapper const [] Bx, int [] Cp, int [] Ci, npy_clongdouble_wrapper [] Cx)
+    csc_eldiv_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, signed char const [] Ax, long long const [] Bp, long long const [] Bi, signed char const [] Bx, long long [] Cp, long long [] Ci, signed char [] Cx)
+    csc_eldiv_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, unsigned char const [] Ax, long long const [] Bp, long long const [] Bi, unsigned char const [] Bx, long long [] Cp, long long [] Ci, unsigned char [] Cx)
+    csc_eldiv_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, short const [] Ax, long long const [] Bp, long long const [] Bi, short const [] Bx, long long [] Cp, long long [] Ci, short [] Cx)
+    csc_eldiv_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, unsigned short const [] Ax, long long const [] Bp, long long const [] Bi, unsigned short const [] Bx, long long [] Cp, long long [] Ci, unsigned short [] Cx)
+    csc_eldiv_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, int const [] Ax, long long const [] Bp, long long const [] Bi, int const [] Bx, long long [] Cp, long long [] Ci, int [] Cx)
+    csc_eldiv_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, unsigned int const [] Ax, long long const [] Bp, long long const [] Bi, unsigned int const [] Bx, long long [] Cp, long long [] Ci, unsigned int [] Cx)
+    csc_eldiv_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, long long const [] Ax, long long const [] Bp, long long const [] Bi, long long const [] Bx, long long [] Cp, long long [] Ci, long long [] Cx)
+    csc_eldiv_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, unsigned long long const [] Ax, long long const [] Bp, long long const [] Bi, unsigned long long const [] Bx, long long [] Cp, long long [] Ci, unsigned long long [] Cx)
+    csc_eldiv_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, float const [] Ax, long long const [] Bp, long long const [] Bi, float const [] Bx, long long [] Cp, long long [] Ci, float [] Cx)
+    csc_eldiv_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, double const [] Ax, long long const [] Bp, long long const [] Bi, double const [] Bx, long long [] Cp, long long [] Ci, double [] Cx)
+    csc_eldiv_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, long double const [] Ax, long long const [] Bp, long long const [] Bi, long double const [] Bx, long long [] Cp, long long [] Ci, long double [] Cx)
+    csc_eldiv_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, npy_cfloat_wrapper const [] Ax, long long const [] Bp, long long const [] Bi, npy_cfloat_wrapper const [] Bx, long long [] Cp, long long [] Ci, npy_cfloat_wrapper [] Cx)
+    csc_eldiv_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, npy_cdouble_wrapper const [] Ax, long long const [] Bp, long long const [] Bi, npy_cdouble_wrapper const [] Bx, long long [] Cp, long long [] Ci, npy_cdouble_wrapper [] Cx)
+    csc_eldiv_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, npy_clongdouble_wrapper const [] Ax, long long const [] Bp, long long const [] Bi, npy_clongdouble_wrapper const [] Bx, long long [] Cp, long long [] Ci, npy_clongdouble_wrapper [] Cx)
+    """
+    return _csc.csc_eldiv_csc(*args)
 
 def csc_plus_csc(*args):
-  """
-    csc_plus_csc(int n_row, int n_col, int Ap, int Ai, signed char Ax, 
-        int Bp, int Bi, signed char Bx, int Cp, int Ci, 
-        signed char Cx)
-    csc_plus_csc(int n_row, int n_col, int Ap, int Ai, unsigned char Ax, 
-        int Bp, int Bi, unsigned char Bx, int Cp, 
-        int Ci, unsigned char Cx)
-    csc_plus_csc(int n_row, int n_col, int Ap, int Ai, short Ax, int Bp, 
-        int Bi, short Bx, int Cp, int Ci, short Cx)
-    csc_plus_csc(int n_row, int n_col, int Ap, int Ai, unsigned short Ax, 
-        int Bp, int Bi, unsigned short Bx, int Cp, 
-        int Ci, unsigned short Cx)
-    csc_plus_csc(int n_row, int n_col, int Ap, int Ai, int Ax, int Bp, 
-        int Bi, int Bx, int Cp, int Ci, int Cx)
-    csc_plus_csc(int n_row, int n_col, int Ap, int Ai, unsigned int Ax, 
-        int Bp, int Bi, unsigned int Bx, int Cp, 
-        int Ci, unsigned int Cx)
-    csc_plus_csc(int n_row, int n_col, int Ap, int Ai, long long Ax, 
-        int Bp, int Bi, long long Bx, int Cp, int Ci, 
-        long long Cx)
-    csc_plus_csc(int n_row, int n_col, int Ap, int Ai, unsigned long long Ax, 
-        int Bp, int Bi, unsigned long long Bx, 
-        int Cp, int Ci, unsigned long long Cx)
-    csc_plus_csc(int n_row, int n_col, int Ap, int Ai, float Ax, int Bp, 
-        int Bi, float Bx, int Cp, int Ci, float Cx)
-    csc_plus_csc(int n_row, int n_col, int Ap, int Ai, double Ax, int Bp, 
-        int Bi, double Bx, int Cp, int Ci, double Cx)
-    csc_plus_csc(int n_row, int n_col, int Ap, int Ai, long double Ax, 
-        int Bp, int Bi, long double Bx, int Cp, int Ci, 
-        long double Cx)
-    csc_plus_csc(int n_row, int n_col, int Ap, int Ai, npy_cfloat_wrapper Ax, 
-        int Bp, int Bi, npy_cfloat_wrapper Bx, 
-        int Cp, int Ci, npy_cfloat_wrapper Cx)
-    csc_plus_csc(int n_row, int n_col, int Ap, int Ai, npy_cdouble_wrapper Ax, 
-        int Bp, int Bi, npy_cdouble_wrapper Bx, 
-        int Cp, int Ci, npy_cdouble_wrapper Cx)
-    csc_plus_csc(int n_row, int n_col, int Ap, int Ai, npy_clongdouble_wrapper Ax, 
-        int Bp, int Bi, npy_clongdouble_wrapper Bx, 
-        int Cp, int Ci, npy_clongdouble_wrapper Cx)
     """
-  return _csc.csc_plus_csc(*args)
+    csc_plus_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, signed char const [] Ax, int const [] Bp, int const [] Bi, signed char const [] Bx, int [] Cp, int [] Ci, signed char [] Cx)
+    csc_plus_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, unsigned char const [] Ax, int const [] Bp, int const [] Bi, unsigned char const [] Bx, int [] Cp, int [] Ci, unsigned char [] Cx)
+    csc_plus_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, short const [] Ax, int const [] Bp, int const [] Bi, short const [] Bx, int [] Cp, int [] Ci, short [] Cx)
+    csc_plus_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, unsigned short const [] Ax, int const [] Bp, int const [] Bi, unsigned short const [] Bx, int [] Cp, int [] Ci, unsigned short [] Cx)
+    csc_plus_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, int const [] Ax, int const [] Bp, int const [] Bi, int const [] Bx, int [] Cp, int [] Ci, int [] Cx)
+    csc_plus_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, unsigned int const [] Ax, int const [] Bp, int const [] Bi, unsigned int const [] Bx, int [] Cp, int [] Ci, unsigned int [] Cx)
+    csc_plus_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, long long const [] Ax, int const [] Bp, int const [] Bi, long long const [] Bx, int [] Cp, int [] Ci, long long [] Cx)
+    csc_plus_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, unsigned long long const [] Ax, int const [] Bp, int const [] Bi, unsigned long long const [] Bx, int [] Cp, int [] Ci, unsigned long long [] Cx)
+    csc_plus_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, float const [] Ax, int const [] Bp, int const [] Bi, float const [] Bx, int [] Cp, int [] Ci, float [] Cx)
+    csc_plus_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, double const [] Ax, int const [] Bp, int const [] Bi, double const [] Bx, int [] Cp, int [] Ci, double [] Cx)
+    csc_plus_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, long double const [] Ax, int const [] Bp, int const [] Bi, long double const [] Bx, int [] Cp, int [] Ci, long double [] Cx)
+    csc_plus_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, npy_cfloat_wrapper const [] Ax, int const [] Bp, int const [] Bi, npy_cfloat_wrapper const [] Bx, int [] Cp, int [] Ci, npy_cfloat_wrapper [] Cx)
+    csc_plus_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, npy_cdouble_wrapper const [] Ax, int const [] Bp, int const [] Bi, npy_cdouble_wrapper const [] Bx, int [] Cp, int [] Ci, npy_cdouble_wrapper [] Cx)
+    csc_plus_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, npy_clongdouble_wrapper const [] Ax, int const [] Bp, int const [] Bi, npy_clongdouble_wrapper const [] Bx, int [] Cp, int [] Ci, npy_clongdouble_wrapper [] Cx)
+    csc_plus_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, signed char const [] Ax, long long const [] Bp, long long const [] Bi, signed char const [] Bx, long long [] Cp, long long [] Ci, signed char [] Cx)
+    csc_plus_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, unsigned char const [] Ax, long long const [] Bp, long long const [] Bi, unsigned char const [] Bx, long long [] Cp, long long [] Ci, unsigned char [] Cx)
+    csc_plus_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, short const [] Ax, long long const [] Bp, long long const [] Bi, short const [] Bx, long long [] Cp, long long [] Ci, short [] Cx)
+    csc_plus_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, unsigned short const [] Ax, long long const [] Bp, long long const [] Bi, unsigned short const [] Bx, long long [] Cp, long long [] Ci, unsigned short [] Cx)
+    csc_plus_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, int const [] Ax, long long const [] Bp, long long const [] Bi, int const [] Bx, long long [] Cp, long long [] Ci, int [] Cx)
+    csc_plus_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, unsigned int const [] Ax, long long const [] Bp, long long const [] Bi, unsigned int const [] Bx, long long [] Cp, long long [] Ci, unsigned int [] Cx)
+    csc_plus_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, long long const [] Ax, long long const [] Bp, long long const [] Bi, long long const [] Bx, long long [] Cp, long long [] Ci, long long [] Cx)
+    csc_plus_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, unsigned long long const [] Ax, long long const [] Bp, long long const [] Bi, unsigned long long const [] Bx, long long [] Cp, long long [] Ci, unsigned long long [] Cx)
+    csc_plus_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, float const [] Ax, long long const [] Bp, long long const [] Bi, float const [] Bx, long long [] Cp, long long [] Ci, float [] Cx)
+    csc_plus_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, double const [] Ax, long long const [] Bp, long long const [] Bi, double const [] Bx, long long [] Cp, long long [] Ci, double [] Cx)
+    csc_plus_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, long double const [] Ax, long long const [] Bp, long long const [] Bi, long double const [] Bx, long long [] Cp, long long [] Ci, long double [] Cx)
+    csc_plus_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, npy_cfloat_wrapper const [] Ax, long long const [] Bp, long long const [] Bi, npy_cfloat_wrapper const [] Bx, long long [] Cp, long long [] Ci, npy_cfloat_wrapper [] Cx)
+    csc_plus_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, npy_cdouble_wrapper const [] Ax, long long const [] Bp, long long const [] Bi, npy_cdouble_wrapper const [] Bx, long long [] Cp, long long [] Ci, npy_cdouble_wrapper [] Cx)
+    csc_plus_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, npy_clongdouble_wrapper const [] Ax, long long const [] Bp, long long const [] Bi, npy_clongdouble_wrapper const [] Bx, long long [] Cp, long long [] Ci, npy_clongdouble_wrapper [] Cx)
+    """
+    return _csc.csc_plus_csc(*args)
 
 def csc_minus_csc(*args):
-  """
-    csc_minus_csc(int n_row, int n_col, int Ap, int Ai, signed char Ax, 
-        int Bp, int Bi, signed char Bx, int Cp, int Ci, 
-        signed char Cx)
-    csc_minus_csc(int n_row, int n_col, int Ap, int Ai, unsigned char Ax, 
-        int Bp, int Bi, unsigned char Bx, int Cp, 
-        int Ci, unsigned char Cx)
-    csc_minus_csc(int n_row, int n_col, int Ap, int Ai, short Ax, int Bp, 
-        int Bi, short Bx, int Cp, int Ci, short Cx)
-    csc_minus_csc(int n_row, int n_col, int Ap, int Ai, unsigned short Ax, 
-        int Bp, int Bi, unsigned short Bx, int Cp, 
-        int Ci, unsigned short Cx)
-    csc_minus_csc(int n_row, int n_col, int Ap, int Ai, int Ax, int Bp, 
-        int Bi, int Bx, int Cp, int Ci, int Cx)
-    csc_minus_csc(int n_row, int n_col, int Ap, int Ai, unsigned int Ax, 
-        int Bp, int Bi, unsigned int Bx, int Cp, 
-        int Ci, unsigned int Cx)
-    csc_minus_csc(int n_row, int n_col, int Ap, int Ai, long long Ax, 
-        int Bp, int Bi, long long Bx, int Cp, int Ci, 
-        long long Cx)
-    csc_minus_csc(int n_row, int n_col, int Ap, int Ai, unsigned long long Ax, 
-        int Bp, int Bi, unsigned long long Bx, 
-        int Cp, int Ci, unsigned long long Cx)
-    csc_minus_csc(int n_row, int n_col, int Ap, int Ai, float Ax, int Bp, 
-        int Bi, float Bx, int Cp, int Ci, float Cx)
-    csc_minus_csc(int n_row, int n_col, int Ap, int Ai, double Ax, int Bp, 
-        int Bi, double Bx, int Cp, int Ci, double Cx)
-    csc_minus_csc(int n_row, int n_col, int Ap, int Ai, long double Ax, 
-        int Bp, int Bi, long double Bx, int Cp, int Ci, 
-        long double Cx)
-    csc_minus_csc(int n_row, int n_col, int Ap, int Ai, npy_cfloat_wrapper Ax, 
-        int Bp, int Bi, npy_cfloat_wrapper Bx, 
-        int Cp, int Ci, npy_cfloat_wrapper Cx)
-    csc_minus_csc(int n_row, int n_col, int Ap, int Ai, npy_cdouble_wrapper Ax, 
-        int Bp, int Bi, npy_cdouble_wrapper Bx, 
-        int Cp, int Ci, npy_cdouble_wrapper Cx)
-    csc_minus_csc(int n_row, int n_col, int Ap, int Ai, npy_clongdouble_wrapper Ax, 
-        int Bp, int Bi, npy_clongdouble_wrapper Bx, 
-        int Cp, int Ci, npy_clongdouble_wrapper Cx)
     """
-  return _csc.csc_minus_csc(*args)
+    csc_minus_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, signed char const [] Ax, int const [] Bp, int const [] Bi, signed char const [] Bx, int [] Cp, int [] Ci, signed char [] Cx)
+    csc_minus_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, unsigned char const [] Ax, int const [] Bp, int const [] Bi, unsigned char const [] Bx, int [] Cp, int [] Ci, unsigned char [] Cx)
+    csc_minus_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, short const [] Ax, int const [] Bp, int const [] Bi, short const [] Bx, int [] Cp, int [] Ci, short [] Cx)
+    csc_minus_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, unsigned short const [] Ax, int const [] Bp, int const [] Bi, unsigned short const [] Bx, int [] Cp, int [] Ci, unsigned short [] Cx)
+    csc_minus_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, int const [] Ax, int const [] Bp, int const [] Bi, int const [] Bx, int [] Cp, int [] Ci, int [] Cx)
+    csc_minus_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, unsigned int const [] Ax, int const [] Bp, int const [] Bi, unsigned int const [] Bx, int [] Cp, int [] Ci, unsigned int [] Cx)
+    csc_minus_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, long long const [] Ax, int const [] Bp, int const [] Bi, long long const [] Bx, int [] Cp, int [] Ci, long long [] Cx)
+    csc_minus_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, unsigned long long const [] Ax, int const [] Bp, int const [] Bi, unsigned long long const [] Bx, int [] Cp, int [] Ci, unsigned long long [] Cx)
+    csc_minus_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, float const [] Ax, int const [] Bp, int const [] Bi, float const [] Bx, int [] Cp, int [] Ci, float [] Cx)
+    csc_minus_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, double const [] Ax, int const [] Bp, int const [] Bi, double const [] Bx, int [] Cp, int [] Ci, double [] Cx)
+    csc_minus_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, long double const [] Ax, int const [] Bp, int const [] Bi, long double const [] Bx, int [] Cp, int [] Ci, long double [] Cx)
+    csc_minus_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, npy_cfloat_wrapper const [] Ax, int const [] Bp, int const [] Bi, npy_cfloat_wrapper const [] Bx, int [] Cp, int [] Ci, npy_cfloat_wrapper [] Cx)
+    csc_minus_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, npy_cdouble_wrapper const [] Ax, int const [] Bp, int const [] Bi, npy_cdouble_wrapper const [] Bx, int [] Cp, int [] Ci, npy_cdouble_wrapper [] Cx)
+    csc_minus_csc(int const n_row, int const n_col, int const [] Ap, int const [] Ai, npy_clongdouble_wrapper const [] Ax, int const [] Bp, int const [] Bi, npy_clongdouble_wrapper const [] Bx, int [] Cp, int [] Ci, npy_clongdouble_wrapper [] Cx)
+    csc_minus_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, signed char const [] Ax, long long const [] Bp, long long const [] Bi, signed char const [] Bx, long long [] Cp, long long [] Ci, signed char [] Cx)
+    csc_minus_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, unsigned char const [] Ax, long long const [] Bp, long long const [] Bi, unsigned char const [] Bx, long long [] Cp, long long [] Ci, unsigned char [] Cx)
+    csc_minus_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, short const [] Ax, long long const [] Bp, long long const [] Bi, short const [] Bx, long long [] Cp, long long [] Ci, short [] Cx)
+    csc_minus_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, unsigned short const [] Ax, long long const [] Bp, long long const [] Bi, unsigned short const [] Bx, long long [] Cp, long long [] Ci, unsigned short [] Cx)
+    csc_minus_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, int const [] Ax, long long const [] Bp, long long const [] Bi, int const [] Bx, long long [] Cp, long long [] Ci, int [] Cx)
+    csc_minus_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, unsigned int const [] Ax, long long const [] Bp, long long const [] Bi, unsigned int const [] Bx, long long [] Cp, long long [] Ci, unsigned int [] Cx)
+    csc_minus_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, long long const [] Ax, long long const [] Bp, long long const [] Bi, long long const [] Bx, long long [] Cp, long long [] Ci, long long [] Cx)
+    csc_minus_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, unsigned long long const [] Ax, long long const [] Bp, long long const [] Bi, unsigned long long const [] Bx, long long [] Cp, long long [] Ci, unsigned long long [] Cx)
+    csc_minus_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, float const [] Ax, long long const [] Bp, long long const [] Bi, float const [] Bx, long long [] Cp, long long [] Ci, float [] Cx)
+    csc_minus_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, double const [] Ax, long long const [] Bp, long long const [] Bi, double const [] Bx, long long [] Cp, long long [] Ci, double [] Cx)
+    csc_minus_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, long double const [] Ax, long long const [] Bp, long long const [] Bi, long double const [] Bx, long long [] Cp, long long [] Ci, long double [] Cx)
+    csc_minus_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, npy_cfloat_wrapper const [] Ax, long long const [] Bp, long long const [] Bi, npy_cfloat_wrapper const [] Bx, long long [] Cp, long long [] Ci, npy_cfloat_wrapper [] Cx)
+    csc_minus_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, npy_cdouble_wrapper const [] Ax, long long const [] Bp, long long const [] Bi, npy_cdouble_wrapper const [] Bx, long long [] Cp, long long [] Ci, npy_cdouble_wrapper [] Cx)
+    csc_minus_csc(long long const n_row, long long const n_col, long long const [] Ap, long long const [] Ai, npy_clongdouble_wrapper const [] Ax, long long const [] Bp, long long const [] Bi, npy_clongdouble_wrapper const [] Bx, long long [] Cp, long long [] Ci, npy_clongdouble_wrapper [] Cx)
+    """
+    return _csc.csc_minus_csc(*args)
+# This file is compatible with both classic and new-style classes.
+
 
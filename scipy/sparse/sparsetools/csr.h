@@ -618,6 +618,83 @@ void csr_matmat_pass2(const I n_row,
 }
 
 
+/*
+ * Compute the entries of the matrix product A * B that lie in the
+ * sparsity pattern (Cp, Cj) of a CSR matrix C, multiplied by the values
+ * Xx of C:
+ *
+ *   Yx[jj] = (A*B)(i, Cj[jj]) * Xx[jj]   for Cp[i] <= jj < Cp[i+1]
+ *
+ * Input Arguments:
+ *   I  n_row         - number of rows in A (and C)
+ *   I  n_col         - number of columns in B (and C)
+ *   I  Ap[n_row+1]   - row pointer of A
+ *   I  Aj[nnz(A)]    - column indices of A
+ *   T  Ax[nnz(A)]    - nonzeros of A
+ *   I  Bp[?]         - row pointer of B
+ *   I  Bj[nnz(B)]    - column indices of B
+ *   T  Bx[nnz(B)]    - nonzeros of B
+ *   I  Cp[n_row+1]   - row pointer of C
+ *   I  Cj[nnz(C)]    - column indices of C
+ *   T  Xx[nnz(C)]    - nonzeros of C
+ * Output Arguments:
+ *   T  Yx[nnz(C)]    - values of the product in the pattern of C
+ *
+ * Note:
+ *   Output array Yx must be preallocated
+ *
+ *   Only the entries Yx[Cp[0]:Cp[n_row]] are written, so the product
+ *   can be computed for a block of rows by passing slices of Ap and Cp.
+ *
+ *   Duplicate entries of C each receive the full product, so summing
+ *   them gives the product times the sum of their values.
+ *
+ *   Complexity: Linear.  Specifically O(nnz(C) + n_col) plus the number
+ *   of multiply-adds of the full product A * B, which are only
+ *   accumulated where C has entries.
+ *
+ */
+template <class I, class T>
+void csr_matmat_masked(const I n_row,
+                       const I n_col,
+                       const I Ap[],
+                       const I Aj[],
+                       const T Ax[],
+                       const I Bp[],
+                       const I Bj[],
+                       const T Bx[],
+                       const I Cp[],
+                       const I Cj[],
+                       const T Xx[],
+                             T Yx[])
+{
+    std::vector<I> mark(n_col, -1);
+    std::vector<T> sums(n_col, 0);
+
+    for(I i = 0; i < n_row; i++){
+        for(I jj = Cp[i]; jj < Cp[i+1]; jj++){
+            mark[Cj[jj]] = i;
+            sums[Cj[jj]] = 0;
+        }
+
+        for(I jj = Ap[i]; jj < Ap[i+1]; jj++){
+            I j = Aj[jj];
+            T v = Ax[jj];
+            for(I kk = Bp[j]; kk < Bp[j+1]; kk++){
+                I k = Bj[kk];
+                if(mark[k] == i){
+                    sums[k] += v*Bx[kk];
+                }
+            }
+        }
+
+        for(I jj = Cp[i]; jj < Cp[i+1]; jj++){
+            Yx[jj] = sums[Cj[jj]] * Xx[jj];
+        }
+    }
+}
+
+
 /*
  * Compute C = A (binary_op) B for CSR matrices that are not
  * necessarily canonical CSR format.  Specifically, this method
@@ -6,6 +6,40 @@
 #include "csr.h"
 %}
 
+/*
+ * The matrix-vector and matrix-matrix products do not touch Python objects, so they
+ * release the GIL and can be run on row blocks in parallel threads.
+ */
+%exception csr_matvec {
+    Py_BEGIN_ALLOW_THREADS
+    $action
+    Py_END_ALLOW_THREADS
+}
+
+%exception csr_matvecs {
+    Py_BEGIN_ALLOW_THREADS
+    $action
+    Py_END_ALLOW_THREADS
+}
+
+%exception csr_matmat_pass1 {
+    Py_BEGIN_ALLOW_THREADS
+    $action
+    Py_END_ALLOW_THREADS
+}
+
+%exception csr_matmat_pass2 {
+    Py_BEGIN_ALLOW_THREADS
+    $action
+    Py_END_ALLOW_THREADS
+}
+
+%exception csr_matmat_masked {
+    Py_BEGIN_ALLOW_THREADS
+    $action
+    Py_END_ALLOW_THREADS
+}
+
 %include "csr.h" 
 
 
@@ -20,6 +54,7 @@ INSTANTIATE_ALL(csr_scale_columns)
 INSTANTIATE_ALL(csr_tocsc)
 INSTANTIATE_ALL(csr_tobsr)
 INSTANTIATE_ALL(csr_matmat_pass2)
+INSTANTIATE_ALL(csr_matmat_masked)
 INSTANTIATE_ALL(csr_matvec)
 INSTANTIATE_ALL(csr_matvecs)
 INSTANTIATE_ALL(csr_elmul_csr)
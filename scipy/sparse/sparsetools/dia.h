@@ -39,8 +39,8 @@ void dia_matvec(const I n_row,
     for(I i = 0; i < n_diags; i++){
         const I k = offsets[i];  //diagonal offset
 
-        const I i_start = std::max(0,-k);
-        const I j_start = std::max(0, k);
+        const I i_start = std::max<I>(0,-k);
+        const I j_start = std::max<I>(0, k);
         const I j_end   = std::min(std::min(n_row + k, n_col),L);
 
         const I N = j_end - j_start;  //number of elements to process
@@ -145,6 +145,7 @@ T_INPLACE_ARRAY2( ctype )
  * Create all desired index and data types here
  */
 DECLARE_INDEX_TYPE( int       )
+DECLARE_INDEX_TYPE( long long )
 
 DECLARE_DATA_TYPE( signed char             )
 DECLARE_DATA_TYPE( unsigned char           )
@@ -187,13 +188,28 @@ DECLARE_DATA_TYPE( npy_clongdouble_wrapper )
 %template(f_name)   f_name<int,npy_cfloat_wrapper>;
 %template(f_name)   f_name<int,npy_cdouble_wrapper>;
 %template(f_name)   f_name<int,npy_clongdouble_wrapper>;
-/* 64-bit indices would go here */
+/* 64-bit indices */
+%template(f_name)   f_name<long long,signed char>;
+%template(f_name)   f_name<long long,unsigned char>;
+%template(f_name)   f_name<long long,short>;
+%template(f_name)   f_name<long long,unsigned short>;
+%template(f_name)   f_name<long long,int>;
+%template(f_name)   f_name<long long,unsigned int>;
+%template(f_name)   f_name<long long,long long>;
+%template(f_name)   f_name<long long,unsigned long long>;
+%template(f_name)   f_name<long long,float>;
+%template(f_name)   f_name<long long,double>;
+%template(f_name)   f_name<long long,long double>;
+%template(f_name)   f_name<long long,npy_cfloat_wrapper>;
+%template(f_name)   f_name<long long,npy_cdouble_wrapper>;
+%template(f_name)   f_name<long long,npy_clongdouble_wrapper>;
 %enddef
 
 
 %define INSTANTIATE_INDEX( f_name )
 /* 32-bit indices */
 %template(f_name)   f_name<int>;
-/* 64-bit indices would go here */
+/* 64-bit indices */
+%template(f_name)   f_name<long long>;
 %enddef
 
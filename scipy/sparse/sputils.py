@@ -1,11 +1,13 @@
 """ Utility functions for sparse matrix module
 """
 
-__all__ = ['upcast','getdtype','isscalarlike','isintlike',
+__all__ = ['upcast','getdtype','get_index_dtype','isscalarlike','isintlike',
             'isshape','issequence','isdense']
 
 import numpy as np
 
+from scipy.lib._threads import cpu_count as _cpu_count
+
 # keep this list syncronized with sparsetools
 #supported_dtypes = ['int8', 'uint8', 'int16', 'uint16', 'int32', 'uint32',
 #        'int64', 'uint64', 'float32', 'float64',
@@ -51,6 +53,25 @@ def to_native(A):
     return np.asarray(A,dtype=A.dtype.newbyteorder('native'))
 
 
+# Largest index or index pointer value held in 32-bit (C int) index
+# arrays; matrices that need larger values use 64-bit indices.
+_max_intc_index = int(np.iinfo(np.intc).max)
+
+def get_index_dtype(arrays=(), maxval=None):
+    """Return the index data type (np.intc or np.int64) to use with
+    sparsetools.
+
+    64-bit indices are used if one of the index arrays in `arrays` already
+    has them, or if `maxval`, the largest dimension, index or index
+    pointer value to be stored, does not fit into a C int.
+    """
+    if maxval is not None and maxval > _max_intc_index:
+        return np.int64
+    for arr in arrays:
+        if np.asarray(arr).dtype.itemsize > np.dtype(np.intc).itemsize:
+            return np.int64
+    return np.intc
+
 def getdtype(dtype, a=None, default=None):
     """Function used to simplify argument processing.  If 'dtype' is not
     specified (is None), returns a.dtype; otherwise returns a np.dtype
@@ -123,3 +144,51 @@ def _isinstance(x, _class):
 
 def isdense(x):
     return _isinstance(x, np.ndarray)
+
+# Number of threads used by the parallel kernels; None means one per CPU.
+_num_threads = None
+
+# Minimum number of stored entries per thread for a kernel to be split.
+_min_nnz_per_thread = 1 << 15
+
+def _threads_for(nnz):
+    """Number of threads to process nnz stored entries with."""
+    n_threads = _num_threads
+    if n_threads is None:
+        n_threads = _cpu_count()
+    return max(1, min(n_threads, nnz // _min_nnz_per_thread))
+
+def _nnz_partition(indptr, n_parts):
+    """Split the rows of a compressed matrix into contiguous ranges.
+
+    Returns a list of at most n_parts ``(start, stop)`` row ranges which
+    hold about the same number of stored entries.
+    """
+    indptr = np.asarray(indptr)
+    n_rows = len(indptr) - 1
+    targets = (int(indptr[-1]) * np.arange(1, n_parts)) // n_parts
+    cuts = np.searchsorted(indptr, targets)
+    bounds = [int(b) for b in np.unique(np.concatenate(([0], cuts, [n_rows])))]
+    return zip(bounds[:-1], bounds[1:])
+
+def _run_threads(func, ranges):
+    """Call func(start, stop) for every range, each in its own thread.
+
+    func should spend its time in code that releases the GIL.  The first
+    exception raised by a call is re-raised.
+    """
+    import threading
+    errors = []
+    def run(start, stop):
+        try:
+            func(start, stop)
+        except Exception, e:
+            errors.append(e)
+    threads = [threading.Thread(target=run, args=r) for r in ranges[1:]]
+    for t in threads:
+        t.start()
+    run(*ranges[0])
+    for t in threads:
+        t.join()
+    if errors:
+        raise errors[0]
@@ -14,6 +14,8 @@ Run tests if sparse is not installed:
 """
 
 import warnings
+import os
+import tempfile
 
 import numpy as np
 from numpy import arange, zeros, array, dot, matrix, asmatrix, asarray, \
@@ -29,6 +31,7 @@ import scipy.sparse as sparse
 from scipy.sparse import csc_matrix, csr_matrix, dok_matrix, \
         coo_matrix, lil_matrix, dia_matrix, bsr_matrix, \
         eye, isspmatrix, SparseEfficiencyWarning
+from scipy.sparse import sputils
 from scipy.sparse.sputils import supported_dtypes
 from scipy.sparse.linalg import splu
 
@@ -1086,6 +1089,63 @@ class TestCSR(_TestCommon, _TestGetSet, _TestSolve,
         bsp = csr_matrix( (data, indices, indptr), shape=(2,10) )
         assert_equal((asp + bsp).todense(), asp.todense() + bsp.todense())
 
+    def test_threaded_matvec(self):
+        np.random.seed(1234)
+        A = sparse.rand(300, 200, density=0.1, format='csr')
+        A.data[:] = np.random.randn(A.nnz)
+        # rows of very different lengths
+        A = sparse.vstack([A, sparse.rand(5, 200, density=0.9)]).tocsr()
+        x = np.random.randn(200)
+        X = np.random.randn(200, 3)
+        x32 = x.astype(np.float32)
+        y, Y, y32 = A * x, A * X, A * x32
+        old_threads = sputils._num_threads
+        old_min_nnz = sputils._min_nnz_per_thread
+        try:
+            sputils._min_nnz_per_thread = 100
+            for n_threads in [2, 3, 7]:
+                sputils._num_threads = n_threads
+                assert_array_equal(A * x, y)
+                assert_array_equal(A * X, Y)
+                assert_array_equal(A * x32, y32)
+                assert_array_equal((1j * A) * x, 1j * y)
+        finally:
+            sputils._num_threads = old_threads
+            sputils._min_nnz_per_thread = old_min_nnz
+
+    def test_threaded_matmat(self):
+        np.random.seed(1234)
+        A = sparse.rand(300, 200, density=0.05, format='csr')
+        A.data[:] = np.random.randn(A.nnz)
+        A = sparse.vstack([A, sparse.rand(5, 200, density=0.9)]).tocsr()
+        B = sparse.rand(200, 150, density=0.05, format='csr')
+        B.data[:] = np.random.randn(B.nnz)
+        # rows whose entries cancel leave gaps between the blocks
+        C = csr_matrix(np.array([[1., 1.], [1., -1.]]))
+        C = sparse.kron(sparse.identity(100), C).tocsr()
+        D = csr_matrix(np.array([[1., 1.], [1., 1.]]))
+        D = sparse.kron(sparse.identity(100), D).tocsr()
+        products = [(A, B), (A, 1j * B), (A.tocsc(), B.tocsc()), (A, A.T),
+                    (C, D)]
+        expected = [(P * Q).todense() for P, Q in products]
+        old_threads = sputils._num_threads
+        old_min_nnz = sputils._min_nnz_per_thread
+        try:
+            sputils._min_nnz_per_thread = 100
+            for n_threads in [2, 3, 7]:
+                sputils._num_threads = n_threads
+                for (P, Q), R in zip(products, expected):
+                    PQ = P * Q
+                    assert_equal(PQ.format, P.format)
+                    PQ.check_format(full_check=True)
+                    assert_array_equal(PQ.todense(), R)
+                    assert_array_almost_equal(PQ.todense(),
+                                              P.todense() * Q.todense())
+                assert_equal((C * D).nnz, 200)
+        finally:
+            sputils._num_threads = old_threads
+            sputils._min_nnz_per_thread = old_min_nnz
+
 
 
 
@@ -1636,5 +1696,214 @@ class TestBSR(_TestCommon, _TestArithmetic, _TestInplaceArithmetic, TestCase):
         assert_equal(A*x, A.todense()*x)
 
 
+class TestCompressedFile(TestCase):
+    def setUp(self):
+        np.random.seed(1234)
+        D = np.random.rand(30, 20)
+        D[D < 0.7] = 0
+        self.D = D
+        fd, self.filename = tempfile.mkstemp(suffix='.spmatrix')
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def test_save_load(self):
+        for cls in [csr_matrix, csc_matrix]:
+            for dtype in [np.float64, np.complex64, np.int8]:
+                A = cls(self.D.astype(dtype))
+                A.save(self.filename)
+                for mmap_mode in ['r', 'c', None]:
+                    B = cls.load(self.filename, mmap_mode=mmap_mode)
+                    assert_equal(B.format, A.format)
+                    assert_equal(B.dtype, A.dtype)
+                    assert_equal(B.shape, A.shape)
+                    assert_array_equal(B.indptr, A.indptr)
+                    assert_array_equal(B.indices, A.indices)
+                    assert_array_equal(B.todense(), A.todense())
+                    del B
+
+    def test_memmap(self):
+        A = csr_matrix(self.D)
+        A.save(self.filename)
+        B = csr_matrix.load(self.filename)
+        # the arrays of the matrix are views of the file
+        for arr in [B.indptr, B.indices, B.data]:
+            base = arr
+            while base is not None and not isinstance(base, np.memmap):
+                base = base.base
+            assert_(isinstance(base, np.memmap))
+        x = np.random.rand(20)
+        assert_array_equal(B * x, A * x)
+        assert_array_equal(B[3:17].todense(), self.D[3:17])
+        assert_array_equal(B[5, :].todense(), self.D[5:6])
+        assert_array_equal(B.T * np.ones(30), self.D.sum(axis=0))
+        del B, arr, base
+
+        # writes through mode 'r+' end up in the file
+        B = csr_matrix.load(self.filename, mmap_mode='r+')
+        B.data *= 2
+        del B
+        assert_array_equal(csr_matrix.load(self.filename).todense(),
+                           2 * self.D)
+
+    def test_in_place_methods(self):
+        # an explicit zero and an unsorted duplicate in row 0
+        A = csr_matrix((np.array([0., 1, 2, 3]), np.array([2, 1, 0, 1]),
+                        np.array([0, 3, 4])), shape=(2, 3))
+        A.save(self.filename)
+        B = csr_matrix.load(self.filename)
+        for method in [B.eliminate_zeros, B.sum_duplicates, B.sort_indices]:
+            assert_raises(ValueError, method)
+        assert_array_equal(B.indices, A.indices)
+        del B
+
+        for mmap_mode in ['c', None]:
+            B = csr_matrix.load(self.filename, mmap_mode=mmap_mode)
+            B.eliminate_zeros()
+            B.sum_duplicates()
+            assert_array_equal(B.indices, [0, 1, 1])
+            assert_array_equal(B.data, [2, 1, 3])
+            del B
+        # copy-on-write mappings leave the file alone
+        assert_array_equal(csr_matrix.load(self.filename).indices,
+                           A.indices)
+
+    def test_unpruned(self):
+        # only the stored entries are written
+        A = csr_matrix(self.D)
+        A = csr_matrix((np.r_[A.data, 1, 2], np.r_[A.indices, 0, 0],
+                        A.indptr), shape=A.shape)
+        A.save(self.filename)
+        B = csr_matrix.load(self.filename, mmap_mode=None)
+        assert_equal(len(B.data), A.nnz)
+        assert_array_equal(B.todense(), self.D)
+
+    def test_memmap_constructor(self):
+        # building a matrix from memory-mapped arrays does not copy them
+        A = csr_matrix(self.D)
+        # the three arrays lie one after the other in the same file
+        arrays = []
+        offset = 0
+        mode = 'w+'
+        for arr in [A.data, A.indices, A.indptr]:
+            mm = np.memmap(self.filename, dtype=arr.dtype, mode=mode,
+                           shape=arr.shape, offset=offset)
+            mm[:] = arr
+            arrays.append(mm)
+            offset += arr.nbytes
+            mode = 'r+'
+        B = csr_matrix(tuple(arrays), shape=A.shape)
+        for arr, mm in zip([B.data, B.indices, B.indptr], arrays):
+            assert_(np.may_share_memory(arr, mm))
+        assert_array_equal(B.todense(), self.D)
+
+        # but warns when it has to
+        filters = warnings.filters[:]
+        try:
+            warnings.simplefilter('error', SparseEfficiencyWarning)
+            assert_raises(SparseEfficiencyWarning, csr_matrix,
+                          tuple(arrays), shape=A.shape, dtype=np.float32)
+        finally:
+            warnings.filters[:] = filters
+        del arrays, mm, B
+
+    def test_version(self):
+        # files of another format version are rejected, not misread
+        csr_matrix(self.D).save(self.filename)
+        f = open(self.filename, 'r+b')
+        f.seek(8)
+        f.write(np.array([1], dtype='<i8').tostring())
+        f.close()
+        try:
+            csr_matrix.load(self.filename)
+        except ValueError, e:
+            assert_('version 1' in str(e), str(e))
+        else:
+            raise AssertionError('version 1 file was accepted')
+
+    def test_bad_file(self):
+        f = open(self.filename, 'wb')
+        f.write(np.array([1, 2, 3]).tostring())
+        f.close()
+        assert_raises(ValueError, csr_matrix.load, self.filename)
+        csr_matrix(self.D).save(self.filename)
+        assert_raises(ValueError, csc_matrix.load, self.filename)
+
+
+class _With64BitIndices(object):
+    """run the tests of a format with 64-bit indices, by pretending that
+    every index pointer and every dimension overflows a C int"""
+
+    def setUp(self):
+        self._max_intc_index = sputils._max_intc_index
+        sputils._max_intc_index = 0
+        super(_With64BitIndices, self).setUp()
+
+    def tearDown(self):
+        sputils._max_intc_index = self._max_intc_index
+        super(_With64BitIndices, self).tearDown()
+
+
+class TestCSR64(_With64BitIndices, TestCSR):
+    def test_index_dtype(self):
+        assert_equal(self.datsp.indices.dtype, np.int64)
+        assert_equal(self.datsp.indptr.dtype, np.int64)
+        for B in [self.datsp * self.datsp.T, self.datsp + self.datsp,
+                  self.datsp.tocsc(), self.datsp[1:, 2:]]:
+            assert_equal(B.indices.dtype, np.int64)
+
+    def test_save_load(self):
+        fd, filename = tempfile.mkstemp(suffix='.spmatrix')
+        os.close(fd)
+        try:
+            self.datsp.save(filename)
+            B = csr_matrix.load(filename)
+            assert_equal(B.indices.dtype, np.int64)
+            assert_array_equal(B.todense(), self.dat)
+            del B
+        finally:
+            os.remove(filename)
+
+
+class TestCSC64(_With64BitIndices, TestCSC):
+    def test_index_dtype(self):
+        assert_equal(self.datsp.indices.dtype, np.int64)
+        assert_equal(self.datsp.tocsr().indices.dtype, np.int64)
+
+
+class TestCOO64(_With64BitIndices, TestCOO):
+    def test_index_dtype(self):
+        assert_equal(self.datsp.row.dtype, np.int64)
+        assert_equal(self.datsp.tocsr().indices.dtype, np.int64)
+        assert_equal(self.datsp.tocsc().indices.dtype, np.int64)
+
+
+class TestBSR64(_With64BitIndices, TestBSR):
+    def test_index_dtype(self):
+        assert_equal(self.datsp.indices.dtype, np.int64)
+        assert_equal((self.datsp * self.datsp.T).indices.dtype, np.int64)
+
+
+class TestMixedIndexDtypes(TestCase):
+    def test_binary_ops(self):
+        D = matrix([[1,0,0,2],[3,0,1,0],[0,2,0,0]],'d')
+        A = csr_matrix(D)
+        B = csr_matrix(D)
+        B.indptr = B.indptr.astype(np.int64)
+        B.indices = B.indices.astype(np.int64)
+        assert_equal(A.indices.dtype, np.intc)
+        assert_equal(B.indices.dtype, np.int64)
+        assert_array_equal((A + B).todense(), 2 * D)
+        assert_array_equal((B - A).todense(), 0 * D)
+        assert_array_equal((A * B.T).todense(), D * D.T)
+        assert_array_equal((B.T * A).todense(), D.T * D)
+        assert_array_equal(A.multiply(B).todense(), np.multiply(D, D))
+        # results that fit use 32-bit indices
+        assert_equal((A + B).indices.dtype, np.intc)
+        assert_equal((A * B.T).indices.dtype, np.intc)
+        assert_equal(coo_matrix(D).row.dtype, np.intc)
+
+
 if __name__ == "__main__":
     run_module_suite()
@@ -0,0 +1,110 @@
+"""test incremental assembly with coo_builder"""
+
+import numpy as np
+from numpy.testing import TestCase, run_module_suite, assert_equal, \
+        assert_array_equal, assert_raises, assert_
+
+from scipy.sparse import coo_builder, isspmatrix_csr, isspmatrix_csc, \
+        isspmatrix_coo
+
+
+class TestCooBuilder(TestCase):
+    def test_add(self):
+        B = coo_builder((3, 4))
+        B.add([0, 2, 0], [1, 3, 1], [1., 2., 3.])
+        B.add(1, [0, 1, 2, 3], 5)
+        B.add([], [], [])
+        assert_equal(B.nnz, 7)
+        D = np.array([[0, 4, 0, 0],
+                      [5, 5, 5, 5],
+                      [0, 0, 0, 2.]])
+        A = B.tocsr()
+        assert_(isspmatrix_csr(A))
+        assert_equal(A.nnz, 6)
+        assert_(A.has_sorted_indices)
+        assert_array_equal(A.todense(), D)
+        A = B.tocsc()
+        assert_(isspmatrix_csc(A))
+        assert_equal(A.nnz, 6)
+        assert_array_equal(A.todense(), D)
+        A = B.tocoo()
+        assert_(isspmatrix_coo(A))
+        assert_equal(A.nnz, 7)
+        assert_array_equal(A.todense(), D)
+
+    def test_add_block(self):
+        B = coo_builder((4, 4), dtype=np.int32)
+        B.add_block([0, 2], [1, 3], [[1, 2], [3, 4]])
+        B.add_block([3], [0, 1, 2, 3], [1, 1, 1, 1])
+        assert_equal(B.dtype, np.int32)
+        assert_array_equal(B.tocsr().todense(), [[0, 1, 0, 2],
+                                                 [0, 0, 0, 0],
+                                                 [0, 3, 0, 4],
+                                                 [1, 1, 1, 1]])
+
+    def test_add_blocks(self):
+        # 1-D linear finite elements on a random mesh of [0, 1]
+        np.random.seed(1234)
+        x = np.sort(np.r_[0, np.random.rand(50), 1])
+        h = np.diff(x)
+        elements = np.column_stack([np.arange(51), np.arange(1, 52)])
+        K = np.array([[1, -1], [-1, 1.]]) / h[:, None, None]
+        B = coo_builder((52, 52), nnz_hint=10)
+        B.add_block(elements, elements, K)
+        assert_equal(B.nnz, 51 * 4)
+
+        D = np.zeros((52, 52))
+        for e in range(51):
+            D[np.ix_(elements[e], elements[e])] += K[e]
+        A = B.tocsr()
+        assert_equal(A.nnz, 52 + 2 * 51)
+        assert_array_equal(A.todense(), D)
+
+        # adding one block at a time gives the same matrix
+        B = coo_builder((52, 52))
+        for e in range(51):
+            B.add_block(elements[e], elements[e], K[e])
+        assert_array_equal(B.tocsr().todense(), D)
+        assert_array_equal(B.tocsc().todense(), D)
+
+    def test_random(self):
+        np.random.seed(0)
+        B = coo_builder((30, 20), dtype=complex)
+        D = np.zeros((30, 20), dtype=complex)
+        for k in range(20):
+            n = np.random.randint(0, 50)
+            i = np.random.randint(0, 30, n)
+            j = np.random.randint(0, 20, n)
+            v = np.random.rand(n) + 1j * np.random.rand(n)
+            B.add(i, j, v)
+            for t in range(n):
+                D[i[t], j[t]] += v[t]
+        for A in [B.tocsr(), B.tocsc(), B.tocoo()]:
+            assert_equal(A.dtype, np.complex128)
+            assert_array_equal(A.todense(), D)
+
+    def test_clear(self):
+        B = coo_builder((2, 2))
+        B.add(0, 0, 1)
+        B.clear()
+        assert_equal(B.nnz, 0)
+        assert_equal(B.tocsr().nnz, 0)
+        assert_equal(B.tocsr().shape, (2, 2))
+        B.add(1, 1, 1)
+        assert_array_equal(B.tocsr().todense(), [[0, 0], [0, 1]])
+
+    def test_errors(self):
+        B = coo_builder((3, 4))
+        assert_raises(IndexError, B.add, 3, 0, 1)
+        assert_raises(IndexError, B.add, 0, 4, 1)
+        assert_raises(IndexError, B.add, -1, 0, 1)
+        assert_raises(TypeError, B.add, 0.5, 0, 1)
+        assert_raises(ValueError, B.add, [0, 1], [0, 1, 2], 1)
+        assert_raises(ValueError, B.add_block, [0, 1], [0, 1], np.ones((3, 3)))
+        assert_raises(ValueError, B.add_block, [[0, 1]], [0, 1], np.ones(2))
+        assert_raises(TypeError, coo_builder, 3)
+        assert_equal(B.nnz, 0)
+
+
+if __name__ == "__main__":
+    run_module_suite()
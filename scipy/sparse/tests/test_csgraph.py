@@ -0,0 +1,284 @@
+"""unit tests for the graph algorithms in scipy.sparse.csgraph"""
+
+import numpy as np
+from numpy.testing import TestCase, run_module_suite, assert_, \
+        assert_equal, assert_array_almost_equal, assert_raises
+
+from scipy.sparse import csr_matrix, csc_matrix, coo_matrix, kron, \
+        identity, spdiags
+from scipy.sparse.linalg import splu
+from scipy.sparse import csgraph
+from scipy.sparse.csgraph import shortest_path, dijkstra, bellman_ford, \
+        johnson, floyd_warshall, breadth_first_order, depth_first_order, \
+        minimum_spanning_tree, NegativeCycleError, reverse_cuthill_mckee, \
+        nested_dissection, symmetric_permutation
+
+
+def _dense_shortest_path(M, directed=True):
+    # repeated min-plus relaxation over the dense weight matrix
+    W = np.where(M != 0, M, np.inf)
+    if not directed:
+        W = np.minimum(W, W.T)
+    D = W.copy()
+    D.flat[::len(D) + 1] = np.minimum(D.flat[::len(D) + 1], 0)
+    for k in range(len(D)):
+        D = np.minimum(D, D[:, k:k+1] + D[k:k+1, :])
+    return D
+
+
+def _random_graph(N, density, seed):
+    np.random.seed(seed)
+    return np.random.rand(N, N) * (np.random.rand(N, N) < density) * 10
+
+
+class TestShortestPath(TestCase):
+    methods = ['auto', 'D', 'BF', 'J', 'FW']
+
+    def test_random(self):
+        for seed in range(5):
+            M = _random_graph(30, 0.1, seed)
+            for directed in [True, False]:
+                D = _dense_shortest_path(M, directed)
+                for method in self.methods:
+                    for G in [M, csr_matrix(M), csc_matrix(M)]:
+                        assert_array_almost_equal(
+                            shortest_path(G, method, directed), D)
+
+    def test_predecessors(self):
+        M = _random_graph(25, 0.15, 0)
+        W = np.where(M != 0, M, np.inf)
+        for method in self.methods:
+            dist, pred = shortest_path(M, method, return_predecessors=True)
+            for i in range(len(M)):
+                for j in range(len(M)):
+                    if i == j or np.isinf(dist[i, j]):
+                        assert_equal(pred[i, j], -9999)
+                    else:
+                        k = pred[i, j]
+                        assert_array_almost_equal(dist[i, k] + W[k, j],
+                                                  dist[i, j])
+
+    def test_indices(self):
+        M = _random_graph(20, 0.2, 1)
+        D = _dense_shortest_path(M)
+        for method in self.methods:
+            assert_array_almost_equal(
+                shortest_path(M, method, indices=[3, -1]), D[[3, -1]])
+            assert_array_almost_equal(
+                shortest_path(M, method, indices=3), D[3])
+        assert_raises(ValueError, dijkstra, M, indices=20)
+
+    def test_unweighted(self):
+        M = _random_graph(20, 0.2, 2)
+        D = _dense_shortest_path((M != 0).astype(float), False)
+        for method in self.methods:
+            assert_array_almost_equal(
+                shortest_path(M, method, False, unweighted=True), D)
+
+    def test_explicit_zero_edge(self):
+        G = csr_matrix((np.array([0., 2.]), np.array([1, 2]),
+                        np.array([0, 1, 2, 2])), shape=(3, 3))
+        for method in self.methods:
+            assert_array_almost_equal(shortest_path(G, method)[0],
+                                      [0, 0, 2])
+
+    def test_negative_weights(self):
+        M = np.array([[0, 2, 5],
+                      [0, 0, -1],
+                      [0, 0, 0.]])
+        D = _dense_shortest_path(M)
+        for func in [bellman_ford, johnson, floyd_warshall]:
+            assert_array_almost_equal(func(M), D)
+        assert_array_almost_equal(shortest_path(M), D)
+        assert_raises(ValueError, dijkstra, M)
+
+    def test_negative_cycle(self):
+        M = np.array([[0, 2, 0],
+                      [0, 0, -1],
+                      [-1.5, 0, 0]])
+        for func in [bellman_ford, johnson, floyd_warshall]:
+            assert_raises(NegativeCycleError, func, M)
+        # an undirected negative edge is a cycle of length two
+        M = np.array([[0, -1], [0, 0.]])
+        assert_raises(NegativeCycleError, bellman_ford, M, False)
+        assert_array_almost_equal(bellman_ford(M, True), [[0, -1],
+                                                          [np.inf, 0]])
+
+    def test_nonsquare(self):
+        for func in [dijkstra, bellman_ford, johnson, floyd_warshall]:
+            assert_raises(ValueError, func, np.ones((2, 3)))
+
+    def test_too_large(self):
+        # the compiled routines use C int indices
+        G = coo_matrix((2**31, 2**31))
+        for func in [dijkstra, bellman_ford, johnson, floyd_warshall,
+                     minimum_spanning_tree]:
+            assert_raises(ValueError, func, G)
+
+
+class TestTraversal(TestCase):
+    def setUp(self):
+        #  0 -> 1 -> 3
+        #  |         ^
+        #  +--> 2 ---+     4 (isolated)
+        self.G = csr_matrix(np.array([[0, 1, 1, 0, 0],
+                                      [0, 0, 0, 1, 0],
+                                      [0, 0, 0, 1, 0],
+                                      [0, 0, 0, 0, 0],
+                                      [0, 0, 0, 0, 0]]))
+
+    def test_breadth_first(self):
+        order, pred = breadth_first_order(self.G, 0)
+        assert_equal(order, [0, 1, 2, 3])
+        assert_equal(pred, [-9999, 0, 0, 1, -9999])
+        assert_equal(breadth_first_order(self.G, 3, True, False), [3])
+        order, pred = breadth_first_order(self.G, 3, directed=False)
+        assert_equal(order, [3, 1, 2, 0])
+        assert_equal(pred, [1, 3, 3, -9999, -9999])
+
+    def test_depth_first(self):
+        order, pred = depth_first_order(self.G, 0)
+        assert_equal(order, [0, 1, 3, 2])
+        assert_equal(pred, [-9999, 0, 0, 1, -9999])
+        order, pred = depth_first_order(self.G, 3, directed=False)
+        assert_equal(order, [3, 1, 0, 2])
+        assert_equal(pred, [1, 3, 0, -9999, -9999])
+
+    def test_deep_path(self):
+        # a long chain must not exhaust any stack
+        N = 100000
+        G = csr_matrix((np.ones(N - 1), np.arange(1, N), np.r_[0:N, N - 1]),
+                       shape=(N, N))
+        assert_equal(depth_first_order(G, 0, return_predecessors=False),
+                     np.arange(N))
+        assert_equal(depth_first_order(G, N - 1, False, False),
+                     np.arange(N)[::-1])
+
+    def test_bad_start(self):
+        assert_raises(ValueError, breadth_first_order, self.G, 5)
+
+
+class TestMinimumSpanningTree(TestCase):
+    def test_small(self):
+        G = [[0, 8, 0, 3],
+             [0, 0, 2, 5],
+             [0, 0, 0, 6],
+             [0, 0, 0, 0]]
+        T = minimum_spanning_tree(G)
+        assert_equal(T.todense(), [[0, 0, 0, 3],
+                                   [0, 0, 2, 5],
+                                   [0, 0, 0, 0],
+                                   [0, 0, 0, 0]])
+
+    def test_random(self):
+        for seed in range(5):
+            M = _random_graph(40, 0.1, seed)
+            T = minimum_spanning_tree(csr_matrix(M))
+            # a spanning forest has N - n_components edges, connects the
+            # same nodes as the graph and only uses edges of the graph
+            n_comp = csgraph.cs_graph_components(
+                    csr_matrix(M + M.T + np.eye(40)))[0]
+            assert_equal(T.nnz, 40 - n_comp)
+            T = T.toarray()
+            assert_(np.all((T == 0) | (T == M)))
+            assert_equal(csgraph.cs_graph_components(
+                    csr_matrix(T + T.T + np.eye(40)))[0], n_comp)
+            # no lighter edge can replace a tree edge: for every non-tree
+            # edge the tree path between its ends has no heavier edge
+            D = np.where(T + T.T != 0, T + T.T, np.inf)
+            for i, j in zip(*np.nonzero(M)):
+                if T[i, j] == 0 and i != j:
+                    assert_(M[i, j] >= _max_on_path(D, i, j) - 1e-12)
+
+
+def _max_on_path(D, i, j):
+    # largest weight on the (unique) tree path from i to j
+    order, pred = breadth_first_order(csr_matrix(np.isfinite(D)), i,
+                                      directed=False)
+    heaviest = 0
+    while j != i:
+        heaviest = max(heaviest, D[pred[j], j])
+        j = pred[j]
+    return heaviest
+
+
+def _grid_laplacian(n):
+    e = np.ones(n)
+    T = spdiags([-e, 2 * e, -e], [-1, 0, 1], n, n)
+    return (kron(identity(n), T) + kron(T, identity(n))).tocsr()
+
+
+def _bandwidth(A):
+    A = A.tocoo()
+    return np.abs(A.row - A.col).max()
+
+
+class TestOrdering(TestCase):
+    def setUp(self):
+        np.random.seed(1234)
+        A = _grid_laplacian(20)
+        self.A = symmetric_permutation(A, np.random.permutation(400))
+
+    def test_symmetric_permutation(self):
+        perm = np.random.permutation(400)
+        D = self.A.toarray()[perm][:, perm]
+        for fmt in ['csr', 'csc', 'coo']:
+            B = symmetric_permutation(self.A.asformat(fmt), perm)
+            assert_equal(B.format, fmt == 'csc' and 'csc' or 'csr')
+            assert_equal(B.toarray(), D)
+        assert_equal(symmetric_permutation(self.A.toarray(), perm).toarray(),
+                     D)
+        assert_raises(ValueError, symmetric_permutation, self.A, perm[1:])
+        perm[0] = perm[1]
+        assert_raises(ValueError, symmetric_permutation, self.A, perm)
+        # out of range entries, which must not wrap around
+        A = identity(3, format='csr')
+        for perm in [[0, 1, 5], [0, 1, -1], [-3, 1, 2], [0, 1, 2**32]]:
+            assert_raises(ValueError, symmetric_permutation, A, perm)
+        assert_raises(ValueError, symmetric_permutation, A, [0, 1, 2.5])
+
+    def test_reverse_cuthill_mckee(self):
+        perm = reverse_cuthill_mckee(self.A)
+        assert_equal(np.sort(perm), np.arange(400))
+        # a level structure of a 20x20 grid has at most 21 nodes per level
+        assert_(_bandwidth(symmetric_permutation(self.A, perm)) <= 40)
+
+    def test_small(self):
+        A = csr_matrix(np.array([[1, 0, 0, 1],
+                                 [0, 1, 1, 0],
+                                 [0, 1, 1, 0],
+                                 [1, 0, 0, 1]]))
+        assert_equal(_bandwidth(symmetric_permutation(
+            A, reverse_cuthill_mckee(A))), 1)
+        # isolated nodes and unsymmetric patterns
+        A = csr_matrix(np.array([[1, 0, 0, 0],
+                                 [0, 0, 0, 1],
+                                 [0, 0, 1, 0],
+                                 [0, 0, 0, 1]]))
+        for func in [reverse_cuthill_mckee, nested_dissection]:
+            assert_equal(np.sort(func(A)), np.arange(4))
+            assert_equal(np.sort(func(A, symmetric_mode=True)),
+                         np.arange(4))
+
+    def test_nested_dissection(self):
+        natural = splu(self.A.tocsc(), permc_spec='NATURAL',
+                       diag_pivot_thresh=0).nnz
+        for leaf_size in [1, 8, 64]:
+            perm = nested_dissection(self.A, leaf_size)
+            assert_equal(np.sort(perm), np.arange(400))
+            B = symmetric_permutation(self.A, perm).tocsc()
+            lu = splu(B, permc_spec='NATURAL', diag_pivot_thresh=0)
+            assert_(lu.nnz < natural / 3)
+        # leaves are left in their original order
+        assert_equal(nested_dissection(self.A, 400), np.arange(400))
+        assert_raises(ValueError, nested_dissection, self.A, 0)
+
+    def test_too_large(self):
+        G = coo_matrix((2**31, 2**31))
+        for func in [reverse_cuthill_mckee, nested_dissection]:
+            assert_raises(ValueError, func, G)
+        assert_raises(ValueError, symmetric_permutation, G, [0])
+
+
+if __name__ == "__main__":
+    run_module_suite()
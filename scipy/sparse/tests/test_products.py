@@ -0,0 +1,120 @@
+"""test masked and blockwise sparse matrix products"""
+
+import numpy as np
+from numpy.testing import TestCase, run_module_suite, assert_equal, \
+        assert_array_equal, assert_array_almost_equal, assert_raises, assert_
+
+from scipy.sparse import csr_matrix, csc_matrix, coo_matrix, vstack, rand, \
+        isspmatrix_csr, masked_product, product_row_blocks
+from scipy.sparse import sputils
+
+
+class _ProductsBase(TestCase):
+    def setUp(self):
+        np.random.seed(1234)
+        A = rand(80, 60, density=0.1, format='csr')
+        A.data[:] = np.random.randn(A.nnz)
+        # a few dense rows, so that the work per row varies
+        self.A = vstack([A, rand(3, 60, density=0.9)]).tocsr()
+        B = rand(60, 50, density=0.1, format='csr')
+        B.data[:] = np.random.randn(B.nnz)
+        self.B = B
+        self.AB = (self.A * self.B).todense()
+
+
+class TestMaskedProduct(_ProductsBase):
+    def test_masked_product(self):
+        mask = rand(83, 50, density=0.2, format='csr')
+        mask.data[:] = np.random.randn(mask.nnz)
+        expected = np.multiply(self.AB, mask.todense())
+        for A, B in [(self.A, self.B), (self.A.tocsc(), self.B.tocoo()),
+                     (self.A.todense(), self.B.toarray())]:
+            for M in [mask, mask.tocsc(), mask.tocoo()]:
+                C = masked_product(A, B, M)
+                assert_(isspmatrix_csr(C))
+                assert_array_almost_equal(C.todense(), expected)
+
+    def test_pattern(self):
+        # only the entries in the pattern of the mask are stored, and
+        # those of the product that vanish are dropped
+        mask = coo_matrix((np.ones(4), ([0, 0, 1, 82], [0, 1, 1, 49])),
+                          shape=(83, 50))
+        C = masked_product(self.A, self.B, mask)
+        assert_(C.nnz <= 4)
+        D = np.zeros((83, 50))
+        for i, j in zip(mask.row, mask.col):
+            D[i, j] = self.AB[i, j]
+        assert_array_almost_equal(C.todense(), D)
+        assert_(np.all(C.data != 0))
+
+    def test_duplicates_and_dtypes(self):
+        # duplicate entries of the mask add up
+        mask = csr_matrix((np.array([1, 2, 3]), np.array([3, 3, 4]),
+                           np.array([0] * 6 + [2, 2] + [3] * 76)),
+                          shape=(83, 50))
+        C = masked_product(self.A, 1j * self.B, mask)
+        assert_equal(C.dtype, np.complex128)
+        D = C.todense()
+        assert_array_almost_equal(D[5, 3], 3j * self.AB[5, 3])
+        assert_array_almost_equal(D[7, 4], 3j * self.AB[7, 4])
+
+    def test_threads(self):
+        mask = rand(83, 50, density=0.3, format='csr')
+        C = masked_product(self.A, self.B, mask)
+        old_threads = sputils._num_threads
+        old_min_nnz = sputils._min_nnz_per_thread
+        try:
+            sputils._min_nnz_per_thread = 10
+            for n_threads in [2, 5]:
+                sputils._num_threads = n_threads
+                D = masked_product(self.A, self.B, mask)
+                assert_array_equal(D.indptr, C.indptr)
+                assert_array_equal(D.indices, C.indices)
+                assert_array_equal(D.data, C.data)
+        finally:
+            sputils._num_threads = old_threads
+            sputils._min_nnz_per_thread = old_min_nnz
+
+    def test_bad_shapes(self):
+        mask = csr_matrix((83, 50))
+        assert_raises(ValueError, masked_product, self.A, self.B[1:], mask)
+        assert_raises(ValueError, masked_product, self.A, self.B, mask[1:])
+
+    def test_empty(self):
+        C = masked_product(csr_matrix((4, 5)), self.B[:5], csr_matrix(
+            np.ones((4, 50))))
+        assert_equal(C.nnz, 0)
+
+
+class TestProductRowBlocks(_ProductsBase):
+    def test_blocks(self):
+        for max_nnz in [1, 50, 300, 10**6]:
+            blocks = list(product_row_blocks(self.A, self.B, max_nnz))
+            stop = 0
+            for start, stop_, C in blocks:
+                assert_equal(start, stop)
+                stop = stop_
+                assert_(isspmatrix_csr(C))
+                assert_equal(C.shape, (stop_ - start, 50))
+                # the bound holds unless a single row exceeds it
+                assert_(C.nnz <= max_nnz or stop_ - start == 1)
+            assert_equal(stop, 83)
+            C = vstack([C for start, stop, C in blocks])
+            assert_array_almost_equal(C.todense(), self.AB)
+        assert_equal(len(list(product_row_blocks(self.A, self.B, 10**6))), 1)
+
+    def test_formats(self):
+        C = vstack([C for start, stop, C in
+                    product_row_blocks(self.A.tocsc(), csc_matrix(self.B),
+                                       max_nnz=100)])
+        assert_array_almost_equal(C.todense(), self.AB)
+
+    def test_bad_args(self):
+        assert_raises(ValueError, list,
+                      product_row_blocks(self.A, self.B[1:]))
+        assert_raises(ValueError, list,
+                      product_row_blocks(self.A, self.B, max_nnz=0))
+
+
+if __name__ == "__main__":
+    run_module_suite()
@@ -65,5 +65,26 @@ class TestSparseUtils(TestCase):
         assert_equal(sputils.isdense( np.array([1]) ),True)
         assert_equal(sputils.isdense( np.matrix([1]) ),True)
 
+    def test_nnz_partition(self):
+        indptr = np.array([0, 0, 10, 10, 11, 12, 13, 20, 20])
+        assert_equal(sputils._nnz_partition(indptr, 1), [(0, 8)])
+        parts = sputils._nnz_partition(indptr, 3)
+        assert_equal(parts, [(0, 2), (2, 6), (6, 8)])
+        # never more parts than rows, and no empty parts
+        parts = sputils._nnz_partition(np.array([0, 5, 5]), 4)
+        assert_equal(parts, [(0, 1), (1, 2)])
+
+    def test_get_index_dtype(self):
+        imax = np.iinfo(np.intc).max
+        a32 = np.array([1, 2], dtype=np.intc)
+        a64 = np.array([1, 2], dtype=np.int64)
+        assert_equal(sputils.get_index_dtype(), np.intc)
+        assert_equal(sputils.get_index_dtype(maxval=imax), np.intc)
+        assert_equal(sputils.get_index_dtype(maxval=imax + 1), np.int64)
+        assert_equal(sputils.get_index_dtype((a32, a32)), np.intc)
+        assert_equal(sputils.get_index_dtype((a32, a64)), np.int64)
+        assert_equal(sputils.get_index_dtype((a32,), maxval=imax + 1),
+                     np.int64)
+
 if __name__ == "__main__":
     run_module_suite()
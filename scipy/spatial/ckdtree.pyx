@@ -3,8 +3,15 @@
 import numpy as np
 cimport numpy as np
 cimport stdlib
+cimport cython
+
+cdef extern from "string.h":
+    void* memcpy(void* dest, void* src, size_t n)
 
 import kdtree
+import scipy.sparse
+from scipy.lib._threads import cpu_count as _cpu_count, \
+        run_parallel as _run_parallel
 
 cdef double infinity = np.inf
 
@@ -25,21 +32,24 @@ cdef struct heap:
     heapitem* heap
     int space
 
-cdef inline heapcreate(heap* self,int initial_size):
+# The heap routines do not touch Python objects, so that queries can
+# run with the GIL released.
+cdef inline void heapcreate(heap* self,int initial_size) nogil:
     self.space = initial_size
     self.heap = <heapitem*>stdlib.malloc(sizeof(heapitem)*self.space)
     self.n=0
 
-cdef inline heapdestroy(heap* self):
+cdef inline void heapdestroy(heap* self) nogil:
     stdlib.free(self.heap)
 
-cdef inline heapresize(heap* self, int new_space):
+cdef inline void heapresize(heap* self, int new_space) nogil:
+    # callers never shrink the heap below its current size
     if new_space<self.n:
-        raise ValueError("Heap containing %d items cannot be resized to %d" % (self.n, new_space))
+        new_space = self.n
     self.space = new_space
     self.heap = <heapitem*>stdlib.realloc(<void*>self.heap,new_space*sizeof(heapitem))
 
-cdef inline heappush(heap* self, heapitem item):
+cdef inline void heappush(heap* self, heapitem item) nogil:
     cdef int i
     cdef heapitem t
 
@@ -55,10 +65,10 @@ cdef inline heappush(heap* self, heapitem item):
         self.heap[i] = t
         i = (i-1)//2
 
-cdef heapitem heappeek(heap* self):
+cdef inline heapitem heappeek(heap* self) nogil:
     return self.heap[0]
 
-cdef heapremove(heap* self):
+cdef inline void heapremove(heap* self) nogil:
     cdef heapitem t
     cdef int i, j, k, l
 
@@ -85,7 +95,7 @@ cdef heapremove(heap* self):
         j = 2*i+1
         k = 2*i+2
 
-cdef heapitem heappop(heap* self):
+cdef inline heapitem heappop(heap* self) nogil:
     cdef heapitem it
     it = heappeek(self)
     heapremove(self)
@@ -96,17 +106,17 @@ cdef heapitem heappop(heap* self):
 
 
 # utility functions
-cdef inline double dmax(double x, double y):
+cdef inline double dmax(double x, double y) nogil:
     if x>y:
         return x
     else:
         return y
-cdef inline double dabs(double x):
+cdef inline double dabs(double x) nogil:
     if x>0:
         return x
     else:
         return -x
-cdef inline double _distance_p(double*x,double*y,double p,int k,double upperbound):
+cdef inline double _distance_p(double*x,double*y,double p,int k,double upperbound) nogil:
     """Compute the distance between x and y
 
     Computes the Minkowski p-distance to the power p between two points.
@@ -133,21 +143,394 @@ cdef inline double _distance_p(double*x,double*y,double p,int k,double upperboun
                 return r
     return r
 
+cdef inline int _bisect_left(double* a, double x, int lo, int hi):
+    # first index in a[lo:hi] with a[i] >= x (a sorted ascending)
+    cdef int mid
+    while lo < hi:
+        mid = (lo+hi)//2
+        if a[mid] < x:
+            lo = mid+1
+        else:
+            hi = mid
+    return lo
+cdef inline int _bisect_right(double* a, double x, int lo, int hi):
+    # first index in a[lo:hi] with a[i] > x (a sorted ascending)
+    cdef int mid
+    while lo < hi:
+        mid = (lo+hi)//2
+        if x < a[mid]:
+            hi = mid
+        else:
+            lo = mid+1
+    return lo
+cdef inline double _pow_p(double x, double p):
+    # raise a one-dimensional distance to the power p, as used for the
+    # internal representation of distances (p==infinity is never raised)
+    if p==1 or p==infinity:
+        return x
+    elif p==2:
+        return x*x
+    else:
+        return x**p
+
+
+
+# Hyperrectangles and incremental distance bookkeeping for the
+# dual-tree traversals.
+#
+# All distances are kept as distance**p (or the plain distance for p==1
+# and p==infinity), exactly as in __query. When a traversal descends into
+# a child the rectangle changes along a single axis, so for finite p the
+# minimum and maximum distances can be updated by removing and re-adding
+# the contribution of that axis; for p==infinity they are recomputed.
+cdef class _Rectangle:
+    cdef int m
+    cdef double* mins
+    cdef double* maxes
+
+    def __init__(_Rectangle self, np.ndarray mins_arr, np.ndarray maxes_arr):
+        cdef int i
+        cdef np.ndarray[double, ndim=1] mi, ma
+        mi = np.ascontiguousarray(mins_arr,dtype=np.float)
+        ma = np.ascontiguousarray(maxes_arr,dtype=np.float)
+        self.m = mi.shape[0]
+        self.mins = <double*>stdlib.malloc(self.m*sizeof(double))
+        self.maxes = <double*>stdlib.malloc(self.m*sizeof(double))
+        for i in range(self.m):
+            self.mins[i] = mi[i]
+            self.maxes[i] = ma[i]
+
+    def __dealloc__(_Rectangle self):
+        stdlib.free(self.mins)
+        stdlib.free(self.maxes)
+
+cdef inline double _min_dist_point_interval(double* x, _Rectangle rect, int k):
+    return dmax(0, dmax(rect.mins[k]-x[k], x[k]-rect.maxes[k]))
+cdef inline double _max_dist_point_interval(double* x, _Rectangle rect, int k):
+    return dmax(rect.maxes[k]-x[k], x[k]-rect.mins[k])
+cdef inline double _min_dist_interval_interval(_Rectangle r1, _Rectangle r2, int k):
+    return dmax(0, dmax(r1.mins[k]-r2.maxes[k], r2.mins[k]-r1.maxes[k]))
+cdef inline double _max_dist_interval_interval(_Rectangle r1, _Rectangle r2, int k):
+    return dmax(r1.maxes[k]-r2.mins[k], r2.maxes[k]-r1.mins[k])
+
+# stack entries record what a push changed so that pop can restore it
+cdef struct stackitem:
+    int which
+    int split_dim
+    double min_along_dim
+    double max_along_dim
+    double min_distance
+    double max_distance
+
+cdef enum:
+    LESS = 1
+    GREATER = 2
+
+cdef class _RectRectDistanceTracker:
+    """Minimum and maximum distances between two shrinking rectangles"""
+    cdef _Rectangle rect1, rect2
+    cdef double p, epsfac, upper_bound
+    cdef double min_distance, max_distance
+    cdef int stack_size, stack_max_size
+    cdef stackitem* stack
+
+    def __init__(_RectRectDistanceTracker self, _Rectangle rect1, _Rectangle rect2,
+                 double p, double eps, double upper_bound):
+        if rect1.m != rect2.m:
+            raise ValueError("rect1 and rect2 have different dimensions")
+        self.rect1 = rect1
+        self.rect2 = rect2
+        self.p = p
+
+        # internally we represent all distances as distance**p
+        if p!=infinity and upper_bound!=infinity:
+            self.upper_bound = upper_bound**p
+        else:
+            self.upper_bound = upper_bound
+
+        # fiddle approximation factor
+        if eps==0:
+            self.epsfac = 1
+        elif p==infinity:
+            self.epsfac = 1/(1+eps)
+        else:
+            self.epsfac = 1/(1+eps)**p
+
+        self.stack_size = 0
+        self.stack_max_size = 10
+        self.stack = <stackitem*>stdlib.malloc(self.stack_max_size*sizeof(stackitem))
+
+        self._recompute()
+
+    def __dealloc__(_RectRectDistanceTracker self):
+        stdlib.free(self.stack)
+
+    cdef void _recompute(_RectRectDistanceTracker self):
+        cdef int i
+        self.min_distance = 0.
+        self.max_distance = 0.
+        for i in range(self.rect1.m):
+            if self.p==infinity:
+                self.min_distance = dmax(self.min_distance,
+                        _min_dist_interval_interval(self.rect1, self.rect2, i))
+                self.max_distance = dmax(self.max_distance,
+                        _max_dist_interval_interval(self.rect1, self.rect2, i))
+            else:
+                self.min_distance += _pow_p(
+                        _min_dist_interval_interval(self.rect1, self.rect2, i), self.p)
+                self.max_distance += _pow_p(
+                        _max_dist_interval_interval(self.rect1, self.rect2, i), self.p)
+
+    cdef int push(_RectRectDistanceTracker self, int which, int direction,
+                  int split_dim, double split_val) except -1:
+        cdef _Rectangle rect
+        cdef stackitem* item
+        if which == 1:
+            rect = self.rect1
+        else:
+            rect = self.rect2
+
+        if self.stack_size == self.stack_max_size:
+            self.stack_max_size = 2*self.stack_max_size
+            self.stack = <stackitem*>stdlib.realloc(<void*>self.stack,
+                    self.stack_max_size*sizeof(stackitem))
+            if self.stack == NULL:
+                raise MemoryError
+        item = &self.stack[self.stack_size]
+        self.stack_size += 1
+        item.which = which
+        item.split_dim = split_dim
+        item.min_distance = self.min_distance
+        item.max_distance = self.max_distance
+        item.min_along_dim = rect.mins[split_dim]
+        item.max_along_dim = rect.maxes[split_dim]
+
+        if self.p != infinity:
+            self.min_distance -= _pow_p(_min_dist_interval_interval(
+                    self.rect1, self.rect2, split_dim), self.p)
+            self.max_distance -= _pow_p(_max_dist_interval_interval(
+                    self.rect1, self.rect2, split_dim), self.p)
+
+        if direction == LESS:
+            rect.maxes[split_dim] = split_val
+        else:
+            rect.mins[split_dim] = split_val
+
+        if self.p != infinity:
+            self.min_distance += _pow_p(_min_dist_interval_interval(
+                    self.rect1, self.rect2, split_dim), self.p)
+            self.max_distance += _pow_p(_max_dist_interval_interval(
+                    self.rect1, self.rect2, split_dim), self.p)
+        else:
+            self._recompute()
+        return 0
+
+    cdef inline int push_less_of(_RectRectDistanceTracker self, int which,
+                                 innernode* node) except -1:
+        return self.push(which, LESS, node.split_dim, node.split)
+
+    cdef inline int push_greater_of(_RectRectDistanceTracker self, int which,
+                                    innernode* node) except -1:
+        return self.push(which, GREATER, node.split_dim, node.split)
+
+    cdef inline void pop(_RectRectDistanceTracker self):
+        cdef _Rectangle rect
+        cdef stackitem* item
+        self.stack_size -= 1
+        item = &self.stack[self.stack_size]
+        self.min_distance = item.min_distance
+        self.max_distance = item.max_distance
+        if item.which == 1:
+            rect = self.rect1
+        else:
+            rect = self.rect2
+        rect.mins[item.split_dim] = item.min_along_dim
+        rect.maxes[item.split_dim] = item.max_along_dim
+
+cdef class _PointRectDistanceTracker:
+    """Minimum and maximum distances between a point and a shrinking rectangle"""
+    cdef _Rectangle rect
+    cdef double* pt
+    cdef double p, epsfac, upper_bound
+    cdef double min_distance, max_distance
+    cdef int stack_size, stack_max_size
+    cdef stackitem* stack
+
+    cdef init(_PointRectDistanceTracker self, double* pt, _Rectangle rect,
+              double p, double eps, double upper_bound):
+        self.pt = pt
+        self.rect = rect
+        self.p = p
+
+        # internally we represent all distances as distance**p
+        if p!=infinity and upper_bound!=infinity:
+            self.upper_bound = upper_bound**p
+        else:
+            self.upper_bound = upper_bound
+
+        # fiddle approximation factor
+        if eps==0:
+            self.epsfac = 1
+        elif p==infinity:
+            self.epsfac = 1/(1+eps)
+        else:
+            self.epsfac = 1/(1+eps)**p
+
+        self.stack_size = 0
+        self.stack_max_size = 10
+        self.stack = <stackitem*>stdlib.malloc(self.stack_max_size*sizeof(stackitem))
+
+        self._recompute()
+
+    def __dealloc__(_PointRectDistanceTracker self):
+        stdlib.free(self.stack)
+
+    cdef void _recompute(_PointRectDistanceTracker self):
+        cdef int i
+        self.min_distance = 0.
+        self.max_distance = 0.
+        for i in range(self.rect.m):
+            if self.p==infinity:
+                self.min_distance = dmax(self.min_distance,
+                        _min_dist_point_interval(self.pt, self.rect, i))
+                self.max_distance = dmax(self.max_distance,
+                        _max_dist_point_interval(self.pt, self.rect, i))
+            else:
+                self.min_distance += _pow_p(
+                        _min_dist_point_interval(self.pt, self.rect, i), self.p)
+                self.max_distance += _pow_p(
+                        _max_dist_point_interval(self.pt, self.rect, i), self.p)
+
+    cdef int push(_PointRectDistanceTracker self, int direction,
+                  int split_dim, double split_val) except -1:
+        cdef stackitem* item
+        if self.stack_size == self.stack_max_size:
+            self.stack_max_size = 2*self.stack_max_size
+            self.stack = <stackitem*>stdlib.realloc(<void*>self.stack,
+                    self.stack_max_size*sizeof(stackitem))
+            if self.stack == NULL:
+                raise MemoryError
+        item = &self.stack[self.stack_size]
+        self.stack_size += 1
+        item.split_dim = split_dim
+        item.min_distance = self.min_distance
+        item.max_distance = self.max_distance
+        item.min_along_dim = self.rect.mins[split_dim]
+        item.max_along_dim = self.rect.maxes[split_dim]
+
+        if self.p != infinity:
+            self.min_distance -= _pow_p(_min_dist_point_interval(
+                    self.pt, self.rect, split_dim), self.p)
+            self.max_distance -= _pow_p(_max_dist_point_interval(
+                    self.pt, self.rect, split_dim), self.p)
+
+        if direction == LESS:
+            self.rect.maxes[split_dim] = split_val
+        else:
+            self.rect.mins[split_dim] = split_val
+
+        if self.p != infinity:
+            self.min_distance += _pow_p(_min_dist_point_interval(
+                    self.pt, self.rect, split_dim), self.p)
+            self.max_distance += _pow_p(_max_dist_point_interval(
+                    self.pt, self.rect, split_dim), self.p)
+        else:
+            self._recompute()
+        return 0
+
+    cdef inline int push_less_of(_PointRectDistanceTracker self,
+                                 innernode* node) except -1:
+        return self.push(LESS, node.split_dim, node.split)
+
+    cdef inline int push_greater_of(_PointRectDistanceTracker self,
+                                    innernode* node) except -1:
+        return self.push(GREATER, node.split_dim, node.split)
+
+    cdef inline void pop(_PointRectDistanceTracker self):
+        cdef stackitem* item
+        self.stack_size -= 1
+        item = &self.stack[self.stack_size]
+        self.min_distance = item.min_distance
+        self.max_distance = item.max_distance
+        self.rect.mins[item.split_dim] = item.min_along_dim
+        self.rect.maxes[item.split_dim] = item.max_along_dim
+
+
+
+def _ckdtree_from_arrays(data, leafsize, indices, tree_buffer, maxes, mins):
+    cdef cKDTree tree
+    tree = cKDTree.__new__(cKDTree)
+    tree._set_arrays(data, leafsize, indices, tree_buffer, maxes, mins)
+    return tree
+
+def _query_worker(cKDTree tree, dd, ii, xx, int start, int stop, int k,
+                  double eps, double p, double distance_upper_bound):
+    tree._query_chunk(dd, ii, xx, start, stop, k, eps, p, distance_upper_bound)
+
 
 
 # Tree structure
 cdef struct innernode:
     int split_dim
     int n_points
+    int start_idx
+    int end_idx
     double split
-    innernode* less
-    innernode* greater
+    # children are stored as positions in the tree's node array, so that
+    # the array can be written to disk and mapped back in unchanged
+    int less
+    int greater
 cdef struct leafnode:
     int split_dim
     int n_points
     int start_idx
     int end_idx
 
+# numpy description of innernode, used to hold the nodes in an array
+_node_dtype = np.dtype([('split_dim', np.intc),
+                        ('n_points', np.intc),
+                        ('start_idx', np.intc),
+                        ('end_idx', np.intc),
+                        ('split', np.float64),
+                        ('less', np.intc),
+                        ('greater', np.intc)])
+if _node_dtype.itemsize != sizeof(innernode):
+    raise ImportError("cKDTree node layout does not match its numpy description")
+
+# On-disk format written by cKDTree.save: an 8-byte magic string, a header
+# of little-endian int64 values (format version, n, m, leafsize, number of
+# nodes and the byte offsets of the data, indices, nodes, maxes and mins
+# arrays), then the arrays themselves in little-endian byte order, each
+# starting at a multiple of _FILE_ALIGN so that they can be memory-mapped.
+_FILE_MAGIC = b'\x93CKDTREE'
+_FILE_VERSION = 1
+_FILE_HEADER_LEN = 10
+_FILE_ALIGN = 64
+
+def _check_tree_arrays(n, m, indices, nodes):
+    # Raise ValueError unless the index and node arrays read from a file
+    # describe a tree over n points of dimension m.  Children are created
+    # after their parent, so requiring them to come later in the node
+    # array also rules out cycles.
+    n_nodes = len(nodes)
+    if n_nodes < 1:
+        raise ValueError("the tree has no nodes")
+    start = nodes['start_idx']
+    end = nodes['end_idx']
+    if np.any((start < 0) | (start > end) | (end > n)):
+        raise ValueError("node point ranges out of bounds")
+    split_dim = nodes['split_dim']
+    inner = split_dim != -1
+    if np.any((split_dim[inner] < 0) | (split_dim[inner] >= m)):
+        raise ValueError("node split dimensions out of bounds")
+    position = np.arange(n_nodes)[inner]
+    for child in ['less', 'greater']:
+        child = nodes[child][inner]
+        if np.any((child <= position) | (child >= n_nodes)):
+            raise ValueError("node children out of bounds")
+    if n > 0 and (np.min(indices) < 0 or np.max(indices) >= n):
+        raise ValueError("point indices out of bounds")
+
 # this is the standard trick for variable-size arrays:
 # malloc sizeof(nodeinfo)+self.m*sizeof(double) bytes.
 cdef struct nodeinfo:
@@ -176,6 +559,11 @@ cdef class cKDTree:
     point). It can also be queried, with a substantial gain in efficiency, 
     for the r approximate closest neighbors.
 
+    The ball, pair and neighbor-count queries of KDTree (query_ball_point,
+    query_ball_tree, query_pairs, count_neighbors and
+    sparse_distance_matrix) are also available, implemented as compiled
+    dual-tree traversals that give the same results as KDTree.
+
     For large dimensions (20 is already large) do not expect this to run 
     significantly faster than brute force. High-dimensional nearest-neighbor
     queries are a substantial open problem in computer science.
@@ -194,6 +582,8 @@ cdef class cKDTree:
     """
 
     cdef innernode* tree 
+    cdef object tree_buffer
+    cdef int n_nodes, max_nodes
     cdef readonly object data
     cdef double* raw_data
     cdef readonly int n, m
@@ -205,42 +595,85 @@ cdef class cKDTree:
     cdef object indices
     cdef np.int32_t* raw_indices
     def __init__(cKDTree self, data, int leafsize=10):
-        cdef np.ndarray[double, ndim=2] inner_data
-        cdef np.ndarray[double, ndim=1] inner_maxes
-        cdef np.ndarray[double, ndim=1] inner_mins
-        cdef np.ndarray[np.int32_t, ndim=1] inner_indices
-        self.data = np.ascontiguousarray(data,dtype=np.float)
-        self.n, self.m = np.shape(self.data)
-        self.leafsize = leafsize
-        if self.leafsize<1:
+        cdef np.ndarray tree_buffer
+        data = np.ascontiguousarray(data,dtype=np.float)
+        n, m = np.shape(data)
+        if leafsize<1:
             raise ValueError("leafsize must be at least 1")
-        self.maxes = np.ascontiguousarray(np.amax(self.data,axis=0))
-        self.mins = np.ascontiguousarray(np.amin(self.data,axis=0))
-        self.indices = np.ascontiguousarray(np.arange(self.n,dtype=np.int32))
-
-        inner_data = self.data
-        self.raw_data = <double*>inner_data.data
-        inner_maxes = self.maxes
-        self.raw_maxes = <double*>inner_maxes.data
-        inner_mins = self.mins
-        self.raw_mins = <double*>inner_mins.data
-        inner_indices = self.indices
-        self.raw_indices = <np.int32_t*>inner_indices.data
-
-        self.tree = self.__build(0, self.n, self.raw_maxes, self.raw_mins)
-
-    cdef innernode* __build(cKDTree self, int start_idx, int end_idx, double* maxes, double* mins):
+        maxes = np.ascontiguousarray(np.amax(data,axis=0))
+        mins = np.ascontiguousarray(np.amin(data,axis=0))
+        indices = np.ascontiguousarray(np.arange(n,dtype=np.int32))
+        self._set_arrays(data, leafsize, indices, None, maxes, mins)
+
+        # nodes are collected in a growable C array while building and
+        # then moved into tree_buffer
+        self.n_nodes = 0
+        self.max_nodes = 2*(self.n//self.leafsize)+1
+        self.tree = <innernode*>stdlib.malloc(self.max_nodes*sizeof(innernode))
+        try:
+            if self.tree == NULL:
+                raise MemoryError
+            self.__build(0, self.n, self.raw_maxes, self.raw_mins)
+            tree_buffer = np.empty(self.n_nodes, dtype=_node_dtype)
+            memcpy(tree_buffer.data, self.tree, self.n_nodes*sizeof(innernode))
+        finally:
+            stdlib.free(self.tree)
+            self.tree = NULL
+        self.tree_buffer = tree_buffer
+        self.tree = <innernode*>tree_buffer.data
+
+    cdef _set_arrays(cKDTree self, data, int leafsize, indices, tree_buffer,
+                     maxes, mins):
+        # point the raw pointers at the arrays (which may be memmaps)
+        cdef np.ndarray arr
+        self.data = data
+        self.n, self.m = np.shape(data)
+        self.leafsize = leafsize
+        self.indices = indices
+        self.maxes = maxes
+        self.mins = mins
+        arr = data
+        self.raw_data = <double*>arr.data
+        arr = maxes
+        self.raw_maxes = <double*>arr.data
+        arr = mins
+        self.raw_mins = <double*>arr.data
+        arr = indices
+        self.raw_indices = <np.int32_t*>arr.data
+        if tree_buffer is not None:
+            arr = tree_buffer
+            self.tree_buffer = tree_buffer
+            self.n_nodes = arr.shape[0]
+            self.tree = <innernode*>arr.data
+
+    cdef int __new_node(cKDTree self) except -1:
+        cdef innernode* new_tree
+        if self.n_nodes == self.max_nodes:
+            self.max_nodes = 2*self.max_nodes+1
+            new_tree = <innernode*>stdlib.realloc(<void*>self.tree,
+                    self.max_nodes*sizeof(innernode))
+            if new_tree == NULL:
+                raise MemoryError
+            self.tree = new_tree
+        self.n_nodes += 1
+        return self.n_nodes-1
+
+    cdef int __build(cKDTree self, int start_idx, int end_idx, double* maxes, double* mins) except -1:
         cdef leafnode* n
         cdef innernode* ni
-        cdef int i, j, t, p, q, d
+        cdef int i, j, t, p, q, d, node_index, less, greater
         cdef double size, split, minval, maxval
         cdef double*mids
+        # the node array may move while the children are built, so nodes
+        # are referred to by position until they are filled in
+        node_index = self.__new_node()
         if end_idx-start_idx<=self.leafsize:
-            n = <leafnode*>stdlib.malloc(sizeof(leafnode))
+            n = <leafnode*>(self.tree+node_index)
             n.split_dim = -1
+            n.n_points = end_idx-start_idx
             n.start_idx = start_idx
             n.end_idx = end_idx
-            return <innernode*>n
+            return node_index
         else:
             d = 0 
             size = 0
@@ -252,11 +685,12 @@ cdef class cKDTree:
             minval = mins[d]
             if maxval==minval:
                 # all points are identical; warn user?
-                n = <leafnode*>stdlib.malloc(sizeof(leafnode))
+                n = <leafnode*>(self.tree+node_index)
                 n.split_dim = -1
+                n.n_points = end_idx-start_idx
                 n.start_idx = start_idx
                 n.end_idx = end_idx
-                return <innernode*>n
+                return node_index
 
             split = (maxval+minval)/2
 
@@ -303,38 +737,171 @@ cdef class cKDTree:
                 q = end_idx-2
 
             # construct new node representation
-            ni = <innernode*>stdlib.malloc(sizeof(innernode))
-
             mids = <double*>stdlib.malloc(sizeof(double)*self.m)
-            for i in range(self.m):
-                mids[i] = maxes[i]
-            mids[d] = split
-            ni.less = self.__build(start_idx,p,mids,mins)
-
-            for i in range(self.m):
-                mids[i] = mins[i]
-            mids[d] = split
-            ni.greater = self.__build(p,end_idx,maxes,mids)
-
-            stdlib.free(mids)
+            try:
+                for i in range(self.m):
+                    mids[i] = maxes[i]
+                mids[d] = split
+                less = self.__build(start_idx,p,mids,mins)
 
+                for i in range(self.m):
+                    mids[i] = mins[i]
+                mids[d] = split
+                greater = self.__build(p,end_idx,maxes,mids)
+            finally:
+                stdlib.free(mids)
+
+            ni = self.tree+node_index
+            ni.less = less
+            ni.greater = greater
             ni.split_dim = d
             ni.split = split
+            ni.n_points = end_idx-start_idx
+            ni.start_idx = start_idx
+            ni.end_idx = end_idx
+
+            return node_index
 
-            return ni
-                    
-    cdef __free_tree(cKDTree self, innernode* node):
-        if node.split_dim!=-1:
-            self.__free_tree(node.less)
-            self.__free_tree(node.greater)
-        stdlib.free(node)
+    def __reduce__(cKDTree self):
+        # pickle the built tree rather than rebuilding it on unpickling
+        return (_ckdtree_from_arrays,
+                (np.asarray(self.data), self.leafsize,
+                 np.asarray(self.indices), np.asarray(self.tree_buffer),
+                 np.asarray(self.maxes), np.asarray(self.mins)))
 
-    def __dealloc__(cKDTree self):
-        if <int>(self.tree) == 0:
-            # should happen only if __init__ was never called
-            return
-        self.__free_tree(self.tree)
+    def save(cKDTree self, filename):
+        """Write the built tree to a file.
 
+        The points, the index permutation and the node array are written
+        to a flat binary file, which can be reopened without rebuilding the
+        tree using `cKDTree.load`.
+
+        Parameters
+        ----------
+        filename : str
+            Name of the file to write.
+
+        See Also
+        --------
+        load
+
+        """
+        arrays = [np.asarray(self.data, dtype='<f8'),
+                  np.asarray(self.indices, dtype='<i4'),
+                  np.asarray(self.tree_buffer, dtype=_node_dtype.newbyteorder('<')),
+                  np.asarray(self.maxes, dtype='<f8'),
+                  np.asarray(self.mins, dtype='<f8')]
+        offsets = []
+        offset = len(_FILE_MAGIC) + 8*_FILE_HEADER_LEN
+        for arr in arrays:
+            offset = -(-offset//_FILE_ALIGN)*_FILE_ALIGN
+            offsets.append(offset)
+            offset += arr.nbytes
+        header = np.array([_FILE_VERSION, self.n, self.m, self.leafsize,
+                           self.n_nodes] + offsets, dtype='<i8')
+
+        f = open(filename, 'wb')
+        try:
+            f.write(_FILE_MAGIC)
+            f.write(header.tostring())
+            for arr, offset in zip(arrays, offsets):
+                f.write(b'\0'*(offset-f.tell()))
+                arr.tofile(f)
+        finally:
+            f.close()
+
+    @classmethod
+    def load(cls, filename, mmap_mode='r', check=False):
+        """Open a tree written by `cKDTree.save`.
+
+        Parameters
+        ----------
+        filename : str
+            Name of the file to read.
+        mmap_mode : {None, 'r', 'r+', 'c'}, optional
+            If not None, the points and the tree are memory-mapped from the
+            file using the given mode (see `numpy.memmap`) instead of being
+            read into memory, so that processes opening the same file
+            share its pages. Default: 'r'.
+        check : bool, optional
+            Whether to check that the node and index arrays describe a
+            valid tree.  This reads both arrays, so it takes time linear
+            in the size of the tree; by default only the header and the
+            size of the file are checked, and a file that has been
+            corrupted after it was written can crash later queries.
+            Default: False.
+
+        Returns
+        -------
+        tree : cKDTree
+            The tree, ready to be queried.
+
+        Raises
+        ------
+        ValueError
+            If the file is not a cKDTree file, is truncated, or (with
+            `check`) its node and index arrays do not describe a valid
+            tree.
+
+        See Also
+        --------
+        save
+
+        """
+        cdef cKDTree tree
+        f = open(filename, 'rb')
+        try:
+            magic = f.read(len(_FILE_MAGIC))
+            if magic != _FILE_MAGIC:
+                raise ValueError("%s is not a cKDTree file" % filename)
+            header = np.fromstring(f.read(8*_FILE_HEADER_LEN), dtype='<i8')
+            if len(header) != _FILE_HEADER_LEN:
+                raise ValueError("%s is truncated" % filename)
+            version, n, m, leafsize, n_nodes = [int(v) for v in header[:5]]
+            if version != _FILE_VERSION:
+                raise ValueError("unsupported cKDTree file version %d" % version)
+            if (min(n, leafsize - 1, m - 1, n_nodes - 1) < 0 or
+                    max(n, m, leafsize, n_nodes) > np.iinfo(np.intc).max):
+                raise ValueError("%s has an invalid header" % filename)
+            specs = [('<f8', (n, m)),
+                     ('<i4', (n,)),
+                     (_node_dtype.newbyteorder('<'), (n_nodes,)),
+                     ('<f8', (m,)),
+                     ('<f8', (m,))]
+            f.seek(0, 2)
+            file_size = f.tell()
+            for (dtype, shape), offset in zip(specs, header[5:]):
+                size = np.dtype(dtype).itemsize*int(np.prod(shape))
+                if offset < len(_FILE_MAGIC) + 8*_FILE_HEADER_LEN or \
+                       offset + size > file_size:
+                    raise ValueError("%s is truncated" % filename)
+            arrays = []
+            for (dtype, shape), offset in zip(specs, header[5:]):
+                if mmap_mode is None:
+                    f.seek(int(offset))
+                    arr = np.fromfile(f, dtype=dtype, count=int(np.prod(shape)))
+                    arr = arr.reshape(shape)
+                else:
+                    arr = np.memmap(filename, dtype=dtype, mode=mmap_mode,
+                                    offset=int(offset), shape=shape)
+                if not arr.dtype.isnative:
+                    # the raw pointers need native byte order
+                    arr = arr.astype(arr.dtype.newbyteorder('='))
+                arrays.append(arr)
+        finally:
+            f.close()
+
+        data, indices, tree_buffer, maxes, mins = arrays
+        if check:
+            try:
+                _check_tree_arrays(n, m, indices, tree_buffer)
+            except ValueError, e:
+                raise ValueError("%s is corrupt: %s" % (filename, e))
+        tree = cls.__new__(cls)
+        tree._set_arrays(data, leafsize, indices, tree_buffer, maxes, mins)
+        return tree
+
+    @cython.cdivision(True)
     cdef void __query(cKDTree self, 
             double*result_distances, 
             int*result_indices, 
@@ -342,7 +909,7 @@ cdef class cKDTree:
             int k, 
             double eps, 
             double p, 
-            double distance_upper_bound):
+            double distance_upper_bound) nogil:
         cdef heap q
         cdef heap neighbors
 
@@ -454,11 +1021,11 @@ cdef class cKDTree:
 
                 # set up children for searching
                 if x[inode.split_dim]<inode.split:
-                    near = inode.less
-                    far = inode.greater
+                    near = self.tree+inode.less
+                    far = self.tree+inode.greater
                 else:
-                    near = inode.greater
-                    far = inode.less
+                    near = self.tree+inode.greater
+                    far = self.tree+inode.less
 
                 # near child is at the same distance as the current node
                 # we're going here next, so no point pushing it on the queue
@@ -511,8 +1078,37 @@ cdef class cKDTree:
         heapdestroy(&q)
         heapdestroy(&neighbors)
 
+    cdef _query_chunk(cKDTree self,
+            np.ndarray dd,
+            np.ndarray ii,
+            np.ndarray xx,
+            int start,
+            int stop,
+            int k,
+            double eps,
+            double p,
+            double distance_upper_bound):
+        # answer the queries xx[start:stop] with the GIL released
+        cdef int c
+        cdef double* raw_dd
+        cdef int* raw_ii
+        cdef double* raw_xx
+        raw_dd = <double*>dd.data
+        raw_ii = <int*>ii.data
+        raw_xx = <double*>xx.data
+        with nogil:
+            for c in range(start, stop):
+                self.__query(
+                        raw_dd+c*k,
+                        raw_ii+c*k,
+                        raw_xx+c*self.m, 
+                        k, 
+                        eps,
+                        p, 
+                        distance_upper_bound)
+
     def query(cKDTree self, object x, int k=1, double eps=0, double p=2, 
-            double distance_upper_bound=infinity):
+            double distance_upper_bound=infinity, int n_jobs=1):
         """Query the kd-tree for nearest neighbors.
 
         Parameters
@@ -535,6 +1131,11 @@ cdef class cKDTree:
             tree searches, so if you are doing a series of nearest-neighbor
             queries, it may help to supply the distance to the nearest neighbor
             of the most recent point.
+        n_jobs : int, optional
+            Number of threads to use. The query points are split into
+            n_jobs contiguous blocks that are searched in parallel with the
+            GIL released; the results are identical to those of a serial
+            query. If -1, the number of CPUs is used. Default: 1.
 
         Returns
         -------
@@ -557,6 +1158,10 @@ cdef class cKDTree:
             raise ValueError("x must consist of vectors of length %d but has shape %s" % (self.m, np.shape(x)))
         if p<1:
             raise ValueError("Only p-norms with 1<=p<=infinity permitted")
+        if n_jobs == -1:
+            n_jobs = _cpu_count()
+        elif n_jobs < 1:
+            raise ValueError("n_jobs must be a positive integer or -1")
         if len(x.shape)==1:
             single = True
             x = x[np.newaxis,:]
@@ -570,15 +1175,18 @@ cdef class cKDTree:
         dd.fill(infinity)
         ii = np.empty((n,k),dtype='i')
         ii.fill(self.n)
-        for c in range(n):
-            self.__query(
-                    (<double*>dd.data)+c*k,
-                    (<int*>ii.data)+c*k,
-                    (<double*>xx.data)+c*self.m, 
-                    k, 
-                    eps,
-                    p, 
-                    distance_upper_bound)
+        n_jobs = min(n_jobs, n)
+        if n_jobs <= 1:
+            self._query_chunk(dd, ii, xx, 0, n,
+                              k, eps, p, distance_upper_bound)
+        else:
+            # the tree is only read during a query, so the blocks can be
+            # searched concurrently
+            bounds = [(n*c)//n_jobs for c in range(n_jobs+1)]
+            blocks = [(self, dd, ii, xx, bounds[c], bounds[c+1],
+                       k, eps, p, distance_upper_bound)
+                      for c in range(n_jobs)]
+            _run_parallel(lambda args: _query_worker(*args), blocks, n_jobs)
         if single:
             if k==1:
                 return dd[0,0], ii[0,0]
@@ -590,3 +1198,659 @@ cdef class cKDTree:
             else:
                 return np.reshape(dd,retshape+(k,)), np.reshape(ii,retshape+(k,))
 
+    # ----------------
+    # query_ball_point
+    # ----------------
+    cdef int __query_ball_point_traverse_no_checking(cKDTree self,
+                                                     list results,
+                                                     innernode* node) except -1:
+        cdef int i
+        for i in range(node.start_idx, node.end_idx):
+            results.append(self.raw_indices[i])
+        return 0
+
+    cdef int __query_ball_point_traverse_checking(cKDTree self,
+                                                  list results,
+                                                  innernode* node,
+                                                  _PointRectDistanceTracker tracker) except -1:
+        cdef int i
+        cdef double d
+        if tracker.min_distance > tracker.upper_bound*tracker.epsfac:
+            return 0
+        elif tracker.max_distance < tracker.upper_bound/tracker.epsfac:
+            self.__query_ball_point_traverse_no_checking(results, node)
+        elif node.split_dim == -1:
+            # brute-force
+            for i in range(node.start_idx, node.end_idx):
+                d = _distance_p(
+                        self.raw_data+self.raw_indices[i]*self.m,
+                        tracker.pt,tracker.p,self.m,tracker.upper_bound)
+                if d <= tracker.upper_bound:
+                    results.append(self.raw_indices[i])
+        else:
+            tracker.push_less_of(node)
+            self.__query_ball_point_traverse_checking(results, self.tree+node.less, tracker)
+            tracker.pop()
+
+            tracker.push_greater_of(node)
+            self.__query_ball_point_traverse_checking(results, self.tree+node.greater, tracker)
+            tracker.pop()
+        return 0
+
+    cdef list __query_ball_point(cKDTree self, double* x, double r,
+                                 double p, double eps):
+        cdef list results
+        cdef _PointRectDistanceTracker tracker
+        tracker = _PointRectDistanceTracker()
+        tracker.init(x, _Rectangle(self.mins, self.maxes), p, eps, r)
+        results = []
+        self.__query_ball_point_traverse_checking(results, self.tree, tracker)
+        return results
+
+    def query_ball_point(cKDTree self, object x, double r, double p=2.,
+                         double eps=0):
+        """Find all points within r of x
+
+        Parameters
+        ----------
+        x : array_like, shape tuple + (self.m,)
+            The point or points to search for neighbors of
+        r : positive float
+            The radius of points to return
+        p : float, 1<=p<=infinity
+            Which Minkowski p-norm to use
+        eps : nonnegative float
+            Approximate search. Branches of the tree are not explored
+            if their nearest points are further than r/(1+eps), and branches
+            are added in bulk if their furthest points are nearer than r*(1+eps).
+
+        Returns
+        -------
+        results : list or array of lists
+            If x is a single point, returns a list of the indices of the
+            neighbors of x. If x is an array of points, returns an object
+            array of shape tuple containing lists of neighbors.
+
+        Notes
+        -----
+        If you have many points whose neighbors you want to find, you may
+        save substantial amounts of time by putting them in a cKDTree and
+        using query_ball_tree.
+
+        """
+        cdef np.ndarray[double, ndim=1] xx
+        x = np.asarray(x).astype(np.float)
+        if x.shape[-1] != self.m:
+            raise ValueError("Searching for a %d-dimensional point in a %d-dimensional KDTree" % (x.shape[-1], self.m))
+        if len(x.shape)==1:
+            xx = np.ascontiguousarray(x)
+            return self.__query_ball_point(<double*>xx.data, r, p, eps)
+        else:
+            retshape = x.shape[:-1]
+            result = np.empty(retshape, dtype=np.object)
+            for c in np.ndindex(retshape):
+                xx = np.ascontiguousarray(x[c])
+                result[c] = self.__query_ball_point(<double*>xx.data, r, p, eps)
+            return result
+
+    # ---------------
+    # query_ball_tree
+    # ---------------
+    cdef int __query_ball_tree_traverse_no_checking(cKDTree self,
+                                                    cKDTree other,
+                                                    list results,
+                                                    innernode* node1,
+                                                    innernode* node2) except -1:
+        cdef int i, j
+        cdef list results_i
+        for i in range(node1.start_idx, node1.end_idx):
+            results_i = results[self.raw_indices[i]]
+            for j in range(node2.start_idx, node2.end_idx):
+                results_i.append(other.raw_indices[j])
+        return 0
+
+    cdef int __query_ball_tree_traverse_checking(cKDTree self,
+                                                 cKDTree other,
+                                                 list results,
+                                                 innernode* node1,
+                                                 innernode* node2,
+                                                 _RectRectDistanceTracker tracker) except -1:
+        cdef int i, j
+        cdef double d
+        cdef list results_i
+        if tracker.min_distance > tracker.upper_bound*tracker.epsfac:
+            return 0
+        elif tracker.max_distance < tracker.upper_bound/tracker.epsfac:
+            self.__query_ball_tree_traverse_no_checking(other, results, node1, node2)
+        elif node1.split_dim == -1: # 1 is a leaf node
+            if node2.split_dim == -1: # 1 & 2 are leaves
+                # brute-force
+                for i in range(node1.start_idx, node1.end_idx):
+                    results_i = results[self.raw_indices[i]]
+                    for j in range(node2.start_idx, node2.end_idx):
+                        d = _distance_p(
+                                self.raw_data+self.raw_indices[i]*self.m,
+                                other.raw_data+other.raw_indices[j]*other.m,
+                                tracker.p,self.m,tracker.upper_bound)
+                        if d <= tracker.upper_bound:
+                            results_i.append(other.raw_indices[j])
+            else: # 1 is a leaf node, 2 is inner node
+                tracker.push_less_of(2, node2)
+                self.__query_ball_tree_traverse_checking(
+                    other, results, node1, other.tree+node2.less, tracker)
+                tracker.pop()
+
+                tracker.push_greater_of(2, node2)
+                self.__query_ball_tree_traverse_checking(
+                    other, results, node1, other.tree+node2.greater, tracker)
+                tracker.pop()
+        elif node2.split_dim == -1: # 1 is an inner node, 2 is a leaf node
+            tracker.push_less_of(1, node1)
+            self.__query_ball_tree_traverse_checking(
+                other, results, self.tree+node1.less, node2, tracker)
+            tracker.pop()
+
+            tracker.push_greater_of(1, node1)
+            self.__query_ball_tree_traverse_checking(
+                other, results, self.tree+node1.greater, node2, tracker)
+            tracker.pop()
+        else: # 1 & 2 are inner nodes
+            tracker.push_less_of(1, node1)
+            tracker.push_less_of(2, node2)
+            self.__query_ball_tree_traverse_checking(
+                other, results, self.tree+node1.less, other.tree+node2.less, tracker)
+            tracker.pop()
+
+            tracker.push_greater_of(2, node2)
+            self.__query_ball_tree_traverse_checking(
+                other, results, self.tree+node1.less, other.tree+node2.greater, tracker)
+            tracker.pop()
+            tracker.pop()
+
+            tracker.push_greater_of(1, node1)
+            tracker.push_less_of(2, node2)
+            self.__query_ball_tree_traverse_checking(
+                other, results, self.tree+node1.greater, other.tree+node2.less, tracker)
+            tracker.pop()
+
+            tracker.push_greater_of(2, node2)
+            self.__query_ball_tree_traverse_checking(
+                other, results, self.tree+node1.greater, other.tree+node2.greater, tracker)
+            tracker.pop()
+            tracker.pop()
+        return 0
+
+    def query_ball_tree(cKDTree self, cKDTree other, double r, double p=2.,
+                        double eps=0):
+        """Find all pairs of points whose distance is at most r
+
+        Parameters
+        ----------
+        other : cKDTree
+            The tree containing points to search against
+        r : positive float
+            The maximum distance
+        p : float, 1<=p<=infinity
+            Which Minkowski norm to use
+        eps : nonnegative float
+            Approximate search. Branches of the tree are not explored
+            if their nearest points are further than r/(1+eps), and branches
+            are added in bulk if their furthest points are nearer than r*(1+eps).
+
+        Returns
+        -------
+        results : list of lists
+            For each element self.data[i] of this tree, results[i] is a list
+            of the indices of its neighbors in other.data.
+
+        """
+        cdef list results
+        cdef _RectRectDistanceTracker tracker
+        if self.m != other.m:
+            raise ValueError("Trees passed to query_ball_tree have different dimensionality")
+        tracker = _RectRectDistanceTracker(
+            _Rectangle(self.mins, self.maxes),
+            _Rectangle(other.mins, other.maxes),
+            p, eps, r)
+        results = [[] for i in range(self.n)]
+        self.__query_ball_tree_traverse_checking(
+            other, results, self.tree, other.tree, tracker)
+        return results
+
+    # -----------
+    # query_pairs
+    # -----------
+    cdef int __query_pairs_traverse_no_checking(cKDTree self,
+                                                set results,
+                                                innernode* node1,
+                                                innernode* node2) except -1:
+        cdef int i, j, min_j
+        if node1.split_dim == -1: # leaf node
+            if node2.split_dim == -1: # leaf node
+                # Special care to avoid duplicate pairs
+                for i in range(node1.start_idx, node1.end_idx):
+                    if node1 == node2:
+                        min_j = i+1
+                    else:
+                        min_j = node2.start_idx
+                    for j in range(min_j, node2.end_idx):
+                        self.__query_pairs_add(results,
+                                self.raw_indices[i], self.raw_indices[j])
+            else:
+                self.__query_pairs_traverse_no_checking(results, node1, self.tree+node2.less)
+                self.__query_pairs_traverse_no_checking(results, node1, self.tree+node2.greater)
+        else:
+            if node1 == node2:
+                # Avoid traversing (self.tree+node1.less, self.tree+node2.greater) and
+                # (self.tree+node1.greater, self.tree+node2.less) (it's the same node pair twice
+                # over, which is the source of the complication in the
+                # original KDTree.query_pairs)
+                self.__query_pairs_traverse_no_checking(results, self.tree+node1.less, self.tree+node2.less)
+                self.__query_pairs_traverse_no_checking(results, self.tree+node1.less, self.tree+node2.greater)
+                self.__query_pairs_traverse_no_checking(results, self.tree+node1.greater, self.tree+node2.greater)
+            else:
+                self.__query_pairs_traverse_no_checking(results, self.tree+node1.less, node2)
+                self.__query_pairs_traverse_no_checking(results, self.tree+node1.greater, node2)
+        return 0
+
+    cdef inline int __query_pairs_add(cKDTree self, set results,
+                                      int i, int j) except -1:
+        # Always add pairs as "i<j", to make sure that every pair is
+        # recorded once only
+        if i > j:
+            results.add((j,i))
+        else:
+            results.add((i,j))
+        return 0
+
+    cdef int __query_pairs_traverse_checking(cKDTree self,
+                                             set results,
+                                             innernode* node1,
+                                             innernode* node2,
+                                             _RectRectDistanceTracker tracker) except -1:
+        cdef int i, j, min_j
+        cdef double d
+        if tracker.min_distance > tracker.upper_bound*tracker.epsfac:
+            return 0
+        elif tracker.max_distance < tracker.upper_bound/tracker.epsfac:
+            self.__query_pairs_traverse_no_checking(results, node1, node2)
+        elif node1.split_dim == -1: # 1 is a leaf node
+            if node2.split_dim == -1: # 1 & 2 are leaves
+                # brute-force
+                # Special care to avoid duplicate pairs
+                for i in range(node1.start_idx, node1.end_idx):
+                    if node1 == node2:
+                        min_j = i+1
+                    else:
+                        min_j = node2.start_idx
+                    for j in range(min_j, node2.end_idx):
+                        d = _distance_p(
+                                self.raw_data+self.raw_indices[i]*self.m,
+                                self.raw_data+self.raw_indices[j]*self.m,
+                                tracker.p,self.m,tracker.upper_bound)
+                        if d <= tracker.upper_bound:
+                            self.__query_pairs_add(results,
+                                    self.raw_indices[i], self.raw_indices[j])
+            else: # 1 is a leaf node, 2 is inner node
+                tracker.push_less_of(2, node2)
+                self.__query_pairs_traverse_checking(
+                    results, node1, self.tree+node2.less, tracker)
+                tracker.pop()
+
+                tracker.push_greater_of(2, node2)
+                self.__query_pairs_traverse_checking(
+                    results, node1, self.tree+node2.greater, tracker)
+                tracker.pop()
+        elif node2.split_dim == -1: # 1 is an inner node, 2 is a leaf node
+            tracker.push_less_of(1, node1)
+            self.__query_pairs_traverse_checking(
+                results, self.tree+node1.less, node2, tracker)
+            tracker.pop()
+
+            tracker.push_greater_of(1, node1)
+            self.__query_pairs_traverse_checking(
+                results, self.tree+node1.greater, node2, tracker)
+            tracker.pop()
+        else: # 1 and 2 are inner nodes
+            tracker.push_less_of(1, node1)
+            tracker.push_less_of(2, node2)
+            self.__query_pairs_traverse_checking(
+                results, self.tree+node1.less, self.tree+node2.less, tracker)
+            tracker.pop()
+
+            tracker.push_greater_of(2, node2)
+            self.__query_pairs_traverse_checking(
+                results, self.tree+node1.less, self.tree+node2.greater, tracker)
+            tracker.pop()
+            tracker.pop()
+
+            tracker.push_greater_of(1, node1)
+            if node1 != node2:
+                # Avoid traversing (self.tree+node1.less, self.tree+node2.greater) and
+                # (self.tree+node1.greater, self.tree+node2.less) (it's the same node pair
+                # twice over)
+                tracker.push_less_of(2, node2)
+                self.__query_pairs_traverse_checking(
+                    results, self.tree+node1.greater, self.tree+node2.less, tracker)
+                tracker.pop()
+
+            tracker.push_greater_of(2, node2)
+            self.__query_pairs_traverse_checking(
+                results, self.tree+node1.greater, self.tree+node2.greater, tracker)
+            tracker.pop()
+            tracker.pop()
+        return 0
+
+    def query_pairs(cKDTree self, double r, double p=2., double eps=0):
+        """Find all pairs of points whose distance is at most r
+
+        Parameters
+        ----------
+        r : positive float
+            The maximum distance
+        p : float, 1<=p<=infinity
+            Which Minkowski norm to use
+        eps : nonnegative float
+            Approximate search. Branches of the tree are not explored
+            if their nearest points are further than r/(1+eps), and branches
+            are added in bulk if their furthest points are nearer than r*(1+eps).
+
+        Returns
+        -------
+        results : set
+            set of pairs (i,j), i<j, for which the corresponding positions
+            are close.
+
+        """
+        cdef set results
+        cdef _RectRectDistanceTracker tracker
+        tracker = _RectRectDistanceTracker(
+            _Rectangle(self.mins, self.maxes),
+            _Rectangle(self.mins, self.maxes),
+            p, eps, r)
+        results = set()
+        self.__query_pairs_traverse_checking(
+            results, self.tree, self.tree, tracker)
+        return results
+
+    # ---------------
+    # count_neighbors
+    # ---------------
+    cdef int __count_neighbors_traverse(cKDTree self,
+                                        cKDTree other,
+                                        innernode* node1,
+                                        innernode* node2,
+                                        _RectRectDistanceTracker tracker,
+                                        int start, int end,
+                                        double* r,
+                                        np.intp_t* diff) except -1:
+        # r[start:end] holds the sorted radii (as distance**p) for which
+        # this node pair is undecided. Counts are accumulated in diff as
+        # "add c to every radius from here on", so that the final counts
+        # are the cumulative sum of diff.
+        cdef int i, j, k, lo, hi
+        cdef np.intp_t c
+        cdef double d, ub
+
+        # radii smaller than the minimum distance count nothing here,
+        # radii larger than the maximum distance count every pair
+        lo = _bisect_left(r, tracker.min_distance, start, end)
+        hi = _bisect_right(r, tracker.max_distance, lo, end)
+        if hi < end:
+            c = (<np.intp_t>node1.n_points)*node2.n_points
+            diff[hi] += c
+            diff[end] -= c
+        if lo == hi:
+            return 0
+
+        if node1.split_dim == -1: # 1 is a leaf node
+            if node2.split_dim == -1: # 1 & 2 are leaves
+                # brute-force
+                ub = r[hi-1]
+                for i in range(node1.start_idx, node1.end_idx):
+                    for j in range(node2.start_idx, node2.end_idx):
+                        d = _distance_p(
+                                self.raw_data+self.raw_indices[i]*self.m,
+                                other.raw_data+other.raw_indices[j]*other.m,
+                                tracker.p,self.m,ub)
+                        if d <= ub:
+                            k = _bisect_left(r, d, lo, hi)
+                            diff[k] += 1
+                            diff[hi] -= 1
+            else: # 1 is a leaf node, 2 is inner node
+                tracker.push_less_of(2, node2)
+                self.__count_neighbors_traverse(
+                    other, node1, other.tree+node2.less, tracker, lo, hi, r, diff)
+                tracker.pop()
+
+                tracker.push_greater_of(2, node2)
+                self.__count_neighbors_traverse(
+                    other, node1, other.tree+node2.greater, tracker, lo, hi, r, diff)
+                tracker.pop()
+        elif node2.split_dim == -1: # 1 is an inner node, 2 is a leaf node
+            tracker.push_less_of(1, node1)
+            self.__count_neighbors_traverse(
+                other, self.tree+node1.less, node2, tracker, lo, hi, r, diff)
+            tracker.pop()
+
+            tracker.push_greater_of(1, node1)
+            self.__count_neighbors_traverse(
+                other, self.tree+node1.greater, node2, tracker, lo, hi, r, diff)
+            tracker.pop()
+        else: # 1 and 2 are inner nodes
+            tracker.push_less_of(1, node1)
+            tracker.push_less_of(2, node2)
+            self.__count_neighbors_traverse(
+                other, self.tree+node1.less, other.tree+node2.less, tracker, lo, hi, r, diff)
+            tracker.pop()
+
+            tracker.push_greater_of(2, node2)
+            self.__count_neighbors_traverse(
+                other, self.tree+node1.less, other.tree+node2.greater, tracker, lo, hi, r, diff)
+            tracker.pop()
+            tracker.pop()
+
+            tracker.push_greater_of(1, node1)
+            tracker.push_less_of(2, node2)
+            self.__count_neighbors_traverse(
+                other, self.tree+node1.greater, other.tree+node2.less, tracker, lo, hi, r, diff)
+            tracker.pop()
+
+            tracker.push_greater_of(2, node2)
+            self.__count_neighbors_traverse(
+                other, self.tree+node1.greater, other.tree+node2.greater, tracker, lo, hi, r, diff)
+            tracker.pop()
+            tracker.pop()
+        return 0
+
+    def count_neighbors(cKDTree self, cKDTree other, object r, double p=2.):
+        """Count how many nearby pairs can be formed.
+
+        Count the number of pairs (x1,x2) can be formed, with x1 drawn
+        from self and x2 drawn from other, and where distance(x1,x2,p)<=r.
+        This is the "two-point correlation" described in Gray and Moore 2000,
+        "N-body problems in statistical learning", and the code here is based
+        on their algorithm.
+
+        Parameters
+        ----------
+        other : cKDTree
+        r : float or one-dimensional array of floats
+            The radius to produce a count for. Multiple radii are searched
+            with a single tree traversal.
+        p : float, 1<=p<=infinity
+            Which Minkowski p-norm to use
+
+        Returns
+        -------
+        result : integer or one-dimensional array of integers
+            The number of pairs.
+
+        """
+        cdef int n_queries
+        cdef np.ndarray[double, ndim=1] real_r
+        cdef np.ndarray[np.intp_t, ndim=1] diff
+        cdef _RectRectDistanceTracker tracker
+
+        if self.m != other.m:
+            raise ValueError("Trees passed to count_neighbors have different dimensionality")
+
+        if np.shape(r) == ():
+            real_r = np.array([r], dtype=np.float)
+        elif len(np.shape(r))==1:
+            real_r = np.array(r, dtype=np.float)
+        else:
+            raise ValueError("r must be either a single value or a one-dimensional array of values")
+        n_queries = real_r.shape[0]
+
+        # the traversal narrows down a contiguous range of sorted radii
+        order = np.argsort(real_r, kind='mergesort')
+        real_r = np.ascontiguousarray(real_r[order])
+        # internally we represent all distances as distance**p
+        if p!=1 and p!=infinity:
+            real_r = np.where(real_r>0, np.abs(real_r)**p, real_r)
+
+        tracker = _RectRectDistanceTracker(
+            _Rectangle(self.mins, self.maxes),
+            _Rectangle(other.mins, other.maxes),
+            p, 0.0, 0.0)
+        diff = np.zeros(n_queries+1, dtype=np.intp)
+        self.__count_neighbors_traverse(other, self.tree, other.tree, tracker,
+                                        0, n_queries, <double*>real_r.data,
+                                        <np.intp_t*>diff.data)
+
+        results = np.empty(n_queries, dtype=int)
+        results[order] = np.cumsum(diff[:-1])
+        if np.shape(r) == ():
+            return results[0]
+        else:
+            return results
+
+    # ----------------------
+    # sparse_distance_matrix
+    # ----------------------
+    cdef int __sparse_distance_matrix_traverse(cKDTree self,
+                                               cKDTree other,
+                                               list results_i,
+                                               list results_j,
+                                               list results_d,
+                                               innernode* node1,
+                                               innernode* node2,
+                                               _RectRectDistanceTracker tracker) except -1:
+        cdef int i, j
+        cdef double d
+        if tracker.min_distance > tracker.upper_bound:
+            return 0
+        elif node1.split_dim == -1: # 1 is a leaf node
+            if node2.split_dim == -1: # 1 & 2 are leaves
+                # brute-force
+                for i in range(node1.start_idx, node1.end_idx):
+                    for j in range(node2.start_idx, node2.end_idx):
+                        d = _distance_p(
+                                self.raw_data+self.raw_indices[i]*self.m,
+                                other.raw_data+other.raw_indices[j]*other.m,
+                                tracker.p,self.m,tracker.upper_bound)
+                        # zero distances are not stored in the sparse
+                        # matrix, just as for KDTree
+                        if d <= tracker.upper_bound and d != 0:
+                            if tracker.p!=1 and tracker.p!=infinity:
+                                d = d**(1./tracker.p)
+                            results_i.append(self.raw_indices[i])
+                            results_j.append(other.raw_indices[j])
+                            results_d.append(d)
+            else: # 1 is a leaf node, 2 is inner node
+                tracker.push_less_of(2, node2)
+                self.__sparse_distance_matrix_traverse(
+                    other, results_i, results_j, results_d,
+                    node1, other.tree+node2.less, tracker)
+                tracker.pop()
+
+                tracker.push_greater_of(2, node2)
+                self.__sparse_distance_matrix_traverse(
+                    other, results_i, results_j, results_d,
+                    node1, other.tree+node2.greater, tracker)
+                tracker.pop()
+        elif node2.split_dim == -1: # 1 is an inner node, 2 is a leaf node
+            tracker.push_less_of(1, node1)
+            self.__sparse_distance_matrix_traverse(
+                other, results_i, results_j, results_d,
+                self.tree+node1.less, node2, tracker)
+            tracker.pop()
+
+            tracker.push_greater_of(1, node1)
+            self.__sparse_distance_matrix_traverse(
+                other, results_i, results_j, results_d,
+                self.tree+node1.greater, node2, tracker)
+            tracker.pop()
+        else: # 1 and 2 are inner nodes
+            tracker.push_less_of(1, node1)
+            tracker.push_less_of(2, node2)
+            self.__sparse_distance_matrix_traverse(
+                other, results_i, results_j, results_d,
+                self.tree+node1.less, other.tree+node2.less, tracker)
+            tracker.pop()
+
+            tracker.push_greater_of(2, node2)
+            self.__sparse_distance_matrix_traverse(
+                other, results_i, results_j, results_d,
+                self.tree+node1.less, other.tree+node2.greater, tracker)
+            tracker.pop()
+            tracker.pop()
+
+            tracker.push_greater_of(1, node1)
+            tracker.push_less_of(2, node2)
+            self.__sparse_distance_matrix_traverse(
+                other, results_i, results_j, results_d,
+                self.tree+node1.greater, other.tree+node2.less, tracker)
+            tracker.pop()
+
+            tracker.push_greater_of(2, node2)
+            self.__sparse_distance_matrix_traverse(
+                other, results_i, results_j, results_d,
+                self.tree+node1.greater, other.tree+node2.greater, tracker)
+            tracker.pop()
+            tracker.pop()
+        return 0
+
+    def sparse_distance_matrix(cKDTree self, cKDTree other,
+                               double max_distance, double p=2.):
+        """Compute a sparse distance matrix
+
+        Computes a distance matrix between two cKDTrees, leaving as zero
+        any distance greater than max_distance.
+
+        Parameters
+        ----------
+        other : cKDTree
+        max_distance : positive float
+        p : float, 1<=p<=infinity
+            Which Minkowski p-norm to use
+
+        Returns
+        -------
+        result : dok_matrix
+            Sparse matrix representing the results in "dictionary of keys"
+            format.
+
+        """
+        cdef list results_i, results_j, results_d
+        cdef _RectRectDistanceTracker tracker
+        if self.m != other.m:
+            raise ValueError("Trees passed to sparse_distance_matrix have different dimensionality")
+        tracker = _RectRectDistanceTracker(
+            _Rectangle(self.mins, self.maxes),
+            _Rectangle(other.mins, other.maxes),
+            p, 0.0, max_distance)
+        results_i = []
+        results_j = []
+        results_d = []
+        self.__sparse_distance_matrix_traverse(
+            other, results_i, results_j, results_d,
+            self.tree, other.tree, tracker)
+
+        return scipy.sparse.coo_matrix(
+            (np.array(results_d, dtype=np.float),
+             (np.array(results_i, dtype=np.intc),
+              np.array(results_j, dtype=np.intc))),
+            shape=(self.n, other.n)).todok()
+
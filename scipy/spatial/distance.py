@@ -16,6 +16,9 @@ stored in a rectangular array.
 
    pdist   -- pairwise distances between observation vectors.
    cdist   -- distances between between two collections of observation vectors
+   pdist_blocks -- pairwise distances computed in blocks
+   cdist_blocks -- distances between two collections computed in blocks
+   cdist_sparse -- sparse matrix of the distances below a cutoff
    squareform -- convert distance matrix to a condensed one and vice versa
 
 Predicates for checking the validity of distance matrices, both
@@ -112,6 +115,7 @@ Copyright (C) Damian Eads, 2007-2008. New BSD License.
 
 import warnings
 import numpy as np
+import scipy.sparse
 
 import _distance_wrap
 
@@ -851,6 +855,53 @@ def sokalsneath(u, v):
     return float(2.0 * (ntf + nft)) / denom
 
 
+# Distance functions whose values are computed by the compiled code of a
+# metric name in pdist and cdist.
+_compiled_metrics = {braycurtis: 'braycurtis',
+                     canberra: 'canberra',
+                     chebyshev: 'chebyshev',
+                     cityblock: 'cityblock',
+                     correlation: 'correlation',
+                     cosine: 'cosine',
+                     euclidean: 'euclidean',
+                     hamming: 'hamming',
+                     jaccard: 'jaccard',
+                     mahalanobis: 'mahalanobis',
+                     minkowski: 'minkowski',
+                     seuclidean: 'seuclidean',
+                     sqeuclidean: 'sqeuclidean',
+                     wminkowski: 'wminkowski'}
+
+# The boolean dissimilarities agree with their compiled versions only when
+# the observations are boolean.
+_compiled_bool_metrics = {dice: 'dice',
+                          kulsinski: 'kulsinski',
+                          matching: 'matching',
+                          rogerstanimoto: 'rogerstanimoto',
+                          russellrao: 'russellrao',
+                          sokalmichener: 'sokalmichener',
+                          sokalsneath: 'sokalsneath',
+                          yule: 'yule'}
+
+def _compiled_metric_name(metric, *arrays):
+    """
+    Returns the metric name under which pdist and cdist compute the
+    distance function ``metric`` in C, or ``metric`` itself if it has
+    no compiled version.
+    """
+    try:
+        if metric in _compiled_metrics:
+            return _compiled_metrics[metric]
+        if metric in _compiled_bool_metrics:
+            for X in arrays:
+                if not np.all((X == 0) | (X == 1)):
+                    return metric
+            return _compiled_bool_metrics[metric]
+    except TypeError:
+        # unhashable callable
+        pass
+    return metric
+
 def pdist(X, metric='euclidean', p=2, w=None, V=None, VI=None):
     r"""
     Computes the pairwise distances between m original observations in
@@ -1030,18 +1081,17 @@ def pdist(X, metric='euclidean', p=2, w=None, V=None, VI=None):
 
          dm = pdist(X, (lambda u, v: np.sqrt(((u-v)*(u-v).T).sum())))
 
-       Note that you should avoid passing a reference to one of
-       the distance functions defined in this library. For example,::
+       Passing a reference to one of the distance functions defined
+       in this library is equivalent to passing its name, so that::
 
          dm = pdist(X, sokalsneath)
 
-       would calculate the pair-wise distances between the vectors in
-       X using the Python function sokalsneath. This would result in
-       sokalsneath being called :math:`{n \choose 2}` times, which
-       is inefficient. Instead, the optimized C version is more
-       efficient, and we call it using the following syntax.::
-
-         dm = pdist(X, 'sokalsneath')
+       calls the optimized C version like ``pdist(X, 'sokalsneath')``
+       does instead of calling the Python function sokalsneath
+       :math:`{n \choose 2}` times. The boolean dissimilarities
+       (``dice``, ``kulsinski``, ``matching``, ``rogerstanimoto``,
+       ``russellrao``, ``sokalmichener``, ``sokalsneath`` and ``yule``)
+       are only dispatched to C when X contains just zeros and ones.
 
     Parameters
     ----------
@@ -1101,16 +1151,12 @@ def pdist(X, metric='euclidean', p=2, w=None, V=None, VI=None):
                             'vector `w` to be given.')
 
     if callable(metric):
-        if metric == minkowski:
-            def dfun(u,v): return minkowski(u, v, p)
-        elif metric == wminkowski:
-            def dfun(u,v): return wminkowski(u, v, p, w)
-        elif metric == seuclidean:
-            def dfun(u,v): return seuclidean(u, v, V)
-        elif metric == mahalanobis:
-            def dfun(u,v): return mahalanobis(u, v, V)
-        else:
-            dfun = metric
+        # The distance functions of this module are computed by the
+        # compiled code used for the equivalent metric names.
+        metric = _compiled_metric_name(metric, X)
+
+    if callable(metric):
+        dfun = metric
 
         k = 0
         for i in xrange(0, m - 1):
@@ -1222,7 +1268,7 @@ def pdist(X, metric='euclidean', p=2, w=None, V=None, VI=None):
         elif mstr == 'sokalsneath':
             _distance_wrap.pdist_sokalsneath_bool_wrap(_convert_to_bool(X), dm)
         elif metric == 'test_euclidean':
-            dm = pdist(X, euclidean)
+            dm = pdist(X, lambda u, v: euclidean(u, v))
         elif metric == 'test_sqeuclidean':
             if V is None:
                 V = np.var(X, axis=0, ddof=1)
@@ -1230,7 +1276,7 @@ def pdist(X, metric='euclidean', p=2, w=None, V=None, VI=None):
                 V = np.asarray(V, order='c')
             dm = pdist(X, lambda u, v: seuclidean(u, v, V))
         elif metric == 'test_braycurtis':
-            dm = pdist(X, braycurtis)
+            dm = pdist(X, lambda u, v: braycurtis(u, v))
         elif metric == 'test_mahalanobis':
             if VI is None:
                 V = np.cov(X.T)
@@ -1241,39 +1287,39 @@ def pdist(X, metric='euclidean', p=2, w=None, V=None, VI=None):
             # (u-v)V^(-1)(u-v)^T
             dm = pdist(X, (lambda u, v: mahalanobis(u, v, VI)))
         elif metric == 'test_canberra':
-            dm = pdist(X, canberra)
+            dm = pdist(X, lambda u, v: canberra(u, v))
         elif metric == 'test_cityblock':
-            dm = pdist(X, cityblock)
+            dm = pdist(X, lambda u, v: cityblock(u, v))
         elif metric == 'test_minkowski':
-            dm = pdist(X, minkowski, p=p)
+            dm = pdist(X, lambda u, v: minkowski(u, v, p))
         elif metric == 'test_wminkowski':
-            dm = pdist(X, wminkowski, p=p, w=w)
+            dm = pdist(X, lambda u, v: wminkowski(u, v, p, w))
         elif metric == 'test_cosine':
-            dm = pdist(X, cosine)
+            dm = pdist(X, lambda u, v: cosine(u, v))
         elif metric == 'test_correlation':
-            dm = pdist(X, correlation)
+            dm = pdist(X, lambda u, v: correlation(u, v))
         elif metric == 'test_hamming':
-            dm = pdist(X, hamming)
+            dm = pdist(X, lambda u, v: hamming(u, v))
         elif metric == 'test_jaccard':
-            dm = pdist(X, jaccard)
+            dm = pdist(X, lambda u, v: jaccard(u, v))
         elif metric == 'test_chebyshev' or metric == 'test_chebychev':
-            dm = pdist(X, chebyshev)
+            dm = pdist(X, lambda u, v: chebyshev(u, v))
         elif metric == 'test_yule':
-            dm = pdist(X, yule)
+            dm = pdist(X, lambda u, v: yule(u, v))
         elif metric == 'test_matching':
-            dm = pdist(X, matching)
+            dm = pdist(X, lambda u, v: matching(u, v))
         elif metric == 'test_dice':
-            dm = pdist(X, dice)
+            dm = pdist(X, lambda u, v: dice(u, v))
         elif metric == 'test_kulsinski':
-            dm = pdist(X, kulsinski)
+            dm = pdist(X, lambda u, v: kulsinski(u, v))
         elif metric == 'test_rogerstanimoto':
-            dm = pdist(X, rogerstanimoto)
+            dm = pdist(X, lambda u, v: rogerstanimoto(u, v))
         elif metric == 'test_russellrao':
-            dm = pdist(X, russellrao)
+            dm = pdist(X, lambda u, v: russellrao(u, v))
         elif metric == 'test_sokalsneath':
-            dm = pdist(X, sokalsneath)
+            dm = pdist(X, lambda u, v: sokalsneath(u, v))
         elif metric == 'test_sokalmichener':
-            dm = pdist(X, sokalmichener)
+            dm = pdist(X, lambda u, v: sokalmichener(u, v))
         else:
             raise ValueError('Unknown Distance Metric: %s' % mstr)
     else:
@@ -1767,18 +1813,18 @@ def cdist(XA, XB, metric='euclidean', p=2, V=None, VI=None, w=None):
 
          dm = cdist(XA, XB, (lambda u, v: np.sqrt(((u-v)*(u-v).T).sum())))
 
-       Note that you should avoid passing a reference to one of
-       the distance functions defined in this library. For example,::
+       Passing a reference to one of the distance functions defined
+       in this library is equivalent to passing its name, so that::
 
          dm = cdist(XA, XB, sokalsneath)
 
-       would calculate the pair-wise distances between the vectors in
-       X using the Python function sokalsneath. This would result in
-       sokalsneath being called :math:`{n \choose 2}` times, which
-       is inefficient. Instead, the optimized C version is more
-       efficient, and we call it using the following syntax.::
-
-         dm = cdist(XA, XB, 'sokalsneath')
+       calls the optimized C version like
+       ``cdist(XA, XB, 'sokalsneath')`` does instead of calling the
+       Python function sokalsneath :math:`m_A \cdot m_B` times. The
+       boolean dissimilarities (``dice``, ``kulsinski``, ``matching``,
+       ``rogerstanimoto``, ``russellrao``, ``sokalmichener``,
+       ``sokalsneath`` and ``yule``) are only dispatched to C when XA
+       and XB contain just zeros and ones.
 
     Parameters
     ----------
@@ -1847,26 +1893,14 @@ def cdist(XA, XB, metric='euclidean', p=2, V=None, VI=None, w=None):
     dm = np.zeros((mA, mB), dtype=np.double)
 
     if callable(metric):
-        if metric == minkowski:
-            for i in xrange(0, mA):
-                for j in xrange(0, mB):
-                    dm[i, j] = minkowski(XA[i, :], XB[j, :], p)
-        elif metric == wminkowski:
-            for i in xrange(0, mA):
-                for j in xrange(0, mB):
-                    dm[i, j] = wminkowski(XA[i, :], XB[j, :], p, w)
-        elif metric == seuclidean:
-            for i in xrange(0, mA):
-                for j in xrange(0, mB):
-                    dm[i, j] = seuclidean(XA[i, :], XB[j, :], V)
-        elif metric == mahalanobis:
-            for i in xrange(0, mA):
-                for j in xrange(0, mB):
-                    dm[i, j] = mahalanobis(XA[i, :], XB[j, :], V)
-        else:
-            for i in xrange(0, mA):
-                for j in xrange(0, mB):
-                    dm[i, j] = metric(XA[i, :], XB[j, :])
+        # The distance functions of this module are computed by the
+        # compiled code used for the equivalent metric names.
+        metric = _compiled_metric_name(metric, XA, XB)
+
+    if callable(metric):
+        for i in xrange(0, mA):
+            for j in xrange(0, mB):
+                dm[i, j] = metric(XA[i, :], XB[j, :])
     elif isinstance(metric,basestring):
         mstr = metric.lower()
 
@@ -1905,7 +1939,7 @@ def cdist(XA, XB, metric='euclidean', p=2, V=None, VI=None, w=None):
                                                 _convert_to_double(XB), dm, p)
         elif mstr in set(['wminkowski', 'wmi', 'wm', 'wpnorm']):
             _distance_wrap.cdist_weighted_minkowski_wrap(_convert_to_double(XA),
-                                                         _convert_to_double(XB), dm, p, _convert_to_double(w))
+                                                         _convert_to_double(XB), dm, p, _convert_to_double(np.asarray(w)))
         elif mstr in set(['seuclidean', 'se', 's']):
             if V is not None:
                 V = np.asarray(V, order='c')
@@ -1996,7 +2030,7 @@ def cdist(XA, XB, metric='euclidean', p=2, V=None, VI=None, w=None):
             _distance_wrap.cdist_sokalsneath_bool_wrap(_convert_to_bool(XA),
                                                        _convert_to_bool(XB), dm)
         elif metric == 'test_euclidean':
-            dm = cdist(XA, XB, euclidean)
+            dm = cdist(XA, XB, lambda u, v: euclidean(u, v))
         elif metric == 'test_seuclidean':
             if V is None:
                 V = np.var(np.vstack([XA, XB]), axis=0, ddof=1)
@@ -2006,7 +2040,7 @@ def cdist(XA, XB, metric='euclidean', p=2, V=None, VI=None, w=None):
         elif metric == 'test_sqeuclidean':
             dm = cdist(XA, XB, lambda u, v: sqeuclidean(u, v))
         elif metric == 'test_braycurtis':
-            dm = cdist(XA, XB, braycurtis)
+            dm = cdist(XA, XB, lambda u, v: braycurtis(u, v))
         elif metric == 'test_mahalanobis':
             if VI is None:
                 X = np.vstack([XA, XB])
@@ -2020,41 +2054,233 @@ def cdist(XA, XB, metric='euclidean', p=2, V=None, VI=None, w=None):
             # (u-v)V^(-1)(u-v)^T
             dm = cdist(XA, XB, (lambda u, v: mahalanobis(u, v, VI)))
         elif metric == 'test_canberra':
-            dm = cdist(XA, XB, canberra)
+            dm = cdist(XA, XB, lambda u, v: canberra(u, v))
         elif metric == 'test_cityblock':
-            dm = cdist(XA, XB, cityblock)
+            dm = cdist(XA, XB, lambda u, v: cityblock(u, v))
         elif metric == 'test_minkowski':
-            dm = cdist(XA, XB, minkowski, p=p)
+            dm = cdist(XA, XB, lambda u, v: minkowski(u, v, p))
         elif metric == 'test_wminkowski':
-            dm = cdist(XA, XB, wminkowski, p=p, w=w)
+            dm = cdist(XA, XB, lambda u, v: wminkowski(u, v, p, w))
         elif metric == 'test_cosine':
-            dm = cdist(XA, XB, cosine)
+            dm = cdist(XA, XB, lambda u, v: cosine(u, v))
         elif metric == 'test_correlation':
-            dm = cdist(XA, XB, correlation)
+            dm = cdist(XA, XB, lambda u, v: correlation(u, v))
         elif metric == 'test_hamming':
-            dm = cdist(XA, XB, hamming)
+            dm = cdist(XA, XB, lambda u, v: hamming(u, v))
         elif metric == 'test_jaccard':
-            dm = cdist(XA, XB, jaccard)
+            dm = cdist(XA, XB, lambda u, v: jaccard(u, v))
         elif metric == 'test_chebyshev' or metric == 'test_chebychev':
-            dm = cdist(XA, XB, chebyshev)
+            dm = cdist(XA, XB, lambda u, v: chebyshev(u, v))
         elif metric == 'test_yule':
-            dm = cdist(XA, XB, yule)
+            dm = cdist(XA, XB, lambda u, v: yule(u, v))
         elif metric == 'test_matching':
-            dm = cdist(XA, XB, matching)
+            dm = cdist(XA, XB, lambda u, v: matching(u, v))
         elif metric == 'test_dice':
-            dm = cdist(XA, XB, dice)
+            dm = cdist(XA, XB, lambda u, v: dice(u, v))
         elif metric == 'test_kulsinski':
-            dm = cdist(XA, XB, kulsinski)
+            dm = cdist(XA, XB, lambda u, v: kulsinski(u, v))
         elif metric == 'test_rogerstanimoto':
-            dm = cdist(XA, XB, rogerstanimoto)
+            dm = cdist(XA, XB, lambda u, v: rogerstanimoto(u, v))
         elif metric == 'test_russellrao':
-            dm = cdist(XA, XB, russellrao)
+            dm = cdist(XA, XB, lambda u, v: russellrao(u, v))
         elif metric == 'test_sokalsneath':
-            dm = cdist(XA, XB, sokalsneath)
+            dm = cdist(XA, XB, lambda u, v: sokalsneath(u, v))
         elif metric == 'test_sokalmichener':
-            dm = cdist(XA, XB, sokalmichener)
+            dm = cdist(XA, XB, lambda u, v: sokalmichener(u, v))
         else:
             raise ValueError('Unknown Distance Metric: %s' % mstr)
     else:
         raise TypeError('2nd argument metric must be a string identifier or a function.')
     return dm
+
+def _block_metric_params(metric, Xs, V, VI):
+    """
+    Computes the default variance vector V and inverse covariance matrix
+    VI of the observations in the arrays Xs once, so that every block of
+    a blockwise distance computation uses the same parameters.  The
+    arrays are only stacked for the metrics that need them.
+    """
+    if callable(metric):
+        metric = _compiled_metric_name(metric)
+    if isinstance(metric, basestring):
+        mstr = metric.lower()
+        if V is None and mstr in set(['seuclidean', 'se', 's']):
+            V = np.var(_stack(Xs), axis=0, ddof=1)
+        elif VI is None and mstr in set(['mahalanobis', 'mahal', 'mah']):
+            VI = np.linalg.inv(np.cov(_stack(Xs).T)).T.copy()
+    return V, VI
+
+def _stack(Xs):
+    if len(Xs) == 1:
+        return Xs[0]
+    return np.vstack(Xs)
+
+def _block_rows(block_size, n):
+    if block_size is None:
+        # Blocks of about 4M distances (32 MB of doubles).
+        return max(1, (1 << 22) // max(n, 1))
+    block_size = int(block_size)
+    if block_size < 1:
+        raise ValueError('block_size must be a positive integer.')
+    return block_size
+
+def cdist_blocks(XA, XB, metric='euclidean', p=2, V=None, VI=None, w=None,
+                 block_size=None):
+    """
+    Computes the distance matrix of ``cdist`` in blocks of rows.
+
+    The distances between the rows of XA and all the rows of XB are
+    generated ``block_size`` rows of XA at a time, so that distance
+    matrices which do not fit into memory can be processed piecewise.
+
+    Parameters
+    ----------
+    XA : ndarray
+        An :math:`m_A` by :math:`n` array of :math:`m_A`
+        original observations in an :math:`n`-dimensional space.
+    XB : ndarray
+        An :math:`m_B` by :math:`n` array of :math:`m_B`
+        original observations in an :math:`n`-dimensional space.
+    metric, p, V, VI, w :
+        The distance metric and its parameters, as in ``cdist``. The
+        default V of 'seuclidean' and VI of 'mahalanobis' are computed
+        once from all of XA and XB.
+    block_size : int, optional
+        The number of rows of XA per block. By default the blocks hold
+        about :math:`2^{22}` distances.
+
+    Returns
+    -------
+    blocks : generator
+        Yields tuples ``(start, D)`` where ``D`` is the
+        :math:`k` by :math:`m_B` array ``cdist(XA, XB, ...)[start:start+k]``.
+
+    Examples
+    --------
+    >>> XA = np.random.rand(1000, 3)
+    >>> XB = np.random.rand(200, 3)
+    >>> nearest = np.empty(1000, dtype=int)
+    >>> for start, D in cdist_blocks(XA, XB, block_size=100):
+    ...     nearest[start:start + D.shape[0]] = D.argmin(axis=1)
+
+    """
+    XA = np.asarray(XA, order='c')
+    XB = np.asarray(XB, order='c')
+    if len(XA.shape) != 2:
+        raise ValueError('XA must be a 2-dimensional array.')
+    if len(XB.shape) != 2:
+        raise ValueError('XB must be a 2-dimensional array.')
+    V, VI = _block_metric_params(metric, [XA, XB], V, VI)
+    mA = XA.shape[0]
+    step = _block_rows(block_size, XB.shape[0])
+    for start in xrange(0, mA, step):
+        yield start, cdist(XA[start:start + step], XB, metric, p=p, V=V,
+                           VI=VI, w=w)
+
+def pdist_blocks(X, metric='euclidean', p=2, w=None, V=None, VI=None,
+                 block_size=None):
+    """
+    Computes the condensed distance matrix of ``pdist`` in blocks.
+
+    The condensed distance matrix is generated in consecutive segments
+    holding the distances of ``block_size`` observations to all the
+    observations that follow them, so that distance matrices which do not
+    fit into memory can be processed piecewise.
+
+    Parameters
+    ----------
+    X : ndarray
+        An :math:`m` by :math:`n` array of :math:`m` original observations
+        in an :math:`n`-dimensional space.
+    metric, p, w, V, VI :
+        The distance metric and its parameters, as in ``pdist``. The
+        default V of 'seuclidean' and VI of 'mahalanobis' are computed
+        once from all of X.
+    block_size : int, optional
+        The number of observations per block. By default the blocks hold
+        at most about :math:`2^{22}` distances.
+
+    Returns
+    -------
+    blocks : generator
+        Yields tuples ``(k, Y)`` where ``Y`` is the segment
+        ``pdist(X, ...)[k:k+len(Y)]`` of the condensed distance matrix.
+
+    """
+    X = np.asarray(X, order='c')
+    if len(X.shape) != 2:
+        raise ValueError('A 2-dimensional array must be passed.')
+    V, VI = _block_metric_params(metric, [X], V, VI)
+    m = X.shape[0]
+    step = _block_rows(block_size, m)
+    offset = 0
+    for a in xrange(0, m - 1, step):
+        b = min(a + step, m - 1)
+        D = cdist(X[a:b], X[a + 1:], metric, p=p, V=V, VI=VI, w=w)
+        Y = np.concatenate([D[i, i:] for i in xrange(b - a)])
+        yield offset, Y
+        offset += Y.shape[0]
+
+def cdist_sparse(XA, XB, max_distance, metric='euclidean', p=2, V=None,
+                 VI=None, w=None, format='coo', block_size=None):
+    """
+    Computes the distances of ``cdist`` that do not exceed a cutoff.
+
+    The distance matrix is computed in blocks of rows with
+    ``cdist_blocks`` and only the pairs within ``max_distance`` are kept,
+    so the dense :math:`m_A` by :math:`m_B` matrix is never allocated.
+    Any metric accepted by ``cdist`` can be used.
+
+    Parameters
+    ----------
+    XA : ndarray
+        An :math:`m_A` by :math:`n` array of :math:`m_A`
+        original observations in an :math:`n`-dimensional space.
+    XB : ndarray
+        An :math:`m_B` by :math:`n` array of :math:`m_B`
+        original observations in an :math:`n`-dimensional space.
+    max_distance : double
+        Only distances ``d <= max_distance`` are returned.
+    metric, p, V, VI, w :
+        The distance metric and its parameters, as in ``cdist``.
+    format : str, optional
+        The sparse matrix format of the result, 'coo' (the default),
+        'csr' or any other format accepted by ``spmatrix.asformat``.
+    block_size : int, optional
+        The number of rows of XA per block, as in ``cdist_blocks``.
+
+    Returns
+    -------
+    D : sparse matrix
+        An :math:`m_A` by :math:`m_B` sparse matrix. Its entry
+        ``(i, j)`` is the distance between ``XA[i]`` and ``XB[j]`` if that
+        distance is at most ``max_distance``. Such pairs at distance
+        zero are stored as explicit zeros.
+
+    See Also
+    --------
+    cKDTree.sparse_distance_matrix : the same for Minkowski distances,
+                                     using a kd-tree
+
+    """
+    XA = np.asarray(XA)
+    XB = np.asarray(XB)
+    rows = []
+    cols = []
+    data = []
+    for start, D in cdist_blocks(XA, XB, metric, p=p, V=V, VI=VI, w=w,
+                                 block_size=block_size):
+        i, j = np.nonzero(D <= max_distance)
+        rows.append(i + start)
+        cols.append(j)
+        data.append(D[i, j])
+    if len(data) == 0:
+        rows = cols = np.zeros(0, dtype=np.intc)
+        data = np.zeros(0, dtype=np.double)
+    else:
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+        data = np.concatenate(data)
+    shape = (XA.shape[0], XB.shape[0])
+    result = scipy.sparse.coo_matrix((data, (rows, cols)), shape=shape)
+    return result.asformat(format)
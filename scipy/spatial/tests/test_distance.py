@@ -38,11 +38,13 @@ import os.path
 
 import numpy as np
 from numpy.testing import verbose, TestCase, run_module_suite, \
-        assert_raises, assert_array_equal
+        assert_raises, assert_array_equal, assert_array_almost_equal
 from scipy.spatial.distance import squareform, pdist, cdist, matching, \
                                    jaccard, dice, sokalsneath, rogerstanimoto, \
                                    russellrao, yule, num_obs_y, num_obs_dm, \
-                                   is_valid_dm, is_valid_y, wminkowski
+                                   is_valid_dm, is_valid_y, wminkowski, \
+                                   pdist_blocks, cdist_blocks, cdist_sparse
+import scipy.spatial.distance as distance
 
 _filenames = ["iris.txt",
               "cdist-X1.txt",
@@ -1401,6 +1403,160 @@ class TestPdist(TestCase):
             print np.abs(pdist_y-right_y).max()
         self.assertTrue(within_tol(pdist_y, right_y, eps))
 
+class TestCompiledFunctions(TestCase):
+    """
+    Tests that passing a distance function to pdist or cdist gives the
+    result of the Python function.
+    """
+
+    def test_pdist_functions(self):
+        "Tests pdist(X, f) against the Python function f for all metrics."
+        for f, D in self._cases(eo['iris'], eo['pdist-boolean-inp']):
+            y1 = pdist(D, f)
+            y2 = pdist(D, lambda u, v: f(u, v))
+            self.assertTrue(within_tol(y1, y2, 1e-10), f.__name__)
+
+    def test_cdist_functions(self):
+        "Tests cdist(XA, XB, f) against the Python function f for all metrics."
+        for f, D in self._cases(eo['cdist-X1'], eo['cdist-X2'] < 0.5):
+            y1 = cdist(D[:5], D[5:], f)
+            y2 = cdist(D[:5], D[5:], lambda u, v: f(u, v))
+            self.assertTrue(within_tol(y1, y2, 1e-10), f.__name__)
+
+    def _cases(self, X, B):
+        cases = []
+        for f in (distance.braycurtis, distance.canberra, distance.chebyshev,
+                  distance.cityblock, distance.correlation, distance.cosine,
+                  distance.euclidean, distance.hamming, distance.jaccard,
+                  distance.sqeuclidean):
+            cases.append((f, X))
+        for f in (distance.dice, distance.kulsinski, distance.matching,
+                  distance.rogerstanimoto, distance.russellrao,
+                  distance.sokalmichener, distance.sokalsneath,
+                  distance.yule):
+            cases.append((f, B))
+        return cases
+
+    def test_pdist_function_parameters(self):
+        "Tests pdist(X, f) with the parameters of f given to pdist."
+        X = eo['iris']
+        w = np.linspace(0.5, 2.0, X.shape[1])
+        VI = np.linalg.inv(np.cov(X.T)).T.copy()
+        eps = 1e-10
+        y1 = pdist(X, distance.minkowski, p=3.2)
+        y2 = pdist(X, 'test_minkowski', p=3.2)
+        self.assertTrue(within_tol(y1, y2, eps))
+        y1 = pdist(X, distance.wminkowski, p=3.2, w=w)
+        y2 = pdist(X, 'test_wminkowski', p=3.2, w=w)
+        self.assertTrue(within_tol(y1, y2, eps))
+        V = np.var(X, axis=0, ddof=1)
+        y1 = pdist(X, distance.seuclidean)
+        y2 = pdist(X, lambda u, v: distance.seuclidean(u, v, V))
+        self.assertTrue(within_tol(y1, y2, eps))
+        y1 = pdist(X, distance.mahalanobis, VI=VI)
+        y2 = pdist(X, 'test_mahalanobis', VI=VI)
+        self.assertTrue(within_tol(y1, y2, eps))
+
+    def test_cdist_function_parameters(self):
+        "Tests cdist(XA, XB, f) with the parameters of f given to cdist."
+        X1 = eo['cdist-X1']
+        X2 = eo['cdist-X2']
+        w = list(np.linspace(0.5, 2.0, X1.shape[1]))
+        eps = 1e-10
+        y1 = cdist(X1, X2, distance.wminkowski, p=3.2, w=w)
+        y2 = cdist(X1, X2, 'test_wminkowski', p=3.2, w=w)
+        self.assertTrue(within_tol(y1, y2, eps))
+        y1 = cdist(X1, X2, distance.seuclidean)
+        y2 = cdist(X1, X2, 'test_seuclidean')
+        self.assertTrue(within_tol(y1, y2, eps))
+
+    def test_nonboolean_input(self):
+        "Tests pdist(X, f) for a boolean dissimilarity f on non-boolean data."
+        X = np.array([[0.0, 2.0, 1.0], [1.0, 0.0, 3.0], [1.0, 1.0, 0.0]])
+        y1 = pdist(X, distance.matching)
+        y2 = pdist(X, lambda u, v: distance.matching(u, v))
+        assert_array_equal(y1, y2)
+
+class TestBlocks(TestCase):
+    """
+    Test suite for the pdist_blocks and cdist_blocks functions.
+    """
+
+    def test_pdist_blocks(self):
+        "Tests that the blocks of pdist_blocks make up pdist(X)."
+        X = eo['iris']
+        for metric in ['euclidean', 'cityblock', 'seuclidean', 'mahalanobis',
+                       distance.correlation]:
+            for block_size in [1, 7, 149, 150, 1000]:
+                y = pdist(X, metric)
+                k = 0
+                for start, yb in pdist_blocks(X, metric, block_size=block_size):
+                    self.assertEqual(start, k)
+                    k += yb.shape[0]
+                    assert_array_almost_equal(yb, y[start:k])
+                self.assertEqual(k, y.shape[0])
+
+    def test_pdist_blocks_default(self):
+        "Tests pdist_blocks with the default block size."
+        X = eo['iris']
+        blocks = list(pdist_blocks(X, 'minkowski', p=3.2))
+        self.assertEqual(len(blocks), 1)
+        assert_array_almost_equal(blocks[0][1], pdist(X, 'minkowski', p=3.2))
+
+    def test_cdist_blocks(self):
+        "Tests that the blocks of cdist_blocks make up cdist(XA, XB)."
+        X1 = eo['cdist-X1']
+        X2 = eo['cdist-X2']
+        for metric in ['euclidean', 'chebychev', 'seuclidean', 'mahalanobis']:
+            for block_size in [1, 3, 10, 100, None]:
+                D = cdist(X1, X2, metric)
+                k = 0
+                for start, Db in cdist_blocks(X1, X2, metric,
+                                              block_size=block_size):
+                    self.assertEqual(start, k)
+                    k += Db.shape[0]
+                    assert_array_almost_equal(Db, D[start:k])
+                self.assertEqual(k, D.shape[0])
+
+    def test_blocks_bad_size(self):
+        X = eo['iris']
+        assert_raises(ValueError, list, pdist_blocks(X, block_size=0))
+        assert_raises(ValueError, list, cdist_blocks(X, X, block_size=-1))
+
+class TestCdistSparse(TestCase):
+    """
+    Test suite for the cdist_sparse function.
+    """
+
+    def test_cdist_sparse(self):
+        "Tests cdist_sparse against thresholding cdist(XA, XB)."
+        X1 = eo['cdist-X1']
+        X2 = eo['cdist-X2']
+        for metric in ['euclidean', 'cityblock', 'cosine', 'mahalanobis']:
+            D = cdist(X1, X2, metric)
+            r = np.median(D)
+            for block_size in [1, 4, None]:
+                S = cdist_sparse(X1, X2, r, metric, block_size=block_size)
+                self.assertEqual(S.format, 'coo')
+                self.assertEqual(S.shape, D.shape)
+                self.assertEqual(S.nnz, (D <= r).sum())
+                assert_array_almost_equal(S.todense(), np.where(D <= r, D, 0))
+
+    def test_cdist_sparse_format(self):
+        X = eo['iris']
+        S = cdist_sparse(X, X, 0.5, format='csr')
+        self.assertEqual(S.format, 'csr')
+        # The zero distances of the diagonal are stored explicitly.
+        self.assertEqual(S.nnz, (cdist(X, X) <= 0.5).sum())
+        assert_array_almost_equal(S.todense(),
+                                  np.where(cdist(X, X) <= 0.5, cdist(X, X), 0))
+
+    def test_cdist_sparse_empty(self):
+        X1 = eo['cdist-X1']
+        S = cdist_sparse(X1, X1 + 100.0, 1.0)
+        self.assertEqual(S.nnz, 0)
+        self.assertEqual(S.shape, (X1.shape[0], X1.shape[0]))
+
 def within_tol(a, b, tol):
     return np.abs(a - b).max() < tol
 
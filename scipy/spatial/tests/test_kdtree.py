@@ -2,11 +2,17 @@
 # Released under the scipy license
 
 from numpy.testing import assert_equal, assert_array_equal, assert_almost_equal, \
-        assert_, run_module_suite
+        assert_array_almost_equal, assert_, assert_raises, run_module_suite
+
+import os
+import pickle
+import tempfile
 
 import numpy as np
+from numpy.compat import asbytes
 from scipy.spatial import KDTree, Rectangle, distance_matrix, cKDTree
 from scipy.spatial import minkowski_distance as distance
+from scipy.spatial.ckdtree import _node_dtype
 
 class ConsistencyTests:
     def test_nearest(self):
@@ -238,6 +244,124 @@ class test_vectorization_compiled:
         assert_(np.all(~np.isfinite(d[:,:,-s:])))
         assert_(np.all(i[:,:,-s:]==self.kdtree.n))
 
+class test_query_threaded_compiled:
+
+    def setUp(self):
+        np.random.seed(1234)
+        self.data = np.random.randn(500,3)
+        self.x = np.random.randn(3,101,3)
+        self.kdtree = cKDTree(self.data)
+
+    def test_same_as_serial(self):
+        for k in [1, 4]:
+            d1, i1 = self.kdtree.query(self.x, k=k)
+            for n_jobs in [2, 3, -1]:
+                d2, i2 = self.kdtree.query(self.x, k=k, n_jobs=n_jobs)
+                assert_array_equal(d1, d2)
+                assert_array_equal(i1, i2)
+
+    def test_more_jobs_than_points(self):
+        d1, i1 = self.kdtree.query(self.x[0,:2], k=2)
+        d2, i2 = self.kdtree.query(self.x[0,:2], k=2, n_jobs=8)
+        assert_array_equal(d1, d2)
+        assert_array_equal(i1, i2)
+
+    def test_bad_n_jobs(self):
+        assert_raises(ValueError, self.kdtree.query, self.x, n_jobs=0)
+
+class test_save_load_compiled:
+
+    def setUp(self):
+        np.random.seed(1234)
+        self.data = np.random.randn(200,3)
+        self.x = np.random.randn(20,3)
+        self.kdtree = cKDTree(self.data, leafsize=4)
+        fd, self.filename = tempfile.mkstemp(suffix='.ckdtree')
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def check_same_tree(self, T):
+        assert_equal(T.n, self.kdtree.n)
+        assert_equal(T.m, self.kdtree.m)
+        assert_equal(T.leafsize, self.kdtree.leafsize)
+        assert_array_equal(T.data, self.kdtree.data)
+        assert_array_equal(T.query(self.x, k=3), self.kdtree.query(self.x, k=3))
+        assert_equal(T.query_pairs(0.3), self.kdtree.query_pairs(0.3))
+
+    def test_memmap(self):
+        self.kdtree.save(self.filename)
+        T = cKDTree.load(self.filename)
+        assert_(isinstance(T.data, np.memmap))
+        self.check_same_tree(T)
+        del T
+
+    def test_in_memory(self):
+        self.kdtree.save(self.filename)
+        self.check_same_tree(cKDTree.load(self.filename, mmap_mode=None))
+
+    def test_bad_file(self):
+        f = open(self.filename, 'wb')
+        f.write(asbytes('not a tree'))
+        f.close()
+        assert_raises(ValueError, cKDTree.load, self.filename)
+
+    def map_saved_arrays(self):
+        # save the tree and map its index and node arrays for writing
+        self.kdtree.save(self.filename)
+        header = np.memmap(self.filename, dtype='<i8', mode='r', offset=8,
+                           shape=(10,))
+        n, n_nodes = int(header[1]), int(header[4])
+        indices = np.memmap(self.filename, dtype='<i4', mode='r+',
+                            offset=int(header[6]), shape=(n,))
+        nodes = np.memmap(self.filename,
+                          dtype=_node_dtype.newbyteorder('<'), mode='r+',
+                          offset=int(header[7]), shape=(n_nodes,))
+        del header
+        return indices, nodes
+
+    def test_corrupt_file(self):
+        indices, nodes = self.map_saved_arrays()
+        n_nodes = len(nodes)
+        leaf = np.nonzero(nodes['split_dim'] == -1)[0][0]
+        del indices, nodes
+        n = self.kdtree.n
+        for name, i, value in [('less', 0, n_nodes), ('greater', 0, -1),
+                               ('less', 0, 0), ('greater', 1, 0),
+                               ('start_idx', 0, -1), ('end_idx', 0, n + 1),
+                               ('start_idx', leaf, n), ('split_dim', 0, 3),
+                               ('split_dim', 0, -2),
+                               ('indices', 5, n), ('indices', 5, -1)]:
+            indices, nodes = self.map_saved_arrays()
+            if name == 'indices':
+                indices[i] = value
+            else:
+                nodes[name][i] = value
+            indices.flush()
+            nodes.flush()
+            del indices, nodes
+            for mmap_mode in ['r', None]:
+                assert_raises(ValueError, cKDTree.load, self.filename,
+                              mmap_mode=mmap_mode, check=True)
+
+    def test_truncated_file(self):
+        self.kdtree.save(self.filename)
+        self.check_same_tree(cKDTree.load(self.filename, check=True))
+        f = open(self.filename, 'rb')
+        contents = f.read()
+        f.close()
+        for size in [len(contents) - 1, 200]:
+            f = open(self.filename, 'wb')
+            f.write(contents[:size])
+            f.close()
+            for mmap_mode in ['r', None]:
+                assert_raises(ValueError, cKDTree.load, self.filename,
+                              mmap_mode=mmap_mode)
+
+    def test_pickle(self):
+        self.check_same_tree(pickle.loads(pickle.dumps(self.kdtree)))
+
 class ball_consistency:
 
     def test_in_ball(self):
@@ -287,6 +411,42 @@ class test_random_ball_linf(test_random_ball):
         test_random_ball.setUp(self)
         self.p = np.inf
 
+class test_random_ball_compiled(ball_consistency):
+
+    def setUp(self):
+        n = 100
+        m = 4
+        self.data = np.random.randn(n,m)
+        self.T = cKDTree(self.data,leafsize=2)
+        self.x = np.random.randn(m)
+        self.p = 2.
+        self.eps = 0
+        self.d = 0.2
+
+class test_random_ball_compiled_approx(test_random_ball_compiled):
+
+    def setUp(self):
+        test_random_ball_compiled.setUp(self)
+        self.eps = 0.1
+
+class test_random_ball_compiled_far(test_random_ball_compiled):
+
+    def setUp(self):
+        test_random_ball_compiled.setUp(self)
+        self.d = 2.
+
+class test_random_ball_compiled_l1(test_random_ball_compiled):
+
+    def setUp(self):
+        test_random_ball_compiled.setUp(self)
+        self.p = 1
+
+class test_random_ball_compiled_linf(test_random_ball_compiled):
+
+    def setUp(self):
+        test_random_ball_compiled.setUp(self)
+        self.p = np.inf
+
 def test_random_ball_vectorized():
 
     n = 20
@@ -297,6 +457,23 @@ def test_random_ball_vectorized():
     assert_equal(r.shape,(2,3))
     assert_(isinstance(r[0,0],list))
 
+def test_random_ball_vectorized_compiled():
+
+    n = 20
+    m = 5
+    np.random.seed(1234)
+    data = np.random.randn(n,m)
+    T1 = KDTree(data)
+    T2 = cKDTree(data)
+    x = np.random.randn(2,3,m)
+
+    r1 = T1.query_ball_point(x,1)
+    r2 = T2.query_ball_point(x,1)
+    assert_equal(r2.shape,(2,3))
+    assert_(isinstance(r2[0,0],list))
+    for c in np.ndindex(r1.shape):
+        assert_equal(sorted(r1[c]),sorted(r2[c]))
+
 class two_trees_consistency:
 
     def test_all_in_ball(self):
@@ -336,6 +513,31 @@ class test_two_random_trees_linf(test_two_random_trees):
         test_two_random_trees.setUp(self)
         self.p = np.inf
 
+class test_two_random_trees_compiled(two_trees_consistency):
+
+    def setUp(self):
+        n = 50
+        m = 4
+        self.data1 = np.random.randn(n,m)
+        self.T1 = cKDTree(self.data1,leafsize=2)
+        self.data2 = np.random.randn(n,m)
+        self.T2 = cKDTree(self.data2,leafsize=2)
+        self.p = 2.
+        self.eps = 0
+        self.d = 0.2
+
+class test_two_random_trees_compiled_far(test_two_random_trees_compiled):
+
+    def setUp(self):
+        test_two_random_trees_compiled.setUp(self)
+        self.d = 2
+
+class test_two_random_trees_compiled_linf(test_two_random_trees_compiled):
+
+    def setUp(self):
+        test_two_random_trees_compiled.setUp(self)
+        self.p = np.inf
+
 
 class test_rectangle:
 
@@ -399,6 +601,22 @@ class test_count_neighbors:
         for r,result in zip(rs, results):
             assert_equal(self.T1.count_neighbors(self.T2, r), result)
 
+class test_count_neighbors_compiled(test_count_neighbors):
+
+    def setUp(self):
+        n = 50
+        m = 2
+        self.T1 = cKDTree(np.random.randn(n,m),leafsize=2)
+        self.T2 = cKDTree(np.random.randn(n,m),leafsize=2)
+
+    def test_consistency_with_python(self):
+        T1 = KDTree(self.T1.data,leafsize=2)
+        T2 = KDTree(self.T2.data,leafsize=2)
+        rs = [1.0, 0.01, 0.3, 10]
+        for p in [1, 2., 3.5, np.inf]:
+            assert_equal(self.T1.count_neighbors(self.T2, rs, p=p),
+                         T1.count_neighbors(T2, rs, p=p))
+
 class test_sparse_distance_matrix:
     def setUp(self):
         n = 50
@@ -419,6 +637,38 @@ class test_sparse_distance_matrix:
     def test_zero_distance(self):
         M = self.T1.sparse_distance_matrix(self.T1, self.r) # raises an exception for bug 870
 
+class test_sparse_distance_matrix_compiled:
+    def setUp(self):
+        n = 50
+        m = 4
+        np.random.seed(1234)
+        data1 = np.random.randn(n,m)
+        data2 = np.random.randn(n,m)
+        self.T1 = cKDTree(data1,leafsize=2)
+        self.T2 = cKDTree(data2,leafsize=2)
+        self.ref_T1 = KDTree(data1, leafsize=2)
+        self.ref_T2 = KDTree(data2, leafsize=2)
+        self.r = 0.5
+
+    def test_consistency_with_neighbors(self):
+        M = self.T1.sparse_distance_matrix(self.T2, self.r)
+        r = self.T1.query_ball_tree(self.T2, self.r)
+        for i,l in enumerate(r):
+            for j in l:
+                assert_almost_equal(M[i,j],
+                                    distance(self.T1.data[i], self.T2.data[j]),
+                                    decimal=14)
+        for ((i,j),d) in M.items():
+            assert_(j in r[i])
+
+    def test_zero_distance(self):
+        M = self.T1.sparse_distance_matrix(self.T1, self.r)
+
+    def test_consistency_with_python(self):
+        M1 = self.T1.sparse_distance_matrix(self.T2, self.r)
+        M2 = self.ref_T1.sparse_distance_matrix(self.ref_T2, self.r)
+        assert_array_almost_equal(M1.todense(), M2.todense(), decimal=14)
+
 def test_distance_matrix():
     m = 10
     n = 11
@@ -467,9 +717,30 @@ def test_onetree_query():
     yield check_onetree_query, T, 0.00001
     yield check_onetree_query, T, 1e-6
 
+def test_onetree_query_compiled():
+    np.random.seed(0)
+    n = 100
+    k = 4
+    points = np.random.randn(n,k)
+    T = cKDTree(points)
+    yield check_onetree_query, T, 0.1
+
+    points = np.random.randn(3*n,k)
+    points[:n] *= 0.001
+    points[n:2*n] += 2
+    T = cKDTree(points)
+    yield check_onetree_query, T, 0.1
+    yield check_onetree_query, T, 0.001
+    yield check_onetree_query, T, 0.00001
+    yield check_onetree_query, T, 1e-6
+
 def test_query_pairs_single_node():
     tree = KDTree([[0, 1]])
     assert_equal(tree.query_pairs(0.5), set())
 
+def test_query_pairs_single_node_compiled():
+    tree = cKDTree([[0, 1]])
+    assert_equal(tree.query_pairs(0.5), set())
+
 if __name__=="__main__":
     run_module_suite()